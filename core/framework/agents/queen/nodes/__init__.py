@@ -175,8 +175,8 @@ def _build_appendices() -> str:
 
 Worker data tools (for large results and spillover):
 - save_data(filename, data, data_dir) — save data to a file for later retrieval
-- load_data(filename, data_dir, offset_bytes?, limit_bytes?) — load data \
-with byte-based pagination
+- load_data(filename, data_dir, offset_bytes?, limit_bytes?, start_line?, \
+max_lines?) — load data with byte-based or line-based pagination
 - list_data_files(data_dir) — list available data files
 - append_data(filename, data, data_dir) — append to a file incrementally
 - edit_data(filename, old_text, new_text, data_dir) — find-and-replace in a data file
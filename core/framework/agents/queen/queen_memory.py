@@ -18,12 +18,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import traceback
 from datetime import date, datetime
 from pathlib import Path
 
+from framework.storage.conversation_store import read_conversation_parts
+
 logger = logging.getLogger(__name__)
 
 
@@ -213,13 +214,11 @@ def read_session_context(session_dir: Path, max_messages: int = 80) -> str:
             parts.append(f"## Session Working Notes (adapt.md)\n\n{text}")
 
     # Conversation transcript
-    parts_dir = session_dir / "conversations" / "parts"
-    if parts_dir.exists():
-        part_files = sorted(parts_dir.glob("*.json"))[-max_messages:]
+    conv_parts = read_conversation_parts(session_dir / "conversations")[-max_messages:]
+    if conv_parts:
         lines: list[str] = []
-        for pf in part_files:
+        for data in conv_parts:
             try:
-                data = json.loads(pf.read_text(encoding="utf-8"))
                 role = data.get("role", "")
                 content = str(data.get("content", "")).strip()
                 tool_calls = data.get("tool_calls") or []
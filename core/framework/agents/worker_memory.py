@@ -50,24 +50,17 @@ def digest_path(agent_name: str, run_id: str) -> Path:
 def _collect_run_events(bus: EventBus, run_id: str, limit: int = 2000) -> list[AgentEvent]:
     """Collect all events belonging to *run_id* from the bus history.
 
-    Strategy: find the EXECUTION_STARTED event that carries ``run_id``,
-    extract its ``execution_id``, then query the bus by that execution_id.
-    This works because TOOL_CALL_*, EDGE_TRAVERSED, NODE_STALLED etc. carry
-    execution_id but not run_id.
+    Strategy: look up the ``execution_id`` for ``run_id`` in the bus's
+    worker status view (recorded from EXECUTION_STARTED), then query the
+    bus by that execution_id.  This works because TOOL_CALL_*,
+    EDGE_TRAVERSED, NODE_STALLED etc. carry execution_id but not run_id.
 
-    Falls back to a full-scan run_id filter when EXECUTION_STARTED is not
-    found (e.g. bus was rotated).
+    Falls back to a full-scan run_id filter when the run is unknown (e.g.
+    bus was rotated).
     """
-    from framework.runtime.event_bus import EventType
-
-    # Pass 1: find execution_id via EXECUTION_STARTED with matching run_id
-    started = bus.get_history(event_type=EventType.EXECUTION_STARTED, limit=limit)
-    exec_id: str | None = None
-    for e in started:
-        if getattr(e, "run_id", None) == run_id and e.execution_id:
-            exec_id = e.execution_id
-            break
+    from framework.runtime.worker_status import get_worker_status_view
 
+    exec_id = get_worker_status_view(bus).execution_for_run(run_id)
     if exec_id:
         return bus.get_history(execution_id=exec_id, limit=limit)
 
@@ -377,6 +377,59 @@ def get_gcu_viewport_scale() -> float:
     return 0.8
 
 
+def get_tool_cache_config() -> dict[str, Any] | None:
+    """Return the ``tool_cache`` section if the tool result cache is enabled.
+
+    Example::
+
+        "tool_cache": {"enabled": true, "max_entries": 512, "disk": true}
+    """
+    cfg = get_hive_config().get("tool_cache")
+    if isinstance(cfg, dict) and cfg.get("enabled"):
+        return cfg
+    return None
+
+
+def get_mcp_schema_cache_dir() -> Path | None:
+    """Return where MCP tool lists are cached, or None if disabled.
+
+    Enabled by default; disable with::
+
+        "mcp_schema_cache": {"enabled": false}
+    """
+    cfg = get_hive_config().get("mcp_schema_cache")
+    if isinstance(cfg, dict) and cfg.get("enabled") is False:
+        return None
+    return Path.home() / ".hive" / "mcp_schema_cache"
+
+
+def get_skill_discovery_cache_dir() -> Path | None:
+    """Return where skill discovery scans are cached, or None if disabled.
+
+    Enabled by default; disable with::
+
+        "skill_cache": {"enabled": false}
+    """
+    cfg = get_hive_config().get("skill_cache")
+    if isinstance(cfg, dict) and cfg.get("enabled") is False:
+        return None
+    return Path.home() / ".hive" / "skill_cache"
+
+
+def get_skill_catalog_top_k() -> int | None:
+    """Return how many skills a node's catalog lists, or None for all of them.
+
+    Defaults to 20; set to null to always inject the full catalog::
+
+        "skill_catalog": {"top_k": 20}
+    """
+    cfg = get_hive_config().get("skill_catalog")
+    if isinstance(cfg, dict) and "top_k" in cfg:
+        top_k = cfg["top_k"]
+        return int(top_k) if top_k else None
+    return 20
+
+
 def get_api_base() -> str | None:
     """Return the api_base URL for OpenAI-compatible endpoints, if configured."""
     llm = get_hive_config().get("llm", {})
@@ -3,13 +3,20 @@
 
 This module provides the TokenLifecycleManager which coordinates
 automatic token refresh with the credential store.
+
+Refreshes go through ``CredentialStore.submit_refresh``, so every manager
+for the same credential shares one in-flight refresh.  A token inside the
+refresh buffer but not yet expired is returned immediately while it is
+refreshed in the background; only callers holding an expired token wait.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
@@ -25,6 +32,9 @@
 
 logger = logging.getLogger(__name__)
 
+# Single-flight key separating these refreshes from the store's own
+_REFRESH_FLIGHT = "oauth2_lifecycle"
+
 
 @dataclass
 class TokenRefreshResult:
@@ -75,6 +85,7 @@ def __init__(
         refresh_buffer_minutes: int = 5,
         on_token_refreshed: Callable[[OAuth2Token], None] | None = None,
         on_refresh_failed: Callable[[str], None] | None = None,
+        refresh_retry_seconds: float = 30.0,
     ):
         """
         Initialize the lifecycle manager.
@@ -86,6 +97,8 @@ def __init__(
             refresh_buffer_minutes: Minutes before expiry to trigger refresh
             on_token_refreshed: Callback when token is refreshed
             on_refresh_failed: Callback when refresh fails
+            refresh_retry_seconds: After a failed background refresh, how long
+                to keep using the still-valid token before trying again
         """
         self.provider = provider
         self.credential_id = credential_id
@@ -98,6 +111,9 @@ def __init__(
         self._cached_token: OAuth2Token | None = None
         self._cache_time: datetime | None = None
 
+        self._refresh_retry_s = refresh_retry_seconds
+        self._refresh_failed_at: float | None = None
+
     # --- Async Token Access ---
 
     async def get_valid_token(self) -> OAuth2Token | None:
@@ -124,7 +140,10 @@ async def get_valid_token(self) -> OAuth2Token | None:
             return None
 
         # Refresh if needed
-        if self._needs_refresh(token):
+        if self._needs_refresh(token) and self._still_valid(token):
+            # Still valid: use it and refresh in the background
+            self._refresh_in_background(credential)
+        elif self._needs_refresh(token):
             result = await self._async_refresh_token(credential)
             if result.success and result.token:
                 token = result.token
@@ -132,10 +151,7 @@ async def get_valid_token(self) -> OAuth2Token | None:
                 logger.warning(f"Token for {self.credential_id} needs reauthorization")
                 return None
             else:
-                # Use existing token if still technically valid
-                if token.is_expired:
-                    return None
-                logger.warning(f"Refresh failed for {self.credential_id}, using existing token")
+                return None
 
         self._cached_token = token
         self._cache_time = datetime.now(UTC)
@@ -203,16 +219,17 @@ def sync_get_valid_token(self) -> OAuth2Token | None:
             return None
 
         # Refresh if needed
-        if self._needs_refresh(token):
-            result = self._sync_refresh_token(credential)
+        if self._needs_refresh(token) and self._still_valid(token):
+            self._refresh_in_background(credential)
+        elif self._needs_refresh(token):
+            result = self._submit_refresh(credential).result()
             if result.success and result.token:
                 token = result.token
             elif result.needs_reauthorization:
                 logger.warning(f"Token for {self.credential_id} needs reauthorization")
                 return None
             else:
-                if token.is_expired:
-                    return None
+                return None
 
         self._cached_token = token
         self._cache_time = datetime.now(UTC)
@@ -236,6 +253,10 @@ def _needs_refresh(self, token: OAuth2Token) -> bool:
             return False
         return datetime.now(UTC) >= (token.expires_at - self.refresh_buffer)
 
+    def _still_valid(self, token: OAuth2Token) -> bool:
+        """Check if token has not actually expired (``is_expired`` adds a skew buffer)."""
+        return token.expires_at is None or datetime.now(UTC) < token.expires_at
+
     def _credential_to_token(self, credential: CredentialObject) -> OAuth2Token | None:
         """Convert credential to OAuth2Token."""
         access_token = credential.get_key("access_token")
@@ -287,8 +308,26 @@ def _save_token_to_store(self, token: OAuth2Token) -> None:
 
     async def _async_refresh_token(self, credential: CredentialObject) -> TokenRefreshResult:
         """Async wrapper for token refresh."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self._sync_refresh_token(credential))
+        return await asyncio.wrap_future(self._submit_refresh(credential))
+
+    def _submit_refresh(self, credential: CredentialObject) -> Future[TokenRefreshResult]:
+        """Refresh via the store, joining a refresh already in flight."""
+        return self.store.submit_refresh(
+            self.credential_id,
+            lambda: self._sync_refresh_token(credential),
+            flight=_REFRESH_FLIGHT,
+        )
+
+    def _refresh_in_background(self, credential: CredentialObject) -> None:
+        """Start a refresh unless one failed too recently."""
+        failed_at = self._refresh_failed_at
+        if failed_at is not None and time.monotonic() - failed_at < self._refresh_retry_s:
+            return
+        self._submit_refresh(credential).add_done_callback(self._record_refresh_outcome)
+
+    def _record_refresh_outcome(self, future: Future[TokenRefreshResult]) -> None:
+        failed = future.exception() is not None or not future.result().success
+        self._refresh_failed_at = time.monotonic() if failed else None
 
     def _sync_refresh_token(self, credential: CredentialObject) -> TokenRefreshResult:
         """Synchronously refresh token."""
@@ -7,14 +7,28 @@
 - Template resolution for {{cred.key}} patterns
 - Caching with TTL for performance
 - Thread-safe operations
+
+Refreshes never run under a store-wide lock.  Storage loads and refreshes
+take one of ``_LOCK_STRIPES`` locks picked by credential id, so a slow
+OAuth refresh only holds up callers of credentials in the same stripe.
+Refreshes are single-flight: concurrent callers needing the same
+credential refreshed share one in-flight future.  A credential that is
+due for refresh but not yet expired is returned as-is while the refresh
+runs in the background (stale-while-revalidate); only callers holding an
+already-expired credential wait.  ``start_background_refresh()`` adds a
+thread that renews cached credentials before they expire, so readers
+rarely see one due for refresh at all.
 """
 
 from __future__ import annotations
 
 import logging
 import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from pydantic import SecretStr
 
@@ -30,6 +44,13 @@
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Locks guarding storage loads and refreshes, picked by credential id
+_LOCK_STRIPES = 16
+# Threads running refreshes
+_REFRESH_WORKERS = 4
+
 
 class CredentialStore:
     """
@@ -71,6 +92,7 @@ def __init__(
         providers: list[CredentialProvider] | None = None,
         cache_ttl_seconds: int = 300,
         auto_refresh: bool = True,
+        refresh_retry_seconds: float = 30.0,
     ):
         """
         Initialize the credential store.
@@ -80,6 +102,8 @@ def __init__(
             providers: List of credential providers. Defaults to [StaticProvider()].
             cache_ttl_seconds: How long to cache credentials in memory (default: 5 minutes).
             auto_refresh: Whether to auto-refresh expired credentials on access.
+            refresh_retry_seconds: After a failed background refresh, how long to
+                keep serving the still-valid credential before trying again.
         """
         self._storage = storage or EnvVarStorage()
         self._providers: dict[str, CredentialProvider] = {}
@@ -88,10 +112,20 @@ def __init__(
         # Cache: credential_id -> (CredentialObject, cached_at)
         self._cache: dict[str, tuple[CredentialObject, datetime]] = {}
         self._cache_ttl = cache_ttl_seconds
+        # Guards the cache and in-flight maps only; never held across I/O
         self._lock = threading.RLock()
+        self._stripes = [threading.RLock() for _ in range(_LOCK_STRIPES)]
 
         self._auto_refresh = auto_refresh
 
+        # Single-flight refreshes: (credential_id, flight) -> in-flight future
+        self._inflight: dict[tuple[str, str], Future[Any]] = {}
+        self._refresh_failed_at: dict[str, float] = {}
+        self._refresh_retry_s = refresh_retry_seconds
+        self._executor: ThreadPoolExecutor | None = None
+        self._refresher: threading.Thread | None = None
+        self._refresher_stop = threading.Event()
+
         # Register providers
         for provider in providers or [StaticProvider()]:
             self.register_provider(provider)
@@ -187,28 +221,29 @@ def get_credential(
 
         Returns:
             CredentialObject or None if not found
-        """
-        with self._lock:
-            # Check cache
-            cached = self._get_from_cache(credential_id)
-            if cached is not None:
-                if refresh_if_needed and self._should_refresh(cached):
-                    return self._refresh_credential(cached)
-                return cached
-
-            # Load from storage
-            credential = self._storage.load(credential_id)
-            if credential is None:
-                return None
 
-            # Refresh if needed
-            if refresh_if_needed and self._should_refresh(credential):
-                credential = self._refresh_credential(credential)
-
-            # Cache
-            self._add_to_cache(credential)
+        A credential that is due for refresh but not yet expired is returned
+        immediately while it is refreshed in the background.
+        """
+        credential = self._get_from_cache(credential_id)
+        if credential is None:
+            with self._stripe(credential_id):
+                # Another caller may have loaded it while we waited
+                credential = self._get_from_cache(credential_id)
+                if credential is None:
+                    credential = self._storage.load(credential_id)
+                    if credential is None:
+                        return None
+                    self._add_to_cache(credential)
+
+        if refresh_if_needed and self._should_refresh(credential):
+            if not credential.needs_refresh:
+                # Still valid: serve it and revalidate in the background
+                self._refresh_in_background(credential)
+                return credential
+            return self._submit_credential_refresh(credential).result()
 
-            return credential
+        return credential
 
     def get_key(self, credential_id: str, key_name: str) -> str | None:
         """
@@ -331,7 +366,7 @@ def save_credential(self, credential: CredentialObject) -> None:
         Args:
             credential: The credential to save
         """
-        with self._lock:
+        with self._stripe(credential.id):
             self._storage.save(credential)
             self._add_to_cache(credential)
             logger.info(f"Saved credential '{credential.id}'")
@@ -346,7 +381,8 @@ def delete_credential(self, credential_id: str) -> bool:
         Returns:
             True if the credential existed and was deleted
         """
-        with self._lock:
+        # The stripe lock waits out any refresh that would re-save it
+        with self._stripe(credential_id):
             self._remove_from_cache(credential_id)
             result = self._storage.delete(credential_id)
             if result:
@@ -524,14 +560,152 @@ def _refresh_credential(self, credential: CredentialObject) -> CredentialObject:
             # Persist the refreshed credential
             self._storage.save(refreshed)
             self._add_to_cache(refreshed)
+            self._refresh_failed_at.pop(credential.id, None)
 
             logger.info(f"Refreshed credential '{credential.id}'")
             return refreshed
 
         except CredentialRefreshError as e:
             logger.error(f"Failed to refresh credential '{credential.id}': {e}")
+            self._refresh_failed_at[credential.id] = time.monotonic()
             return credential
 
+    def _submit_credential_refresh(self, credential: CredentialObject) -> Future[CredentialObject]:
+        return self.submit_refresh(credential.id, lambda: self._refresh_credential(credential))
+
+    def _refresh_in_background(self, credential: CredentialObject) -> bool:
+        """Start a refresh of *credential* unless one failed too recently."""
+        failed_at = self._refresh_failed_at.get(credential.id)
+        if failed_at is not None and time.monotonic() - failed_at < self._refresh_retry_s:
+            return False
+        self._submit_credential_refresh(credential)
+        return True
+
+    def submit_refresh(
+        self, credential_id: str, refresh: Callable[[], T], flight: str = ""
+    ) -> Future[T]:
+        """
+        Run *refresh* in the background unless one is already in flight.
+
+        Concurrent callers for the same credential and *flight* get the same
+        future, so the refresh runs once.  It runs under the credential's
+        stripe lock, which also serializes it against saves and deletes.
+
+        Args:
+            credential_id: The credential being refreshed
+            refresh: Performs the refresh and returns its result
+            flight: Separates refreshes of the same credential whose results
+                differ in kind (e.g. a lifecycle manager's token refresh)
+
+        Returns:
+            Future resolving to the result of *refresh*
+        """
+        key = (credential_id, flight)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = Future()
+            self._inflight[key] = future
+
+        def run() -> None:
+            try:
+                with self._stripe(credential_id):
+                    result = refresh()
+            except BaseException as e:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                future.set_exception(e)
+            else:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                future.set_result(result)
+
+        try:
+            self._get_executor().submit(run)
+        except RuntimeError:
+            # Executor shut down (store closed): refresh inline
+            run()
+        return future
+
+    def refresh_expiring(self) -> int:
+        """
+        Start background refreshes of cached credentials that are due for one.
+
+        Only credentials cached within the cache TTL count, i.e. ones in use.
+
+        Returns:
+            Number of refreshes started
+        """
+        now = datetime.now(UTC)
+        with self._lock:
+            cached = [
+                credential
+                for credential, cached_at in self._cache.values()
+                if (now - cached_at).total_seconds() <= self._cache_ttl
+            ]
+        started = 0
+        for credential in cached:
+            if self._should_refresh(credential) and self._refresh_in_background(credential):
+                started += 1
+        return started
+
+    def start_background_refresh(self, interval_seconds: float = 60.0) -> None:
+        """
+        Renew credentials before they expire on a background thread.
+
+        Every *interval_seconds* the thread calls :meth:`refresh_expiring`.
+        Providers decide how early a credential is due (typically five
+        minutes before ``expires_at``), so the interval should be shorter
+        than that.
+
+        Args:
+            interval_seconds: Time between scans
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._refresher_stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            args=(interval_seconds,),
+            name="credential-refresher",
+            daemon=True,
+        )
+        self._refresher.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stop the thread started by :meth:`start_background_refresh`."""
+        self._refresher_stop.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout=5)
+            self._refresher = None
+
+    def _refresh_loop(self, interval_seconds: float) -> None:
+        while not self._refresher_stop.wait(interval_seconds):
+            try:
+                self.refresh_expiring()
+            except Exception:
+                logger.warning("Background credential refresh scan failed", exc_info=True)
+
+    def close(self) -> None:
+        """Stop background refreshing and release its threads."""
+        self.stop_background_refresh()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=_REFRESH_WORKERS, thread_name_prefix="credential-refresh"
+                )
+            return self._executor
+
+    def _stripe(self, credential_id: str) -> threading.RLock:
+        return self._stripes[hash(credential_id) % _LOCK_STRIPES]
+
     def refresh_credential(self, credential_id: str) -> CredentialObject | None:
         """
         Manually refresh a credential.
@@ -549,31 +723,35 @@ def refresh_credential(self, credential_id: str) -> CredentialObject | None:
         if credential is None:
             return None
 
-        return self._refresh_credential(credential)
+        return self._submit_credential_refresh(credential).result()
 
     # --- Caching ---
 
     def _get_from_cache(self, credential_id: str) -> CredentialObject | None:
         """Get credential from cache if not expired."""
-        if credential_id not in self._cache:
-            return None
+        with self._lock:
+            entry = self._cache.get(credential_id)
+            if entry is None:
+                return None
 
-        credential, cached_at = self._cache[credential_id]
-        age = (datetime.now(UTC) - cached_at).total_seconds()
+            credential, cached_at = entry
+            age = (datetime.now(UTC) - cached_at).total_seconds()
 
-        if age > self._cache_ttl:
-            del self._cache[credential_id]
-            return None
+            if age > self._cache_ttl:
+                del self._cache[credential_id]
+                return None
 
-        return credential
+            return credential
 
     def _add_to_cache(self, credential: CredentialObject) -> None:
         """Add credential to cache."""
-        self._cache[credential.id] = (credential, datetime.now(UTC))
+        with self._lock:
+            self._cache[credential.id] = (credential, datetime.now(UTC))
 
     def _remove_from_cache(self, credential_id: str) -> None:
         """Remove credential from cache."""
-        self._cache.pop(credential_id, None)
+        with self._lock:
+            self._cache.pop(credential_id, None)
 
     def clear_cache(self) -> None:
         """Clear the credential cache."""
@@ -677,6 +855,7 @@ def with_aden_sync(
         cache_ttl_seconds: int = 300,
         local_path: str | None = None,
         auto_sync: bool = True,
+        background_refresh_interval_seconds: float | None = 60.0,
         **kwargs: Any,
     ) -> CredentialStore:
         """
@@ -684,13 +863,16 @@ def with_aden_sync(
 
         Automatically syncs OAuth2 tokens from the Aden authentication server.
         Falls back to local-only storage if ADEN_API_KEY is not set or Aden
-        is unreachable.
+        is unreachable.  Synced tokens are renewed in the background before
+        they expire (see :meth:`start_background_refresh`).
 
         Args:
             base_url: Aden server URL (default: https://api.adenhq.com)
             cache_ttl_seconds: How long to cache credentials locally (default: 5 min)
             local_path: Path for local credential storage (default: ~/.hive/credentials)
             auto_sync: Whether to sync all credentials on startup (default: True)
+            background_refresh_interval_seconds: Interval of the background
+                refresher, or None to refresh only on access
             **kwargs: Additional arguments passed to CredentialStore
 
         Returns:
@@ -754,6 +936,9 @@ def with_aden_sync(
                 synced = provider.sync_all(store)
                 logger.info(f"Synced {synced} credentials from Aden server")
 
+            if background_refresh_interval_seconds is not None:
+                store.start_background_refresh(background_refresh_interval_seconds)
+
             return store
 
         except ImportError:
@@ -0,0 +1,225 @@
+"""
+Tests for credential refreshing in CredentialStore.
+
+Tests cover:
+- Single-flight refreshes of expired credentials
+- Stale-while-revalidate reads of credentials due for refresh
+- Lock striping between credentials
+- The proactive background refresher
+- TokenLifecycleManager refreshes through the store
+"""
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from pydantic import SecretStr
+
+from framework.credentials import (
+    CredentialKey,
+    CredentialObject,
+    CredentialRefreshError,
+    CredentialStore,
+    CredentialType,
+    InMemoryStorage,
+)
+from framework.credentials.oauth2 import OAuth2Token, TokenLifecycleManager
+from framework.credentials.provider import CredentialProvider
+
+
+class SlowProvider(CredentialProvider):
+    """Refreshes tokens for an hour, blocking until ``gate`` is set."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.fail = False
+
+    @property
+    def provider_id(self) -> str:
+        return "slow"
+
+    @property
+    def supported_types(self) -> list[CredentialType]:
+        return [CredentialType.OAUTH2]
+
+    def refresh(self, credential: CredentialObject) -> CredentialObject:
+        self.calls.append(credential.id)
+        self.gate.wait(5)
+        if self.fail:
+            raise CredentialRefreshError("upstream down")
+        refreshed = credential.model_copy(deep=True)
+        refreshed.set_key(
+            "access_token",
+            f"fresh-{len(self.calls)}",
+            expires_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+        return refreshed
+
+    def validate(self, credential: CredentialObject) -> bool:
+        return True
+
+
+def _oauth(credential_id: str, expires_in: timedelta) -> CredentialObject:
+    return CredentialObject(
+        id=credential_id,
+        credential_type=CredentialType.OAUTH2,
+        keys={
+            "access_token": CredentialKey(
+                name="access_token",
+                value=SecretStr("old"),
+                expires_at=datetime.now(UTC) + expires_in,
+            )
+        },
+        provider_id="slow",
+        auto_refresh=True,
+    )
+
+
+@pytest.fixture
+def provider():
+    return SlowProvider()
+
+
+@pytest.fixture
+def store(provider):
+    store = CredentialStore(storage=InMemoryStorage(), providers=[provider])
+    yield store
+    provider.gate.set()
+    store.close()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestStoreRefresh:
+    def test_concurrent_readers_share_one_refresh(self, store, provider):
+        store._storage.save(_oauth("github", -timedelta(minutes=1)))
+        provider.gate.clear()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(store.get_key("github", "access_token")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        assert _wait_for(lambda: provider.calls)
+        time.sleep(0.05)
+        provider.gate.set()
+        for thread in threads:
+            thread.join()
+
+        assert provider.calls == ["github"]
+        assert results == ["fresh-1"] * 8
+
+    def test_due_credential_is_served_while_refreshing(self, store, provider):
+        store._storage.save(_oauth("github", timedelta(minutes=2)))
+        provider.gate.clear()
+
+        assert store.get_key("github", "access_token") == "old"
+        assert store.get_key("github", "access_token") == "old"
+        provider.gate.set()
+
+        assert _wait_for(lambda: store.get_key("github", "access_token") == "fresh-1")
+        assert provider.calls == ["github"]
+
+    def test_slow_refresh_does_not_block_other_credentials(self, store, provider):
+        other = next(
+            f"slack_{i}"
+            for i in range(100)
+            if store._stripe(f"slack_{i}") is not store._stripe("github")
+        )
+        store._storage.save(_oauth("github", -timedelta(minutes=1)))
+        store._storage.save(_oauth(other, timedelta(hours=1)))
+        provider.gate.clear()
+
+        blocked = threading.Thread(target=store.get_credential, args=("github",))
+        blocked.start()
+        assert _wait_for(lambda: provider.calls)
+
+        started = time.monotonic()
+        assert store.get_key(other, "access_token") == "old"
+        assert time.monotonic() - started < 1
+        provider.gate.set()
+        blocked.join()
+
+    def test_failed_background_refresh_backs_off(self, store, provider):
+        store._storage.save(_oauth("github", timedelta(minutes=2)))
+        provider.fail = True
+
+        assert store.get_key("github", "access_token") == "old"
+        assert _wait_for(lambda: "github" in store._refresh_failed_at)
+        for _ in range(5):
+            assert store.get_key("github", "access_token") == "old"
+
+        assert provider.calls == ["github"]
+
+    def test_background_refresher_renews_before_expiry(self, store, provider):
+        store.save_credential(_oauth("github", timedelta(minutes=2)))
+        store.save_credential(_oauth("fresh", timedelta(hours=1)))
+
+        store.start_background_refresh(interval_seconds=0.01)
+        assert _wait_for(lambda: provider.calls)
+        store.stop_background_refresh()
+
+        assert provider.calls == ["github"]
+        assert _wait_for(lambda: store._storage.load("github").get_key("access_token") == "fresh-1")
+
+
+class TestLifecycleRefresh:
+    def test_managers_share_one_token_refresh(self, store):
+        gate = threading.Event()
+
+        def refresh_access_token(refresh_token):
+            gate.wait(5)
+            return OAuth2Token(
+                access_token="new",
+                expires_at=datetime.now(UTC) + timedelta(hours=1),
+                refresh_token=refresh_token,
+            )
+
+        oauth = Mock(provider_id="oauth2")
+        oauth.refresh_access_token.side_effect = refresh_access_token
+        credential = _oauth("github", -timedelta(minutes=1))
+        credential.provider_id = "oauth2"
+        credential.set_key("refresh_token", "r1")
+        store.save_credential(credential)
+
+        managers = [TokenLifecycleManager(oauth, "github", store) for _ in range(4)]
+        tokens = []
+        threads = [
+            threading.Thread(target=lambda m=m: tokens.append(m.sync_get_valid_token()))
+            for m in managers
+        ]
+        for thread in threads:
+            thread.start()
+        assert _wait_for(lambda: oauth.refresh_access_token.called)
+        time.sleep(0.05)
+        gate.set()
+        for thread in threads:
+            thread.join()
+
+        assert oauth.refresh_access_token.call_count == 1
+        assert [t.access_token for t in tokens] == ["new"] * 4
+
+    def test_token_in_buffer_is_used_while_refreshing(self, store):
+        oauth = Mock(provider_id="oauth2")
+        oauth.refresh_access_token.return_value = OAuth2Token(
+            access_token="new", expires_at=datetime.now(UTC) + timedelta(hours=1)
+        )
+        credential = _oauth("github", timedelta(minutes=2))
+        credential.provider_id = "oauth2"
+        credential.set_key("refresh_token", "r1")
+        store.save_credential(credential)
+
+        manager = TokenLifecycleManager(oauth, "github", store)
+        assert manager.sync_get_valid_token().access_token == "old"
+        assert _wait_for(lambda: manager.sync_get_valid_token().access_token == "new")
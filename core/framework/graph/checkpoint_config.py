@@ -28,6 +28,12 @@ class CheckpointConfig:
     # Performance
     async_checkpoint: bool = True  # Don't block execution on checkpoint writes
 
+    # Delta checkpoints: write only memory keys changed since the previous
+    # checkpoint, with a full snapshot every N checkpoints to bound the
+    # chain walked on load.
+    delta_checkpoints: bool = True
+    full_snapshot_interval: int = 10
+
     # What to include in checkpoints
     include_full_memory: bool = True
     include_metrics: bool = True
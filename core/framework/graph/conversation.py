@@ -6,7 +6,10 @@
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Literal, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from framework.llm.token_counting import TokenCounter
 
 
 @dataclass
@@ -174,6 +177,80 @@ def _compact_tool_calls(tool_calls: list[dict[str, Any]]) -> list[dict[str, Any]
     return compact
 
 
+def _tool_call_ids(msgs: list[dict[str, Any]]) -> set[str]:
+    """IDs of all tool calls made by assistant messages in *msgs*."""
+    ids: set[str] = set()
+    for m in msgs:
+        if m.get("role") == "assistant":
+            for tc in m.get("tool_calls") or []:
+                tc_id = tc.get("id")
+                if tc_id:
+                    ids.add(tc_id)
+    return ids
+
+
+def _interrupted_results(
+    tool_calls: list[dict[str, Any]], answered: set[str]
+) -> list[dict[str, Any]]:
+    """Synthetic error results for tool calls that never got a result."""
+    return [
+        {
+            "role": "tool",
+            "tool_call_id": tc["id"],
+            "content": "ERROR: Tool execution was interrupted.",
+        }
+        for tc in tool_calls
+        if tc.get("id") and tc["id"] not in answered
+    ]
+
+
+def _repair_tool_pairs(
+    msgs: list[dict[str, Any]],
+    known_ids: set[str],
+    dropped: set[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Single-pass tool_call / tool_result repair (see ``_repair_orphaned_tool_calls``).
+
+    Tool results whose ID is not in *known_ids* are dropped (and recorded in
+    *dropped* when given).  Results following an assistant tool-call message
+    are buffered until the run ends so synthetic results for unanswered
+    calls go right after the assistant message without rescanning.
+    """
+    repaired: list[dict[str, Any]] = []
+    open_calls: list[dict[str, Any]] | None = None
+    answered: set[str] = set()
+    run: list[dict[str, Any]] = []
+    for m in msgs:
+        if m.get("role") == "tool":
+            tid = m.get("tool_call_id")
+            if tid and tid not in known_ids:
+                if dropped is not None:
+                    dropped.add(tid)
+                continue  # skip orphaned result
+            if open_calls is None:
+                repaired.append(m)
+            else:
+                if tid:
+                    answered.add(tid)
+                run.append(m)
+            continue
+
+        if open_calls is not None:
+            repaired.extend(_interrupted_results(open_calls, answered))
+            repaired.extend(run)
+            open_calls = None
+        repaired.append(m)
+        if m.get("role") == "assistant" and m.get("tool_calls"):
+            open_calls = m["tool_calls"]
+            answered = set()
+            run = []
+
+    if open_calls is not None:
+        repaired.extend(_interrupted_results(open_calls, answered))
+        repaired.extend(run)
+    return repaired
+
+
 def extract_tool_call_history(messages: list[Message], max_entries: int = 30) -> str:
     """Build a compact tool call history from a list of messages.
 
@@ -324,6 +401,12 @@ class NodeConversation:
     When a :class:`ConversationStore` is supplied every mutation is
     persisted via write-through (meta is lazily written on the first
     ``_persist`` call).
+
+    Token usage is tracked incrementally: each message's estimate is added
+    to a running total when it is appended and the total is recomputed only
+    when history is rewritten (prune/compact/clear/restore), so budget
+    checks are O(1).  Estimates use ``chars / 4`` unless a
+    :class:`~framework.llm.token_counting.TokenCounter` is supplied.
     """
 
     def __init__(
@@ -333,6 +416,7 @@ def __init__(
         compaction_threshold: float = 0.8,
         output_keys: list[str] | None = None,
         store: ConversationStore | None = None,
+        token_counter: TokenCounter | None = None,
     ) -> None:
         self._system_prompt = system_prompt
         self._max_context_tokens = max_context_tokens
@@ -344,6 +428,20 @@ def __init__(
         self._meta_persisted: bool = False
         self._last_api_input_tokens: int | None = None
         self._current_phase: str | None = None
+        self._token_counter = token_counter
+        # Running sum of per-message estimates, and its value when the last
+        # API input-token count was recorded
+        self._message_tokens: float = 0
+        self._api_anchor_tokens: float = 0
+        # LLM-format dicts aligned with _messages (each message converted once)
+        self._llm_entries: list[tuple[Message, dict[str, Any]]] = []
+        self._llm_stale: bool = False
+        # Repaired to_llm_messages() output for _llm_entries[:_llm_view_upto].
+        # Only the tail after the last non-tool message is re-repaired per call.
+        self._llm_view: list[dict[str, Any]] | None = None
+        self._llm_view_upto: int = 0
+        self._llm_tool_call_ids: set[str] = set()
+        self._llm_dropped_ids: set[str] = set()
 
     # --- Properties --------------------------------------------------------
 
@@ -406,8 +504,7 @@ async def add_user_message(
             is_client_input=is_client_input,
             image_content=image_content,
         )
-        self._messages.append(msg)
-        self._next_seq += 1
+        self._append(msg)
         await self._persist(msg)
         return msg
 
@@ -423,8 +520,7 @@ async def add_assistant_message(
             tool_calls=tool_calls,
             phase_id=self._current_phase,
         )
-        self._messages.append(msg)
-        self._next_seq += 1
+        self._append(msg)
         await self._persist(msg)
         return msg
 
@@ -446,8 +542,7 @@ async def add_tool_result(
             image_content=image_content,
             is_skill_content=is_skill_content,
         )
-        self._messages.append(msg)
-        self._next_seq += 1
+        self._append(msg)
         await self._persist(msg)
         return msg
 
@@ -459,9 +554,59 @@ def to_llm_messages(self) -> list[dict[str, Any]]:
         Automatically repairs orphaned tool_use blocks (assistant messages
         with tool_calls that lack corresponding tool-result messages).  This
         can happen when a loop is cancelled mid-tool-execution.
+
+        Each message is converted once and the repaired prefix is kept, so a
+        call after appending only processes the new tail.  The returned list
+        is a fresh copy but its dicts are shared and must not be mutated.
         """
-        msgs = [m.to_llm_dict() for m in self._messages]
-        return self._repair_orphaned_tool_calls(msgs)
+        self._sync_llm_entries()
+        entries = self._llm_entries
+        if self._llm_view is None:
+            self._llm_view = []
+            self._llm_view_upto = 0
+            self._llm_tool_call_ids = set()
+            self._llm_dropped_ids = set()
+
+        tail = [d for _, d in entries[self._llm_view_upto :]]
+        new_ids = _tool_call_ids(tail)
+        if new_ids & self._llm_dropped_ids:
+            # A result dropped as orphaned now has its call: repair from scratch
+            self._llm_view = None
+            return self.to_llm_messages()
+        self._llm_tool_call_ids |= new_ids
+
+        # Tool-call runs never span a non-tool message, so everything before
+        # the last one is final and can join the cached prefix.
+        boundary = len(tail)
+        while boundary > 0 and tail[boundary - 1].get("role") == "tool":
+            boundary -= 1
+        boundary = max(0, boundary - 1)
+        if boundary:
+            self._llm_view.extend(
+                _repair_tool_pairs(tail[:boundary], self._llm_tool_call_ids, self._llm_dropped_ids)
+            )
+            self._llm_view_upto += boundary
+        return self._llm_view + _repair_tool_pairs(tail[boundary:], self._llm_tool_call_ids)
+
+    def _sync_llm_entries(self) -> None:
+        """Bring the cached LLM dicts in line with ``_messages``.
+
+        Appends only convert the new tail.  After a rewrite (compaction,
+        clear, restore) dicts are reused for every message that survived and
+        the repaired view is rebuilt.
+        """
+        msgs = self._messages
+        entries = self._llm_entries
+        n = len(entries)
+        if not self._llm_stale and n <= len(msgs) and (n == 0 or entries[-1][0] is msgs[n - 1]):
+            entries.extend((m, m.to_llm_dict()) for m in msgs[n:])
+            return
+        cached = {id(m): d for m, d in entries}
+        self._llm_entries = [
+            (m, cached[id(m)] if id(m) in cached else m.to_llm_dict()) for m in msgs
+        ]
+        self._llm_stale = False
+        self._llm_view = None
 
     @staticmethod
     def _repair_orphaned_tool_calls(
@@ -476,81 +621,38 @@ def _repair_orphaned_tool_calls(
            get a synthetic error result appended.  This happens when a loop
            is cancelled mid-tool-execution.
         """
-        # Pass 1: collect all tool_call IDs from assistant messages so we
-        # can identify orphaned tool-result messages.
-        all_tool_call_ids: set[str] = set()
-        for m in msgs:
-            if m.get("role") == "assistant":
-                for tc in m.get("tool_calls") or []:
-                    tc_id = tc.get("id")
-                    if tc_id:
-                        all_tool_call_ids.add(tc_id)
-
-        # Pass 2: build repaired list — drop orphaned tool results, patch
-        # missing tool results.
-        repaired: list[dict[str, Any]] = []
-        for i, m in enumerate(msgs):
-            # Drop tool-result messages whose tool_call_id has no matching
-            # tool_use in any assistant message (orphaned by compaction).
-            if m.get("role") == "tool":
-                tid = m.get("tool_call_id")
-                if tid and tid not in all_tool_call_ids:
-                    continue  # skip orphaned result
-
-            repaired.append(m)
-            tool_calls = m.get("tool_calls")
-            if m.get("role") != "assistant" or not tool_calls:
-                continue
-            # Collect IDs of tool results that follow this assistant message
-            answered: set[str] = set()
-            for j in range(i + 1, len(msgs)):
-                if msgs[j].get("role") == "tool":
-                    tid = msgs[j].get("tool_call_id")
-                    if tid:
-                        answered.add(tid)
-                else:
-                    break  # stop at first non-tool message
-            # Patch any missing results
-            for tc in tool_calls:
-                tc_id = tc.get("id")
-                if tc_id and tc_id not in answered:
-                    repaired.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": tc_id,
-                            "content": "ERROR: Tool execution was interrupted.",
-                        }
-                    )
-        return repaired
+        return _repair_tool_pairs(msgs, _tool_call_ids(msgs))
 
     def estimate_tokens(self) -> int:
-        """Best available token estimate.
+        """Best available token estimate.  O(1).
 
-        Uses actual API input token count when available (set via
-        :meth:`update_token_count`), otherwise falls back to a
-        ``total_chars / 4`` heuristic that includes both message content
-        AND tool_call argument sizes.
+        Uses the actual API input token count when available (set via
+        :meth:`update_token_count`) plus the estimate for messages added
+        since; otherwise the running per-message estimate, which covers
+        message content AND tool_call argument sizes.
         """
         if self._last_api_input_tokens is not None:
-            return self._last_api_input_tokens
-        total_chars = 0
-        for m in self._messages:
-            total_chars += len(m.content)
-            if m.tool_calls:
-                for tc in m.tool_calls:
-                    func = tc.get("function", {})
-                    total_chars += len(func.get("arguments", ""))
-                    total_chars += len(func.get("name", ""))
-        return total_chars // 4
+            added = max(0.0, self._message_tokens - self._api_anchor_tokens)
+            return self._last_api_input_tokens + int(added)
+        return max(0, int(self._message_tokens))
 
     def update_token_count(self, actual_input_tokens: int) -> None:
         """Store actual API input token count for more accurate compaction.
 
-        Called by EventLoopNode after each LLM call with the ``input_tokens``
-        value from the API response.  This value includes system prompt and
-        tool definitions, so it may be higher than a message-only estimate.
+        Call with the ``input_tokens`` of a single LLM request, before
+        appending that request's response: the count covers the messages
+        present now (plus system prompt and tool definitions), and
+        messages appended later are estimated on top of it.
         """
         self._last_api_input_tokens = actual_input_tokens
+        self._api_anchor_tokens = self._message_tokens
+
+    def set_token_counter(self, token_counter: TokenCounter | None) -> None:
+        """Switch the per-message estimator and recount the history."""
+        if token_counter is self._token_counter:
+            return
+        self._token_counter = token_counter
+        self._recount_tokens()
 
     def usage_ratio(self) -> float:
         """Current token usage as a fraction of *max_context_tokens*.
@@ -564,6 +666,33 @@ def usage_ratio(self) -> float:
     def needs_compaction(self) -> bool:
         return self.estimate_tokens() >= self._max_context_tokens * self._compaction_threshold
 
+    def _estimate_message_tokens(self, msg: Message) -> float:
+        if self._token_counter is not None:
+            return self._token_counter.count_message(msg.to_llm_dict())
+        chars = len(msg.content)
+        if msg.tool_calls:
+            for tc in msg.tool_calls:
+                func = tc.get("function", {})
+                chars += len(func.get("arguments", ""))
+                chars += len(func.get("name", ""))
+        return chars / 4
+
+    def _append(self, msg: Message) -> None:
+        self._messages.append(msg)
+        self._next_seq += 1
+        self._message_tokens += self._estimate_message_tokens(msg)
+
+    def _recount_tokens(self) -> None:
+        """Recompute the running total after history was rewritten.
+
+        Also marks the cached LLM dicts for re-alignment on the next
+        :meth:`to_llm_messages` call.
+        """
+        self._llm_stale = True
+        self._message_tokens = sum(self._estimate_message_tokens(m) for m in self._messages)
+        self._last_api_input_tokens = None
+        self._api_anchor_tokens = 0
+
     # --- Output-key extraction ---------------------------------------------
 
     def _extract_protected_values(self, messages: list[Message]) -> dict[str, str]:
@@ -689,6 +818,14 @@ async def prune_old_tool_results(
                 phase_id=msg.phase_id,
                 is_transition_marker=msg.is_transition_marker,
             )
+            self._message_tokens += self._estimate_message_tokens(
+                self._messages[i]
+            ) - self._estimate_message_tokens(msg)
+            if i < len(self._llm_entries) and self._llm_entries[i][0] is msg:
+                self._llm_entries[i] = (self._messages[i], self._messages[i].to_llm_dict())
+            else:
+                self._llm_stale = True
+            self._llm_view = None
             count += 1
 
             if self._store:
@@ -696,6 +833,7 @@ async def prune_old_tool_results(
 
         # Reset token estimate — content lengths changed
         self._last_api_input_tokens = None
+        self._api_anchor_tokens = 0
         return count
 
     async def compact(
@@ -774,7 +912,7 @@ async def compact(
             await self._store.write_cursor({"next_seq": self._next_seq})
 
         self._messages = [summary_msg] + recent_messages
-        self._last_api_input_tokens = None  # reset; next LLM call will recalibrate
+        self._recount_tokens()  # next LLM call will recalibrate
 
     async def compact_preserving_structure(
         self,
@@ -979,7 +1117,7 @@ async def compact_preserving_structure(
 
         # Reassemble: reference + kept structural (in original order) + recent
         self._messages = [ref_msg] + kept_structural + recent_messages
-        self._last_api_input_tokens = None
+        self._recount_tokens()
 
     def _find_phase_graduated_split(self) -> int | None:
         """Find split point that preserves current + previous phase.
@@ -1014,7 +1152,7 @@ async def clear(self) -> None:
             await self._store.delete_parts_before(self._next_seq)
             await self._store.write_cursor({"next_seq": self._next_seq})
         self._messages.clear()
-        self._last_api_input_tokens = None
+        self._recount_tokens()
 
     def export_summary(self) -> str:
         """Structured summary with [STATS], [CONFIG], [RECENT_MESSAGES] sections."""
@@ -1077,6 +1215,7 @@ async def restore(
         cls,
         store: ConversationStore,
         phase_id: str | None = None,
+        token_counter: TokenCounter | None = None,
     ) -> NodeConversation | None:
         """Reconstruct a NodeConversation from a store.
 
@@ -1086,6 +1225,7 @@ async def restore(
                 Used in isolated mode so a node only sees its own
                 messages in the shared flat store.  In continuous mode
                 pass ``None`` to load all parts.
+            token_counter: Optional tokenizer-backed estimator.
 
         Returns ``None`` if the store contains no metadata (i.e. the
         conversation was never persisted).
@@ -1100,6 +1240,7 @@ async def restore(
             compaction_threshold=meta.get("compaction_threshold", 0.8),
             output_keys=meta.get("output_keys"),
             store=store,
+            token_counter=token_counter,
         )
         conv._meta_persisted = True
 
@@ -1107,6 +1248,7 @@ async def restore(
         if phase_id:
             parts = [p for p in parts if p.get("phase_id") == phase_id]
         conv._messages = [Message.from_storage_dict(p) for p in parts]
+        conv._recount_tokens()
 
         cursor = await store.read_cursor()
         if cursor:
@@ -24,17 +24,21 @@
 import json
 import logging
 import re
+from collections import ChainMap
 from enum import StrEnum
 from typing import Any
 
 from pydantic import BaseModel, Field, model_validator
 
-from framework.graph.safe_eval import safe_eval
+from framework.graph.safe_eval import compile_expression
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_TOKENS = 8192
 
+# Names always present in a condition's context (not logged as variables)
+_CONDITION_FIXED_NAMES = frozenset({"output", "memory", "result", "true", "false"})
+
 
 class EdgeCondition(StrEnum):
     """When an edge should be traversed."""
@@ -167,35 +171,37 @@ def _evaluate_condition(
         if not self.condition_expr:
             return True
 
-        # Build evaluation context
-        # Include memory keys directly for easier access in conditions
-        context = {
-            "output": output,
-            "memory": memory,
-            "result": output.get("result"),
-            "true": True,  # Allow lowercase true/false in conditions
-            "false": False,
-            **memory,  # Unpack memory keys directly into context
-        }
+        # Evaluation context: memory keys are exposed directly (and shadow
+        # the fixed names), read lazily instead of copying all of memory.
+        context = ChainMap(
+            memory,
+            {
+                "output": output,
+                "memory": memory,
+                "result": output.get("result"),
+                "true": True,  # Allow lowercase true/false in conditions
+                "false": False,
+            },
+        )
 
         try:
-            # Safe evaluation using AST-based whitelist
-            result = bool(safe_eval(self.condition_expr, context))
-            # Log the evaluation for visibility
-            # Extract the variable names used in the expression for debugging
-            expr_vars = {
-                k: repr(context[k])
-                for k in context
-                if k not in ("output", "memory", "result", "true", "false")
-                and k in self.condition_expr
-            }
-            logger.info(
-                "  Edge %s: condition '%s' → %s  (vars: %s)",
-                self.id,
-                self.condition_expr,
-                result,
-                expr_vars or "none matched",
-            )
+            # Safe evaluation using the AST-whitelisted expression, compiled once
+            compiled = compile_expression(self.condition_expr)
+            result = bool(compiled(context))
+            # Log the evaluation for visibility, with the variables it read
+            if logger.isEnabledFor(logging.INFO):
+                expr_vars = {
+                    k: repr(context[k])
+                    for k in sorted(compiled.names)
+                    if k not in _CONDITION_FIXED_NAMES and k in context
+                }
+                logger.info(
+                    "  Edge %s: condition '%s' → %s  (vars: %s)",
+                    self.id,
+                    self.condition_expr,
+                    result,
+                    expr_vars or "none matched",
+                )
             return result
         except Exception as e:
             logger.warning(f"      ⚠ Condition evaluation failed: {self.condition_expr}")
@@ -576,6 +582,14 @@ def validate(self) -> dict[str, list[str]]:
                 errors.append(f"Edge '{edge.id}' references missing source '{edge.source}'")
             if not self.get_node(edge.target):
                 errors.append(f"Edge '{edge.id}' references missing target '{edge.target}'")
+            # Compile conditions now so bad expressions fail here, not mid-run
+            if edge.condition == EdgeCondition.CONDITIONAL and edge.condition_expr:
+                try:
+                    compile_expression(edge.condition_expr)
+                except (SyntaxError, ValueError) as e:
+                    errors.append(
+                        f"Edge '{edge.id}' has invalid condition_expr '{edge.condition_expr}': {e}"
+                    )
 
         # Check for unreachable nodes
         # Start with main entry node and all entry points (for pause/resume architecture)
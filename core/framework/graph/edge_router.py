@@ -0,0 +1,181 @@
+"""
+Edge Router - Batched LLM routing for llm_decide edges.
+
+Evaluating llm_decide edges one at a time costs one LLM round-trip per
+edge.  When a node has several llm_decide edges, the router asks a single
+LLM call to pick among all of them, and memoizes the decision per
+(source node, source output) so re-visiting a node with the same output
+does not ask again.
+
+If the response cannot be parsed, ``decide()`` returns ``None`` and the
+caller falls back to per-edge evaluation.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from collections import OrderedDict
+from typing import Any
+
+from framework.graph.edge import EdgeSpec
+
+logger = logging.getLogger(__name__)
+
+_ROUTER_SYSTEM = "You are a routing agent. Respond with JSON only."
+
+
+def _output_digest(source_success: bool, source_output: dict[str, Any]) -> str:
+    payload = json.dumps(source_output, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8", "surrogatepass")).hexdigest()
+    return f"{int(source_success)}:{digest}"
+
+
+class LLMEdgeRouter:
+    """Decides all llm_decide edges leaving a node with one LLM call.
+
+    Decisions are cached (LRU, ``max_entries``) keyed on the source node,
+    the candidate edge IDs, and a hash of the source output and success flag.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._cache: OrderedDict[tuple[str, tuple[str, ...], str], dict[str, bool]] = OrderedDict()
+        self.llm_calls = 0
+        self.cache_hits = 0
+        self.parse_failures = 0
+
+    async def decide(
+        self,
+        edges: list[EdgeSpec],
+        *,
+        llm: Any,
+        goal: Any,
+        source_node_id: str,
+        source_success: bool,
+        source_output: dict[str, Any],
+        memory: dict[str, Any],
+        source_node_name: str | None = None,
+        target_node_names: dict[str, str] | None = None,
+    ) -> dict[str, bool] | None:
+        """Decide which of *edges* to traverse.
+
+        Returns:
+            ``{edge_id: proceed}`` for every edge, or ``None`` when the LLM
+            call or its response was unusable (evaluate edges individually).
+        """
+        key = (
+            source_node_id,
+            tuple(edge.id for edge in edges),
+            _output_digest(source_success, source_output),
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return dict(cached)
+
+        prompt = self._build_prompt(
+            edges,
+            goal=goal,
+            source_success=source_success,
+            source_output=source_output,
+            memory=memory,
+            source_node_name=source_node_name or source_node_id,
+            target_node_names=target_node_names or {},
+        )
+        try:
+            self.llm_calls += 1
+            response = await llm.acomplete(
+                messages=[{"role": "user", "content": prompt}],
+                system=_ROUTER_SYSTEM,
+                max_tokens=300,
+                json_mode=True,
+            )
+        except Exception as e:
+            logger.warning(f"      ⚠ Batched LLM routing failed, evaluating edges one by one: {e}")
+            return None
+
+        content = getattr(response, "content", None)
+        decisions = self._parse(content, edges) if isinstance(content, str) else None
+        if decisions is None:
+            self.parse_failures += 1
+            logger.warning(
+                "      ⚠ Unparseable batched routing response, evaluating edges one by one"
+            )
+            return None
+
+        self._cache[key] = decisions
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return dict(decisions)
+
+    @staticmethod
+    def _build_prompt(
+        edges: list[EdgeSpec],
+        *,
+        goal: Any,
+        source_success: bool,
+        source_output: dict[str, Any],
+        memory: dict[str, Any],
+        source_node_name: str,
+        target_node_names: dict[str, str],
+    ) -> str:
+        options = "\n".join(
+            f'- "{edge.id}": proceed to {target_node_names.get(edge.id, edge.target)}'
+            f" — {edge.description or 'No description'}"
+            for edge in edges
+        )
+        memory_preview = {k: str(v)[:100] for k, v in list(memory.items())[:5]}
+        return f"""You are choosing which edges to follow in an agent workflow.
+
+**Goal**: {goal.name}
+{goal.description}
+
+**Current State**:
+- Just completed: {source_node_name}
+- Success: {source_success}
+- Output: {json.dumps(source_output, default=str)}
+
+**Candidate next steps** (edge id: target — description):
+{options}
+
+**Context from memory**:
+{json.dumps(memory_preview, indent=2)}
+
+Select every candidate that is the right next step toward achieving the goal.
+Select none if no candidate should be taken, and more than one only if they
+should run in parallel.
+
+Respond with ONLY a JSON object:
+{{"proceed": ["<edge id>", ...], "reasoning": "brief explanation"}}"""
+
+    @staticmethod
+    def _parse(content: str, edges: list[EdgeSpec]) -> dict[str, bool] | None:
+        data: Any = None
+        try:
+            data = json.loads(content)
+        except (json.JSONDecodeError, TypeError):
+            match = re.search(r"\{.*\}", content, re.DOTALL)
+            if match:
+                try:
+                    data = json.loads(match.group())
+                except json.JSONDecodeError:
+                    data = None
+        if not isinstance(data, dict):
+            return None
+
+        selected = data.get("proceed")
+        edge_ids = {edge.id for edge in edges}
+        if not isinstance(selected, list) or not all(
+            isinstance(edge_id, str) and edge_id in edge_ids for edge_id in selected
+        ):
+            return None
+
+        logger.info(
+            "      🤔 LLM routing decision: %s",
+            ", ".join(selected) if selected else "none",
+        )
+        if data.get("reasoning"):
+            logger.info("         Reason: %s", data["reasoning"])
+        return {edge.id: edge.id in selected for edge in edges}
@@ -5,19 +5,26 @@
 2. Structure-preserving compaction (spillover)
 3. LLM summary compaction (with recursive splitting)
 4. Emergency deterministic summary (no LLM)
+
+With ``LoopConfig.speculative_compaction_watermark`` set, a
+:class:`SpeculativeCompactor` builds the stage-3 summary of the older
+history in the background once usage crosses the watermark, and
+:func:`compact` swaps it in instead of blocking on the LLM.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import re
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from framework.graph.conversation import NodeConversation
+from framework.graph.conversation import Message, NodeConversation
 from framework.graph.event_loop.event_publishing import publish_context_usage
 from framework.graph.event_loop.types import LoopConfig, OutputAccumulator
 from framework.graph.node import NodeContext
@@ -39,10 +46,12 @@ async def compact(
     event_bus: EventBus | None,
     char_limit: int = LLM_COMPACT_CHAR_LIMIT,
     max_depth: int = LLM_COMPACT_MAX_DEPTH,
+    speculative: SpeculativeCompactor | None = None,
 ) -> None:
     """Run the full compaction pipeline if conversation needs compaction.
 
     Pipeline stages (in order, short-circuits when budget is restored):
+    0. Swap in a speculative summary built in the background, if valid
     1. Prune old tool results
     2. Structure-preserving compaction (free, no LLM)
     3. LLM summary compaction (recursive split if too large)
@@ -55,6 +64,21 @@ async def compact(
     if ratio_before >= 1.0:
         pre_inventory = build_message_inventory(conversation)
 
+    # --- Step 0: Speculative summary (already built off the critical path) ---
+    if speculative is not None and await speculative.apply(
+        conversation, phase_graduated=phase_grad
+    ):
+        if not conversation.needs_compaction():
+            await log_compaction(
+                ctx,
+                conversation,
+                ratio_before,
+                event_bus,
+                pre_inventory=pre_inventory,
+                extra=speculative.metrics(),
+            )
+            return
+
     # --- Step 1: Prune old tool results (free, fast) ---
     protect = max(2000, config.max_context_tokens // 12)
     pruned = await conversation.prune_old_tool_results(
@@ -149,6 +173,185 @@ async def compact(
     )
 
 
+# --- Speculative (background) LLM compaction ----------------------------
+
+
+class SpeculativeCompactor:
+    """Builds the LLM summary of a conversation's older prefix in the background.
+
+    :meth:`maybe_start` snapshots every message except the most recent
+    *keep_recent* once usage crosses the watermark and summarises them in
+    a background task while the agent keeps working.  When the hard
+    threshold trips, :meth:`apply` swaps the summary in with
+    ``NodeConversation.compact`` — but only if the summarised messages
+    are still the conversation's leading messages (same objects, so any
+    prune/compaction in between invalidates it).  An in-flight summary is
+    awaited rather than restarted, which still saves the time it has
+    already run.
+
+    Counters: ``started``, ``applied``, ``discarded`` and
+    ``latency_saved`` (seconds of LLM time taken off the turn's critical
+    path).
+    """
+
+    def __init__(self, keep_recent: int = 4) -> None:
+        self._keep_recent = keep_recent
+        self._task: asyncio.Task[str] | None = None
+        self._conversation: NodeConversation | None = None
+        self._prefix: list[Message] = []
+        self._started_at = 0.0
+        self._finished_at: float | None = None
+        self.started = 0
+        self.applied = 0
+        self.discarded = 0
+        self.latency_saved = 0.0
+
+    @property
+    def pending(self) -> bool:
+        return self._task is not None
+
+    def maybe_start(
+        self,
+        ctx: NodeContext,
+        conversation: NodeConversation,
+        accumulator: OutputAccumulator | None,
+        *,
+        config: LoopConfig,
+        char_limit: int = LLM_COMPACT_CHAR_LIMIT,
+        max_depth: int = LLM_COMPACT_MAX_DEPTH,
+    ) -> bool:
+        """Start a background summary if usage is past the watermark.  O(1) when idle."""
+        watermark = config.speculative_compaction_watermark
+        if not watermark or ctx.llm is None:
+            return False
+        if self._task is not None:
+            if self._is_valid_for(conversation):
+                return False
+            self.discard("history changed")
+        if conversation.usage_ratio() < watermark:
+            return False
+
+        messages = conversation.messages
+        split = len(messages) - self._keep_recent
+        # Never separate tool results from the assistant message that called them
+        while 0 < split < len(messages) and messages[split].role == "tool":
+            split += 1
+        if split < 2 or split >= len(messages):
+            return False
+
+        self._conversation = conversation
+        self._prefix = messages[:split]
+        self._started_at = time.monotonic()
+        self._finished_at = None
+        self._task = asyncio.create_task(
+            llm_compact(
+                ctx,
+                list(self._prefix),
+                accumulator,
+                char_limit=char_limit,
+                max_depth=max_depth,
+                max_context_tokens=config.max_context_tokens,
+            )
+        )
+        self._task.add_done_callback(self._on_done)
+        self.started += 1
+        logger.info(
+            "Speculative compaction started: summarising %d/%d messages at %.0f%% usage",
+            split,
+            len(messages),
+            conversation.usage_ratio() * 100,
+        )
+        return True
+
+    def _on_done(self, task: asyncio.Task[str]) -> None:
+        self._finished_at = time.monotonic()
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Speculative compaction failed: %s", task.exception())
+
+    def _is_valid_for(self, conversation: NodeConversation) -> bool:
+        if conversation is not self._conversation:
+            return False
+        current = conversation.messages
+        n = len(self._prefix)
+        if len(current) <= n:
+            return False
+        return all(a is b for a, b in zip(self._prefix, current[:n], strict=False))
+
+    async def apply(self, conversation: NodeConversation, *, phase_graduated: bool = False) -> bool:
+        """Swap the speculative summary into *conversation*.  Returns True if applied.
+
+        *phase_graduated* is passed on to ``NodeConversation.compact`` as in
+        the blocking path, unless the phase split would also drop messages
+        added after the summarised prefix.
+        """
+        task = self._task
+        if task is None:
+            return False
+        if not self._is_valid_for(conversation):
+            self.discard("history changed")
+            return False
+
+        waited_from = time.monotonic()
+        try:
+            summary = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise  # the caller was cancelled, not the speculation
+            self.discard("cancelled")
+            return False
+        except Exception:
+            self.discard("summary failed")
+            return False
+        waited = time.monotonic() - waited_from
+
+        # The await may have yielded to other work; re-check before swapping
+        if not self._is_valid_for(conversation):
+            self.discard("history changed")
+            return False
+
+        keep_recent = len(conversation.messages) - len(self._prefix)
+        if phase_graduated:
+            split = conversation._find_phase_graduated_split()
+            phase_graduated = split is not None and split <= len(self._prefix)
+        await conversation.compact(
+            summary, keep_recent=keep_recent, phase_graduated=phase_graduated
+        )
+        saved = max(0.0, (self._finished_at or time.monotonic()) - self._started_at - waited)
+        self.latency_saved += saved
+        self.applied += 1
+        self._reset()
+        logger.info(
+            "Speculative compaction applied: %.0f%% usage, %.2fs of LLM time off the turn",
+            conversation.usage_ratio() * 100,
+            saved,
+        )
+        return True
+
+    def discard(self, reason: str = "") -> None:
+        """Drop the current speculation (cancelling it if still running)."""
+        if self._task is None:
+            return
+        if not self._task.done():
+            self._task.cancel()
+        self.discarded += 1
+        logger.info("Speculative compaction discarded: %s", reason or "no longer needed")
+        self._reset()
+
+    def _reset(self) -> None:
+        self._task = None
+        self._conversation = None
+        self._prefix = []
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "speculative": True,
+            "speculative_started": self.started,
+            "speculative_applied": self.applied,
+            "speculative_discarded": self.discarded,
+            "latency_saved_ms": round(self.latency_saved * 1000),
+        }
+
+
 # --- LLM compaction with binary-search splitting ----------------------
 
 
@@ -467,8 +670,13 @@ async def log_compaction(
     event_bus: EventBus | None,
     *,
     pre_inventory: list[dict[str, Any]] | None = None,
+    extra: dict[str, Any] | None = None,
 ) -> None:
-    """Log compaction result to runtime logger and event bus."""
+    """Log compaction result to runtime logger and event bus.
+
+    *extra* is merged into the ``CONTEXT_COMPACTED`` event data (e.g.
+    speculative-compaction metrics).
+    """
     ratio_after = conversation.usage_ratio()
     before_pct = round(ratio_before * 100)
     after_pct = round(ratio_after * 100)
@@ -508,6 +716,8 @@ async def log_compaction(
         }
         if pre_inventory is not None:
             event_data["message_inventory"] = pre_inventory
+        if extra:
+            event_data.update(extra)
         await event_bus.publish(
             AgentEvent(
                 type=EventType.CONTEXT_COMPACTED,
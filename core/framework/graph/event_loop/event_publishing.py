@@ -10,6 +10,7 @@
 import time
 
 from framework.graph.conversation import NodeConversation
+from framework.graph.event_loop.tool_scheduler import ToolScheduler, ToolSlot
 from framework.graph.event_loop.types import HookContext
 from framework.graph.node import NodeContext
 from framework.runtime.event_bus import EventBus
@@ -108,6 +109,7 @@ async def publish_llm_turn_complete(
     input_tokens: int,
     output_tokens: int,
     cached_tokens: int = 0,
+    cache_write_tokens: int = 0,
     execution_id: str = "",
     iteration: int | None = None,
 ) -> None:
@@ -120,6 +122,7 @@ async def publish_llm_turn_complete(
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             cached_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens,
             execution_id=execution_id,
             iteration=iteration,
         )
@@ -276,6 +279,7 @@ async def publish_tool_completed(
     result: str,
     is_error: bool,
     execution_id: str = "",
+    cached: bool = False,
 ) -> None:
     if event_bus:
         await event_bus.emit_tool_call_completed(
@@ -286,6 +290,29 @@ async def publish_tool_completed(
             result=result,
             is_error=is_error,
             execution_id=execution_id,
+            cached=cached,
+        )
+
+
+async def publish_tool_queue_metrics(
+    event_bus: EventBus | None,
+    stream_id: str,
+    node_id: str,
+    slots: list[ToolSlot],
+    scheduler: ToolScheduler,
+    execution_id: str = "",
+) -> None:
+    if event_bus and slots:
+        waits = [slot.wait_s for slot in slots]
+        await event_bus.emit_tool_queue_metrics(
+            stream_id=stream_id,
+            node_id=node_id,
+            batch_size=len(slots),
+            mean_wait_s=round(sum(waits) / len(waits), 4),
+            max_wait_s=round(max(waits), 4),
+            max_queue_depth=max(slot.queue_depth for slot in slots),
+            scheduler=scheduler.metrics(),
+            execution_id=execution_id,
         )
 
 
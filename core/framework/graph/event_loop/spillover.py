@@ -0,0 +1,349 @@
+"""Streaming spill files and bounded JSON sampling for large tool results.
+
+Large tool results used to be parsed with ``json.loads``, re-serialised
+with ``indent=2`` for the spill file, and walked again for metadata and
+previews.  Here a single scan does all three:
+
+- containers near the top are walked by hand; every other value is
+  decoded one at a time with the C ``raw_decode`` and dropped once
+  written, so memory stays bounded by the largest single record;
+- the spill file is streamed to disk as it is scanned, with every array
+  element (record) on its own line;
+- the scan returns a *sample*: the same shape as the parsed JSON, but
+  large arrays keep only their first items and last item
+  (:class:`SampledList`) and wide objects only their first keys
+  (:class:`SampledDict`).  ``extract_json_metadata`` and
+  ``build_json_preview`` accept it in place of the parsed value.
+
+Each spill file gets a line-offset index next to it
+(``.<filename>.idx``) so ``load_data`` can seek straight to a line or
+record.  Index layout (little-endian)::
+
+    b"HIVEIDX1"
+    u64 size of the indexed file in bytes
+    u64 mtime_ns of the indexed file
+    u64 first line of the principal record array (0 if none)
+    u64 number of records in that array
+    u64 byte offset of line 0, line 1, ... (one per line)
+
+A size or mtime mismatch means the file changed since it was indexed.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+INDEX_MAGIC = b"HIVEIDX1"
+_INDEX_HEADER = struct.Struct("<8sQQQQ")
+
+# Arrays longer than this keep only a sample (matches the preview cutoff)
+LARGE_ARRAY_THRESHOLD = 10
+# Object keys sampled per object
+MAX_SAMPLED_KEYS = 200
+# Containers nested deeper than this are decoded whole
+MAX_WALK_DEPTH = 3
+
+_WS = re.compile(r"[ \t\n\r]*")
+_ARRAY_SEP = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+_compact = json.JSONEncoder(ensure_ascii=False, separators=(", ", ": ")).encode
+
+
+class SampledList(list):
+    """First few items and the last item of a large JSON array.
+
+    ``total`` is the length of the real array.
+    """
+
+    def __init__(self, items: list[Any], total: int):
+        super().__init__(items)
+        self.total = total
+
+
+class SampledDict(dict):
+    """The first keys of a wide JSON object; ``total`` is its real key count."""
+
+    def __init__(self, items: dict[str, Any], total: int):
+        super().__init__(items)
+        self.total = total
+
+
+def json_length(value: list | dict) -> int:
+    """Length of a (possibly sampled) JSON container."""
+    return getattr(value, "total", len(value))
+
+
+def index_path_for(path: Path) -> Path:
+    return path.with_name(f".{path.name}.idx")
+
+
+@dataclass
+class RecordRange:
+    """An array in the spill file whose elements are one per line."""
+
+    path: str  # e.g. "results" or "" for a top-level array
+    first_line: int  # 0-based
+    count: int
+
+
+@dataclass
+class SpillInfo:
+    """What was written for one spilled result."""
+
+    size_bytes: int
+    lines: int
+    sample: Any = None  # sampled JSON, or None when the content is not JSON
+    is_json: bool = False
+    records: list[RecordRange] = field(default_factory=list)
+
+    @property
+    def principal_records(self) -> RecordRange | None:
+        """The largest record array, if any."""
+        return max(self.records, key=lambda r: r.count, default=None)
+
+
+class _LineWriter:
+    """Buffered UTF-8 line writer that records each line's byte offset.
+
+    The most recent line is held back so a trailing comma can still be
+    added once the scanner sees the next sibling.
+    """
+
+    _FLUSH_BYTES = 1 << 16
+
+    def __init__(self, f: BinaryIO | None):
+        self._f = f
+        self._buf: list[bytes] = []
+        self._buf_bytes = 0
+        self._pending: str | None = None
+        self.offset = 0
+        self.line_offsets: list[int] = []
+
+    @property
+    def line_no(self) -> int:
+        """Line number the next ``line()`` call will get."""
+        return len(self.line_offsets) + (self._pending is not None)
+
+    def line(self, text: str) -> None:
+        self._emit_pending()
+        self._pending = text
+
+    def append(self, text: str) -> None:
+        assert self._pending is not None
+        self._pending += text
+
+    def close(self) -> None:
+        self._emit_pending()
+        if self._f is not None and self._buf:
+            self._f.write(b"".join(self._buf))
+        self._buf = []
+
+    def _emit_pending(self) -> None:
+        if self._pending is None:
+            return
+        data = (self._pending + "\n").encode("utf-8", "surrogatepass")
+        self._pending = None
+        self.line_offsets.append(self.offset)
+        self.offset += len(data)
+        if self._f is None:
+            return
+        self._buf.append(data)
+        self._buf_bytes += len(data)
+        if self._buf_bytes >= self._FLUSH_BYTES:
+            self._f.write(b"".join(self._buf))
+            self._buf = []
+            self._buf_bytes = 0
+
+
+class _JsonScanner:
+    """Single pass over JSON text producing a sample and line-per-record output."""
+
+    def __init__(self, text: str, writer: _LineWriter):
+        self.text = text
+        self.out = writer
+        self.records: list[RecordRange] = []
+
+    def scan(self) -> Any:
+        sample, end = self._value(0, depth=0, indent="", prefix="", path="")
+        if _WS.match(self.text, end).end() != len(self.text):
+            raise ValueError("Extra data after JSON value")
+        return sample
+
+    def _skip(self, pos: int) -> int:
+        return _WS.match(self.text, pos).end()
+
+    def _value(
+        self, pos: int, *, depth: int, indent: str, prefix: str, path: str
+    ) -> tuple[Any, int]:
+        pos = self._skip(pos)
+        if pos >= len(self.text):
+            raise ValueError("Unexpected end of JSON")
+        ch = self.text[pos]
+        if depth < MAX_WALK_DEPTH:
+            if ch == "{":
+                return self._object(pos, depth=depth, indent=indent, prefix=prefix, path=path)
+            if ch == "[":
+                return self._array(pos, indent=indent, prefix=prefix, path=path)
+        value, end = _decoder.raw_decode(self.text, pos)
+        self.out.line(prefix + _compact(value))
+        return value, end
+
+    def _object(
+        self, pos: int, *, depth: int, indent: str, prefix: str, path: str
+    ) -> tuple[Any, int]:
+        text = self.text
+        pos = self._skip(pos + 1)
+        if text.startswith("}", pos):
+            self.out.line(prefix + "{}")
+            return {}, pos + 1
+        self.out.line(prefix + "{")
+        child_indent = indent + "  "
+        sample: dict[str, Any] = {}
+        total = 0
+        while True:
+            pos = self._skip(pos)
+            if not text.startswith('"', pos):
+                raise ValueError(f"Expected object key at {pos}")
+            key, pos = _decoder.raw_decode(text, pos)
+            pos = self._skip(pos)
+            if not text.startswith(":", pos):
+                raise ValueError(f"Expected ':' at {pos}")
+            value, pos = self._value(
+                pos + 1,
+                depth=depth + 1,
+                indent=child_indent,
+                prefix=f"{child_indent}{_compact(key)}: ",
+                path=f"{path}.{key}" if path else key,
+            )
+            total += 1
+            if total <= MAX_SAMPLED_KEYS:
+                sample[key] = value
+            pos = self._skip(pos)
+            if text.startswith(",", pos):
+                self.out.append(",")
+                pos += 1
+                continue
+            if text.startswith("}", pos):
+                break
+            raise ValueError(f"Expected ',' or '}}' at {pos}")
+        self.out.line(indent + "}")
+        if total > MAX_SAMPLED_KEYS:
+            return SampledDict(sample, total), pos + 1
+        return sample, pos + 1
+
+    def _array(self, pos: int, *, indent: str, prefix: str, path: str) -> tuple[Any, int]:
+        text = self.text
+        pos = self._skip(pos + 1)
+        if text.startswith("]", pos):
+            self.out.line(prefix + "[]")
+            return [], pos + 1
+        self.out.line(prefix + "[")
+        child_indent = indent + "  "
+        first_line = self.out.line_no
+        head: list[Any] = []
+        last: Any = None
+        total = 0
+        decode = _decoder.raw_decode
+        match_sep = _ARRAY_SEP.match
+        line = self.out.line
+        while True:
+            item, end = decode(text, pos)
+            # Reuse the source text unless it spans lines
+            raw = text[pos:end]
+            if "\n" in raw or "\r" in raw:
+                raw = _compact(item)
+            sep = match_sep(text, end)
+            if sep is None:
+                raise ValueError(f"Expected ',' or ']' at {end}")
+            total += 1
+            if total <= LARGE_ARRAY_THRESHOLD:
+                head.append(item)
+            last = item
+            pos = sep.end()
+            if sep.group(1) == ",":
+                line(f"{child_indent}{raw},")
+                continue
+            line(child_indent + raw)
+            break
+        self.out.line(indent + "]")
+        self.records.append(RecordRange(path=path, first_line=first_line, count=total))
+        if total > LARGE_ARRAY_THRESHOLD:
+            return SampledList(head[:3] + [last], total), pos
+        return head, pos
+
+
+def sample_json(text: str) -> Any:
+    """Sample JSON *text* without materialising large arrays.
+
+    Raises ``ValueError`` if *text* is not valid JSON.
+    """
+    return _JsonScanner(text, _LineWriter(None)).scan()
+
+
+def _write_index(path: Path, line_offsets: list[int], records: RecordRange | None) -> None:
+    stat = path.stat()
+    header = _INDEX_HEADER.pack(
+        INDEX_MAGIC,
+        stat.st_size,
+        stat.st_mtime_ns,
+        records.first_line if records else 0,
+        records.count if records else 0,
+    )
+    with open(index_path_for(path), "wb") as f:
+        f.write(header)
+        for start in range(0, len(line_offsets), 8192):
+            chunk = line_offsets[start : start + 8192]
+            f.write(struct.pack(f"<{len(chunk)}Q", *chunk))
+
+
+def _write_text(f: BinaryIO, text: str) -> tuple[int, list[int]]:
+    """Stream plain *text*; return (bytes written, line start offsets)."""
+    offsets = [0] if text else []
+    written = 0
+    step = 1 << 20
+    for start in range(0, len(text), step):
+        data = text[start : start + step].encode("utf-8", "surrogatepass")
+        pos = data.find(b"\n")
+        while pos != -1:
+            offsets.append(written + pos + 1)
+            pos = data.find(b"\n", pos + 1)
+        f.write(data)
+        written += len(data)
+    if offsets and offsets[-1] == written and len(offsets) > 1:
+        offsets.pop()  # trailing newline does not start another line
+    return written, offsets
+
+
+def write_spill(path: Path, content: str) -> SpillInfo:
+    """Write *content* to *path* with its line index.
+
+    JSON is re-laid out with one array element per line; anything else
+    is written as-is.
+    """
+    with open(path, "wb") as f:
+        writer = _LineWriter(f)
+        scanner = _JsonScanner(content, writer)
+        try:
+            sample = scanner.scan()
+        except (ValueError, RecursionError):
+            f.seek(0)
+            f.truncate()
+            size, offsets = _write_text(f, content)
+            info = SpillInfo(size_bytes=size, lines=len(offsets))
+        else:
+            writer.close()
+            offsets = writer.line_offsets
+            info = SpillInfo(
+                size_bytes=writer.offset,
+                lines=len(offsets),
+                sample=sample,
+                is_json=True,
+                records=scanner.records,
+            )
+    _write_index(path, offsets, info.principal_records)
+    return info
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import json
+from typing import Any
 
 
 def ngram_similarity(s1: str, s2: str, n: int = 2) -> float:
@@ -54,6 +55,15 @@ def is_stalled(
     return True
 
 
+def fingerprint_tool_call(tool_name: str, tool_input: Any) -> tuple[str, str]:
+    """Fingerprint one tool call as (tool_name, canonical_args_json)."""
+    try:
+        canonical = json.dumps(tool_input, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        canonical = str(tool_input)
+    return tool_name, canonical
+
+
 def fingerprint_tool_calls(
     tool_results: list[dict],
 ) -> list[tuple[str, str]]:
@@ -62,16 +72,10 @@ def fingerprint_tool_calls(
     Each fingerprint is (tool_name, canonical_args_json).  Order-sensitive
     so [search("a"), fetch("b")] != [fetch("b"), search("a")].
     """
-    fingerprints = []
-    for tr in tool_results:
-        name = tr.get("tool_name", "")
-        args = tr.get("tool_input", {})
-        try:
-            canonical = json.dumps(args, sort_keys=True, default=str)
-        except (TypeError, ValueError):
-            canonical = str(args)
-        fingerprints.append((name, canonical))
-    return fingerprints
+    return [
+        fingerprint_tool_call(tr.get("tool_name", ""), tr.get("tool_input", {}))
+        for tr in tool_results
+    ]
 
 
 def is_tool_doom_loop(
@@ -277,14 +277,16 @@ async def _report_callback(
     # 5. Create and execute subagent EventLoopNode
     subagent_conv_store = None
     if conversation_store is not None:
-        from framework.storage.conversation_store import FileConversationStore
+        from framework.storage.conversation_store import open_conversation_store
 
         parent_base = getattr(conversation_store, "_base", None)
         if parent_base is not None:
             conversations_dir = parent_base.parent
             subagent_dir_name = f"{agent_id}-{subagent_instance}"
             subagent_store_path = conversations_dir / subagent_dir_name
-            subagent_conv_store = FileConversationStore(base_path=subagent_store_path)
+            subagent_conv_store = open_conversation_store(
+                subagent_store_path, getattr(conversation_store, "backend", None)
+            )
 
     # Derive a subagent-scoped spillover dir
     subagent_spillover = None
@@ -14,6 +14,13 @@
 from pathlib import Path
 from typing import Any
 
+from framework.graph.event_loop.spillover import (
+    LARGE_ARRAY_THRESHOLD,
+    json_length,
+    sample_json,
+    write_spill,
+)
+from framework.graph.event_loop.tool_scheduler import ToolScheduler, ToolSlot
 from framework.llm.provider import ToolResult, ToolUse
 from framework.llm.stream_events import ToolCallEvent
 
@@ -96,13 +103,14 @@ def extract_json_metadata(parsed: Any, *, _depth: int = 0, _max_depth: int = 3)
     Reports key names, value types, and — crucially — array lengths so
     the LLM knows how much data exists beyond the preview.
 
+    Accepts the sample from :func:`sample_json` in place of parsed JSON.
     Returns an empty string for simple scalars.
     """
     if _depth >= _max_depth:
         if isinstance(parsed, dict):
-            return f"dict with {len(parsed)} keys"
+            return f"dict with {json_length(parsed)} keys"
         if isinstance(parsed, list):
-            return f"list of {len(parsed)} items"
+            return f"list of {json_length(parsed)} items"
         return type(parsed).__name__
 
     if isinstance(parsed, dict):
@@ -112,7 +120,7 @@ def extract_json_metadata(parsed: Any, *, _depth: int = 0, _max_depth: int = 3)
         indent = "  " * (_depth + 1)
         for key, value in list(parsed.items())[:20]:
             if isinstance(value, list):
-                line = f'{indent}"{key}": list of {len(value)} items'
+                line = f'{indent}"{key}": list of {json_length(value)} items'
                 if value:
                     first = value[0]
                     if isinstance(first, dict):
@@ -126,14 +134,14 @@ def extract_json_metadata(parsed: Any, *, _depth: int = 0, _max_depth: int = 3)
                 lines.append(f'{indent}"{key}": {child}')
             else:
                 lines.append(f'{indent}"{key}": {type(value).__name__}')
-        if len(parsed) > 20:
-            lines.append(f"{indent}... and {len(parsed) - 20} more keys")
+        if json_length(parsed) > 20:
+            lines.append(f"{indent}... and {json_length(parsed) - 20} more keys")
         return "\n".join(lines)
 
     if isinstance(parsed, list):
         if not parsed:
             return "empty list"
-        desc = f"list of {len(parsed)} items"
+        desc = f"list of {json_length(parsed)} items"
         first = parsed[0]
         if isinstance(first, dict):
             sample_keys = list(first.keys())[:10]
@@ -151,14 +159,15 @@ def build_json_preview(parsed: Any, *, max_chars: int = 5000) -> str | None:
     Shows first 3 + last 1 items of large arrays with explicit count
     markers so the LLM cannot mistake the preview for the full dataset.
 
+    Accepts the sample from :func:`sample_json` in place of parsed JSON.
     Returns ``None`` if no truncation was needed (no large arrays).
     """
-    _LARGE_ARRAY_THRESHOLD = 10
+    _LARGE_ARRAY_THRESHOLD = LARGE_ARRAY_THRESHOLD
 
     def _truncate_arrays(obj: Any) -> tuple[Any, bool]:
         """Return (truncated_copy, was_truncated)."""
-        if isinstance(obj, list) and len(obj) > _LARGE_ARRAY_THRESHOLD:
-            n = len(obj)
+        if isinstance(obj, list) and json_length(obj) > _LARGE_ARRAY_THRESHOLD:
+            n = json_length(obj)
             head = obj[:3]
             tail = obj[-1:]
             marker = f"... ({n - 4} more items omitted, {n} total) ..."
@@ -185,8 +194,8 @@ def _truncate_arrays(obj: Any) -> tuple[Any, bool]:
     if len(result) > max_chars:
         # Even 3+1 items too big — try just 1 item
         def _minimal_arrays(obj: Any) -> Any:
-            if isinstance(obj, list) and len(obj) > _LARGE_ARRAY_THRESHOLD:
-                n = len(obj)
+            if isinstance(obj, list) and json_length(obj) > _LARGE_ARRAY_THRESHOLD:
+                n = json_length(obj)
                 return obj[:1] + [f"... ({n - 1} more items omitted, {n} total) ..."]
             if isinstance(obj, dict):
                 return {k: _minimal_arrays(v) for k, v in obj.items()}
@@ -240,10 +249,10 @@ def truncate_tool_result(
         metadata_str = ""
         smart_preview: str | None = None
         try:
-            parsed_ld = json.loads(result.content)
-            metadata_str = extract_json_metadata(parsed_ld)
-            smart_preview = build_json_preview(parsed_ld, max_chars=PREVIEW_CAP)
-        except (json.JSONDecodeError, TypeError, ValueError):
+            sampled_ld = sample_json(result.content)
+            metadata_str = extract_json_metadata(sampled_ld)
+            smart_preview = build_json_preview(sampled_ld, max_chars=PREVIEW_CAP)
+        except (ValueError, RecursionError):
             pass
 
         if smart_preview is not None:
@@ -275,6 +284,7 @@ def truncate_tool_result(
             is_error=False,
             image_content=result.image_content,
             is_skill_content=result.is_skill_content,
+            cached=result.cached,
         )
 
     spill_dir = spillover_dir
@@ -283,17 +293,9 @@ def truncate_tool_result(
         spill_path.mkdir(parents=True, exist_ok=True)
         filename = next_spill_filename_fn(tool_name)
 
-        # Pretty-print JSON content so load_data's line-based
-        # pagination works correctly.
-        write_content = result.content
-        parsed_json: Any = None  # track for metadata extraction
-        try:
-            parsed_json = json.loads(result.content)
-            write_content = json.dumps(parsed_json, indent=2, ensure_ascii=False)
-        except (json.JSONDecodeError, TypeError, ValueError):
-            pass  # Not JSON — write as-is
-
-        (spill_path / filename).write_text(write_content, encoding="utf-8")
+        # One pass: JSON is laid out one record per line (so load_data
+        # can page by line), sampled for the preview, and indexed.
+        spill = write_spill(spill_path / filename, result.content)
 
         if limit > 0 and len(result.content) > limit:
             # Large result: build a small, metadata-rich preview so the
@@ -303,9 +305,9 @@ def truncate_tool_result(
             # Extract structural metadata (array lengths, key names)
             metadata_str = ""
             smart_preview: str | None = None
-            if parsed_json is not None:
-                metadata_str = extract_json_metadata(parsed_json)
-                smart_preview = build_json_preview(parsed_json, max_chars=PREVIEW_CAP)
+            if spill.is_json:
+                metadata_str = extract_json_metadata(spill.sample)
+                smart_preview = build_json_preview(spill.sample, max_chars=PREVIEW_CAP)
 
             if smart_preview is not None:
                 preview_block = smart_preview
@@ -319,6 +321,15 @@ def truncate_tool_result(
             )
             if metadata_str:
                 header += f"\nData structure:\n{metadata_str}"
+            records = spill.principal_records
+            if records and records.count > LARGE_ARRAY_THRESHOLD:
+                first = records.first_line + 1
+                label = f'"{records.path}"' if records.path else "the array"
+                header += (
+                    f"\n\nItems of {label} are one per line, lines {first:,}-"
+                    f"{first + records.count - 1:,} of the file. Page through them with "
+                    f"load_data(filename='{filename}', start_line={first}, max_lines=50)."
+                )
             header += (
                 f"\n\nWARNING: The preview below is INCOMPLETE. "
                 f"Do NOT draw conclusions or counts from it. "
@@ -349,6 +360,7 @@ def truncate_tool_result(
             is_error=False,
             image_content=result.image_content,
             is_skill_content=result.is_skill_content,
+            cached=result.cached,
         )
 
     # No spillover_dir — truncate in-place if needed
@@ -358,10 +370,10 @@ def truncate_tool_result(
         metadata_str = ""
         smart_preview: str | None = None
         try:
-            parsed_inline = json.loads(result.content)
-            metadata_str = extract_json_metadata(parsed_inline)
-            smart_preview = build_json_preview(parsed_inline, max_chars=PREVIEW_CAP)
-        except (json.JSONDecodeError, TypeError, ValueError):
+            sampled_inline = sample_json(result.content)
+            metadata_str = extract_json_metadata(sampled_inline)
+            smart_preview = build_json_preview(sampled_inline, max_chars=PREVIEW_CAP)
+        except (ValueError, RecursionError):
             pass
 
         if smart_preview is not None:
@@ -393,6 +405,7 @@ def truncate_tool_result(
             is_error=False,
             image_content=result.image_content,
             is_skill_content=result.is_skill_content,
+            cached=result.cached,
         )
 
     return result
@@ -403,6 +416,8 @@ async def execute_tool(
     tc: ToolCallEvent,
     timeout: float,
     skill_dirs: list[str] | None = None,
+    scheduler: ToolScheduler | None = None,
+    slots: list[ToolSlot] | None = None,
 ) -> ToolResult:
     """Execute a tool call, handling both sync and async executors.
 
@@ -410,6 +425,11 @@ async def execute_tool(
     from blocking the event loop indefinitely.  The initial executor
     call is offloaded to a thread pool so that sync executors don't
     freeze the event loop.
+
+    With a *scheduler*, the call first waits for a slot (per-tool,
+    per-MCP-server and global limits) and runs on the scheduler's own
+    pool; the timeout only covers execution, not the wait.  The granted
+    slot is appended to *slots* for queue metrics.
     """
     if tool_executor is None:
         return ToolResult(
@@ -443,21 +463,35 @@ async def execute_tool(
     tool_use = ToolUse(id=tc.tool_use_id, name=tc.tool_name, input=tc.tool_input)
 
     async def _run() -> ToolResult:
-        # Offload the executor call to a thread.  Sync MCP executors
-        # block on future.result() — running in a thread keeps the
-        # event loop free so asyncio.wait_for can fire the timeout.
+        if scheduler is not None:
+            return await scheduler.invoke(tool_executor, tool_use)
+        # Offload the executor call to a thread.  Sync executors may
+        # block — running in a thread keeps the event loop free so
+        # asyncio.wait_for can fire the timeout.
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(None, tool_executor, tool_use)
-        # Async executors return a coroutine — await it on the loop
+        # Async executors (including MCP tools, which multiplex calls over
+        # one session) return a coroutine — await it on the loop so
+        # parallel tool calls overlap.
         if asyncio.iscoroutine(result) or asyncio.isfuture(result):
             result = await result
         return result
 
-    try:
+    async def _run_with_timeout() -> ToolResult:
         if timeout > 0:
-            result = await asyncio.wait_for(_run(), timeout=timeout)
+            return await asyncio.wait_for(_run(), timeout=timeout)
+        return await _run()
+
+    try:
+        if scheduler is None:
+            result = await _run_with_timeout()
         else:
-            result = await _run()
+            tool_server = getattr(tool_executor, "tool_server", None)
+            group = tool_server(tc.tool_name) if callable(tool_server) else None
+            async with scheduler.reserve(tc.tool_name, group) as slot:
+                if slots is not None:
+                    slots.append(slot)
+                result = await _run_with_timeout()
     except TimeoutError:
         logger.warning("Tool '%s' timed out after %.0fs", tc.tool_name, timeout)
         return ToolResult(
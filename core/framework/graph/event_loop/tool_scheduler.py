@@ -0,0 +1,265 @@
+"""Bounded-parallel scheduling of tool calls.
+
+Tool calls used to go through ``loop.run_in_executor(None, ...)``, sharing
+the default thread pool with everything else in the process, and a node
+fanned out every tool call of a turn at once.  :class:`ToolScheduler`
+bounds that fan-out:
+
+- a global concurrency limit, plus per-tool and per-group (MCP server)
+  limits, so one slow server cannot take every slot;
+- when calls have to wait, the one with the shortest expected duration
+  (moving average of past runs of that tool) goes first;
+- sync executors run on a dedicated thread pool; executors that return a
+  coroutine (async tools, MCP tools) are learned per tool and invoked
+  directly on the event loop afterwards, skipping the thread hop;
+- each reservation reports how long it waited and how deep the queue was,
+  which the event loop publishes as ``TOOL_QUEUE_METRICS``.
+
+The waiting primitives are built on plain futures rather than
+``asyncio.Semaphore`` so that the process-wide scheduler is not bound to
+the first event loop that used it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import time
+import weakref
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from framework.llm.provider import ToolUse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ToolSlot:
+    """A granted execution slot and what it cost to get it."""
+
+    tool_name: str
+    group: str | None
+    wait_s: float
+    queue_depth: int
+
+
+class _PriorityGate:
+    """Counting gate that admits waiters lowest-priority-value first.
+
+    ``limit <= 0`` means unlimited.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    async def acquire(self, priority: float) -> None:
+        if self.limit <= 0:
+            self.active += 1
+            return
+        if self.active < self.limit and not self.waiting:
+            self.active += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                # Hand the slot straight to the next waiter
+                fut.set_result(None)
+                return
+        self.active -= 1
+
+
+class ToolScheduler:
+    """Admission control and execution for tool calls.
+
+    Args:
+        max_concurrency: Tool calls running at once across the process.
+            Also the size of the dedicated thread pool.
+        default_tool_limit: Concurrent calls per tool name (0 = unlimited).
+        default_group_limit: Concurrent calls per group, i.e. per MCP
+            server (0 = unlimited).
+        tool_limits: Per-tool overrides of ``default_tool_limit``.
+        group_limits: Per-group overrides of ``default_group_limit``.
+        default_estimate_s: Expected duration of a tool never run before.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        default_tool_limit: int = 0,
+        default_group_limit: int = 8,
+        tool_limits: dict[str, int] | None = None,
+        group_limits: dict[str, int] | None = None,
+        default_estimate_s: float = 1.0,
+    ):
+        self.max_concurrency = max_concurrency
+        self.default_tool_limit = default_tool_limit
+        self.default_group_limit = default_group_limit
+        self.tool_limits = dict(tool_limits or {})
+        self.group_limits = dict(group_limits or {})
+        self.default_estimate_s = default_estimate_s
+        self._global = _PriorityGate(max_concurrency)
+        self._tool_gates: dict[str, _PriorityGate] = {}
+        self._group_gates: dict[str, _PriorityGate] = {}
+        self._durations: dict[str, float] = {}
+        self._async_tools: weakref.WeakKeyDictionary[Any, set[str]] = weakref.WeakKeyDictionary()
+        self._pool: ThreadPoolExecutor | None = None
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.total_wait_s = 0.0
+        self.max_queue_depth = 0
+
+    # === ADMISSION ===
+
+    def estimate(self, tool_name: str) -> float:
+        """Expected duration of *tool_name* in seconds."""
+        return self._durations.get(tool_name, self.default_estimate_s)
+
+    def _record_duration(self, tool_name: str, duration: float) -> None:
+        previous = self._durations.get(tool_name)
+        self._durations[tool_name] = (
+            duration if previous is None else 0.7 * previous + 0.3 * duration
+        )
+
+    def _gate(
+        self, gates: dict[str, _PriorityGate], key: str, limits: dict[str, int], default: int
+    ) -> _PriorityGate:
+        gate = gates.get(key)
+        if gate is None:
+            gate = _PriorityGate(limits.get(key, default))
+            gates[key] = gate
+        return gate
+
+    @asynccontextmanager
+    async def reserve(self, tool_name: str, group: str | None = None) -> AsyncIterator[ToolSlot]:
+        """Wait for a slot to run *tool_name*; hold it for the ``async with`` body."""
+        priority = self.estimate(tool_name)
+        gates = [self._gate(self._tool_gates, tool_name, self.tool_limits, self.default_tool_limit)]
+        if group:
+            gates.append(
+                self._gate(self._group_gates, group, self.group_limits, self.default_group_limit)
+            )
+        gates.append(self._global)
+
+        # Calls already waiting ahead of this one
+        depth = self.queued
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self.queued += 1
+        start = time.monotonic()
+        acquired: list[_PriorityGate] = []
+        try:
+            for gate in gates:
+                await gate.acquire(priority)
+                acquired.append(gate)
+        except BaseException:
+            for gate in reversed(acquired):
+                gate.release()
+            raise
+        finally:
+            self.queued -= 1
+
+        wait_s = time.monotonic() - start
+        self.total_wait_s += wait_s
+        self.running += 1
+        started = time.monotonic()
+        try:
+            yield ToolSlot(tool_name=tool_name, group=group, wait_s=wait_s, queue_depth=depth)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self._record_duration(tool_name, time.monotonic() - started)
+            for gate in reversed(acquired):
+                gate.release()
+
+    # === EXECUTION ===
+
+    def _executor_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_concurrency if self.max_concurrency > 0 else None,
+                thread_name_prefix="tool",
+            )
+        return self._pool
+
+    def _is_async_tool(self, tool_executor: Any, tool_name: str) -> bool:
+        if inspect.iscoroutinefunction(tool_executor):
+            return True
+        try:
+            return tool_name in self._async_tools.get(tool_executor, ())
+        except TypeError:
+            return False
+
+    def _mark_async_tool(self, tool_executor: Any, tool_name: str) -> None:
+        try:
+            self._async_tools.setdefault(tool_executor, set()).add(tool_name)
+        except TypeError:
+            pass  # not weak-referenceable; keep using the thread hop
+
+    async def invoke(self, tool_executor: Any, tool_use: ToolUse) -> Any:
+        """Run *tool_executor* on *tool_use* and return its (awaited) result.
+
+        Sync executors run on the scheduler's thread pool.  Once a tool's
+        executor has returned a coroutine, later calls of that tool invoke
+        it on the event loop directly, since the blocking part is the
+        awaited I/O, not the call itself.
+        """
+        if self._is_async_tool(tool_executor, tool_use.name):
+            result = tool_executor(tool_use)
+        else:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor_pool(), tool_executor, tool_use)
+        if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+            self._mark_async_tool(tool_executor, tool_use.name)
+            result = await result
+        return result
+
+    def metrics(self) -> dict[str, Any]:
+        """Cumulative scheduler counters."""
+        return {
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "total_wait_s": round(self.total_wait_s, 3),
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+_default_scheduler: ToolScheduler | None = None
+
+
+def get_tool_scheduler() -> ToolScheduler:
+    """Return the process-wide tool scheduler."""
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = ToolScheduler()
+    return _default_scheduler
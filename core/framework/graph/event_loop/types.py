@@ -54,6 +54,16 @@ class LoopConfig:
     max_context_tokens: int = 32_000
     store_prefix: str = ""
 
+    # Count conversation tokens with the model's tokenizer (memoized per
+    # message) instead of the chars/4 heuristic.
+    tokenizer_token_counts: bool = False
+
+    # Speculative compaction: once context usage reaches this fraction of
+    # max_context_tokens, summarise the older history in the background so
+    # the hard compaction threshold swaps it in without an LLM round-trip.
+    # 0 disables.  Should sit below the conversation's compaction threshold.
+    speculative_compaction_watermark: float = 0.0
+
     # Overflow margin for max_tool_calls_per_turn. Tool calls are only
     # discarded when the count exceeds max_tool_calls_per_turn * (1 + margin).
     tool_call_overflow_margin: float = 0.5
@@ -80,6 +90,11 @@ class LoopConfig:
     # Per-tool-call timeout.
     tool_call_timeout_seconds: float = 60.0
 
+    # Run tool calls through the process-wide ToolScheduler (per-tool and
+    # per-MCP-server concurrency limits, short tools first, queue metrics).
+    # False falls back to unbounded fan-out on the default thread pool.
+    tool_scheduling: bool = True
+
     # Subagent delegation timeout.
     subagent_timeout_seconds: float = 600.0
 
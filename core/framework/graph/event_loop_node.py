@@ -25,6 +25,7 @@
 from framework.graph.conversation import ConversationStore, NodeConversation
 from framework.graph.event_loop import types as event_loop_types
 from framework.graph.event_loop.compaction import (
+    SpeculativeCompactor,
     build_emergency_summary,
     build_llm_compaction_prompt,
     compact,
@@ -52,6 +53,7 @@
     publish_stalled,
     publish_text_delta,
     publish_tool_completed,
+    publish_tool_queue_metrics,
     publish_tool_started,
     run_hooks,
 )
@@ -84,6 +86,7 @@
     restore_spill_counter,
     truncate_tool_result,
 )
+from framework.graph.event_loop.tool_scheduler import ToolScheduler, ToolSlot, get_tool_scheduler
 from framework.graph.event_loop.types import (
     JudgeProtocol,
     JudgeVerdict,
@@ -146,6 +149,10 @@ async def _describe_images_as_text(image_content: list[dict[str, Any]]) -> str |
     return None
 
 
+# Tool results larger than this are spilled to disk on a worker thread
+_SPILL_OFFLOAD_CHARS = 64 * 1024
+
+
 # Pattern for detecting context-window-exceeded errors across LLM providers.
 _CONTEXT_TOO_LARGE_RE = re.compile(
     r"context.{0,20}(length|window|limit|size)|"
@@ -289,6 +296,14 @@ def __init__(
         self._mark_complete_flag = False
         # Counter for subagent instances (1, 2, 3, ...)
         self._subagent_instance_counter: dict[str, int] = {}
+        # Background LLM summary of older history (speculative compaction)
+        self._speculative_compactor: SpeculativeCompactor | None = (
+            SpeculativeCompactor() if self._config.speculative_compaction_watermark else None
+        )
+        # Bounded-parallel tool execution shared by every node in the process
+        self._tool_scheduler: ToolScheduler | None = (
+            get_tool_scheduler() if self._config.tool_scheduling else None
+        )
 
     def validate_input(self, ctx: NodeContext) -> list[str]:
         """Validate hard requirements only.
@@ -308,6 +323,13 @@ def validate_input(self, ctx: NodeContext) -> list[str]:
 
     async def execute(self, ctx: NodeContext) -> NodeResult:
         """Run the event loop."""
+        try:
+            return await self._execute(ctx)
+        finally:
+            if self._speculative_compactor is not None:
+                self._speculative_compactor.discard("node finished")
+
+    async def _execute(self, ctx: NodeContext) -> NodeResult:
         start_time = time.time()
         total_input_tokens = 0
         total_output_tokens = 0
@@ -526,6 +548,11 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
             if initial_message:
                 await conversation.add_user_message(initial_message)
 
+        if self._config.tokenizer_token_counts:
+            from framework.llm.token_counting import get_token_counter
+
+            conversation.set_token_counter(get_token_counter(getattr(ctx.llm, "model", "")))
+
         # 2b. Restore spill counter from existing files (resume safety)
         self._restore_spill_counter()
 
@@ -739,6 +766,7 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
                         input_tokens=turn_tokens.get("input", 0),
                         output_tokens=turn_tokens.get("output", 0),
                         cached_tokens=turn_tokens.get("cached", 0),
+                        cache_write_tokens=turn_tokens.get("cache_write", 0),
                         execution_id=execution_id,
                         iteration=iteration,
                     )
@@ -903,23 +931,20 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
             if _llm_turn_failed_waiting_input:
                 continue
 
-            # 6e'. Feed actual API token count back for accurate estimation
-            turn_input = turn_tokens.get("input", 0)
-            if turn_input > 0:
-                conversation.update_token_count(turn_input)
-
-            # 6e''. Post-turn compaction check (catches tool-result bloat).
+            # 6e'. Post-turn compaction check (catches tool-result bloat).
             # Skip if pre-turn already compacted this iteration — two compactions
             # in one iteration produce back-to-back spillover files and leave the
             # agent disoriented on the very next turn.
             if not _compacted_this_iter and conversation.needs_compaction():
                 await self._compact(ctx, conversation, accumulator)
+            else:
+                self._maybe_start_speculative_compaction(ctx, conversation, accumulator)
 
             # Reset auto-block grace streak when real work happens
             if real_tool_results or outputs_set:
                 _cf_text_only_streak = 0
 
-            # 6e'''. Empty response guard — if the LLM returned nothing
+            # 6e''. Empty response guard — if the LLM returned nothing
             # (no text, no real tools, no set_output) and all required
             # outputs are already set, accept immediately.  This prevents
             # wasted iterations when the LLM has genuinely finished its
@@ -1921,7 +1946,7 @@ async def _run_single_turn(
         stream_id = ctx.stream_id or ctx.node_id
         node_id = ctx.node_id
         execution_id = ctx.execution_id or ""
-        token_counts: dict[str, int] = {"input": 0, "output": 0, "cached": 0}
+        token_counts: dict[str, int] = {"input": 0, "output": 0, "cached": 0, "cache_write": 0}
         tool_call_count = 0
         final_text = ""
         final_system_prompt = conversation.system_prompt
@@ -1952,6 +1977,8 @@ async def _run_single_turn(
                     conversation.usage_ratio() * 100,
                 )
                 await self._compact(ctx, conversation, accumulator)
+            else:
+                self._maybe_start_speculative_compaction(ctx, conversation, accumulator)
 
             messages = conversation.to_llm_messages()
 
@@ -2010,6 +2037,12 @@ async def _do_stream(
                         token_counts["input"] += event.input_tokens
                         token_counts["output"] += event.output_tokens
                         token_counts["cached"] += event.cached_tokens
+                        token_counts["cache_write"] += event.cache_write_tokens
+                        # Calibrate the conversation's estimate against this
+                        # request (not the turn total, which sums every
+                        # inner-loop call) before its response is appended.
+                        if event.input_tokens > 0:
+                            conversation.update_token_count(event.input_tokens)
                         token_counts["stop_reason"] = event.stop_reason
                         token_counts["model"] = event.model
 
@@ -2450,15 +2483,17 @@ async def _do_stream(
 
             # Phase 2a: execute real tools in parallel.
             if pending_real:
+                _slots: list[ToolSlot] = []
 
                 async def _timed_execute(
                     _tc: ToolCallEvent,
+                    _slots: list[ToolSlot],
                 ) -> tuple[ToolResult | BaseException, str, float]:
                     """Execute a tool and return (result, start_iso, duration_s)."""
                     _s = time.time()
                     _iso = datetime.now(UTC).isoformat()
                     try:
-                        _r = await self._execute_tool(_tc)
+                        _r = await self._execute_tool(_tc, _slots)
                     except BaseException as _exc:
                         _r = _exc
                     _dur = round(time.time() - _s, 3)
@@ -2466,7 +2501,7 @@ async def _timed_execute(
 
                 self._tool_task = asyncio.ensure_future(
                     asyncio.gather(
-                        *(_timed_execute(tc) for tc in pending_real),
+                        *(_timed_execute(tc, _slots) for tc in pending_real),
                         return_exceptions=True,
                     )
                 )
@@ -2480,6 +2515,15 @@ async def _timed_execute(
                 for entry in timed_results:
                     if isinstance(entry, asyncio.CancelledError):
                         raise entry
+                if self._tool_scheduler is not None:
+                    await publish_tool_queue_metrics(
+                        event_bus=self._event_bus,
+                        stream_id=stream_id,
+                        node_id=node_id,
+                        slots=_slots,
+                        scheduler=self._tool_scheduler,
+                        execution_id=execution_id,
+                    )
                 for tc, entry in zip(pending_real, timed_results, strict=True):
                     if isinstance(entry, BaseException):
                         raw = entry
@@ -2499,7 +2543,9 @@ async def _timed_execute(
                         )
                     else:
                         result = raw
-                    results_by_id[tc.tool_use_id] = self._truncate_tool_result(result, tc.tool_name)
+                    results_by_id[tc.tool_use_id] = await self._truncate_tool_result_async(
+                        result, tc.tool_name
+                    )
 
             # Phase 2b: execute subagent delegations in parallel.
             if pending_subagent:
@@ -2584,7 +2630,7 @@ async def _timed_subagent(
                     # subagent results are saved to spillover files
                     # and survive pruning (instead of being "cleared
                     # from context" with no recovery path).
-                    result = self._truncate_tool_result(result, "delegate_to_sub_agent")
+                    result = await self._truncate_tool_result_async(result, "delegate_to_sub_agent")
                     results_by_id[tc.tool_use_id] = result
                     logged_tool_calls.append(
                         {
@@ -2664,6 +2710,7 @@ async def _timed_subagent(
                         result.content,
                         result.is_error,
                         execution_id,
+                        cached=result.cached,
                     )
 
             # If the limit was hit, add error results for every remaining
@@ -2926,20 +2973,24 @@ def _is_tool_doom_loop(
             enabled=self._config.tool_doom_loop_enabled,
         )
 
-    async def _execute_tool(self, tc: ToolCallEvent) -> ToolResult:
+    async def _execute_tool(
+        self, tc: ToolCallEvent, slots: list[ToolSlot] | None = None
+    ) -> ToolResult:
         """Execute a tool call, handling both sync and async executors.
 
         Applies ``tool_call_timeout_seconds`` from LoopConfig to prevent
         hung MCP servers from blocking the event loop indefinitely.
-        The initial executor call is offloaded to a thread pool so that
-        sync executors (MCP STDIO tools that block on ``future.result()``)
-        don't freeze the event loop.
+        Calls go through the tool scheduler (concurrency limits, dedicated
+        thread pool for sync executors such as MCP STDIO tools that block
+        on ``future.result()``) so they don't freeze the event loop.
         """
         return await execute_tool(
             tool_executor=self._tool_executor,
             tc=tc,
             timeout=self._config.tool_call_timeout_seconds,
             skill_dirs=getattr(self, "_skill_dirs", []),
+            scheduler=getattr(self, "_tool_scheduler", None),
+            slots=slots,
         )
 
     def _record_learning(self, key: str, value: Any) -> None:
@@ -3025,6 +3076,16 @@ def _truncate_tool_result(
             next_spill_filename_fn=self._next_spill_filename,
         )
 
+    async def _truncate_tool_result_async(
+        self,
+        result: ToolResult,
+        tool_name: str,
+    ) -> ToolResult:
+        """``_truncate_tool_result`` that spills large results off the event loop."""
+        if self._config.spillover_dir and len(result.content) > _SPILL_OFFLOAD_CHARS:
+            return await asyncio.to_thread(self._truncate_tool_result, result, tool_name)
+        return self._truncate_tool_result(result, tool_name)
+
     # --- Compaction -----------------------------------------------------------
 
     # Max chars of formatted messages before proactively splitting for LLM.
@@ -3056,6 +3117,25 @@ async def _compact(
             event_bus=self._event_bus,
             char_limit=self._LLM_COMPACT_CHAR_LIMIT,
             max_depth=self._LLM_COMPACT_MAX_DEPTH,
+            speculative=self._speculative_compactor,
+        )
+
+    def _maybe_start_speculative_compaction(
+        self,
+        ctx: NodeContext,
+        conversation: NodeConversation,
+        accumulator: OutputAccumulator | None = None,
+    ) -> None:
+        """Start summarising older history in the background past the watermark."""
+        if self._speculative_compactor is None:
+            return
+        self._speculative_compactor.maybe_start(
+            ctx,
+            conversation,
+            accumulator,
+            config=self._config,
+            char_limit=self._LLM_COMPACT_CHAR_LIMIT,
+            max_depth=self._LLM_COMPACT_MAX_DEPTH,
         )
 
     # --- LLM compaction with binary-search splitting ----------------------
@@ -3299,6 +3379,7 @@ async def _publish_llm_turn_complete(
         input_tokens: int,
         output_tokens: int,
         cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
         execution_id: str = "",
         iteration: int | None = None,
     ) -> None:
@@ -3311,6 +3392,7 @@ async def _publish_llm_turn_complete(
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             cached_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens,
             execution_id=execution_id,
             iteration=iteration,
         )
@@ -3408,6 +3490,7 @@ async def _publish_tool_completed(
         result: str,
         is_error: bool,
         execution_id: str = "",
+        cached: bool = False,
     ) -> None:
         return await publish_tool_completed(
             event_bus=self._event_bus,
@@ -3418,6 +3501,7 @@ async def _publish_tool_completed(
             result=result,
             is_error=is_error,
             execution_id=execution_id,
+            cached=cached,
         )
 
     async def _publish_judge_verdict(
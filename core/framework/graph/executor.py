@@ -18,6 +18,7 @@
 
 from framework.graph.checkpoint_config import CheckpointConfig
 from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
+from framework.graph.edge_router import LLMEdgeRouter
 from framework.graph.goal import Goal
 from framework.graph.node import (
     NodeContext,
@@ -153,6 +154,7 @@ def __init__(
         dynamic_prompt_provider: Callable | None = None,
         iteration_metadata_provider: Callable | None = None,
         skills_catalog_prompt: str = "",
+        skills_catalog_provider: Callable[[str], str] | None = None,
         protocols_prompt: str = "",
         skill_dirs: list[str] | None = None,
     ):
@@ -181,6 +183,8 @@ def __init__(
             dynamic_prompt_provider: Optional callback returning current
                 system prompt (for phase switching)
             skills_catalog_prompt: Available skills catalog for system prompt
+            skills_catalog_provider: Optional callback returning the skills
+                catalog for a node's task (replaces skills_catalog_prompt)
             protocols_prompt: Default skill operational protocols for system prompt
             skill_dirs: Skill base directories for Tier 3 resource access
         """
@@ -191,6 +195,7 @@ def __init__(
         self.node_registry = node_registry or {}
         self.approval_callback = approval_callback
         self.validator = OutputValidator()
+        self.edge_router = LLMEdgeRouter()
         self.logger = logging.getLogger(__name__)
         self._event_bus = event_bus
         self._stream_id = stream_id
@@ -205,6 +210,7 @@ def __init__(
         self.dynamic_prompt_provider = dynamic_prompt_provider
         self.iteration_metadata_provider = iteration_metadata_provider
         self.skills_catalog_prompt = skills_catalog_prompt
+        self.skills_catalog_provider = skills_catalog_provider
         self.protocols_prompt = protocols_prompt
         self.skill_dirs: list[str] = skill_dirs or []
 
@@ -517,7 +523,11 @@ async def execute(
         # Initialize checkpoint store if checkpointing is enabled
         checkpoint_store: CheckpointStore | None = None
         if checkpoint_config and checkpoint_config.enabled and self._storage_path:
-            checkpoint_store = CheckpointStore(self._storage_path)
+            checkpoint_store = CheckpointStore(
+                self._storage_path,
+                delta_checkpoints=checkpoint_config.delta_checkpoints,
+                full_snapshot_interval=checkpoint_config.full_snapshot_interval,
+            )
             self.logger.info("✓ Checkpointing enabled")
 
         # Restore session state if provided
@@ -678,11 +688,13 @@ async def execute(
         )
         if _is_fresh_shared and is_continuous and self._storage_path:
             try:
-                from framework.storage.conversation_store import FileConversationStore
+                from framework.storage.conversation_store import open_conversation_store
 
                 entry_conv_path = self._storage_path / "conversations"
                 if entry_conv_path.exists():
-                    _store = FileConversationStore(base_path=entry_conv_path)
+                    _store = open_conversation_store(
+                        entry_conv_path, self._loop_config.get("conversation_store")
+                    )
 
                     # Read cursor to find next seq for the transition marker.
                     _cursor = await _store.read_cursor() or {}
@@ -1873,6 +1885,16 @@ def _build_context(
                 node_tool_names=node_spec.tools,
             )
 
+        # Build per-node skills catalog (ranked against this node's task)
+        node_skills_prompt = self.skills_catalog_prompt
+        if self.skills_catalog_provider is not None:
+            node_task = "\n".join(
+                part
+                for part in (node_spec.name, node_spec.description, node_spec.system_prompt)
+                if part
+            )
+            node_skills_prompt = self.skills_catalog_provider(node_task)
+
         goal_context = goal.to_prompt_context()
 
         return NodeContext(
@@ -1903,7 +1925,7 @@ def _build_context(
             dynamic_tools_provider=self.dynamic_tools_provider,
             dynamic_prompt_provider=self.dynamic_prompt_provider,
             iteration_metadata_provider=self.iteration_metadata_provider,
-            skills_catalog_prompt=self.skills_catalog_prompt,
+            skills_catalog_prompt=node_skills_prompt,
             protocols_prompt=self.protocols_prompt,
             skill_dirs=self.skill_dirs,
         )
@@ -1951,13 +1973,17 @@ def _get_node_implementation(
             # Custom configs can still be pre-registered via node_registry.
             from framework.graph.event_loop_node import EventLoopNode, LoopConfig
 
-            # Create a FileConversationStore if a storage path is available
+            # Create a conversation store if a storage path is available.
+            # loop_config["conversation_store"] selects the backend for new
+            # sessions ("file" or "segmented"); existing layouts are kept.
             conv_store = None
             if self._storage_path:
-                from framework.storage.conversation_store import FileConversationStore
+                from framework.storage.conversation_store import open_conversation_store
 
                 store_path = self._storage_path / "conversations"
-                conv_store = FileConversationStore(base_path=store_path)
+                conv_store = open_conversation_store(
+                    store_path, self._loop_config.get("conversation_store")
+                )
 
             # Auto-configure spillover directory for large tool results.
             # When a tool result exceeds max_tool_result_chars, the full
@@ -2005,18 +2031,25 @@ async def _follow_edges(
     ) -> str | None:
         """Determine the next node by following edges."""
         edges = graph.get_outgoing_edges(current_node_id)
+        memory_snapshot = memory.read_all()
+        llm_decisions: dict[str, bool] | None = None
 
         for edge in edges:
-            target_node_spec = graph.get_node(edge.target)
-
-            if await edge.should_traverse(
-                source_success=result.success,
-                source_output=result.output,
-                memory=memory.read_all(),
-                llm=self.llm,
-                goal=goal,
-                source_node_name=current_node_spec.name if current_node_spec else current_node_id,
-                target_node_name=target_node_spec.name if target_node_spec else edge.target,
+            # Batch the LLM_DECIDE edges only once the first of them is reached;
+            # an earlier edge that matches returns without any LLM call.
+            if llm_decisions is None and edge.condition == EdgeCondition.LLM_DECIDE:
+                llm_decisions = await self._route_llm_edges(
+                    graph, goal, current_node_id, current_node_spec, result, memory_snapshot, edges
+                )
+            if await self._edge_matches(
+                graph,
+                goal,
+                current_node_id,
+                current_node_spec,
+                result,
+                memory_snapshot,
+                edge,
+                llm_decisions or {},
             ):
                 # Map inputs (skip validation for processed LLM output)
                 mapped = edge.map_inputs(result.output, memory.read_all())
@@ -2044,17 +2077,21 @@ async def _get_all_traversable_edges(
         """
         edges = graph.get_outgoing_edges(current_node_id)
         traversable = []
+        memory_snapshot = memory.read_all()
+        llm_decisions = await self._route_llm_edges(
+            graph, goal, current_node_id, current_node_spec, result, memory_snapshot, edges
+        )
 
         for edge in edges:
-            target_node_spec = graph.get_node(edge.target)
-            if await edge.should_traverse(
-                source_success=result.success,
-                source_output=result.output,
-                memory=memory.read_all(),
-                llm=self.llm,
-                goal=goal,
-                source_node_name=current_node_spec.name if current_node_spec else current_node_id,
-                target_node_name=target_node_spec.name if target_node_spec else edge.target,
+            if await self._edge_matches(
+                graph,
+                goal,
+                current_node_id,
+                current_node_spec,
+                result,
+                memory_snapshot,
+                edge,
+                llm_decisions,
             ):
                 traversable.append(edge)
 
@@ -2075,6 +2112,67 @@ async def _get_all_traversable_edges(
 
         return traversable
 
+    async def _route_llm_edges(
+        self,
+        graph: GraphSpec,
+        goal: Goal,
+        current_node_id: str,
+        current_node_spec: Any,
+        result: NodeResult,
+        memory_snapshot: dict[str, Any],
+        edges: list[EdgeSpec],
+    ) -> dict[str, bool]:
+        """Decide all LLM_DECIDE edges of a node with one batched LLM call.
+
+        Only used when the node has more than one such edge.  Returns an
+        empty dict (per-edge evaluation) when batching does not apply or
+        the router's response was unusable.
+        """
+        llm_edges = [e for e in edges if e.condition == EdgeCondition.LLM_DECIDE]
+        if len(llm_edges) < 2 or self.llm is None or goal is None:
+            return {}
+        target_names = {}
+        for edge in llm_edges:
+            target_spec = graph.get_node(edge.target)
+            target_names[edge.id] = target_spec.name if target_spec else edge.target
+        decisions = await self.edge_router.decide(
+            llm_edges,
+            llm=self.llm,
+            goal=goal,
+            source_node_id=current_node_id,
+            source_success=result.success,
+            source_output=result.output,
+            memory=memory_snapshot,
+            source_node_name=current_node_spec.name if current_node_spec else current_node_id,
+            target_node_names=target_names,
+        )
+        return decisions or {}
+
+    async def _edge_matches(
+        self,
+        graph: GraphSpec,
+        goal: Goal,
+        current_node_id: str,
+        current_node_spec: Any,
+        result: NodeResult,
+        memory_snapshot: dict[str, Any],
+        edge: EdgeSpec,
+        llm_decisions: dict[str, bool],
+    ) -> bool:
+        """Whether *edge* should be traversed, using a batched LLM decision if present."""
+        if edge.id in llm_decisions:
+            return llm_decisions[edge.id]
+        target_node_spec = graph.get_node(edge.target)
+        return await edge.should_traverse(
+            source_success=result.success,
+            source_output=result.output,
+            memory=memory_snapshot,
+            llm=self.llm,
+            goal=goal,
+            source_node_name=current_node_spec.name if current_node_spec else current_node_id,
+            target_node_name=target_node_spec.name if target_node_spec else edge.target,
+        )
+
     def _find_convergence_node(
         self,
         graph: GraphSpec,
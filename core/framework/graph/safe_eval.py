@@ -1,5 +1,7 @@
 import ast
+import functools
 import operator
+from collections.abc import Callable, Mapping
 from typing import Any
 
 # Safe operators whitelist
@@ -52,209 +54,250 @@
     "any": any,
 }
 
+# Methods that may be called on values (e.g. ``output.get("key")``)
+SAFE_METHODS = frozenset({"get", "keys", "values", "items", "lower", "upper", "strip", "split"})
 
-class SafeEvalVisitor(ast.NodeVisitor):
-    def __init__(self, context: dict[str, Any]):
-        self.context = context
 
-    def visit(self, node: ast.AST) -> Any:
-        # Override visit to prevent default behavior and ensure only explicitly allowed nodes work
-        method = "visit_" + node.__class__.__name__
-        visitor = getattr(self, method, self.generic_visit)
-        return visitor(node)
+Evaluator = Callable[[Mapping[str, Any]], Any]
 
-    def generic_visit(self, node: ast.AST):
-        raise ValueError(f"Use of {node.__class__.__name__} is not allowed")
 
-    def visit_Expression(self, node: ast.Expression) -> Any:
-        return self.visit(node.body)
+class CompiledExpression:
+    """An expression validated and compiled once into nested closures.
 
-    def visit_Expr(self, node: ast.Expr) -> Any:
-        return self.visit(node.value)
+    Calling it evaluates the expression against a context mapping with
+    Python semantics restricted to literals, the ``SAFE_OPERATORS``,
+    chained comparisons, short-circuiting ``and``/``or``, conditional
+    expressions, subscripts, public attribute access and calls to
+    ``SAFE_FUNCTIONS`` or ``SAFE_METHODS``.  Names are looked up in the
+    context (``NameError`` if missing), except that safe function names
+    take precedence.  The context is only read for the names the
+    expression uses, so it can be a lazy view (e.g. a ``ChainMap``)
+    instead of a merged copy.
 
-    def visit_Constant(self, node: ast.Constant) -> Any:
-        return node.value
+    Attributes:
+        expr: The source expression.
+        names: Context variable names the expression reads.
+    """
+
+    __slots__ = ("expr", "names", "_evaluate")
+
+    def __init__(self, expr: str, evaluate: Evaluator, names: frozenset[str]):
+        self.expr = expr
+        self.names = names
+        self._evaluate = evaluate
+
+    def __call__(self, context: Mapping[str, Any] | None = None) -> Any:
+        return self._evaluate(context if context is not None else {})
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.expr!r})"
+
+
+class _ExpressionCompiler:
+    """Compiles an AST into closures, rejecting disallowed nodes up front."""
+
+    def __init__(self) -> None:
+        self.names: set[str] = set()
+
+    def compile(self, node: ast.AST) -> Evaluator:
+        method = getattr(self, "compile_" + node.__class__.__name__, None)
+        if method is None:
+            raise ValueError(f"Use of {node.__class__.__name__} is not allowed")
+        return method(node)
+
+    def compile_Expression(self, node: ast.Expression) -> Evaluator:
+        return self.compile(node.body)
+
+    def compile_Expr(self, node: ast.Expr) -> Evaluator:
+        return self.compile(node.value)
+
+    def compile_Constant(self, node: ast.Constant) -> Evaluator:
+        value = node.value
+        return lambda ctx: value
 
     # --- Data Structures ---
-    def visit_List(self, node: ast.List) -> list:
-        return [self.visit(elt) for elt in node.elts]
+    def compile_List(self, node: ast.List) -> Evaluator:
+        elts = [self.compile(elt) for elt in node.elts]
+        return lambda ctx: [elt(ctx) for elt in elts]
 
-    def visit_Tuple(self, node: ast.Tuple) -> tuple:
-        return tuple(self.visit(elt) for elt in node.elts)
+    def compile_Tuple(self, node: ast.Tuple) -> Evaluator:
+        elts = [self.compile(elt) for elt in node.elts]
+        return lambda ctx: tuple(elt(ctx) for elt in elts)
 
-    def visit_Dict(self, node: ast.Dict) -> dict:
-        return {
-            self.visit(k): self.visit(v)
+    def compile_Dict(self, node: ast.Dict) -> Evaluator:
+        items = [
+            (self.compile(k), self.compile(v))
             for k, v in zip(node.keys, node.values, strict=False)
             if k is not None
-        }
+        ]
+        return lambda ctx: {k(ctx): v(ctx) for k, v in items}
 
     # --- Operations ---
-    def visit_BinOp(self, node: ast.BinOp) -> Any:
-        op_func = SAFE_OPERATORS.get(type(node.op))
-        if op_func is None:
-            raise ValueError(f"Operator {type(node.op).__name__} is not allowed")
-        return op_func(self.visit(node.left), self.visit(node.right))
-
-    def visit_UnaryOp(self, node: ast.UnaryOp) -> Any:
-        op_func = SAFE_OPERATORS.get(type(node.op))
+    def _operator(self, op: ast.AST) -> Callable[..., Any]:
+        op_func = SAFE_OPERATORS.get(type(op))
         if op_func is None:
-            raise ValueError(f"Operator {type(node.op).__name__} is not allowed")
-        return op_func(self.visit(node.operand))
-
-    def visit_Compare(self, node: ast.Compare) -> Any:
-        left = self.visit(node.left)
-        for op, comparator in zip(node.ops, node.comparators, strict=False):
-            op_func = SAFE_OPERATORS.get(type(op))
-            if op_func is None:
-                raise ValueError(f"Operator {type(op).__name__} is not allowed")
-            right = self.visit(comparator)
-            if not op_func(left, right):
-                return False
-            left = right  # Chain comparisons
-        return True
-
-    def visit_BoolOp(self, node: ast.BoolOp) -> Any:
-        # Short-circuit evaluation to match Python semantics.
-        # Previously all operands were eagerly evaluated, which broke
-        # guard patterns like: ``x is not None and x.get("key")``
+            raise ValueError(f"Operator {type(op).__name__} is not allowed")
+        return op_func
+
+    def compile_BinOp(self, node: ast.BinOp) -> Evaluator:
+        op_func = self._operator(node.op)
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        return lambda ctx: op_func(left(ctx), right(ctx))
+
+    def compile_UnaryOp(self, node: ast.UnaryOp) -> Evaluator:
+        op_func = self._operator(node.op)
+        operand = self.compile(node.operand)
+        return lambda ctx: op_func(operand(ctx))
+
+    def compile_Compare(self, node: ast.Compare) -> Evaluator:
+        first = self.compile(node.left)
+        steps = [
+            (self._operator(op), self.compile(comparator))
+            for op, comparator in zip(node.ops, node.comparators, strict=False)
+        ]
+
+        def compare(ctx: Mapping[str, Any]) -> bool:
+            left = first(ctx)
+            for op_func, comparator in steps:
+                right = comparator(ctx)
+                if not op_func(left, right):
+                    return False
+                left = right  # Chain comparisons
+            return True
+
+        return compare
+
+    def compile_BoolOp(self, node: ast.BoolOp) -> Evaluator:
+        values = [self.compile(v) for v in node.values]
         if isinstance(node.op, ast.And):
-            result = True
-            for v in node.values:
-                result = self.visit(v)
-                if not result:
-                    return result
-            return result
-        elif isinstance(node.op, ast.Or):
-            result = False
-            for v in node.values:
-                result = self.visit(v)
-                if result:
-                    return result
-            return result
+
+            def all_of(ctx: Mapping[str, Any]) -> Any:
+                result: Any = True
+                for value in values:
+                    result = value(ctx)
+                    if not result:
+                        return result
+                return result
+
+            return all_of
+        if isinstance(node.op, ast.Or):
+
+            def any_of(ctx: Mapping[str, Any]) -> Any:
+                result: Any = False
+                for value in values:
+                    result = value(ctx)
+                    if result:
+                        return result
+                return result
+
+            return any_of
         raise ValueError(f"Boolean operator {type(node.op).__name__} is not allowed")
 
-    def visit_IfExp(self, node: ast.IfExp) -> Any:
-        # Ternary: true_val if test else false_val
-        if self.visit(node.test):
-            return self.visit(node.body)
-        else:
-            return self.visit(node.orelse)
+    def compile_IfExp(self, node: ast.IfExp) -> Evaluator:
+        test = self.compile(node.test)
+        body = self.compile(node.body)
+        orelse = self.compile(node.orelse)
+        return lambda ctx: body(ctx) if test(ctx) else orelse(ctx)
 
     # --- Variables and Attributes ---
-    def visit_Name(self, node: ast.Name) -> Any:
-        if isinstance(node.ctx, ast.Load):
-            if node.id in self.context:
-                return self.context[node.id]
-            raise NameError(f"Name '{node.id}' is not defined")
-        raise ValueError("Only reading variables is allowed")
-
-    def visit_Subscript(self, node: ast.Subscript) -> Any:
-        # value[slice]
-        val = self.visit(node.value)
-        idx = self.visit(node.slice)
-        return val[idx]
-
-    def visit_Attribute(self, node: ast.Attribute) -> Any:
-        # value.attr
+    def compile_Name(self, node: ast.Name) -> Evaluator:
+        if not isinstance(node.ctx, ast.Load):
+            raise ValueError("Only reading variables is allowed")
+        name = node.id
+        # Safe functions take precedence over context variables
+        if name in SAFE_FUNCTIONS:
+            func = SAFE_FUNCTIONS[name]
+            return lambda ctx: func
+        self.names.add(name)
+
+        def load(ctx: Mapping[str, Any]) -> Any:
+            try:
+                return ctx[name]
+            except KeyError:
+                raise NameError(f"Name '{name}' is not defined") from None
+
+        return load
+
+    def compile_Subscript(self, node: ast.Subscript) -> Evaluator:
+        value = self.compile(node.value)
+        index = self.compile(node.slice)
+        return lambda ctx: value(ctx)[index(ctx)]
+
+    def compile_Attribute(self, node: ast.Attribute) -> Evaluator:
+        attr = node.attr
         # STRICT CHECK: No access to private attributes (starting with _)
-        if node.attr.startswith("_"):
-            raise ValueError(f"Access to private attribute '{node.attr}' is not allowed")
-
-        val = self.visit(node.value)
-
-        # Safe attribute access: only allow if it's in the dict (if val is dict)
-        # or it's a safe property of a basic type?
-        # Actually, for flexibility, people often use dot access for dicts in these expressions.
-        # But standard Python dict doesn't support dot access.
-        # If val is a dict, Attribute access usually fails in Python unless wrapped.
-        # If the user context provides objects, we might want to allow attribute access.
-        # BUT we must be careful not to allow access to dangerous things like __class__ etc.
-        # The check starts_with("_") covers __class__, __init__, etc.
-
-        try:
-            return getattr(val, node.attr)
-        except AttributeError:
-            # Fallback: maybe it's a dict and they want dot access?
-            # (Only if we want to support that sugar, usually not standard python)
-            # Let's stick to standard python behavior + strict private check.
-            pass
-
-        raise AttributeError(f"Object has no attribute '{node.attr}'")
-
-    def visit_Call(self, node: ast.Call) -> Any:
-        # Only allow calling whitelisted functions
-        func = self.visit(node.func)
-
-        # Check if the function object itself is in our whitelist values
-        # This is tricky because `func` is the actual function object,
-        # but we also want to verify it came from a safe place.
-        # Easier: Check if node.func is a Name and that name is in SAFE_FUNCTIONS.
-
-        is_safe = False
-        if isinstance(node.func, ast.Name):
-            if node.func.id in SAFE_FUNCTIONS:
-                is_safe = True
-
-        # Also allow methods on objects if they are safe?
-        # E.g. "somestring".lower() or list.append() (if we allowed mutation, but we don't for now)
-        # For now, restrict to SAFE_FUNCTIONS whitelist for global calls and deny method calls
-        # unless we explicitly add safe methods.
-        # Allowing method calls on strings/lists (split, join, get) is commonly needed.
-
-        if isinstance(node.func, ast.Attribute):
-            # Method call.
-            # Allow basic safe methods?
-            # For security, start strict. Only helper functions.
-            # Re-visiting: User might want 'output.get("key")'.
-            method_name = node.func.attr
-            if method_name in [
-                "get",
-                "keys",
-                "values",
-                "items",
-                "lower",
-                "upper",
-                "strip",
-                "split",
-            ]:
-                is_safe = True
-
-        if not is_safe and func not in SAFE_FUNCTIONS.values():
-            raise ValueError("Call to function/method is not allowed")
-
-        args = [self.visit(arg) for arg in node.args]
-        keywords = {kw.arg: self.visit(kw.value) for kw in node.keywords}
-
-        return func(*args, **keywords)
-
-
-def safe_eval(expr: str, context: dict[str, Any] | None = None) -> Any:
+        if attr.startswith("_"):
+            raise ValueError(f"Access to private attribute '{attr}' is not allowed")
+        value = self.compile(node.value)
+
+        def get(ctx: Mapping[str, Any]) -> Any:
+            val = value(ctx)
+            try:
+                return getattr(val, attr)
+            except AttributeError:
+                pass
+            raise AttributeError(f"Object has no attribute '{attr}'")
+
+        return get
+
+    def compile_Call(self, node: ast.Call) -> Evaluator:
+        func_eval = self.compile(node.func)
+        # Whitelisted names and methods are safe by construction; anything
+        # else is checked against the whitelist once the callee is known.
+        is_safe = (isinstance(node.func, ast.Name) and node.func.id in SAFE_FUNCTIONS) or (
+            isinstance(node.func, ast.Attribute) and node.func.attr in SAFE_METHODS
+        )
+        args = [self.compile(arg) for arg in node.args]
+        keywords = [(kw.arg, self.compile(kw.value)) for kw in node.keywords]
+
+        def call(ctx: Mapping[str, Any]) -> Any:
+            func = func_eval(ctx)
+            if not is_safe and func not in SAFE_FUNCTIONS.values():
+                raise ValueError("Call to function/method is not allowed")
+            return func(*[arg(ctx) for arg in args], **{k: v(ctx) for k, v in keywords})
+
+        return call
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_expression(expr: str) -> CompiledExpression:
     """
-    Safely evaluate a python expression string.
+    Parse, validate and compile an expression string (cached per string).
 
     Args:
-        expr: The expression string to evaluate.
-        context: Dictionary of variables available in the expression.
+        expr: The expression string to compile.
 
     Returns:
-        The result of the evaluation.
+        A callable taking the evaluation context.
 
     Raises:
-        ValueError: If unsafe operations or syntax are detected.
+        ValueError: If unsafe operations are used anywhere in the expression.
         SyntaxError: If the expression is invalid Python.
     """
-    if context is None:
-        context = {}
-
-    # Add safe builtins to context
-    full_context = context.copy()
-    full_context.update(SAFE_FUNCTIONS)
-
     try:
         tree = ast.parse(expr, mode="eval")
     except SyntaxError as e:
         raise SyntaxError(f"Invalid syntax in expression: {e}") from e
 
-    visitor = SafeEvalVisitor(full_context)
-    return visitor.visit(tree)
+    compiler = _ExpressionCompiler()
+    evaluate = compiler.compile(tree)
+    return CompiledExpression(expr, evaluate, frozenset(compiler.names))
+
+
+def safe_eval(expr: str, context: Mapping[str, Any] | None = None) -> Any:
+    """
+    Safely evaluate a python expression string.
+
+    Args:
+        expr: The expression string to evaluate.
+        context: Mapping of variables available in the expression.
+
+    Returns:
+        The result of the evaluation.
+
+    Raises:
+        ValueError: If unsafe operations or syntax are detected.
+        SyntaxError: If the expression is invalid Python.
+    """
+    return compile_expression(expr)(context)
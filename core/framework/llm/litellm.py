@@ -30,6 +30,7 @@
 from framework.config import HIVE_LLM_ENDPOINT as HIVE_API_BASE
 from framework.llm.provider import LLMProvider, LLMResponse, Tool
 from framework.llm.stream_events import StreamEvent
+from framework.llm.token_counting import get_token_counter
 
 logger = logging.getLogger(__name__)
 
@@ -203,6 +204,73 @@ def _model_supports_cache_control(model: str) -> bool:
     return any(model.startswith(p) for p in _CACHE_CONTROL_PREFIXES)
 
 
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+def _apply_cache_breakpoints(
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Mark the stable prompt prefix for caching on cache_control providers.
+
+    Anthropic allows four breakpoints per request; the system message uses
+    one.  The other three go on:
+
+    - the last tool definition, so tools stay cached when the system
+      prompt changes between turns;
+    - the last message, which writes the whole conversation to the cache;
+    - the last message before the most recent assistant reply, i.e. where
+      the previous turn's request ended, so this turn reads that prefix
+      back even when the newest turn added many blocks (the provider only
+      looks back ~20 blocks from a breakpoint).
+
+    Breakpoints are recomputed from the messages on every call, so after
+    compaction or pruning rewrites the history they simply land on the new
+    messages.  Marked messages are copied — callers' dicts are not mutated.
+
+    Args:
+        messages: Full request messages; system messages are never marked
+            here (the system prompt carries its own breakpoint)
+        tools: OpenAI-format tool definitions; the last one is marked in place
+
+    Returns:
+        A new message list with ``cache_control`` on up to two
+        conversation messages
+    """
+    if tools:
+        tools[-1]["cache_control"] = _EPHEMERAL_CACHE
+
+    marked = list(messages)
+    if not marked:
+        return marked
+    targets = {len(marked) - 1}
+    for i in range(len(marked) - 1, 0, -1):
+        if marked[i].get("role") == "assistant":
+            targets.add(i - 1)
+            break
+    for i in targets:
+        msg = marked[i]
+        if msg.get("role") == "system":
+            continue
+        if msg.get("content") or msg.get("tool_calls"):
+            marked[i] = {**msg, "cache_control": _EPHEMERAL_CACHE}
+    return marked
+
+
+def _usage_cache_tokens(usage: Any) -> tuple[int, int]:
+    """Return ``(cache_read, cache_write)`` input token counts from a usage object."""
+    if usage is None:
+        return 0, 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    read = (
+        getattr(details, "cached_tokens", 0) or 0
+        if details is not None
+        else getattr(usage, "cache_read_input_tokens", 0) or 0
+    )
+    write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+    return read, write
+
+
 # Kimi For Coding uses an Anthropic-compatible endpoint (no /v1 suffix).
 # Claude Code integration uses this format; the /v1 OpenAI-compatible endpoint
 # enforces a coding-agent whitelist that blocks unknown User-Agents.
@@ -282,11 +350,13 @@ def _claude_code_billing_header(messages: list[dict[str, Any]]) -> str:
 
 def _estimate_tokens(model: str, messages: list[dict]) -> tuple[int, str]:
     """Estimate token count for messages. Returns (token_count, method)."""
-    # Try litellm's token counter first
+    # Try litellm's tokenizer first, memoized per message: retries resend
+    # the same history, so only new messages are tokenized.
     if litellm is not None:
         try:
-            count = litellm.token_counter(model=model, messages=messages)
-            return count, "litellm"
+            counter = get_token_counter(model)
+            if counter is not None:
+                return counter.count_messages(messages), "litellm"
         except Exception:
             pass
 
@@ -769,12 +839,15 @@ def complete(
         usage = response.usage
         input_tokens = usage.prompt_tokens if usage else 0
         output_tokens = usage.completion_tokens if usage else 0
+        cached_tokens, cache_write_tokens = _usage_cache_tokens(usage)
 
         return LLMResponse(
             content=content,
             model=response.model or self.model,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cached_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens,
             stop_reason=response.choices[0].finish_reason or "",
             raw_response=response,
         )
@@ -949,6 +1022,8 @@ async def acomplete(
                 # Ollama requires explicit tool_choice=auto for function calling
                 # so future readers don't have to guess.
                 kwargs.setdefault("tool_choice", "auto")
+        if _model_supports_cache_control(self.model):
+            kwargs["messages"] = _apply_cache_breakpoints(full_messages, kwargs.get("tools"))
         if response_format:
             kwargs["response_format"] = response_format
 
@@ -958,12 +1033,15 @@ async def acomplete(
         usage = response.usage
         input_tokens = usage.prompt_tokens if usage else 0
         output_tokens = usage.completion_tokens if usage else 0
+        cached_tokens, cache_write_tokens = _usage_cache_tokens(usage)
 
         return LLMResponse(
             content=content,
             model=response.model or self.model,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cached_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens,
             stop_reason=response.choices[0].finish_reason or "",
             raw_response=response,
         )
@@ -1478,6 +1556,8 @@ async def _stream_via_openrouter_tool_compat(
             stop_reason=response.stop_reason,
             input_tokens=response.input_tokens,
             output_tokens=response.output_tokens,
+            cached_tokens=response.cached_tokens,
+            cache_write_tokens=response.cache_write_tokens,
             model=response.model,
         )
 
@@ -1543,6 +1623,8 @@ async def _stream_via_nonstream_completion(
             stop_reason=response.stop_reason or "stop",
             input_tokens=response.input_tokens,
             output_tokens=response.output_tokens,
+            cached_tokens=response.cached_tokens,
+            cache_write_tokens=response.cache_write_tokens,
             model=response.model,
         )
 
@@ -1654,6 +1736,8 @@ async def stream(
                 # Ollama requires explicit tool_choice=auto for function calling
                 # so future readers don't have to guess.
                 kwargs.setdefault("tool_choice", "auto")
+        if _model_supports_cache_control(self.model):
+            kwargs["messages"] = _apply_cache_breakpoints(full_messages, kwargs.get("tools"))
         if response_format:
             kwargs["response_format"] = response_format
         # The Codex ChatGPT backend (Responses API) rejects several params.
@@ -1774,22 +1858,17 @@ async def stream(
                             usage,
                             type(usage).__name__,
                         )
-                        cached_tokens = 0
+                        cached_tokens, cache_write_tokens = _usage_cache_tokens(usage)
                         if usage:
                             input_tokens = getattr(usage, "prompt_tokens", 0) or 0
                             output_tokens = getattr(usage, "completion_tokens", 0) or 0
-                            _details = getattr(usage, "prompt_tokens_details", None)
-                            cached_tokens = (
-                                getattr(_details, "cached_tokens", 0) or 0
-                                if _details is not None
-                                else getattr(usage, "cache_read_input_tokens", 0) or 0
-                            )
                             logger.debug(
                                 "[tokens] finish-chunk usage: "
-                                "input=%d output=%d cached=%d model=%s",
+                                "input=%d output=%d cached=%d cache_write=%d model=%s",
                                 input_tokens,
                                 output_tokens,
                                 cached_tokens,
+                                cache_write_tokens,
                                 self.model,
                             )
 
@@ -1807,6 +1886,7 @@ async def stream(
                                 input_tokens=input_tokens,
                                 output_tokens=output_tokens,
                                 cached_tokens=cached_tokens,
+                                cache_write_tokens=cache_write_tokens,
                                 model=self.model,
                             )
                         )
@@ -1826,12 +1906,7 @@ async def stream(
                             _usage = calculate_total_usage(chunks=_chunks)
                             input_tokens = _usage.prompt_tokens or 0
                             output_tokens = _usage.completion_tokens or 0
-                            _details = getattr(_usage, "prompt_tokens_details", None)
-                            cached_tokens = (
-                                getattr(_details, "cached_tokens", 0) or 0
-                                if _details is not None
-                                else getattr(_usage, "cache_read_input_tokens", 0) or 0
-                            )
+                            cached_tokens, cache_write_tokens = _usage_cache_tokens(_usage)
                             logger.debug(
                                 "[tokens] post-loop chunks fallback:"
                                 " input=%d output=%d cached=%d model=%s",
@@ -1848,6 +1923,7 @@ async def stream(
                                         input_tokens=input_tokens,
                                         output_tokens=output_tokens,
                                         cached_tokens=cached_tokens,
+                                        cache_write_tokens=cache_write_tokens,
                                         model=_ev.model,
                                     )
                                     break
@@ -16,6 +16,8 @@ class LLMResponse:
     model: str
     input_tokens: int = 0
     output_tokens: int = 0
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
     stop_reason: str = ""
     raw_response: Any = None
 
@@ -47,6 +49,7 @@ class ToolResult:
     is_error: bool = False
     image_content: list[dict[str, Any]] | None = None
     is_skill_content: bool = False  # AS-10: marks activated skill body, protected from pruning
+    cached: bool = False  # served from the tool result cache, tool not run
 
 
 class LLMProvider(ABC):
@@ -157,6 +160,8 @@ async def stream(
             stop_reason=response.stop_reason,
             input_tokens=response.input_tokens,
             output_tokens=response.output_tokens,
+            cached_tokens=response.cached_tokens,
+            cache_write_tokens=response.cache_write_tokens,
             model=response.model,
         )
 
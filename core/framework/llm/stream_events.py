@@ -72,6 +72,7 @@ class FinishEvent:
     input_tokens: int = 0
     output_tokens: int = 0
     cached_tokens: int = 0
+    cache_write_tokens: int = 0
     model: str = ""
 
 
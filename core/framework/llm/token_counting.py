@@ -0,0 +1,121 @@
+"""Per-message token counting with a real tokenizer, memoized by content hash.
+
+Conversation budget checks run several times per turn over a history that
+changes by a few messages at a time.  :class:`TokenCounter` counts each
+message once with the model's tokenizer (via ``litellm.token_counter``) and
+remembers the result by a hash of the message content, so recounting after
+compaction, pruning or a restore only tokenizes messages it has not seen.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Fixed per-message overhead (role / separators) added by chat formats
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_DEFAULT_MAX_ENTRIES = 20_000
+
+
+def _message_text(message: dict[str, Any]) -> str:
+    """Text the tokenizer should see for an OpenAI-format message."""
+    content = message.get("content")
+    if isinstance(content, list):
+        parts = [b.get("text", "") for b in content if isinstance(b, dict)]
+        text = "\n".join(p for p in parts if p)
+    else:
+        text = content or ""
+    tool_calls = message.get("tool_calls")
+    if tool_calls:
+        calls = [
+            f"{tc.get('function', {}).get('name', '')}"
+            f"({tc.get('function', {}).get('arguments', '')})"
+            for tc in tool_calls
+        ]
+        text = "\n".join([text, *calls]) if text else "\n".join(calls)
+    return text
+
+
+class TokenCounter:
+    """Counts message tokens with a tokenizer, memoizing results by content hash.
+
+    Thread-safe.  The memo is a bounded LRU so long-running processes that
+    see many conversations do not grow without limit.
+    """
+
+    def __init__(
+        self,
+        count_text: Callable[[str], int],
+        name: str = "",
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._count_text = count_text
+        self.name = name
+        self._max_entries = max_entries
+        self._memo: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count_text(self, text: str) -> int:
+        """Token count for *text* (memoized)."""
+        if not text:
+            return 0
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+                self.hits += 1
+                return cached
+        count = self._count_text(text)
+        with self._lock:
+            self.misses += 1
+            self._memo[key] = count
+            if len(self._memo) > self._max_entries:
+                self._memo.popitem(last=False)
+        return count
+
+    def count_message(self, message: dict[str, Any]) -> int:
+        """Token count for one OpenAI-format message, including per-message overhead."""
+        return self.count_text(_message_text(message)) + MESSAGE_OVERHEAD_TOKENS
+
+    def count_messages(self, messages: list[dict[str, Any]]) -> int:
+        return sum(self.count_message(m) for m in messages)
+
+
+_counters: dict[str, TokenCounter | None] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(model: str) -> TokenCounter | None:
+    """Shared memoized tokenizer-backed counter for *model*.
+
+    Returns ``None`` when litellm is not installed or has no tokenizer for
+    the model, in which case callers keep their character heuristic.
+    """
+    if not model:
+        return None
+    with _counters_lock:
+        if model in _counters:
+            return _counters[model]
+    counter: TokenCounter | None = None
+    try:
+        import litellm
+
+        def count_text(text: str) -> int:
+            return litellm.token_counter(model=model, text=text)
+
+        count_text("probe")
+        counter = TokenCounter(count_text, name=model)
+    except Exception as e:
+        logger.debug("No tokenizer available for %s: %s", model, e)
+    with _counters_lock:
+        return _counters.setdefault(model, counter)
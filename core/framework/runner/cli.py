@@ -308,19 +308,17 @@ def _load_resume_state(
         return None
 
     if checkpoint_id:
-        # Checkpoint-based resume: load checkpoint and extract state
-        cp_path = session_dir / "checkpoints" / f"{checkpoint_id}.json"
-        if not cp_path.exists():
-            return None
-        try:
-            cp_data = json.loads(cp_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+        # Checkpoint-based resume: load checkpoint (rebuilding delta chains)
+        from framework.storage.checkpoint_store import CheckpointStore
+
+        checkpoint = CheckpointStore(session_dir).load_checkpoint_sync(checkpoint_id)
+        if checkpoint is None:
             return None
         return {
             "resume_session_id": session_id,
-            "memory": cp_data.get("shared_memory", {}),
-            "paused_at": cp_data.get("next_node") or cp_data.get("current_node"),
-            "execution_path": cp_data.get("execution_path", []),
+            "memory": checkpoint.shared_memory,
+            "paused_at": checkpoint.next_node or checkpoint.current_node,
+            "execution_path": checkpoint.execution_path,
             "node_visit_counts": {},
         }
     else:
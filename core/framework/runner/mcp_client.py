@@ -38,6 +38,11 @@ class MCPServerConfig:
     # Optional metadata
     description: str = ""
 
+    # Replicas of this server kept by MCPConnectionManager; a pool is used
+    # when max_replicas > 1 (see mcp_replica_pool)
+    min_replicas: int = 1
+    max_replicas: int = 1
+
 
 @dataclass
 class MCPTool:
@@ -47,6 +52,8 @@ class MCPTool:
     description: str
     input_schema: dict[str, Any]
     server_name: str
+    # Tool-declared metadata (MCP ``_meta``), e.g. {"cache_ttl": 3600}
+    meta: dict[str, Any] | None = None
 
 
 class MCPClient:
@@ -74,6 +81,8 @@ def __init__(self, config: MCPServerConfig):
         self._http_client: httpx.Client | None = None
         self._tools: dict[str, MCPTool] = {}
         self._connected = False
+        # serverInfo.version reported at initialization (stdio/sse only)
+        self.server_version: str | None = None
 
         # Background event loop for persistent STDIO connection
         self._loop = None
@@ -220,7 +229,8 @@ async def init_connection():
                         await self._session.__aenter__()
 
                         # Initialize session
-                        await self._session.initialize()
+                        init_result = await self._session.initialize()
+                        self._record_server_info(init_result)
 
                         connection_ready.set()
                     except Exception as e:
@@ -331,7 +341,8 @@ async def init_connection():
 
                         self._session = ClientSession(self._read_stream, self._write_stream)
                         await self._session.__aenter__()
-                        await self._session.initialize()
+                        init_result = await self._session.initialize()
+                        self._record_server_info(init_result)
 
                         connection_ready.set()
                     except Exception as e:
@@ -356,6 +367,11 @@ async def init_connection():
         except Exception as e:
             raise RuntimeError(f"Failed to connect to MCP server: {e}") from e
 
+    def _record_server_info(self, init_result: Any) -> None:
+        server_info = getattr(init_result, "serverInfo", None)
+        version = getattr(server_info, "version", None)
+        self.server_version = str(version) if version else None
+
     def _discover_tools(self) -> None:
         """Discover available tools from the MCP server."""
         try:
@@ -371,6 +387,7 @@ def _discover_tools(self) -> None:
                     description=tool_data.get("description", ""),
                     input_schema=tool_data.get("inputSchema", {}),
                     server_name=self.config.name,
+                    meta=tool_data.get("_meta") or tool_data.get("meta"),
                 )
                 self._tools[tool.name] = tool
 
@@ -398,6 +415,7 @@ async def _list_tools_stdio_async(self) -> list[dict]:
                     "name": tool.name,
                     "description": tool.description,
                     "inputSchema": tool.inputSchema,
+                    "_meta": getattr(tool, "meta", None),
                 }
             )
 
@@ -470,6 +488,58 @@ def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         else:
             return self._call_tool_http(tool_name, arguments)
 
+    async def call_tool_async(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        """
+        Invoke a tool on the MCP server without blocking the caller's event loop.
+
+        STDIO and SSE calls are submitted to the persistent session's loop
+        without taking ``_stdio_call_lock``: the session correlates responses
+        by JSON-RPC request id, so concurrent calls are multiplexed over the
+        one connection and overlap on the server.  HTTP and UNIX calls run the
+        blocking request in a worker thread.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            arguments: Tool arguments
+
+        Returns:
+            Tool result (same shape as :meth:`call_tool`)
+        """
+        if not self._connected:
+            await asyncio.to_thread(self.connect)
+
+        if tool_name not in self._tools:
+            raise ValueError(f"Unknown tool: {tool_name}")
+
+        if self.config.transport == "stdio":
+            return await self._submit(self._call_tool_stdio_async(tool_name, arguments))
+        elif self.config.transport == "sse":
+            try:
+                return await self._submit(self._call_tool_stdio_async(tool_name, arguments))
+            except (httpx.ConnectError, httpx.ReadTimeout) as original_error:
+                logger.warning(
+                    "Retrying MCP tool call after transport error from '%s': %s",
+                    self.config.name,
+                    original_error,
+                )
+                await asyncio.to_thread(self._reconnect)
+                try:
+                    return await self._submit(self._call_tool_stdio_async(tool_name, arguments))
+                except (httpx.ConnectError, httpx.ReadTimeout) as retry_error:
+                    raise original_error from retry_error
+        else:
+            return await asyncio.to_thread(self.call_tool, tool_name, arguments)
+
+    async def _submit(self, coro) -> Any:
+        """Run a coroutine on the persistent session loop and await it from the caller's loop."""
+        loop = self._loop
+        if loop is None or not loop.is_running() or loop.is_closed():
+            coro.close()
+            raise RuntimeError(f"MCP server '{self.config.name}' session loop is not running")
+        if loop is asyncio.get_running_loop():
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
     def _call_tool_with_retry(self, call: Any) -> Any:
         """Retry transient MCP transport failures once after reconnecting."""
         if self.config.transport == "stdio":
@@ -2,10 +2,12 @@
 
 import logging
 import threading
+from typing import Any
 
 import httpx
 
 from framework.runner.mcp_client import MCPClient, MCPServerConfig
+from framework.runner.mcp_replica_pool import MCPReplicaPool
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,16 @@ def get_instance(cls) -> "MCPConnectionManager":
     def _is_connected(client: MCPClient | None) -> bool:
         return bool(client and getattr(client, "_connected", False))
 
+    def _new_client(self, config: MCPServerConfig) -> MCPClient | MCPReplicaPool:
+        """A single client, or a replica pool when the server allows several."""
+        if config.max_replicas > 1:
+            return MCPReplicaPool(
+                config,
+                client_factory=MCPClient,
+                probe=lambda client: self._probe(client, config),
+            )
+        return MCPClient(config)
+
     def has_connection(self, server_name: str) -> bool:
         """Return True when a live pooled connection exists for ``server_name``."""
         with self._pool_lock:
@@ -86,7 +98,7 @@ def acquire(self, config: MCPServerConfig) -> MCPClient:
                 continue
 
             logger.info("Connecting to MCP server '%s'", server_name)
-            client = MCPClient(config)
+            client = self._new_client(config)
             try:
                 client.connect()
             except Exception:
@@ -213,7 +225,15 @@ def health_check(self, server_name: str) -> bool:
 
         if client is None or config is None:
             return False
+        if isinstance(client, MCPReplicaPool):
+            # Probes each replica, evicting and replacing unhealthy ones
+            return client.check_health()
+        return self._probe(client, config)
 
+    @staticmethod
+    def _probe(client: Any, config: MCPServerConfig) -> bool:
+        """Return True when *client* (one server connection) responds."""
+        server_name = config.name
         try:
             match config.transport:
                 case "stdio":
@@ -301,7 +321,7 @@ def reconnect(self, server_name: str) -> MCPClient:
                 )
 
         logger.info("Reconnecting MCP server '%s'", server_name)
-        new_client = MCPClient(config)
+        new_client = self._new_client(config)
         try:
             new_client.connect()
         except Exception:
@@ -362,6 +382,25 @@ def reconnect(self, server_name: str) -> MCPClient:
             )
         return self.acquire(config)
 
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-server connection stats, including per-replica latency for pools."""
+        with self._pool_lock:
+            pooled = list(self._pool.items())
+            refcounts = dict(self._refcounts)
+        stats: dict[str, dict[str, Any]] = {}
+        for server_name, client in pooled:
+            entry: dict[str, Any] = {
+                "transport": client.config.transport,
+                "refcount": refcounts.get(server_name, 0),
+                "connected": self._is_connected(client),
+            }
+            if isinstance(client, MCPReplicaPool):
+                entry.update(client.stats())
+            else:
+                entry["replicas"] = [{"id": 0}]
+            stats[server_name] = entry
+        return stats
+
     def cleanup_all(self) -> None:
         """Disconnect all pooled clients and clear manager state."""
         while True:
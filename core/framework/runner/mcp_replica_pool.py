@@ -0,0 +1,327 @@
+"""Replicated MCP server connections with load balancing.
+
+``MCPConnectionManager`` shares one client (one server process) per
+server name across every session in the process, so a slow tool on one
+server holds up everyone using it.  For servers configured with
+``max_replicas > 1`` the manager pools an :class:`MCPReplicaPool`
+instead: a drop-in for ``MCPClient`` that runs several clients of the
+same server and
+
+- routes each call to the replica with the fewest outstanding calls
+  (ties go to the one with the lower average latency);
+- adds a replica, up to ``max_replicas``, when every replica already has
+  ``scale_up_queue_depth`` calls outstanding, and retires replicas above
+  ``min_replicas`` once they have been idle for ``idle_timeout_s``;
+- health-checks a replica after ``max_consecutive_failures`` failed calls
+  in a row (tool errors also raise, so a failure alone proves nothing),
+  and on :meth:`check_health`; unhealthy replicas are evicted and
+  replaced;
+- records per-replica call counts, errors and latency for
+  ``MCPConnectionManager.stats()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from framework.runner.mcp_client import MCPClient, MCPServerConfig, MCPTool
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per replica for percentiles
+_LATENCY_WINDOW = 256
+
+
+@dataclass
+class _Replica:
+    id: int
+    client: Any
+    outstanding: int = 0
+    calls: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    latency_ewma_s: float | None = None
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+    last_used: float = field(default_factory=time.monotonic)
+
+    def record(self, duration: float, failed: bool) -> None:
+        self.calls += 1
+        self.latencies.append(duration)
+        self.latency_ewma_s = (
+            duration if self.latency_ewma_s is None else 0.8 * self.latency_ewma_s + 0.2 * duration
+        )
+        if failed:
+            self.errors += 1
+            self.consecutive_errors += 1
+        else:
+            self.consecutive_errors = 0
+
+    def stats(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+
+        def pct(p: float) -> float | None:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 1)
+
+        return {
+            "id": self.id,
+            "outstanding": self.outstanding,
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_avg_ms": (
+                round(self.latency_ewma_s * 1000, 1) if self.latency_ewma_s is not None else None
+            ),
+            "latency_p50_ms": pct(0.5),
+            "latency_p95_ms": pct(0.95),
+        }
+
+
+class MCPReplicaPool:
+    """Several clients of one MCP server behind the ``MCPClient`` interface.
+
+    Args:
+        config: Server configuration; ``min_replicas``/``max_replicas``
+            bound the pool size.
+        client_factory: Builds one replica client (default ``MCPClient``).
+        probe: Returns True if a replica client is healthy.
+        scale_up_queue_depth: Outstanding calls on every replica that
+            trigger adding a replica.
+        idle_timeout_s: Idle time after which replicas above the minimum
+            are retired.
+        max_consecutive_failures: Failed calls in a row before a replica
+            is health-checked.
+    """
+
+    def __init__(
+        self,
+        config: MCPServerConfig,
+        client_factory: Callable[[MCPServerConfig], Any] | None = None,
+        probe: Callable[[Any], bool] | None = None,
+        scale_up_queue_depth: int = 2,
+        idle_timeout_s: float = 300.0,
+        max_consecutive_failures: int = 3,
+    ):
+        self.config = config
+        self.min_replicas = max(1, config.min_replicas)
+        self.max_replicas = max(self.min_replicas, config.max_replicas)
+        self._client_factory = client_factory or MCPClient
+        self._probe = probe or _default_probe
+        self.scale_up_queue_depth = scale_up_queue_depth
+        self.idle_timeout_s = idle_timeout_s
+        self.max_consecutive_failures = max_consecutive_failures
+        self._replicas: list[_Replica] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._spawning = 0
+        self._closed = False
+        self.scale_ups = 0
+        self.scale_downs = 0
+        self.evictions = 0
+
+    # === MCPClient INTERFACE ===
+
+    @property
+    def _connected(self) -> bool:
+        return bool(self._replicas) and not self._closed
+
+    @property
+    def server_version(self) -> str | None:
+        replicas = self._replicas
+        return getattr(replicas[0].client, "server_version", None) if replicas else None
+
+    def connect(self) -> None:
+        """Start ``min_replicas`` replicas; fails only if none comes up."""
+        if self._connected:
+            return
+        self._closed = False
+        with self._lock:
+            self._spawning += self.min_replicas
+        with ThreadPoolExecutor(max_workers=self.min_replicas) as pool:
+            started = list(pool.map(lambda _: self._spawn(), range(self.min_replicas)))
+        if not any(started):
+            raise RuntimeError(f"No replica of MCP server '{self.config.name}' could be started")
+
+    def disconnect(self) -> None:
+        with self._lock:
+            self._closed = True
+            replicas, self._replicas = self._replicas, []
+        for replica in replicas:
+            self._disconnect(replica)
+
+    def list_tools(self) -> list[MCPTool]:
+        if not self._connected:
+            self.connect()
+        return self._replicas[0].client.list_tools()
+
+    def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        replica = self._checkout()
+        started = time.monotonic()
+        failed = True
+        try:
+            result = replica.client.call_tool(tool_name, arguments)
+            failed = False
+            return result
+        finally:
+            self._checkin(replica, time.monotonic() - started, failed)
+
+    async def call_tool_async(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        if not self._connected:
+            await asyncio.to_thread(self.connect)
+        replica = self._checkout()
+        started = time.monotonic()
+        failed = True
+        try:
+            call_async = getattr(replica.client, "call_tool_async", None)
+            if inspect.iscoroutinefunction(call_async):
+                result = await call_async(tool_name, arguments)
+            else:
+                result = await asyncio.to_thread(replica.client.call_tool, tool_name, arguments)
+            failed = False
+            return result
+        finally:
+            self._checkin(replica, time.monotonic() - started, failed)
+
+    # === ROUTING ===
+
+    def _checkout(self) -> _Replica:
+        if not self._connected:
+            self.connect()
+        scale_up = False
+        with self._lock:
+            if not self._replicas:
+                raise RuntimeError(f"MCP server '{self.config.name}' has no live replicas")
+            replica = min(self._replicas, key=lambda r: (r.outstanding, r.latency_ewma_s or 0.0))
+            replica.outstanding += 1
+            replica.last_used = time.monotonic()
+            # The least-loaded replica is busy, so all of them are
+            if (
+                replica.outstanding > self.scale_up_queue_depth
+                and len(self._replicas) + self._spawning < self.max_replicas
+            ):
+                self._spawning += 1
+                scale_up = True
+        if scale_up:
+            logger.info("Scaling up MCP server '%s'", self.config.name)
+            threading.Thread(target=self._spawn, args=(True,), daemon=True).start()
+        return replica
+
+    def _checkin(self, replica: _Replica, duration: float, failed: bool) -> None:
+        check = False
+        with self._lock:
+            replica.outstanding -= 1
+            replica.last_used = time.monotonic()
+            replica.record(duration, failed)
+            # Probe after every run of max_consecutive_failures failures
+            if failed and replica.consecutive_errors % self.max_consecutive_failures == 0:
+                check = True
+        if check:
+            threading.Thread(target=self._check_replica, args=(replica,), daemon=True).start()
+        self._retire_idle()
+
+    # === SCALING AND HEALTH ===
+
+    def _spawn(self, scale_up: bool = False) -> bool:
+        """Start one replica (caller already counted it in ``_spawning``)."""
+        client = None
+        try:
+            client = self._client_factory(self.config)
+            client.connect()
+        except Exception:
+            logger.warning(
+                "Failed to start a replica of MCP server '%s'", self.config.name, exc_info=True
+            )
+            client = None
+        with self._lock:
+            self._spawning -= 1
+            if client is not None and not self._closed:
+                self._replicas.append(_Replica(id=next(self._ids), client=client))
+                if scale_up:
+                    self.scale_ups += 1
+                return True
+        if client is not None:
+            # Pool was closed while this replica started
+            self._disconnect(_Replica(id=-1, client=client))
+        return False
+
+    def _retire_idle(self) -> None:
+        now = time.monotonic()
+        retired: list[_Replica] = []
+        with self._lock:
+            for replica in list(self._replicas):
+                if len(self._replicas) <= self.min_replicas:
+                    break
+                if replica.outstanding == 0 and now - replica.last_used > self.idle_timeout_s:
+                    self._replicas.remove(replica)
+                    retired.append(replica)
+            self.scale_downs += len(retired)
+        for replica in retired:
+            logger.info("Retiring idle replica %d of MCP server '%s'", replica.id, self.config.name)
+            self._disconnect(replica)
+
+    def _check_replica(self, replica: _Replica) -> bool:
+        """Probe *replica*; evict and replace it if unhealthy."""
+        try:
+            healthy = self._probe(replica.client)
+        except Exception:
+            healthy = False
+        if healthy:
+            return True
+        with self._lock:
+            if replica not in self._replicas:
+                return False
+            self._replicas.remove(replica)
+            self.evictions += 1
+            replace = not self._closed and len(self._replicas) + self._spawning < self.min_replicas
+            if replace:
+                self._spawning += 1
+        logger.warning(
+            "Evicting unhealthy replica %d of MCP server '%s'", replica.id, self.config.name
+        )
+        self._disconnect(replica)
+        if replace:
+            self._spawn()
+        return False
+
+    def check_health(self) -> bool:
+        """Probe every replica, replacing unhealthy ones; True if any is healthy."""
+        with self._lock:
+            replicas = list(self._replicas)
+        results = [self._check_replica(replica) for replica in replicas]
+        self._retire_idle()
+        return any(results) or bool(self._replicas)
+
+    def _disconnect(self, replica: _Replica) -> None:
+        try:
+            replica.client.disconnect()
+        except Exception:
+            logger.debug(
+                "Error disconnecting replica of MCP server '%s'", self.config.name, exc_info=True
+            )
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "min_replicas": self.min_replicas,
+                "max_replicas": self.max_replicas,
+                "spawning": self._spawning,
+                "scale_ups": self.scale_ups,
+                "scale_downs": self.scale_downs,
+                "evictions": self.evictions,
+                "replicas": [replica.stats() for replica in self._replicas],
+            }
+
+
+def _default_probe(client: Any) -> bool:
+    client.list_tools()
+    return bool(getattr(client, "_connected", True))
@@ -0,0 +1,156 @@
+"""
+MCP Schema Cache - Persists each MCP server's ``tools/list`` result.
+
+Bringing up an MCP server means spawning it (or reaching it over the
+network), initializing a session and listing its tools, which takes
+seconds for some servers.  With a cached tool list the registry can
+register a server's tools immediately and finish the real connection in
+the background.
+
+Entries are keyed by a hash of the resolved ``MCPServerConfig`` (plus the
+modification time of any script it runs, so editing a local server
+invalidates its entry).  Each entry also records the ``serverInfo.version``
+the server reported; once the live connection is up, the registry
+compares version and tools against the entry and re-registers if either
+changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from framework.runner.mcp_client import MCPServerConfig, MCPTool
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout changes
+_FORMAT_VERSION = 1
+
+
+@dataclass
+class CachedServerSchema:
+    """A server's cached tool list."""
+
+    server_version: str | None
+    tools: list[MCPTool]
+
+
+def config_fingerprint(config: MCPServerConfig) -> str:
+    """Stable hash of everything that determines what a server exposes."""
+    data = asdict(config)
+    for key in ("description", "min_replicas", "max_replicas"):
+        data.pop(key, None)
+    # Scripts the server runs (e.g. "coder_tools_server.py"): their mtime
+    # stands in for a version when the server does not report one.
+    base = Path(config.cwd) if config.cwd else Path.cwd()
+    mtimes = {}
+    for arg in [config.command, *config.args]:
+        if not isinstance(arg, str) or not arg.endswith(".py"):
+            continue
+        path = Path(arg) if Path(arg).is_absolute() else base / arg
+        try:
+            mtimes[arg] = path.stat().st_mtime_ns
+        except OSError:
+            continue
+    data["script_mtimes"] = mtimes
+    encoded = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def tools_signature(tools: list[MCPTool]) -> list[tuple[str, str, str, str]]:
+    """Comparable form of a tool list (order-insensitive)."""
+    return sorted(
+        (
+            t.name,
+            t.description or "",
+            json.dumps(t.input_schema, sort_keys=True, default=str),
+            json.dumps(getattr(t, "meta", None), sort_keys=True, default=str),
+        )
+        for t in tools
+    )
+
+
+class MCPSchemaCache:
+    """On-disk cache of MCP ``tools/list`` results, one JSON file per server config.
+
+    Args:
+        cache_dir: Directory holding the entries.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, config: MCPServerConfig) -> Path:
+        return self.cache_dir / f"{config_fingerprint(config)}.json"
+
+    def get(self, config: MCPServerConfig) -> CachedServerSchema | None:
+        """Return the cached tool list for *config*, if any."""
+        path = self._path(config)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Unreadable MCP schema cache entry %s: %s", path, e)
+            return None
+        if data.get("format") != _FORMAT_VERSION or data.get("server") != config.name:
+            return None
+        try:
+            tools = [
+                MCPTool(
+                    name=t["name"],
+                    description=t.get("description", ""),
+                    input_schema=t.get("input_schema", {}),
+                    server_name=config.name,
+                    meta=t.get("meta"),
+                )
+                for t in data["tools"]
+            ]
+        except (KeyError, TypeError) as e:
+            logger.debug("Malformed MCP schema cache entry %s: %s", path, e)
+            return None
+        if not tools:
+            return None
+        return CachedServerSchema(server_version=data.get("server_version"), tools=tools)
+
+    def put(
+        self, config: MCPServerConfig, server_version: str | None, tools: list[MCPTool]
+    ) -> None:
+        """Persist *tools* for *config* (atomically; errors are logged, not raised)."""
+        path = self._path(config)
+        entry: dict[str, Any] = {
+            "format": _FORMAT_VERSION,
+            "server": config.name,
+            "server_version": server_version,
+            "tools": [
+                {
+                    "name": t.name,
+                    "description": t.description,
+                    "input_schema": t.input_schema,
+                    "meta": getattr(t, "meta", None),
+                }
+                for t in tools
+            ],
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".entry.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not persist MCP schema cache entry %s: %s", path, e)
+
+    def invalidate(self, config: MCPServerConfig) -> None:
+        self._path(config).unlink(missing_ok=True)
@@ -9,7 +9,15 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from framework.config import get_hive_config, get_max_context_tokens, get_preferred_model
+from framework.config import (
+    get_hive_config,
+    get_max_context_tokens,
+    get_mcp_schema_cache_dir,
+    get_preferred_model,
+    get_skill_catalog_top_k,
+    get_skill_discovery_cache_dir,
+    get_tool_cache_config,
+)
 from framework.credentials.validation import (
     ensure_credential_key_env as _ensure_credential_key_env,
 )
@@ -23,7 +31,9 @@
 from framework.graph.executor import ExecutionResult
 from framework.graph.node import NodeSpec
 from framework.llm.provider import LLMProvider, Tool
+from framework.runner.mcp_schema_cache import MCPSchemaCache
 from framework.runner.preload_validation import run_preload_validation
+from framework.runner.tool_cache import ToolResultCache
 from framework.runner.tool_registry import ToolRegistry
 from framework.runtime.agent_runtime import AgentRuntime, AgentRuntimeConfig, create_agent_runtime
 from framework.runtime.execution_stream import EntryPointSpec
@@ -1093,6 +1103,21 @@ def __init__(
 
         # Initialize components
         self._tool_registry = ToolRegistry()
+        tool_cache_config = get_tool_cache_config()
+        if tool_cache_config:
+            self._tool_registry.enable_result_cache(
+                ToolResultCache(
+                    max_entries=tool_cache_config.get("max_entries", 512),
+                    disk_dir=(
+                        Path.home() / ".hive" / "tool_cache"
+                        if tool_cache_config.get("disk")
+                        else None
+                    ),
+                )
+            )
+        mcp_schema_cache_dir = get_mcp_schema_cache_dir()
+        if mcp_schema_cache_dir is not None:
+            self._tool_registry.enable_schema_cache(MCPSchemaCache(mcp_schema_cache_dir))
         self._llm: LLMProvider | None = None
         self._approval_callback: Callable | None = None
 
@@ -1736,6 +1761,8 @@ def _setup(self, event_bus=None) -> None:
             ),
             project_root=self.agent_path,
             interactive=self._interactive,
+            discovery_cache_dir=get_skill_discovery_cache_dir(),
+            catalog_top_k=get_skill_catalog_top_k(),
         )
 
         self._setup_agent_runtime(
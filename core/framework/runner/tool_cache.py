@@ -0,0 +1,231 @@
+"""
+Tool Result Cache - Memoizes results of idempotent tools.
+
+Agents often repeat identical read-only lookups (a search, a wiki page, a
+quote) within a session and across sessions.  Tools that declare a
+``cache_ttl`` have their successful results cached under the call's
+canonical fingerprint (the same ``(tool_name, args_json)`` pair the doom
+loop detector uses), so a repeated call is answered without running the
+tool.
+
+Two tiers:
+
+- memory: LRU bounded by entry count and total content size
+- disk (optional): one JSON file per call, shared across processes and
+  sessions; entries found there are promoted back into memory
+
+Error results are never cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from framework.graph.event_loop.stall_detector import fingerprint_tool_call
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str]
+
+
+@dataclass
+class CachedResult:
+    """A cached successful tool result."""
+
+    content: str
+    image_content: list[dict[str, Any]] | None
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+
+def make_cache_key(
+    tool_name: str, tool_input: dict[str, Any], context: dict[str, Any] | None = None
+) -> CacheKey:
+    """Fingerprint a call.  *context* holds injected params that affect the result."""
+    args = {**tool_input, "__context__": context} if context else tool_input
+    return fingerprint_tool_call(tool_name, args)
+
+
+def is_error_payload(result: Any) -> bool:
+    """True for the ``{"error": ...}`` payloads tools return instead of raising."""
+    if isinstance(result, dict):
+        return "error" in result
+    if isinstance(result, str) and result.startswith("{") and '"error"' in result:
+        try:
+            parsed = json.loads(result)
+        except ValueError:
+            return False
+        return isinstance(parsed, dict) and "error" in parsed
+    return False
+
+
+class ToolResultCache:
+    """TTL + LRU cache of tool results with an optional disk tier.
+
+    Args:
+        max_entries: Entries kept in memory.
+        max_bytes: Total content characters kept in memory.
+        disk_dir: Directory for the persistent tier (None = memory only).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        disk_dir: str | Path | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[CacheKey, CachedResult] = OrderedDict()
+        self._bytes = 0
+        # Sync tools run on worker threads
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> CachedResult | None:
+        """Return the live entry for *key*, checking memory then disk."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                self._remove(key)
+
+        entry = self._read_disk(key, now)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self._store(key, entry)
+            self.hits += 1
+            self.disk_hits += 1
+        return entry
+
+    def put(
+        self,
+        key: CacheKey,
+        content: str,
+        ttl: float,
+        image_content: list[dict[str, Any]] | None = None,
+    ) -> None:
+        if ttl <= 0:
+            return
+        entry = CachedResult(
+            content=content, image_content=image_content, expires_at=time.time() + ttl
+        )
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    # === MEMORY TIER (callers hold the lock) ===
+
+    def _store(self, key: CacheKey, entry: CachedResult) -> None:
+        self._remove(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    # === DISK TIER ===
+
+    def _disk_path(self, key: CacheKey) -> Path:
+        assert self.disk_dir is not None
+        digest = hashlib.sha256("\0".join(key).encode("utf-8", "surrogatepass")).hexdigest()
+        return self.disk_dir / f"{digest}.json"
+
+    def _read_disk(self, key: CacheKey, now: float) -> CachedResult | None:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Unreadable tool cache entry %s: %s", path, e)
+            return None
+        if data.get("key") != list(key):
+            return None
+        if data.get("expires_at", 0) <= now:
+            path.unlink(missing_ok=True)
+            return None
+        return CachedResult(
+            content=data.get("content", ""),
+            image_content=data.get("image_content"),
+            expires_at=data["expires_at"],
+        )
+
+    def _write_disk(self, key: CacheKey, entry: CachedResult) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(key)
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.disk_dir, prefix=".entry.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(
+                        {
+                            "key": list(key),
+                            "expires_at": entry.expires_at,
+                            "content": entry.content,
+                            "image_content": entry.image_content,
+                        },
+                        f,
+                    )
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not persist tool cache entry %s: %s", path, e)
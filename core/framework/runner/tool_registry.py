@@ -7,17 +7,28 @@
 import json
 import logging
 import os
+import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from framework.llm.provider import Tool, ToolResult, ToolUse
+from framework.runner.tool_cache import ToolResultCache, is_error_payload, make_cache_key
+
+if TYPE_CHECKING:
+    from framework.runner.mcp_client import MCPClient, MCPServerConfig, MCPTool
+    from framework.runner.mcp_schema_cache import CachedServerSchema, MCPSchemaCache
 
 logger = logging.getLogger(__name__)
 
 _INPUT_LOG_MAX_LEN = 500
 
+# MCP servers brought up at once by load_registry_servers
+_MCP_CONNECT_WORKERS = 8
+
 # Per-execution context overrides.  Each asyncio task (and thus each
 # concurrent graph execution) gets its own copy, so there are no races
 # when multiple ExecutionStreams run in parallel.
@@ -26,12 +37,24 @@
 )
 
 
+def _declared_cache_ttl(meta: dict[str, Any] | None) -> float | None:
+    """Read the ``cache_ttl`` an MCP tool declares in its ``_meta``."""
+    ttl = (meta or {}).get("cache_ttl")
+    if isinstance(ttl, bool) or not isinstance(ttl, int | float) or ttl <= 0:
+        return None
+    return float(ttl)
+
+
 @dataclass
 class RegisteredTool:
     """A tool with its executor function."""
 
     tool: Tool
     executor: Callable[[dict], Any]
+    # Seconds a successful result may be reused (None = never cached)
+    cache_ttl: float | None = None
+    # Injected context params the tool accepts; part of its cache key
+    context_params: frozenset[str] = frozenset()
 
 
 class ToolRegistry:
@@ -66,12 +89,21 @@ def __init__(self):
         self._mcp_cred_snapshot: set[str] = set()  # Credential filenames at MCP load time
         self._mcp_aden_key_snapshot: str | None = None  # ADEN_API_KEY value at MCP load time
         self._mcp_server_tools: dict[str, set[str]] = {}  # server name -> tool names
+        self._result_cache: ToolResultCache | None = None  # opt-in, see enable_result_cache
+        self._schema_cache: MCPSchemaCache | None = None  # opt-in, see enable_schema_cache
+        # Guards MCP bookkeeping; servers are brought up on worker threads
+        self._mcp_lock = threading.RLock()
+        # Bumped on cleanup so late background connections are released
+        self._mcp_generation = 0
+        self._mcp_pending: dict[str, Future] = {}  # server name -> background bring-up
 
     def register(
         self,
         name: str,
         tool: Tool,
         executor: Callable[[dict], Any],
+        cache_ttl: float | None = None,
+        context_params: frozenset[str] = frozenset(),
     ) -> None:
         """
         Register a single tool with its executor.
@@ -80,14 +112,23 @@ def register(
             name: Tool name (must match tool.name)
             tool: Tool definition
             executor: Function that takes tool input dict and returns result
+            cache_ttl: Seconds a successful result may be reused when the
+                result cache is enabled (only for idempotent tools)
+            context_params: Injected context params the tool accepts
         """
-        self._tools[name] = RegisteredTool(tool=tool, executor=executor)
+        self._tools[name] = RegisteredTool(
+            tool=tool,
+            executor=executor,
+            cache_ttl=cache_ttl,
+            context_params=context_params,
+        )
 
     def register_function(
         self,
         func: Callable,
         name: str | None = None,
         description: str | None = None,
+        cache_ttl: float | None = None,
     ) -> None:
         """
         Register a function as a tool, auto-generating the Tool definition.
@@ -96,6 +137,7 @@ def register_function(
             func: Function to register
             name: Tool name (defaults to function name)
             description: Tool description (defaults to docstring)
+            cache_ttl: Seconds a successful result may be reused (see register)
         """
         tool_name = name or func.__name__
         tool_desc = description or func.__doc__ or f"Execute {tool_name}"
@@ -140,7 +182,7 @@ def register_function(
         def executor(inputs: dict) -> Any:
             return func(**inputs)
 
-        self.register(tool_name, tool, executor)
+        self.register(tool_name, tool, executor, cache_ttl=cache_ttl)
 
     def discover_from_module(self, module_path: Path) -> int:
         """
@@ -226,6 +268,7 @@ def executor(inputs: dict) -> Any:
                     obj,
                     name=metadata.get("name", name),
                     description=metadata.get("description"),
+                    cache_ttl=metadata.get("cache_ttl"),
                 )
                 count += 1
 
@@ -235,6 +278,27 @@ def get_tools(self) -> dict[str, Tool]:
         """Get all registered Tool objects."""
         return {name: rt.tool for name, rt in self._tools.items()}
 
+    def enable_result_cache(self, cache: ToolResultCache | None = None) -> ToolResultCache:
+        """Reuse results of tools that declare a ``cache_ttl``.
+
+        Returns the cache in use.  Executors returned by ``get_executor()``
+        before or after this call both consult it.
+        """
+        self._result_cache = cache if cache is not None else ToolResultCache()
+        return self._result_cache
+
+    @property
+    def result_cache(self) -> ToolResultCache | None:
+        return self._result_cache
+
+    def _cache_context(self, registered: RegisteredTool) -> dict[str, Any] | None:
+        """Injected context values that change *registered*'s result."""
+        if not registered.context_params:
+            return None
+        context = dict(self._session_context)
+        context.update(_execution_context.get() or {})
+        return {k: context[k] for k in sorted(registered.context_params) if k in context}
+
     def get_executor(self) -> Callable[[ToolUse], ToolResult]:
         """
         Get unified tool executor function.
@@ -242,6 +306,9 @@ def get_executor(self) -> Callable[[ToolUse], ToolResult]:
         Returns a function that dispatches to the appropriate tool executor.
         Handles both sync and async tool implementations — async results are
         wrapped so that ``EventLoopNode._execute_tool`` can await them.
+        When the result cache is enabled, tools with a ``cache_ttl`` are
+        answered from it (``ToolResult.cached``) and successful results
+        are stored.
         """
 
         def _wrap_result(tool_use_id: str, result: Any) -> ToolResult:
@@ -269,6 +336,28 @@ def executor(tool_use: ToolUse) -> ToolResult:
                 )
 
             registered = self._tools[tool_use.name]
+            cache = self._result_cache if registered.cache_ttl else None
+            cache_key = None
+            if cache is not None:
+                cache_key = make_cache_key(
+                    tool_use.name, tool_use.input, self._cache_context(registered)
+                )
+                hit = cache.get(cache_key)
+                if hit is not None:
+                    return ToolResult(
+                        tool_use_id=tool_use.id,
+                        content=hit.content,
+                        image_content=hit.image_content,
+                        cached=True,
+                    )
+
+            def _remember(raw: Any, wrapped: ToolResult) -> ToolResult:
+                if cache_key is not None and not wrapped.is_error and not is_error_payload(raw):
+                    cache.put(
+                        cache_key, wrapped.content, registered.cache_ttl, wrapped.image_content
+                    )
+                return wrapped
+
             try:
                 result = registered.executor(tool_use.input)
 
@@ -278,7 +367,7 @@ def executor(tool_use: ToolUse) -> ToolResult:
                     async def _await_and_wrap():
                         try:
                             r = await result
-                            return _wrap_result(tool_use.id, r)
+                            return _remember(r, _wrap_result(tool_use.id, r))
                         except Exception as exc:
                             inputs_str = json.dumps(tool_use.input, default=str)
                             if len(inputs_str) > _INPUT_LOG_MAX_LEN:
@@ -299,7 +388,7 @@ async def _await_and_wrap():
 
                     return _await_and_wrap()
 
-                return _wrap_result(tool_use.id, result)
+                return _remember(result, _wrap_result(tool_use.id, result))
             except Exception as e:
                 inputs_str = json.dumps(tool_use.input, default=str)
                 if len(inputs_str) > _INPUT_LOG_MAX_LEN:
@@ -318,6 +407,8 @@ async def _await_and_wrap():
                     is_error=True,
                 )
 
+        # Lets the tool scheduler apply per-MCP-server concurrency limits
+        executor.tool_server = self.get_tool_server  # type: ignore[attr-defined]
         return executor
 
     def get_registered_names(self) -> list[str]:
@@ -328,6 +419,13 @@ def has_tool(self, name: str) -> bool:
         """Check if a tool is registered."""
         return name in self._tools
 
+    def get_tool_server(self, name: str) -> str | None:
+        """Return the MCP server a tool was registered from, or None."""
+        for server_name, tool_names in self._mcp_server_tools.items():
+            if name in tool_names:
+                return server_name
+        return None
+
     def get_server_tool_names(self, server_name: str) -> set[str]:
         """Return tool names registered from a specific MCP server."""
         return set(self._mcp_server_tools.get(server_name, set()))
@@ -519,8 +617,6 @@ def _register_mcp_server_with_retry(
                     name,
                     last_error,
                 )
-                import time
-
                 time.sleep(2)
             else:
                 logger.warning("MCP server '%s' failed after retry: %s", name, last_error)
@@ -533,12 +629,38 @@ def load_registry_servers(
         *,
         log_summary: bool = True,
     ) -> list[dict[str, Any]]:
-        """Register resolved registry-selected MCP servers with retry and status tracking."""
+        """Register resolved registry-selected MCP servers with retry and status tracking.
+
+        Servers are brought up concurrently.  With the schema cache enabled,
+        servers whose tool list is cached register their tools immediately
+        and connect in the background (see :meth:`wait_for_mcp_servers`).
+        """
         results: list[dict[str, Any]] = []
+        outcomes: list[tuple[bool, int, str | None] | None] = [None] * len(server_list)
 
-        for server_config in server_list:
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(_MCP_CONNECT_WORKERS, len(server_list))),
+            thread_name_prefix="mcp-connect",
+        )
+        try:
+            futures: dict[int, Future] = {}
+            for i, server_config in enumerate(server_list):
+                cached_count = self._register_cached_mcp_server(
+                    server_config, pool, log_summary=log_summary
+                )
+                if cached_count:
+                    outcomes[i] = (True, cached_count, None)
+                else:
+                    futures[i] = pool.submit(self._register_mcp_server_with_retry, server_config)
+            for i, future in futures.items():
+                outcomes[i] = future.result()
+        finally:
+            # Background bring-ups keep running; the pool winds down after them
+            pool.shutdown(wait=False)
+
+        for server_config, outcome in zip(server_list, outcomes, strict=True):
             name = server_config.get("name", "unknown")
-            success, tools_loaded, error = self._register_mcp_server_with_retry(server_config)
+            success, tools_loaded, error = outcome
             result = {
                 "server": name,
                 "status": "loaded" if success else "skipped",
@@ -580,126 +702,339 @@ def register_mcp_server(
                 - url: Server URL (for http)
                 - headers: HTTP headers (for http)
                 - description: Server description (optional)
+                - replicas / min_replicas, max_replicas: Server processes the
+                  connection manager keeps (optional, default 1)
             use_connection_manager: When True, reuse a shared client keyed by server name
 
         Returns:
             Number of tools registered from this server
         """
         try:
-            from framework.runner.mcp_client import MCPClient, MCPServerConfig
-            from framework.runner.mcp_connection_manager import MCPConnectionManager
-
-            # Build config object
-            config = MCPServerConfig(
-                name=server_config["name"],
-                transport=server_config["transport"],
-                command=server_config.get("command"),
-                args=server_config.get("args", []),
-                env=server_config.get("env", {}),
-                cwd=server_config.get("cwd"),
-                url=server_config.get("url"),
-                headers=server_config.get("headers", {}),
-                socket_path=server_config.get("socket_path"),
-                description=server_config.get("description", ""),
-            )
+            config = self._build_mcp_server_config(server_config)
+            client = self._connect_mcp_client(config, use_connection_manager)
+            with self._mcp_lock:
+                self._track_mcp_client(client, config, use_connection_manager)
+            tools = client.list_tools()
+            count = self._register_mcp_tools(config.name, tools, client)
+            if self._schema_cache is not None and count > 0:
+                self._schema_cache.put(config, getattr(client, "server_version", None), tools)
 
-            # Create and connect client
-            if use_connection_manager:
-                client = MCPConnectionManager.get_instance().acquire(config)
-            else:
-                client = MCPClient(config)
-                client.connect()
-
-            # Store client for cleanup
-            self._mcp_clients.append(client)
-            client_id = id(client)
-            self._mcp_client_servers[client_id] = config.name
-            if use_connection_manager:
-                self._mcp_managed_clients.add(client_id)
-
-            # Register each tool
-            server_name = server_config["name"]
-            if server_name not in self._mcp_server_tools:
-                self._mcp_server_tools[server_name] = set()
-            count = 0
-            for mcp_tool in client.list_tools():
-                # Convert MCP tool to framework Tool (strips context params from LLM schema)
-                tool = self._convert_mcp_tool_to_framework_tool(mcp_tool)
+            logger.info(f"Registered {count} tools from MCP server '{config.name}'")
+            return count
 
-                # Create executor that calls the MCP server
-                def make_mcp_executor(
-                    client_ref: MCPClient,
-                    tool_name: str,
-                    registry_ref,
-                    tool_params: set[str],
-                ):
-                    def executor(inputs: dict) -> Any:
-                        try:
-                            # Build base context: session < execution (execution wins)
-                            base_context = dict(registry_ref._session_context)
-                            exec_ctx = _execution_context.get()
-                            if exec_ctx:
-                                base_context.update(exec_ctx)
-
-                            # Only inject context params the tool accepts
-                            filtered_context = {
-                                k: v for k, v in base_context.items() if k in tool_params
-                            }
-                            # Strip context params from LLM inputs — the framework
-                            # values are authoritative (prevents the LLM from passing
-                            # e.g. data_dir="/data" and overriding the real path).
-                            clean_inputs = {
-                                k: v
-                                for k, v in inputs.items()
-                                if k not in registry_ref.CONTEXT_PARAMS
-                            }
-                            merged_inputs = {**clean_inputs, **filtered_context}
-                            result = client_ref.call_tool(tool_name, merged_inputs)
-                            # MCP client already extracts content (returns str
-                            # or {"_text": ..., "_images": ...} for image results).
-                            # Handle legacy list format from HTTP transport.
-                            if isinstance(result, list) and len(result) > 0:
-                                if isinstance(result[0], dict) and "text" in result[0]:
-                                    return result[0]["text"]
-                                return result[0]
-                            return result
-                        except Exception as e:
-                            inputs_str = json.dumps(inputs, default=str)
-                            if len(inputs_str) > _INPUT_LOG_MAX_LEN:
-                                inputs_str = inputs_str[:_INPUT_LOG_MAX_LEN] + "...(truncated)"
-                            logger.error(
-                                "MCP tool '%s' execution failed: %s\nInputs: %s",
-                                tool_name,
-                                e,
-                                inputs_str,
-                                exc_info=True,
-                            )
-                            return {"error": str(e)}
+        except Exception as e:
+            logger.error(f"Failed to register MCP server: {e}")
+            if "Connection closed" in str(e) and os.name == "nt":
+                logger.debug(
+                    "On Windows, check that the MCP subprocess starts (e.g. uv in PATH, "
+                    "script path correct). Worker config uses base_dir = mcp_servers.json parent."
+                )
+            return 0
+
+    @staticmethod
+    def _build_mcp_server_config(server_config: dict[str, Any]) -> "MCPServerConfig":
+        from framework.runner.mcp_client import MCPServerConfig
+
+        min_replicas = int(server_config.get("min_replicas", server_config.get("replicas", 1)))
+        return MCPServerConfig(
+            name=server_config["name"],
+            transport=server_config["transport"],
+            command=server_config.get("command"),
+            args=server_config.get("args", []),
+            env=server_config.get("env", {}),
+            cwd=server_config.get("cwd"),
+            url=server_config.get("url"),
+            headers=server_config.get("headers", {}),
+            socket_path=server_config.get("socket_path"),
+            description=server_config.get("description", ""),
+            min_replicas=min_replicas,
+            max_replicas=max(min_replicas, int(server_config.get("max_replicas", min_replicas))),
+        )
+
+    @staticmethod
+    def _connect_mcp_client(config: "MCPServerConfig", use_connection_manager: bool) -> Any:
+        from framework.runner.mcp_client import MCPClient
+        from framework.runner.mcp_connection_manager import MCPConnectionManager
+
+        if use_connection_manager:
+            return MCPConnectionManager.get_instance().acquire(config)
+        client = MCPClient(config)
+        client.connect()
+        return client
+
+    def _track_mcp_client(
+        self, client: Any, config: "MCPServerConfig", use_connection_manager: bool
+    ) -> None:
+        """Remember *client* for cleanup (caller holds ``_mcp_lock``)."""
+        self._mcp_clients.append(client)
+        client_id = id(client)
+        self._mcp_client_servers[client_id] = config.name
+        if use_connection_manager:
+            self._mcp_managed_clients.add(client_id)
+
+    def _register_mcp_tools(
+        self,
+        server_name: str,
+        mcp_tools: list["MCPTool"],
+        client_ref: "MCPClient | Future",
+    ) -> int:
+        """Register *mcp_tools* with executors that call *client_ref*.
+
+        *client_ref* is a connected client, or a future of one while the
+        server is still coming up in the background.
+        """
+
+        def make_mcp_executor(
+            client_ref: Any,
+            tool_name: str,
+            registry_ref,
+            tool_params: set[str],
+        ):
+            def log_failure(inputs: dict, e: Exception) -> dict:
+                inputs_str = json.dumps(inputs, default=str)
+                if len(inputs_str) > _INPUT_LOG_MAX_LEN:
+                    inputs_str = inputs_str[:_INPUT_LOG_MAX_LEN] + "...(truncated)"
+                logger.error(
+                    "MCP tool '%s' execution failed: %s\nInputs: %s",
+                    tool_name,
+                    e,
+                    inputs_str,
+                    exc_info=True,
+                )
+                return {"error": str(e)}
+
+            def unwrap(result: Any) -> Any:
+                # MCP client already extracts content (returns str
+                # or {"_text": ..., "_images": ...} for image results).
+                # Handle legacy list format from HTTP transport.
+                if isinstance(result, list) and len(result) > 0:
+                    if isinstance(result[0], dict) and "text" in result[0]:
+                        return result[0]["text"]
+                    return result[0]
+                return result
 
-                    return executor
+            def async_call(client: Any) -> Callable | None:
+                # Clients with an async API multiplex concurrent calls over
+                # one session, so parallel tool calls overlap on the server.
+                call_async = getattr(client, "call_tool_async", None)
+                return call_async if inspect.iscoroutinefunction(call_async) else None
+
+            async def run_async(call_async: Callable, inputs: dict, merged_inputs: dict) -> Any:
+                try:
+                    return unwrap(await call_async(tool_name, merged_inputs))
+                except Exception as e:
+                    return log_failure(inputs, e)
+
+            async def run_when_connected(inputs: dict, merged_inputs: dict) -> Any:
+                try:
+                    client = await asyncio.wrap_future(client_ref)
+                    call_async = async_call(client)
+                    if call_async is not None:
+                        return unwrap(await call_async(tool_name, merged_inputs))
+                    return unwrap(
+                        await asyncio.to_thread(client.call_tool, tool_name, merged_inputs)
+                    )
+                except Exception as e:
+                    return log_failure(inputs, e)
+
+            def executor(inputs: dict) -> Any:
+                try:
+                    # Build base context: session < execution (execution wins)
+                    base_context = dict(registry_ref._session_context)
+                    exec_ctx = _execution_context.get()
+                    if exec_ctx:
+                        base_context.update(exec_ctx)
+
+                    # Only inject context params the tool accepts
+                    filtered_context = {k: v for k, v in base_context.items() if k in tool_params}
+                    # Strip context params from LLM inputs — the framework
+                    # values are authoritative (prevents the LLM from passing
+                    # e.g. data_dir="/data" and overriding the real path).
+                    clean_inputs = {
+                        k: v for k, v in inputs.items() if k not in registry_ref.CONTEXT_PARAMS
+                    }
+                    merged_inputs = {**clean_inputs, **filtered_context}
+                    client = client_ref
+                    if isinstance(client_ref, Future):
+                        if not client_ref.done():
+                            # Server still coming up in the background
+                            return run_when_connected(inputs, merged_inputs)
+                        client = client_ref.result()
+                    call_async = async_call(client)
+                    if call_async is not None:
+                        return run_async(call_async, inputs, merged_inputs)
+                    return unwrap(client.call_tool(tool_name, merged_inputs))
+                except Exception as e:
+                    return log_failure(inputs, e)
+
+            return executor
 
+        count = 0
+        with self._mcp_lock:
+            server_tools = self._mcp_server_tools.setdefault(server_name, set())
+            for mcp_tool in mcp_tools:
+                # Convert MCP tool to framework Tool (strips context params from LLM schema)
+                tool = self._convert_mcp_tool_to_framework_tool(mcp_tool)
                 tool_params = set(mcp_tool.input_schema.get("properties", {}).keys())
                 self.register(
                     mcp_tool.name,
                     tool,
-                    make_mcp_executor(client, mcp_tool.name, self, tool_params),
+                    make_mcp_executor(client_ref, mcp_tool.name, self, tool_params),
+                    cache_ttl=_declared_cache_ttl(getattr(mcp_tool, "meta", None)),
+                    context_params=frozenset(tool_params & self.CONTEXT_PARAMS),
                 )
                 self._mcp_tool_names.add(mcp_tool.name)
-                self._mcp_server_tools[server_name].add(mcp_tool.name)
+                server_tools.add(mcp_tool.name)
                 count += 1
+        return count
 
-            logger.info(f"Registered {count} tools from MCP server '{config.name}'")
-            return count
+    # ------------------------------------------------------------------
+    # Cached MCP bring-up
+    # ------------------------------------------------------------------
+
+    def enable_schema_cache(self, cache: "MCPSchemaCache") -> None:
+        """Persist MCP tool lists and use them to register servers before they connect."""
+        self._schema_cache = cache
+
+    @property
+    def schema_cache(self) -> "MCPSchemaCache | None":
+        return self._schema_cache
+
+    def _register_cached_mcp_server(
+        self,
+        server_config: dict[str, Any],
+        pool: ThreadPoolExecutor,
+        log_summary: bool = True,
+    ) -> int:
+        """Register a server's tools from the schema cache; connect it on *pool*.
 
+        Returns the number of tools registered, or 0 on a cache miss.  If
+        the server then fails to connect, its tools are unregistered again.
+        """
+        if self._schema_cache is None:
+            return 0
+        try:
+            config = self._build_mcp_server_config(server_config)
+            cached = self._schema_cache.get(config)
         except Exception as e:
-            logger.error(f"Failed to register MCP server: {e}")
-            if "Connection closed" in str(e) and os.name == "nt":
-                logger.debug(
-                    "On Windows, check that the MCP subprocess starts (e.g. uv in PATH, "
-                    "script path correct). Worker config uses base_dir = mcp_servers.json parent."
-                )
+            logger.debug("MCP schema cache lookup failed for %s: %s", server_config, e)
+            return 0
+        if cached is None:
             return 0
 
+        with self._mcp_lock:
+            generation = self._mcp_generation
+            future = pool.submit(
+                self._bring_up_cached_mcp_server, config, cached, generation, log_summary
+            )
+            self._mcp_pending[config.name] = future
+        count = self._register_mcp_tools(config.name, cached.tools, future)
+        logger.info(
+            "Registered %d cached tools from MCP server '%s'; connecting in the background",
+            count,
+            config.name,
+        )
+        return count
+
+    def _bring_up_cached_mcp_server(
+        self,
+        config: "MCPServerConfig",
+        cached: "CachedServerSchema",
+        generation: int,
+        log_summary: bool = True,
+    ) -> Any:
+        """Connect a server registered from the cache and reconcile its tools."""
+        from framework.runner.mcp_schema_cache import tools_signature
+
+        stale = False
+        try:
+            client = None
+            for attempt in range(2):
+                try:
+                    client = self._connect_mcp_client(config, use_connection_manager=True)
+                    break
+                except Exception as exc:
+                    if attempt == 1:
+                        raise
+                    logger.warning(
+                        "MCP server '%s' failed to connect, retrying in 2s: %s", config.name, exc
+                    )
+                    time.sleep(2)
+
+            with self._mcp_lock:
+                stale = generation != self._mcp_generation
+                if not stale:
+                    self._track_mcp_client(client, config, use_connection_manager=True)
+            if stale:
+                # The registry was cleaned up while this server connected
+                self._release_mcp_client(client, config.name, managed=True)
+                raise RuntimeError(f"MCP server '{config.name}' is no longer registered")
+
+            tools = client.list_tools()
+            version = getattr(client, "server_version", None)
+            if version != cached.server_version or tools_signature(tools) != tools_signature(
+                cached.tools
+            ):
+                logger.info("MCP server '%s' tools changed; re-registering", config.name)
+                self._reregister_mcp_tools(config.name, tools, client)
+                self._schema_cache.put(config, version, tools)
+            return client
+        except Exception as exc:
+            if self._schema_cache is not None:
+                self._schema_cache.invalidate(config)
+            if stale:
+                raise
+            # Drop the cached tools so the server is skipped, as if it had
+            # failed to register synchronously
+            with self._mcp_lock:
+                if generation == self._mcp_generation:
+                    self._unregister_mcp_server_tools(config.name)
+            logger.warning(
+                "MCP server '%s' failed after retry: %s", config.name, exc, exc_info=True
+            )
+            if log_summary:
+                logger.info(
+                    "MCP registry server resolution",
+                    extra={
+                        "event": "mcp_registry_server_resolution",
+                        "server": config.name,
+                        "status": "skipped",
+                        "tools_loaded": 0,
+                        "skipped_reason": str(exc) or "unknown error",
+                    },
+                )
+            raise
+        finally:
+            with self._mcp_lock:
+                self._mcp_pending.pop(config.name, None)
+
+    def _reregister_mcp_tools(
+        self, server_name: str, mcp_tools: list["MCPTool"], client: Any
+    ) -> None:
+        """Replace a server's registered tools with *mcp_tools*."""
+        with self._mcp_lock:
+            self._unregister_mcp_server_tools(server_name, keep={t.name for t in mcp_tools})
+            self._register_mcp_tools(server_name, mcp_tools, client)
+
+    def _unregister_mcp_server_tools(self, server_name: str, keep: set[str] | None = None) -> None:
+        """Remove a server's tools, except *keep* (caller holds ``_mcp_lock``)."""
+        gone = self._mcp_server_tools.pop(server_name, set()) - (keep or set())
+        # Swap in a new dict: other threads may be iterating the old one
+        tools = dict(self._tools)
+        for name in gone:
+            tools.pop(name, None)
+            self._mcp_tool_names.discard(name)
+        self._tools = tools
+
+    def wait_for_mcp_servers(self, timeout: float | None = None) -> bool:
+        """Block until background MCP bring-ups finish; False on timeout."""
+        from concurrent.futures import wait
+
+        with self._mcp_lock:
+            pending = list(self._mcp_pending.values())
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
     def _convert_mcp_tool_to_framework_tool(self, mcp_tool: Any) -> Tool:
         """
         Convert an MCP tool to a framework Tool.
@@ -845,24 +1180,39 @@ def cleanup(self) -> None:
 
     def _cleanup_mcp_clients(self, context: str = "") -> None:
         """Disconnect or release all tracked MCP clients for this registry."""
+        with self._mcp_lock:
+            # Servers still connecting release themselves when they finish
+            self._mcp_generation += 1
+            clients = [
+                (
+                    client,
+                    self._mcp_client_servers.get(id(client), client.config.name),
+                    id(client) in self._mcp_managed_clients,
+                )
+                for client in self._mcp_clients
+            ]
+            self._mcp_clients.clear()
+            self._mcp_client_servers.clear()
+            self._mcp_managed_clients.clear()
+
+        for client, server_name, managed in clients:
+            self._release_mcp_client(client, server_name, managed, context)
+
+    @staticmethod
+    def _release_mcp_client(
+        client: Any, server_name: str, managed: bool, context: str = ""
+    ) -> None:
         if context:
             context = f" {context}"
+        try:
+            if managed:
+                from framework.runner.mcp_connection_manager import MCPConnectionManager
 
-        for client in self._mcp_clients:
-            client_id = id(client)
-            server_name = self._mcp_client_servers.get(client_id, client.config.name)
-            try:
-                if client_id in self._mcp_managed_clients:
-                    from framework.runner.mcp_connection_manager import MCPConnectionManager
-
-                    MCPConnectionManager.get_instance().release(server_name)
-                else:
-                    client.disconnect()
-            except Exception as e:
-                logger.warning(f"Error disconnecting MCP client{context}: {e}")
-        self._mcp_clients.clear()
-        self._mcp_client_servers.clear()
-        self._mcp_managed_clients.clear()
+                MCPConnectionManager.get_instance().release(server_name)
+            else:
+                client.disconnect()
+        except Exception as e:
+            logger.warning(f"Error disconnecting MCP client{context}: {e}")
 
     def __del__(self):
         """Destructor to ensure cleanup."""
@@ -872,10 +1222,15 @@ def __del__(self):
 def tool(
     description: str | None = None,
     name: str | None = None,
+    cache_ttl: float | None = None,
 ) -> Callable:
     """
     Decorator to mark a function as a tool.
 
+    ``cache_ttl`` marks the tool idempotent: with the registry's result
+    cache enabled, identical calls within that many seconds reuse the
+    previous result.
+
     Usage:
         @tool(description="Fetch lead from GTM table")
         def gtm_fetch_lead(lead_id: str) -> dict:
@@ -886,6 +1241,7 @@ def decorator(func: Callable) -> Callable:
         func._tool_metadata = {
             "name": name or func.__name__,
             "description": description or func.__doc__,
+            "cache_ttl": cache_ttl,
         }
         return func
 
@@ -23,7 +23,7 @@
 from framework.runtime.runtime_log_store import RuntimeLogStore
 from framework.runtime.shared_state import SharedStateManager
 from framework.storage.concurrent import ConcurrentStorage
-from framework.storage.session_store import SessionStore
+from framework.storage.session_store import open_session_store
 
 if TYPE_CHECKING:
     from framework.graph.edge import GraphSpec
@@ -49,6 +49,9 @@ class AgentRuntimeConfig:
     webhook_port: int = 8080
     webhook_routes: list[dict] = field(default_factory=list)
     # Each dict: {"source_id": str, "path": str, "methods": ["POST"], "secret": str|None}
+    # Session state backend: "file" (state.json per session) or "sqlite"
+    # (indexed sessions.db). None defers to $HIVE_SESSION_STORE / existing layout.
+    session_store_backend: str | None = None
 
 
 @dataclass
@@ -220,7 +223,9 @@ def __init__(
         )
 
         # Initialize SessionStore for unified sessions (always enabled)
-        self._session_store = SessionStore(storage_path_obj)
+        self._session_store = open_session_store(
+            storage_path_obj, self._config.session_store_backend
+        )
 
         # Initialize shared components
         self._state_manager = SharedStateManager()
@@ -346,6 +351,7 @@ async def start(self) -> None:
                     accounts_data=self._accounts_data,
                     tool_provider_map=self._tool_provider_map,
                     skills_catalog_prompt=self.skills_catalog_prompt,
+                    skills_catalog_provider=self._skills_manager.catalog_provider,
                     protocols_prompt=self.protocols_prompt,
                     skill_dirs=self.skill_dirs,
                 )
@@ -955,7 +961,7 @@ async def add_graph(
         # Secondary graphs get their own SessionStore AND RuntimeLogStore
         # so their sessions and logs don't pollute the worker's directories.
         graph_base = self._session_store.base_path / subpath
-        graph_session_store = SessionStore(graph_base)
+        graph_session_store = open_session_store(graph_base, self._config.session_store_backend)
         graph_log_store = RuntimeLogStore(graph_base / "runtime_logs")
 
         # Create streams for each entry point
@@ -983,6 +989,7 @@ async def add_graph(
                 accounts_data=self._accounts_data,
                 tool_provider_map=self._tool_provider_map,
                 skills_catalog_prompt=self.skills_catalog_prompt,
+                skills_catalog_provider=self._skills_manager.catalog_provider,
                 protocols_prompt=self.protocols_prompt,
                 skill_dirs=self.skill_dirs,
             )
@@ -1265,9 +1272,10 @@ async def _teardown_graph(self, graph_id: str) -> None:
         for sub_id in reg.event_subscriptions:
             self._event_bus.unsubscribe(sub_id)
 
-        # Stop streams
+        # Stop streams and release their shared state
         for stream in reg.streams.values():
             await stream.stop()
+            self._state_manager.cleanup_stream(stream.stream_id)
 
         # Reset active graph if it was the removed one
         if self._active_graph_id == graph_id:
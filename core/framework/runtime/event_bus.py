@@ -8,15 +8,20 @@
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
 import os
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
 from pathlib import Path
-from typing import IO, Any
+from typing import Any
+
+from framework.runtime.event_log_writer import BatchedLogWriter
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +33,8 @@
 #   HIVE_DEBUG_EVENTS=/tmp/ev    → writes to that exact directory
 #
 # Each line is a full JSON serialisation of the AgentEvent.
-# The file is opened lazily on first publish and flushed after every write.
+# The file is opened lazily on first publish and written by a background
+# BatchedLogWriter (see event_log_writer.py for flush/fsync semantics).
 # ---------------------------------------------------------------------------
 _DEBUG_EVENTS_RAW = os.environ.get("HIVE_DEBUG_EVENTS", "").strip()
 _DEBUG_EVENTS_ENABLED = _DEBUG_EVENTS_RAW.lower() in ("1", "true", "full") or (
@@ -36,7 +42,7 @@
 )
 
 
-def _open_event_log() -> IO[str] | None:
+def _open_event_log() -> BatchedLogWriter | None:
     """Open a JSONL event log file.  Returns None if disabled."""
     if not _DEBUG_EVENTS_ENABLED:
         return None
@@ -49,10 +55,10 @@ def _open_event_log() -> IO[str] | None:
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     path = log_dir / f"{ts}.jsonl"
     logger.info("Event debug log → %s", path)
-    return open(path, "a", encoding="utf-8")  # noqa: SIM115
+    return BatchedLogWriter(path)
 
 
-_event_log_file: IO[str] | None = None
+_event_log_file: BatchedLogWriter | None = None
 _event_log_ready = False  # lazy init guard
 
 
@@ -93,6 +99,7 @@ class EventType(StrEnum):
     # Tool lifecycle
     TOOL_CALL_STARTED = "tool_call_started"
     TOOL_CALL_COMPLETED = "tool_call_completed"
+    TOOL_QUEUE_METRICS = "tool_queue_metrics"
 
     # Client I/O (client_facing=True nodes only)
     CLIENT_OUTPUT_DELTA = "client_output_delta"
@@ -176,6 +183,7 @@ class AgentEvent:
     correlation_id: str | None = None  # For tracking related events
     graph_id: str | None = None  # Which graph emitted this event (multi-graph sessions)
     run_id: str | None = None  # Unique ID per trigger() invocation — used for run dividers
+    seq: int | None = None  # Bus-assigned publish sequence number (see EventBus.events_since)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -209,6 +217,7 @@ class Subscription:
     filter_node: str | None = None  # Only receive events from this node
     filter_execution: str | None = None  # Only receive events from this execution
     filter_graph: str | None = None  # Only receive events from this graph
+    seq: int = 0  # Registration order, preserved when merging index buckets
 
 
 class EventBus:
@@ -219,7 +228,16 @@ class EventBus:
     - Async event handling
     - Type-based subscriptions
     - Stream/execution filtering
-    - Event history for debugging
+    - Event history (bounded ring buffer) with sequence-based replay
+
+    Subscriptions are indexed by (event type, stream filter), so publishing
+    only visits subscriptions that can match the event's type and stream
+    instead of scanning every subscription on each streaming token.
+
+    Every published event is stamped with a monotonically increasing
+    ``seq``.  History is a fixed-size ring buffer with per-type and
+    per-execution indices that are trimmed in step with it, so appends are
+    O(1) and ``get_history``/``events_since`` never copy the whole buffer.
 
     Example:
         bus = EventBus()
@@ -255,13 +273,18 @@ def __init__(
             max_concurrent_handlers: Maximum concurrent handler executions
         """
         self._subscriptions: dict[str, Subscription] = {}
-        self._event_history: list[AgentEvent] = []
+        # Dispatch index: (event_type, filter_stream or None) → {sub_id: Subscription}
+        self._dispatch_index: dict[tuple[EventType, str | None], dict[str, Subscription]] = {}
+        # History ring buffer; seqs in it are contiguous, ending at self._last_seq
+        self._event_history: deque[AgentEvent] = deque()
+        self._history_by_type: dict[EventType, deque[AgentEvent]] = {}
+        self._history_by_execution: dict[str, deque[AgentEvent]] = {}
         self._max_history = max_history
+        self._last_seq = 0
         self._semaphore = asyncio.Semaphore(max_concurrent_handlers)
         self._subscription_counter = 0
-        self._lock = asyncio.Lock()
         # Per-session persistent event log (always-on, survives restarts)
-        self._session_log: IO[str] | None = None
+        self._session_log: BatchedLogWriter | None = None
         self._session_log_iteration_offset: int = 0
         # Accumulator for client_output_delta snapshots — flushed on llm_turn_complete.
         # Key: (stream_id, node_id, execution_id, iteration, inner_turn) → latest AgentEvent
@@ -277,19 +300,28 @@ def set_session_log(self, path: Path, *, iteration_offset: int = 0) -> None:
         events so that cold-resumed sessions produce monotonically increasing
         iteration values — preventing frontend message ID collisions between
         the original run and resumed runs.
+
+        Lines are written by a background ``BatchedLogWriter`` so slow disks
+        never stall ``publish()``; call ``flush_session_log()`` to wait for
+        pending lines to reach the file.
         """
         if self._session_log is not None:
             try:
                 self._session_log.close()
             except Exception:
                 pass
-        path.parent.mkdir(parents=True, exist_ok=True)
-        self._session_log = open(path, "a", encoding="utf-8")  # noqa: SIM115
+        self._session_log = BatchedLogWriter(path)
         self._session_log_iteration_offset = iteration_offset
         logger.info("Session event log → %s (iteration_offset=%d)", path, iteration_offset)
 
+    def flush_session_log(self, timeout: float | None = 5.0) -> bool:
+        """Block until queued session-log lines are written.  Returns False on timeout."""
+        if self._session_log is None:
+            return True
+        return self._session_log.flush(timeout)
+
     def close_session_log(self) -> None:
-        """Close the per-session event log file."""
+        """Close the per-session event log file, writing everything still queued."""
         # Flush any pending output snapshots before closing
         self._flush_pending_snapshots()
         if self._session_log is not None:
@@ -343,9 +375,9 @@ def _write_session_log_event(self, event: AgentEvent) -> None:
                 execution_id=event.execution_id,
             )
 
-        line = json.dumps(event.to_dict(), default=str)
-        self._session_log.write(line + "\n")
-        self._session_log.flush()
+        # Serialise now so the log reflects the event as published; the
+        # writer thread only does the I/O.
+        self._session_log.write(json.dumps(event.to_dict(), default=str))
 
     def _flush_pending_snapshots(
         self,
@@ -372,14 +404,7 @@ def _flush_pending_snapshots(
         for key in to_flush:
             evt = self._pending_output_snapshots.pop(key)
             try:
-                line = json.dumps(evt.to_dict(), default=str)
-                self._session_log.write(line + "\n")
-            except Exception:
-                pass
-
-        if to_flush:
-            try:
-                self._session_log.flush()
+                self._session_log.write(json.dumps(evt.to_dict(), default=str))
             except Exception:
                 pass
 
@@ -417,9 +442,13 @@ def subscribe(
             filter_node=filter_node,
             filter_execution=filter_execution,
             filter_graph=filter_graph,
+            seq=self._subscription_counter,
         )
 
         self._subscriptions[sub_id] = subscription
+        for event_type in subscription.event_types:
+            key = (event_type, filter_stream or None)
+            self._dispatch_index.setdefault(key, {})[sub_id] = subscription
         logger.debug(f"Subscription {sub_id} registered for {event_types}")
 
         return sub_id
@@ -435,7 +464,14 @@ def unsubscribe(self, subscription_id: str) -> bool:
             True if subscription was found and removed
         """
         if subscription_id in self._subscriptions:
-            del self._subscriptions[subscription_id]
+            subscription = self._subscriptions.pop(subscription_id)
+            for event_type in subscription.event_types:
+                key = (event_type, subscription.filter_stream or None)
+                bucket = self._dispatch_index.get(key)
+                if bucket is not None:
+                    bucket.pop(subscription_id, None)
+                    if not bucket:
+                        del self._dispatch_index[key]
             logger.debug(f"Subscription {subscription_id} removed")
             return True
         return False
@@ -461,10 +497,7 @@ async def publish(self, event: AgentEvent) -> None:
             event.data = {**event.data, "iteration": event.data["iteration"] + offset}
 
         # Add to history
-        async with self._lock:
-            self._event_history.append(event)
-            if len(self._event_history) > self._max_history:
-                self._event_history = self._event_history[-self._max_history :]
+        self._record_history(event)
 
         # Write event to JSONL file (gated by HIVE_DEBUG_EVENTS env var)
         if _DEBUG_EVENTS_ENABLED:
@@ -474,9 +507,7 @@ async def publish(self, event: AgentEvent) -> None:
                 _event_log_ready = True
             if _event_log_file is not None:
                 try:
-                    line = json.dumps(event.to_dict(), default=str)
-                    _event_log_file.write(line + "\n")
-                    _event_log_file.flush()
+                    _event_log_file.write(json.dumps(event.to_dict(), default=str))
                 except Exception:
                     pass  # never break event delivery
 
@@ -490,16 +521,55 @@ async def publish(self, event: AgentEvent) -> None:
                 pass  # never break event delivery
 
         # Find matching subscriptions
-        matching_handlers: list[EventHandler] = []
-
-        for subscription in self._subscriptions.values():
-            if self._matches(subscription, event):
-                matching_handlers.append(subscription.handler)
+        matching_handlers = [
+            subscription.handler
+            for subscription in self._candidate_subscriptions(event)
+            if self._matches(subscription, event)
+        ]
 
         # Execute handlers concurrently
         if matching_handlers:
             await self._execute_handlers(event, matching_handlers)
 
+    def _record_history(self, event: AgentEvent) -> None:
+        """Stamp ``event.seq`` and append it to the history ring buffer and indices."""
+        self._last_seq += 1
+        event.seq = self._last_seq
+        if self._max_history <= 0:
+            return
+
+        if len(self._event_history) >= self._max_history:
+            evicted = self._event_history.popleft()
+            # Index deques are in publish order, so the evicted event is at their head
+            self._evict_from_index(self._history_by_type, evicted.type)
+            if evicted.execution_id:
+                self._evict_from_index(self._history_by_execution, evicted.execution_id)
+
+        self._event_history.append(event)
+        self._history_by_type.setdefault(event.type, deque()).append(event)
+        if event.execution_id:
+            self._history_by_execution.setdefault(event.execution_id, deque()).append(event)
+
+    @staticmethod
+    def _evict_from_index(index: dict[Any, deque[AgentEvent]], key: Any) -> None:
+        bucket = index.get(key)
+        if bucket:
+            bucket.popleft()
+            if not bucket:
+                del index[key]
+
+    def _candidate_subscriptions(self, event: AgentEvent) -> list[Subscription]:
+        """Subscriptions indexed under the event's type and stream, in registration order."""
+        wildcard = self._dispatch_index.get((event.type, None))
+        scoped = (
+            self._dispatch_index.get((event.type, event.stream_id)) if event.stream_id else None
+        )
+        if not scoped:
+            return list(wildcard.values()) if wildcard else []
+        if not wildcard:
+            return list(scoped.values())
+        return list(heapq.merge(wildcard.values(), scoped.values(), key=lambda sub: sub.seq))
+
     def _matches(self, subscription: Subscription, event: AgentEvent) -> bool:
         """Check if a subscription matches an event."""
         # Check event type
@@ -792,16 +862,22 @@ async def emit_llm_turn_complete(
         input_tokens: int,
         output_tokens: int,
         cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
         execution_id: str | None = None,
         iteration: int | None = None,
     ) -> None:
-        """Emit LLM turn completion with stop reason and model metadata."""
+        """Emit LLM turn completion with stop reason, model and token metadata.
+
+        ``cached_tokens`` counts input tokens read from the provider's prompt
+        cache and ``cache_write_tokens`` those written to it this turn.
+        """
         data: dict = {
             "stop_reason": stop_reason,
             "model": model,
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
             "cached_tokens": cached_tokens,
+            "cache_write_tokens": cache_write_tokens,
         }
         if iteration is not None:
             data["iteration"] = iteration
@@ -850,8 +926,9 @@ async def emit_tool_call_completed(
         result: str = "",
         is_error: bool = False,
         execution_id: str | None = None,
+        cached: bool = False,
     ) -> None:
-        """Emit tool call completed event."""
+        """Emit tool call completed event.  ``cached`` marks a result cache hit."""
         await self.publish(
             AgentEvent(
                 type=EventType.TOOL_CALL_COMPLETED,
@@ -863,6 +940,35 @@ async def emit_tool_call_completed(
                     "tool_name": tool_name,
                     "result": result,
                     "is_error": is_error,
+                    "cached": cached,
+                },
+            )
+        )
+
+    async def emit_tool_queue_metrics(
+        self,
+        stream_id: str,
+        node_id: str,
+        batch_size: int,
+        mean_wait_s: float,
+        max_wait_s: float,
+        max_queue_depth: int,
+        scheduler: dict[str, Any] | None = None,
+        execution_id: str | None = None,
+    ) -> None:
+        """Emit tool scheduling metrics for one batch of parallel tool calls."""
+        await self.publish(
+            AgentEvent(
+                type=EventType.TOOL_QUEUE_METRICS,
+                stream_id=stream_id,
+                node_id=node_id,
+                execution_id=execution_id,
+                data={
+                    "batch_size": batch_size,
+                    "mean_wait_s": mean_wait_s,
+                    "max_wait_s": max_wait_s,
+                    "max_queue_depth": max_queue_depth,
+                    "scheduler": scheduler or {},
                 },
             )
         )
@@ -1263,28 +1369,99 @@ def get_history(
         Returns:
             List of matching events (most recent first)
         """
-        events = self._event_history[::-1]  # Reverse for most recent first
-
-        # Apply filters
+        # Scan the smallest applicable index, newest first, stopping at limit
+        source: deque[AgentEvent] = self._event_history
         if event_type:
-            events = [e for e in events if e.type == event_type]
-        if stream_id:
-            events = [e for e in events if e.stream_id == stream_id]
+            source = self._history_by_type.get(event_type, deque())
         if execution_id:
-            events = [e for e in events if e.execution_id == execution_id]
+            by_execution = self._history_by_execution.get(execution_id, deque())
+            if len(by_execution) < len(source):
+                source = by_execution
+
+        events: list[AgentEvent] = []
+        if limit <= 0:
+            return events
+        for event in reversed(source):
+            if event_type and event.type != event_type:
+                continue
+            if stream_id and event.stream_id != stream_id:
+                continue
+            if execution_id and event.execution_id != execution_id:
+                continue
+            events.append(event)
+            if len(events) >= limit:
+                break
+        return events
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recently published event (0 if none)."""
+        return self._last_seq
+
+    def events_since(
+        self,
+        seq: int,
+        event_types: set[EventType] | None = None,
+        limit: int | None = None,
+    ) -> list[AgentEvent]:
+        """
+        Get buffered events published after sequence number ``seq``.
+
+        Used to resume a consumer (e.g. an SSE client reconnecting with its
+        last seen ``seq``) without rescanning the whole history.  Events that
+        have already been evicted from the ring buffer are not returned;
+        compare ``seq`` with :attr:`oldest_seq` to detect a gap.
 
-        return events[:limit]
+        Args:
+            seq: Last sequence number the caller has seen (0 for everything)
+            event_types: Only return events of these types
+            limit: Maximum events to return (the oldest ones after ``seq``)
+
+        Returns:
+            Matching events in publish order (oldest first)
+        """
+        if not self._event_history or seq >= self._last_seq:
+            return []
+
+        first_seq = self._last_seq - len(self._event_history) + 1
+        start = max(0, seq + 1 - first_seq)
+        # Seqs are contiguous, so the start is found by offset; walk from the
+        # nearer end of the deque.
+        if start > len(self._event_history) // 2:
+            tail = list(
+                itertools.islice(reversed(self._event_history), len(self._event_history) - start)
+            )
+            tail.reverse()
+            candidates = iter(tail)
+        else:
+            candidates = itertools.islice(self._event_history, start, None)
+
+        events: list[AgentEvent] = []
+        for event in candidates:
+            if event_types is not None and event.type not in event_types:
+                continue
+            events.append(event)
+            if limit is not None and len(events) >= limit:
+                break
+        return events
+
+    @property
+    def oldest_seq(self) -> int | None:
+        """Sequence number of the oldest event still in history, or None if empty."""
+        if not self._event_history:
+            return None
+        return self._last_seq - len(self._event_history) + 1
 
     def get_stats(self) -> dict:
         """Get event bus statistics."""
-        type_counts = {}
-        for event in self._event_history:
-            type_counts[event.type.value] = type_counts.get(event.type.value, 0) + 1
-
         return {
             "total_events": len(self._event_history),
             "subscriptions": len(self._subscriptions),
-            "events_by_type": type_counts,
+            "events_by_type": {
+                event_type.value: len(events)
+                for event_type, events in self._history_by_type.items()
+            },
+            "last_seq": self._last_seq,
         }
 
     # === WAITING OPERATIONS ===
@@ -0,0 +1,217 @@
+"""Batched, background JSONL writer for event logs.
+
+``EventBus`` persists events (the per-session ``events.jsonl`` and the
+``HIVE_DEBUG_EVENTS`` log) from inside ``publish()``, which runs on the
+event loop between streamed tokens.  ``BatchedLogWriter`` moves the file
+I/O onto a dedicated thread: callers enqueue already-serialised lines and
+return immediately, and the thread group-commits them — one ``write`` +
+``flush`` (and optionally ``fsync``) per batch of up to ``max_batch``
+lines or ``flush_interval`` seconds, whichever comes first.
+
+Crash-safety semantics:
+
+- Lines are written in enqueue order, and each batch is written as a
+  single string ending in a newline, so a crash can at worst leave one
+  torn final line.  All readers of these logs skip unparseable lines.
+- Lines still queued in memory when the *process* dies are lost (at most
+  ``flush_interval`` seconds of events).  ``close()`` and ``flush()``
+  block until every line enqueued before the call has been written, and
+  open writers are closed at interpreter exit.
+- Durability against power loss is governed by the fsync policy:
+  ``"none"`` (OS page cache only — same as the previous per-event
+  ``flush()``), ``"batch"`` (fsync after every group commit) or
+  ``"close"`` (fsync once when the writer is closed).  The default comes
+  from ``HIVE_EVENT_LOG_FSYNC``.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("none", "batch", "close")
+EVENT_LOG_FSYNC_ENV = "HIVE_EVENT_LOG_FSYNC"
+
+_CLOSE = object()  # queue sentinel: drain, then stop the writer thread
+
+_open_writers: "weakref.WeakSet[BatchedLogWriter]" = weakref.WeakSet()
+
+
+def default_fsync_policy() -> str:
+    """Fsync policy from ``HIVE_EVENT_LOG_FSYNC`` (falls back to ``"none"``)."""
+    policy = os.environ.get(EVENT_LOG_FSYNC_ENV, "").strip().lower()
+    if policy in FSYNC_POLICIES:
+        return policy
+    if policy:
+        logger.warning("Unknown %s=%r, using 'none'", EVENT_LOG_FSYNC_ENV, policy)
+    return "none"
+
+
+class BatchedLogWriter:
+    """
+    Append lines to a file from a background thread with group commit.
+
+    Example:
+        writer = BatchedLogWriter(path)
+        writer.write(json.dumps(record))
+        ...
+        writer.close()  # drains everything queued so far
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        flush_interval: float = 0.05,
+        max_batch: int = 256,
+        fsync: str | None = None,
+    ):
+        """
+        Open ``path`` for appending and start the writer thread.
+
+        Args:
+            path: JSONL file to append to (parent directories are created)
+            flush_interval: Max seconds a line waits before its batch is written
+            max_batch: Max lines per group commit
+            fsync: One of ``FSYNC_POLICIES``; defaults to ``HIVE_EVENT_LOG_FSYNC``
+
+        Raises:
+            ValueError: If ``fsync`` is not a known policy
+            OSError: If the file cannot be opened
+        """
+        fsync = fsync or default_fsync_policy()
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy {fsync!r}; expected one of {FSYNC_POLICIES}")
+
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.max_batch = max(1, max_batch)
+        self.fsync = fsync
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self.batches_written = 0
+        self.lines_written = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"event-log-writer:{self.path.name}", daemon=True
+        )
+        self._thread.start()
+        _open_writers.add(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, line: str) -> None:
+        """Enqueue one line (without trailing newline).  Never blocks on I/O."""
+        if self._closed:
+            return
+        self._queue.put(line)
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """
+        Block until every line enqueued before this call has been written.
+
+        Returns:
+            True if the writer caught up within ``timeout``
+        """
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Drain the queue, apply the fsync policy and close the file."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Event log writer for %s did not drain within %ss", self.path, timeout)
+        _open_writers.discard(self)
+
+    # --- writer thread -------------------------------------------------
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            lines: list[str] = []
+            waiters: list[threading.Event] = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _CLOSE:
+                    stopping = True
+                    break
+                if isinstance(item, threading.Event):
+                    # Flush request: commit what we have now
+                    waiters.append(item)
+                    break
+                lines.append(item)
+                if len(lines) >= self.max_batch:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if lines:
+                self._commit(lines)
+            for waiter in waiters:
+                waiter.set()
+
+        # Drain anything enqueued after the close sentinel raced in
+        leftover: list[str] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is not _CLOSE:
+                leftover.append(item)
+        if leftover:
+            self._commit(leftover)
+
+        try:
+            if self.fsync == "close":
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            self._file.close()
+        except Exception:
+            logger.debug("Failed to close event log %s", self.path, exc_info=True)
+
+    def _commit(self, lines: list[str]) -> None:
+        try:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            if self.fsync == "batch":
+                os.fsync(self._file.fileno())
+            self.batches_written += 1
+            self.lines_written += len(lines)
+        except Exception:
+            # Never let a disk error take down the writer; the lines are lost
+            logger.warning("Failed to write %d lines to %s", len(lines), self.path, exc_info=True)
+
+
+@atexit.register
+def _close_open_writers() -> None:
+    for writer in list(_open_writers):
+        writer.close(timeout=2.0)
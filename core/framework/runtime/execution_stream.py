@@ -93,6 +93,17 @@ def get_history(self, *args: Any, **kwargs: Any) -> list:
     def get_stats(self) -> dict:
         return self._real_bus.get_stats()
 
+    def events_since(self, *args: Any, **kwargs: Any) -> list:
+        return self._real_bus.events_since(*args, **kwargs)
+
+    @property
+    def last_seq(self) -> int:
+        return self._real_bus.last_seq
+
+    @property
+    def oldest_seq(self) -> int | None:
+        return self._real_bus.oldest_seq
+
     async def wait_for(self, *args: Any, **kwargs: Any) -> Any:
         return await self._real_bus.wait_for(*args, **kwargs)
 
@@ -187,6 +198,7 @@ def __init__(
         accounts_data: list[dict] | None = None,
         tool_provider_map: dict[str, str] | None = None,
         skills_catalog_prompt: str = "",
+        skills_catalog_provider: Callable[[str], str] | None = None,
         protocols_prompt: str = "",
         skill_dirs: list[str] | None = None,
     ):
@@ -213,6 +225,8 @@ def __init__(
             accounts_data: Raw account data for per-node prompt generation
             tool_provider_map: Tool name to provider name mapping for account routing
             skills_catalog_prompt: Available skills catalog for system prompt
+            skills_catalog_provider: Optional callback returning the skills
+                catalog for a node's task (replaces skills_catalog_prompt)
             protocols_prompt: Default skill operational protocols for system prompt
             skill_dirs: Skill base directories for Tier 3 resource access
         """
@@ -237,6 +251,7 @@ def __init__(
         self._accounts_data = accounts_data
         self._tool_provider_map = tool_provider_map
         self._skills_catalog_prompt = skills_catalog_prompt
+        self._skills_catalog_provider = skills_catalog_provider
         self._protocols_prompt = protocols_prompt
         self._skill_dirs: list[str] = skill_dirs or []
 
@@ -701,6 +716,7 @@ async def _run_execution(self, ctx: ExecutionContext) -> None:
                         accounts_data=self._accounts_data,
                         tool_provider_map=self._tool_provider_map,
                         skills_catalog_prompt=self._skills_catalog_prompt,
+                        skills_catalog_provider=self._skills_catalog_provider,
                         protocols_prompt=self._protocols_prompt,
                         skill_dirs=self._skill_dirs,
                     )
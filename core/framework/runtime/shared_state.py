@@ -5,11 +5,30 @@
 - ISOLATED: Each execution has its own memory copy
 - SHARED: All executions read/write same memory (eventual consistency)
 - SYNCHRONIZED: Shared memory with write locks (strong consistency)
+
+State is copy-on-write: each level (global, per stream, per execution)
+is a short tuple of dicts ("layers", newest first) that are never mutated
+once published.  A write publishes a new tuple whose front layer holds
+the change and has absorbed the older layers no larger than itself, like
+a binary counter.  Versions share every other layer, so a write copies
+amortised O(log n) keys rather than the whole level, a lookup checks at
+most O(log n) layers, and a :class:`StateSnapshot` is O(1) to take and
+unaffected by later writes.  Values themselves are shared, never copied.
+
+For long-lived runtimes everything per-execution and per-stream is
+reclaimed: ``cleanup_execution`` drops the execution's state and its
+change history, ``cleanup_stream`` the stream's; write locks exist only
+while a write holds or awaits them; history is bounded per stream.
 """
 
 import asyncio
+import heapq
 import logging
+import sys
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
@@ -46,6 +65,85 @@ class StateChange:
     timestamp: float = field(default_factory=time.time)
 
 
+# A level of state: immutable dicts, highest precedence (newest) first
+_Layers = tuple[dict[str, Any], ...]
+
+_NO_LAYERS: _Layers = ()
+_MISSING = object()
+
+
+def _with_updates(layers: _Layers, updates: dict[str, Any]) -> _Layers:
+    """New version of *layers* with *updates* applied; *layers* is left intact."""
+    front = dict(updates)
+    rest = list(layers)
+    # Merge like a binary counter: each layer is at least twice the size of
+    # the one before it, so a level keeps O(log n) layers
+    while rest and len(rest[0]) < 2 * len(front):
+        front = {**rest.pop(0), **front}
+    return (front, *rest)
+
+
+def _lookup(layers: _Layers, key: str) -> Any:
+    for layer in layers:
+        if key in layer:
+            return layer[key]
+    return _MISSING
+
+
+def _merged(layers: _Layers) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for layer in reversed(layers):
+        result.update(layer)
+    return result
+
+
+class StateSnapshot(Mapping[str, Any]):
+    """Read-only view of the state visible to an execution at one version.
+
+    Lookups resolve execution, then stream, then global state, like
+    ``SharedStateManager.read``.  Later writes do not show up.
+    """
+
+    __slots__ = ("_layers", "version")
+
+    def __init__(self, layers: _Layers, version: int):
+        # Highest precedence first
+        self._layers = layers
+        self.version = version
+
+    def __getitem__(self, key: str) -> Any:
+        value = _lookup(self._layers, key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self) -> Iterator[str]:
+        seen: set[str] = set()
+        for layer in self._layers:
+            for key in layer:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self) -> int:
+        if len(self._layers) == 1:
+            return len(self._layers[0])
+        return len(set().union(*self._layers))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Merged copy of the snapshot."""
+        return _merged(self._layers)
+
+
+@dataclass
+class _KeyLock:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
 class SharedStateManager:
     """
     Manages shared state across concurrent executions.
@@ -75,20 +173,20 @@ class SharedStateManager:
         value = await memory.read("customer_id")
     """
 
-    def __init__(self):
-        # State storage at each level
-        self._global_state: dict[str, Any] = {}
-        self._stream_state: dict[str, dict[str, Any]] = {}  # stream_id -> {key: value}
-        self._execution_state: dict[str, dict[str, Any]] = {}  # execution_id -> {key: value}
+    def __init__(self, max_history_per_stream: int = 200):
+        # State storage at each level; every level is copy-on-write layers
+        self._global_state: _Layers = _NO_LAYERS
+        self._stream_state: dict[str, _Layers] = {}  # stream_id -> layers
+        self._execution_state: dict[str, _Layers] = {}  # execution_id -> layers
+        self._execution_streams: dict[str, str] = {}  # execution_id -> stream_id
 
-        # Locks for synchronized access
-        self._global_lock = asyncio.Lock()
-        self._stream_locks: dict[str, asyncio.Lock] = {}
-        self._key_locks: dict[str, asyncio.Lock] = {}
+        # Locks for synchronized access, dropped once no write holds or awaits them
+        self._key_locks: dict[str, _KeyLock] = {}
 
-        # Change history for debugging/auditing
-        self._change_history: list[StateChange] = []
-        self._max_history = 1000
+        # Change history for debugging/auditing: stream_id -> recent changes
+        self._history: dict[str, deque[StateChange]] = {}
+        self._max_history = max_history_per_stream
+        self._total_changes = 0
 
         # Version tracking
         self._version = 0
@@ -112,12 +210,12 @@ def create_memory(
         """
         # Initialize execution state
         if execution_id not in self._execution_state:
-            self._execution_state[execution_id] = {}
+            self._execution_state[execution_id] = _NO_LAYERS
+        self._execution_streams[execution_id] = stream_id
 
         # Initialize stream state
         if stream_id not in self._stream_state:
-            self._stream_state[stream_id] = {}
-            self._stream_locks[stream_id] = asyncio.Lock()
+            self._stream_state[stream_id] = _NO_LAYERS
 
         return StreamMemory(
             manager=self,
@@ -130,10 +228,24 @@ def cleanup_execution(self, execution_id: str) -> None:
         """
         Clean up state for a completed execution.
 
+        Drops its execution-scope state and the history of its
+        execution-scope writes (which would otherwise keep their values
+        alive).  Its stream and global writes stay in the stream's history.
+
         Args:
             execution_id: Execution to clean up
         """
         self._execution_state.pop(execution_id, None)
+        stream_id = self._execution_streams.pop(execution_id, None)
+        history = self._history.get(stream_id) if stream_id is not None else None
+        if history:
+            kept = [
+                c
+                for c in history
+                if c.execution_id != execution_id or c.scope != StateScope.EXECUTION
+            ]
+            if len(kept) != len(history):
+                self._history[stream_id] = deque(kept, maxlen=self._max_history)
         logger.debug(f"Cleaned up state for execution: {execution_id}")
 
     def cleanup_stream(self, stream_id: str) -> None:
@@ -144,7 +256,9 @@ def cleanup_stream(self, stream_id: str) -> None:
             stream_id: Stream to clean up
         """
         self._stream_state.pop(stream_id, None)
-        self._stream_locks.pop(stream_id, None)
+        self._history.pop(stream_id, None)
+        for execution_id in [e for e, s in self._execution_streams.items() if s == stream_id]:
+            self.cleanup_execution(execution_id)
         logger.debug(f"Cleaned up state for stream: {stream_id}")
 
     # === LOW-LEVEL STATE OPERATIONS ===
@@ -165,19 +279,16 @@ async def read(
         3. Global state (if isolation != ISOLATED)
         """
         # Always check execution-local first
-        if execution_id in self._execution_state:
-            if key in self._execution_state[execution_id]:
-                return self._execution_state[execution_id][key]
+        value = _lookup(self._execution_state.get(execution_id, _NO_LAYERS), key)
+        if value is not _MISSING:
+            return value
 
-        # Check stream-level (unless isolated)
+        # Check stream-level, then global (unless isolated)
         if isolation != IsolationLevel.ISOLATED:
-            if stream_id in self._stream_state:
-                if key in self._stream_state[stream_id]:
-                    return self._stream_state[stream_id][key]
-
-            # Check global
-            if key in self._global_state:
-                return self._global_state[key]
+            for layers in (self._stream_state.get(stream_id, _NO_LAYERS), self._global_state):
+                value = _lookup(layers, key)
+                if value is not _MISSING:
+                    return value
 
         return None
 
@@ -235,18 +346,26 @@ async def _write_direct(
         scope: StateScope,
     ) -> None:
         """Write without locking (for ISOLATED and SHARED)."""
+        self._apply({key: value}, execution_id, stream_id, scope)
+
+    def _apply(
+        self,
+        updates: dict[str, Any],
+        execution_id: str,
+        stream_id: str,
+        scope: StateScope,
+    ) -> None:
+        """Publish a new version of one level with *updates* applied (copy-on-write)."""
         if scope == StateScope.EXECUTION:
-            if execution_id not in self._execution_state:
-                self._execution_state[execution_id] = {}
-            self._execution_state[execution_id][key] = value
+            current = self._execution_state.get(execution_id, _NO_LAYERS)
+            self._execution_state[execution_id] = _with_updates(current, updates)
 
         elif scope == StateScope.STREAM:
-            if stream_id not in self._stream_state:
-                self._stream_state[stream_id] = {}
-            self._stream_state[stream_id][key] = value
+            current = self._stream_state.get(stream_id, _NO_LAYERS)
+            self._stream_state[stream_id] = _with_updates(current, updates)
 
         elif scope == StateScope.GLOBAL:
-            self._global_state[key] = value
+            self._global_state = _with_updates(self._global_state, updates)
 
         self._version += 1
 
@@ -259,31 +378,40 @@ async def _write_with_lock(
         scope: StateScope,
     ) -> None:
         """Write with locking (for SYNCHRONIZED)."""
-        lock = self._get_lock(scope, key, stream_id)
-        async with lock:
+        async with self._key_lock(self._lock_key(scope, key, stream_id)):
             await self._write_direct(key, value, execution_id, stream_id, scope)
 
-    def _get_lock(self, scope: StateScope, key: str, stream_id: str) -> asyncio.Lock:
-        """Get appropriate lock for scope and key."""
+    @staticmethod
+    def _lock_key(scope: StateScope, key: str, stream_id: str) -> str:
+        """Lock name for scope and key."""
         if scope == StateScope.GLOBAL:
-            lock_key = f"global:{key}"
-        elif scope == StateScope.STREAM:
-            lock_key = f"stream:{stream_id}:{key}"
-        else:
-            lock_key = f"exec:{key}"
-
-        if lock_key not in self._key_locks:
-            self._key_locks[lock_key] = asyncio.Lock()
-
-        return self._key_locks[lock_key]
+            return f"global:{key}"
+        if scope == StateScope.STREAM:
+            return f"stream:{stream_id}:{key}"
+        return f"exec:{key}"
+
+    @asynccontextmanager
+    async def _key_lock(self, lock_key: str) -> AsyncIterator[None]:
+        """Hold the lock for *lock_key*, dropping it once nobody uses it."""
+        entry = self._key_locks.get(lock_key)
+        if entry is None:
+            entry = self._key_locks[lock_key] = _KeyLock()
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if entry.users == 0 and self._key_locks.get(lock_key) is entry:
+                del self._key_locks[lock_key]
 
     def _record_change(self, change: StateChange) -> None:
         """Record a state change for auditing."""
-        self._change_history.append(change)
-
-        # Trim history if too long
-        if len(self._change_history) > self._max_history:
-            self._change_history = self._change_history[-self._max_history :]
+        history = self._history.get(change.stream_id)
+        if history is None:
+            history = self._history[change.stream_id] = deque(maxlen=self._max_history)
+        history.append(change)
+        self._total_changes += 1
 
     # === BULK OPERATIONS ===
 
@@ -298,21 +426,25 @@ async def read_all(
 
         Returns merged state from all visible levels.
         """
-        result = {}
-
-        # Start with global (if visible)
-        if isolation != IsolationLevel.ISOLATED:
-            result.update(self._global_state)
+        return self.snapshot(execution_id, stream_id, isolation).to_dict()
 
-            # Add stream state (overwrites global)
-            if stream_id in self._stream_state:
-                result.update(self._stream_state[stream_id])
-
-        # Add execution state (overwrites all)
-        if execution_id in self._execution_state:
-            result.update(self._execution_state[execution_id])
+    def snapshot(
+        self,
+        execution_id: str,
+        stream_id: str,
+        isolation: IsolationLevel,
+    ) -> StateSnapshot:
+        """
+        O(1) read-only view of all state visible to an execution.
 
-        return result
+        Unlike ``read_all`` nothing is copied; the view keeps showing the
+        state as of this call.
+        """
+        execution = self._execution_state.get(execution_id, _NO_LAYERS)
+        if isolation == IsolationLevel.ISOLATED:
+            return StateSnapshot(execution, self._version)
+        stream = self._stream_state.get(stream_id, _NO_LAYERS)
+        return StateSnapshot((*execution, *stream, *self._global_state), self._version)
 
     async def write_batch(
         self,
@@ -323,24 +455,89 @@ async def write_batch(
         scope: StateScope = StateScope.EXECUTION,
     ) -> None:
         """Write multiple values atomically."""
+        if not updates:
+            return
+        before = self.snapshot(execution_id, stream_id, isolation)
+
+        if isolation == IsolationLevel.ISOLATED:
+            scope = StateScope.EXECUTION
+
+        async with AsyncExitStack() as stack:
+            if isolation == IsolationLevel.SYNCHRONIZED and scope != StateScope.EXECUTION:
+                # Sorted so concurrent batches cannot deadlock
+                for key in sorted(updates):
+                    await stack.enter_async_context(
+                        self._key_lock(self._lock_key(scope, key, stream_id))
+                    )
+            self._apply(dict(updates), execution_id, stream_id, scope)
+
         for key, value in updates.items():
-            await self.write(key, value, execution_id, stream_id, isolation, scope)
+            self._record_change(
+                StateChange(
+                    key=key,
+                    old_value=before.get(key),
+                    new_value=value,
+                    scope=scope,
+                    execution_id=execution_id,
+                    stream_id=stream_id,
+                )
+            )
 
     # === UTILITY ===
 
     def get_stats(self) -> dict:
         """Get state manager statistics."""
         return {
-            "global_keys": len(self._global_state),
+            "global_keys": len(_merged(self._global_state)),
             "stream_count": len(self._stream_state),
             "execution_count": len(self._execution_state),
-            "total_changes": len(self._change_history),
+            "total_changes": self._total_changes,
+            "retained_changes": sum(len(h) for h in self._history.values()),
+            "active_locks": len(self._key_locks),
             "version": self._version,
+            "streams": self.get_stream_stats(),
         }
 
+    def get_stream_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Memory usage per stream.
+
+        ``approx_bytes`` is shallow: the stream's and its live executions'
+        dicts plus each value's own size, not what the values reference.
+        """
+        executions: dict[str, list[dict[str, Any]]] = {}
+        for execution_id, stream_id in self._execution_streams.items():
+            executions.setdefault(stream_id, []).append(
+                _merged(self._execution_state.get(execution_id, _NO_LAYERS))
+            )
+
+        stats: dict[str, dict[str, Any]] = {}
+        for stream_id in self._stream_state.keys() | executions.keys():
+            stream = _merged(self._stream_state.get(stream_id, _NO_LAYERS))
+            exec_states = executions.get(stream_id, [])
+            stats[stream_id] = {
+                "keys": len(stream),
+                "executions": len(exec_states),
+                "execution_keys": sum(len(s) for s in exec_states),
+                "history": len(self._history.get(stream_id, ())),
+                "approx_bytes": sum(_shallow_size(s) for s in (stream, *exec_states)),
+            }
+        return stats
+
     def get_recent_changes(self, limit: int = 10) -> list[StateChange]:
-        """Get recent state changes."""
-        return self._change_history[-limit:]
+        """Get recent state changes (across all streams, oldest first)."""
+        recent = heapq.nlargest(
+            limit,
+            (c for h in self._history.values() for c in list(h)[-limit:]),
+            key=lambda c: c.timestamp,
+        )
+        return recent[::-1]
+
+
+def _shallow_size(state: dict[str, Any]) -> int:
+    if not state:
+        return 0
+    return sys.getsizeof(state) + sum(sys.getsizeof(v) for v in state.values())
 
 
 class StreamMemory:
@@ -434,6 +631,13 @@ async def read_all(self) -> dict[str, Any]:
 
         return all_state
 
+    def snapshot(self) -> Mapping[str, Any]:
+        """O(1) read-only view of visible state (see ``SharedStateManager.snapshot``)."""
+        snap = self._manager.snapshot(self._execution_id, self._stream_id, self._isolation)
+        if self._allowed_read is not None:
+            return {k: snap[k] for k in self._allowed_read if k in snap}
+        return snap
+
     # === SYNC API (for backward compatibility with SharedMemory) ===
 
     def read_sync(self, key: str) -> Any:
@@ -447,21 +651,7 @@ def read_sync(self, key: str) -> Any:
         if self._allowed_read is not None and key not in self._allowed_read:
             raise PermissionError(f"Not allowed to read key: {key}")
 
-        # Check execution state
-        exec_state = self._manager._execution_state.get(self._execution_id, {})
-        if key in exec_state:
-            return exec_state[key]
-
-        # Check stream/global if not isolated
-        if self._isolation != IsolationLevel.ISOLATED:
-            stream_state = self._manager._stream_state.get(self._stream_id, {})
-            if key in stream_state:
-                return stream_state[key]
-
-            if key in self._manager._global_state:
-                return self._manager._global_state[key]
-
-        return None
+        return self._manager.snapshot(self._execution_id, self._stream_id, self._isolation).get(key)
 
     def write_sync(self, key: str, value: Any) -> None:
         """
@@ -472,25 +662,15 @@ def write_sync(self, key: str, value: Any) -> None:
         if self._allowed_write is not None and key not in self._allowed_write:
             raise PermissionError(f"Not allowed to write key: {key}")
 
-        if self._execution_id not in self._manager._execution_state:
-            self._manager._execution_state[self._execution_id] = {}
-
-        self._manager._execution_state[self._execution_id][key] = value
-        self._manager._version += 1
+        self._manager._apply(
+            {key: value}, self._execution_id, self._stream_id, StateScope.EXECUTION
+        )
 
     def read_all_sync(self) -> dict[str, Any]:
         """Synchronous read all."""
-        result = {}
-
-        # Global (if visible)
-        if self._isolation != IsolationLevel.ISOLATED:
-            result.update(self._manager._global_state)
-            if self._stream_id in self._manager._stream_state:
-                result.update(self._manager._stream_state[self._stream_id])
-
-        # Execution
-        if self._execution_id in self._manager._execution_state:
-            result.update(self._manager._execution_state[self._execution_id])
+        result = self._manager.snapshot(
+            self._execution_id, self._stream_id, self._isolation
+        ).to_dict()
 
         # Filter by permissions
         if self._allowed_read is not None:
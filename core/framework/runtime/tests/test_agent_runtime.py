@@ -11,6 +11,7 @@
 """
 
 import asyncio
+import math
 import tempfile
 from pathlib import Path
 
@@ -20,11 +21,12 @@
 from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
 from framework.graph.goal import Constraint, SuccessCriterion
 from framework.graph.node import NodeSpec
+from framework.runtime import shared_state
 from framework.runtime.agent_runtime import AgentRuntime, create_agent_runtime
 from framework.runtime.event_bus import AgentEvent, EventBus, EventType
 from framework.runtime.execution_stream import EntryPointSpec
 from framework.runtime.outcome_aggregator import OutcomeAggregator
-from framework.runtime.shared_state import IsolationLevel, SharedStateManager
+from framework.runtime.shared_state import IsolationLevel, SharedStateManager, StateScope
 
 # === Test Fixtures ===
 
@@ -189,6 +191,99 @@ def test_cleanup_execution(self):
 
         assert "exec-1" not in manager._execution_state
 
+    @pytest.mark.asyncio
+    async def test_snapshot_is_unaffected_by_later_writes(self):
+        """Test a snapshot keeps showing the state as of when it was taken."""
+        manager = SharedStateManager()
+        memory = manager.create_memory("exec-1", "stream-1", IsolationLevel.SHARED)
+        await memory.write("a", 1)
+        await manager.write("g", "x", "exec-1", "stream-1", IsolationLevel.SHARED, "global")
+
+        snapshot = memory.snapshot()
+        await memory.write("a", 2)
+        await manager.write_batch({"b": 3, "g": "y"}, "exec-1", "stream-1", IsolationLevel.SHARED)
+
+        assert dict(snapshot) == {"a": 1, "g": "x"}
+        assert await memory.read_all() == {"a": 2, "b": 3, "g": "y"}
+        assert snapshot.version < memory.snapshot().version
+
+    @pytest.mark.asyncio
+    async def test_sequential_writes_share_structure(self, monkeypatch):
+        """Test filling a level key by key does not copy the whole level per write."""
+        copied = 0
+        with_updates = shared_state._with_updates
+
+        def counting(layers, updates):
+            nonlocal copied
+            result = with_updates(layers, updates)
+            copied += len(result[0])
+            return result
+
+        monkeypatch.setattr(shared_state, "_with_updates", counting)
+        manager = SharedStateManager()
+        memory = manager.create_memory("exec-1", "stream-1", IsolationLevel.SHARED)
+        n = 2048
+        for i in range(n):
+            await memory.write(f"key-{i}", i, scope=StateScope.STREAM)
+            if i == n // 2:
+                snapshot = memory.snapshot()
+
+        # A full copy per write would be n * (n + 1) / 2 ~= 2.1M keys
+        assert copied <= n * (math.log2(n) + 1)
+        assert len(manager._stream_state["stream-1"]) <= math.log2(n) + 1
+        assert len(snapshot) == n // 2 + 1
+        assert await memory.read("key-0") == 0
+        assert await memory.read_all() == {f"key-{i}": i for i in range(n)}
+
+    @pytest.mark.asyncio
+    async def test_synchronized_locks_are_released(self):
+        """Test per-key write locks are dropped once idle."""
+        manager = SharedStateManager()
+        memory = manager.create_memory("exec-1", "stream-1", IsolationLevel.SYNCHRONIZED)
+
+        await asyncio.gather(*(memory.write(f"key-{i}", i) for i in range(50)))
+        await manager.write_batch(
+            {"x": 1, "y": 2}, "exec-1", "stream-1", IsolationLevel.SYNCHRONIZED, "stream"
+        )
+
+        assert await memory.read("key-49") == 49
+        assert manager._key_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_and_reclaimed(self):
+        """Test change history is capped per stream and released on cleanup."""
+        manager = SharedStateManager(max_history_per_stream=5)
+        memory = manager.create_memory("exec-1", "stream-1", IsolationLevel.SHARED)
+        for i in range(20):
+            await memory.write("key", i)
+
+        assert manager.get_stats()["total_changes"] == 20
+        assert [c.new_value for c in manager.get_recent_changes(3)] == [17, 18, 19]
+
+        manager.cleanup_execution("exec-1")
+        assert manager.get_recent_changes() == []
+
+        manager.create_memory("exec-2", "stream-1", IsolationLevel.SHARED)
+        manager.cleanup_stream("stream-1")
+        stats = manager.get_stats()
+        assert stats["stream_count"] == 0
+        assert stats["execution_count"] == 0
+        assert stats["streams"] == {}
+
+    @pytest.mark.asyncio
+    async def test_per_stream_stats(self):
+        """Test stats report memory held by each stream."""
+        manager = SharedStateManager()
+        memory = manager.create_memory("exec-1", "stream-1", IsolationLevel.SHARED)
+        await memory.write("key", "value")
+        manager.create_memory("exec-2", "stream-2", IsolationLevel.SHARED)
+
+        streams = manager.get_stats()["streams"]
+        assert streams["stream-1"]["executions"] == 1
+        assert streams["stream-1"]["execution_keys"] == 1
+        assert streams["stream-1"]["approx_bytes"] > 0
+        assert streams["stream-2"]["approx_bytes"] == 0
+
 
 # === EventBus Tests ===
 
@@ -0,0 +1,315 @@
+"""
+Worker Status View - Incrementally maintained projection of worker activity.
+
+The queen polls ``get_worker_status`` frequently, and worker digests need
+the run → execution mapping.  Instead of re-querying the EventBus history
+for every category on each poll, :class:`WorkerStatusView` subscribes to
+the bus once and folds each event into the state those readers need:
+current node and iteration, recent tool calls and transitions, issues,
+subagent reports, token totals and per-execution counters.  Reads are O(1)
+(or O(limit) for recent-event lists).  Only the most recent finished
+executions keep their counters, so a long-lived view stays bounded.
+"""
+
+from __future__ import annotations
+
+import logging
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from framework.runtime.event_bus import AgentEvent, EventType
+
+if TYPE_CHECKING:
+    from framework.runtime.event_bus import EventBus
+
+logger = logging.getLogger(__name__)
+
+# Event types kept as bounded most-recent-first lists
+RECENT_EVENT_TYPES = (
+    EventType.EDGE_TRAVERSED,
+    EventType.TOOL_CALL_STARTED,
+    EventType.TOOL_CALL_COMPLETED,
+    EventType.NODE_RETRY,
+    EventType.NODE_STALLED,
+    EventType.NODE_TOOL_DOOM_LOOP,
+    EventType.CONSTRAINT_VIOLATION,
+    EventType.SUBAGENT_REPORT,
+    EventType.EXECUTION_COMPLETED,
+    EventType.EXECUTION_FAILED,
+)
+
+# Issue categories counted as red flags in the status summary
+RED_FLAG_TYPES = (
+    EventType.NODE_STALLED,
+    EventType.NODE_TOOL_DOOM_LOOP,
+    EventType.CONSTRAINT_VIOLATION,
+)
+
+TRACKED_EVENT_TYPES = (
+    *RECENT_EVENT_TYPES,
+    EventType.EXECUTION_STARTED,
+    EventType.EXECUTION_PAUSED,
+    EventType.NODE_LOOP_ITERATION,
+    EventType.CLIENT_INPUT_REQUESTED,
+    EventType.LLM_TEXT_DELTA,
+    EventType.LLM_TURN_COMPLETE,
+)
+
+
+@dataclass
+class ExecutionCounters:
+    """Running counters for a single execution."""
+
+    execution_id: str
+    run_id: str | None = None
+    stream_id: str = ""
+    status: str = "running"
+    started_at: datetime | None = None
+    current_node: str | None = None
+    iteration: int | None = None
+    llm_turns: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    tool_calls: int = 0
+    tool_errors: int = 0
+    retries: int = 0
+    stalls: int = 0
+    doom_loops: int = 0
+    running_tools: dict[str, AgentEvent] = field(default_factory=dict)
+
+
+class WorkerStatusView:
+    """Status projection kept up to date from EventBus events.
+
+    Use :func:`get_worker_status_view` to get the view attached to a bus;
+    it is seeded from the bus history on first use and then updated by a
+    subscription, so it reflects every event published since.
+    """
+
+    def __init__(self, max_recent: int = 200, token_window: int = 200, max_finished: int = 100):
+        self._max_recent = max_recent
+        self._max_finished = max_finished
+        self._recent: dict[EventType, deque[AgentEvent]] = {
+            t: deque(maxlen=max_recent) for t in RECENT_EVENT_TYPES
+        }
+        self.current_node: str | None = None
+        self.current_iteration: int | None = None
+        self.last_input_request: AgentEvent | None = None
+        self.last_text_delta: AgentEvent | None = None
+        # Rolling token totals over the last ``token_window`` LLM turns
+        self._turn_tokens: deque[tuple[int, int]] = deque(maxlen=token_window)
+        self._window_input_tokens = 0
+        self._window_output_tokens = 0
+        self.executions: dict[str, ExecutionCounters] = {}
+        self._run_to_execution: dict[str, str] = {}
+        self._running_tools: dict[str, AgentEvent] = {}
+        # Completed/failed execution ids, oldest first; pruned past max_finished
+        self._finished: OrderedDict[str, None] = OrderedDict()
+        self.completed_count = 0
+        self.failed_count = 0
+        self.last_seq = 0
+        # Weak, so the view (a value in ``_views``) does not keep its bus alive
+        self._bus_ref: weakref.ref[EventBus] | None = None
+        self._sub_id: str | None = None
+
+    # === WIRING ===
+
+    def attach(self, bus: EventBus) -> None:
+        """Seed from the bus history, then follow new events."""
+        if self._bus_ref is not None:
+            return
+        tracked = set(TRACKED_EVENT_TYPES)
+        for event in bus.events_since(0, event_types=tracked):
+            self.apply(event)
+        self._bus_ref = weakref.ref(bus)
+        self._sub_id = bus.subscribe(list(TRACKED_EVENT_TYPES), self._on_event)
+
+    def detach(self) -> None:
+        bus = self._bus_ref() if self._bus_ref is not None else None
+        if bus is not None and self._sub_id is not None:
+            bus.unsubscribe(self._sub_id)
+        self._bus_ref = None
+        self._sub_id = None
+
+    async def _on_event(self, event: AgentEvent) -> None:
+        self.apply(event)
+
+    # === PROJECTION ===
+
+    def apply(self, event: AgentEvent) -> None:
+        """Fold one event into the view.  Events already applied are ignored."""
+        if event.seq and event.seq <= self.last_seq:
+            return
+        self.last_seq = max(self.last_seq, event.seq)
+
+        etype = event.type
+        data = event.data or {}
+        recent = self._recent.get(etype)
+        if recent is not None:
+            recent.append(event)
+
+        exec_counters = self._execution(event)
+
+        if etype == EventType.LLM_TEXT_DELTA:
+            self.last_text_delta = event
+        elif etype == EventType.EDGE_TRAVERSED:
+            target = data.get("target_node")
+            if target:
+                self.current_node = target
+                if exec_counters:
+                    exec_counters.current_node = target
+        elif etype == EventType.NODE_LOOP_ITERATION:
+            self.current_iteration = data.get("iteration")
+            if exec_counters:
+                exec_counters.iteration = self.current_iteration
+        elif etype == EventType.CLIENT_INPUT_REQUESTED:
+            self.last_input_request = event
+        elif etype == EventType.LLM_TURN_COMPLETE:
+            tokens_in = data.get("input_tokens", 0) or 0
+            tokens_out = data.get("output_tokens", 0) or 0
+            if len(self._turn_tokens) == self._turn_tokens.maxlen:
+                old_in, old_out = self._turn_tokens[0]
+                self._window_input_tokens -= old_in
+                self._window_output_tokens -= old_out
+            self._turn_tokens.append((tokens_in, tokens_out))
+            self._window_input_tokens += tokens_in
+            self._window_output_tokens += tokens_out
+            if exec_counters:
+                exec_counters.llm_turns += 1
+                exec_counters.input_tokens += tokens_in
+                exec_counters.output_tokens += tokens_out
+        elif etype == EventType.TOOL_CALL_STARTED:
+            tool_use_id = data.get("tool_use_id")
+            if tool_use_id:
+                self._running_tools[tool_use_id] = event
+                if exec_counters:
+                    exec_counters.running_tools[tool_use_id] = event
+        elif etype == EventType.TOOL_CALL_COMPLETED:
+            tool_use_id = data.get("tool_use_id")
+            if tool_use_id:
+                self._running_tools.pop(tool_use_id, None)
+            if exec_counters:
+                exec_counters.running_tools.pop(tool_use_id, None)
+                exec_counters.tool_calls += 1
+                if data.get("is_error"):
+                    exec_counters.tool_errors += 1
+        elif etype == EventType.NODE_RETRY:
+            if exec_counters:
+                exec_counters.retries += 1
+        elif etype == EventType.NODE_STALLED:
+            if exec_counters:
+                exec_counters.stalls += 1
+        elif etype == EventType.NODE_TOOL_DOOM_LOOP:
+            if exec_counters:
+                exec_counters.doom_loops += 1
+        elif etype == EventType.EXECUTION_STARTED:
+            if exec_counters:
+                exec_counters.status = "running"
+                exec_counters.started_at = event.timestamp
+                self._finished.pop(exec_counters.execution_id, None)
+        elif etype in (
+            EventType.EXECUTION_COMPLETED,
+            EventType.EXECUTION_FAILED,
+            EventType.EXECUTION_PAUSED,
+        ):
+            if etype == EventType.EXECUTION_COMPLETED:
+                self.completed_count += 1
+            elif etype == EventType.EXECUTION_FAILED:
+                self.failed_count += 1
+            if exec_counters:
+                exec_counters.status = {
+                    EventType.EXECUTION_COMPLETED: "completed",
+                    EventType.EXECUTION_FAILED: "failed",
+                    EventType.EXECUTION_PAUSED: "paused",
+                }[etype]
+                # Tools still "running" in a finished execution never completed
+                for tool_use_id in exec_counters.running_tools:
+                    self._running_tools.pop(tool_use_id, None)
+                exec_counters.running_tools.clear()
+                if etype != EventType.EXECUTION_PAUSED:
+                    self._finish(exec_counters.execution_id)
+
+    def _finish(self, exec_id: str) -> None:
+        """Keep counters for the last ``max_finished`` finished executions only."""
+        self._finished[exec_id] = None
+        self._finished.move_to_end(exec_id)
+        while len(self._finished) > self._max_finished:
+            old_id, _ = self._finished.popitem(last=False)
+            counters = self.executions.pop(old_id, None)
+            if counters is not None and counters.run_id is not None:
+                if self._run_to_execution.get(counters.run_id) == old_id:
+                    del self._run_to_execution[counters.run_id]
+
+    def _execution(self, event: AgentEvent) -> ExecutionCounters | None:
+        exec_id = event.execution_id
+        if not exec_id:
+            return None
+        counters = self.executions.get(exec_id)
+        if counters is None:
+            counters = ExecutionCounters(execution_id=exec_id, stream_id=event.stream_id)
+            self.executions[exec_id] = counters
+        run_id = getattr(event, "run_id", None)
+        if run_id and counters.run_id is None:
+            counters.run_id = run_id
+            self._run_to_execution[run_id] = exec_id
+        return counters
+
+    # === QUERIES ===
+
+    def recent(self, event_type: EventType, limit: int = 100) -> list[AgentEvent]:
+        """Most recent events of *event_type*, newest first (like ``get_history``)."""
+        events = self._recent.get(event_type)
+        if not events or limit <= 0:
+            return []
+        out: list[AgentEvent] = []
+        for event in reversed(events):
+            out.append(event)
+            if len(out) >= limit:
+                break
+        return out
+
+    def latest(self, event_type: EventType) -> AgentEvent | None:
+        events = self._recent.get(event_type)
+        return events[-1] if events else None
+
+    @property
+    def running_tools(self) -> list[AgentEvent]:
+        """TOOL_CALL_STARTED events with no completion yet, newest first."""
+        return list(reversed(self._running_tools.values()))
+
+    @property
+    def red_flags(self) -> int:
+        """Number of issue categories (stall / doom loop / violation) seen."""
+        return sum(1 for t in RED_FLAG_TYPES if self._recent[t])
+
+    def token_summary(self) -> dict[str, int]:
+        """Token totals over the most recent LLM turns."""
+        return {
+            "llm_turns": len(self._turn_tokens),
+            "input_tokens": self._window_input_tokens,
+            "output_tokens": self._window_output_tokens,
+            "total_tokens": self._window_input_tokens + self._window_output_tokens,
+        }
+
+    def execution_for_run(self, run_id: str) -> str | None:
+        return self._run_to_execution.get(run_id)
+
+    def run_for_execution(self, execution_id: str) -> str | None:
+        counters = self.executions.get(execution_id)
+        return counters.run_id if counters else None
+
+
+_views: weakref.WeakKeyDictionary[Any, WorkerStatusView] = weakref.WeakKeyDictionary()
+
+
+def get_worker_status_view(bus: EventBus) -> WorkerStatusView:
+    """Return the status view for *bus*, attaching one on first use."""
+    view = _views.get(bus)
+    if view is None:
+        view = WorkerStatusView()
+        view.attach(bus)
+        _views[bus] = view
+    return view
@@ -43,6 +43,14 @@ class Checkpoint(BaseModel):
     is_clean: bool = True  # True if no failures/retries before this checkpoint
     description: str = ""  # Human-readable checkpoint description
 
+    # Delta checkpoints (written by CheckpointStore when enabled). On disk a
+    # delta's shared_memory holds only keys changed since its parent and
+    # deleted_memory_keys lists keys removed since then; load_checkpoint()
+    # returns the reconstructed full state with is_delta=False.
+    is_delta: bool = False
+    parent_checkpoint_id: str | None = None
+    deleted_memory_keys: list[str] = Field(default_factory=list)
+
     model_config = {"extra": "allow"}
 
     @classmethod
@@ -114,6 +122,8 @@ class CheckpointSummary(BaseModel):
     next_node: str | None = None
     is_clean: bool = True
     description: str = ""
+    is_delta: bool = False
+    parent_checkpoint_id: str | None = None
 
     model_config = {"extra": "allow"}
 
@@ -128,6 +138,8 @@ def from_checkpoint(cls, checkpoint: Checkpoint) -> "CheckpointSummary":
             next_node=checkpoint.next_node,
             is_clean=checkpoint.is_clean,
             description=checkpoint.description,
+            is_delta=checkpoint.is_delta,
+            parent_checkpoint_id=checkpoint.parent_checkpoint_id,
         )
 
 
@@ -173,6 +173,7 @@ async def _on_shutdown(app: web.Application) -> None:
     """Gracefully unload all agents on server shutdown."""
     manager: SessionManager = app["manager"]
     await manager.shutdown_all()
+    app["credential_store"].close()
 
 
 async def handle_health(request: web.Request) -> web.Response:
@@ -188,6 +189,13 @@ async def handle_health(request: web.Request) -> web.Response:
     )
 
 
+async def handle_mcp_stats(request: web.Request) -> web.Response:
+    """GET /api/mcp/stats — pooled MCP connections and per-replica latency."""
+    from framework.runner.mcp_connection_manager import MCPConnectionManager
+
+    return web.json_response({"servers": MCPConnectionManager.get_instance().stats()})
+
+
 def create_app(model: str | None = None) -> web.Application:
     """Create and configure the aiohttp Application.
 
@@ -233,6 +241,7 @@ def create_app(model: str | None = None) -> web.Application:
 
     # Health check
     app.router.add_get("/api/health", handle_health)
+    app.router.add_get("/api/mcp/stats", handle_mcp_stats)
 
     # Register route modules
     from framework.server.routes_credentials import register_routes as register_credential_routes
@@ -60,9 +60,11 @@ async def create_queen(
         _shared_building_knowledge,
     )
     from framework.agents.queen.nodes.thinking_hook import select_expert_persona
+    from framework.config import get_mcp_schema_cache_dir, get_skill_discovery_cache_dir
     from framework.graph.event_loop_node import HookContext, HookResult
     from framework.graph.executor import GraphExecutor
     from framework.runner.mcp_registry import MCPRegistry
+    from framework.runner.mcp_schema_cache import MCPSchemaCache
     from framework.runner.tool_registry import ToolRegistry
     from framework.runtime.core import Runtime
     from framework.runtime.event_bus import AgentEvent, EventType
@@ -76,6 +78,9 @@ async def create_queen(
 
     # ---- Tool registry ------------------------------------------------
     queen_registry = ToolRegistry()
+    mcp_schema_cache_dir = get_mcp_schema_cache_dir()
+    if mcp_schema_cache_dir is not None:
+        queen_registry.enable_schema_cache(MCPSchemaCache(mcp_schema_cache_dir))
     import framework.agents.queen as _queen_pkg
 
     queen_pkg_dir = Path(_queen_pkg.__file__).parent
@@ -238,7 +243,12 @@ async def _track_planning_asks(event: AgentEvent) -> None:
         # Pass project_root so user-scope skills (~/.hive/skills/, ~/.agents/skills/)
         # are discovered. Queen has no agent-specific project root, so we use its
         # own directory — the value just needs to be non-None to enable user-scope scanning.
-        _queen_skills_mgr = SkillsManager(SkillsManagerConfig(project_root=Path(__file__).parent))
+        _queen_skills_mgr = SkillsManager(
+            SkillsManagerConfig(
+                project_root=Path(__file__).parent,
+                discovery_cache_dir=get_skill_discovery_cache_dir(),
+            )
+        )
         _queen_skills_mgr.load()
         phase_state.protocols_prompt = _queen_skills_mgr.protocols_prompt
         phase_state.skills_catalog_prompt = _queen_skills_mgr.skills_catalog_prompt
@@ -74,11 +74,38 @@ def _parse_event_types(query_param: str | None) -> list[EventType]:
     return result or DEFAULT_EVENT_TYPES
 
 
+def _parse_cursor(value: str | None) -> int | None:
+    """Parse an SSE resume cursor (an event ``seq``); None if absent or invalid."""
+    if not value:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(f"Invalid SSE resume cursor: {value}")
+        return None
+
+
+def _event_payload(event: AgentEvent) -> dict:
+    """Serialize a bus event for SSE, including its resume cursor."""
+    evt_dict = event.to_dict()
+    if event.seq is not None:
+        evt_dict["seq"] = event.seq
+    return evt_dict
+
+
 async def handle_events(request: web.Request) -> web.StreamResponse:
     """SSE event stream for a session.
 
     Query params:
         types: Comma-separated event type names to filter (optional).
+        since: Resume cursor — the ``seq`` of the last event the client
+            received.  All buffered events after it are replayed instead of
+            the default chat-message replay.  The ``Last-Event-ID`` header
+            is accepted as well.
+
+    Every streamed bus event carries its ``seq`` in the payload and as the
+    SSE ``id``, so a browser ``EventSource`` resumes with ``Last-Event-ID``
+    on its own.  Synthetic status events have no ``seq`` and no ``id``.
     """
     session, err = resolve_session(request)
     if err:
@@ -113,7 +140,7 @@ async def on_event(event) -> None:
         if client_disconnected.is_set():
             return
 
-        evt_dict = event.to_dict()
+        evt_dict = _event_payload(event)
         if evt_dict.get("type") in _CRITICAL_EVENTS:
             try:
                 queue.put_nowait(evt_dict)
@@ -137,33 +164,47 @@ async def on_event(event) -> None:
         handler=on_event,
     )
 
+    # Replay buffered events that were published before this SSE connected.
+    # This runs synchronously right after subscribe(), so no live event can
+    # be queued ahead of (or duplicated by) the replay.
+    #
+    # A reconnecting client that sends its cursor gets every subscribed
+    # event it missed.  Otherwise we replay the subset that produces visible
+    # chat messages so the frontend never misses early queen output;
+    # lifecycle events are NOT replayed to avoid duplicate state transitions
+    # (turn counter increments, etc.).
+    _REPLAY_TYPES = {
+        EventType.CLIENT_OUTPUT_DELTA,
+        EventType.EXECUTION_STARTED,
+        EventType.CLIENT_INPUT_REQUESTED,
+        EventType.CLIENT_INPUT_RECEIVED,
+    }
+    since = _parse_cursor(request.query.get("since") or request.headers.get("Last-Event-ID"))
+    if since is None:
+        past_events = event_bus.events_since(0, event_types=_REPLAY_TYPES & set(event_types))
+    else:
+        past_events = event_bus.events_since(since, event_types=set(event_types))
+        oldest = event_bus.oldest_seq
+        if oldest is not None and since + 1 < oldest:
+            logger.info(
+                "SSE resume cursor %d older than history (oldest=%d) for session='%s'",
+                since,
+                oldest,
+                session.id,
+            )
+    replayed = 0
+    for past_event in past_events:
+        try:
+            queue.put_nowait(_event_payload(past_event))
+            replayed += 1
+        except asyncio.QueueFull:
+            break
+
     sse = SSEResponse()
     await sse.prepare(request)
     logger.info(
         "SSE connected: session='%s', sub_id='%s', types=%d", session.id, sub_id, len(event_types)
     )
-
-    # Replay buffered events that were published before this SSE connected.
-    # The EventBus keeps a history ring-buffer; we replay the subset that
-    # produces visible chat messages so the frontend never misses early
-    # queen output.  Lifecycle events are NOT replayed to avoid duplicate
-    # state transitions (turn counter increments, etc.).
-    _REPLAY_TYPES = {
-        EventType.CLIENT_OUTPUT_DELTA.value,
-        EventType.EXECUTION_STARTED.value,
-        EventType.CLIENT_INPUT_REQUESTED.value,
-        EventType.CLIENT_INPUT_RECEIVED.value,
-    }
-    event_type_values = {et.value for et in event_types}
-    replay_types = _REPLAY_TYPES & event_type_values
-    replayed = 0
-    for past_event in event_bus._event_history:
-        if past_event.type.value in replay_types:
-            try:
-                queue.put_nowait(past_event.to_dict())
-                replayed += 1
-            except asyncio.QueueFull:
-                break
     if replayed:
         logger.info("SSE replayed %d buffered events for session='%s'", replayed, session.id)
 
@@ -221,7 +262,8 @@ async def on_event(event) -> None:
         while not client_disconnected.is_set():
             try:
                 data = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_INTERVAL)
-                await sse.send_event(data)
+                seq = data.get("seq")
+                await sse.send_event(data, id=str(seq) if seq is not None else None)
                 event_count += 1
                 if event_count == 1:
                     logger.info(
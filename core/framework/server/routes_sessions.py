@@ -43,6 +43,9 @@
     validate_agent_path,
 )
 from framework.server.session_manager import SessionManager
+from framework.storage.checkpoint_store import CheckpointStore
+from framework.storage.conversation_store import read_conversation_parts
+from framework.storage.sqlite_store import read_sqlite_session_states
 
 logger = logging.getLogger(__name__)
 
@@ -605,39 +608,61 @@ async def handle_list_worker_sessions(request: web.Request) -> web.Response:
     if not sess_dir.exists():
         return web.json_response({"sessions": []})
 
+    # Sessions stored in sessions.db are listed from there, like the runtime sees them
+    db_states = read_sqlite_session_states(sess_dir.parent)
+
     sessions = []
     for d in sorted(sess_dir.iterdir(), reverse=True):
         if not d.is_dir():
             continue
         state_path = d / "state.json"
-        if not d.name.startswith("session_") and not state_path.exists():
+        if db_states is not None:
+            if d.name not in db_states:
+                continue
+        elif not d.name.startswith("session_") and not state_path.exists():
             continue
 
         entry: dict = {"session_id": d.name}
 
-        if state_path.exists():
+        state: dict | None = None
+        if db_states is not None:
+            state = db_states[d.name]
+        elif state_path.exists():
             try:
                 state = json.loads(state_path.read_text(encoding="utf-8"))
-                entry["status"] = state.get("status", "unknown")
-                entry["started_at"] = state.get("started_at")
-                entry["completed_at"] = state.get("completed_at")
-                progress = state.get("progress", {})
-                entry["steps"] = progress.get("steps_executed", 0)
-                entry["paused_at"] = progress.get("paused_at")
             except (json.JSONDecodeError, OSError):
                 entry["status"] = "error"
+        if state is not None:
+            entry["status"] = state.get("status", "unknown")
+            entry["started_at"] = state.get("started_at")
+            entry["completed_at"] = state.get("completed_at")
+            progress = state.get("progress", {})
+            entry["steps"] = progress.get("steps_executed", 0)
+            entry["paused_at"] = progress.get("paused_at")
 
-        cp_dir = d / "checkpoints"
-        if cp_dir.exists():
-            entry["checkpoint_count"] = sum(1 for f in cp_dir.iterdir() if f.suffix == ".json")
-        else:
-            entry["checkpoint_count"] = 0
+        entry["checkpoint_count"] = _count_checkpoints(d)
 
         sessions.append(entry)
 
     return web.json_response({"sessions": sessions})
 
 
+def _count_checkpoints(session_path: Path) -> int:
+    """Number of checkpoints in a worker session, read from the checkpoint index."""
+    store = CheckpointStore(session_path)
+    if not store.checkpoints_dir.exists():
+        return 0
+    index = store.load_index_sync()
+    if index is not None:
+        return len(index.checkpoints)
+    # No index (written outside CheckpointStore): each checkpoint is one file
+    return sum(
+        1
+        for f in store.checkpoints_dir.iterdir()
+        if f.suffix == ".json" and f != store.legacy_index_path
+    )
+
+
 async def handle_get_worker_session(request: web.Request) -> web.Response:
     """Get worker session detail from disk."""
     session, err = resolve_session(request)
@@ -785,31 +810,22 @@ async def handle_messages(request: web.Request) -> web.Response:
     filter_node = request.query.get("node_id")
     all_messages = []
 
-    def _collect_msg_parts(parts_dir: Path, node_id: str) -> None:
-        if not parts_dir.exists():
-            return
-        for part_file in sorted(parts_dir.iterdir()):
-            if part_file.suffix != ".json":
-                continue
-            try:
-                part = json.loads(part_file.read_text(encoding="utf-8"))
-                part["_node_id"] = node_id
-                part.setdefault("created_at", part_file.stat().st_mtime)
-                all_messages.append(part)
-            except (json.JSONDecodeError, OSError):
-                continue
+    def _collect_msg_parts(conv_dir: Path, node_id: str) -> None:
+        for part in read_conversation_parts(conv_dir):
+            part["_node_id"] = node_id
+            all_messages.append(part)
 
-    # Flat layout: conversations/parts/*.json
+    # Flat layout: conversations/{parts,log}/
     if not filter_node:
-        _collect_msg_parts(convs_dir / "parts", "worker")
+        _collect_msg_parts(convs_dir, "worker")
 
-    # Node-based layout: conversations/<node_id>/parts/*.json
+    # Node-based layout: conversations/<node_id>/{parts,log}/
     for node_dir in convs_dir.iterdir():
-        if not node_dir.is_dir() or node_dir.name == "parts":
+        if not node_dir.is_dir() or node_dir.name in ("parts", "log"):
             continue
         if filter_node and node_dir.name != filter_node:
             continue
-        _collect_msg_parts(node_dir / "parts", node_dir.name)
+        _collect_msg_parts(node_dir, node_dir.name)
 
     # Merge run lifecycle markers from runs.jsonl (for historical dividers)
     runs_file = sess_dir / ws_id / "runs.jsonl"
@@ -877,6 +893,11 @@ async def handle_session_events_history(request: web.Request) -> web.Response:
     """
     session_id = request.match_info["session_id"]
 
+    # Live sessions write the log in the background; wait for queued lines.
+    live = _get_manager(request).get_session(session_id)
+    if live is not None:
+        await asyncio.to_thread(live.event_bus.flush_session_log)
+
     queen_dir = Path.home() / ".hive" / "queen" / "session" / session_id
     events_path = queen_dir / "events.jsonl"
     if not events_path.exists():
@@ -20,6 +20,7 @@
 from typing import Any
 
 from framework.runtime.triggers import TriggerDefinition
+from framework.storage.conversation_store import has_conversation_parts, read_conversation_parts
 
 logger = logging.getLogger(__name__)
 
@@ -775,6 +776,7 @@ def _subscribe_worker_digest(self, session: Session) -> None:
         import time as _time
 
         from framework.runtime.event_bus import EventType as _ET
+        from framework.runtime.worker_status import get_worker_status_view
 
         _DIGEST_COOLDOWN = 300.0  # seconds between mid-run snapshots
 
@@ -795,12 +797,11 @@ def _subscribe_worker_digest(self, session: Session) -> None:
         # per-execution_id monotonic timestamp of last mid-run digest
         _last_digest: dict[str, float] = {}
 
+        _status_view = get_worker_status_view(_bus)
+
         def _resolve_run_id(exec_id: str) -> str | None:
-            """Look up the run_id for a given execution_id via EXECUTION_STARTED history."""
-            for e in _bus.get_history(event_type=_ET.EXECUTION_STARTED, limit=200):
-                if e.execution_id == exec_id and getattr(e, "run_id", None):
-                    return e.run_id
-            return None
+            """Look up the run_id for a given execution_id (recorded at EXECUTION_STARTED)."""
+            return _status_view.run_for_execution(exec_id)
 
         async def _inject_digest_to_queen(run_id: str) -> None:
             """Read the written digest and push it into the queen's conversation."""
@@ -1259,17 +1260,15 @@ def get_cold_session_info(session_id: str) -> dict | None:
         # Check whether any message part files are actually present
         has_messages = False
         try:
-            # Flat layout: conversations/parts/*.json
-            flat_parts = convs_dir / "parts"
-            if flat_parts.exists() and any(f.suffix == ".json" for f in flat_parts.iterdir()):
+            # Flat layout: conversations/{parts,log}/
+            if has_conversation_parts(convs_dir):
                 has_messages = True
             else:
-                # Node-based layout: conversations/<node_id>/parts/*.json
+                # Node-based layout: conversations/<node_id>/{parts,log}/
                 for node_dir in convs_dir.iterdir():
-                    if not node_dir.is_dir() or node_dir.name == "parts":
+                    if not node_dir.is_dir() or node_dir.name in ("parts", "log"):
                         continue
-                    parts_dir = node_dir / "parts"
-                    if parts_dir.exists() and any(f.suffix == ".json" for f in parts_dir.iterdir()):
+                    if has_conversation_parts(node_dir):
                         has_messages = True
                         break
         except OSError:
@@ -1347,28 +1346,13 @@ def list_cold_sessions() -> list[dict]:
             convs_dir = d / "conversations"
             if convs_dir.exists():
                 try:
-                    all_parts: list[dict] = []
-
-                    def _collect_parts(parts_dir: Path, _dest: list[dict] = all_parts) -> None:
-                        if not parts_dir.exists():
-                            return
-                        for part_file in sorted(parts_dir.iterdir()):
-                            if part_file.suffix != ".json":
-                                continue
-                            try:
-                                part = json.loads(part_file.read_text(encoding="utf-8"))
-                                part.setdefault("created_at", part_file.stat().st_mtime)
-                                _dest.append(part)
-                            except (json.JSONDecodeError, OSError):
-                                continue
-
-                    # Flat layout: conversations/parts/*.json
-                    _collect_parts(convs_dir / "parts")
-                    # Node-based layout: conversations/<node_id>/parts/*.json
+                    # Flat layout: conversations/{parts,log}/
+                    all_parts: list[dict] = read_conversation_parts(convs_dir)
+                    # Node-based layout: conversations/<node_id>/{parts,log}/
                     for node_dir in convs_dir.iterdir():
-                        if not node_dir.is_dir() or node_dir.name == "parts":
+                        if not node_dir.is_dir() or node_dir.name in ("parts", "log"):
                             continue
-                        _collect_parts(node_dir / "parts")
+                        all_parts.extend(read_conversation_parts(node_dir))
                     # Filter to client-facing messages only
                     client_msgs = [
                         p
@@ -362,6 +362,15 @@ async def test_health(self):
             assert data["agents_loaded"] == 0
             assert data["sessions"] == 0
 
+    @pytest.mark.asyncio
+    async def test_mcp_stats(self):
+        app = create_app()
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/api/mcp/stats")
+            assert resp.status == 200
+            data = await resp.json()
+            assert isinstance(data["servers"], dict)
+
 
 class TestSessionCRUD:
     @pytest.mark.asyncio
@@ -877,6 +886,34 @@ async def test_list_sessions(self, sample_session, tmp_agent_dir):
             assert data["sessions"][0]["status"] == "paused"
             assert data["sessions"][0]["steps"] == 5
 
+    @pytest.mark.asyncio
+    async def test_list_sessions_reads_sqlite_backend(self, sample_session, tmp_agent_dir):
+        from framework.schemas.session_state import SessionState, SessionTimestamps
+        from framework.storage.sqlite_store import SQLiteSessionStore
+
+        session_id, session_dir, state = sample_session
+        tmp_path, agent_name, base = tmp_agent_dir
+        store = SQLiteSessionStore(base, mirror_state_json=False)
+        await store.write_state(
+            session_id,
+            SessionState(
+                session_id=session_id,
+                status="completed",
+                goal_id="goal",
+                timestamps=SessionTimestamps(started_at="t", updated_at="t"),
+            ),
+        )
+        store.close()
+
+        session = _make_session(tmp_dir=tmp_path / ".hive" / "agents" / agent_name)
+        app = _make_app_with_session(session)
+
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/api/sessions/test_agent/worker-sessions")
+            data = await resp.json()
+            assert [s["session_id"] for s in data["sessions"]] == [session_id]
+            assert data["sessions"][0]["status"] == "completed"
+
     @pytest.mark.asyncio
     async def test_list_sessions_includes_custom_id(self, custom_id_session, tmp_agent_dir):
         session_id, session_dir, state = custom_id_session
@@ -1696,10 +1733,34 @@ def test_events_route_does_not_pass_event_param(self):
         from framework.server import routes_events
 
         source = inspect.getsource(routes_events.handle_events)
-        # Should NOT contain send_event(data, event=...)
-        assert "send_event(data," not in source
-        # Should contain the simple call
-        assert "send_event(data)" in source
+        calls = [line for line in source.splitlines() if "send_event(data" in line]
+        assert calls
+        # Should NOT pass an SSE event name; the frontend dispatches on data.type
+        assert not any("event=" in line for line in calls)
+
+    @pytest.mark.asyncio
+    async def test_events_carry_seq_as_sse_id(self):
+        from framework.runtime.event_bus import AgentEvent, EventBus, EventType
+
+        session = _make_session()
+        session.event_bus = EventBus()
+        for i in range(3):
+            await session.event_bus.publish(
+                AgentEvent(type=EventType.NODE_RETRY, stream_id="worker", data={"n": i})
+            )
+        app = _make_app_with_session(session)
+
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get(
+                "/api/sessions/test_agent/events",
+                params={"types": "node_retry"},
+                headers={"Last-Event-ID": "1"},
+            )
+            assert resp.status == 200
+            lines = [(await resp.content.readline()).decode().strip() for _ in range(6)]
+            resp.close()
+
+        assert [line for line in lines if line.startswith("id:")] == ["id: 2", "id: 3"]
 
 
 class TestErrorMiddleware:
@@ -1,7 +1,8 @@
 """Skill catalog — in-memory index with system prompt generation.
 
 Builds the XML catalog injected into the system prompt for model-driven
-skill activation per the Agent Skills standard.
+skill activation per the Agent Skills standard.  Large catalogs can be
+narrowed to the skills most relevant to a task (see ``SkillIndex``).
 """
 
 from __future__ import annotations
@@ -9,6 +10,7 @@
 import logging
 from xml.sax.saxutils import escape
 
+from framework.skills.index import SkillIndex
 from framework.skills.parser import ParsedSkill
 from framework.skills.skill_errors import SkillErrorCode, log_skill_error
 
@@ -29,6 +31,7 @@ class SkillCatalog:
     def __init__(self, skills: list[ParsedSkill] | None = None):
         self._skills: dict[str, ParsedSkill] = {}
         self._activated: set[str] = set()
+        self._index: SkillIndex | None = None
         if skills:
             for skill in skills:
                 self.add(skill)
@@ -36,6 +39,7 @@ def __init__(self, skills: list[ParsedSkill] | None = None):
     def add(self, skill: ParsedSkill) -> None:
         """Add a skill to the catalog."""
         self._skills[skill.name] = skill
+        self._index = None
 
     def get(self, name: str) -> ParsedSkill | None:
         """Look up a skill by name."""
@@ -53,16 +57,28 @@ def is_activated(self, name: str) -> bool:
     def skill_count(self) -> int:
         return len(self._skills)
 
+    @property
+    def community_skill_count(self) -> int:
+        """Skills listed by ``to_prompt`` (all but framework defaults)."""
+        return sum(1 for s in self._skills.values() if s.source_scope != "framework")
+
     @property
     def allowlisted_dirs(self) -> list[str]:
         """All skill base directories for file access allowlisting."""
         return [skill.base_dir for skill in self._skills.values()]
 
-    def to_prompt(self) -> str:
+    def to_prompt(self, query: str | None = None, top_k: int | None = None) -> str:
         """Generate the catalog prompt for system prompt injection.
 
         Returns empty string if no community/user skills are discovered
         (default skills are handled separately by DefaultSkillManager).
+
+        Args:
+            query: Task text to rank skills against.
+            top_k: With *query*, list at most this many skills — those most
+                relevant to the task.  Catalogs no larger than *top_k* are
+                listed in full.  If no skill matches the task at all, the
+                first *top_k* by name are listed instead.
         """
         # Filter out framework-scope skills (default skills) — they're
         # injected via the protocols prompt, not the catalog
@@ -71,6 +87,24 @@ def to_prompt(self) -> str:
         if not community_skills:
             return ""
 
+        instruction = _BEHAVIORAL_INSTRUCTION
+        if query is not None and top_k is not None and len(community_skills) > top_k:
+            if self._index is None:
+                self._index = SkillIndex(community_skills)
+            total = len(community_skills)
+            ranked = self._index.search(query, top_k)
+            if ranked:
+                community_skills = ranked
+                note = (
+                    f"Only the {len(ranked)} of {total} installed skills most relevant "
+                    "to the current task are listed."
+                )
+            else:
+                # Nothing matched the task's wording; still show a catalog
+                community_skills = sorted(community_skills, key=lambda s: s.name)[:top_k]
+                note = f"Only {top_k} of {total} installed skills are listed."
+            instruction = f"{instruction}\n{note}"
+
         lines = ["<available_skills>"]
         for skill in sorted(community_skills, key=lambda s: s.name):
             lines.append("  <skill>")
@@ -82,7 +116,7 @@ def to_prompt(self) -> str:
         lines.append("</available_skills>")
 
         xml_block = "\n".join(lines)
-        return f"{_BEHAVIORAL_INSTRUCTION}\n\n{xml_block}"
+        return f"{instruction}\n\n{xml_block}"
 
     def build_pre_activated_prompt(self, skill_names: list[str]) -> str:
         """Build prompt content for pre-activated skills.
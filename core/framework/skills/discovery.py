@@ -1,15 +1,24 @@
 """Skill discovery — scan standard directories for SKILL.md files.
 
 Implements the Agent Skills standard discovery paths plus Hive-specific
-locations. Resolves name collisions deterministically.
+locations. Resolves name collisions deterministically.  With
+``DiscoveryConfig.cache_dir`` set, unchanged scopes and files are served
+from a :class:`~framework.skills.discovery_cache.SkillDiscoveryCache`.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
+from framework.skills.discovery_cache import (
+    CachedSkillFile,
+    ScopeCacheEntry,
+    SkillDiscoveryCache,
+    file_digest,
+)
 from framework.skills.parser import ParsedSkill, parse_skill_md
 from framework.skills.skill_errors import SkillErrorCode, log_skill_error
 
@@ -49,6 +58,7 @@ class DiscoveryConfig:
     skip_framework_scope: bool = False
     max_depth: int = 4
     max_dirs: int = 2000
+    cache_dir: Path | None = None
 
 
 class SkillDiscovery:
@@ -56,6 +66,9 @@ class SkillDiscovery:
 
     def __init__(self, config: DiscoveryConfig | None = None):
         self._config = config or DiscoveryConfig()
+        self._cache = (
+            SkillDiscoveryCache(self._config.cache_dir) if self._config.cache_dir else None
+        )
 
     def discover(self) -> list[ParsedSkill]:
         """Scan all scopes and return deduplicated skill list.
@@ -116,33 +129,92 @@ def discover(self) -> list[ParsedSkill]:
 
     def _scan_scope(self, root: Path, scope: str) -> list[ParsedSkill]:
         """Scan a single directory for skill directories containing SKILL.md."""
-        skills: list[ParsedSkill] = []
-        dirs_scanned = 0
-
-        for skill_md in self._find_skill_files(root, depth=0):
-            if dirs_scanned >= self._config.max_dirs:
-                logger.warning(
-                    "Hit max directory limit (%d) scanning %s",
-                    self._config.max_dirs,
-                    root,
-                )
-                break
+        if self._cache is not None:
+            return self._scan_scope_cached(root, scope, self._cache)
 
+        skills: list[ParsedSkill] = []
+        for skill_md in self._limit(self._find_skill_files(root, depth=0), root):
             parsed = parse_skill_md(skill_md, source_scope=scope)
             if parsed is not None:
                 skills.append(parsed)
-            dirs_scanned += 1
 
         return skills
 
-    def _find_skill_files(self, directory: Path, depth: int) -> list[Path]:
-        """Recursively find SKILL.md files up to max_depth."""
+    def _scan_scope_cached(
+        self, root: Path, scope: str, cache: SkillDiscoveryCache
+    ) -> list[ParsedSkill]:
+        """``_scan_scope`` reusing the previous scan where nothing changed."""
+        max_depth = self._config.max_depth
+        previous = cache.get(root, scope, max_depth) or ScopeCacheEntry()
+        current = ScopeCacheEntry()
+
+        if previous.files and previous.tree_unchanged():
+            current.dir_mtimes = previous.dir_mtimes
+            skill_files = [Path(p) for p in previous.files]
+        else:
+            skill_files = self._find_skill_files(root, depth=0, dir_mtimes=current.dir_mtimes)
+
+        skills: list[ParsedSkill] = []
+        changed = current.dir_mtimes is not previous.dir_mtimes
+        for skill_md in self._limit(skill_files, root):
+            key = str(skill_md)
+            cached = previous.files.get(key)
+            try:
+                st = os.stat(skill_md)
+                if cached and (cached.size, cached.mtime_ns) == (st.st_size, st.st_mtime_ns):
+                    current.files[key] = cached
+                    skills.append(cached.skill)
+                    continue
+                digest = file_digest(skill_md.read_bytes())
+            except OSError:
+                # Removed since the directory listing was recorded: rescan next time
+                current.dir_mtimes = {}
+                changed = True
+                continue
+
+            changed = True
+            if cached and cached.sha256 == digest:
+                parsed = cached.skill
+            else:
+                parsed = parse_skill_md(skill_md, source_scope=scope)
+            if parsed is None:
+                # Not cached, so walk again next time to pick up a fix
+                current.dir_mtimes = {}
+                continue
+            current.files[key] = CachedSkillFile(
+                size=st.st_size, mtime_ns=st.st_mtime_ns, sha256=digest, skill=parsed
+            )
+            skills.append(parsed)
+
+        if changed or len(current.files) != len(previous.files):
+            cache.put(root, scope, max_depth, current)
+        return skills
+
+    def _limit(self, skill_files: list[Path], root: Path) -> list[Path]:
+        if len(skill_files) > self._config.max_dirs:
+            logger.warning(
+                "Hit max directory limit (%d) scanning %s",
+                self._config.max_dirs,
+                root,
+            )
+            return skill_files[: self._config.max_dirs]
+        return skill_files
+
+    def _find_skill_files(
+        self, directory: Path, depth: int, dir_mtimes: dict[str, int] | None = None
+    ) -> list[Path]:
+        """Recursively find SKILL.md files up to max_depth.
+
+        When *dir_mtimes* is given, records the mtime of each listed directory.
+        """
         if depth > self._config.max_depth:
             return []
 
         results: list[Path] = []
 
         try:
+            if dir_mtimes is not None:
+                dir_mtimes[str(directory)] = directory.stat().st_mtime_ns
             entries = sorted(directory.iterdir())
         except OSError:
             return []
@@ -158,7 +230,7 @@ def _find_skill_files(self, directory: Path, depth: int) -> list[Path]:
                 results.append(skill_md)
             else:
                 # Recurse into subdirectories
-                results.extend(self._find_skill_files(entry, depth + 1))
+                results.extend(self._find_skill_files(entry, depth + 1, dir_mtimes))
 
         return results
 
@@ -0,0 +1,141 @@
+"""Skill discovery cache — persists scanned scopes across processes.
+
+``SkillDiscovery`` walks every scope directory and parses each SKILL.md
+(read + YAML) on every ``SkillsManager.load()``.  With a cache directory
+configured, each scope root gets one JSON entry recording:
+
+- the mtime of every directory the walk listed.  Adding or removing a
+  skill directory changes its parent's mtime, so when none changed the
+  walk is skipped and the recorded SKILL.md paths are reused;
+- per SKILL.md, its size, mtime and sha256 plus the parsed skill.  A
+  file whose size and mtime match is not read at all; one that was only
+  touched (same hash) is not re-parsed.
+
+Parse failures are not cached, so their errors are logged on every load
+until the file is fixed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from framework.skills.parser import ParsedSkill
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout or ParsedSkill fields change
+_FORMAT_VERSION = 1
+
+
+@dataclass
+class CachedSkillFile:
+    """One SKILL.md as of the last scan."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    skill: ParsedSkill
+
+
+@dataclass
+class ScopeCacheEntry:
+    """Everything recorded for one scanned scope root."""
+
+    dir_mtimes: dict[str, int] = field(default_factory=dict)
+    files: dict[str, CachedSkillFile] = field(default_factory=dict)
+
+    def tree_unchanged(self) -> bool:
+        """True if no listed directory was modified (or removed) since the scan."""
+        for path, mtime_ns in self.dir_mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class SkillDiscoveryCache:
+    """On-disk cache of skill scans, one JSON file per scope root.
+
+    Args:
+        cache_dir: Directory holding the entries.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, root: Path, scope: str, max_depth: int) -> Path:
+        key = f"{root.resolve()}\0{scope}\0{max_depth}"
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, root: Path, scope: str, max_depth: int) -> ScopeCacheEntry | None:
+        """Return the recorded scan of *root*, if any."""
+        path = self._path(root, scope, max_depth)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Unreadable skill discovery cache entry %s: %s", path, e)
+            return None
+        if data.get("format") != _FORMAT_VERSION:
+            return None
+        try:
+            return ScopeCacheEntry(
+                dir_mtimes={p: int(m) for p, m in data["dirs"].items()},
+                files={
+                    p: CachedSkillFile(
+                        size=f["size"],
+                        mtime_ns=f["mtime_ns"],
+                        sha256=f["sha256"],
+                        skill=ParsedSkill(**f["skill"]),
+                    )
+                    for p, f in data["files"].items()
+                },
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug("Malformed skill discovery cache entry %s: %s", path, e)
+            return None
+
+    def put(self, root: Path, scope: str, max_depth: int, entry: ScopeCacheEntry) -> None:
+        """Persist *entry* for *root* (atomically; errors are logged, not raised)."""
+        path = self._path(root, scope, max_depth)
+        data: dict[str, Any] = {
+            "format": _FORMAT_VERSION,
+            "root": str(root),
+            "scope": scope,
+            "dirs": entry.dir_mtimes,
+            "files": {
+                p: {
+                    "size": f.size,
+                    "mtime_ns": f.mtime_ns,
+                    "sha256": f.sha256,
+                    "skill": asdict(f.skill),
+                }
+                for p, f in entry.files.items()
+            },
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".entry.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not persist skill discovery cache entry %s: %s", path, e)
@@ -0,0 +1,101 @@
+"""Skill index — BM25 relevance ranking over the skill catalog.
+
+Injecting every discovered skill into every system prompt makes prompt
+size grow with the skill library.  ``SkillIndex`` ranks skills against a
+node's task so the catalog can list only the most relevant ones.
+
+Each skill is indexed as one document built from its name, description
+and SKILL.md body.  Name and description tokens are repeated so a match
+there outweighs a passing mention in the body.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+
+from framework.skills.parser import ParsedSkill
+
+# Term-frequency saturation and length normalisation (standard BM25 values)
+_K1 = 1.2
+_B = 0.75
+
+# Field weights: how many times each field's tokens are counted
+_NAME_WEIGHT = 3
+_DESCRIPTION_WEIGHT = 2
+
+# Body text indexed per skill; long references add noise, not signal
+_MAX_BODY_CHARS = 4000
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or that the this "
+    "to use used uses using when which with you your".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens, minus stopwords and single characters."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS]
+
+
+class SkillIndex:
+    """BM25 index over a fixed set of skills."""
+
+    def __init__(self, skills: list[ParsedSkill]):
+        self._skills = list(skills)
+        self._term_freqs: list[Counter[str]] = []
+        self._lengths: list[int] = []
+        doc_freq: Counter[str] = Counter()
+
+        for skill in self._skills:
+            tokens = (
+                tokenize(skill.name) * _NAME_WEIGHT
+                + tokenize(skill.description) * _DESCRIPTION_WEIGHT
+                + tokenize(skill.body[:_MAX_BODY_CHARS])
+            )
+            freqs = Counter(tokens)
+            self._term_freqs.append(freqs)
+            self._lengths.append(len(tokens))
+            doc_freq.update(freqs.keys())
+
+        n = len(self._skills)
+        self._avg_length = (sum(self._lengths) / n) if n else 0.0
+        self._idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def score(self, query: str) -> list[float]:
+        """BM25 score of every skill (in index order) for *query*."""
+        terms = [t for t in set(tokenize(query)) if t in self._idf]
+        scores = [0.0] * len(self._skills)
+        if not terms:
+            return scores
+        for i, freqs in enumerate(self._term_freqs):
+            norm = _K1 * (1 - _B + _B * self._lengths[i] / (self._avg_length or 1.0))
+            total = 0.0
+            for term in terms:
+                tf = freqs.get(term)
+                if tf:
+                    total += self._idf[term] * tf * (_K1 + 1) / (tf + norm)
+            scores[i] = total
+        return scores
+
+    def search(self, query: str, k: int) -> list[ParsedSkill]:
+        """The *k* skills most relevant to *query*, best first.
+
+        Skills that match no query term are left out, so fewer than *k*
+        may be returned.  Ties are broken by name for stable prompts.
+        """
+        scored = [
+            (score, skill)
+            for score, skill in zip(self.score(query), self._skills, strict=True)
+            if score > 0
+        ]
+        scored.sort(key=lambda pair: (-pair[0], pair[1].name))
+        return [skill for _, skill in scored[:k]]
@@ -15,6 +15,10 @@
     print(mgr.protocols_prompt)       # default skill protocols
     print(mgr.skills_catalog_prompt)  # community skills XML
 
+With ``catalog_top_k`` set, large catalogs are narrowed per node:
+``catalog_prompt_for(task)`` lists only the skills most relevant to the
+task, keeping prompt size flat as the skill library grows.
+
 Typical usage — **bare** (exported agents, SDK users)::
 
     mgr = SkillsManager()   # default config
@@ -24,11 +28,16 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from framework.skills.config import SkillsConfig
 
+if TYPE_CHECKING:
+    from framework.skills.catalog import SkillCatalog
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,12 +53,19 @@ class SkillsManagerConfig:
             even when ``project_root`` is set.
         interactive: Whether trust gating can prompt the user interactively.
             When ``False``, untrusted project skills are silently skipped.
+        discovery_cache_dir: Where to persist discovery scans between
+            processes.  When ``None``, every load rescans and reparses.
+        catalog_top_k: Most community skills listed in a node's catalog,
+            ranked by relevance to the node's task.  When ``None``, every
+            node gets the full catalog.
     """
 
     skills_config: SkillsConfig = field(default_factory=SkillsConfig)
     project_root: Path | None = None
     skip_community_discovery: bool = False
     interactive: bool = True
+    discovery_cache_dir: Path | None = None
+    catalog_top_k: int | None = None
 
 
 class SkillsManager:
@@ -67,6 +83,9 @@ def __init__(self, config: SkillsManagerConfig | None = None) -> None:
         self._catalog_prompt: str = ""
         self._protocols_prompt: str = ""
         self._allowlisted_dirs: list[str] = []
+        self._catalog: SkillCatalog | None = None
+        self._pre_activated_prompt: str = ""
+        self._task_prompts: dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # Factory for backwards-compat bridge
@@ -90,6 +109,9 @@ def from_precomputed(
         mgr._catalog_prompt = skills_catalog_prompt
         mgr._protocols_prompt = protocols_prompt
         mgr._allowlisted_dirs = []
+        mgr._catalog = None
+        mgr._pre_activated_prompt = ""
+        mgr._task_prompts = {}
         return mgr
 
     # ------------------------------------------------------------------
@@ -120,7 +142,12 @@ def _do_load(self) -> None:
         if self._config.project_root is not None and not self._config.skip_community_discovery:
             from framework.skills.trust import TrustGate
 
-            discovery = SkillDiscovery(DiscoveryConfig(project_root=self._config.project_root))
+            discovery = SkillDiscovery(
+                DiscoveryConfig(
+                    project_root=self._config.project_root,
+                    cache_dir=self._config.discovery_cache_dir,
+                )
+            )
             discovered = discovery.discover()
 
             # Trust-gate project-scope skills (AS-13)
@@ -129,12 +156,14 @@ def _do_load(self) -> None:
             )
 
             catalog = SkillCatalog(discovered)
+            self._catalog = catalog
             self._allowlisted_dirs = catalog.allowlisted_dirs
             catalog_prompt = catalog.to_prompt()
 
             # Pre-activated community skills
             if skills_config.skills:
                 pre_activated = catalog.build_pre_activated_prompt(skills_config.skills)
+                self._pre_activated_prompt = pre_activated
                 if pre_activated:
                     if catalog_prompt:
                         catalog_prompt = f"{catalog_prompt}\n\n{pre_activated}"
@@ -179,6 +208,43 @@ def skills_catalog_prompt(self) -> str:
         """Community skills XML catalog for system prompt injection."""
         return self._catalog_prompt
 
+    @property
+    def ranks_catalog(self) -> bool:
+        """Whether nodes get a task-specific catalog (see ``catalog_prompt_for``)."""
+        top_k = self._config.catalog_top_k
+        if self._catalog is None or top_k is None:
+            return False
+        # Small catalogs are listed in full anyway
+        return self._catalog.community_skill_count > top_k
+
+    @property
+    def catalog_provider(self) -> Callable[[str], str] | None:
+        """``catalog_prompt_for`` when catalogs are ranked per node, else None."""
+        return self.catalog_prompt_for if self.ranks_catalog else None
+
+    def catalog_prompt_for(self, task: str) -> str:
+        """Skills catalog listing only the skills most relevant to *task*.
+
+        Pre-activated skills are always included.  Falls back to the full
+        catalog when ranking is off.
+        """
+        if not self.ranks_catalog:
+            return self._catalog_prompt
+        cached = self._task_prompts.get(task)
+        if cached is not None:
+            return cached
+
+        prompt = self._catalog.to_prompt(query=task, top_k=self._config.catalog_top_k)
+        if self._pre_activated_prompt:
+            prompt = (
+                f"{prompt}\n\n{self._pre_activated_prompt}"
+                if prompt
+                else self._pre_activated_prompt
+            )
+        if len(self._task_prompts) < 256:
+            self._task_prompts[task] = prompt
+        return prompt
+
     @property
     def protocols_prompt(self) -> str:
         """Default skill operational protocols for system prompt injection."""
@@ -1,6 +1,15 @@
 """Storage backends for runtime data."""
 
 from framework.storage.concurrent import ConcurrentStorage
-from framework.storage.conversation_store import FileConversationStore
+from framework.storage.conversation_store import FileConversationStore, open_conversation_store
+from framework.storage.segmented_conversation_store import SegmentedConversationStore
+from framework.storage.sqlite_store import SQLiteConversationStore, SQLiteSessionStore
 
-__all__ = ["ConcurrentStorage", "FileConversationStore"]
+__all__ = [
+    "ConcurrentStorage",
+    "FileConversationStore",
+    "SegmentedConversationStore",
+    "SQLiteConversationStore",
+    "SQLiteSessionStore",
+    "open_conversation_store",
+]
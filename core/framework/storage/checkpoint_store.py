@@ -3,12 +3,21 @@
 
 Handles saving, loading, listing, and pruning of execution checkpoints
 for session resumability.
+
+With delta checkpoints enabled, each checkpoint stores only the memory
+keys that changed since the previous one (plus a full base snapshot every
+``full_snapshot_interval`` checkpoints), and the index is an append-only
+JSONL file, so per-node disk writes stay proportional to what changed
+rather than to the total size of memory and checkpoint history.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 from framework.schemas.checkpoint import Checkpoint, CheckpointIndex, CheckpointSummary
 from framework.utils.io import atomic_write
@@ -16,6 +25,15 @@
 logger = logging.getLogger(__name__)
 
 
+def _memory_digest(value: Any) -> str:
+    """Stable digest of a memory value, used to detect changed keys."""
+    try:
+        raw = json.dumps(value, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        raw = repr(value)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
 class CheckpointStore:
     """
     Manages checkpoint storage with atomic writes.
@@ -25,22 +43,45 @@ class CheckpointStore:
 
     Directory structure:
         checkpoints/
-            index.json              # Checkpoint manifest
+            index.jsonl             # Append-only checkpoint manifest
             cp_{type}_{node}_{timestamp}.json  # Individual checkpoints
+
+    Legacy ``index.json`` manifests are still read and are converted to
+    ``index.jsonl`` on the next write.
     """
 
-    def __init__(self, base_path: Path):
+    def __init__(
+        self,
+        base_path: Path,
+        delta_checkpoints: bool = False,
+        full_snapshot_interval: int = 10,
+    ):
         """
         Initialize checkpoint store.
 
         Args:
             base_path: Session directory (e.g., ~/.hive/agents/agent_name/sessions/session_ID/)
+            delta_checkpoints: Store only memory keys changed since the
+                previous checkpoint saved through this store
+            full_snapshot_interval: Write a full snapshot every N checkpoints
+                (bounds the parent chain walked on load)
         """
         self.base_path = Path(base_path)
         self.checkpoints_dir = self.base_path / "checkpoints"
-        self.index_path = self.checkpoints_dir / "index.json"
+        self.index_path = self.checkpoints_dir / "index.jsonl"
+        self.legacy_index_path = self.checkpoints_dir / "index.json"
         self._index_lock = asyncio.Lock()
 
+        self.delta_checkpoints = delta_checkpoints
+        self.full_snapshot_interval = max(1, full_snapshot_interval)
+        self.bytes_written = 0  # checkpoint + index bytes written by this store
+
+        # Delta chain state: digests of the last checkpoint saved here
+        self._last_checkpoint_id: str | None = None
+        self._last_digests: dict[str, str] = {}
+        self._deltas_since_full = 0
+        self._saved_ids: set[str] = set()
+
     async def save_checkpoint(self, checkpoint: Checkpoint) -> None:
         """
         Atomically save checkpoint and update index.
@@ -48,30 +89,81 @@ async def save_checkpoint(self, checkpoint: Checkpoint) -> None:
         Uses temp file + rename for crash safety. Updates index
         after checkpoint is persisted.
 
+        With delta checkpoints enabled the delta is computed before the
+        first await, so saves scheduled with ``asyncio.create_task`` chain
+        in call order.  A checkpoint ID already saved by this store gets a
+        numeric suffix (``checkpoint.checkpoint_id`` is updated) so a
+        parent is never overwritten by its descendant.
+
         Args:
             checkpoint: Checkpoint to save
 
         Raises:
             OSError: If file write fails
         """
+        record = self._prepare_record(checkpoint)
 
-        def _write():
+        def _write() -> int:
             # Ensure directory exists
             self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
 
             # Write checkpoint file atomically
-            checkpoint_path = self.checkpoints_dir / f"{checkpoint.checkpoint_id}.json"
+            payload = record.model_dump_json()
+            checkpoint_path = self.checkpoints_dir / f"{record.checkpoint_id}.json"
             with atomic_write(checkpoint_path) as f:
-                f.write(checkpoint.model_dump_json(indent=2))
+                f.write(payload)
 
-            logger.debug(f"Saved checkpoint {checkpoint.checkpoint_id}")
+            logger.debug(f"Saved checkpoint {record.checkpoint_id}")
+            return len(payload.encode("utf-8"))
 
         # Write checkpoint file (blocking I/O in thread)
-        await asyncio.to_thread(_write)
+        try:
+            self.bytes_written += await asyncio.to_thread(_write)
+        except BaseException:
+            # The next checkpoint must not chain onto a file that never landed
+            self._last_checkpoint_id = None
+            raise
 
         # Update index (with lock to prevent concurrent modifications)
         async with self._index_lock:
-            await self._update_index_add(checkpoint)
+            await self._update_index_add(record)
+
+    def _prepare_record(self, checkpoint: Checkpoint) -> Checkpoint:
+        """Return the on-disk form of *checkpoint* (a delta when possible)."""
+        if not self.delta_checkpoints:
+            return checkpoint
+
+        if checkpoint.checkpoint_id in self._saved_ids:
+            base_id = checkpoint.checkpoint_id
+            n = 2
+            while f"{base_id}_{n}" in self._saved_ids:
+                n += 1
+            checkpoint.checkpoint_id = f"{base_id}_{n}"
+        self._saved_ids.add(checkpoint.checkpoint_id)
+
+        digests = {k: _memory_digest(v) for k, v in checkpoint.shared_memory.items()}
+        parent_id = self._last_checkpoint_id
+        previous = self._last_digests
+        self._last_checkpoint_id = checkpoint.checkpoint_id
+        self._last_digests = digests
+
+        if parent_id is None or self._deltas_since_full + 1 >= self.full_snapshot_interval:
+            self._deltas_since_full = 0
+            return checkpoint
+
+        self._deltas_since_full += 1
+        return checkpoint.model_copy(
+            update={
+                "is_delta": True,
+                "parent_checkpoint_id": parent_id,
+                "shared_memory": {
+                    k: v
+                    for k, v in checkpoint.shared_memory.items()
+                    if previous.get(k) != digests[k]
+                },
+                "deleted_memory_keys": sorted(set(previous) - set(digests)),
+            }
+        )
 
     async def load_checkpoint(
         self,
@@ -87,19 +179,6 @@ async def load_checkpoint(
             Checkpoint object, or None if not found
         """
 
-        def _read(checkpoint_id: str) -> Checkpoint | None:
-            checkpoint_path = self.checkpoints_dir / f"{checkpoint_id}.json"
-
-            if not checkpoint_path.exists():
-                logger.warning(f"Checkpoint file not found: {checkpoint_path}")
-                return None
-
-            try:
-                return Checkpoint.model_validate_json(checkpoint_path.read_text(encoding="utf-8"))
-            except Exception as e:
-                logger.error(f"Failed to load checkpoint {checkpoint_id}: {e}")
-                return None
-
         # Load index to get checkpoint ID if not provided
         if checkpoint_id is None:
             index = await self.load_index()
@@ -108,7 +187,58 @@ def _read(checkpoint_id: str) -> Checkpoint | None:
                 return None
             checkpoint_id = index.latest_checkpoint_id
 
-        return await asyncio.to_thread(_read, checkpoint_id)
+        return await asyncio.to_thread(self.load_checkpoint_sync, checkpoint_id)
+
+    def load_checkpoint_sync(self, checkpoint_id: str) -> Checkpoint | None:
+        """Synchronous :meth:`load_checkpoint` for a specific ID (delta chains resolved)."""
+        return self._load_full_checkpoint(checkpoint_id)
+
+    def load_index_sync(self) -> CheckpointIndex | None:
+        """Synchronous :meth:`load_index`."""
+        return self._read_index()[0]
+
+    def _read_checkpoint_file(self, checkpoint_id: str) -> Checkpoint | None:
+        checkpoint_path = self.checkpoints_dir / f"{checkpoint_id}.json"
+
+        if not checkpoint_path.exists():
+            logger.warning(f"Checkpoint file not found: {checkpoint_path}")
+            return None
+
+        try:
+            return Checkpoint.model_validate_json(checkpoint_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.error(f"Failed to load checkpoint {checkpoint_id}: {e}")
+            return None
+
+    def _load_full_checkpoint(self, checkpoint_id: str) -> Checkpoint | None:
+        """Read a checkpoint and rebuild its full memory from the delta chain."""
+        checkpoint = self._read_checkpoint_file(checkpoint_id)
+        if checkpoint is None or not checkpoint.is_delta:
+            return checkpoint
+
+        chain = [checkpoint]
+        seen = {checkpoint.checkpoint_id}
+        while chain[-1].is_delta:
+            parent_id = chain[-1].parent_checkpoint_id
+            if parent_id is None or parent_id in seen:
+                logger.error(f"Broken delta chain for checkpoint {checkpoint_id} at {parent_id}")
+                return None
+            parent = self._read_checkpoint_file(parent_id)
+            if parent is None:
+                logger.error(f"Missing parent {parent_id} of delta checkpoint {checkpoint_id}")
+                return None
+            seen.add(parent_id)
+            chain.append(parent)
+
+        memory = dict(chain[-1].shared_memory)
+        for delta in reversed(chain[:-1]):
+            for key in delta.deleted_memory_keys:
+                memory.pop(key, None)
+            memory.update(delta.shared_memory)
+
+        return checkpoint.model_copy(
+            update={"shared_memory": memory, "is_delta": False, "deleted_memory_keys": []}
+        )
 
     async def load_index(self) -> CheckpointIndex | None:
         """
@@ -118,19 +248,95 @@ async def load_index(self) -> CheckpointIndex | None:
             CheckpointIndex or None if not found
         """
 
-        def _read() -> CheckpointIndex | None:
-            if not self.index_path.exists():
-                return None
+        return await asyncio.to_thread(self.load_index_sync)
+
+    def _read_index(self) -> tuple[CheckpointIndex | None, int]:
+        """
+        Replay ``index.jsonl`` (or read a legacy ``index.json``).
 
+        Returns:
+            (index, number of removal records seen)
+        """
+        if not self.index_path.exists():
+            if not self.legacy_index_path.exists():
+                return None, 0
             try:
-                return CheckpointIndex.model_validate_json(
-                    self.index_path.read_text(encoding="utf-8")
+                return (
+                    CheckpointIndex.model_validate_json(
+                        self.legacy_index_path.read_text(encoding="utf-8")
+                    ),
+                    0,
                 )
             except Exception as e:
                 logger.error(f"Failed to load checkpoint index: {e}")
-                return None
-
-        return await asyncio.to_thread(_read)
+                return None, 0
+
+        session_id = ""
+        entries: dict[str, CheckpointSummary] = {}
+        removed = 0
+        try:
+            lines = self.index_path.read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            logger.error(f"Failed to load checkpoint index: {e}")
+            return None, 0
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if "removed" in record:
+                    entries.pop(record["removed"], None)
+                    removed += 1
+                elif "update" in record:
+                    summary = CheckpointSummary.model_validate(record["update"])
+                    if summary.checkpoint_id in entries:
+                        entries[summary.checkpoint_id] = summary
+                elif "checkpoint_id" in record:
+                    summary = CheckpointSummary.model_validate(record)
+                    # Re-adding an ID (legacy overwrite) moves it to the end
+                    entries.pop(summary.checkpoint_id, None)
+                    entries[summary.checkpoint_id] = summary
+                else:
+                    session_id = record.get("session_id", session_id)
+            except Exception:
+                # A torn trailing line from a crash mid-append
+                logger.warning(f"Skipping malformed line in {self.index_path}")
+                continue
+
+        checkpoints = list(entries.values())
+        return (
+            CheckpointIndex(
+                session_id=session_id,
+                checkpoints=checkpoints,
+                latest_checkpoint_id=checkpoints[-1].checkpoint_id if checkpoints else None,
+                total_checkpoints=len(checkpoints),
+            ),
+            removed,
+        )
+
+    def _append_index_lines(self, records: list[dict[str, Any]]) -> None:
+        """Append records to ``index.jsonl``, converting a legacy index first."""
+        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        if not self.index_path.exists() and self.legacy_index_path.exists():
+            legacy, _ = self._read_index()
+            if legacy is not None:
+                self._rewrite_index(legacy)
+            self.legacy_index_path.unlink(missing_ok=True)
+
+        data = "".join(json.dumps(r) + "\n" for r in records)
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(data)
+        self.bytes_written += len(data.encode("utf-8"))
+
+    def _rewrite_index(self, index: CheckpointIndex) -> None:
+        """Atomically rewrite ``index.jsonl`` without removal records."""
+        lines = [json.dumps({"session_id": index.session_id})]
+        lines.extend(cp.model_dump_json() for cp in index.checkpoints)
+        data = "\n".join(lines) + "\n"
+        with atomic_write(self.index_path) as f:
+            f.write(data)
+        self.bytes_written += len(data.encode("utf-8"))
 
     async def list_checkpoints(
         self,
@@ -180,6 +386,8 @@ def _delete(checkpoint_id: str) -> bool:
                 logger.warning(f"Checkpoint file not found: {checkpoint_path}")
                 return False
 
+            self._rebase_dependents(checkpoint_id)
+
             try:
                 checkpoint_path.unlink()
                 logger.info(f"Deleted checkpoint {checkpoint_id}")
@@ -228,6 +436,19 @@ async def prune_checkpoints(
             except Exception as e:
                 logger.warning(f"Failed to parse timestamp for {cp.checkpoint_id}: {e}")
 
+        # Keep old checkpoints that retained delta checkpoints are built on
+        parents = {cp.checkpoint_id: cp.parent_checkpoint_id for cp in index.checkpoints}
+        old = set(old_checkpoints)
+        needed: set[str] = set()
+        for cp in index.checkpoints:
+            if cp.checkpoint_id in old:
+                continue
+            parent = parents.get(cp.checkpoint_id)
+            while parent and parent not in needed:
+                needed.add(parent)
+                parent = parents.get(parent)
+        old_checkpoints = [cp_id for cp_id in old_checkpoints if cp_id not in needed]
+
         # Delete old checkpoints
         deleted_count = 0
         for checkpoint_id in old_checkpoints:
@@ -256,37 +477,44 @@ def _check(checkpoint_id: str) -> bool:
 
         return await asyncio.to_thread(_check, checkpoint_id)
 
+    def _rebase_dependents(self, checkpoint_id: str) -> None:
+        """Rewrite deltas whose parent is *checkpoint_id* as full snapshots."""
+        index, _ = self._read_index()
+        if index is None:
+            return
+        for summary in index.checkpoints:
+            if summary.parent_checkpoint_id != checkpoint_id or not summary.is_delta:
+                continue
+            full = self._load_full_checkpoint(summary.checkpoint_id)
+            if full is None:
+                continue
+            full = full.model_copy(update={"parent_checkpoint_id": None})
+            with atomic_write(self.checkpoints_dir / f"{full.checkpoint_id}.json") as f:
+                f.write(full.model_dump_json())
+            self._append_index_lines(
+                [{"update": CheckpointSummary.from_checkpoint(full).model_dump(mode="json")}]
+            )
+            logger.debug(f"Rebased delta checkpoint {full.checkpoint_id} to a full snapshot")
+
     async def _update_index_add(self, checkpoint: Checkpoint) -> None:
         """
         Update index after adding a checkpoint.
 
+        Appends one summary line; the index is never rewritten on add.
         Should be called with _index_lock held.
 
         Args:
             checkpoint: Checkpoint that was added
         """
 
-        def _write(index: CheckpointIndex):
-            # Ensure directory exists
-            self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
-
-            # Write index atomically
-            with atomic_write(self.index_path) as f:
-                f.write(index.model_dump_json(indent=2))
-
-        # Load or create index
-        index = await self.load_index()
-        if not index:
-            index = CheckpointIndex(
-                session_id=checkpoint.session_id,
-                checkpoints=[],
-            )
-
-        # Add checkpoint to index
-        index.add_checkpoint(checkpoint)
+        def _write():
+            records: list[dict[str, Any]] = []
+            if not self.index_path.exists() and not self.legacy_index_path.exists():
+                records.append({"session_id": checkpoint.session_id})
+            records.append(CheckpointSummary.from_checkpoint(checkpoint).model_dump(mode="json"))
+            self._append_index_lines(records)
 
-        # Write updated index
-        await asyncio.to_thread(_write, index)
+        await asyncio.to_thread(_write)
 
         logger.debug(f"Updated index with checkpoint {checkpoint.checkpoint_id}")
 
@@ -294,34 +522,21 @@ async def _update_index_remove(self, checkpoint_id: str) -> None:
         """
         Update index after removing a checkpoint.
 
-        Should be called with _index_lock held.
+        Appends a removal record, compacting the file once removal records
+        outnumber live entries.  Should be called with _index_lock held.
 
         Args:
             checkpoint_id: Checkpoint ID that was removed
         """
 
-        def _write(index: CheckpointIndex):
-            with atomic_write(self.index_path) as f:
-                f.write(index.model_dump_json(indent=2))
-
-        # Load index
-        index = await self.load_index()
-        if not index:
-            return
-
-        # Remove checkpoint from index
-        index.checkpoints = [cp for cp in index.checkpoints if cp.checkpoint_id != checkpoint_id]
-
-        # Update totals
-        index.total_checkpoints = len(index.checkpoints)
-
-        # Update latest_checkpoint_id if we removed the latest
-        if index.latest_checkpoint_id == checkpoint_id:
-            index.latest_checkpoint_id = (
-                index.checkpoints[-1].checkpoint_id if index.checkpoints else None
-            )
+        def _write():
+            if not self.index_path.exists() and not self.legacy_index_path.exists():
+                return
+            self._append_index_lines([{"removed": checkpoint_id}])
+            index, removed = self._read_index()
+            if index is not None and removed > len(index.checkpoints):
+                self._rewrite_index(index)
 
-        # Write updated index
-        await asyncio.to_thread(_write, index)
+        await asyncio.to_thread(_write)
 
         logger.debug(f"Removed checkpoint {checkpoint_id} from index")
@@ -19,12 +19,17 @@
             0000000002.json   (transition marker)
             0000000003.json   (phase_id=node_b)
             ...
+
+:func:`open_conversation_store` picks between this layout, the
+segmented log in :mod:`framework.storage.segmented_conversation_store`
+and the SQLite database in :mod:`framework.storage.sqlite_store`.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import os
 import shutil
 from pathlib import Path
 from typing import Any
@@ -38,6 +43,8 @@ class FileConversationStore:
     non-blocking I/O.
     """
 
+    backend = "file"
+
     def __init__(self, base_path: str | Path) -> None:
         self._base = Path(base_path)
         self._parts_dir = self._base / "parts"
@@ -118,3 +125,106 @@ def _destroy() -> None:
                 shutil.rmtree(self._base)
 
         await self._run(_destroy)
+
+
+# Environment override for the default backend of newly created stores.
+CONVERSATION_STORE_ENV = "HIVE_CONVERSATION_STORE"
+CONVERSATION_STORE_BACKENDS = ("file", "segmented", "sqlite")
+
+
+def open_conversation_store(
+    base_path: str | Path,
+    backend: str | None = None,
+) -> FileConversationStore:
+    """Open the conversation store for *base_path* with the right backend.
+
+    An existing SQLite database or segmented log always wins, so a session
+    keeps the backend it was created with.  Otherwise *backend* (e.g. from a graph's
+    ``loop_config["conversation_store"]``), then ``$HIVE_CONVERSATION_STORE``,
+    then ``"file"`` is used.  Choosing ``"segmented"`` for a directory
+    that still has a ``parts/`` layout migrates it on first access; use
+    :func:`framework.storage.sqlite_store.import_conversation_dir` to move
+    existing data into SQLite.
+    """
+    from framework.storage.segmented_conversation_store import SegmentedConversationStore
+    from framework.storage.sqlite_store import CONVERSATION_DB, SQLiteConversationStore
+
+    base = Path(base_path)
+    if (base / CONVERSATION_DB).exists():
+        return SQLiteConversationStore(base)
+    if (base / "log").is_dir():
+        return SegmentedConversationStore(base)
+
+    backend = backend or os.environ.get(CONVERSATION_STORE_ENV) or "file"
+    if backend == "segmented":
+        return SegmentedConversationStore(base)
+    if backend == "sqlite":
+        return SQLiteConversationStore(base)
+    if backend != "file":
+        raise ValueError(
+            f"Unknown conversation store backend {backend!r}; "
+            f"expected one of {CONVERSATION_STORE_BACKENDS}"
+        )
+    return FileConversationStore(base)
+
+
+def read_conversation_parts(base_path: str | Path) -> list[dict[str, Any]]:
+    """Synchronously read all parts under *base_path*, whichever layout it uses.
+
+    Intended for disk-only listings (cold sessions, message history) that
+    run outside a node.  Each part gets a ``created_at``: the time it was
+    written for segmented logs, otherwise the mtime of its part file (or
+    of the log, for records written before timestamps were recorded).
+    Never migrates on-disk data.
+    """
+    from framework.storage.segmented_conversation_store import SegmentedConversationStore
+    from framework.storage.sqlite_store import CONVERSATION_DB, read_sqlite_conversation_parts
+
+    base = Path(base_path)
+    if (base / CONVERSATION_DB).exists():
+        return read_sqlite_conversation_parts(base)
+
+    log_dir = base / "log"
+    if log_dir.is_dir():
+        try:
+            mtime = log_dir.stat().st_mtime
+        except OSError:
+            return []
+        parts = SegmentedConversationStore(base, migrate=False).read_parts_sync(
+            include_created_at=True
+        )
+        for part in parts:
+            part.setdefault("created_at", mtime)
+        return parts
+
+    parts_dir = base / "parts"
+    if not parts_dir.exists():
+        return []
+    parts = []
+    for part_file in sorted(parts_dir.iterdir()):
+        if part_file.suffix != ".json":
+            continue
+        try:
+            part = json.loads(part_file.read_text(encoding="utf-8"))
+            part.setdefault("created_at", part_file.stat().st_mtime)
+            parts.append(part)
+        except (json.JSONDecodeError, OSError):
+            continue
+    return parts
+
+
+def has_conversation_parts(base_path: str | Path) -> bool:
+    """Cheap check for whether *base_path* holds any message parts."""
+    from framework.storage.sqlite_store import CONVERSATION_DB, read_sqlite_conversation_parts
+
+    base = Path(base_path)
+    try:
+        if (base / CONVERSATION_DB).exists():
+            return bool(read_sqlite_conversation_parts(base, limit=1))
+        log_dir = base / "log"
+        if log_dir.is_dir():
+            return any(f.suffix == ".jsonl" and f.stat().st_size > 0 for f in log_dir.iterdir())
+        parts_dir = base / "parts"
+        return parts_dir.exists() and any(f.suffix == ".json" for f in parts_dir.iterdir())
+    except OSError:
+        return False
@@ -0,0 +1,508 @@
+"""Segmented append-only ConversationStore implementation.
+
+Parts are appended as JSON lines to a small number of segment files
+instead of one file per part.  A binary sidecar index maps every
+record to ``(segment, offset, length)`` so restore reads only the live
+byte ranges and never has to glob or parse dead records.
+
+Directory layout::
+
+    {base_path}/          (typically ``{session}/conversations/``)
+        meta.json         current node config (same as FileConversationStore)
+        cursor.json       iteration counter, accumulator outputs, stall state
+        log/
+            index.bin         append-only fixed-width index records
+            0000000000.jsonl  segment 0: {"seq": N, "created_at": T, "part": {...}} per line
+            0000000001.jsonl  segment 1 (rolled once segment 0 is full)
+            ...
+
+Semantics match :class:`FileConversationStore`: re-writing a seq
+replaces the previous part (last write wins), and
+``delete_parts_before(seq)`` drops every part currently stored with a
+lower seq — parts written afterwards with a lower seq (compaction
+summaries) remain visible.  Deletes are appended as tombstone records;
+once a prefix of the log holds no live parts, whole segments are
+unlinked ("segment truncation") and the index is rewritten without them.
+
+Crash safety: data is appended before its index record, so on open the
+index is reconciled against the segment files — index records pointing
+past the end of a segment are dropped, complete trailing lines that
+never made it into the index are re-indexed, and a torn final line is
+truncated.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from framework.storage.conversation_store import FileConversationStore
+
+logger = logging.getLogger(__name__)
+
+# kind, seq, segment, offset, length
+_INDEX_RECORD = struct.Struct("<BqIQI")
+_PUT = 0
+_DELETE_BEFORE = 1
+
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+
+_IndexRecord = tuple[int, int, int, int, int]
+
+
+def _segment_name(segment: int) -> str:
+    return f"{segment:010d}.jsonl"
+
+
+def _encode_record(
+    kind: int,
+    seq: int,
+    data: dict[str, Any] | None = None,
+    created_at: float | None = None,
+) -> bytes:
+    if kind == _PUT:
+        payload: dict[str, Any] = {"seq": seq, "created_at": created_at, "part": data}
+    else:
+        payload = {"delete_before": seq}
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _decode_record(line: bytes) -> tuple[int, int] | None:
+    """Return ``(kind, seq)`` for a raw log line, or None if unparseable."""
+    try:
+        payload = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if "delete_before" in payload:
+        return _DELETE_BEFORE, int(payload["delete_before"])
+    if "seq" in payload and "part" in payload:
+        return _PUT, int(payload["seq"])
+    return None
+
+
+class SegmentedConversationStore(FileConversationStore):
+    """Segmented append-only ConversationStore with a seq→offset index.
+
+    Meta and cursor handling is inherited from
+    :class:`FileConversationStore`; only message parts use the log.  An
+    existing ``parts/`` directory is migrated into the log the first time
+    the store is touched (disable with ``migrate=False``).
+
+    The in-memory index is revalidated against ``index.bin`` on every
+    operation, so several store instances over the same directory (the
+    executor creates one per node) stay consistent.
+    """
+
+    backend = "segmented"
+
+    def __init__(
+        self,
+        base_path: str | Path,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        migrate: bool = True,
+    ) -> None:
+        super().__init__(base_path)
+        self._log_dir = self._base / "log"
+        self._index_path = self._log_dir / "index.bin"
+        self._segment_bytes = segment_bytes
+        self._migrate = migrate
+
+        self._lock = threading.Lock()
+        self._records: list[_IndexRecord] = []
+        self._live: dict[int, tuple[int, int, int]] = {}
+        self._index_key: tuple[int, int, int] | None = None
+        self._active_segment = 0
+        self._active_size = 0
+        self._segment_fh: BinaryIO | None = None
+        self._index_fh: BinaryIO | None = None
+
+    # --- index state -----------------------------------------------------------
+
+    def _apply(self, record: _IndexRecord) -> None:
+        kind, seq, segment, offset, length = record
+        self._records.append(record)
+        if kind == _PUT:
+            self._live[seq] = (segment, offset, length)
+        else:
+            self._live = {s: loc for s, loc in self._live.items() if s >= seq}
+
+    @staticmethod
+    def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+        # mtime guards against inode reuse after an index rewrite
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _reset_state(self) -> None:
+        self._close_handles()
+        self._records = []
+        self._live = {}
+        self._index_key = None
+        self._active_segment = 0
+        self._active_size = 0
+
+    def _segment_files(self) -> dict[int, Path]:
+        segments: dict[int, Path] = {}
+        for path in self._log_dir.glob("*.jsonl"):
+            try:
+                segments[int(path.stem)] = path
+            except ValueError:
+                continue
+        return segments
+
+    def _sync(self) -> None:
+        """Bring the in-memory index up to date with ``index.bin``.
+
+        Must be called with ``self._lock`` held.  The common case is a
+        single ``stat`` that matches the cached key.
+        """
+        if self._migrate:
+            migrate_file_conversation_store(self._base, self._segment_bytes)
+            self._migrate = False
+
+        try:
+            st = os.stat(self._index_path)
+        except FileNotFoundError:
+            if self._index_key is not None or self._records:
+                self._reset_state()
+            if self._log_dir.exists() and self._segment_files():
+                self._load()
+            return
+
+        key = self._stat_key(st)
+        if key == self._index_key:
+            return
+        if (
+            self._index_key is not None
+            and key[0] == self._index_key[0]
+            and key[1] > self._index_key[1]
+        ):
+            # Another instance appended records — read only the tail.
+            self._close_handles()
+            with open(self._index_path, "rb") as f:
+                f.seek(self._index_key[1])
+                tail = f.read(key[1] - self._index_key[1])
+            usable = len(tail) - len(tail) % _INDEX_RECORD.size
+            for record in _INDEX_RECORD.iter_unpack(tail[:usable]):
+                self._apply(record)
+            self._index_key = (key[0], self._index_key[1] + usable, key[2])
+            self._locate_active_segment()
+            return
+        self._load()
+
+    def _load(self) -> None:
+        """Full (re)load of the index with crash recovery."""
+        self._reset_state()
+        self._log_dir.mkdir(parents=True, exist_ok=True)
+
+        raw = self._index_path.read_bytes() if self._index_path.exists() else b""
+        usable = len(raw) - len(raw) % _INDEX_RECORD.size
+        records = list(_INDEX_RECORD.iter_unpack(raw[:usable]))
+        dirty = usable != len(raw)
+
+        segments = self._segment_files()
+        sizes = {seg: path.stat().st_size for seg, path in segments.items()}
+
+        # Drop records whose segment was already truncated away (crash
+        # between unlink and index rewrite) or whose bytes never hit disk.
+        valid: list[_IndexRecord] = []
+        for record in records:
+            _, _, segment, offset, length = record
+            if segment not in sizes:
+                if valid:
+                    # A hole in the middle of the log means the data is gone;
+                    # everything after it is unreliable.
+                    dirty = True
+                    break
+                dirty = True
+                continue
+            if offset + length > sizes[segment]:
+                dirty = True
+                break
+            valid.append(record)
+
+        # Re-index complete lines appended after the last indexed record.
+        if valid:
+            last_segment = valid[-1][2]
+            resume_at = valid[-1][3] + valid[-1][4]
+        else:
+            last_segment = min(segments) if segments else 0
+            resume_at = 0
+        for segment in sorted(s for s in segments if s >= last_segment):
+            start = resume_at if segment == last_segment else 0
+            recovered = self._scan_segment(segments[segment], segment, start)
+            if recovered:
+                valid.extend(recovered)
+                dirty = True
+
+        if dirty:
+            self._write_index(valid)
+
+        for record in valid:
+            self._apply(record)
+        try:
+            self._index_key = self._stat_key(os.stat(self._index_path))
+        except FileNotFoundError:
+            self._index_key = None
+        self._locate_active_segment()
+
+    def _scan_segment(self, path: Path, segment: int, start: int) -> list[_IndexRecord]:
+        """Index complete lines from *start*; truncate a torn trailing line."""
+        with open(path, "rb") as f:
+            f.seek(start)
+            data = f.read()
+        records: list[_IndexRecord] = []
+        offset = start
+        pos = 0
+        while True:
+            end = data.find(b"\n", pos)
+            if end == -1:
+                break
+            line = data[pos : end + 1]
+            decoded = _decode_record(line)
+            if decoded is None:
+                logger.warning("Skipping corrupt record in %s at offset %d", path, offset)
+            else:
+                records.append((decoded[0], decoded[1], segment, offset, len(line)))
+            offset += len(line)
+            pos = end + 1
+        if pos < len(data):
+            logger.warning("Truncating torn record at end of %s (offset %d)", path, offset)
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+        return records
+
+    def _write_index(self, records: list[_IndexRecord]) -> None:
+        self._close_handles()
+        tmp = self._index_path.with_suffix(".bin.tmp")
+        with open(tmp, "wb") as f:
+            f.write(b"".join(_INDEX_RECORD.pack(*r) for r in records))
+        tmp.replace(self._index_path)
+
+    def _locate_active_segment(self) -> None:
+        segments = self._segment_files() if self._log_dir.exists() else {}
+        candidates = list(segments)
+        if self._records:
+            candidates.append(self._records[-1][2])
+        self._active_segment = max(candidates) if candidates else 0
+        path = segments.get(self._active_segment)
+        self._active_size = path.stat().st_size if path is not None else 0
+
+    # --- write path ------------------------------------------------------------
+
+    def _close_handles(self) -> None:
+        for fh in (self._segment_fh, self._index_fh):
+            if fh is not None:
+                fh.close()
+        self._segment_fh = None
+        self._index_fh = None
+
+    def _append(self, kind: int, seq: int, line: bytes) -> None:
+        if self._active_size and self._active_size + len(line) > self._segment_bytes:
+            self._close_handles()
+            self._active_segment += 1
+            self._active_size = 0
+        if self._segment_fh is None:
+            self._log_dir.mkdir(parents=True, exist_ok=True)
+            self._segment_fh = open(self._log_dir / _segment_name(self._active_segment), "ab")
+            self._active_size = os.fstat(self._segment_fh.fileno()).st_size
+        if self._index_fh is None:
+            self._index_fh = open(self._index_path, "ab")
+
+        offset = self._active_size
+        self._segment_fh.write(line)
+        self._segment_fh.flush()
+        self._active_size += len(line)
+
+        record = (kind, seq, self._active_segment, offset, len(line))
+        self._index_fh.write(_INDEX_RECORD.pack(*record))
+        self._index_fh.flush()
+        self._index_key = self._stat_key(os.fstat(self._index_fh.fileno()))
+        self._apply(record)
+
+    def _truncate_dead_segments(self) -> None:
+        """Unlink whole segments that precede the first live part."""
+        first_live_segment: int | None = None
+        for kind, seq, segment, offset, length in self._records:
+            if kind == _PUT and self._live.get(seq) == (segment, offset, length):
+                first_live_segment = segment
+                break
+        if first_live_segment is None:
+            # Nothing live: the active segment can go too.
+            first_live_segment = self._active_segment + 1
+
+        dead = sorted(s for s in self._segment_files() if s < first_live_segment)
+        if not dead:
+            return
+        self._close_handles()
+        # Unlink before rewriting the index: a crash in between leaves index
+        # records for missing segments, which _load() drops as a dead prefix.
+        for segment in dead:
+            (self._log_dir / _segment_name(segment)).unlink(missing_ok=True)
+        kept = [r for r in self._records if r[2] >= first_live_segment]
+        self._write_index(kept)
+        self._records = []
+        self._live = {}
+        for record in kept:
+            self._apply(record)
+        self._index_key = self._stat_key(os.stat(self._index_path))
+        if first_live_segment > self._active_segment:
+            self._active_segment = first_live_segment
+            self._active_size = 0
+
+    # --- read path -------------------------------------------------------------
+
+    def read_parts_sync(self, include_created_at: bool = False) -> list[dict[str, Any]]:
+        """Synchronous :meth:`read_parts` for disk-only listings.
+
+        With *include_created_at*, each part also gets the ``created_at``
+        recorded when it was written (if the record has one).
+        """
+        with self._lock:
+            self._sync()
+            by_segment: dict[int, list[tuple[int, int, int]]] = {}
+            for seq, (segment, offset, length) in self._live.items():
+                by_segment.setdefault(segment, []).append((seq, offset, length))
+
+            parts: dict[int, dict[str, Any]] = {}
+            for segment, locs in by_segment.items():
+                lo = min(offset for _, offset, _ in locs)
+                hi = max(offset + length for _, offset, length in locs)
+                try:
+                    with open(self._log_dir / _segment_name(segment), "rb") as f:
+                        f.seek(lo)
+                        buf = f.read(hi - lo)
+                except FileNotFoundError:
+                    continue
+                for seq, offset, length in locs:
+                    try:
+                        payload = json.loads(buf[offset - lo : offset - lo + length])
+                        part = payload["part"]
+                        if include_created_at and payload.get("created_at") is not None:
+                            part.setdefault("created_at", payload["created_at"])
+                        parts[seq] = part
+                    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                        continue
+            return [parts[seq] for seq in sorted(parts)]
+
+    # --- ConversationStore interface -----------------------------------------
+
+    async def write_part(self, seq: int, data: dict[str, Any]) -> None:
+        line = _encode_record(_PUT, seq, data, created_at=time.time())
+
+        def _write() -> None:
+            with self._lock:
+                self._sync()
+                self._append(_PUT, seq, line)
+
+        await self._run(_write)
+
+    async def read_parts(self) -> list[dict[str, Any]]:
+        return await self._run(self.read_parts_sync)
+
+    async def delete_parts_before(self, seq: int) -> None:
+        def _delete() -> None:
+            with self._lock:
+                self._sync()
+                if not any(s < seq for s in self._live):
+                    return
+                self._append(_DELETE_BEFORE, seq, _encode_record(_DELETE_BEFORE, seq))
+                self._truncate_dead_segments()
+
+        await self._run(_delete)
+
+    async def close(self) -> None:
+        """Close the open segment and index handles."""
+
+        def _close() -> None:
+            with self._lock:
+                self._close_handles()
+
+        await self._run(_close)
+
+    async def destroy(self) -> None:
+        """Delete the entire base directory and all persisted data."""
+
+        def _forget() -> None:
+            with self._lock:
+                self._reset_state()
+
+        await self._run(_forget)
+        await super().destroy()
+
+
+def migrate_file_conversation_store(
+    base_path: str | Path,
+    segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+) -> int:
+    """Migrate a ``parts/NNNNNNNNNN.json`` layout into a segmented log.
+
+    The log is built in ``log.migrating/`` and renamed into place before
+    ``parts/`` is removed, so an interrupted migration is either redone
+    from scratch or just finishes deleting the leftover part files.
+    Unreadable part files are skipped, matching
+    :meth:`FileConversationStore.read_parts`.
+
+    Returns:
+        Number of parts migrated (0 when there was nothing to migrate).
+    """
+    base = Path(base_path)
+    parts_dir = base / "parts"
+    log_dir = base / "log"
+    if not parts_dir.is_dir():
+        return 0
+    if log_dir.exists():
+        # A previous migration committed the log but died before cleanup.
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        return 0
+
+    staging = base / "log.migrating"
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+
+    segment = 0
+    size = 0
+    count = 0
+    index: list[bytes] = []
+    segment_fh = open(staging / _segment_name(segment), "wb")
+    try:
+        for path in sorted(parts_dir.glob("*.json")):
+            try:
+                seq = int(path.stem)
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                created_at = path.stat().st_mtime
+            except (ValueError, OSError):
+                continue
+            line = _encode_record(_PUT, seq, data, created_at=created_at)
+            if size and size + len(line) > segment_bytes:
+                segment_fh.close()
+                segment += 1
+                size = 0
+                segment_fh = open(staging / _segment_name(segment), "wb")
+            segment_fh.write(line)
+            index.append(_INDEX_RECORD.pack(_PUT, seq, segment, size, len(line)))
+            size += len(line)
+            count += 1
+        segment_fh.flush()
+        os.fsync(segment_fh.fileno())
+    finally:
+        segment_fh.close()
+
+    with open(staging / "index.bin", "wb") as f:
+        f.write(b"".join(index))
+        f.flush()
+        os.fsync(f.fileno())
+
+    staging.rename(log_dir)
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    logger.info("Migrated %d conversation parts in %s to segmented log", count, base)
+    return count
@@ -7,6 +7,7 @@
 
 import asyncio
 import logging
+import os
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -217,3 +218,49 @@ def _check():
             return self.get_state_path(session_id).exists()
 
         return await asyncio.to_thread(_check)
+
+
+# Environment override for the default session store backend.
+SESSION_STORE_ENV = "HIVE_SESSION_STORE"
+SESSION_STORE_BACKENDS = ("file", "sqlite")
+
+
+def open_session_store(base_path: Path, backend: str | None = None) -> SessionStore:
+    """
+    Open the session store for *base_path* with the right backend.
+
+    An existing ``sessions.db`` always selects the SQLite backend.
+    Otherwise *backend*, then ``$HIVE_SESSION_STORE``, then ``"file"`` is
+    used.  When SQLite is selected for a directory that still has
+    file-layout sessions, their ``state.json`` files are imported before
+    the store is returned, so switching backends never hides a session.
+    Conversations keep their layout and are still found by
+    :func:`framework.storage.conversation_store.open_conversation_store`;
+    :func:`framework.storage.sqlite_store.import_file_layout` moves them
+    too.
+
+    Args:
+        base_path: Base path for storage (e.g., ~/.hive/agents/deep_research_agent)
+        backend: ``"file"`` or ``"sqlite"``
+
+    Returns:
+        SessionStore instance
+    """
+    from framework.storage.sqlite_store import SESSIONS_DB, SQLiteSessionStore
+
+    base_path = Path(base_path)
+    if (base_path / SESSIONS_DB).exists():
+        return SQLiteSessionStore(base_path)
+
+    backend = backend or os.environ.get(SESSION_STORE_ENV) or "file"
+    if backend == "sqlite":
+        store = SQLiteSessionStore(base_path)
+        imported = store.import_state_files()
+        if imported:
+            logger.info(f"Imported {imported} file-layout sessions into {base_path / SESSIONS_DB}")
+        return store
+    if backend != "file":
+        raise ValueError(
+            f"Unknown session store backend {backend!r}; expected one of {SESSION_STORE_BACKENDS}"
+        )
+    return SessionStore(base_path)
@@ -0,0 +1,599 @@
+"""
+SQLite Store - Indexed session and conversation storage.
+
+Optional alternative to the directory-scan backends:
+
+* :class:`SQLiteSessionStore` keeps every ``SessionState`` in
+  ``{base_path}/sessions.db`` with indexes on status, goal_id and
+  updated_at, so ``list_sessions()`` is a single indexed query instead of
+  reading and validating every ``state.json``.  Session directories are
+  still used for conversations, artifacts and logs, and ``state.json`` is
+  mirrored by default because the server and executor read it directly.
+* :class:`SQLiteConversationStore` keeps parts, meta and cursor for one
+  conversation in ``{base_path}/conversation.db`` (parts indexed by
+  phase_id).
+
+Both databases run in WAL mode so readers (server listings) never block
+the writing execution.  :func:`import_file_layout` performs a one-shot
+import of an existing agent storage directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from framework.schemas.session_state import SessionState
+from framework.storage.conversation_store import FileConversationStore, read_conversation_parts
+from framework.storage.session_store import SessionStore
+from framework.utils.io import atomic_write
+
+logger = logging.getLogger(__name__)
+
+SESSIONS_DB = "sessions.db"
+CONVERSATION_DB = "conversation.db"
+
+_SESSIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    goal_id TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    state TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions(updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status, updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_goal ON sessions(goal_id, updated_at DESC);
+"""
+
+_CONVERSATION_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parts (
+    seq INTEGER PRIMARY KEY,
+    phase_id TEXT,
+    role TEXT,
+    data TEXT NOT NULL,
+    created_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_parts_phase ON parts(phase_id, seq);
+CREATE TABLE IF NOT EXISTS kv (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+def _upgrade_conversation_db(conn: sqlite3.Connection) -> None:
+    """Add columns missing from databases created by older versions."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(parts)")}
+    if "created_at" not in columns:
+        conn.execute("ALTER TABLE parts ADD COLUMN created_at REAL")
+
+
+class _Database:
+    """Lazily opened, thread-safe SQLite connection in WAL mode."""
+
+    def __init__(
+        self,
+        path: Path,
+        schema: str,
+        upgrade: Callable[[sqlite3.Connection], None] | None = None,
+    ):
+        self.path = path
+        self._schema = schema
+        self._upgrade = upgrade
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            if self._conn is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(self._schema)
+                if self._upgrade is not None:
+                    with conn:
+                        self._upgrade(conn)
+                self._conn = conn
+            with self._conn:
+                yield self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SessionStore backed by an indexed SQLite table.
+
+    Drop-in replacement for :class:`SessionStore`: paths, ID generation
+    and directory layout are unchanged; only state persistence and
+    queries go through ``sessions.db``.
+    """
+
+    def __init__(self, base_path: Path, mirror_state_json: bool = True):
+        """
+        Initialize SQLite session store.
+
+        Args:
+            base_path: Base path for storage (e.g., ~/.hive/agents/deep_research_agent)
+            mirror_state_json: Also write ``state.json`` into the session
+                directory for code that reads it directly (default True)
+        """
+        super().__init__(base_path)
+        self.mirror_state_json = mirror_state_json
+        self._db = _Database(self.base_path / SESSIONS_DB, _SESSIONS_SCHEMA)
+
+    def _upsert(self, conn: sqlite3.Connection, session_id: str, state: SessionState) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO sessions (session_id, status, goal_id, updated_at, state) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                session_id,
+                str(state.status),
+                state.goal_id,
+                state.timestamps.updated_at,
+                state.model_dump_json(),
+            ),
+        )
+
+    async def write_state(self, session_id: str, state: SessionState) -> None:
+        """
+        Write a session's state row (and mirror ``state.json`` if enabled).
+
+        Args:
+            session_id: Session ID
+            state: SessionState to write
+        """
+
+        def _write():
+            state_path = self.get_state_path(session_id)
+            if self.mirror_state_json:
+                state_path.parent.mkdir(parents=True, exist_ok=True)
+                with atomic_write(state_path) as f:
+                    f.write(state.model_dump_json(indent=2))
+            with self._db.transaction() as conn:
+                self._upsert(conn, session_id, state)
+
+        await asyncio.to_thread(_write)
+        logger.debug(f"Wrote state row for session {session_id}")
+
+    async def read_state(self, session_id: str) -> SessionState | None:
+        """
+        Read a session's state.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            SessionState or None if not found
+        """
+
+        def _read():
+            self.get_session_path(session_id)  # validates the ID
+            with self._db.transaction() as conn:
+                row = conn.execute(
+                    "SELECT state FROM sessions WHERE session_id = ?", (session_id,)
+                ).fetchone()
+            if row is None:
+                return None
+            return SessionState.model_validate_json(row[0])
+
+        return await asyncio.to_thread(_read)
+
+    async def list_sessions(
+        self,
+        status: str | None = None,
+        goal_id: str | None = None,
+        limit: int = 100,
+    ) -> list[SessionState]:
+        """
+        List sessions with a single indexed query, most recent first.
+
+        Args:
+            status: Optional status filter (e.g., "paused", "completed")
+            goal_id: Optional goal ID filter
+            limit: Maximum number of sessions to return
+
+        Returns:
+            List of SessionState objects
+        """
+
+        def _query():
+            clauses: list[str] = []
+            params: list[Any] = []
+            if status:
+                clauses.append("status = ?")
+                params.append(str(status))
+            if goal_id:
+                clauses.append("goal_id = ?")
+                params.append(goal_id)
+            where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+            with self._db.transaction() as conn:
+                rows = conn.execute(
+                    f"SELECT session_id, state FROM sessions {where}"
+                    "ORDER BY updated_at DESC LIMIT ?",
+                    (*params, limit),
+                ).fetchall()
+
+            sessions = []
+            for session_id, raw in rows:
+                try:
+                    sessions.append(SessionState.model_validate_json(raw))
+                except Exception as e:
+                    logger.warning(f"Failed to load session {session_id} from {SESSIONS_DB}: {e}")
+            return sessions
+
+        return await asyncio.to_thread(_query)
+
+    async def delete_session(self, session_id: str) -> bool:
+        """
+        Delete a session's row and all its data.
+
+        Args:
+            session_id: Session ID to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+
+        def _delete():
+            session_path = self.get_session_path(session_id)
+            with self._db.transaction() as conn:
+                deleted = conn.execute(
+                    "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+                ).rowcount
+            if session_path.exists():
+                shutil.rmtree(session_path)
+                deleted = 1
+            if deleted:
+                logger.info(f"Deleted session {session_id}")
+            return bool(deleted)
+
+        return await asyncio.to_thread(_delete)
+
+    async def session_exists(self, session_id: str) -> bool:
+        """
+        Check if a session exists.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            True if session exists
+        """
+
+        def _check():
+            self.get_session_path(session_id)
+            with self._db.transaction() as conn:
+                row = conn.execute(
+                    "SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)
+                ).fetchone()
+            return row is not None
+
+        return await asyncio.to_thread(_check)
+
+    def import_state_files(self) -> int:
+        """
+        Import every ``sessions/*/state.json`` into the database.
+
+        Existing rows are replaced.  Unreadable files are logged and skipped.
+
+        Returns:
+            Number of sessions imported
+        """
+        if not self.sessions_dir.exists():
+            return 0
+
+        count = 0
+        with self._db.transaction() as conn:
+            for session_dir in self.sessions_dir.iterdir():
+                state_path = session_dir / "state.json"
+                if not state_path.is_file():
+                    continue
+                try:
+                    state = SessionState.model_validate_json(state_path.read_text(encoding="utf-8"))
+                except Exception as e:
+                    logger.warning(f"Skipping {state_path}: {e}")
+                    continue
+                self._upsert(conn, session_dir.name, state)
+                count += 1
+        return count
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+
+class SQLiteConversationStore(FileConversationStore):
+    """ConversationStore backed by a per-conversation SQLite database.
+
+    Parts, meta and cursor live in ``{base_path}/conversation.db``; the
+    base directory is otherwise unused, so subagent stores can still be
+    placed next to it.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, base_path: str | Path) -> None:
+        super().__init__(base_path)
+        self._db = _Database(
+            self._base / CONVERSATION_DB, _CONVERSATION_SCHEMA, _upgrade_conversation_db
+        )
+
+    # --- sync helpers --------------------------------------------------------
+
+    def _put_kv(self, key: str, data: dict[str, Any]) -> None:
+        with self._db.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (key, data) VALUES (?, ?)", (key, json.dumps(data))
+            )
+
+    def _get_kv(self, key: str) -> dict[str, Any] | None:
+        with self._db.transaction() as conn:
+            row = conn.execute("SELECT data FROM kv WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def write_parts_sync(
+        self,
+        parts: list[tuple[int, dict[str, Any]]],
+        created_at: Mapping[int, float] | None = None,
+    ) -> None:
+        """Upsert many ``(seq, data)`` parts in one transaction.
+
+        Each part is stamped with the current time unless *created_at*
+        gives one for its seq (imports keep the original write times).
+        """
+        now = time.time()
+        created_at = created_at or {}
+        with self._db.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO parts (seq, phase_id, role, data, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        seq,
+                        data.get("phase_id"),
+                        data.get("role"),
+                        json.dumps(data),
+                        created_at.get(seq, now),
+                    )
+                    for seq, data in parts
+                ],
+            )
+
+    def read_parts_sync(self, phase_id: str | None = None) -> list[dict[str, Any]]:
+        """Synchronous :meth:`read_parts`, optionally limited to one phase."""
+        with self._db.transaction() as conn:
+            if phase_id is None:
+                rows = conn.execute("SELECT data FROM parts ORDER BY seq").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT data FROM parts WHERE phase_id = ? ORDER BY seq", (phase_id,)
+                ).fetchall()
+        parts = []
+        for (raw,) in rows:
+            try:
+                parts.append(json.loads(raw))
+            except json.JSONDecodeError:
+                continue
+        return parts
+
+    # --- ConversationStore interface -----------------------------------------
+
+    async def write_part(self, seq: int, data: dict[str, Any]) -> None:
+        await self._run(self.write_parts_sync, [(seq, data)])
+
+    async def read_parts(self, phase_id: str | None = None) -> list[dict[str, Any]]:
+        return await self._run(self.read_parts_sync, phase_id)
+
+    async def write_meta(self, data: dict[str, Any]) -> None:
+        await self._run(self._put_kv, "meta", data)
+
+    async def read_meta(self) -> dict[str, Any] | None:
+        return await self._run(self._get_kv, "meta")
+
+    async def write_cursor(self, data: dict[str, Any]) -> None:
+        await self._run(self._put_kv, "cursor", data)
+
+    async def read_cursor(self) -> dict[str, Any] | None:
+        return await self._run(self._get_kv, "cursor")
+
+    async def delete_parts_before(self, seq: int) -> None:
+        def _delete() -> None:
+            with self._db.transaction() as conn:
+                conn.execute("DELETE FROM parts WHERE seq < ?", (seq,))
+
+        await self._run(_delete)
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        await self._run(self._db.close)
+
+    async def destroy(self) -> None:
+        """Delete the entire base directory and all persisted data."""
+        await self.close()
+        await super().destroy()
+
+
+def read_sqlite_conversation_parts(
+    base_path: str | Path, limit: int | None = None
+) -> list[dict[str, Any]]:
+    """
+    Read parts from ``conversation.db`` through a read-only connection.
+
+    Used for disk-only listings; never creates or migrates the database.
+    Each part gets the ``created_at`` recorded when it was written, or the
+    database mtime for rows written before that column existed.
+    """
+    db_path = Path(base_path) / CONVERSATION_DB
+    try:
+        mtime = db_path.stat().st_mtime
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+    except (OSError, sqlite3.Error):
+        return []
+    suffix = f" ORDER BY seq LIMIT {int(limit)}" if limit is not None else " ORDER BY seq"
+    try:
+        try:
+            rows = conn.execute("SELECT data, created_at FROM parts" + suffix).fetchall()
+        except sqlite3.OperationalError:
+            # Database not yet upgraded (opened read-only, so it cannot be)
+            rows = [(raw, None) for (raw,) in conn.execute("SELECT data FROM parts" + suffix)]
+    except sqlite3.Error:
+        return []
+    finally:
+        conn.close()
+
+    parts = []
+    for raw, created_at in rows:
+        try:
+            part = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        part.setdefault("created_at", created_at if created_at is not None else mtime)
+        parts.append(part)
+    return parts
+
+
+def read_sqlite_session_states(base_path: str | Path) -> dict[str, dict[str, Any]] | None:
+    """
+    Read every session's state from ``sessions.db`` through a read-only connection.
+
+    Used for disk-only listings.  Returns None when *base_path* has no
+    readable ``sessions.db`` (the file layout is in use).
+    """
+    db_path = Path(base_path) / SESSIONS_DB
+    if not db_path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None
+    try:
+        rows = conn.execute("SELECT session_id, state FROM sessions").fetchall()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+    states: dict[str, dict[str, Any]] = {}
+    for session_id, raw in rows:
+        try:
+            states[session_id] = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+    return states
+
+
+def _read_json_file(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, ValueError):
+        return None
+
+
+def import_conversation_dir(base_path: str | Path) -> int:
+    """
+    Import one conversation directory (``parts/`` or ``log/`` layout) into SQLite.
+
+    Meta, cursor and parts are copied into ``conversation.db`` and the old
+    files are removed only after the import has committed.
+
+    Returns:
+        Number of parts imported
+    """
+    base = Path(base_path)
+    if (base / CONVERSATION_DB).exists():
+        return 0
+    has_legacy = any((base / name).exists() for name in ("parts", "log", "meta.json"))
+    if not has_legacy:
+        return 0
+
+    parts = read_conversation_parts(base)
+    created_at = {
+        p["seq"]: ts for p in parts if "seq" in p and (ts := p.pop("created_at", None)) is not None
+    }
+    meta = _read_json_file(base / "meta.json")
+    cursor = _read_json_file(base / "cursor.json")
+
+    store = SQLiteConversationStore(base)
+    try:
+        store.write_parts_sync([(p["seq"], p) for p in parts if "seq" in p], created_at)
+        if meta is not None:
+            store._put_kv("meta", meta)
+        if cursor is not None:
+            store._put_kv("cursor", cursor)
+    finally:
+        store._db.close()
+
+    for name in ("parts", "log"):
+        shutil.rmtree(base / name, ignore_errors=True)
+    for name in ("meta.json", "cursor.json"):
+        (base / name).unlink(missing_ok=True)
+    return len(parts)
+
+
+def import_file_layout(base_path: str | Path) -> dict[str, int]:
+    """
+    One-shot import of an agent storage directory into the SQLite backends.
+
+    Imports every ``sessions/*/state.json`` into ``sessions.db`` and every
+    conversation directory under ``sessions/*/conversations/`` (flat store,
+    per-node and subagent stores) into its own ``conversation.db``.
+    Safe to re-run: sessions are upserted and already-imported
+    conversations are skipped.
+
+    Args:
+        base_path: Agent storage root (e.g., ~/.hive/agents/deep_research_agent)
+
+    Returns:
+        ``{"sessions": n, "conversations": n, "parts": n}``
+    """
+    store = SQLiteSessionStore(Path(base_path))
+    try:
+        sessions = store.import_state_files()
+    finally:
+        store.close()
+
+    conversations = 0
+    parts = 0
+    if store.sessions_dir.exists():
+        for session_dir in store.sessions_dir.iterdir():
+            convs_dir = session_dir / "conversations"
+            if not convs_dir.is_dir():
+                continue
+            candidates = [convs_dir] + [
+                d for d in convs_dir.iterdir() if d.is_dir() and d.name not in ("parts", "log")
+            ]
+            for conv_dir in candidates:
+                if (conv_dir / CONVERSATION_DB).exists():
+                    continue
+                if not any((conv_dir / n).exists() for n in ("parts", "log", "meta.json")):
+                    continue
+                parts += import_conversation_dir(conv_dir)
+                conversations += 1
+
+    logger.info(
+        f"Imported {sessions} sessions and {conversations} conversations "
+        f"({parts} parts) into SQLite under {base_path}"
+    )
+    return {"sessions": sessions, "conversations": conversations, "parts": parts}
@@ -45,6 +45,7 @@
 from framework.credentials.models import CredentialError
 from framework.runner.preload_validation import credential_errors_to_json, validate_credentials
 from framework.runtime.event_bus import AgentEvent, EventType
+from framework.runtime.worker_status import WorkerStatusView, get_worker_status_view
 from framework.server.app import validate_agent_path
 from framework.tools.flowchart_utils import (
     FLOWCHART_TYPES,
@@ -2413,6 +2414,11 @@ def _get_event_bus():
         """Get the session's event bus for querying history."""
         return getattr(session, "event_bus", None)
 
+    def _get_status_view() -> WorkerStatusView | None:
+        """Get the incrementally maintained status view for the session's bus."""
+        bus = _get_event_bus()
+        return get_worker_status_view(bus) if bus is not None else None
+
     def _get_worker_name() -> str | None:
         """Return the worker agent directory name, used for diary lookups."""
         p = getattr(session, "worker_path", None)
@@ -2525,39 +2531,21 @@ def _build_preamble(
             if active_execs:
                 preamble["elapsed_seconds"] = active_execs[0].get("elapsed_seconds", 0)
 
-        # Enrich with EventBus basics (cheap limit=1 queries)
-        bus = _get_event_bus()
-        if bus:
-            if preamble["status"] == "waiting_for_input":
-                input_events = bus.get_history(event_type=EventType.CLIENT_INPUT_REQUESTED, limit=1)
-                if input_events:
-                    prompt = input_events[0].data.get("prompt", "")
-                    if prompt:
-                        preamble["pending_question"] = prompt[:200]
-
-            edge_events = bus.get_history(event_type=EventType.EDGE_TRAVERSED, limit=1)
-            if edge_events:
-                target = edge_events[0].data.get("target_node")
-                if target:
-                    preamble["current_node"] = target
-
-            iter_events = bus.get_history(event_type=EventType.NODE_LOOP_ITERATION, limit=1)
-            if iter_events:
-                preamble["current_iteration"] = iter_events[0].data.get("iteration")
+        # Enrich with EventBus basics (maintained by the status view)
+        view = _get_status_view()
+        if view:
+            if preamble["status"] == "waiting_for_input" and view.last_input_request:
+                prompt = view.last_input_request.data.get("prompt", "")
+                if prompt:
+                    preamble["pending_question"] = prompt[:200]
 
-        return preamble
+            if view.current_node:
+                preamble["current_node"] = view.current_node
 
-    def _detect_red_flags(bus: EventBus) -> int:
-        """Count issue categories with cheap limit=1 queries."""
-        count = 0
-        for evt_type in (
-            EventType.NODE_STALLED,
-            EventType.NODE_TOOL_DOOM_LOOP,
-            EventType.CONSTRAINT_VIOLATION,
-        ):
-            if bus.get_history(event_type=evt_type, limit=1):
-                count += 1
-        return count
+            if view.current_iteration is not None:
+                preamble["current_iteration"] = view.current_iteration
+
+        return preamble
 
     def _format_summary(preamble: dict[str, Any], red_flags: int) -> str:
         """Generate a 1-2 sentence prose summary from the preamble."""
@@ -2592,18 +2580,17 @@ def _format_summary(preamble: dict[str, Any], red_flags: int) -> str:
             parts.append("No issues detected")
 
         # Latest subagent progress (if any delegation is in flight)
-        bus = _get_event_bus()
-        if bus:
-            sa_reports = bus.get_history(event_type=EventType.SUBAGENT_REPORT, limit=1)
-            if sa_reports:
-                latest = sa_reports[0]
+        view = _get_status_view()
+        if view:
+            latest = view.latest(EventType.SUBAGENT_REPORT)
+            if latest:
                 sa_msg = str(latest.data.get("message", ""))[:200]
                 ago = _format_time_ago(latest.timestamp)
                 parts.append(f"Latest subagent update ({ago}): {sa_msg}")
 
         return ". ".join(parts) + "."
 
-    def _format_activity(bus: EventBus, preamble: dict[str, Any], last_n: int) -> str:
+    def _format_activity(view: WorkerStatusView, preamble: dict[str, Any], last_n: int) -> str:
         """Format current activity: node, iteration, transitions, LLM output."""
         lines = []
 
@@ -2618,16 +2605,15 @@ def _format_activity(bus: EventBus, preamble: dict[str, Any], last_n: int) -> st
         lines.append(node_desc)
 
         # Latest LLM output snippet
-        text_events = bus.get_history(event_type=EventType.LLM_TEXT_DELTA, limit=1)
-        if text_events:
-            snapshot = text_events[0].data.get("snapshot", "") or ""
+        if view.last_text_delta:
+            snapshot = view.last_text_delta.data.get("snapshot", "") or ""
             snippet = snapshot[-300:].strip()
             if snippet:
                 # Show last meaningful chunk
                 lines.append(f'Last LLM output: "{snippet}"')
 
         # Recent node transitions
-        edges = bus.get_history(event_type=EventType.EDGE_TRAVERSED, limit=last_n)
+        edges = view.recent(EventType.EDGE_TRAVERSED, last_n)
         if edges:
             lines.append("")
             lines.append("Recent transitions:")
@@ -2686,21 +2672,13 @@ async def _format_memory(runtime: AgentRuntime) -> str:
 
         return "\n".join(lines)
 
-    def _format_tools(bus: EventBus, last_n: int) -> str:
+    def _format_tools(view: WorkerStatusView, last_n: int) -> str:
         """Format running and recent tool calls."""
         lines = []
 
         # Running tools (started but not yet completed)
-        tool_started = bus.get_history(event_type=EventType.TOOL_CALL_STARTED, limit=last_n * 2)
-        tool_completed = bus.get_history(event_type=EventType.TOOL_CALL_COMPLETED, limit=last_n * 2)
-        completed_ids = {
-            evt.data.get("tool_use_id") for evt in tool_completed if evt.data.get("tool_use_id")
-        }
-        running = [
-            evt
-            for evt in tool_started
-            if evt.data.get("tool_use_id") and evt.data.get("tool_use_id") not in completed_ids
-        ]
+        running = view.running_tools
+        tool_completed = view.recent(EventType.TOOL_CALL_COMPLETED, last_n)
 
         if running:
             names = [evt.data.get("tool_name", "?") for evt in running]
@@ -2737,13 +2715,13 @@ def _format_tools(bus: EventBus, last_n: int) -> str:
 
         return "\n".join(lines)
 
-    def _format_issues(bus: EventBus) -> str:
+    def _format_issues(view: WorkerStatusView) -> str:
         """Format retries, stalls, doom loops, and constraint violations."""
         lines = []
         total = 0
 
         # Retries
-        retries = bus.get_history(event_type=EventType.NODE_RETRY, limit=20)
+        retries = view.recent(EventType.NODE_RETRY, 20)
         if retries:
             total += len(retries)
             lines.append(f"{len(retries)} retry event(s):")
@@ -2755,7 +2733,7 @@ def _format_issues(bus: EventBus) -> str:
                 lines.append(f"  {node} (attempt {count}, {ago}): {error}")
 
         # Stalls
-        stalls = bus.get_history(event_type=EventType.NODE_STALLED, limit=5)
+        stalls = view.recent(EventType.NODE_STALLED, 5)
         if stalls:
             total += len(stalls)
             lines.append(f"{len(stalls)} stall(s):")
@@ -2766,7 +2744,7 @@ def _format_issues(bus: EventBus) -> str:
                 lines.append(f"  {node} ({ago}): {reason}")
 
         # Doom loops
-        doom_loops = bus.get_history(event_type=EventType.NODE_TOOL_DOOM_LOOP, limit=5)
+        doom_loops = view.recent(EventType.NODE_TOOL_DOOM_LOOP, 5)
         if doom_loops:
             total += len(doom_loops)
             lines.append(f"{len(doom_loops)} tool doom loop(s):")
@@ -2777,7 +2755,7 @@ def _format_issues(bus: EventBus) -> str:
                 lines.append(f"  {node} ({ago}): {desc}")
 
         # Constraint violations
-        violations = bus.get_history(event_type=EventType.CONSTRAINT_VIOLATION, limit=5)
+        violations = view.recent(EventType.CONSTRAINT_VIOLATION, 5)
         if violations:
             total += len(violations)
             lines.append(f"{len(violations)} constraint violation(s):")
@@ -2793,7 +2771,7 @@ def _format_issues(bus: EventBus) -> str:
         header = f"{total} issue(s) detected."
         return header + "\n\n" + "\n".join(lines)
 
-    async def _format_progress(runtime: AgentRuntime, bus: EventBus) -> str:
+    async def _format_progress(runtime: AgentRuntime, view: WorkerStatusView) -> str:
         """Format goal progress, token consumption, and execution outcomes."""
         lines = []
 
@@ -2819,22 +2797,19 @@ async def _format_progress(runtime: AgentRuntime, bus: EventBus) -> str:
             lines.append("Goal progress unavailable.")
 
         # Token summary
-        llm_events = bus.get_history(event_type=EventType.LLM_TURN_COMPLETE, limit=200)
-        if llm_events:
-            total_in = sum(evt.data.get("input_tokens", 0) or 0 for evt in llm_events)
-            total_out = sum(evt.data.get("output_tokens", 0) or 0 for evt in llm_events)
-            total_tok = total_in + total_out
+        tokens = view.token_summary()
+        if tokens["llm_turns"]:
             lines.append("")
             lines.append(
-                f"Tokens: {len(llm_events)} LLM turns, "
-                f"{total_tok:,} total ({total_in:,} in + {total_out:,} out)."
+                f"Tokens: {tokens['llm_turns']} LLM turns, "
+                f"{tokens['total_tokens']:,} total "
+                f"({tokens['input_tokens']:,} in + {tokens['output_tokens']:,} out)."
             )
 
         # Execution outcomes
-        exec_completed = bus.get_history(event_type=EventType.EXECUTION_COMPLETED, limit=5)
-        exec_failed = bus.get_history(event_type=EventType.EXECUTION_FAILED, limit=5)
-        completed_n = len(exec_completed)
-        failed_n = len(exec_failed)
+        exec_failed = view.recent(EventType.EXECUTION_FAILED, 5)
+        completed_n = view.completed_count
+        failed_n = view.failed_count
         active_n = len(runtime.get_active_streams())
         lines.append(
             f"Executions: {completed_n} completed, {failed_n} failed"
@@ -2850,7 +2825,7 @@ async def _format_progress(runtime: AgentRuntime, bus: EventBus) -> str:
 
     def _build_full_json(
         runtime: AgentRuntime,
-        bus: EventBus,
+        view: WorkerStatusView,
         preamble: dict[str, Any],
         last_n: int,
     ) -> dict[str, Any]:
@@ -2877,16 +2852,8 @@ def _build_full_json(
                 result[key] = preamble[key]
 
         # Running + completed tool calls
-        tool_started = bus.get_history(event_type=EventType.TOOL_CALL_STARTED, limit=last_n * 2)
-        tool_completed = bus.get_history(event_type=EventType.TOOL_CALL_COMPLETED, limit=last_n * 2)
-        completed_ids = {
-            evt.data.get("tool_use_id") for evt in tool_completed if evt.data.get("tool_use_id")
-        }
-        running = [
-            evt
-            for evt in tool_started
-            if evt.data.get("tool_use_id") and evt.data.get("tool_use_id") not in completed_ids
-        ]
+        running = view.running_tools
+        tool_completed = view.recent(EventType.TOOL_CALL_COMPLETED, last_n)
         if running:
             result["running_tools"] = [
                 {
@@ -2913,7 +2880,7 @@ def _build_full_json(
             result["recent_tool_calls"] = recent_calls
 
         # Node transitions
-        edges = bus.get_history(event_type=EventType.EDGE_TRAVERSED, limit=last_n)
+        edges = view.recent(EventType.EDGE_TRAVERSED, last_n)
         if edges:
             result["node_transitions"] = [
                 {
@@ -2926,7 +2893,7 @@ def _build_full_json(
             ]
 
         # Retries
-        retries = bus.get_history(event_type=EventType.NODE_RETRY, limit=last_n)
+        retries = view.recent(EventType.NODE_RETRY, last_n)
         if retries:
             result["retries"] = [
                 {
@@ -2939,8 +2906,8 @@ def _build_full_json(
             ]
 
         # Stalls and doom loops
-        stalls = bus.get_history(event_type=EventType.NODE_STALLED, limit=5)
-        doom_loops = bus.get_history(event_type=EventType.NODE_TOOL_DOOM_LOOP, limit=5)
+        stalls = view.recent(EventType.NODE_STALLED, 5)
+        doom_loops = view.recent(EventType.NODE_TOOL_DOOM_LOOP, 5)
         issues = []
         for evt in stalls:
             issues.append(
@@ -2964,7 +2931,7 @@ def _build_full_json(
             result["issues"] = issues
 
         # Subagent activity (in-flight progress from delegated subagents)
-        sa_reports = bus.get_history(event_type=EventType.SUBAGENT_REPORT, limit=last_n)
+        sa_reports = view.recent(EventType.SUBAGENT_REPORT, last_n)
         if sa_reports:
             result["subagent_activity"] = [
                 {
@@ -2976,7 +2943,7 @@ def _build_full_json(
             ]
 
         # Constraint violations
-        violations = bus.get_history(event_type=EventType.CONSTRAINT_VIOLATION, limit=5)
+        violations = view.recent(EventType.CONSTRAINT_VIOLATION, 5)
         if violations:
             result["constraint_violations"] = [
                 {
@@ -2988,20 +2955,13 @@ def _build_full_json(
             ]
 
         # Token summary
-        llm_events = bus.get_history(event_type=EventType.LLM_TURN_COMPLETE, limit=200)
-        if llm_events:
-            total_in = sum(evt.data.get("input_tokens", 0) or 0 for evt in llm_events)
-            total_out = sum(evt.data.get("output_tokens", 0) or 0 for evt in llm_events)
-            result["token_summary"] = {
-                "llm_turns": len(llm_events),
-                "input_tokens": total_in,
-                "output_tokens": total_out,
-                "total_tokens": total_in + total_out,
-            }
+        tokens = view.token_summary()
+        if tokens["llm_turns"]:
+            result["token_summary"] = tokens
 
         # Execution outcomes
-        exec_completed = bus.get_history(event_type=EventType.EXECUTION_COMPLETED, limit=5)
-        exec_failed = bus.get_history(event_type=EventType.EXECUTION_FAILED, limit=5)
+        exec_completed = view.recent(EventType.EXECUTION_COMPLETED, 5)
+        exec_failed = view.recent(EventType.EXECUTION_FAILED, 5)
         if exec_completed or exec_failed:
             result["execution_outcomes"] = []
             for evt in exec_completed:
@@ -3081,32 +3041,32 @@ async def get_worker_status(focus: str | None = None, last_n: int = 20) -> str:
         # --- Build preamble (always cheap) ---
         preamble = _build_preamble(runtime)
 
-        bus = _get_event_bus()
+        view = _get_status_view()
 
         try:
             if focus is None:
                 # Default: brief prose summary
-                red_flags = _detect_red_flags(bus) if bus else 0
+                red_flags = view.red_flags if view else 0
                 return _format_summary(preamble, red_flags)
 
-            if bus is None:
+            if view is None:
                 return (
                     f"Worker is {preamble['status']}. "
                     "EventBus unavailable — only basic status returned."
                 )
 
             if focus == "activity":
-                return _format_activity(bus, preamble, last_n)
+                return _format_activity(view, preamble, last_n)
             elif focus == "memory":
                 return await _format_memory(runtime)
             elif focus == "tools":
-                return _format_tools(bus, last_n)
+                return _format_tools(view, last_n)
             elif focus == "issues":
-                return _format_issues(bus)
+                return _format_issues(view)
             elif focus == "progress":
-                return await _format_progress(runtime, bus)
+                return await _format_progress(runtime, view)
             elif focus == "full":
-                result = _build_full_json(runtime, bus, preamble, last_n)
+                result = _build_full_json(runtime, view, preamble, last_n)
                 # Also include goal progress in full dump
                 try:
                     progress = await runtime.get_goal_progress()
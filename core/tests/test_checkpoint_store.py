@@ -0,0 +1,199 @@
+"""Tests for CheckpointStore delta checkpoints and the append-only index."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from framework.schemas.checkpoint import Checkpoint, CheckpointIndex
+from framework.storage.checkpoint_store import CheckpointStore
+
+
+def make_checkpoint(node: str, memory: dict, n: int = 0) -> Checkpoint:
+    cp = Checkpoint.create(
+        checkpoint_type="node_complete",
+        session_id="session_test",
+        current_node=node,
+        execution_path=[node],
+        shared_memory=memory,
+    )
+    cp.checkpoint_id = f"cp_node_complete_{node}_{n:04d}"
+    return cp
+
+
+class TestDeltaCheckpoints:
+    @pytest.mark.asyncio
+    async def test_full_store_round_trip(self, tmp_path):
+        store = CheckpointStore(tmp_path)
+        await store.save_checkpoint(make_checkpoint("a", {"x": 1}))
+        loaded = await store.load_checkpoint("cp_node_complete_a_0000")
+        assert loaded is not None
+        assert loaded.shared_memory == {"x": 1}
+        assert not loaded.is_delta
+
+    @pytest.mark.asyncio
+    async def test_delta_reconstructs_memory(self, tmp_path):
+        store = CheckpointStore(tmp_path, delta_checkpoints=True)
+        await store.save_checkpoint(make_checkpoint("a", {"x": 1, "y": 2}, 0))
+        await store.save_checkpoint(make_checkpoint("b", {"x": 1, "y": 3, "z": 4}, 1))
+        await store.save_checkpoint(make_checkpoint("c", {"y": 3, "z": 4}, 2))
+
+        raw = json.loads((store.checkpoints_dir / "cp_node_complete_c_0002.json").read_text())
+        assert raw["is_delta"] is True
+        assert raw["shared_memory"] == {}
+        assert raw["deleted_memory_keys"] == ["x"]
+
+        b = await store.load_checkpoint("cp_node_complete_b_0001")
+        assert b.shared_memory == {"x": 1, "y": 3, "z": 4}
+        latest = await store.load_checkpoint()
+        assert latest.checkpoint_id == "cp_node_complete_c_0002"
+        assert latest.shared_memory == {"y": 3, "z": 4}
+        assert not latest.is_delta
+
+    @pytest.mark.asyncio
+    async def test_full_snapshot_interval_bounds_chain(self, tmp_path):
+        store = CheckpointStore(tmp_path, delta_checkpoints=True, full_snapshot_interval=3)
+        for i in range(7):
+            await store.save_checkpoint(make_checkpoint(f"n{i}", {"i": i}, i))
+        index = await store.load_index()
+        assert [cp.is_delta for cp in index.checkpoints] == [
+            False,
+            True,
+            True,
+            False,
+            True,
+            True,
+            False,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_id_does_not_overwrite_parent(self, tmp_path):
+        store = CheckpointStore(tmp_path, delta_checkpoints=True)
+        first = make_checkpoint("a", {"x": 1})
+        second = make_checkpoint("a", {"x": 2})
+        await store.save_checkpoint(first)
+        await store.save_checkpoint(second)
+        assert second.checkpoint_id == "cp_node_complete_a_0000_2"
+        assert (await store.load_checkpoint(first.checkpoint_id)).shared_memory == {"x": 1}
+        assert (await store.load_checkpoint(second.checkpoint_id)).shared_memory == {"x": 2}
+
+    @pytest.mark.asyncio
+    async def test_missing_parent_returns_none(self, tmp_path):
+        store = CheckpointStore(tmp_path, delta_checkpoints=True)
+        await store.save_checkpoint(make_checkpoint("a", {"x": 1}, 0))
+        await store.save_checkpoint(make_checkpoint("b", {"x": 2}, 1))
+        (store.checkpoints_dir / "cp_node_complete_a_0000.json").unlink()
+        assert await store.load_checkpoint("cp_node_complete_b_0001") is None
+
+
+class TestIndex:
+    @pytest.mark.asyncio
+    async def test_index_is_append_only_and_skips_torn_lines(self, tmp_path):
+        store = CheckpointStore(tmp_path)
+        await store.save_checkpoint(make_checkpoint("a", {}, 0))
+        await store.save_checkpoint(make_checkpoint("b", {}, 1))
+        with open(store.index_path, "a") as f:
+            f.write('{"checkpoint_id": "cp_tor')
+
+        index = await store.load_index()
+        assert index.session_id == "session_test"
+        assert index.latest_checkpoint_id == "cp_node_complete_b_0001"
+        assert index.total_checkpoints == 2
+
+    @pytest.mark.asyncio
+    async def test_legacy_index_is_migrated(self, tmp_path):
+        store = CheckpointStore(tmp_path)
+        store.checkpoints_dir.mkdir(parents=True)
+        cp = make_checkpoint("a", {"x": 1}, 0)
+        (store.checkpoints_dir / f"{cp.checkpoint_id}.json").write_text(cp.model_dump_json())
+        legacy = CheckpointIndex(session_id="session_test", checkpoints=[])
+        legacy.add_checkpoint(cp)
+        store.legacy_index_path.write_text(legacy.model_dump_json(indent=2))
+
+        assert (await store.load_index()).latest_checkpoint_id == cp.checkpoint_id
+        await store.save_checkpoint(make_checkpoint("b", {}, 1))
+        assert not store.legacy_index_path.exists()
+        index = await store.load_index()
+        assert [c.checkpoint_id for c in index.checkpoints] == [
+            "cp_node_complete_a_0000",
+            "cp_node_complete_b_0001",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_delete_rebases_dependent_delta(self, tmp_path):
+        store = CheckpointStore(tmp_path, delta_checkpoints=True)
+        await store.save_checkpoint(make_checkpoint("a", {"x": 1, "y": 1}, 0))
+        await store.save_checkpoint(make_checkpoint("b", {"x": 1, "y": 2}, 1))
+
+        assert await store.delete_checkpoint("cp_node_complete_a_0000")
+        b = await store.load_checkpoint("cp_node_complete_b_0001")
+        assert b.shared_memory == {"x": 1, "y": 2}
+        index = await store.load_index()
+        assert [c.checkpoint_id for c in index.checkpoints] == ["cp_node_complete_b_0001"]
+        assert not index.checkpoints[0].is_delta
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_parents_of_retained_deltas(self, tmp_path):
+        store = CheckpointStore(tmp_path, delta_checkpoints=True)
+        old = make_checkpoint("a", {"x": 1}, 0)
+        old.created_at = (datetime.now() - timedelta(days=30)).isoformat()
+        await store.save_checkpoint(old)
+        await store.save_checkpoint(make_checkpoint("b", {"x": 2}, 1))
+
+        assert await store.prune_checkpoints(max_age_days=7) == 0
+        assert (await store.load_checkpoint("cp_node_complete_b_0001")).shared_memory == {"x": 2}
+
+
+class TestCheckpointWriteVolume:
+    @pytest.mark.asyncio
+    async def test_delta_bytes_per_node_on_50_node_graph(self, tmp_path):
+        """Each node adds one small output to an otherwise unchanged memory."""
+        base_memory = {f"context_{i}": "x" * 2000 for i in range(10)}
+
+        async def run(store: CheckpointStore) -> int:
+            memory = dict(base_memory)
+            for i in range(50):
+                memory[f"node_{i}_output"] = f"result {i}"
+                await store.save_checkpoint(make_checkpoint(f"node_{i}", dict(memory), i))
+            return store.bytes_written
+
+        full = await run(CheckpointStore(tmp_path / "full"))
+        delta = await run(CheckpointStore(tmp_path / "delta", delta_checkpoints=True))
+
+        print(f"\nbytes/node full={full / 50:.0f} delta={delta / 50:.0f}")
+        assert delta < full / 5
+
+        # The final checkpoint still reconstructs the complete memory
+        latest = await CheckpointStore(tmp_path / "delta").load_checkpoint()
+        assert len(latest.shared_memory) == 60
+
+
+class TestCheckpointReaders:
+    @pytest.mark.asyncio
+    async def test_cli_resume_rebuilds_delta_memory(self, tmp_path, monkeypatch):
+        from framework.runner.cli import _load_resume_state
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        session_dir = tmp_path / ".hive" / "agents" / "my_agent" / "sessions" / "session_test"
+        store = CheckpointStore(session_dir, delta_checkpoints=True)
+        await store.save_checkpoint(make_checkpoint("a", {"x": 1, "y": 2}, 0))
+        await store.save_checkpoint(make_checkpoint("b", {"x": 1, "y": 3}, 1))
+
+        state = _load_resume_state("exports/my_agent", "session_test", "cp_node_complete_b_0001")
+        assert state["memory"] == {"x": 1, "y": 3}
+        assert state["paused_at"] == "b"
+        assert _load_resume_state("exports/my_agent", "session_test", "missing") is None
+
+    @pytest.mark.asyncio
+    async def test_session_listing_counts_indexed_checkpoints(self, tmp_path):
+        from framework.server.routes_sessions import _count_checkpoints
+
+        assert _count_checkpoints(tmp_path) == 0
+        store = CheckpointStore(tmp_path, delta_checkpoints=True)
+        for i in range(3):
+            await store.save_checkpoint(make_checkpoint(f"n{i}", {"i": i}, i))
+        await store.delete_checkpoint("cp_node_complete_n2_0002")
+
+        assert _count_checkpoints(tmp_path) == 2
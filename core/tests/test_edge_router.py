@@ -0,0 +1,136 @@
+"""Tests for batched LLM routing of llm_decide edges."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
+from framework.graph.executor import GraphExecutor
+from framework.graph.goal import Goal
+from framework.graph.node import NodeResult, NodeSpec, SharedMemory
+
+
+class _RoutingLLM:
+    """Answers batched routing prompts with *batched*, single-edge prompts with proceed=True."""
+
+    def __init__(self, batched: str):
+        self.batched = batched
+        self.prompts: list[str] = []
+
+    async def acomplete(self, messages, **kwargs):
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        if "choosing which edges" in prompt:
+            return SimpleNamespace(content=self.batched)
+        return SimpleNamespace(content='{"proceed": true, "reasoning": "ok"}')
+
+
+def _graph(*extra_edges: EdgeSpec) -> GraphSpec:
+    nodes = [
+        NodeSpec(id=n, name=n.title(), description=n, node_type="event_loop")
+        for n in ("triage", "refund", "escalate", "close")
+    ]
+    edges = [
+        EdgeSpec(
+            id=f"to_{target}",
+            source="triage",
+            target=target,
+            condition=EdgeCondition.LLM_DECIDE,
+            description=f"Go to {target}",
+        )
+        for target in ("refund", "escalate", "close")
+    ]
+    edges.extend(extra_edges)
+    return GraphSpec(
+        id="g",
+        goal_id="goal",
+        entry_node="triage",
+        nodes=nodes,
+        edges=edges,
+        terminal_nodes=["refund", "escalate", "close"],
+    )
+
+
+async def _traversable(executor: GraphExecutor, graph: GraphSpec, output: dict) -> list[str]:
+    edges = await executor._get_all_traversable_edges(
+        graph=graph,
+        goal=Goal(id="goal", name="Resolve ticket", description="Resolve the ticket"),
+        current_node_id="triage",
+        current_node_spec=graph.get_node("triage"),
+        result=NodeResult(success=True, output=output),
+        memory=SharedMemory(),
+    )
+    return [e.id for e in edges]
+
+
+async def _next_node(executor: GraphExecutor, graph: GraphSpec, success: bool = True) -> str | None:
+    return await executor._follow_edges(
+        graph=graph,
+        goal=Goal(id="goal", name="Resolve ticket", description="Resolve the ticket"),
+        current_node_id="triage",
+        current_node_spec=graph.get_node("triage"),
+        result=NodeResult(success=success, output={"ticket": "x"}),
+        memory=SharedMemory(),
+    )
+
+
+def _priority_edge(condition: EdgeCondition) -> EdgeSpec:
+    return EdgeSpec(
+        id="priority", source="triage", target="close", condition=condition, priority=10
+    )
+
+
+class TestBatchedEdgeRouting:
+    @pytest.mark.asyncio
+    async def test_one_call_decides_all_edges_and_is_cached(self):
+        llm = _RoutingLLM(json.dumps({"proceed": ["to_refund"], "reasoning": "refundable"}))
+        executor = GraphExecutor(runtime=None, llm=llm)
+        graph = _graph()
+
+        assert await _traversable(executor, graph, {"ticket": "broken item"}) == ["to_refund"]
+        assert len(llm.prompts) == 1
+        assert all(f'"to_{t}"' in llm.prompts[0] for t in ("refund", "escalate", "close"))
+
+        # Same node + output: served from the cache
+        assert await _traversable(executor, graph, {"ticket": "broken item"}) == ["to_refund"]
+        assert len(llm.prompts) == 1
+        assert executor.edge_router.cache_hits == 1
+
+        # Different output: asks again
+        await _traversable(executor, graph, {"ticket": "late delivery"})
+        assert len(llm.prompts) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "batched",
+        ["I think refund is best", '{"proceed": ["to_nowhere"]}', '{"proceed": "to_refund"}'],
+    )
+    async def test_unusable_response_falls_back_to_per_edge(self, batched):
+        llm = _RoutingLLM(batched)
+        executor = GraphExecutor(runtime=None, llm=llm)
+
+        edges = await _traversable(executor, _graph(), {"ticket": "x"})
+
+        assert edges == ["to_refund", "to_escalate", "to_close"]
+        # One batched attempt, then one call per edge
+        assert len(llm.prompts) == 4
+        assert executor.edge_router.parse_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_follow_edges_skips_the_router_when_an_earlier_edge_matches(self):
+        llm = _RoutingLLM(json.dumps({"proceed": ["to_refund"]}))
+        executor = GraphExecutor(runtime=None, llm=llm)
+        graph = _graph(_priority_edge(EdgeCondition.ON_SUCCESS))
+
+        assert await _next_node(executor, graph) == "close"
+        assert llm.prompts == []
+
+    @pytest.mark.asyncio
+    async def test_follow_edges_batches_once_the_llm_edges_are_reached(self):
+        llm = _RoutingLLM(json.dumps({"proceed": ["to_escalate"]}))
+        executor = GraphExecutor(runtime=None, llm=llm)
+        graph = _graph(_priority_edge(EdgeCondition.ON_FAILURE))
+
+        assert await _next_node(executor, graph) == "escalate"
+        assert len(llm.prompts) == 1
@@ -0,0 +1,113 @@
+"""Tests and microbenchmark for indexed EventBus dispatch.
+
+Run the benchmark with output:
+    cd core
+    pytest tests/test_event_bus_dispatch.py -v -s
+"""
+
+import time
+
+import pytest
+
+from framework.runtime.event_bus import AgentEvent, EventBus, EventType
+
+PUBLISHES = 2000
+
+
+def _delta(stream_id: str = "s0") -> AgentEvent:
+    return AgentEvent(type=EventType.LLM_TEXT_DELTA, stream_id=stream_id, data={"content": "x"})
+
+
+class TestDispatchIndex:
+    @pytest.mark.asyncio
+    async def test_delivers_in_registration_order(self):
+        bus = EventBus()
+        order: list[str] = []
+
+        def make(name: str):
+            async def handler(event: AgentEvent) -> None:
+                order.append(name)
+
+            return handler
+
+        bus.subscribe([EventType.LLM_TEXT_DELTA], make("any-1"))
+        bus.subscribe([EventType.LLM_TEXT_DELTA], make("s1"), filter_stream="s1")
+        bus.subscribe([EventType.LLM_TEXT_DELTA], make("s2"), filter_stream="s2")
+        bus.subscribe([EventType.LLM_TEXT_DELTA, EventType.TOOL_CALL_STARTED], make("any-2"))
+        bus.subscribe([EventType.LLM_TEXT_DELTA], make("s1-2"), filter_stream="s1")
+        bus.subscribe([EventType.LLM_TEXT_DELTA], make("exec"), filter_execution="other")
+
+        await bus.publish(_delta("s1"))
+        assert order == ["any-1", "s1", "any-2", "s1-2"]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_removes_from_index(self):
+        bus = EventBus()
+        received: list[AgentEvent] = []
+
+        async def handler(event: AgentEvent) -> None:
+            received.append(event)
+
+        sub_id = bus.subscribe(
+            [EventType.LLM_TEXT_DELTA, EventType.CLIENT_OUTPUT_DELTA],
+            handler,
+            filter_stream="s0",
+        )
+        assert bus.unsubscribe(sub_id)
+        assert bus._dispatch_index == {}
+        await bus.publish(_delta())
+        assert received == []
+        assert not bus.unsubscribe(sub_id)
+
+    @pytest.mark.asyncio
+    async def test_event_without_stream_reaches_wildcard_once(self):
+        bus = EventBus()
+        received: list[AgentEvent] = []
+
+        async def handler(event: AgentEvent) -> None:
+            received.append(event)
+
+        bus.subscribe([EventType.LLM_TEXT_DELTA], handler)
+        await bus.publish(_delta(""))
+        assert len(received) == 1
+
+
+class TestDispatchPerformance:
+    """Publish throughput with many subscriptions that do not match the event."""
+
+    async def _throughput(self, bus: EventBus) -> float:
+        event = _delta()
+        start = time.perf_counter()
+        for _ in range(PUBLISHES):
+            await bus.publish(event)
+        return PUBLISHES / (time.perf_counter() - start)
+
+    async def _bus_with(self, n_subscriptions: int) -> EventBus:
+        bus = EventBus(max_history=100)
+
+        async def handler(event: AgentEvent) -> None:
+            pass
+
+        # One real listener on the token stream, the rest on other streams or types
+        bus.subscribe([EventType.LLM_TEXT_DELTA], handler, filter_stream="s0")
+        for i in range(n_subscriptions - 1):
+            if i % 2:
+                bus.subscribe([EventType.EXECUTION_COMPLETED], handler)
+            else:
+                bus.subscribe([EventType.LLM_TEXT_DELTA], handler, filter_stream=f"other-{i}")
+        return bus
+
+    @pytest.mark.asyncio
+    async def test_publish_throughput_independent_of_subscription_count(self):
+        await self._throughput(await self._bus_with(1))  # warm up
+        results = {}
+        for n in (1, 100, 1000):
+            results[n] = await self._throughput(await self._bus_with(n))
+
+        print()
+        for n, rate in results.items():
+            print(f"  {n:>5} subscriptions: {rate:>10.0f} publishes/s")
+
+        # A linear scan would be ~1000x slower per publish at 1000 subscriptions;
+        # with the index only the matching subscriber is visited.
+        assert results[1000] > results[1] / 3
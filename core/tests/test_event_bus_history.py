@@ -0,0 +1,86 @@
+"""Tests for the EventBus history ring buffer and sequence-based replay."""
+
+import pytest
+
+from framework.runtime.event_bus import AgentEvent, EventBus, EventType
+
+
+def _event(
+    event_type: EventType, execution_id: str | None = None, stream_id: str = "s"
+) -> AgentEvent:
+    return AgentEvent(type=event_type, stream_id=stream_id, execution_id=execution_id)
+
+
+class TestEventHistory:
+    @pytest.mark.asyncio
+    async def test_publish_stamps_contiguous_seq(self):
+        bus = EventBus()
+        events = [_event(EventType.LLM_TEXT_DELTA) for _ in range(3)]
+        for event in events:
+            await bus.publish(event)
+        assert [e.seq for e in events] == [1, 2, 3]
+        assert bus.last_seq == 3
+        assert bus.oldest_seq == 1
+
+    @pytest.mark.asyncio
+    async def test_ring_buffer_evicts_oldest_and_trims_indices(self):
+        bus = EventBus(max_history=5)
+        for i in range(12):
+            event_type = EventType.TOOL_CALL_STARTED if i % 3 == 0 else EventType.LLM_TEXT_DELTA
+            await bus.publish(_event(event_type, execution_id=f"exec_{i % 2}"))
+
+        assert bus.oldest_seq == 8
+        assert [e.seq for e in bus.get_history(limit=100)] == [12, 11, 10, 9, 8]
+        assert [e.seq for e in bus.get_history(event_type=EventType.TOOL_CALL_STARTED)] == [10]
+        assert [e.seq for e in bus.get_history(execution_id="exec_0")] == [11, 9]
+        assert [
+            e.seq
+            for e in bus.get_history(event_type=EventType.LLM_TEXT_DELTA, execution_id="exec_1")
+        ] == [12, 8]
+
+        stats = bus.get_stats()
+        assert stats["total_events"] == 5
+        assert stats["events_by_type"] == {"tool_call_started": 1, "llm_text_delta": 4}
+
+        # Indices for fully evicted executions are dropped
+        for _ in range(5):
+            await bus.publish(_event(EventType.LLM_TEXT_DELTA))
+        assert bus._history_by_execution == {}
+        assert set(bus._history_by_type) == {EventType.LLM_TEXT_DELTA}
+
+    @pytest.mark.asyncio
+    async def test_get_history_filters_and_limits(self):
+        bus = EventBus()
+        await bus.publish(_event(EventType.EXECUTION_STARTED, "e1", stream_id="a"))
+        await bus.publish(_event(EventType.EXECUTION_STARTED, "e2", stream_id="b"))
+        await bus.publish(_event(EventType.EXECUTION_STARTED, "e3", stream_id="a"))
+
+        started = bus.get_history(event_type=EventType.EXECUTION_STARTED, stream_id="a")
+        assert [e.execution_id for e in started] == ["e3", "e1"]
+        assert [e.execution_id for e in bus.get_history(limit=1)] == ["e3"]
+        assert bus.get_history(event_type=EventType.EXECUTION_FAILED) == []
+
+
+class TestEventsSince:
+    @pytest.mark.asyncio
+    async def test_returns_events_after_cursor_in_order(self):
+        bus = EventBus(max_history=10)
+        for i in range(15):
+            event_type = EventType.CLIENT_OUTPUT_DELTA if i % 2 else EventType.LLM_TEXT_DELTA
+            await bus.publish(_event(event_type))
+
+        assert [e.seq for e in bus.events_since(12)] == [13, 14, 15]
+        assert [e.seq for e in bus.events_since(7)] == [8, 9, 10, 11, 12, 13, 14, 15]
+        # A cursor older than the buffer returns whatever is still retained
+        assert [e.seq for e in bus.events_since(0)][0] == 6
+        assert bus.events_since(15) == []
+
+        deltas = bus.events_since(9, event_types={EventType.CLIENT_OUTPUT_DELTA}, limit=2)
+        assert [e.seq for e in deltas] == [10, 12]
+
+    @pytest.mark.asyncio
+    async def test_empty_bus(self):
+        bus = EventBus()
+        assert bus.events_since(0) == []
+        assert bus.oldest_seq is None
+        assert bus.last_seq == 0
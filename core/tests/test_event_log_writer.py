@@ -0,0 +1,107 @@
+"""Tests for the batched background event-log writer."""
+
+import json
+import time
+
+import pytest
+
+from framework.runtime.event_bus import AgentEvent, EventBus, EventType
+from framework.runtime.event_log_writer import BatchedLogWriter
+
+
+def _read_lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestBatchedLogWriter:
+    def test_writes_in_order_and_group_commits(self, tmp_path):
+        writer = BatchedLogWriter(tmp_path / "log.jsonl", flush_interval=0.5, max_batch=100)
+        for i in range(250):
+            writer.write(json.dumps({"i": i}))
+        writer.close()
+
+        assert [r["i"] for r in _read_lines(tmp_path / "log.jsonl")] == list(range(250))
+        assert writer.lines_written == 250
+        assert writer.batches_written < 10
+
+    def test_flush_waits_for_queued_lines(self, tmp_path):
+        writer = BatchedLogWriter(tmp_path / "log.jsonl", flush_interval=10.0)
+        writer.write('{"a": 1}')
+        assert writer.flush(timeout=5.0)
+        assert _read_lines(tmp_path / "log.jsonl") == [{"a": 1}]
+        writer.close()
+
+    def test_close_is_idempotent_and_drops_late_writes(self, tmp_path):
+        writer = BatchedLogWriter(tmp_path / "log.jsonl", fsync="close")
+        writer.write('{"a": 1}')
+        writer.close()
+        writer.close()
+        writer.write('{"a": 2}')
+        assert writer.closed
+        assert writer.flush()
+        assert _read_lines(tmp_path / "log.jsonl") == [{"a": 1}]
+
+    def test_fsync_policy(self, tmp_path, monkeypatch):
+        with pytest.raises(ValueError):
+            BatchedLogWriter(tmp_path / "log.jsonl", fsync="sometimes")
+
+        monkeypatch.setenv("HIVE_EVENT_LOG_FSYNC", "batch")
+        writer = BatchedLogWriter(tmp_path / "log.jsonl")
+        assert writer.fsync == "batch"
+        writer.write("{}")
+        writer.close()
+        assert _read_lines(tmp_path / "log.jsonl") == [{}]
+
+
+class TestSessionLog:
+    @pytest.mark.asyncio
+    async def test_session_log_coalesces_deltas_and_flushes_on_close(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        bus = EventBus()
+        bus.set_session_log(path)
+
+        for i in range(3):
+            await bus.publish(
+                AgentEvent(
+                    type=EventType.CLIENT_OUTPUT_DELTA,
+                    stream_id="queen",
+                    node_id="n",
+                    data={"snapshot": "x" * (i + 1), "iteration": 0},
+                )
+            )
+        await bus.publish(
+            AgentEvent(type=EventType.LLM_TURN_COMPLETE, stream_id="queen", node_id="n")
+        )
+        await bus.publish(AgentEvent(type=EventType.EXECUTION_COMPLETED, stream_id="queen"))
+        bus.close_session_log()
+
+        records = _read_lines(path)
+        assert [r["type"] for r in records] == [
+            "client_output_delta",
+            "llm_turn_complete",
+            "execution_completed",
+        ]
+        assert records[0]["data"]["snapshot"] == "xxx"
+
+    @pytest.mark.asyncio
+    async def test_slow_disk_does_not_block_publish(self, tmp_path, monkeypatch):
+        bus = EventBus()
+        bus.set_session_log(tmp_path / "events.jsonl")
+        writer = bus._session_log
+        real_commit = writer._commit
+
+        def slow_commit(lines):
+            time.sleep(0.2)
+            real_commit(lines)
+
+        monkeypatch.setattr(writer, "_commit", slow_commit)
+
+        start = time.perf_counter()
+        for _ in range(20):
+            await bus.publish(AgentEvent(type=EventType.EXECUTION_STARTED, stream_id="s"))
+        elapsed = time.perf_counter() - start
+        assert elapsed < 0.2
+
+        assert bus.flush_session_log(timeout=5.0)
+        assert len(_read_lines(tmp_path / "events.jsonl")) == 20
+        bus.close_session_log()
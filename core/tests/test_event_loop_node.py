@@ -2335,6 +2335,32 @@ def test_build_context_defaults_execution_id_for_plain_runtime(self):
         )
         assert ctx.execution_id == ""
 
+    def test_build_context_ranks_skills_catalog_for_node(self):
+        """_build_context asks the catalog provider for this node's catalog."""
+        from framework.graph.executor import GraphExecutor
+        from framework.graph.goal import Goal
+
+        tasks = []
+        executor = GraphExecutor(
+            runtime=MagicMock(spec=Runtime),
+            skills_catalog_prompt="full catalog",
+            skills_catalog_provider=lambda task: tasks.append(task) or "ranked catalog",
+        )
+
+        goal = Goal(id="g1", name="test", description="test", success_criteria=[])
+        node_spec = NodeSpec(
+            id="n1",
+            name="Report",
+            description="Write the SQL report",
+            node_type="event_loop",
+            system_prompt="Query the warehouse.",
+        )
+        ctx = executor._build_context(
+            node_spec=node_spec, memory=SharedMemory(), goal=goal, input_data={}
+        )
+        assert ctx.skills_catalog_prompt == "ranked catalog"
+        assert tasks == ["Report\nWrite the SQL report\nQuery the warehouse."]
+
 
 # ---------------------------------------------------------------------------
 # Subagent memory snapshot includes accumulator outputs
@@ -14,6 +14,7 @@
 import threading
 import time
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,6 +24,7 @@
 from framework.llm.litellm import (
     OPENROUTER_TOOL_COMPAT_MODEL_CACHE,
     LiteLLMProvider,
+    _apply_cache_breakpoints,
     _compute_retry_delay,
     _ensure_ollama_chat_prefix,
     _is_ollama_model,
@@ -1187,3 +1189,143 @@ def test_empty_config_returns_empty(self):
         with patch("framework.config.get_hive_config", return_value={}):
             result = get_llm_extra_kwargs()
         assert result == {}
+
+
+def _fake_stream(text: str, usage):
+    """Minimal litellm streaming response: one text chunk, then a finish chunk with usage."""
+
+    async def _chunks():
+        yield SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    delta=SimpleNamespace(content=text, tool_calls=None),
+                    finish_reason=None,
+                )
+            ],
+            usage=None,
+        )
+        yield SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    delta=SimpleNamespace(content=None, tool_calls=None),
+                    finish_reason="stop",
+                )
+            ],
+            usage=usage,
+        )
+
+    return _chunks()
+
+
+def _cache_marked(messages: list[dict]) -> list[int]:
+    return [i for i, m in enumerate(messages) if "cache_control" in m]
+
+
+class TestPromptCacheBreakpoints:
+    """Rolling cache_control breakpoints on the conversation prefix."""
+
+    HISTORY = [
+        {"role": "user", "content": "find the report"},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {"id": "t1", "type": "function", "function": {"name": "search", "arguments": "{}"}}
+            ],
+        },
+        {"role": "tool", "tool_call_id": "t1", "content": "report.pdf"},
+        {"role": "assistant", "content": "Found it. Summarize?"},
+        {"role": "user", "content": "yes"},
+    ]
+    TOOLS = [
+        Tool(name="search", description="Search", parameters={"properties": {}}),
+        Tool(name="read", description="Read", parameters={"properties": {}}),
+    ]
+
+    async def _stream_kwargs(self, model: str, messages: list[dict], usage=None) -> dict:
+        captured: dict = {}
+
+        async def fake_acompletion(**kwargs):
+            captured.update(kwargs)
+            return _fake_stream("ok", usage)
+
+        provider = LiteLLMProvider(model=model, api_key="test-key")
+        with patch("litellm.acompletion", side_effect=fake_acompletion):
+            events = [
+                e
+                async for e in provider.stream(
+                    messages=messages, system="You are helpful.", tools=self.TOOLS
+                )
+            ]
+        captured["_events"] = events
+        return captured
+
+    @pytest.mark.asyncio
+    async def test_marks_tools_system_and_rolling_conversation_prefix(self):
+        messages = [dict(m) for m in self.HISTORY]
+        kwargs = await self._stream_kwargs("anthropic/claude-sonnet-4-20250514", messages)
+
+        sent = kwargs["messages"]
+        assert sent[0]["role"] == "system" and "cache_control" in sent[0]
+        # Last message, plus where the previous turn's request ended (before
+        # the latest assistant reply)
+        assert _cache_marked(sent[1:]) == [2, 4]
+        assert "cache_control" in kwargs["tools"][-1]
+        assert "cache_control" not in kwargs["tools"][0]
+        breakpoints = len(_cache_marked(sent)) + len(_cache_marked(kwargs["tools"]))
+        assert breakpoints <= 4
+        # The caller's message dicts are not mutated
+        assert messages == self.HISTORY
+
+    @pytest.mark.asyncio
+    async def test_breakpoints_follow_history_after_compaction(self):
+        compacted = [
+            {"role": "user", "content": "Summary of earlier conversation: report found."},
+            {"role": "assistant", "content": "Summarize?"},
+            {"role": "user", "content": "yes"},
+        ]
+        kwargs = await self._stream_kwargs("claude-sonnet-4-20250514", compacted)
+        assert _cache_marked(kwargs["messages"][1:]) == [0, 2]
+
+    @pytest.mark.asyncio
+    async def test_first_turn_breakpoint_skips_the_system_prompt(self):
+        greeting = [
+            {"role": "assistant", "content": "Hi, what can I do?"},
+            {"role": "user", "content": "find the report"},
+        ]
+        kwargs = await self._stream_kwargs("claude-sonnet-4-20250514", greeting)
+        sent = kwargs["messages"]
+        # The turn before the greeting is the system prompt, which already
+        # has its own breakpoint; only the conversation tail is added
+        assert _cache_marked(sent) == [0, 2]
+
+    def test_breakpoints_never_land_on_system_messages(self):
+        messages = [
+            {"role": "system", "content": "billing header"},
+            {"role": "assistant", "content": "Hi"},
+            {"role": "user", "content": "hello"},
+        ]
+        assert _cache_marked(_apply_cache_breakpoints(messages)) == [2]
+        assert _cache_marked(_apply_cache_breakpoints(messages[:1])) == []
+
+    @pytest.mark.asyncio
+    async def test_no_breakpoints_for_models_without_cache_control(self):
+        kwargs = await self._stream_kwargs("gpt-4o-mini", list(self.HISTORY))
+        assert _cache_marked(kwargs["messages"]) == []
+        assert _cache_marked(kwargs["tools"]) == []
+
+    @pytest.mark.asyncio
+    async def test_finish_event_reports_cache_read_and_write_tokens(self):
+        from framework.llm.stream_events import FinishEvent
+
+        usage = SimpleNamespace(
+            prompt_tokens=1200,
+            completion_tokens=20,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1000),
+            cache_creation_input_tokens=150,
+        )
+        kwargs = await self._stream_kwargs("anthropic/claude-sonnet-4-20250514", [], usage)
+        finish = [e for e in kwargs["_events"] if isinstance(e, FinishEvent)]
+        assert len(finish) == 1
+        assert finish[0].cached_tokens == 1000
+        assert finish[0].cache_write_tokens == 150
@@ -1,5 +1,9 @@
 """Unit tests for MCP client transport and reconnect behavior."""
 
+import asyncio
+import sys
+import textwrap
+import time
 from types import SimpleNamespace
 
 import httpx
@@ -226,3 +230,81 @@ def post(self, _path, json):
     assert "Failed to call tool via HTTP" in str(exc_info.value)
     assert exc_info.value.__cause__ is connect_error
     assert reconnects == []
+
+
+_STAND_IN_SERVER = textwrap.dedent(
+    """
+    import asyncio
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("stand-in")
+
+
+    @mcp.tool()
+    async def slow_echo(value: str, delay: float) -> str:
+        await asyncio.sleep(delay)
+        return value
+
+
+    mcp.run()
+    """
+)
+
+
+@pytest.fixture
+def stand_in_client(tmp_path):
+    """MCPClient connected over STDIO to a local stand-in server with a sleeping tool."""
+    script = tmp_path / "stand_in_server.py"
+    script.write_text(_STAND_IN_SERVER)
+    client = MCPClient(
+        MCPServerConfig(
+            name="stand-in",
+            transport="stdio",
+            command=sys.executable,
+            args=[str(script)],
+        )
+    )
+    client.connect()
+    yield client
+    client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_call_tool_async_returns_stdio_result(stand_in_client):
+    result = await stand_in_client.call_tool_async("slow_echo", {"value": "hi", "delay": 0})
+    assert result == "hi"
+
+    with pytest.raises(ValueError, match="Unknown tool"):
+        await stand_in_client.call_tool_async("missing", {})
+
+
+@pytest.mark.asyncio
+async def test_parallel_stdio_calls_overlap_benchmark(stand_in_client):
+    """N concurrent calls share one STDIO session instead of queueing behind a lock."""
+    n_calls, delay = 8, 0.25
+
+    start = time.perf_counter()
+    serial = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                stand_in_client.call_tool, "slow_echo", {"value": str(i), "delay": delay}
+            )
+            for i in range(n_calls)
+        )
+    )
+    serial_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = await asyncio.gather(
+        *(
+            stand_in_client.call_tool_async("slow_echo", {"value": str(i), "delay": delay})
+            for i in range(n_calls)
+        )
+    )
+    parallel_elapsed = time.perf_counter() - start
+
+    # Responses are matched to their requests, not to arrival order
+    assert serial == parallel == [str(i) for i in range(n_calls)]
+    assert serial_elapsed >= n_calls * delay
+    assert parallel_elapsed < n_calls * delay / 2
@@ -0,0 +1,175 @@
+"""Tests for replicated MCP server connections."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from framework.runner.mcp_client import MCPServerConfig, MCPTool
+from framework.runner.mcp_connection_manager import MCPConnectionManager
+from framework.runner.mcp_replica_pool import MCPReplicaPool
+
+
+class FakeReplicaClient:
+    """One fake server process; calls block until ``release`` is set."""
+
+    instances: list["FakeReplicaClient"] = []
+    release = threading.Event()
+
+    def __init__(self, config: MCPServerConfig):
+        self.config = config
+        self._connected = False
+        self.calls = 0
+        self.healthy = True
+        self.fail_calls = False
+        self.disconnect_calls = 0
+        FakeReplicaClient.instances.append(self)
+
+    def connect(self) -> None:
+        self._connected = True
+
+    def disconnect(self) -> None:
+        self.disconnect_calls += 1
+        self._connected = False
+
+    def list_tools(self) -> list[MCPTool]:
+        if not self.healthy:
+            raise RuntimeError("dead")
+        return [MCPTool("ping", "Ping", {"type": "object"}, self.config.name)]
+
+    def call_tool(self, tool_name, arguments):
+        self.calls += 1
+        if self.fail_calls:
+            raise RuntimeError("MCP tool 'ping' failed")
+        if arguments.get("block"):
+            FakeReplicaClient.release.wait(5)
+        return f"replica {FakeReplicaClient.instances.index(self)}"
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr("framework.runner.mcp_connection_manager.MCPClient", FakeReplicaClient)
+    monkeypatch.setattr(MCPConnectionManager, "_instance", None)
+    FakeReplicaClient.instances.clear()
+    FakeReplicaClient.release.clear()
+    manager = MCPConnectionManager.get_instance()
+    yield manager
+    FakeReplicaClient.release.set()
+    manager.cleanup_all()
+    monkeypatch.setattr(MCPConnectionManager, "_instance", None)
+
+
+def _config(min_replicas=2, max_replicas=3) -> MCPServerConfig:
+    return MCPServerConfig(
+        name="hive-tools",
+        transport="stdio",
+        command="echo",
+        min_replicas=min_replicas,
+        max_replicas=max_replicas,
+    )
+
+
+def test_single_replica_servers_keep_a_plain_client(manager):
+    client = manager.acquire(MCPServerConfig(name="solo", transport="stdio", command="echo"))
+    assert isinstance(client, FakeReplicaClient)
+
+
+def test_calls_go_to_the_least_busy_replica(manager):
+    pool = manager.acquire(_config(max_replicas=2))
+    assert isinstance(pool, MCPReplicaPool)
+    assert len(FakeReplicaClient.instances) == 2
+
+    blocked = threading.Thread(target=pool.call_tool, args=("ping", {"block": True}))
+    blocked.start()
+    deadline = time.monotonic() + 2
+    while sum(c.calls for c in FakeReplicaClient.instances) == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    busy = next(c for c in FakeReplicaClient.instances if c.calls)
+
+    # Every call made meanwhile goes to the idle replica
+    for _ in range(3):
+        assert pool.call_tool("ping", {}) != f"replica {FakeReplicaClient.instances.index(busy)}"
+    FakeReplicaClient.release.set()
+    blocked.join()
+
+
+def test_pool_scales_up_under_queue_depth(manager):
+    pool = manager.acquire(_config(min_replicas=1, max_replicas=3))
+    pool.scale_up_queue_depth = 1
+
+    async def burst():
+        return await asyncio.gather(
+            *(pool.call_tool_async("ping", {"block": True}) for _ in range(4)),
+            _release_later(),
+        )
+
+    async def _release_later():
+        await asyncio.sleep(0.3)
+        FakeReplicaClient.release.set()
+
+    asyncio.run(burst())
+
+    assert pool.scale_ups >= 1
+    assert 1 < len(pool.stats()["replicas"]) <= 3
+
+
+def test_idle_replicas_above_minimum_are_retired(manager):
+    pool = manager.acquire(_config(min_replicas=1, max_replicas=3))
+    pool._spawning += 1  # noqa: SLF001 - simulate an autoscaled replica
+    pool._spawn(scale_up=True)  # noqa: SLF001
+    pool.idle_timeout_s = 0.0
+
+    time.sleep(0.01)
+    pool.call_tool("ping", {})
+
+    assert len(pool.stats()["replicas"]) == 1
+    assert pool.scale_downs == 1
+
+
+def test_failing_replica_is_probed_evicted_and_replaced(manager):
+    pool = MCPReplicaPool(_config(min_replicas=1, max_replicas=2), FakeReplicaClient)
+    pool.connect()
+    bad = FakeReplicaClient.instances[0]
+    bad.fail_calls = True
+
+    # Tool errors alone do not evict a replica that passes its health check
+    for _ in range(pool.max_consecutive_failures):
+        with pytest.raises(RuntimeError):
+            pool.call_tool("ping", {})
+    time.sleep(0.1)
+    assert pool.evictions == 0
+
+    bad.healthy = False
+    for _ in range(pool.max_consecutive_failures):
+        with pytest.raises(RuntimeError):
+            pool.call_tool("ping", {})
+    deadline = time.monotonic() + 2
+    while len(FakeReplicaClient.instances) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert pool.evictions == 1
+    assert bad.disconnect_calls == 1
+    assert pool.call_tool("ping", {}) == "replica 1"
+    pool.disconnect()
+
+
+def test_health_check_evicts_dead_replicas(manager):
+    pool = manager.acquire(_config(min_replicas=2, max_replicas=2))
+    FakeReplicaClient.instances[0].healthy = False
+
+    assert manager.health_check("hive-tools") is True
+    assert pool.evictions == 1
+    assert all(r.client.healthy for r in pool._replicas)  # noqa: SLF001
+
+
+def test_stats_report_per_replica_latency(manager):
+    pool = manager.acquire(_config())
+    for _ in range(5):
+        pool.call_tool("ping", {})
+
+    stats = manager.stats()["hive-tools"]
+    assert stats["refcount"] == 1
+    assert stats["max_replicas"] == 3
+    assert sum(r["calls"] for r in stats["replicas"]) == 5
+    assert all("latency_p95_ms" in r for r in stats["replicas"])
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import time
 from typing import Any
 
 import pytest
@@ -366,6 +367,103 @@ async def test_export_summary_output_keys(self):
         assert "output_keys" not in conv2.export_summary()
 
 
+# ===================================================================
+# Incremental token accounting
+# ===================================================================
+
+
+def _recomputed_chars_estimate(conv: NodeConversation) -> int:
+    total = 0
+    for m in conv.messages:
+        total += len(m.content)
+        for tc in m.tool_calls or []:
+            total += len(tc["function"]["arguments"]) + len(tc["function"]["name"])
+    return total // 4
+
+
+class TestIncrementalTokenAccounting:
+    @pytest.mark.asyncio
+    async def test_running_estimate_matches_full_recount(self, tmp_path):
+        store = MockConversationStore()
+        conv = NodeConversation(store=store)
+        await conv.add_user_message("u" * 401)
+        for i in range(6):
+            await conv.add_assistant_message(
+                "",
+                tool_calls=[
+                    {
+                        "id": f"c{i}",
+                        "type": "function",
+                        "function": {"name": "search", "arguments": '{"q": "x"}'},
+                    }
+                ],
+            )
+            await conv.add_tool_result(f"c{i}", "r" * 3000)
+        assert conv.estimate_tokens() == _recomputed_chars_estimate(conv)
+
+        assert await conv.prune_old_tool_results(protect_tokens=1000, min_prune_tokens=100)
+        assert conv.estimate_tokens() == _recomputed_chars_estimate(conv)
+
+        await conv.compact_preserving_structure(str(tmp_path), keep_recent=4)
+        assert conv.estimate_tokens() == _recomputed_chars_estimate(conv)
+
+        restored = await NodeConversation.restore(store)
+        assert restored.estimate_tokens() == _recomputed_chars_estimate(restored)
+
+        await conv.compact("summary", keep_recent=1)
+        assert conv.estimate_tokens() == _recomputed_chars_estimate(conv)
+
+    @pytest.mark.asyncio
+    async def test_messages_added_after_api_count_are_estimated_on_top(self):
+        conv = NodeConversation()
+        await conv.add_user_message("a" * 400)
+        conv.update_token_count(500)  # includes system prompt + tools
+
+        await conv.add_assistant_message("b" * 40)
+        await conv.add_user_message("c" * 4000)
+
+        assert conv.estimate_tokens() == 500 + 10 + 1000
+
+    @pytest.mark.asyncio
+    async def test_token_counter_memoizes_by_content(self):
+        from framework.llm.token_counting import MESSAGE_OVERHEAD_TOKENS, TokenCounter
+
+        calls: list[str] = []
+
+        def count_words(text: str) -> int:
+            calls.append(text)
+            return len(text.split())
+
+        counter = TokenCounter(count_words)
+        conv = NodeConversation(token_counter=counter)
+        await conv.add_user_message("one two three")
+        await conv.add_assistant_message("four five")
+        assert conv.estimate_tokens() == 5 + 2 * MESSAGE_OVERHEAD_TOKENS
+        assert len(calls) == 2
+
+        # Budget checks are O(1): no re-tokenizing
+        for _ in range(100):
+            conv.needs_compaction()
+            conv.usage_ratio()
+        assert len(calls) == 2
+
+        # Recount after compaction only tokenizes the new summary message
+        await conv.compact("summary text", keep_recent=1)
+        assert conv.estimate_tokens() == 2 + 2 + 2 * MESSAGE_OVERHEAD_TOKENS
+        assert calls[2:] == ["summary text"]
+
+    @pytest.mark.asyncio
+    async def test_set_token_counter_recounts_history(self):
+        from framework.llm.token_counting import MESSAGE_OVERHEAD_TOKENS, TokenCounter
+
+        conv = NodeConversation()
+        await conv.add_user_message("x" * 400)
+        assert conv.estimate_tokens() == 100
+
+        conv.set_token_counter(TokenCounter(lambda text: 7))
+        assert conv.estimate_tokens() == 7 + MESSAGE_OVERHEAD_TOKENS
+
+
 # ===================================================================
 # Output-key extraction
 # ===================================================================
@@ -1528,3 +1626,147 @@ def test_mixed_orphans(self):
         roles = [m["role"] for m in repaired]
         assert roles == ["user", "assistant", "tool", "user"]
         assert repaired[2]["tool_call_id"] == "tc_2"
+
+    def test_partial_results_keep_stub_next_to_call(self):
+        """Stubs for missing results go right after the assistant message."""
+        msgs = [
+            {
+                "role": "assistant",
+                "content": "",
+                "tool_calls": [
+                    {"id": "tc_1", "function": {"name": "a", "arguments": "{}"}},
+                    {"id": "tc_2", "function": {"name": "b", "arguments": "{}"}},
+                ],
+            },
+            {"role": "tool", "tool_call_id": "tc_2", "content": "b done"},
+        ]
+        repaired = NodeConversation._repair_orphaned_tool_calls(msgs)
+        assert [m.get("tool_call_id") for m in repaired] == [None, "tc_1", "tc_2"]
+        assert "interrupted" in repaired[1]["content"].lower()
+
+
+# ---------------------------------------------------------------------------
+# Tests: cached to_llm_messages
+# ---------------------------------------------------------------------------
+
+
+async def _build_tool_conversation(pairs: int) -> NodeConversation:
+    conv = NodeConversation(max_context_tokens=0)
+    await conv.add_user_message("Start")
+    for i in range(pairs):
+        await conv.add_assistant_message(
+            f"step {i}",
+            tool_calls=[_make_tool_call(f"call_{i}", "web_search", {"query": f"q{i}"})],
+        )
+        await conv.add_tool_result(f"call_{i}", f"result {i} " + "r" * 200)
+    return conv
+
+
+def _uncached_llm_messages(conv: NodeConversation) -> list[dict[str, Any]]:
+    return NodeConversation._repair_orphaned_tool_calls([m.to_llm_dict() for m in conv.messages])
+
+
+class TestLlmMessageCache:
+    @pytest.mark.asyncio
+    async def test_matches_fresh_conversion_through_mutations(self, tmp_path):
+        conv = await _build_tool_conversation(20)
+        assert conv.to_llm_messages() == _uncached_llm_messages(conv)
+
+        # Dangling tool call gets a stub, which disappears once answered
+        await conv.add_assistant_message("more", tool_calls=[_make_tool_call("x", "f", {})])
+        assert conv.to_llm_messages()[-1]["content"].startswith("ERROR")
+        await conv.add_tool_result("x", "ok")
+        assert conv.to_llm_messages() == _uncached_llm_messages(conv)
+
+        await conv.prune_old_tool_results(protect_tokens=100, min_prune_tokens=10)
+        assert conv.to_llm_messages() == _uncached_llm_messages(conv)
+
+        # Appended behind the conversation's back
+        conv._messages.append(Message(seq=conv._next_seq, role="user", content="direct"))
+        conv._next_seq += 1
+        assert conv.to_llm_messages() == _uncached_llm_messages(conv)
+
+        await conv.compact_preserving_structure(spillover_dir=str(tmp_path), keep_recent=4)
+        assert conv.to_llm_messages() == _uncached_llm_messages(conv)
+
+        await conv.compact("summary", keep_recent=3)
+        assert conv.to_llm_messages() == _uncached_llm_messages(conv)
+
+        await conv.clear()
+        assert conv.to_llm_messages() == []
+
+    @pytest.mark.asyncio
+    async def test_late_tool_call_restores_dropped_result(self):
+        conv = NodeConversation()
+        await conv.add_user_message("Start")
+        await conv.add_tool_result("late", "result")
+        assert [m["role"] for m in conv.to_llm_messages()] == ["user"]
+        await conv.add_user_message("Again")
+        conv.to_llm_messages()
+        await conv.add_assistant_message("call", tool_calls=[_make_tool_call("late", "f", {})])
+        assert conv.to_llm_messages() == _uncached_llm_messages(conv)
+        assert [m["role"] for m in conv.to_llm_messages()] == [
+            "user",
+            "tool",
+            "user",
+            "assistant",
+            "tool",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_messages_converted_once(self, monkeypatch):
+        conv = await _build_tool_conversation(5)
+        conv.to_llm_messages()
+
+        calls = 0
+        original = Message.to_llm_dict
+
+        def counting(self):
+            nonlocal calls
+            calls += 1
+            return original(self)
+
+        monkeypatch.setattr(Message, "to_llm_dict", counting)
+        conv.to_llm_messages()
+        assert calls == 0
+        await conv.add_user_message("next")
+        conv.to_llm_messages()
+        assert calls == 1
+        # compact keeps the recent tail: only the summary is new
+        await conv.compact("summary", keep_recent=2)
+        conv.to_llm_messages()
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_returned_list_is_a_copy(self):
+        conv = await _build_tool_conversation(2)
+        first = conv.to_llm_messages()
+        first.append({"role": "user", "content": "extra"})
+        assert len(conv.to_llm_messages()) == len(first) - 1
+
+    @pytest.mark.asyncio
+    async def test_benchmark_2k_messages(self):
+        """Per-turn cost of building LLM messages for a 2k-message conversation."""
+        conv = await _build_tool_conversation(1000)
+        assert conv.message_count == 2001
+        turns = 50
+
+        start = time.perf_counter()
+        for i in range(turns):
+            await conv.add_user_message(f"turn {i}")
+            _uncached_llm_messages(conv)
+        uncached = (time.perf_counter() - start) / turns
+
+        conv.to_llm_messages()
+        start = time.perf_counter()
+        for i in range(turns):
+            await conv.add_user_message(f"turn {i}")
+            conv.to_llm_messages()
+        cached = (time.perf_counter() - start) / turns
+
+        print(
+            f"to_llm_messages per turn: uncached {uncached * 1e3:.2f} ms, "
+            f"cached {cached * 1e3:.2f} ms"
+        )
+        assert conv.to_llm_messages() == _uncached_llm_messages(conv)
+        assert cached < uncached / 5
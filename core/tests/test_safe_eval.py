@@ -7,9 +7,13 @@
 AST nodes, disallowed function calls).
 """
 
+from collections.abc import Mapping
+
 import pytest
 
-from framework.graph.safe_eval import safe_eval
+from framework.graph.edge import EdgeCondition, EdgeSpec, GraphSpec
+from framework.graph.node import NodeSpec
+from framework.graph.safe_eval import compile_expression, safe_eval
 
 # ---------------------------------------------------------------------------
 # Literals and constants
@@ -518,3 +522,102 @@ def test_no_context_needed(self):
         """Some edges use constant expressions."""
         assert safe_eval("True") is True
         assert safe_eval("1 == 1") is True
+
+
+# ---------------------------------------------------------------------------
+# Compiled expressions and edge conditions
+# ---------------------------------------------------------------------------
+
+
+class _CountingMemory(Mapping):
+    """Mapping that records which keys were read and whether it was iterated."""
+
+    def __init__(self, data):
+        self._data = data
+        self.reads = []
+        self.iterated = False
+
+    def __getitem__(self, key):
+        self.reads.append(key)
+        return self._data[key]
+
+    def __iter__(self):
+        self.iterated = True
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TestCompiledExpression:
+    def test_compiled_once_per_expression(self):
+        compiled = compile_expression("score > 80 and len(items) > 0")
+        assert compile_expression("score > 80 and len(items) > 0") is compiled
+        assert compiled.names == {"score", "items"}
+        assert compiled({"score": 90, "items": [1]}) is True
+        assert compiled({"score": 10, "items": [1]}) is False
+
+    def test_disallowed_node_rejected_even_in_untaken_branch(self):
+        with pytest.raises(ValueError, match="not allowed"):
+            compile_expression("False and [x for x in y]")
+        with pytest.raises(ValueError, match="private attribute"):
+            compile_expression("x if True else x.__class__")
+
+    def test_reads_only_referenced_names(self):
+        memory = _CountingMemory({f"key_{i}": i for i in range(1000)})
+        assert compile_expression("key_7 == 7")(memory) is True
+        assert memory.reads == ["key_7"]
+        assert not memory.iterated
+
+
+def _edge(expr: str) -> EdgeSpec:
+    return EdgeSpec(
+        id="e1",
+        source="a",
+        target="b",
+        condition=EdgeCondition.CONDITIONAL,
+        condition_expr=expr,
+    )
+
+
+class TestEdgeConditionEvaluation:
+    @pytest.mark.asyncio
+    async def test_memory_view_is_lazy_and_shadows_fixed_names(self):
+        memory = _CountingMemory(
+            {"score": 85, "result": "from_memory", **{str(i): i for i in range(500)}}
+        )
+        edge = _edge("score > 80 and result == 'from_memory' and output['ok']")
+        assert await edge.should_traverse(
+            source_success=True, source_output={"ok": True, "result": "out"}, memory=memory
+        )
+        assert not memory.iterated
+
+    @pytest.mark.asyncio
+    async def test_evaluation_error_returns_false(self):
+        edge = _edge("missing_key > 1")
+        assert not await edge.should_traverse(source_success=True, source_output={}, memory={})
+
+    def test_graph_validation_rejects_invalid_conditions(self):
+        nodes = [
+            NodeSpec(id=n, name=n, description=n, node_type="event_loop") for n in ("a", "b", "c")
+        ]
+        graph = GraphSpec(
+            id="g",
+            goal_id="goal",
+            entry_node="a",
+            terminal_nodes=["b", "c"],
+            nodes=nodes,
+            edges=[
+                _edge("score >"),
+                EdgeSpec(
+                    id="e2",
+                    source="a",
+                    target="c",
+                    condition=EdgeCondition.CONDITIONAL,
+                    condition_expr="[x for x in items]",
+                ),
+            ],
+        )
+        errors = graph.validate()["errors"]
+        assert any("'e1' has invalid condition_expr" in e for e in errors)
+        assert any("'e2' has invalid condition_expr" in e for e in errors)
@@ -0,0 +1,204 @@
+"""Tests for SegmentedConversationStore and open_conversation_store."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from framework.graph.conversation import NodeConversation
+from framework.storage.conversation_store import (
+    FileConversationStore,
+    has_conversation_parts,
+    open_conversation_store,
+    read_conversation_parts,
+)
+from framework.storage.segmented_conversation_store import (
+    SegmentedConversationStore,
+    migrate_file_conversation_store,
+)
+
+
+class TestSegmentedConversationStore:
+    @pytest.mark.asyncio
+    async def test_write_and_read_parts_in_order(self, tmp_path):
+        store = SegmentedConversationStore(tmp_path / "conv")
+        await store.write_part(2, {"seq": 2, "content": "second"})
+        await store.write_part(0, {"seq": 0, "content": "first"})
+        await store.write_part(1, {"seq": 1, "content": "middle"})
+        parts = await store.read_parts()
+        assert [p["seq"] for p in parts] == [0, 1, 2]
+        assert not (tmp_path / "conv" / "parts").exists()
+
+    @pytest.mark.asyncio
+    async def test_rewrite_is_last_write_wins(self, tmp_path):
+        store = SegmentedConversationStore(tmp_path / "conv")
+        await store.write_part(0, {"seq": 0, "v": 1})
+        await store.write_part(0, {"seq": 0, "v": 2})
+        parts = await store.read_parts()
+        assert parts == [{"seq": 0, "v": 2}]
+
+    @pytest.mark.asyncio
+    async def test_delete_parts_before_keeps_later_low_seq_writes(self, tmp_path):
+        """Compaction deletes then writes a summary just below the boundary."""
+        store = SegmentedConversationStore(tmp_path / "conv")
+        for i in range(5):
+            await store.write_part(i, {"seq": i})
+        await store.delete_parts_before(3)
+        await store.write_part(2, {"seq": 2, "summary": True})
+        parts = await store.read_parts()
+        assert [p["seq"] for p in parts] == [2, 3, 4]
+
+        reopened = SegmentedConversationStore(tmp_path / "conv")
+        assert await reopened.read_parts() == parts
+
+    @pytest.mark.asyncio
+    async def test_delete_truncates_dead_segments(self, tmp_path):
+        store = SegmentedConversationStore(tmp_path / "conv", segment_bytes=64)
+        for i in range(20):
+            await store.write_part(i, {"seq": i, "content": "x" * 40})
+        log_dir = tmp_path / "conv" / "log"
+        before = len(list(log_dir.glob("*.jsonl")))
+        assert before > 5
+
+        await store.delete_parts_before(18)
+        after = len(list(log_dir.glob("*.jsonl")))
+        assert after < before
+        assert [p["seq"] for p in await store.read_parts()] == [18, 19]
+
+        reopened = SegmentedConversationStore(tmp_path / "conv", segment_bytes=64)
+        assert [p["seq"] for p in await reopened.read_parts()] == [18, 19]
+
+    @pytest.mark.asyncio
+    async def test_delete_everything_then_continue(self, tmp_path):
+        store = SegmentedConversationStore(tmp_path / "conv")
+        for i in range(3):
+            await store.write_part(i, {"seq": i})
+        await store.delete_parts_before(3)
+        assert await store.read_parts() == []
+        await store.write_part(3, {"seq": 3})
+        assert [p["seq"] for p in await store.read_parts()] == [3]
+
+    @pytest.mark.asyncio
+    async def test_two_instances_stay_consistent(self, tmp_path):
+        """The executor opens a fresh store per node over the same directory."""
+        a = SegmentedConversationStore(tmp_path / "conv")
+        b = SegmentedConversationStore(tmp_path / "conv")
+        await a.write_part(0, {"seq": 0})
+        await b.write_part(1, {"seq": 1})
+        await a.write_part(2, {"seq": 2})
+        assert [p["seq"] for p in await b.read_parts()] == [0, 1, 2]
+        await b.delete_parts_before(2)
+        assert [p["seq"] for p in await a.read_parts()] == [2]
+
+    @pytest.mark.asyncio
+    async def test_recovers_from_torn_tail_and_lost_index(self, tmp_path):
+        store = SegmentedConversationStore(tmp_path / "conv")
+        for i in range(3):
+            await store.write_part(i, {"seq": i})
+        await store.close()
+
+        log_dir = tmp_path / "conv" / "log"
+        segment = log_dir / "0000000000.jsonl"
+        # Record 3 reached the segment but not the index; record 4 is torn.
+        with open(segment, "ab") as f:
+            f.write(b'{"seq": 3, "part": {"seq": 3}}\n{"seq": 4, "par')
+
+        reopened = SegmentedConversationStore(tmp_path / "conv")
+        assert [p["seq"] for p in await reopened.read_parts()] == [0, 1, 2, 3]
+        assert segment.read_bytes().endswith(b"\n")
+
+        (log_dir / "index.bin").unlink()
+        rebuilt = SegmentedConversationStore(tmp_path / "conv")
+        assert [p["seq"] for p in await rebuilt.read_parts()] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_integration_with_node_conversation(self, tmp_path):
+        store = SegmentedConversationStore(tmp_path / "conv")
+        conv = NodeConversation(system_prompt="test", store=store)
+        await conv.add_user_message("u1")
+        await conv.add_assistant_message("a1")
+        await conv.add_user_message("u2")
+        await conv.compact("summary", keep_recent=1)
+
+        restored = await NodeConversation.restore(SegmentedConversationStore(tmp_path / "conv"))
+        assert restored is not None
+        assert [m.content for m in restored.messages] == ["summary", "u2"]
+        assert restored.next_seq == conv.next_seq
+
+
+class TestMigration:
+    @pytest.mark.asyncio
+    async def test_migrates_file_layout_on_first_access(self, tmp_path):
+        legacy = FileConversationStore(tmp_path / "conv")
+        await legacy.write_meta({"system_prompt": "hi"})
+        for i in range(4):
+            await legacy.write_part(i, {"seq": i, "content": f"m{i}"})
+
+        store = open_conversation_store(tmp_path / "conv", "segmented")
+        assert isinstance(store, SegmentedConversationStore)
+        parts = await store.read_parts()
+        assert [p["content"] for p in parts] == ["m0", "m1", "m2", "m3"]
+        assert await store.read_meta() == {"system_prompt": "hi"}
+        assert all("created_at" in p for p in read_conversation_parts(tmp_path / "conv"))
+        assert not (tmp_path / "conv" / "parts").exists()
+
+    def test_migration_finishes_interrupted_cleanup(self, tmp_path):
+        base = tmp_path / "conv"
+        (base / "parts").mkdir(parents=True)
+        (base / "parts" / "0000000000.json").write_text(json.dumps({"seq": 0}))
+        assert migrate_file_conversation_store(base) == 1
+
+        # Simulate a crash after the log was committed but before cleanup
+        (base / "parts").mkdir()
+        (base / "parts" / "0000000000.json").write_text(json.dumps({"seq": 0, "stale": 1}))
+        assert migrate_file_conversation_store(base) == 0
+        assert not (base / "parts").exists()
+        assert read_conversation_parts(base)[0].get("stale") is None
+
+
+class TestOpenConversationStore:
+    def test_defaults_to_file_backend(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("HIVE_CONVERSATION_STORE", raising=False)
+        assert type(open_conversation_store(tmp_path / "conv")) is FileConversationStore
+
+    def test_env_selects_backend(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HIVE_CONVERSATION_STORE", "segmented")
+        store = open_conversation_store(tmp_path / "conv")
+        assert isinstance(store, SegmentedConversationStore)
+
+    @pytest.mark.asyncio
+    async def test_existing_log_wins_over_requested_backend(self, tmp_path):
+        await SegmentedConversationStore(tmp_path / "conv").write_part(0, {"seq": 0})
+        store = open_conversation_store(tmp_path / "conv", "file")
+        assert isinstance(store, SegmentedConversationStore)
+
+    def test_unknown_backend_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown conversation store backend"):
+            open_conversation_store(tmp_path / "conv", "bogus")
+
+    @pytest.mark.asyncio
+    async def test_sync_helpers_read_both_layouts(self, tmp_path):
+        await FileConversationStore(tmp_path / "a").write_part(0, {"seq": 0, "role": "user"})
+        await SegmentedConversationStore(tmp_path / "b").write_part(0, {"seq": 0, "role": "user"})
+        for name in ("a", "b"):
+            assert has_conversation_parts(tmp_path / name)
+            parts = read_conversation_parts(tmp_path / name)
+            assert parts[0]["role"] == "user"
+            assert "created_at" in parts[0]
+        assert not has_conversation_parts(tmp_path / "missing")
+
+    @pytest.mark.asyncio
+    async def test_sync_read_keeps_per_part_timestamps(self, tmp_path, monkeypatch):
+        import framework.storage.segmented_conversation_store as segmented
+
+        clock = iter([100.0, 200.0, 300.0])
+        monkeypatch.setattr(segmented.time, "time", lambda: next(clock))
+        store = SegmentedConversationStore(tmp_path / "conv")
+        for i in range(3):
+            await store.write_part(i, {"seq": i, "role": "user"})
+
+        parts = read_conversation_parts(tmp_path / "conv")
+        assert [p["created_at"] for p in parts] == [100.0, 200.0, 300.0]
+        # Node restores see the parts exactly as written
+        assert "created_at" not in (await store.read_parts())[0]
@@ -175,3 +175,70 @@ def test_duplicate_add_overwrites(self):
 
         assert catalog.skill_count == 1
         assert catalog.get("x").description == "Second"
+
+
+class TestRankedCatalog:
+    SKILLS = [
+        _make_skill("pdf-extract", "Extract text and tables from PDF files."),
+        _make_skill("sql-report", "Build SQL reports from a warehouse."),
+        _make_skill("slack-digest", "Summarize Slack channels.", body="Reads channel history."),
+        _make_skill("csv-clean", "Clean CSV files.", body="Also handles PDF exports."),
+    ]
+
+    def test_lists_most_relevant_skills(self):
+        prompt = SkillCatalog(self.SKILLS).to_prompt(query="Extract tables from a PDF", top_k=2)
+
+        assert "<name>pdf-extract</name>" in prompt
+        assert "<name>csv-clean</name>" in prompt
+        assert "sql-report" not in prompt
+        assert "Only the 2 of 4 installed skills" in prompt
+
+    def test_small_catalog_is_listed_in_full(self):
+        catalog = SkillCatalog(self.SKILLS)
+
+        assert catalog.to_prompt(query="PDF", top_k=4) == catalog.to_prompt()
+
+    def test_unmatched_task_still_lists_skills(self):
+        prompt = SkillCatalog(self.SKILLS).to_prompt(query="Deploy to kubernetes", top_k=2)
+
+        assert "<name>csv-clean</name>" in prompt
+        assert "<name>pdf-extract</name>" in prompt
+        assert "sql-report" not in prompt
+        assert "Only 2 of 4 installed skills are listed." in prompt
+
+    def test_name_matches_outrank_body_mentions(self):
+        from framework.skills.index import SkillIndex
+
+        index = SkillIndex(self.SKILLS)
+
+        assert [s.name for s in index.search("pdf", 5)] == ["pdf-extract", "csv-clean"]
+        assert index.search("kubernetes", 5) == []
+
+    def test_manager_ranks_catalog_per_task(self, tmp_path, monkeypatch):
+        from framework.skills.config import SkillsConfig
+        from framework.skills.manager import SkillsManager, SkillsManagerConfig
+
+        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+        for skill in self.SKILLS:
+            skill_dir = tmp_path / ".hive" / "skills" / skill.name
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(
+                f"---\nname: {skill.name}\ndescription: {skill.description}\n---\n{skill.body}\n"
+            )
+
+        mgr = SkillsManager(
+            SkillsManagerConfig(
+                skills_config=SkillsConfig(skills=["slack-digest"]),
+                project_root=tmp_path / "agent",
+                interactive=False,
+                catalog_top_k=1,
+            )
+        )
+        mgr.load()
+        prompt = mgr.catalog_prompt_for("Write the weekly SQL report")
+
+        assert mgr.catalog_provider is not None
+        assert "<name>sql-report</name>" in prompt
+        assert "<name>pdf-extract</name>" not in prompt
+        assert "Pre-Activated Skill: slack-digest" in prompt
+        assert "<name>pdf-extract</name>" in mgr.skills_catalog_prompt
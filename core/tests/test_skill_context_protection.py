@@ -11,6 +11,12 @@ def _make_conversation() -> NodeConversation:
     conv._next_seq = 0
     conv._current_phase = None
     conv._store = None
+    conv._token_counter = None
+    conv._message_tokens = 0
+    conv._api_anchor_tokens = 0
+    conv._llm_entries = []
+    conv._llm_stale = False
+    conv._llm_view = None
     return conv
 
 
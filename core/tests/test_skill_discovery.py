@@ -158,3 +158,45 @@ def test_max_depth_limit(self, tmp_path):
         )
         skills = discovery.discover()
         assert not any(s.name == "too-deep" for s in skills)
+
+
+class TestDiscoveryCache:
+    def _discover(self, project: Path, cache_dir: Path):
+        return SkillDiscovery(
+            DiscoveryConfig(
+                project_root=project,
+                skip_user_scope=True,
+                skip_framework_scope=True,
+                cache_dir=cache_dir,
+            )
+        ).discover()
+
+    def test_unchanged_scope_is_not_reparsed(self, tmp_path, monkeypatch):
+        skills_dir = tmp_path / "project" / ".agents" / "skills"
+        _write_skill(skills_dir, "skill-a")
+        _write_skill(skills_dir / "group", "skill-b")
+        first = self._discover(tmp_path / "project", tmp_path / "cache")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("SKILL.md was re-parsed")
+
+        monkeypatch.setattr("framework.skills.discovery.parse_skill_md", fail)
+        second = self._discover(tmp_path / "project", tmp_path / "cache")
+
+        assert second == first
+        assert {s.name for s in second} == {"skill-a", "skill-b"}
+
+    def test_changes_are_picked_up(self, tmp_path):
+        project = tmp_path / "project"
+        skills_dir = project / ".agents" / "skills"
+        _write_skill(skills_dir, "skill-a")
+        _write_skill(skills_dir, "skill-b")
+        self._discover(project, tmp_path / "cache")
+
+        _write_skill(skills_dir, "skill-a", "Edited description, now longer.")
+        _write_skill(skills_dir / "group", "skill-c")
+        (skills_dir / "skill-b" / "SKILL.md").unlink()
+        skills = {s.name: s for s in self._discover(project, tmp_path / "cache")}
+
+        assert set(skills) == {"skill-a", "skill-c"}
+        assert skills["skill-a"].description == "Edited description, now longer."
@@ -0,0 +1,250 @@
+"""Tests for speculative (background) LLM compaction."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from framework.graph.conversation import NodeConversation
+from framework.graph.event_loop import compaction
+from framework.graph.event_loop.compaction import SpeculativeCompactor, compact
+from framework.graph.event_loop.types import LoopConfig
+from framework.graph.node import NodeSpec
+from framework.runtime.event_bus import EventBus, EventType
+
+
+class _GatedSummaryLLM:
+    """Summary LLM that only returns once ``gate`` is set; records call order in ``log``."""
+
+    def __init__(self, log: list[str] | None = None, open_gate: bool = False) -> None:
+        self.gate = asyncio.Event()
+        if open_gate:
+            self.gate.set()
+        self.log = log if log is not None else []
+        self.calls = 0
+
+    async def acomplete(self, **kwargs):
+        self.calls += 1
+        self.log.append(f"llm:{self.calls}")
+        await self.gate.wait()
+        return SimpleNamespace(content=f"Summary #{self.calls} of earlier work.")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(compaction, "time", clock)
+    return clock
+
+
+def _make_ctx(llm, continuous_mode: bool = False) -> MagicMock:
+    ctx = MagicMock()
+    ctx.node_spec = NodeSpec(
+        id="worker",
+        name="Worker",
+        description="Does work",
+        node_type="event_loop",
+        input_keys=[],
+        output_keys=[],
+    )
+    ctx.node_id = "worker"
+    ctx.stream_id = "worker"
+    ctx.continuous_mode = continuous_mode
+    ctx.runtime_logger = None
+    ctx.llm = llm
+    return ctx
+
+
+def _config() -> LoopConfig:
+    # No spillover dir: structural compaction is skipped, so without a
+    # speculative summary compact() must block on the LLM.
+    return LoopConfig(max_context_tokens=1000, speculative_compaction_watermark=0.5)
+
+
+async def _fill(conv: NodeConversation, n: int, start: int = 0, size: int = 160) -> None:
+    for i in range(start, start + n):
+        await conv.add_user_message(f"request {i} " + "u" * size)
+        await conv.add_assistant_message(f"answer {i} " + "a" * size)
+
+
+async def _conversation_past_watermark() -> NodeConversation:
+    conv = NodeConversation(max_context_tokens=1000, compaction_threshold=0.8)
+    await _fill(conv, 7)  # ~0.59 of budget
+    return conv
+
+
+async def _summary_ready(speculative: SpeculativeCompactor) -> None:
+    await asyncio.wait({speculative._task})
+
+
+class TestSpeculativeCompactor:
+    @pytest.mark.asyncio
+    async def test_does_not_start_below_watermark(self):
+        conv = NodeConversation(max_context_tokens=1000)
+        await _fill(conv, 2)
+        speculative = SpeculativeCompactor()
+        assert not speculative.maybe_start(
+            _make_ctx(_GatedSummaryLLM()), conv, None, config=_config()
+        )
+        assert not speculative.pending
+
+    @pytest.mark.asyncio
+    async def test_summary_is_swapped_in_without_blocking(self, clock):
+        llm = _GatedSummaryLLM()
+        ctx = _make_ctx(llm)
+        conv = await _conversation_past_watermark()
+        speculative = SpeculativeCompactor(keep_recent=2)
+        bus = EventBus()
+        events = []
+        bus.subscribe([EventType.CONTEXT_COMPACTED], events.append)
+
+        assert speculative.maybe_start(ctx, conv, None, config=_config())
+        # Agent keeps working while the summary is built
+        await _fill(conv, 3, start=7)
+        clock.now = 5.0
+        llm.gate.set()
+        await _summary_ready(speculative)
+        assert conv.needs_compaction()
+
+        await compact(ctx, conv, None, config=_config(), event_bus=bus, speculative=speculative)
+
+        # No LLM call on the critical path
+        assert llm.calls == 1
+        assert conv.messages[0].content.startswith("Summary #1")
+        # Everything added after the snapshot (plus keep_recent) is kept verbatim
+        assert [m.content[:9] for m in conv.messages[1:]] == [
+            "request 6",
+            "answer 6 ",
+            "request 7",
+            "answer 7 ",
+            "request 8",
+            "answer 8 ",
+            "request 9",
+            "answer 9 ",
+        ]
+        assert not conv.needs_compaction()
+        assert speculative.applied == 1
+        assert speculative.latency_saved == 5.0
+        assert events[0].data["speculative_applied"] == 1
+        assert events[0].data["latency_saved_ms"] == 5000
+
+    @pytest.mark.asyncio
+    async def test_in_flight_summary_is_awaited_not_restarted(self, clock):
+        llm = _GatedSummaryLLM()
+        ctx = _make_ctx(llm)
+        conv = await _conversation_past_watermark()
+        speculative = SpeculativeCompactor(keep_recent=2)
+        speculative.maybe_start(ctx, conv, None, config=_config())
+        await _fill(conv, 3, start=7)
+
+        clock.now = 2.0
+        compacting = asyncio.create_task(
+            compact(ctx, conv, None, config=_config(), event_bus=None, speculative=speculative)
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert not compacting.done()
+
+        clock.now = 3.0
+        llm.gate.set()
+        await compacting
+
+        assert llm.calls == 1
+        assert speculative.applied == 1
+        assert conv.messages[0].content.startswith("Summary #1")
+        # Only the time the summary ran before compaction was needed is saved
+        assert speculative.latency_saved == 2.0
+
+    @pytest.mark.asyncio
+    async def test_rewritten_history_discards_summary(self):
+        llm = _GatedSummaryLLM(open_gate=True)
+        ctx = _make_ctx(llm)
+        conv = await _conversation_past_watermark()
+        speculative = SpeculativeCompactor(keep_recent=2)
+        speculative.maybe_start(ctx, conv, None, config=_config())
+        await asyncio.sleep(0)
+
+        # Something else compacted the conversation in the meantime
+        await conv.compact("manual summary", keep_recent=4)
+        await _fill(conv, 6, start=7)
+
+        assert not await speculative.apply(conv)
+        assert speculative.discarded == 1
+        assert conv.messages[0].content == "manual summary"
+
+    @pytest.mark.asyncio
+    async def test_summary_call_moves_off_the_critical_path(self):
+        """Blocking compaction calls the LLM during compact(); speculative before it."""
+        logs = {}
+        for mode in ("blocking", "speculative"):
+            log: list[str] = []
+            llm = _GatedSummaryLLM(log, open_gate=True)
+            ctx = _make_ctx(llm)
+            conv = await _conversation_past_watermark()
+            speculative = SpeculativeCompactor(keep_recent=2) if mode == "speculative" else None
+            if speculative:
+                speculative.maybe_start(ctx, conv, None, config=_config())
+                await _summary_ready(speculative)
+            await _fill(conv, 3, start=7)
+
+            log.append("compact")
+            await compact(
+                ctx, conv, None, config=_config(), event_bus=None, speculative=speculative
+            )
+            log.append("done")
+            logs[mode] = log
+            assert not conv.needs_compaction()
+
+        assert logs["blocking"] == ["compact", "llm:1", "done"]
+        assert logs["speculative"] == ["llm:1", "compact", "done"]
+
+
+class TestSpeculativePhaseGraduation:
+    @pytest.mark.asyncio
+    async def test_continuous_mode_keeps_phases_like_the_blocking_path(self):
+        llm = _GatedSummaryLLM(open_gate=True)
+        ctx = _make_ctx(llm, continuous_mode=True)
+        conv = NodeConversation(max_context_tokens=1000, compaction_threshold=0.8)
+        for phase, (start, n) in (("a", (0, 4)), ("b", (4, 2)), ("c", (6, 1))):
+            conv.set_current_phase(phase)
+            await _fill(conv, n, start=start)
+        speculative = SpeculativeCompactor(keep_recent=2)
+        assert speculative.maybe_start(ctx, conv, None, config=_config())
+        await _summary_ready(speculative)
+        await _fill(conv, 3, start=7)
+
+        await compact(ctx, conv, None, config=_config(), event_bus=None, speculative=speculative)
+
+        assert speculative.applied == 1
+        # Previous phase "b" survives verbatim, as with phase-graduated blocking compaction
+        assert conv.messages[0].content.startswith("Summary #1")
+        assert [m.phase_id for m in conv.messages[1:]] == ["b"] * 4 + ["c"] * 8
+
+    @pytest.mark.asyncio
+    async def test_phase_split_never_drops_unsummarised_messages(self):
+        llm = _GatedSummaryLLM(open_gate=True)
+        ctx = _make_ctx(llm, continuous_mode=True)
+        conv = NodeConversation(max_context_tokens=1000, compaction_threshold=0.8)
+        conv.set_current_phase("a")
+        await _fill(conv, 7)
+        speculative = SpeculativeCompactor(keep_recent=2)
+        assert speculative.maybe_start(ctx, conv, None, config=_config())
+        await _summary_ready(speculative)
+        # Phases "b" and "c" start after the snapshot; their split lies past the prefix
+        for phase, start in (("b", 7), ("c", 8)):
+            conv.set_current_phase(phase)
+            await _fill(conv, 1, start=start)
+
+        assert await speculative.apply(conv, phase_graduated=True)
+        assert [m.content[:9] for m in conv.messages[1:3]] == ["request 6", "answer 6 "]
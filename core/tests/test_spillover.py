@@ -0,0 +1,105 @@
+"""Tests for streaming spill files, JSON sampling, and line indexes."""
+
+import json
+import struct
+
+import pytest
+
+from framework.graph.event_loop.spillover import (
+    INDEX_MAGIC,
+    SampledList,
+    index_path_for,
+    sample_json,
+    write_spill,
+)
+from framework.graph.event_loop.tool_result_handler import (
+    build_json_preview,
+    extract_json_metadata,
+    truncate_tool_result,
+)
+from framework.llm.provider import ToolResult
+
+
+def _read_index(path):
+    data = index_path_for(path).read_bytes()
+    header = struct.Struct("<8sQQQQ")
+    magic, size, _mtime, first, count = header.unpack_from(data)
+    offsets = list(struct.unpack_from(f"<{(len(data) - header.size) // 8}Q", data, header.size))
+    return magic, size, first, count, offsets
+
+
+PAYLOAD = {
+    "query": "bees",
+    "results": [{"id": i, "title": f"result {i}\nline two", "tags": ["a", "b"]} for i in range(50)],
+    "meta": {"took_ms": 12, "nested": {"deep": [1, 2, 3]}},
+}
+
+
+class TestWriteSpill:
+    def test_round_trip_and_one_record_per_line(self, tmp_path):
+        path = tmp_path / "search_1.txt"
+        info = write_spill(path, json.dumps(PAYLOAD))
+
+        text = path.read_text(encoding="utf-8")
+        assert json.loads(text) == PAYLOAD
+        assert info.is_json and info.size_bytes == path.stat().st_size
+
+        lines = text.splitlines()
+        records = info.principal_records
+        assert records.path == "results" and records.count == 50
+        for i in range(50):
+            record = lines[records.first_line + i].strip().rstrip(",")
+            assert json.loads(record)["id"] == i
+
+    def test_index_matches_line_starts(self, tmp_path):
+        path = tmp_path / "search_1.txt"
+        info = write_spill(path, json.dumps(PAYLOAD, indent=4))
+        magic, size, first, count, offsets = _read_index(path)
+
+        data = path.read_bytes()
+        expected = [0] + [i + 1 for i, b in enumerate(data[:-1]) if b == ord("\n")]
+        assert magic == INDEX_MAGIC
+        assert size == len(data)
+        assert offsets == expected
+        assert len(offsets) == info.lines
+        assert (first, count) == (info.principal_records.first_line, 50)
+
+    def test_non_json_is_written_as_is(self, tmp_path):
+        path = tmp_path / "fetch_1.txt"
+        content = "plain text\nwith ünïcode\n{not json"
+        info = write_spill(path, content)
+
+        assert path.read_text(encoding="utf-8") == content
+        assert not info.is_json and info.sample is None
+        assert _read_index(path)[4] == [0, 11, 26]
+
+    def test_sample_keeps_counts_without_full_arrays(self):
+        sample = sample_json(json.dumps(PAYLOAD))
+        results = sample["results"]
+
+        assert isinstance(results, SampledList)
+        assert results.total == 50
+        assert [r["id"] for r in results] == [0, 1, 2, 49]
+        assert '"results": list of 50 items' in extract_json_metadata(sample)
+        assert build_json_preview(sample) == build_json_preview(PAYLOAD)
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(ValueError):
+            sample_json('{"a": 1} trailing')
+
+
+class TestTruncateToolResult:
+    def test_large_result_points_at_record_lines(self, tmp_path):
+        content = json.dumps(PAYLOAD)
+        truncated = truncate_tool_result(
+            ToolResult(tool_use_id="t1", content=content),
+            tool_name="web_search",
+            max_tool_result_chars=1000,
+            spillover_dir=str(tmp_path),
+            next_spill_filename_fn=lambda name: f"{name}_1.txt",
+        )
+
+        first = write_spill(tmp_path / "check.txt", content).principal_records.first_line + 1
+        assert "list of 50 items" in truncated.content
+        assert f"start_line={first}, max_lines=50" in truncated.content
+        assert json.loads((tmp_path / "web_search_1.txt").read_text()) == PAYLOAD
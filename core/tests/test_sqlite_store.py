@@ -0,0 +1,245 @@
+"""Tests for the SQLite session and conversation stores."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+
+import pytest
+
+from framework.graph.conversation import NodeConversation
+from framework.schemas.session_state import SessionState, SessionStatus, SessionTimestamps
+from framework.storage.conversation_store import (
+    FileConversationStore,
+    has_conversation_parts,
+    open_conversation_store,
+    read_conversation_parts,
+)
+from framework.storage.session_store import SessionStore, open_session_store
+from framework.storage.sqlite_store import (
+    SQLiteConversationStore,
+    SQLiteSessionStore,
+    import_file_layout,
+    read_sqlite_session_states,
+)
+
+
+def make_state(
+    session_id: str,
+    status: SessionStatus = SessionStatus.COMPLETED,
+    goal_id: str = "goal",
+    updated_at: str = "2026-01-01T00:00:00",
+) -> SessionState:
+    return SessionState(
+        session_id=session_id,
+        status=status,
+        goal_id=goal_id,
+        timestamps=SessionTimestamps(started_at=updated_at, updated_at=updated_at),
+    )
+
+
+class TestSQLiteSessionStore:
+    @pytest.mark.asyncio
+    async def test_write_read_round_trip(self, tmp_path):
+        store = SQLiteSessionStore(tmp_path)
+        await store.write_state("session_a", make_state("session_a"))
+
+        state = await store.read_state("session_a")
+        assert state is not None
+        assert state.session_id == "session_a"
+        assert await store.session_exists("session_a")
+        assert not await store.session_exists("session_b")
+        # state.json is mirrored for code that reads it directly
+        assert (tmp_path / "sessions" / "session_a" / "state.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_filters_and_orders(self, tmp_path):
+        store = SQLiteSessionStore(tmp_path, mirror_state_json=False)
+        await store.write_state(
+            "s1", make_state("s1", SessionStatus.PAUSED, updated_at="2026-01-01T00:00:01")
+        )
+        await store.write_state(
+            "s2", make_state("s2", SessionStatus.COMPLETED, updated_at="2026-01-01T00:00:03")
+        )
+        await store.write_state(
+            "s3",
+            make_state(
+                "s3", SessionStatus.PAUSED, goal_id="other", updated_at="2026-01-01T00:00:02"
+            ),
+        )
+
+        assert [s.session_id for s in await store.list_sessions()] == ["s2", "s3", "s1"]
+        paused = await store.list_sessions(status="paused")
+        assert [s.session_id for s in paused] == ["s3", "s1"]
+        assert [s.session_id for s in await store.list_sessions(goal_id="other")] == ["s3"]
+        assert [s.session_id for s in await store.list_sessions(limit=1)] == ["s2"]
+
+    @pytest.mark.asyncio
+    async def test_status_update_replaces_row(self, tmp_path):
+        store = SQLiteSessionStore(tmp_path)
+        await store.write_state("s1", make_state("s1", SessionStatus.ACTIVE))
+        await store.write_state("s1", make_state("s1", SessionStatus.COMPLETED))
+        assert await store.list_sessions(status="active") == []
+        assert len(await store.list_sessions(status="completed")) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_session(self, tmp_path):
+        store = SQLiteSessionStore(tmp_path)
+        await store.write_state("s1", make_state("s1"))
+        assert await store.delete_session("s1") is True
+        assert await store.read_state("s1") is None
+        assert not (tmp_path / "sessions" / "s1").exists()
+        assert await store.delete_session("s1") is False
+
+    @pytest.mark.asyncio
+    async def test_rejects_path_traversal(self, tmp_path):
+        store = SQLiteSessionStore(tmp_path)
+        with pytest.raises(ValueError):
+            await store.read_state("../escape")
+
+    @pytest.mark.asyncio
+    async def test_open_session_store_selects_backend(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("HIVE_SESSION_STORE", raising=False)
+        assert type(open_session_store(tmp_path)) is SessionStore
+        assert isinstance(open_session_store(tmp_path, "sqlite"), SQLiteSessionStore)
+        with pytest.raises(ValueError):
+            open_session_store(tmp_path, "bogus")
+
+        await SQLiteSessionStore(tmp_path).write_state("s1", make_state("s1"))
+        assert isinstance(open_session_store(tmp_path, "file"), SQLiteSessionStore)
+
+    @pytest.mark.asyncio
+    async def test_switching_to_sqlite_imports_file_sessions(self, tmp_path):
+        await SessionStore(tmp_path).write_state("s1", make_state("s1"))
+
+        store = open_session_store(tmp_path, "sqlite")
+        assert isinstance(store, SQLiteSessionStore)
+        assert [s.session_id for s in await store.list_sessions()] == ["s1"]
+        assert read_sqlite_session_states(tmp_path).keys() == {"s1"}
+        assert read_sqlite_session_states(tmp_path / "missing") is None
+
+
+class TestSQLiteConversationStore:
+    @pytest.mark.asyncio
+    async def test_parts_meta_cursor(self, tmp_path):
+        store = SQLiteConversationStore(tmp_path / "conv")
+        assert await store.read_meta() is None
+        await store.write_meta({"system_prompt": "hi"})
+        await store.write_cursor({"next_seq": 3})
+        await store.write_part(1, {"seq": 1, "phase_id": "b"})
+        await store.write_part(0, {"seq": 0, "phase_id": "a"})
+        await store.write_part(0, {"seq": 0, "phase_id": "a", "v": 2})
+
+        assert await store.read_meta() == {"system_prompt": "hi"}
+        assert await store.read_cursor() == {"next_seq": 3}
+        parts = await store.read_parts()
+        assert [p["seq"] for p in parts] == [0, 1]
+        assert parts[0]["v"] == 2
+        assert [p["seq"] for p in await store.read_parts(phase_id="b")] == [1]
+
+        await store.delete_parts_before(1)
+        assert [p["seq"] for p in await store.read_parts()] == [1]
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_restore_node_conversation(self, tmp_path):
+        store = SQLiteConversationStore(tmp_path / "conv")
+        conv = NodeConversation(system_prompt="sys", store=store)
+        await conv.add_user_message("u1")
+        await conv.add_assistant_message("a1")
+        await store.close()
+
+        restored = await NodeConversation.restore(open_conversation_store(tmp_path / "conv"))
+        assert restored is not None
+        assert restored.system_prompt == "sys"
+        assert [m.content for m in restored.messages] == ["u1", "a1"]
+        assert has_conversation_parts(tmp_path / "conv")
+        assert [p["content"] for p in read_conversation_parts(tmp_path / "conv")] == ["u1", "a1"]
+
+    @pytest.mark.asyncio
+    async def test_parts_keep_their_write_time(self, tmp_path, monkeypatch):
+        import framework.storage.sqlite_store as sqlite_store
+
+        clock = iter([100.0, 200.0])
+        monkeypatch.setattr(sqlite_store.time, "time", lambda: next(clock))
+        store = SQLiteConversationStore(tmp_path / "conv")
+        await store.write_part(0, {"seq": 0, "role": "user"})
+        await store.write_part(1, {"seq": 1, "role": "assistant"})
+        await store.close()
+
+        assert [p["created_at"] for p in read_conversation_parts(tmp_path / "conv")] == [
+            100.0,
+            200.0,
+        ]
+        assert "created_at" not in (await store.read_parts())[0]
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_upgrades_database_without_created_at(self, tmp_path):
+        conv = tmp_path / "conv"
+        conv.mkdir()
+        conn = sqlite3.connect(conv / "conversation.db")
+        conn.execute("CREATE TABLE parts (seq INTEGER PRIMARY KEY, phase_id, role, data)")
+        conn.execute("INSERT INTO parts VALUES (0, NULL, 'user', ?)", (json.dumps({"seq": 0}),))
+        conn.commit()
+        conn.close()
+
+        # Read-only listings fall back to the database mtime
+        assert "created_at" in read_conversation_parts(conv)[0]
+
+        store = SQLiteConversationStore(conv)
+        await store.write_part(1, {"seq": 1, "role": "user"})
+        assert [p["seq"] for p in await store.read_parts()] == [0, 1]
+        await store.close()
+        assert abs(read_conversation_parts(conv)[1]["created_at"] - time.time()) < 60
+
+    @pytest.mark.asyncio
+    async def test_destroy(self, tmp_path):
+        store = SQLiteConversationStore(tmp_path / "conv")
+        await store.write_part(0, {"seq": 0})
+        await store.destroy()
+        assert not (tmp_path / "conv").exists()
+
+
+class TestImportFileLayout:
+    @pytest.mark.asyncio
+    async def test_imports_sessions_and_conversations(self, tmp_path):
+        file_store = SessionStore(tmp_path)
+        await file_store.write_state("s1", make_state("s1", SessionStatus.PAUSED))
+        await file_store.write_state("s2", make_state("s2"))
+        # A corrupt state file is skipped, not fatal
+        (tmp_path / "sessions" / "s3").mkdir()
+        (tmp_path / "sessions" / "s3" / "state.json").write_text("{nope")
+
+        conv_dir = tmp_path / "sessions" / "s1" / "conversations"
+        legacy = FileConversationStore(conv_dir)
+        await legacy.write_meta({"system_prompt": "sys"})
+        await legacy.write_cursor({"next_seq": 2})
+        await legacy.write_part(0, {"seq": 0, "role": "user", "content": "hi"})
+        await legacy.write_part(1, {"seq": 1, "role": "assistant", "content": "yo"})
+        await FileConversationStore(conv_dir / "sub-1").write_part(0, {"seq": 0, "role": "user"})
+
+        counts = import_file_layout(tmp_path)
+        assert counts == {"sessions": 2, "conversations": 2, "parts": 3}
+
+        store = open_session_store(tmp_path)
+        assert isinstance(store, SQLiteSessionStore)
+        assert [s.session_id for s in await store.list_sessions(status="paused")] == ["s1"]
+
+        conv = open_conversation_store(conv_dir)
+        assert isinstance(conv, SQLiteConversationStore)
+        assert await conv.read_cursor() == {"next_seq": 2}
+        assert [p["content"] for p in await conv.read_parts()] == ["hi", "yo"]
+        # Imported parts keep the write time of their part files
+        part_times = [p["created_at"] for p in read_conversation_parts(conv_dir)]
+        assert part_times == sorted(part_times)
+        assert not (conv_dir / "parts").exists()
+        assert not (conv_dir / "meta.json").exists()
+
+        # Re-running is a no-op for conversations and upserts sessions
+        again = import_file_layout(tmp_path)
+        assert again == {"sessions": 2, "conversations": 0, "parts": 0}
+        assert (
+            json.loads((conv_dir / "..").joinpath("state.json").read_text())["session_id"] == "s1"
+        )
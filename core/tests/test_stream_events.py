@@ -241,6 +241,7 @@ def test_finish_asdict(self):
             "input_tokens": 10,
             "output_tokens": 20,
             "cached_tokens": 0,
+            "cache_write_tokens": 0,
             "model": "gpt-4",
         }
 
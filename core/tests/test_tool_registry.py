@@ -6,8 +6,11 @@
 could cause a json.JSONDecodeError and crash execution.
 """
 
+import asyncio
 import logging
 import textwrap
+import threading
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -121,6 +124,50 @@ def call_tool(self, tool_name, arguments):
         return [{"text": f"{tool_name}:{arguments}"}]
 
 
+class _AsyncRegistryFakeClient(_RegistryFakeClient):
+    def __init__(self, config):
+        super().__init__(config)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def call_tool(self, tool_name, arguments):
+        raise AssertionError("async-capable clients should not be called synchronously")
+
+    async def call_tool_async(self, tool_name, arguments):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if arguments.get("fail"):
+            raise RuntimeError("server exploded")
+        return [{"text": f"{tool_name}:{arguments}"}]
+
+
+def test_mcp_executor_uses_async_client_api(monkeypatch):
+    """MCP tools on async-capable clients run concurrently on the caller's loop."""
+    registry = ToolRegistry()
+    client = _AsyncRegistryFakeClient(SimpleNamespace(name="async"))
+    monkeypatch.setattr("framework.runner.mcp_client.MCPClient", lambda config: client)
+    registry.register_mcp_server(
+        {"name": "async", "transport": "stdio", "command": "echo"},
+        use_connection_manager=False,
+    )
+    executor = registry.get_executor()
+
+    async def run_all():
+        pending = [
+            executor(ToolUse(id=f"call_{i}", name="pooled_tool", input={"i": i})) for i in range(4)
+        ]
+        pending.append(executor(ToolUse(id="bad", name="pooled_tool", input={"fail": True})))
+        return await asyncio.gather(*pending)
+
+    results = asyncio.run(run_all())
+
+    assert [r.content for r in results[:4]] == [f"pooled_tool:{{'i': {i}}}" for i in range(4)]
+    assert client.max_in_flight == 5
+    assert "server exploded" in results[4].content
+
+
 def test_register_mcp_server_uses_connection_manager_when_enabled(monkeypatch):
     registry = ToolRegistry()
     client = _RegistryFakeClient(SimpleNamespace(name="shared"))
@@ -393,3 +440,129 @@ def failing_executor(inputs: dict) -> None:
     log_messages = [record.message for record in caplog.records]
     full_log = " ".join(log_messages)
     assert "...(truncated)" in full_log
+
+
+def test_load_registry_servers_connects_in_parallel(monkeypatch):
+    registry = ToolRegistry()
+
+    def slow_register(server_config, use_connection_manager=True):
+        time.sleep(0.2)
+        return 1
+
+    monkeypatch.setattr(registry, "register_mcp_server", slow_register)
+    servers = [{"name": f"s{i}", "transport": "http", "url": "http://x"} for i in range(4)]
+
+    start = time.monotonic()
+    results = registry.load_registry_servers(servers, log_summary=False)
+
+    assert time.monotonic() - start < 0.6
+    assert [r["server"] for r in results] == ["s0", "s1", "s2", "s3"]
+
+
+def _schema_cache_manager(monkeypatch, client_factory):
+    class FakeManager:
+        def acquire(self, config):
+            return client_factory(config)
+
+        def release(self, server_name):
+            pass
+
+    monkeypatch.setattr(
+        "framework.runner.mcp_connection_manager.MCPConnectionManager.get_instance",
+        lambda: FakeManager(),
+    )
+
+
+def test_cached_schemas_register_before_the_server_connects(monkeypatch, tmp_path):
+    from framework.runner.mcp_schema_cache import MCPSchemaCache
+
+    server = {"name": "cached", "transport": "stdio", "command": "echo"}
+    _schema_cache_manager(monkeypatch, _RegistryFakeClient)
+    first = ToolRegistry()
+    first.enable_schema_cache(MCPSchemaCache(tmp_path))
+    first.load_registry_servers([server], log_summary=False)
+    first.cleanup()
+
+    connected = threading.Event()
+    clients: list[_RegistryFakeClient] = []
+
+    def slow_client(config):
+        connected.wait(5)
+        clients.append(_RegistryFakeClient(config))
+        return clients[-1]
+
+    _schema_cache_manager(monkeypatch, slow_client)
+    registry = ToolRegistry()
+    registry.enable_schema_cache(MCPSchemaCache(tmp_path))
+    results = registry.load_registry_servers([server], log_summary=False)
+
+    assert results[0]["status"] == "loaded"
+    assert registry.has_tool("pooled_tool") and not clients
+
+    async def call():
+        pending = registry.get_executor()(ToolUse(id="1", name="pooled_tool", input={}))
+        connected.set()
+        return await pending
+
+    result = asyncio.run(call())
+    assert result.content == "pooled_tool:{}"
+    assert registry.wait_for_mcp_servers(timeout=5)
+    assert len(clients) == 1
+
+
+def test_changed_server_tools_are_reregistered(monkeypatch, tmp_path):
+    from framework.runner.mcp_schema_cache import MCPSchemaCache
+
+    server = {"name": "changing", "transport": "stdio", "command": "echo"}
+    _schema_cache_manager(monkeypatch, _RegistryFakeClient)
+    first = ToolRegistry()
+    first.enable_schema_cache(MCPSchemaCache(tmp_path))
+    first.load_registry_servers([server], log_summary=False)
+
+    class RenamedToolClient(_RegistryFakeClient):
+        def list_tools(self):
+            return [
+                SimpleNamespace(
+                    name="renamed_tool",
+                    description="",
+                    input_schema={"type": "object", "properties": {}},
+                )
+            ]
+
+    _schema_cache_manager(monkeypatch, RenamedToolClient)
+    registry = ToolRegistry()
+    registry.enable_schema_cache(MCPSchemaCache(tmp_path))
+    registry.load_registry_servers([server], log_summary=False)
+    assert registry.wait_for_mcp_servers(timeout=5)
+
+    assert registry.has_tool("renamed_tool")
+    assert not registry.has_tool("pooled_tool")
+    assert registry.get_server_tool_names("changing") == {"renamed_tool"}
+
+
+def test_cached_tools_are_dropped_when_the_server_fails_to_connect(monkeypatch, tmp_path):
+    from framework.runner.mcp_schema_cache import MCPSchemaCache
+
+    server = {"name": "flaky", "transport": "stdio", "command": "echo"}
+    _schema_cache_manager(monkeypatch, _RegistryFakeClient)
+    first = ToolRegistry()
+    first.enable_schema_cache(MCPSchemaCache(tmp_path))
+    first.load_registry_servers([server], log_summary=False)
+    first.cleanup()
+
+    def broken_client(config):
+        raise ConnectionError("server exited")
+
+    _schema_cache_manager(monkeypatch, broken_client)
+    monkeypatch.setattr("framework.runner.tool_registry.time.sleep", lambda s: None)
+    registry = ToolRegistry()
+    cache = MCPSchemaCache(tmp_path)
+    registry.enable_schema_cache(cache)
+    registry.load_registry_servers([server], log_summary=False)
+    registry.wait_for_mcp_servers(timeout=5)
+
+    assert not registry.has_tool("pooled_tool")
+    assert registry.get_server_tool_names("flaky") == set()
+    # The next load goes through the synchronous path and reports the failure
+    results = registry.load_registry_servers([server], log_summary=False)
+    assert results[0]["status"] == "skipped"
@@ -0,0 +1,180 @@
+"""Tests for memoizing idempotent tool results in ToolRegistry."""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from framework.llm.provider import Tool, ToolUse
+from framework.runner.tool_cache import ToolResultCache, make_cache_key
+from framework.runner.tool_registry import ToolRegistry
+from framework.runtime.event_bus import EventBus, EventType
+
+
+def _registry(cache_ttl=60, cache=None, result=None):
+    registry = ToolRegistry()
+    calls = []
+
+    def lookup(inputs: dict):
+        calls.append(inputs)
+        return result if result is not None else {"answer": inputs["q"].upper()}
+
+    registry.register(
+        "lookup",
+        Tool(name="lookup", description="Look something up"),
+        lookup,
+        cache_ttl=cache_ttl,
+    )
+    registry.enable_result_cache(cache)
+    return registry, calls
+
+
+def _use(q: str, call_id: str = "c1") -> ToolUse:
+    return ToolUse(id=call_id, name="lookup", input={"q": q})
+
+
+class TestToolResultCache:
+    def test_repeated_call_is_served_from_cache(self):
+        registry, calls = _registry()
+        executor = registry.get_executor()
+
+        first = executor(_use("hive", "c1"))
+        second = executor(_use("hive", "c2"))
+
+        assert len(calls) == 1
+        assert not first.cached
+        assert second.cached
+        assert second.tool_use_id == "c2"
+        assert json.loads(second.content) == {"answer": "HIVE"}
+        assert registry.result_cache.hits == 1
+
+        executor(_use("bees"))
+        assert len(calls) == 2
+
+    def test_tools_without_ttl_and_errors_are_not_cached(self):
+        registry, calls = _registry(cache_ttl=None)
+        executor = registry.get_executor()
+        executor(_use("a"))
+        executor(_use("a"))
+        assert len(calls) == 2
+
+        registry, calls = _registry(result={"success": False, "error": "rate limited"})
+        executor = registry.get_executor()
+        executor(_use("a"))
+        executor(_use("a"))
+        assert len(calls) == 2
+
+    def test_ttl_expiry(self, monkeypatch):
+        registry, calls = _registry(cache_ttl=10)
+        executor = registry.get_executor()
+        now = time.time()
+        monkeypatch.setattr("framework.runner.tool_cache.time.time", lambda: now)
+        executor(_use("a"))
+        monkeypatch.setattr("framework.runner.tool_cache.time.time", lambda: now + 11)
+        assert not executor(_use("a")).cached
+        assert len(calls) == 2
+
+    def test_lru_eviction_by_count_and_size(self):
+        cache = ToolResultCache(max_entries=2, max_bytes=100)
+        for name in ("a", "b", "c"):
+            cache.put(make_cache_key("t", {"k": name}), "x", ttl=60)
+        assert cache.get(make_cache_key("t", {"k": "a"})) is None
+        assert cache.get(make_cache_key("t", {"k": "c"})) is not None
+
+        cache.put(make_cache_key("t", {"k": "big"}), "y" * 100, ttl=60)
+        assert len(cache) == 1
+        assert cache.stats()["bytes"] == 100
+        assert cache.evictions == 3
+
+    def test_disk_tier_survives_a_new_registry(self, tmp_path):
+        registry, calls = _registry(cache=ToolResultCache(disk_dir=tmp_path))
+        registry.get_executor()(_use("hive"))
+
+        fresh, fresh_calls = _registry(cache=ToolResultCache(disk_dir=tmp_path))
+        result = fresh.get_executor()(_use("hive"))
+
+        assert result.cached
+        assert fresh_calls == []
+        assert fresh.result_cache.disk_hits == 1
+
+    def test_async_tools_are_cached_after_awaiting(self):
+        registry = ToolRegistry()
+        calls = []
+
+        async def fetch(inputs: dict):
+            calls.append(inputs)
+            await asyncio.sleep(0)
+            return "page"
+
+        registry.register("fetch", Tool(name="fetch", description=""), fetch, cache_ttl=60)
+        registry.enable_result_cache()
+        executor = registry.get_executor()
+
+        async def run():
+            first = await executor(ToolUse(id="1", name="fetch", input={"url": "u"}))
+            second = executor(ToolUse(id="2", name="fetch", input={"url": "u"}))
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first.content == "page" and not first.cached
+        assert second.content == "page" and second.cached
+        assert len(calls) == 1
+
+    def test_injected_context_is_part_of_the_key(self, monkeypatch):
+        registry = ToolRegistry()
+        calls = []
+
+        class _Client:
+            def __init__(self, config):
+                self.config = config
+
+            def connect(self):
+                pass
+
+            def disconnect(self):
+                pass
+
+            def list_tools(self):
+                return [
+                    SimpleNamespace(
+                        name="read_note",
+                        description="",
+                        input_schema={"properties": {"name": {}, "workspace_id": {}}},
+                        meta={"cache_ttl": 300},
+                    )
+                ]
+
+            def call_tool(self, tool_name, arguments):
+                calls.append(arguments)
+                return f"note in {arguments['workspace_id']}"
+
+        monkeypatch.setattr("framework.runner.mcp_client.MCPClient", _Client)
+        registry.register_mcp_server(
+            {"name": "notes", "transport": "stdio", "command": "echo"},
+            use_connection_manager=False,
+        )
+        registry.enable_result_cache()
+        executor = registry.get_executor()
+        use = ToolUse(id="1", name="read_note", input={"name": "todo"})
+
+        registry.set_session_context(workspace_id="ws1")
+        executor(use)
+        assert executor(use).cached
+        registry.set_session_context(workspace_id="ws2")
+        assert executor(use).content == "note in ws2"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_completed_event_carries_cache_flag(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        bus.subscribe([EventType.TOOL_CALL_COMPLETED], handler)
+        await bus.emit_tool_call_completed("s", "n", "c1", "lookup", result="x", cached=True)
+
+        assert received[0].data["cached"] is True
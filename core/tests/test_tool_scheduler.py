@@ -0,0 +1,161 @@
+"""Tests for the bounded-parallel tool scheduler."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from framework.graph.event_loop.event_publishing import publish_tool_queue_metrics
+from framework.graph.event_loop.tool_result_handler import execute_tool
+from framework.graph.event_loop.tool_scheduler import ToolScheduler, ToolSlot
+from framework.llm.provider import ToolResult, ToolUse
+from framework.llm.stream_events import ToolCallEvent
+from framework.runtime.event_bus import EventBus, EventType
+
+
+def _call(name: str, i: int = 0) -> ToolCallEvent:
+    return ToolCallEvent(tool_use_id=f"{name}_{i}", tool_name=name, tool_input={})
+
+
+class _ConcurrencyProbe:
+    """Sync executor that sleeps and records peak concurrency per tool."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, tool_use: ToolUse) -> ToolResult:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return ToolResult(tool_use_id=tool_use.id, content="ok")
+
+
+class TestToolScheduler:
+    @pytest.mark.asyncio
+    async def test_group_limit_bounds_fan_out(self):
+        scheduler = ToolScheduler(group_limits={"slow_server": 2})
+        probe = _ConcurrencyProbe()
+        probe.tool_server = lambda name: "slow_server"
+
+        slots: list[ToolSlot] = []
+        results = await asyncio.gather(
+            *(
+                execute_tool(probe, _call("search", i), timeout=5, scheduler=scheduler, slots=slots)
+                for i in range(6)
+            )
+        )
+
+        assert all(r.content == "ok" for r in results)
+        assert probe.peak == 2
+        assert len(slots) == 6
+        assert {s.group for s in slots} == {"slow_server"}
+        assert max(s.queue_depth for s in slots) >= 3
+        assert max(s.wait_s for s in slots) > 0.05
+        assert scheduler.running == 0 and scheduler.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_short_tools_admitted_first(self):
+        scheduler = ToolScheduler(max_concurrency=1)
+        scheduler._record_duration("crawl", 5.0)
+        scheduler._record_duration("lookup", 0.01)
+        order: list[str] = []
+
+        async def run(name: str) -> None:
+            async with scheduler.reserve(name):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        blocker = asyncio.create_task(run("blocker"))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(run(n)) for n in ("crawl", "crawl", "lookup")]
+        await asyncio.gather(blocker, *waiters)
+
+        assert order == ["blocker", "lookup", "crawl", "crawl"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_releases_its_place(self):
+        scheduler = ToolScheduler(max_concurrency=1)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with scheduler.reserve("a"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        async with scheduler.reserve("b") as slot:
+            assert slot.queue_depth == 0
+        assert scheduler._global.active == 0
+
+    @pytest.mark.asyncio
+    async def test_async_tools_skip_the_thread_pool(self):
+        scheduler = ToolScheduler()
+        threads: list[str] = []
+
+        def executor(tool_use: ToolUse):
+            threads.append(threading.current_thread().name)
+
+            async def _run():
+                await asyncio.sleep(0)
+                return ToolResult(tool_use_id=tool_use.id, content="async")
+
+            return _run()
+
+        for i in range(3):
+            result = await execute_tool(executor, _call("mcp_tool", i), 5, scheduler=scheduler)
+            assert result.content == "async"
+
+        # Learned on the first call, then invoked on the event loop thread
+        main = threading.current_thread().name
+        assert threads[0] != main
+        assert threads[1:] == [main, main]
+
+    @pytest.mark.asyncio
+    async def test_timeout_excludes_queue_wait(self):
+        scheduler = ToolScheduler(max_concurrency=1)
+        probe = _ConcurrencyProbe(delay=0.3)
+
+        results = await asyncio.gather(
+            *(execute_tool(probe, _call("t", i), 0.5, scheduler=scheduler) for i in range(3))
+        )
+
+        # Third call waits ~0.6s for a slot but still completes in 0.3s
+        assert [r.is_error for r in results] == [False, False, False]
+
+    @pytest.mark.asyncio
+    async def test_queue_metrics_event(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        bus.subscribe([EventType.TOOL_QUEUE_METRICS], handler)
+        slots = [
+            ToolSlot(tool_name="a", group=None, wait_s=0.0, queue_depth=0),
+            ToolSlot(tool_name="b", group="srv", wait_s=0.2, queue_depth=1),
+        ]
+        await publish_tool_queue_metrics(bus, "s", "n", slots, ToolScheduler(), "exec_1")
+
+        assert len(received) == 1
+        data = received[0].data
+        assert data["batch_size"] == 2
+        assert data["mean_wait_s"] == 0.1
+        assert data["max_wait_s"] == 0.2
+        assert data["max_queue_depth"] == 1
+        assert data["scheduler"]["running"] == 0
@@ -0,0 +1,170 @@
+"""Tests for the incrementally maintained worker status view."""
+
+import gc
+import weakref
+
+import pytest
+
+from framework.agents.worker_memory import _collect_run_events
+from framework.runtime import worker_status
+from framework.runtime.event_bus import AgentEvent, EventBus, EventType
+from framework.runtime.worker_status import WorkerStatusView, get_worker_status_view
+
+
+def _event(
+    event_type: EventType,
+    execution_id: str | None = "exec_1",
+    run_id: str | None = None,
+    **data,
+) -> AgentEvent:
+    return AgentEvent(
+        type=event_type,
+        stream_id="worker",
+        execution_id=execution_id,
+        run_id=run_id,
+        data=data,
+    )
+
+
+class TestWorkerStatusView:
+    @pytest.mark.asyncio
+    async def test_seeds_from_history_then_follows_bus(self):
+        bus = EventBus()
+        await bus.publish(_event(EventType.EXECUTION_STARTED, run_id="run_1"))
+        await bus.publish(
+            _event(EventType.EDGE_TRAVERSED, source_node="start", target_node="research")
+        )
+
+        view = get_worker_status_view(bus)
+        assert get_worker_status_view(bus) is view
+        assert view.current_node == "research"
+        assert view.execution_for_run("run_1") == "exec_1"
+        assert view.run_for_execution("exec_1") == "run_1"
+
+        await bus.publish(_event(EventType.NODE_LOOP_ITERATION, iteration=3))
+        await bus.publish(
+            _event(EventType.EDGE_TRAVERSED, source_node="research", target_node="write")
+        )
+        assert view.current_node == "write"
+        assert view.current_iteration == 3
+        assert view.executions["exec_1"].current_node == "write"
+
+        # Re-applying an already seen event is a no-op
+        view.apply(bus.get_history(event_type=EventType.EDGE_TRAVERSED, limit=1)[0])
+        assert len(view.recent(EventType.EDGE_TRAVERSED)) == 2
+
+    @pytest.mark.asyncio
+    async def test_recent_matches_bus_history(self):
+        bus = EventBus()
+        view = get_worker_status_view(bus)
+        for i in range(30):
+            await bus.publish(_event(EventType.NODE_RETRY, retry_count=i))
+            await bus.publish(_event(EventType.LLM_TEXT_DELTA, snapshot=f"text {i}"))
+
+        for limit in (1, 5, 50):
+            assert view.recent(EventType.NODE_RETRY, limit) == bus.get_history(
+                event_type=EventType.NODE_RETRY, limit=limit
+            )
+        assert view.last_text_delta.data["snapshot"] == "text 29"
+        assert view.executions["exec_1"].retries == 30
+
+    @pytest.mark.asyncio
+    async def test_running_tools_and_counters(self):
+        bus = EventBus()
+        view = get_worker_status_view(bus)
+        await bus.publish(_event(EventType.EXECUTION_STARTED, run_id="run_1"))
+        for tool_use_id in ("t1", "t2", "t3"):
+            await bus.publish(
+                _event(EventType.TOOL_CALL_STARTED, tool_use_id=tool_use_id, tool_name="search")
+            )
+        await bus.publish(
+            _event(
+                EventType.TOOL_CALL_COMPLETED, tool_use_id="t2", tool_name="search", is_error=True
+            )
+        )
+        assert [e.data["tool_use_id"] for e in view.running_tools] == ["t3", "t1"]
+
+        counters = view.executions["exec_1"]
+        assert counters.tool_calls == 1
+        assert counters.tool_errors == 1
+
+        await bus.publish(_event(EventType.EXECUTION_FAILED, error="boom"))
+        assert view.running_tools == []
+        assert counters.status == "failed"
+        assert view.failed_count == 1
+
+    @pytest.mark.asyncio
+    async def test_finished_executions_are_pruned(self):
+        bus = EventBus()
+        view = WorkerStatusView(max_finished=2)
+        view.attach(bus)
+        for i in range(5):
+            exec_id, run_id = f"exec_{i}", f"run_{i}"
+            await bus.publish(_event(EventType.EXECUTION_STARTED, exec_id, run_id=run_id))
+            await bus.publish(_event(EventType.TOOL_CALL_COMPLETED, exec_id, tool_use_id="t"))
+            if i < 4:
+                await bus.publish(_event(EventType.EXECUTION_COMPLETED, exec_id, run_id=run_id))
+
+        # Two most recent finished executions plus the running one
+        assert sorted(view.executions) == ["exec_2", "exec_3", "exec_4"]
+        assert view.execution_for_run("run_1") is None
+        assert view.execution_for_run("run_3") == "exec_3"
+        assert view.executions["exec_4"].tool_calls == 1
+        assert view.completed_count == 4
+
+    @pytest.mark.asyncio
+    async def test_red_flags_and_token_window(self):
+        bus = EventBus()
+        view = WorkerStatusView(token_window=3)
+        view.attach(bus)
+        assert view.red_flags == 0
+
+        await bus.publish(_event(EventType.NODE_STALLED, reason="no progress"))
+        await bus.publish(_event(EventType.NODE_STALLED, reason="still stuck"))
+        await bus.publish(_event(EventType.CONSTRAINT_VIOLATION, constraint_id="c1"))
+        assert view.red_flags == 2
+
+        for i in range(1, 6):
+            await bus.publish(
+                _event(EventType.LLM_TURN_COMPLETE, input_tokens=i * 100, output_tokens=i)
+            )
+        # Window keeps the last 3 turns; per-execution totals keep everything
+        assert view.token_summary() == {
+            "llm_turns": 3,
+            "input_tokens": 1200,
+            "output_tokens": 12,
+            "total_tokens": 1212,
+        }
+        assert view.executions["exec_1"].input_tokens == 1500
+
+    @pytest.mark.asyncio
+    async def test_collect_run_events_uses_run_mapping(self):
+        bus = EventBus()
+        await bus.publish(_event(EventType.EXECUTION_STARTED, run_id="run_1"))
+        await bus.publish(_event(EventType.TOOL_CALL_COMPLETED, tool_name="search"))
+        await bus.publish(
+            _event(EventType.EXECUTION_STARTED, execution_id="exec_2", run_id="run_2")
+        )
+        await bus.publish(_event(EventType.NODE_STALLED, execution_id="exec_2"))
+
+        events = _collect_run_events(bus, "run_1")
+        assert [e.type for e in events] == [
+            EventType.TOOL_CALL_COMPLETED,
+            EventType.EXECUTION_STARTED,
+        ]
+        assert _collect_run_events(bus, "unknown") == []
+
+    @pytest.mark.asyncio
+    async def test_view_does_not_keep_bus_alive(self):
+        bus = EventBus()
+        await bus.publish(_event(EventType.EXECUTION_STARTED, run_id="run_1"))
+        view = get_worker_status_view(bus)
+        bus_ref = weakref.ref(bus)
+        before = len(worker_status._views)
+
+        del bus
+        gc.collect()
+
+        assert bus_ref() is None
+        assert len(worker_status._views) == before - 1
+        view.detach()  # safe once the bus is gone
@@ -1141,8 +1141,8 @@ def list_agent_checkpoints(
             }
         )
 
-    # Try index.json first
-    index_data = _read_session_json(checkpoint_dir / "index.json")
+    # Try the index first (index.jsonl, or a legacy index.json)
+    index_data = _read_checkpoint_index(session_dir)
     if index_data and "checkpoints" in index_data:
         checkpoints = index_data["checkpoints"]
     else:
@@ -1206,7 +1206,7 @@ def get_agent_checkpoint(
         return json.dumps({"error": f"No checkpoints for session: {session_id}"})
 
     if not checkpoint_id:
-        index_data = _read_session_json(checkpoint_dir / "index.json")
+        index_data = _read_checkpoint_index(checkpoint_dir.parent)
         if index_data and index_data.get("latest_checkpoint_id"):
             checkpoint_id = index_data["latest_checkpoint_id"]
         else:
@@ -1220,9 +1220,29 @@ def get_agent_checkpoint(
     if data is None:
         return json.dumps({"error": f"Checkpoint not found: {checkpoint_id}"})
 
+    if data.get("is_delta"):
+        # Delta checkpoints only hold changed memory keys; rebuild the full state
+        from framework.storage.checkpoint_store import CheckpointStore
+
+        checkpoint = CheckpointStore(checkpoint_dir.parent).load_checkpoint_sync(checkpoint_id)
+        if checkpoint is None:
+            return json.dumps({"error": f"Checkpoint delta chain broken: {checkpoint_id}"})
+        data = checkpoint.model_dump(mode="json")
+
     return json.dumps(data, indent=2, default=str)
 
 
+def _read_checkpoint_index(session_dir: Path) -> dict | None:
+    """Read a session's checkpoint index as a dict, or None if absent."""
+    checkpoint_dir = session_dir / "checkpoints"
+    if (checkpoint_dir / "index.jsonl").exists():
+        from framework.storage.checkpoint_store import CheckpointStore
+
+        index = CheckpointStore(session_dir).load_index_sync()
+        return index.model_dump(mode="json") if index else None
+    return _read_session_json(checkpoint_dir / "index.json")
+
+
 # ── Meta-agent: Test execution ────────────────────────────────────────────
 
 
@@ -18,6 +18,10 @@
     MCP_PORT                  - Server port (default: 4001)
     INCLUDE_UNVERIFIED_TOOLS  - Set to "true", "1", or "yes" to also load
                                 unverified/community tool integrations (default: off)
+    LAZY_TOOL_REGISTRATION    - Set to "false", "0", or "no" to import every tool
+                                integration at startup instead of on first call
+                                (default: lazy, using the prebuilt tool manifest)
+    ADEN_TOOL_MANIFEST        - Path of the tool manifest used for lazy registration
     ANTHROPIC_API_KEY         - Required at startup for testing/LLM nodes
     BRAVE_SEARCH_API_KEY      - Required for web_search tool (validated at agent load time)
 
@@ -84,7 +88,10 @@ def _patched_console_init(self, *args, **kwargs):
 
 # Register all tools with the MCP server, passing credential store
 include_unverified = os.getenv("INCLUDE_UNVERIFIED_TOOLS", "").lower() in ("true", "1", "yes")
-tools = register_all_tools(mcp, credentials=credentials, include_unverified=include_unverified)
+lazy = os.getenv("LAZY_TOOL_REGISTRATION", "").lower() not in ("false", "0", "no")
+tools = register_all_tools(
+    mcp, credentials=credentials, include_unverified=include_unverified, lazy=lazy
+)
 # Only print to stdout in HTTP mode (STDIO mode requires clean stdout for JSON-RPC)
 if "--stdio" not in sys.argv:
     logger.info(f"Registered {len(tools)} tools: {tools}")
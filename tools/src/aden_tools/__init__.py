@@ -24,6 +24,9 @@
     CredentialStoreAdapter,
 )
 
+# Shared pooled HTTP clients for integrations
+from .http_client import PooledClient, get_http_client, http_client_stats, pooled_client
+
 # Utilities (no external dependencies)
 from .utils import get_env_var
 
@@ -47,6 +50,11 @@ def __getattr__(name: str):
     "CredentialSpec",
     "CredentialError",
     "CREDENTIAL_SPECS",
+    # HTTP
+    "PooledClient",
+    "get_http_client",
+    "http_client_stats",
+    "pooled_client",
     # MCP registration (lazy loaded)
     "register_all_tools",
 ]
@@ -0,0 +1,244 @@
+"""
+Shared, connection-pooled HTTP clients for tool integrations.
+
+Module-level ``httpx.get()``/``httpx.post()`` open a fresh TCP + TLS
+connection for every call.  Integrations instead get a long-lived
+``httpx.Client`` per integration, so repeated calls to the same API host
+reuse keep-alive connections (and HTTP/2 when ``h2`` is installed).
+
+Integrations fetch a named client and call it explicitly; exceptions and
+types still come from ``httpx`` itself::
+
+    import httpx
+
+    from aden_tools.http_client import pooled_client
+
+    _http = pooled_client("github")
+
+    response = _http.get(url, headers=headers, timeout=30.0)  # pooled
+    except httpx.TimeoutException: ...
+
+Pool limits and defaults are configurable through environment variables:
+
+- ``ADEN_HTTP_MAX_CONNECTIONS`` (default 100)
+- ``ADEN_HTTP_MAX_KEEPALIVE`` (default 20)
+- ``ADEN_HTTP_KEEPALIVE_EXPIRY`` seconds (default 30)
+- ``ADEN_HTTP_TIMEOUT`` default request timeout in seconds (default 5,
+  matching ``httpx.get``)
+- ``ADEN_HTTP2`` set to ``0`` to disable HTTP/2
+
+Clients never persist cookies, so state cannot leak between calls made
+with different credentials.  Requests that need client-level options
+(``verify``, ``cert``, ``proxy``, ``trust_env``, ``cookies``) fall back to a
+one-shot ``httpx.request``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Per-request options that only exist on a client, not on Client.request()
+_CLIENT_ONLY_KWARGS = frozenset({"verify", "cert", "proxy", "trust_env", "cookies"})
+
+
+@dataclass
+class ConnectionStats:
+    """Per-integration connection reuse counters."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+    unpooled_requests: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests served on an already-open connection."""
+        pooled = self.requests - self.unpooled_requests
+        return max(0, pooled - self.connections_opened)
+
+    def to_dict(self) -> dict[str, int]:
+        data = asdict(self)
+        data["reused_connections"] = self.reused_connections
+        return data
+
+
+_clients: dict[str, httpx.Client] = {}
+_stats: dict[str, ConnectionStats] = {}
+_lock = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r, using %s", name, raw, default)
+        return default
+
+
+def _http2_enabled() -> bool:
+    if os.environ.get("ADEN_HTTP2", "").strip().lower() in ("0", "false", "no"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+def _make_tracer(stats: ConnectionStats):
+    def trace(event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            with _lock:
+                stats.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            with _lock:
+                stats.tls_handshakes += 1
+
+    return trace
+
+
+def _create_client(stats: ConnectionStats) -> httpx.Client:
+    tracer = _make_tracer(stats)
+
+    def on_request(request: httpx.Request) -> None:
+        request.extensions["trace"] = tracer
+        with _lock:
+            stats.requests += 1
+
+    limits = httpx.Limits(
+        max_connections=int(_env_float("ADEN_HTTP_MAX_CONNECTIONS", 100)),
+        max_keepalive_connections=int(_env_float("ADEN_HTTP_MAX_KEEPALIVE", 20)),
+        keepalive_expiry=_env_float("ADEN_HTTP_KEEPALIVE_EXPIRY", 30.0),
+    )
+    return httpx.Client(
+        limits=limits,
+        timeout=httpx.Timeout(_env_float("ADEN_HTTP_TIMEOUT", 5.0)),
+        http2=_http2_enabled(),
+        # Refuse all cookies: one shared client serves every caller
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        event_hooks={"request": [on_request]},
+    )
+
+
+def get_http_client(integration: str = "default") -> httpx.Client:
+    """
+    Return the shared pooled client for an integration, creating it on first use.
+
+    Args:
+        integration: Name used to key the pool and its metrics (e.g. "github")
+
+    Returns:
+        A long-lived ``httpx.Client``; do not close it
+    """
+    client = _clients.get(integration)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(integration)
+        if client is None:
+            stats = _stats.setdefault(integration, ConnectionStats())
+            client = _create_client(stats)
+            _clients[integration] = client
+        return client
+
+
+def http_client_stats() -> dict[str, dict[str, int]]:
+    """Connection reuse metrics for every integration that has made a request."""
+    with _lock:
+        return {name: stats.to_dict() for name, stats in _stats.items()}
+
+
+def close_http_clients() -> None:
+    """Close all pooled clients (they are recreated on next use)."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            logger.debug("Failed to close pooled HTTP client", exc_info=True)
+
+
+def _reset_after_fork() -> None:
+    # Pooled sockets belong to the parent process
+    global _lock
+    _lock = threading.Lock()
+    _clients.clear()
+
+
+atexit.register(close_http_clients)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class PooledClient:
+    """
+    Request functions for one integration, backed by its shared pooled client.
+
+    ``get``/``post``/``put``/``patch``/``delete``/``head``/``options``/``request``
+    accept the same arguments as their ``httpx`` module counterparts.
+    """
+
+    def __init__(self, integration: str):
+        self.integration = integration
+
+    def __repr__(self) -> str:
+        return f"PooledClient({self.integration!r})"
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Connection reuse metrics for this integration."""
+        return http_client_stats().get(self.integration, ConnectionStats().to_dict())
+
+    def request(self, method: str, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        if _CLIENT_ONLY_KWARGS.intersection(kwargs):
+            with _lock:
+                _stats.setdefault(self.integration, ConnectionStats()).unpooled_requests += 1
+                _stats[self.integration].requests += 1
+            return httpx.request(method, url, **kwargs)
+        return get_http_client(self.integration).request(method, url, **kwargs)
+
+    def get(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def options(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        return self.request("OPTIONS", url, **kwargs)
+
+    def head(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: httpx.URL | str, **kwargs: Any) -> httpx.Response:
+        return self.request("DELETE", url, **kwargs)
+
+
+def pooled_client(integration: str) -> PooledClient:
+    """
+    Return the request functions for an integration's pooled client.
+
+    Args:
+        integration: Name used to key the pool and its metrics (e.g. "github")
+
+    Returns:
+        A ``PooledClient`` whose ``get``/``post``/... reuse pooled connections
+    """
+    return PooledClient(integration)
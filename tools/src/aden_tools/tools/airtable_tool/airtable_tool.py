@@ -9,9 +9,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("airtable")
+
 BASE_URL = "https://api.airtable.com/v0"
 
 
@@ -28,7 +31,7 @@ def _get_headers() -> dict | None:
 
 def _get(url: str, headers: dict, params: dict | None = None) -> dict:
     """Send a GET request."""
-    resp = httpx.get(url, headers=headers, params=params, timeout=30)
+    resp = _http.get(url, headers=headers, params=params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -36,7 +39,7 @@ def _get(url: str, headers: dict, params: dict | None = None) -> dict:
 
 def _post(url: str, headers: dict, body: dict) -> dict:
     """Send a POST request."""
-    resp = httpx.post(url, headers=headers, json=body, timeout=30)
+    resp = _http.post(url, headers=headers, json=body, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -44,7 +47,7 @@ def _post(url: str, headers: dict, body: dict) -> dict:
 
 def _patch(url: str, headers: dict, body: dict) -> dict:
     """Send a PATCH request."""
-    resp = httpx.patch(url, headers=headers, json=body, timeout=30)
+    resp = _http.patch(url, headers=headers, json=body, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -52,7 +55,7 @@ def _patch(url: str, headers: dict, body: dict) -> dict:
 
 def _delete(url: str, headers: dict, params: dict | None = None) -> dict:
     """Send a DELETE request."""
-    resp = httpx.delete(url, headers=headers, params=params, timeout=30)
+    resp = _http.delete(url, headers=headers, params=params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     if not resp.content:
@@ -363,7 +366,7 @@ def airtable_delete_records(
         url = f"{BASE_URL}/{base_id}/{table_name}"
         # Airtable DELETE uses repeated records[] query params
         params = [("records[]", rid) for rid in ids]
-        resp = httpx.delete(url, headers=hdrs, params=params, timeout=30)
+        resp = _http.delete(url, headers=hdrs, params=params, timeout=30)
         if resp.status_code >= 400:
             return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
 
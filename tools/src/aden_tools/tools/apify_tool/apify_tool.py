@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("apify")
+
 APIFY_API = "https://api.apify.com/v2"
 
 
@@ -35,7 +39,7 @@ def _headers(token: str) -> dict[str, str]:
 
 def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.get(
+        resp = _http.get(
             f"{APIFY_API}/{endpoint}", headers=_headers(token), params=params, timeout=30.0
         )
         if resp.status_code == 401:
@@ -53,7 +57,7 @@ def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any
 
 def _post(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.post(
+        resp = _http.post(
             f"{APIFY_API}/{endpoint}", headers=_headers(token), json=body or {}, timeout=60.0
         )
         if resp.status_code == 401:
@@ -118,7 +122,7 @@ def apify_run_actor(
         # Build the URL with query params
         url = f"acts/{actor_id}/runs"
         try:
-            resp = httpx.post(
+            resp = _http.post(
                 f"{APIFY_API}/{url}",
                 headers=_headers(token),
                 params=params,
@@ -211,7 +215,7 @@ def apify_get_dataset_items(
             "format": format,
         }
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{APIFY_API}/datasets/{dataset_id}/items",
                 headers=_headers(token),
                 params=params,
@@ -330,7 +334,7 @@ def apify_get_kv_store_record(
             return {"error": "store_id and key are required"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{APIFY_API}/key-value-stores/{store_id}/records/{key}",
                 headers={"Authorization": f"Bearer {token}"},
                 timeout=30.0,
@@ -21,9 +21,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("apollo")
+
 APOLLO_API_BASE = "https://api.apollo.io/api/v1"
 
 
@@ -99,7 +103,7 @@ def enrich_person(
         if domain:
             body["domain"] = domain
 
-        response = httpx.post(
+        response = _http.post(
             f"{APOLLO_API_BASE}/people/match",
             headers=self._headers,
             params=body if not email and not linkedin_url else None,
@@ -149,7 +153,7 @@ def enrich_company(self, domain: str) -> dict[str, Any]:
             "domain": domain,
         }
 
-        response = httpx.post(
+        response = _http.post(
             f"{APOLLO_API_BASE}/organizations/enrich",
             headers=self._headers,
             json=body,
@@ -224,7 +228,7 @@ def search_people(
         if technologies:
             body["currently_using_any_of_technology_uids"] = technologies
 
-        response = httpx.post(
+        response = _http.post(
             f"{APOLLO_API_BASE}/mixed_people/search",
             headers=self._headers,
             json=body,
@@ -274,7 +278,7 @@ def get_person_activities(
         person_id: str,
     ) -> dict[str, Any]:
         """Get activity history for a person (emails, calls, tasks)."""
-        response = httpx.get(
+        response = _http.get(
             f"{APOLLO_API_BASE}/activities",
             headers=self._headers,
             params={"contact_id": person_id},
@@ -304,7 +308,7 @@ def get_person_activities(
 
     def list_email_accounts(self) -> dict[str, Any]:
         """List email accounts connected to Apollo."""
-        response = httpx.get(
+        response = _http.get(
             f"{APOLLO_API_BASE}/email_accounts",
             headers=self._headers,
             timeout=30.0,
@@ -336,7 +340,7 @@ def bulk_enrich_people(
     ) -> dict[str, Any]:
         """Bulk enrich up to 10 people at once."""
         body: dict[str, Any] = {"details": details[:10]}
-        response = httpx.post(
+        response = _http.post(
             f"{APOLLO_API_BASE}/people/bulk_match",
             headers=self._headers,
             json=body,
@@ -388,7 +392,7 @@ def search_companies(
         if technologies:
             body["currently_using_any_of_technology_uids"] = technologies
 
-        response = httpx.post(
+        response = _http.post(
             f"{APOLLO_API_BASE}/mixed_companies/search",
             headers=self._headers,
             json=body,
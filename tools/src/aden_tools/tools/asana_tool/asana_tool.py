@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("asana")
+
 ASANA_API = "https://app.asana.com/api/1.0"
 
 
@@ -34,7 +38,7 @@ def _headers(token: str) -> dict[str, str]:
 
 def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.get(
+        resp = _http.get(
             f"{ASANA_API}/{endpoint}", headers=_headers(token), params=params, timeout=30.0
         )
         if resp.status_code == 401:
@@ -54,7 +58,7 @@ def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any
 
 def _post(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.post(
+        resp = _http.post(
             f"{ASANA_API}/{endpoint}",
             headers=_headers(token),
             json={"data": body or {}},
@@ -73,7 +77,7 @@ def _post(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]
 
 def _put(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.put(
+        resp = _http.put(
             f"{ASANA_API}/{endpoint}",
             headers=_headers(token),
             json={"data": body or {}},
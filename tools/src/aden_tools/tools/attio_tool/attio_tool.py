@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("attio")
+
 ATTIO_API_BASE = "https://api.attio.com/v2"
 
 
@@ -45,7 +49,7 @@ def _request(
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Execute an HTTP request against the Attio API."""
-        response = httpx.request(
+        response = _http.request(
             method,
             f"{ATTIO_API_BASE}{path}",
             headers=self._headers,
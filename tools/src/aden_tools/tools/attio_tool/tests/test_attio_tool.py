@@ -80,7 +80,7 @@ def test_handle_response_generic_error_no_json(self):
         assert "error" in result
         assert "Bad Gateway" in result["error"]
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_request_get(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -99,7 +99,7 @@ def test_request_get(self, mock_request):
         )
         assert result == {"data": []}
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_request_post_with_body(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -113,7 +113,7 @@ def test_request_post_with_body(self, mock_request):
         assert call_kwargs["json"] == body
         assert result == {"data": [{"id": "rec-1"}]}
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_request_with_params(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -128,7 +128,7 @@ def test_request_with_params(self, mock_request):
 
     # --- Record Operations ---
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_records(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -145,7 +145,7 @@ def test_list_records(self, mock_request):
         assert result["total"] == 2
         assert len(result["records"]) == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_records_with_filter(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -159,7 +159,7 @@ def test_list_records_with_filter(self, mock_request):
         body = call_kwargs["json"]
         assert body["filter"] == filter_data
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_records_error(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 401
@@ -168,7 +168,7 @@ def test_list_records_error(self, mock_request):
         result = self.client.list_records("people")
         assert "error" in result
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_get_record(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -184,7 +184,7 @@ def test_get_record(self, mock_request):
 
         assert result["id"]["record_id"] == "rec-123"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_create_record(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -203,7 +203,7 @@ def test_create_record(self, mock_request):
         call_kwargs = mock_request.call_args.kwargs
         assert call_kwargs["json"] == {"data": {"values": values}}
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_update_record(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -220,7 +220,7 @@ def test_update_record(self, mock_request):
 
         assert result["values"]["name"][0]["first_name"] == "Updated"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_assert_record(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -236,7 +236,7 @@ def test_assert_record(self, mock_request):
 
     # --- List Operations ---
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_lists(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -248,7 +248,7 @@ def test_list_lists(self, mock_request):
         assert result["total"] == 1
         assert result["lists"][0]["name"] == "Sales Pipeline"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_get_entries(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -260,7 +260,7 @@ def test_get_entries(self, mock_request):
         assert result["total"] == 2
         assert len(result["entries"]) == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_create_entry(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -275,7 +275,7 @@ def test_create_entry(self, mock_request):
         assert body["data"]["parent_record_id"] == "rec-123"
         assert body["data"]["parent_object"] == "people"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_create_entry_with_values(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -289,7 +289,7 @@ def test_create_entry_with_values(self, mock_request):
         body = call_kwargs["json"]
         assert body["data"]["entry_values"] == entry_values
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_delete_entry(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 204
@@ -301,7 +301,7 @@ def test_delete_entry(self, mock_request):
 
     # --- Task Operations ---
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_create_task(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -323,7 +323,7 @@ def test_create_task(self, mock_request):
         assert result["id"] == "task-new"
         assert result["content"] == "Follow up with Jane"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_tasks(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -335,7 +335,7 @@ def test_list_tasks(self, mock_request):
         assert result["total"] == 2
         assert len(result["tasks"]) == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_get_task(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -346,7 +346,7 @@ def test_get_task(self, mock_request):
 
         assert result["id"] == "task-1"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_delete_task(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 204
@@ -358,7 +358,7 @@ def test_delete_task(self, mock_request):
 
     # --- Workspace Members ---
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_members(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -375,7 +375,7 @@ def test_list_members(self, mock_request):
         assert result["total"] == 2
         assert result["members"][0]["first_name"] == "Alice"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_get_member(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -439,7 +439,7 @@ def test_credential_from_env(self, monkeypatch):
 
         # Should not return error when env var is set
         tool_fn = mcp._tool_manager._tools["attio_members_list"].fn
-        with patch("aden_tools.tools.attio_tool.attio_tool.httpx.request") as mock_req:
+        with patch("aden_tools.tools.attio_tool.attio_tool._http.request") as mock_req:
             mock_resp = MagicMock()
             mock_resp.status_code = 200
             mock_resp.json.return_value = {"data": []}
@@ -471,7 +471,7 @@ def test_credential_from_store(self, monkeypatch):
         register_tools(mcp, credentials=mock_creds)
 
         tool_fn = mcp._tool_manager._tools["attio_members_list"].fn
-        with patch("aden_tools.tools.attio_tool.attio_tool.httpx.request") as mock_req:
+        with patch("aden_tools.tools.attio_tool.attio_tool._http.request") as mock_req:
             mock_resp = MagicMock()
             mock_resp.status_code = 200
             mock_resp.json.return_value = {"data": []}
@@ -491,7 +491,7 @@ def setup_method(self):
         self.mcp = FastMCP("test")
         register_tools(self.mcp, credentials=None)
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_timeout_error(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
 
@@ -506,7 +506,7 @@ def test_timeout_error(self, mock_request, monkeypatch):
         assert "error" in result
         assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_network_error(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
 
@@ -526,7 +526,7 @@ def test_network_error(self, mock_request, monkeypatch):
 
 
 class TestRecordTools:
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_list(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -543,7 +543,7 @@ def test_record_list(self, mock_request, monkeypatch):
         result = tool_fn(object_handle="people", limit=10)
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_list_with_filter_json(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -575,7 +575,7 @@ def test_record_list_invalid_filter_json(self, monkeypatch):
         assert "error" in result
         assert "Invalid filter_json" in result["error"]
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_get(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -592,7 +592,7 @@ def test_record_get(self, mock_request, monkeypatch):
         result = tool_fn(object_handle="people", record_id="r1")
         assert result["id"]["record_id"] == "r1"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_create(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -612,7 +612,7 @@ def test_record_create(self, mock_request, monkeypatch):
         )
         assert result["id"]["record_id"] == "r-new"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_update(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -633,7 +633,7 @@ def test_record_update(self, mock_request, monkeypatch):
         )
         assert "error" not in result
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_assert(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -659,7 +659,7 @@ def test_record_assert(self, mock_request, monkeypatch):
 
 
 class TestListTools:
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_lists(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -676,7 +676,7 @@ def test_list_lists(self, mock_request, monkeypatch):
         result = tool_fn()
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_entries_get(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -693,7 +693,7 @@ def test_list_entries_get(self, mock_request, monkeypatch):
         result = tool_fn(list_id="list-1")
         assert result["total"] == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_entry_create(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -710,7 +710,7 @@ def test_list_entry_create(self, mock_request, monkeypatch):
         result = tool_fn(list_id="list-1", parent_record_id="rec-123")
         assert result["id"] == "entry-new"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_entry_delete(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -731,7 +731,7 @@ def test_list_entry_delete(self, mock_request, monkeypatch):
 
 
 class TestTaskTools:
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_task_create(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -748,7 +748,7 @@ def test_task_create(self, mock_request, monkeypatch):
         result = tool_fn(content="Follow up")
         assert result["id"] == "task-new"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_task_list(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -765,7 +765,7 @@ def test_task_list(self, mock_request, monkeypatch):
         result = tool_fn()
         assert result["total"] == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_task_get(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -782,7 +782,7 @@ def test_task_get(self, mock_request, monkeypatch):
         result = tool_fn(task_id="t1")
         assert result["id"] == "t1"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_task_delete(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -803,7 +803,7 @@ def test_task_delete(self, mock_request, monkeypatch):
 
 
 class TestMemberTools:
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_members_list(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -820,7 +820,7 @@ def test_members_list(self, mock_request, monkeypatch):
         result = tool_fn()
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_member_get(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -17,6 +17,10 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("aws_s3")
+
 EMPTY_HASH = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
 
 
@@ -123,7 +127,7 @@ def _s3_request(
 
     headers = _sign_request(method, host, path, qp, headers, body, access_key, secret_key, region)
 
-    return getattr(httpx, method.lower())(url, headers=headers, params=qp, content=body, timeout=30)
+    return getattr(_http, method.lower())(url, headers=headers, params=qp, content=body, timeout=30)
 
 
 def _parse_xml(text: str, ns: str = "") -> ET.Element:
@@ -9,9 +9,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("azure_sql")
+
 BASE_URL = "https://management.azure.com"
 API_VERSION = "2023-08-01"
 
@@ -34,7 +37,7 @@ def _get(url: str, headers: dict, params: dict | None = None) -> dict:
     final_params = {"api-version": API_VERSION}
     if params:
         final_params.update(params)
-    resp = httpx.get(url, headers=headers, params=final_params, timeout=30)
+    resp = _http.get(url, headers=headers, params=final_params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
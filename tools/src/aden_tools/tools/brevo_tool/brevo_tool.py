@@ -15,9 +15,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("brevo")
+
 BREVO_API_BASE = "https://api.brevo.com/v3"
 
 
@@ -71,7 +75,7 @@ def send_email(
         if text_content:
             body["textContent"] = text_content
 
-        response = httpx.post(
+        response = _http.post(
             f"{BREVO_API_BASE}/smtp/email",
             headers=self._headers,
             json=body,
@@ -91,7 +95,7 @@ def send_sms(
             "recipient": to,
             "content": content,
         }
-        response = httpx.post(
+        response = _http.post(
             f"{BREVO_API_BASE}/transactionalSMS/sms",
             headers=self._headers,
             json=body,
@@ -123,7 +127,7 @@ def create_contact(
         if list_ids:
             body["listIds"] = list_ids
 
-        response = httpx.post(
+        response = _http.post(
             f"{BREVO_API_BASE}/contacts",
             headers=self._headers,
             json=body,
@@ -133,7 +137,7 @@ def create_contact(
 
     def get_contact(self, email: str) -> dict[str, Any]:
         """Get a contact by email."""
-        response = httpx.get(
+        response = _http.get(
             f"{BREVO_API_BASE}/contacts/{email}",
             headers=self._headers,
             timeout=30.0,
@@ -161,7 +165,7 @@ def update_contact(
         if list_ids:
             body["listIds"] = list_ids
 
-        response = httpx.put(
+        response = _http.put(
             f"{BREVO_API_BASE}/contacts/{email}",
             headers=self._headers,
             json=body,
@@ -171,7 +175,7 @@ def update_contact(
 
     def get_email_stats(self, message_id: str) -> dict[str, Any]:
         """Get delivery stats for a sent email."""
-        response = httpx.get(
+        response = _http.get(
             f"{BREVO_API_BASE}/smtp/emails/{message_id}",
             headers=self._headers,
             timeout=30.0,
@@ -188,7 +192,7 @@ def list_contacts(
         params: dict[str, Any] = {"limit": limit, "offset": offset}
         if modified_since:
             params["modifiedSince"] = modified_since
-        response = httpx.get(
+        response = _http.get(
             f"{BREVO_API_BASE}/contacts",
             headers=self._headers,
             params=params,
@@ -198,7 +202,7 @@ def list_contacts(
 
     def delete_contact(self, email: str) -> dict[str, Any]:
         """Delete a contact by email."""
-        response = httpx.delete(
+        response = _http.delete(
             f"{BREVO_API_BASE}/contacts/{email}",
             headers=self._headers,
             timeout=30.0,
@@ -215,7 +219,7 @@ def list_email_campaigns(
         params: dict[str, Any] = {"limit": limit, "offset": offset}
         if status:
             params["status"] = status
-        response = httpx.get(
+        response = _http.get(
             f"{BREVO_API_BASE}/emailCampaigns",
             headers=self._headers,
             params=params,
@@ -25,11 +25,15 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from framework.credentials.oauth2 import TokenLifecycleManager
 
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("calendar")
+
 logger = logging.getLogger(__name__)
 
 # Google Calendar API base URL
@@ -222,7 +226,7 @@ def calendar_list_events(
             params["q"] = query
 
         try:
-            response = httpx.get(
+            response = _http.get(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events",
                 headers=_get_headers(),
                 params=params,
@@ -294,7 +298,7 @@ def calendar_get_event(
             return {"error": "event_id is required"}
 
         try:
-            response = httpx.get(
+            response = _http.get(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events/{_encode_id(event_id)}",
                 headers=_get_headers(),
                 timeout=30.0,
@@ -410,7 +414,7 @@ def calendar_create_event(
             params["conferenceDataVersion"] = 1
 
         try:
-            response = httpx.post(
+            response = _http.post(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events",
                 headers=_get_headers(),
                 json=event_body,
@@ -496,7 +500,7 @@ def calendar_update_event(
         if remove_attendees is not None:
             # Fetch current event to get attendee list
             try:
-                get_response = httpx.get(
+                get_response = _http.get(
                     f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events/{_encode_id(event_id)}",
                     headers=_get_headers(),
                     timeout=30.0,
@@ -563,7 +567,7 @@ def calendar_update_event(
             params["conferenceDataVersion"] = 1
 
         try:
-            response = httpx.patch(
+            response = _http.patch(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events/{_encode_id(event_id)}",
                 headers=_get_headers(),
                 json=patch_body,
@@ -611,7 +615,7 @@ def calendar_delete_event(
         params = {"sendUpdates": "all" if send_notifications else "none"}
 
         try:
-            response = httpx.delete(
+            response = _http.delete(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}/events/{_encode_id(event_id)}",
                 headers=_get_headers(),
                 params=params,
@@ -656,7 +660,7 @@ def calendar_list_calendars(
             return {"error": "max_results must be between 1 and 250"}
 
         try:
-            response = httpx.get(
+            response = _http.get(
                 f"{CALENDAR_API_BASE}/users/me/calendarList",
                 headers=_get_headers(),
                 params={"maxResults": max_results},
@@ -718,7 +722,7 @@ def calendar_get_calendar(
             return {"error": "calendar_id is required"}
 
         try:
-            response = httpx.get(
+            response = _http.get(
                 f"{CALENDAR_API_BASE}/calendars/{_encode_id(calendar_id)}",
                 headers=_get_headers(),
                 timeout=30.0,
@@ -871,7 +875,7 @@ def calendar_check_availability(
             }
 
             try:
-                response = httpx.get(
+                response = _http.get(
                     f"{CALENDAR_API_BASE}/calendars/{_encode_id(cal_id)}/events",
                     headers=_get_headers(),
                     params=params,
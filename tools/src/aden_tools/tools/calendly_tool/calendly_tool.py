@@ -9,9 +9,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("calendly")
+
 BASE_URL = "https://api.calendly.com"
 
 
@@ -28,7 +31,7 @@ def _get_headers() -> dict | None:
 
 def _get(path: str, headers: dict, params: dict | None = None) -> dict:
     """Send a GET request."""
-    resp = httpx.get(f"{BASE_URL}{path}", headers=headers, params=params, timeout=30)
+    resp = _http.get(f"{BASE_URL}{path}", headers=headers, params=params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -36,7 +39,7 @@ def _get(path: str, headers: dict, params: dict | None = None) -> dict:
 
 def _post(path: str, headers: dict, body: dict) -> dict:
     """Send a POST request."""
-    resp = httpx.post(f"{BASE_URL}{path}", headers=headers, json=body, timeout=30)
+    resp = _http.post(f"{BASE_URL}{path}", headers=headers, json=body, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     if not resp.content:
@@ -18,9 +18,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("cloudinary")
+
 
 def _get_credentials(
     credentials: CredentialStoreAdapter | None,
@@ -52,7 +56,7 @@ def _request(method: str, url: str, api_key: str, api_secret: str, **kwargs: Any
     headers = kwargs.pop("headers", {})
     headers["Authorization"] = _auth_header(api_key, api_secret)
     try:
-        resp = getattr(httpx, method)(
+        resp = getattr(_http, method)(
             url,
             headers=headers,
             timeout=60.0,
@@ -18,9 +18,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("databricks")
+
 
 def _get_config(credentials: CredentialStoreAdapter | None) -> tuple[str | None, str | None]:
     """Return (token, host)."""
@@ -38,7 +42,7 @@ def _headers(token: str) -> dict[str, str]:
 
 def _get(host: str, endpoint: str, token: str, params: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.get(
+        resp = _http.get(
             f"{host}/api/2.0/{endpoint}", headers=_headers(token), params=params, timeout=30.0
         )
         if resp.status_code == 401:
@@ -56,7 +60,7 @@ def _get(host: str, endpoint: str, token: str, params: dict | None = None) -> di
 
 def _post(host: str, endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.post(
+        resp = _http.post(
             f"{host}/api/2.0/{endpoint}", headers=_headers(token), json=body or {}, timeout=60.0
         )
         if resp.status_code == 401:
@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("discord")
+
 DISCORD_API_BASE = "https://discord.com/api/v10"
 MAX_MESSAGE_LENGTH = 2000  # Discord API limit
 # Channel types: 0 = GUILD_TEXT, 5 = GUILD_ANNOUNCEMENT (both support messages)
@@ -49,7 +53,7 @@ def _request_with_retry(
         """Make HTTP request with retry on 429 rate limit."""
         request_kwargs = {"headers": self._headers, "timeout": 30.0, **kwargs}
         for attempt in range(MAX_RETRIES + 1):
-            response = httpx.request(method, url, **request_kwargs)
+            response = _http.request(method, url, **request_kwargs)
             if response.status_code == 429 and attempt < MAX_RETRIES:
                 try:
                     data = response.json()
@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("docker_hub")
+
 HUB_API = "https://hub.docker.com/v2"
 
 
@@ -35,7 +39,7 @@ def _headers(token: str) -> dict[str, str]:
 
 def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.get(
+        resp = _http.get(
             f"{HUB_API}/{endpoint}", headers=_headers(token), params=params, timeout=30.0
         )
         if resp.status_code == 401:
@@ -53,7 +57,7 @@ def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any
 
 def _delete(endpoint: str, token: str) -> dict[str, Any]:
     try:
-        resp = httpx.delete(f"{HUB_API}/{endpoint}", headers=_headers(token), timeout=30.0)
+        resp = _http.delete(f"{HUB_API}/{endpoint}", headers=_headers(token), timeout=30.0)
         if resp.status_code == 401:
             return {"error": "Unauthorized. Check your DOCKER_HUB_TOKEN."}
         if resp.status_code == 404:
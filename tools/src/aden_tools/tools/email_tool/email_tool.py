@@ -14,9 +14,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("email")
+
 
 def register_tools(
     mcp: FastMCP,
@@ -93,7 +97,7 @@ def _send_via_gmail(
 
         raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("ascii")
 
-        response = httpx.post(
+        response = _http.post(
             "https://gmail.googleapis.com/gmail/v1/users/me/messages/send",
             headers={
                 "Authorization": f"Bearer {access_token}",
@@ -260,7 +264,7 @@ def _fetch_original_message(access_token: str, message_id: str) -> dict:
         """Fetch the original message to extract threading info and body."""
         import base64
 
-        response = httpx.get(
+        response = _http.get(
             f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}",
             headers={
                 "Authorization": f"Bearer {access_token}",
@@ -425,7 +429,7 @@ def gmail_reply_email(
             raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("ascii")
 
         try:
-            response = httpx.post(
+            response = _http.post(
                 "https://gmail.googleapis.com/gmail/v1/users/me/messages/send",
                 headers={
                     "Authorization": f"Bearer {credential}",
@@ -20,9 +20,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("exa_search")
+
 # Exa API base URL
 EXA_API_BASE = "https://api.exa.ai"
 
@@ -56,7 +60,7 @@ def _make_request(
         """
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.post(
+            response = _http.post(
                 f"{EXA_API_BASE}{endpoint}",
                 json=payload,
                 headers={
@@ -6,16 +6,149 @@
 Used in conjunction with the spillover system: when a tool result is too
 large, the framework writes it to a file and the agent can load it back
 with load_data().
+
+Spill files come with a line-offset index (``.<filename>.idx``) written by
+the framework, which lets load_data jump straight to a line.  Layout
+(little-endian): ``b"HIVEIDX1"``, u64 file size, u64 file mtime_ns,
+u64 first record line, u64 record count, then one u64 byte offset per
+line.  Files without a (fresh) index are scanned instead.
 """
 
 from __future__ import annotations
 
+import struct
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
 from aden_tools.credentials.browser import open_browser
 
+_INDEX_MAGIC = b"HIVEIDX1"
+_INDEX_HEADER = struct.Struct("<8sQQQQ")
+_OFFSET = struct.Struct("<Q")
+
+
+class _LineIndex:
+    """Byte offset of each line of a file, read lazily from its index."""
+
+    def __init__(self, path: Path, size: int):
+        self._offsets: list[int] | None = None
+        self._index = None
+        idx_path = path.with_name(f".{path.name}.idx")
+        try:
+            f = open(idx_path, "rb")
+        except OSError:
+            f = None
+        if f is not None:
+            header = f.read(_INDEX_HEADER.size)
+            stat = path.stat()
+            if len(header) == _INDEX_HEADER.size and _INDEX_HEADER.unpack(header)[:3] == (
+                _INDEX_MAGIC,
+                size,
+                stat.st_mtime_ns,
+            ):
+                self._index = f
+                self.total = (idx_path.stat().st_size - _INDEX_HEADER.size) // _OFFSET.size
+                return
+            f.close()
+        # No usable index: scan for newlines
+        offsets = [0] if size else []
+        pos = 0
+        with open(path, "rb") as src:
+            while chunk := src.read(1 << 20):
+                nl = chunk.find(b"\n")
+                while nl != -1:
+                    offsets.append(pos + nl + 1)
+                    nl = chunk.find(b"\n", nl + 1)
+                pos += len(chunk)
+        if len(offsets) > 1 and offsets[-1] == size:
+            offsets.pop()
+        self._offsets = offsets
+        self.total = len(offsets)
+
+    def offset(self, line: int) -> int:
+        """Start of 0-based *line*."""
+        if self._offsets is not None:
+            return self._offsets[line]
+        self._index.seek(_INDEX_HEADER.size + line * _OFFSET.size)
+        return _OFFSET.unpack(self._index.read(_OFFSET.size))[0]
+
+    def close(self) -> None:
+        if self._index is not None:
+            self._index.close()
+
+
+def _decode_prefix(raw: bytes) -> tuple[str, int] | None:
+    """Decode *raw*, dropping up to 4 trailing bytes of a split character."""
+    for i in range(min(4, len(raw)) + 1):
+        try:
+            return raw[: len(raw) - i].decode("utf-8"), len(raw) - i
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def _load_lines(
+    path: Path, filename: str, file_size: int, start_line: int, max_lines: int, limit_bytes: int
+) -> dict:
+    """Return up to *max_lines* lines from 1-based *start_line*, within *limit_bytes*."""
+    index = _LineIndex(path, file_size)
+    try:
+        total = index.total
+        first = start_line - 1
+        if first >= total:
+            return {
+                "success": True,
+                "filename": filename,
+                "content": "",
+                "start_line": start_line,
+                "lines_read": 0,
+                "next_line": total + 1,
+                "total_lines": total,
+                "file_size_bytes": file_size,
+                "has_more": False,
+            }
+
+        def line_start(n: int) -> int:
+            return index.offset(n) if n < total else file_size
+
+        stop = min(first + max(1, max_lines), total)
+        begin = index.offset(first)
+        # Shrink to whole lines within limit_bytes (binary search on offsets)
+        if line_start(stop) - begin > limit_bytes:
+            lo, hi = first + 1, stop
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if line_start(mid) - begin <= limit_bytes:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            stop = lo
+        end = line_start(stop)
+        line_truncated = end - begin > limit_bytes
+        with open(path, "rb") as f:
+            f.seek(begin)
+            raw = f.read(min(end - begin, limit_bytes))
+        decoded = _decode_prefix(raw)
+        if decoded is None:
+            return {"error": "Could not decode file as UTF-8"}
+        result = {
+            "success": True,
+            "filename": filename,
+            "content": decoded[0],
+            "start_line": start_line,
+            "lines_read": stop - first,
+            "next_line": stop + 1,
+            "total_lines": total,
+            "file_size_bytes": file_size,
+            "has_more": stop < total,
+        }
+        if line_truncated:
+            result["line_truncated"] = True
+        return result
+    finally:
+        index.close()
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register data management tools with the MCP server."""
@@ -70,11 +203,13 @@ def load_data(
         data_dir: str,
         offset_bytes: int = 0,
         limit_bytes: int = 10000,
+        start_line: int = 0,
+        max_lines: int = 200,
     ) -> dict:
         """
         Purpose
-            Load data from a previously saved file with byte-based pagination.
-            Efficient for files of any size (1 byte to 1 TB).
+            Load data from a previously saved file with byte-based or line-based
+            pagination. Efficient for files of any size (1 byte to 1 TB).
             Automatically detects safe UTF-8 boundaries to prevent character splitting.
 
         When to use
@@ -87,12 +222,18 @@ def load_data(
             Uses byte offsets for O(1) seeking (works with huge files)
             Automatically trims to valid UTF-8 character boundaries
             Returns exactly limit_bytes or less (rounded to safe boundary)
+            Spilled JSON has one record per line; the spillover message says
+            which lines hold the records, so page them with start_line/max_lines
 
         Args:
             filename: The filename to load (as shown in spillover messages or save_data results).
             data_dir: Absolute path to the data directory.
             offset_bytes: Byte offset to start reading from. Default 0.
             limit_bytes: Max number of bytes to return. Default 10000 (10KB).
+            start_line: 1-based line to start reading from. When set, pages by
+                line instead of by byte and offset_bytes is ignored. Default 0 (off).
+            max_lines: Max number of whole lines to return in line mode
+                (fewer if they exceed limit_bytes). Default 200.
 
         Returns:
             Dict with content, pagination info, and metadata
@@ -101,6 +242,7 @@ def load_data(
             load_data('emails.jsonl', '/data')                           # first 10KB
             load_data('emails.jsonl', '/data', offset_bytes=10000)       # next 10KB
             load_data('large.txt', '/data', limit_bytes=50000)           # first 50KB
+            load_data('web_search_3.txt', '/data', start_line=4, max_lines=50)  # lines 4-53
         """
         if not filename or ".." in filename or "/" in filename or "\\" in filename:
             return {"error": "Invalid filename"}
@@ -116,6 +258,12 @@ def load_data(
 
             file_size = path.stat().st_size
 
+            start_line = int(start_line)
+            if start_line > 0:
+                return _load_lines(
+                    path, filename, file_size, start_line, int(max_lines), limit_bytes
+                )
+
             # Handle edge case: offset beyond file size
             if offset_bytes >= file_size:
                 return {
@@ -253,7 +401,8 @@ def list_data_files(data_dir: str) -> dict:
 
             files = []
             for f in sorted(dir_path.iterdir()):
-                if f.is_file():
+                # Skip hidden files such as spill line indexes
+                if f.is_file() and not f.name.startswith("."):
                     files.append(
                         {
                             "filename": f.name,
@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("github")
+
 GITHUB_API_BASE = "https://api.github.com"
 
 
@@ -123,7 +127,7 @@ def list_repos(
             "per_page": min(limit, 100),
         }
 
-        response = httpx.get(
+        response = _http.get(
             url,
             headers=self._headers,
             params=params,
@@ -139,7 +143,7 @@ def get_repo(
         """Get repository information."""
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}",
             headers=self._headers,
             timeout=30.0,
@@ -160,7 +164,7 @@ def search_repos(
         if sort:
             params["sort"] = sort
 
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/search/repositories",
             headers=self._headers,
             params=params,
@@ -187,7 +191,7 @@ def list_issues(
             "page": max(1, page),
         }
 
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues",
             headers=self._headers,
             params=params,
@@ -204,7 +208,7 @@ def get_issue(
         """Get a specific issue."""
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues/{issue_number}",
             headers=self._headers,
             timeout=30.0,
@@ -231,7 +235,7 @@ def create_issue(
         if assignees:
             payload["assignees"] = assignees
 
-        response = httpx.post(
+        response = _http.post(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues",
             headers=self._headers,
             json=payload,
@@ -262,7 +266,7 @@ def update_issue(
         if labels is not None:
             payload["labels"] = labels
 
-        response = httpx.patch(
+        response = _http.patch(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/issues/{issue_number}",
             headers=self._headers,
             json=payload,
@@ -289,7 +293,7 @@ def list_pull_requests(
             "page": max(1, page),
         }
 
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls",
             headers=self._headers,
             params=params,
@@ -306,7 +310,7 @@ def get_pull_request(
         """Get a specific pull request."""
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls/{pull_number}",
             headers=self._headers,
             timeout=30.0,
@@ -335,7 +339,7 @@ def create_pull_request(
         if body:
             payload["body"] = body
 
-        response = httpx.post(
+        response = _http.post(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/pulls",
             headers=self._headers,
             json=payload,
@@ -356,7 +360,7 @@ def search_code(
             "per_page": min(limit, 100),
         }
 
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/search/code",
             headers=self._headers,
             params=params,
@@ -379,7 +383,7 @@ def list_branches(
             "per_page": min(limit, 100),
         }
 
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/branches",
             headers=self._headers,
             params=params,
@@ -397,7 +401,7 @@ def get_branch(
         owner = _sanitize_path_param(owner, "owner")
         repo = _sanitize_path_param(repo, "repo")
         branch = _sanitize_path_param(branch, "branch")
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/branches/{branch}",
             headers=self._headers,
             timeout=30.0,
@@ -421,7 +425,7 @@ def list_stargazers(
             "page": max(1, page),
         }
 
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/stargazers",
             headers=self._headers,
             params=params,
@@ -437,7 +441,7 @@ def get_user_profile(
     ) -> dict[str, Any]:
         """Get a user's public profile."""
         username = _sanitize_path_param(username, "username")
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/users/{username}",
             headers=self._headers,
             timeout=30.0,
@@ -465,7 +469,7 @@ def get_user_emails(
                 emails[profile["email"]] = "profile"
 
         # 2. Check recent public events for commit emails
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/users/{username}/events/public",
             headers=self._headers,
             params={"per_page": 30},
@@ -515,7 +519,7 @@ def list_commits(
         if until:
             params["until"] = until
 
-        response = httpx.get(
+        response = _http.get(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits",
             headers=self._headers,
             params=params,
@@ -554,7 +558,7 @@ def create_release(
         if target_commitish:
             payload["target_commitish"] = target_commitish
 
-        response = httpx.post(
+        response = _http.post(
             f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases",
             headers=self._headers,
             json=payload,
@@ -590,7 +594,7 @@ def list_workflow_runs(
         else:
             url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/actions/runs"
 
-        response = httpx.get(
+        response = _http.get(
             url,
             headers=self._headers,
             params=params,
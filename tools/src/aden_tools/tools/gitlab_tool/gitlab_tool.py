@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("gitlab")
+
 DEFAULT_URL = "https://gitlab.com"
 
 
@@ -39,7 +43,7 @@ def _get(
 ) -> dict[str, Any] | list:
     """Make an authenticated GET to the GitLab API."""
     try:
-        resp = httpx.get(
+        resp = _http.get(
             f"{base_url}/api/v4{path}",
             headers={"PRIVATE-TOKEN": token},
             params=params or {},
@@ -67,7 +71,7 @@ def _post(
 ) -> dict[str, Any] | list:
     """Make an authenticated POST to the GitLab API."""
     try:
-        resp = httpx.post(
+        resp = _http.post(
             f"{base_url}/api/v4{path}",
             headers={"PRIVATE-TOKEN": token, "Content-Type": "application/json"},
             json=json or {},
@@ -91,7 +95,7 @@ def _put(
 ) -> dict[str, Any] | list:
     """Make an authenticated PUT to the GitLab API."""
     try:
-        resp = httpx.put(
+        resp = _http.put(
             f"{base_url}/api/v4{path}",
             headers={"PRIVATE-TOKEN": token, "Content-Type": "application/json"},
             json=json or {},
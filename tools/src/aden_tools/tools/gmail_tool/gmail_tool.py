@@ -21,9 +21,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("gmail")
+
 GMAIL_API_BASE = "https://gmail.googleapis.com/gmail/v1/users/me"
 
 
@@ -64,7 +68,7 @@ def _gmail_request(
         method: str, path: str, access_token: str, **kwargs: object
     ) -> httpx.Response:
         """Make an authenticated Gmail API request."""
-        return httpx.request(
+        return _http.request(
             method,
             f"{GMAIL_API_BASE}/{path}",
             headers={
@@ -24,9 +24,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("google_docs")
+
 GOOGLE_DOCS_API_BASE = "https://docs.googleapis.com/v1"
 GOOGLE_DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
 # Allowed URL schemes for image insertion
@@ -134,7 +138,7 @@ def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
 
     def create_document(self, title: str) -> dict[str, Any]:
         """Create a new blank document with a specified title."""
-        response = httpx.post(
+        response = _http.post(
             f"{GOOGLE_DOCS_API_BASE}/documents",
             headers=self._headers,
             json={"title": title},
@@ -144,7 +148,7 @@ def create_document(self, title: str) -> dict[str, Any]:
 
     def get_document(self, document_id: str) -> dict[str, Any]:
         """Retrieve the full structural content, metadata, and elements of a document."""
-        response = httpx.get(
+        response = _http.get(
             f"{GOOGLE_DOCS_API_BASE}/documents/{document_id}",
             headers=self._headers,
             timeout=30.0,
@@ -153,7 +157,7 @@ def get_document(self, document_id: str) -> dict[str, Any]:
 
     def batch_update(self, document_id: str, requests: list[dict[str, Any]]) -> dict[str, Any]:
         """Execute multiple requests in a single atomic operation."""
-        response = httpx.post(
+        response = _http.post(
             f"{GOOGLE_DOCS_API_BASE}/documents/{document_id}:batchUpdate",
             headers=self._headers,
             json={"requests": requests},
@@ -317,7 +321,7 @@ def add_comment(
         if quoted_text:
             body["quotedFileContent"] = {"value": quoted_text}
 
-        response = httpx.post(
+        response = _http.post(
             f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/comments",
             headers=self._headers,
             params={"fields": "*"},
@@ -342,7 +346,7 @@ def list_comments(
         if page_token:
             params["pageToken"] = page_token
 
-        response = httpx.get(
+        response = _http.get(
             f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/comments",
             headers=self._headers,
             params=params,
@@ -356,7 +360,7 @@ def export_document(
         mime_type: str = "application/pdf",
     ) -> dict[str, Any]:
         """Export the document to different formats (PDF, DOCX, TXT)."""
-        response = httpx.get(
+        response = _http.get(
             f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/export",
             headers=self._headers,
             params={"mimeType": mime_type},
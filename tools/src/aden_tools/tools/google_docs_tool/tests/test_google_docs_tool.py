@@ -13,6 +13,8 @@
 
 from aden_tools.tools.google_docs_tool import register_tools
 
+PATCH_BASE = "aden_tools.tools.google_docs_tool.google_docs_tool"
+
 
 @pytest.fixture
 def mcp():
@@ -49,7 +51,7 @@ def test_no_credentials_returns_error(self, mcp):
             assert "not configured" in result["error"]
             assert "help" in result
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_create_document_success(self, mock_post, mcp_with_credentials):
         """Test successful document creation."""
         mock_response = MagicMock()
@@ -68,7 +70,7 @@ def test_create_document_success(self, mock_post, mcp_with_credentials):
         assert "document_url" in result
         assert "doc123" in result["document_url"]
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_create_document_unauthorized(self, mock_post, mcp_with_credentials):
         """Test handling of 401 unauthorized response."""
         mock_response = MagicMock()
@@ -85,7 +87,7 @@ def test_create_document_unauthorized(self, mock_post, mcp_with_credentials):
 class TestGoogleDocsGetDocument:
     """Tests for google_docs_get_document tool."""
 
-    @patch("httpx.get")
+    @patch(f"{PATCH_BASE}._http.get")
     def test_get_document_success(self, mock_get, mcp_with_credentials):
         """Test successful document retrieval."""
         mock_response = MagicMock()
@@ -103,7 +105,7 @@ def test_get_document_success(self, mock_get, mcp_with_credentials):
         assert result["documentId"] == "doc123"
         assert result["title"] == "Test Document"
 
-    @patch("httpx.get")
+    @patch(f"{PATCH_BASE}._http.get")
     def test_get_document_not_found(self, mock_get, mcp_with_credentials):
         """Test handling of 404 not found response."""
         mock_response = MagicMock()
@@ -120,7 +122,7 @@ def test_get_document_not_found(self, mock_get, mcp_with_credentials):
 class TestGoogleDocsReplaceAllText:
     """Tests for google_docs_replace_all_text tool."""
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_replace_all_text_success(self, mock_post, mcp_with_credentials):
         """Test successful find and replace."""
         mock_response = MagicMock()
@@ -145,8 +147,8 @@ def test_replace_all_text_success(self, mock_post, mcp_with_credentials):
 class TestGoogleDocsInsertText:
     """Tests for google_docs_insert_text tool."""
 
-    @patch("httpx.post")
-    @patch("httpx.get")
+    @patch(f"{PATCH_BASE}._http.post")
+    @patch(f"{PATCH_BASE}._http.get")
     def test_insert_text_at_end(self, mock_get, mock_post, mcp_with_credentials):
         """Test inserting text at the end of document."""
         # Mock get document for finding end index
@@ -166,7 +168,7 @@ def test_insert_text_at_end(self, mock_get, mock_post, mcp_with_credentials):
 
         assert "error" not in result
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_insert_text_at_index(self, mock_post, mcp_with_credentials):
         """Test inserting text at a specific index."""
         mock_response = MagicMock()
@@ -183,7 +185,7 @@ def test_insert_text_at_index(self, mock_post, mcp_with_credentials):
 class TestGoogleDocsFormatText:
     """Tests for google_docs_format_text tool."""
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_format_text_bold(self, mock_post, mcp_with_credentials):
         """Test applying bold formatting."""
         mock_response = MagicMock()
@@ -217,7 +219,7 @@ def test_format_text_no_options(self, mcp_with_credentials):
 class TestGoogleDocsBatchUpdate:
     """Tests for google_docs_batch_update tool."""
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_batch_update_success(self, mock_post, mcp_with_credentials):
         """Test successful batch update."""
         mock_response = MagicMock()
@@ -256,7 +258,7 @@ def test_batch_update_not_array(self, mcp_with_credentials):
 class TestGoogleDocsExport:
     """Tests for google_docs_export_content tool."""
 
-    @patch("httpx.get")
+    @patch(f"{PATCH_BASE}._http.get")
     def test_export_to_pdf(self, mock_get, mcp_with_credentials):
         """Test exporting document to PDF."""
         mock_response = MagicMock()
@@ -272,7 +274,7 @@ def test_export_to_pdf(self, mock_get, mcp_with_credentials):
         assert "content_base64" in result
         assert result["size_bytes"] == len(b"PDF content here")
 
-    @patch("httpx.get")
+    @patch(f"{PATCH_BASE}._http.get")
     def test_export_to_docx(self, mock_get, mcp_with_credentials):
         """Test exporting document to DOCX."""
         mock_response = MagicMock()
@@ -289,7 +291,7 @@ def test_export_to_docx(self, mock_get, mcp_with_credentials):
 class TestGoogleDocsCreateList:
     """Tests for google_docs_create_list tool."""
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_create_bullet_list(self, mock_post, mcp_with_credentials):
         """Test creating a bullet list."""
         mock_response = MagicMock()
@@ -307,7 +309,7 @@ def test_create_bullet_list(self, mock_post, mcp_with_credentials):
 
         assert "error" not in result
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_create_numbered_list(self, mock_post, mcp_with_credentials):
         """Test creating a numbered list."""
         mock_response = MagicMock()
@@ -329,7 +331,7 @@ def test_create_numbered_list(self, mock_post, mcp_with_credentials):
 class TestGoogleDocsAddComment:
     """Tests for google_docs_add_comment tool."""
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_add_comment_success(self, mock_post, mcp_with_credentials):
         """Test adding a comment to a document."""
         mock_response = MagicMock()
@@ -353,7 +355,7 @@ def test_add_comment_success(self, mock_post, mcp_with_credentials):
 class TestImageUriValidation:
     """Tests for image URI validation."""
 
-    @patch("httpx.post")
+    @patch(f"{PATCH_BASE}._http.post")
     def test_insert_image_valid_https_uri(self, mock_post, mcp_with_credentials):
         """Test that valid HTTPS URIs are accepted."""
         mock_response = MagicMock()
@@ -437,7 +439,7 @@ def test_replace_all_text_empty_find_text(self, mcp_with_credentials):
 class TestGoogleDocsListComments:
     """Tests for google_docs_list_comments tool."""
 
-    @patch("httpx.get")
+    @patch(f"{PATCH_BASE}._http.get")
     def test_list_comments_success(self, mock_get, mcp_with_credentials):
         """Test retrieving comments with pagination token."""
         mock_response = MagicMock()
@@ -456,7 +458,7 @@ def test_list_comments_success(self, mock_get, mcp_with_credentials):
         assert result["comments"][0]["id"] == "comment123"
         assert result["next_page_token"] == "next-token"
 
-    @patch("httpx.get")
+    @patch(f"{PATCH_BASE}._http.get")
     def test_list_comments_not_found(self, mock_get, mcp_with_credentials):
         """Test handling a missing document for comment retrieval."""
         mock_response = MagicMock()
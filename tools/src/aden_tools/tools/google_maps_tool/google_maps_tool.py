@@ -20,9 +20,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("google_maps")
+
 # Google Maps API base URLs
 _GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 _DIRECTIONS_URL = "https://maps.googleapis.com/maps/api/directions/json"
@@ -51,7 +55,7 @@ def __init__(self, api_key: str):
     def get(self, url: str, params: dict) -> httpx.Response:
         """Execute a GET request with API key authentication."""
         params["key"] = self._api_key
-        return httpx.get(url, params=params, timeout=_REQUEST_TIMEOUT)
+        return _http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
 
     def handle_status(self, api_status: str, error_message: str = "") -> dict | None:
         """Check API-level status and return error dict if not OK.
@@ -18,9 +18,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("google_search_console")
+
 GSC_API = "https://www.googleapis.com/webmasters/v3"
 INSPECTION_API = "https://searchconsole.googleapis.com/v1"
 
@@ -37,7 +41,7 @@ def _headers(token: str) -> dict[str, str]:
 
 def _get(endpoint: str, token: str, base: str = GSC_API) -> dict[str, Any]:
     try:
-        resp = httpx.get(f"{base}/{endpoint}", headers=_headers(token), timeout=30.0)
+        resp = _http.get(f"{base}/{endpoint}", headers=_headers(token), timeout=30.0)
         if resp.status_code == 401:
             return {"error": "Unauthorized. Check your GOOGLE_SEARCH_CONSOLE_TOKEN."}
         if resp.status_code == 403:
@@ -55,7 +59,7 @@ def _post(
     endpoint: str, token: str, body: dict | None = None, base: str = GSC_API
 ) -> dict[str, Any]:
     try:
-        resp = httpx.post(
+        resp = _http.post(
             f"{base}/{endpoint}", headers=_headers(token), json=body or {}, timeout=30.0
         )
         if resp.status_code == 401:
@@ -277,7 +281,7 @@ def gsc_submit_sitemap(
         encoded_site = _encode_site(site_url)
         encoded_sitemap = _encode_site(sitemap_url)
         try:
-            resp = httpx.put(
+            resp = _http.put(
                 f"{GSC_API}/sites/{encoded_site}/sitemaps/{encoded_sitemap}",
                 headers=_headers(token),
                 timeout=30.0,
@@ -429,7 +433,7 @@ def gsc_delete_sitemap(
         encoded_site = _encode_site(site_url)
         encoded_sitemap = _encode_site(sitemap_url)
         try:
-            resp = httpx.delete(
+            resp = _http.delete(
                 f"{GSC_API}/sites/{encoded_site}/sitemaps/{encoded_sitemap}",
                 headers=_headers(token),
                 timeout=30.0,
@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("google_sheets")
+
 GOOGLE_SHEETS_API_BASE = "https://sheets.googleapis.com/v4/spreadsheets"
 
 
@@ -64,7 +68,7 @@ def get_spreadsheet(
         if include_grid_data:
             params["includeGridData"] = "true"
 
-        response = httpx.get(
+        response = _http.get(
             f"{GOOGLE_SHEETS_API_BASE}/{spreadsheet_id}",
             headers=self._headers,
             params=params,
@@ -85,7 +89,7 @@ def create_spreadsheet(
                 {"properties": {"title": sheet_title}} for sheet_title in sheet_titles
             ]
 
-        response = httpx.post(
+        response = _http.post(
             GOOGLE_SHEETS_API_BASE,
             headers=self._headers,
             json=body,
@@ -102,7 +106,7 @@ def get_values(
         """Get values from a range."""
         params = {"valueRenderOption": value_render_option}
 
-        response = httpx.get(
+        response = _http.get(
             f"{GOOGLE_SHEETS_API_BASE}/{spreadsheet_id}/values/{range_name}",
             headers=self._headers,
             params=params,
@@ -121,7 +125,7 @@ def update_values(
         params = {"valueInputOption": value_input_option}
         body = {"values": values}
 
-        response = httpx.put(
+        response = _http.put(
             f"{GOOGLE_SHEETS_API_BASE}/{spreadsheet_id}/values/{range_name}",
             headers=self._headers,
             params=params,
@@ -141,7 +145,7 @@ def append_values(
         params = {"valueInputOption": value_input_option}
         body = {"values": values}
 
-        response = httpx.post(
+        response = _http.post(
             f"{GOOGLE_SHEETS_API_BASE}/{spreadsheet_id}/values/{range_name}:append",
             headers=self._headers,
             params=params,
@@ -156,7 +160,7 @@ def clear_values(
         range_name: str,
     ) -> dict[str, Any]:
         """Clear values in a range."""
-        response = httpx.post(
+        response = _http.post(
             f"{GOOGLE_SHEETS_API_BASE}/{spreadsheet_id}/values/{range_name}:clear",
             headers=self._headers,
             timeout=30.0,
@@ -175,7 +179,7 @@ def batch_update_values(
             "data": data,
         }
 
-        response = httpx.post(
+        response = _http.post(
             f"{GOOGLE_SHEETS_API_BASE}/{spreadsheet_id}/values:batchUpdate",
             headers=self._headers,
             json=body,
@@ -191,7 +195,7 @@ def batch_clear_values(
         """Batch clear multiple ranges."""
         body = {"ranges": ranges}
 
-        response = httpx.post(
+        response = _http.post(
             f"{GOOGLE_SHEETS_API_BASE}/{spreadsheet_id}/values:batchClear",
             headers=self._headers,
             json=body,
@@ -223,7 +227,7 @@ def add_sheet(
             ]
         }
 
-        response = httpx.post(
+        response = _http.post(
             f"{GOOGLE_SHEETS_API_BASE}/{spreadsheet_id}:batchUpdate",
             headers=self._headers,
             json=body,
@@ -239,7 +243,7 @@ def delete_sheet(
         """Delete a sheet from a spreadsheet."""
         body = {"requests": [{"deleteSheet": {"sheetId": sheet_id}}]}
 
-        response = httpx.post(
+        response = _http.post(
             f"{GOOGLE_SHEETS_API_BASE}/{spreadsheet_id}:batchUpdate",
             headers=self._headers,
             json=body,
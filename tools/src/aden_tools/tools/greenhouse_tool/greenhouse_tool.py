@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("greenhouse")
+
 API_BASE = "https://harvest.greenhouse.io/v1"
 
 
@@ -38,7 +42,7 @@ def _auth_header(token: str) -> str:
 def _get(path: str, token: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list:
     """Make an authenticated GET to the Greenhouse Harvest API."""
     try:
-        resp = httpx.get(
+        resp = _http.get(
             f"{API_BASE}{path}",
             headers={"Authorization": _auth_header(token)},
             params=params or {},
@@ -64,7 +68,7 @@ def _get(path: str, token: str, params: dict[str, Any] | None = None) -> dict[st
 def _post(path: str, token: str, body: dict[str, Any]) -> dict[str, Any]:
     """Make an authenticated POST to the Greenhouse Harvest API."""
     try:
-        resp = httpx.post(
+        resp = _http.post(
             f"{API_BASE}{path}",
             headers={
                 "Authorization": _auth_header(token),
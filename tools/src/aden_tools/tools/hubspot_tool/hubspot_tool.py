@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("hubspot")
+
 HUBSPOT_API_BASE = "https://api.hubapi.com"
 
 
@@ -68,7 +72,7 @@ def search_objects(
         if properties:
             body["properties"] = properties
 
-        response = httpx.post(
+        response = _http.post(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}/search",
             headers=self._headers,
             json=body,
@@ -87,7 +91,7 @@ def get_object(
         if properties:
             params["properties"] = ",".join(properties)
 
-        response = httpx.get(
+        response = _http.get(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}/{object_id}",
             headers=self._headers,
             params=params,
@@ -101,7 +105,7 @@ def create_object(
         properties: dict[str, str],
     ) -> dict[str, Any]:
         """Create a CRM object."""
-        response = httpx.post(
+        response = _http.post(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}",
             headers=self._headers,
             json={"properties": properties},
@@ -116,7 +120,7 @@ def update_object(
         properties: dict[str, str],
     ) -> dict[str, Any]:
         """Update a CRM object."""
-        response = httpx.patch(
+        response = _http.patch(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}/{object_id}",
             headers=self._headers,
             json={"properties": properties},
@@ -133,7 +137,7 @@ def delete_object(
 
         API ref: DELETE /crm/v3/objects/{objectType}/{objectId}
         """
-        response = httpx.delete(
+        response = _http.delete(
             f"{HUBSPOT_API_BASE}/crm/v3/objects/{object_type}/{object_id}",
             headers=self._headers,
             timeout=30.0,
@@ -154,7 +158,7 @@ def list_associations(
         API ref: GET /crm/v4/objects/{fromObjectType}/{fromObjectId}/associations/{toObjectType}
         """
         params: dict[str, Any] = {"limit": min(limit, 500)}
-        response = httpx.get(
+        response = _http.get(
             f"{HUBSPOT_API_BASE}/crm/v4/objects/{from_object_type}/{from_object_id}/associations/{to_object_type}",
             headers=self._headers,
             params=params,
@@ -182,7 +186,7 @@ def create_association(
                 "associationTypeId": association_type_id,
             }
         ]
-        response = httpx.put(
+        response = _http.put(
             f"{HUBSPOT_API_BASE}/crm/v4/objects/{from_object_type}/{from_object_id}/associations/{to_object_type}/{to_object_id}",
             headers=self._headers,
             json=body,
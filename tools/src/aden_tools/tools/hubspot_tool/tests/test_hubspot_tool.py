@@ -64,7 +64,7 @@ def test_handle_response_generic_error(self):
         assert "error" in result
         assert "500" in result["error"]
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_search_objects(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -84,7 +84,7 @@ def test_search_objects(self, mock_post):
         )
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_search_objects_no_query(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -97,7 +97,7 @@ def test_search_objects_no_query(self, mock_post):
         assert "query" not in call_json
         assert call_json["limit"] == 10
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_search_objects_limit_capped(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -109,7 +109,7 @@ def test_search_objects_limit_capped(self, mock_post):
         call_json = mock_post.call_args.kwargs["json"]
         assert call_json["limit"] == 100
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.get")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.get")
     def test_get_object(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -126,7 +126,7 @@ def test_get_object(self, mock_get):
         )
         assert result["id"] == "123"
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.get")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.get")
     def test_get_object_no_properties(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -137,7 +137,7 @@ def test_get_object_no_properties(self, mock_get):
 
         assert mock_get.call_args.kwargs["params"] == {}
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_create_object(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -159,7 +159,7 @@ def test_create_object(self, mock_post):
         )
         assert result["id"] == "456"
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.patch")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.patch")
     def test_update_object(self, mock_patch):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -221,7 +221,7 @@ def test_credentials_from_credential_manager(self):
 
         search_fn = next(fn for fn in registered_fns if fn.__name__ == "hubspot_search_contacts")
 
-        with patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post") as mock_post:
+        with patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"total": 0, "results": []}
@@ -243,7 +243,7 @@ def test_credentials_from_env_var(self):
 
         with (
             patch.dict("os.environ", {"HUBSPOT_ACCESS_TOKEN": "env-token"}),
-            patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post") as mock_post,
         ):
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -273,7 +273,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_search_contacts(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"total": 1, "results": [{"id": "1"}]})
@@ -281,13 +281,13 @@ def test_search_contacts(self, mock_post):
         result = self._fn("hubspot_search_contacts")(query="john")
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.get")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.get")
     def test_get_contact(self, mock_get):
         mock_get.return_value = MagicMock(status_code=200, json=MagicMock(return_value={"id": "1"}))
         result = self._fn("hubspot_get_contact")(contact_id="1")
         assert result["id"] == "1"
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_create_contact(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=201, json=MagicMock(return_value={"id": "2"})
@@ -295,7 +295,7 @@ def test_create_contact(self, mock_post):
         result = self._fn("hubspot_create_contact")(properties={"email": "a@b.com"})
         assert result["id"] == "2"
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.patch")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.patch")
     def test_update_contact(self, mock_patch):
         mock_patch.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"id": "1"})
@@ -303,14 +303,14 @@ def test_update_contact(self, mock_patch):
         result = self._fn("hubspot_update_contact")(contact_id="1", properties={"phone": "123"})
         assert result["id"] == "1"
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_search_contacts_timeout(self, mock_post):
         mock_post.side_effect = httpx.TimeoutException("timed out")
         result = self._fn("hubspot_search_contacts")(query="test")
         assert "error" in result
         assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.get")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.get")
     def test_get_contact_network_error(self, mock_get):
         mock_get.side_effect = httpx.RequestError("connection failed")
         result = self._fn("hubspot_get_contact")(contact_id="1")
@@ -330,7 +330,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_search_companies(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"total": 2, "results": []})
@@ -338,7 +338,7 @@ def test_search_companies(self, mock_post):
         result = self._fn("hubspot_search_companies")(query="acme")
         assert result["total"] == 2
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.get")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.get")
     def test_get_company(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"id": "10"})
@@ -346,7 +346,7 @@ def test_get_company(self, mock_get):
         result = self._fn("hubspot_get_company")(company_id="10")
         assert result["id"] == "10"
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_create_company(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=201, json=MagicMock(return_value={"id": "11"})
@@ -354,7 +354,7 @@ def test_create_company(self, mock_post):
         result = self._fn("hubspot_create_company")(properties={"name": "Acme"})
         assert result["id"] == "11"
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.patch")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.patch")
     def test_update_company(self, mock_patch):
         mock_patch.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"id": "10"})
@@ -377,7 +377,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_search_deals(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"total": 3, "results": []})
@@ -385,7 +385,7 @@ def test_search_deals(self, mock_post):
         result = self._fn("hubspot_search_deals")(query="big deal")
         assert result["total"] == 3
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.get")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.get")
     def test_get_deal(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"id": "20"})
@@ -393,7 +393,7 @@ def test_get_deal(self, mock_get):
         result = self._fn("hubspot_get_deal")(deal_id="20")
         assert result["id"] == "20"
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.post")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.post")
     def test_create_deal(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=201, json=MagicMock(return_value={"id": "21"})
@@ -401,7 +401,7 @@ def test_create_deal(self, mock_post):
         result = self._fn("hubspot_create_deal")(properties={"dealname": "New Deal"})
         assert result["id"] == "21"
 
-    @patch("aden_tools.tools.hubspot_tool.hubspot_tool.httpx.patch")
+    @patch("aden_tools.tools.hubspot_tool.hubspot_tool._http.patch")
     def test_update_deal(self, mock_patch):
         mock_patch.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"id": "20"})
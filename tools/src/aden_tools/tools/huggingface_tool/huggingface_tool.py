@@ -22,9 +22,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("huggingface")
+
 BASE_URL = "https://huggingface.co/api"
 INFERENCE_URL = "https://api-inference.huggingface.co/models"
 
@@ -43,7 +47,7 @@ def _get(
     if token:
         headers["Authorization"] = f"Bearer {token}"
     try:
-        resp = httpx.get(
+        resp = _http.get(
             f"{BASE_URL}{path}",
             headers=headers,
             params=params or {},
@@ -73,7 +77,7 @@ def _post(
     if token:
         headers["Authorization"] = f"Bearer {token}"
     try:
-        resp = httpx.post(
+        resp = _http.post(
             url,
             headers=headers,
             json=payload,
@@ -502,7 +506,7 @@ def huggingface_list_inference_endpoints(
         headers: dict[str, str] = {"Authorization": f"Bearer {token}"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"https://api.endpoints.huggingface.cloud{path}",
                 headers=headers,
                 timeout=30.0,
@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("intercom")
+
 INTERCOM_API_BASE = "https://api.intercom.io"
 
 
@@ -62,7 +66,7 @@ def _get_admin_id(self) -> str | dict[str, Any]:
         """Get the current admin ID, fetching from /me on first call."""
         if self._admin_id is not None:
             return self._admin_id
-        response = httpx.get(
+        response = _http.get(
             f"{INTERCOM_API_BASE}/me",
             headers=self._headers,
             timeout=30.0,
@@ -80,7 +84,7 @@ def search_conversations(self, query: dict[str, Any], limit: int = 20) -> dict[s
             "query": query,
             "pagination": {"per_page": min(limit, 150)},
         }
-        response = httpx.post(
+        response = _http.post(
             f"{INTERCOM_API_BASE}/conversations/search",
             headers=self._headers,
             json=body,
@@ -90,7 +94,7 @@ def search_conversations(self, query: dict[str, Any], limit: int = 20) -> dict[s
 
     def get_conversation(self, conversation_id: str) -> dict[str, Any]:
         """Get a single conversation by ID with plaintext message bodies."""
-        response = httpx.get(
+        response = _http.get(
             f"{INTERCOM_API_BASE}/conversations/{conversation_id}",
             headers=self._headers,
             params={"display_as": "plaintext"},
@@ -100,7 +104,7 @@ def get_conversation(self, conversation_id: str) -> dict[str, Any]:
 
     def get_contact(self, contact_id: str) -> dict[str, Any]:
         """Get a single contact by ID."""
-        response = httpx.get(
+        response = _http.get(
             f"{INTERCOM_API_BASE}/contacts/{contact_id}",
             headers=self._headers,
             timeout=30.0,
@@ -113,7 +117,7 @@ def search_contacts(self, query: dict[str, Any], limit: int = 50) -> dict[str, A
             "query": query,
             "pagination": {"per_page": min(limit, 150)},
         }
-        response = httpx.post(
+        response = _http.post(
             f"{INTERCOM_API_BASE}/contacts/search",
             headers=self._headers,
             json=body,
@@ -123,7 +127,7 @@ def search_contacts(self, query: dict[str, Any], limit: int = 50) -> dict[str, A
 
     def list_teams(self) -> dict[str, Any]:
         """List all teams in the workspace."""
-        response = httpx.get(
+        response = _http.get(
             f"{INTERCOM_API_BASE}/teams",
             headers=self._headers,
             timeout=30.0,
@@ -132,7 +136,7 @@ def list_teams(self) -> dict[str, Any]:
 
     def list_tags(self) -> dict[str, Any]:
         """List all tags in the workspace."""
-        response = httpx.get(
+        response = _http.get(
             f"{INTERCOM_API_BASE}/tags",
             headers=self._headers,
             timeout=30.0,
@@ -157,7 +161,7 @@ def reply_to_conversation(
             "message_type": message_type,
             "body": body,
         }
-        response = httpx.post(
+        response = _http.post(
             f"{INTERCOM_API_BASE}/conversations/{conversation_id}/reply",
             headers=self._headers,
             json=payload,
@@ -184,7 +188,7 @@ def assign_conversation(
             "message_type": "assignment",
             "body": body,
         }
-        response = httpx.post(
+        response = _http.post(
             f"{INTERCOM_API_BASE}/conversations/{conversation_id}/parts",
             headers=self._headers,
             json=payload,
@@ -194,7 +198,7 @@ def assign_conversation(
 
     def create_or_get_tag(self, name: str) -> dict[str, Any]:
         """Create a tag or return existing tag with the same name."""
-        response = httpx.post(
+        response = _http.post(
             f"{INTERCOM_API_BASE}/tags",
             headers=self._headers,
             json={"name": name},
@@ -211,7 +215,7 @@ def tag_conversation(
         admin_id = self._get_admin_id()
         if isinstance(admin_id, dict):
             return admin_id
-        response = httpx.post(
+        response = _http.post(
             f"{INTERCOM_API_BASE}/conversations/{conversation_id}/tags",
             headers=self._headers,
             json={"id": tag_id, "admin_id": admin_id},
@@ -225,7 +229,7 @@ def tag_contact(
         tag_id: str,
     ) -> dict[str, Any]:
         """Attach a tag to a contact."""
-        response = httpx.post(
+        response = _http.post(
             f"{INTERCOM_API_BASE}/contacts/{contact_id}/tags",
             headers=self._headers,
             json={"id": tag_id},
@@ -245,7 +249,7 @@ def close_conversation(self, conversation_id: str, body: str = "") -> dict[str,
         }
         if body:
             payload["body"] = body
-        response = httpx.post(
+        response = _http.post(
             f"{INTERCOM_API_BASE}/conversations/{conversation_id}/parts",
             headers=self._headers,
             json=payload,
@@ -271,7 +275,7 @@ def create_contact(
             payload["phone"] = phone
         if external_id:
             payload["external_id"] = external_id
-        response = httpx.post(
+        response = _http.post(
             f"{INTERCOM_API_BASE}/contacts",
             headers=self._headers,
             json=payload,
@@ -288,7 +292,7 @@ def list_conversations(
         params: dict[str, Any] = {"per_page": min(limit, 150), "display_as": "plaintext"}
         if starting_after:
             params["starting_after"] = starting_after
-        response = httpx.get(
+        response = _http.get(
             f"{INTERCOM_API_BASE}/conversations",
             headers=self._headers,
             params=params,
@@ -92,7 +92,7 @@ class TestGetAdminId:
     def setup_method(self):
         self.client = _IntercomClient("test-token")
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_fetches_admin_id(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -108,7 +108,7 @@ def test_fetches_admin_id(self, mock_get):
             timeout=30.0,
         )
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_caches_admin_id(self, mock_get):
         """Second call should use cached value, not hit API again."""
         mock_response = MagicMock()
@@ -122,7 +122,7 @@ def test_caches_admin_id(self, mock_get):
         # Should only call the API once
         mock_get.assert_called_once()
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_returns_error_on_failure(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 401
@@ -138,7 +138,7 @@ class TestListTeams:
     def setup_method(self):
         self.client = _IntercomClient("test-token")
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_list_teams_success(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -163,7 +163,7 @@ class TestListTags:
     def setup_method(self):
         self.client = _IntercomClient("test-token")
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_list_tags_success(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -188,7 +188,7 @@ class TestSearchContacts:
     def setup_method(self):
         self.client = _IntercomClient("test-token")
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_search_contacts(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -215,7 +215,7 @@ class TestGetContact:
     def setup_method(self):
         self.client = _IntercomClient("test-token")
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_get_contact_success(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -241,7 +241,7 @@ class TestGetConversation:
     def setup_method(self):
         self.client = _IntercomClient("test-token")
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_get_conversation_success(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -268,7 +268,7 @@ class TestSearchConversations:
     def setup_method(self):
         self.client = _IntercomClient("test-token")
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_search_conversations_success(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -296,7 +296,7 @@ def setup_method(self):
         self.client = _IntercomClient("test-token")
         self.client._admin_id = "admin-1"  # pre-cache to avoid mocking /me
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_reply_success(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -322,7 +322,7 @@ def test_reply_success(self, mock_post):
         )
         assert result["type"] == "conversation"
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_reply_returns_error_when_admin_id_fails(self, mock_get):
         client = _IntercomClient("bad-token")
         mock_response = MagicMock()
@@ -339,7 +339,7 @@ def setup_method(self):
         self.client = _IntercomClient("test-token")
         self.client._admin_id = "admin-1"
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_assign_success(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -363,7 +363,7 @@ def test_assign_success(self, mock_post):
         )
         assert result["type"] == "conversation"
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_assign_with_team_type(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -394,7 +394,7 @@ class TestCreateOrGetTag:
     def setup_method(self):
         self.client = _IntercomClient("test-token")
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_create_tag_success(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -418,7 +418,7 @@ def setup_method(self):
         self.client = _IntercomClient("test-token")
         self.client._admin_id = "admin-1"
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_tag_conversation_success(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -440,7 +440,7 @@ class TestTagContact:
     def setup_method(self):
         self.client = _IntercomClient("test-token")
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_tag_contact_success(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -494,7 +494,7 @@ def test_credentials_from_credential_manager(self):
 
         list_fn = next(fn for fn in registered_fns if fn.__name__ == "intercom_list_teams")
 
-        with patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get") as mock_get:
+        with patch("aden_tools.tools.intercom_tool.intercom_tool._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"type": "team.list", "teams": []}
@@ -516,7 +516,7 @@ def test_credentials_from_env_var(self):
 
         with (
             patch.dict("os.environ", {"INTERCOM_ACCESS_TOKEN": "env-token"}),
-            patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.intercom_tool.intercom_tool._http.get") as mock_get,
         ):
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -545,7 +545,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_search_conversations(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -556,7 +556,7 @@ def test_search_conversations(self, mock_post):
         result = self._fn("intercom_search_conversations")(status="open")
         assert result["type"] == "conversation.list"
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_get_conversation(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"type": "conversation", "id": "1"})
@@ -572,14 +572,14 @@ def test_search_conversations_invalid_limit(self):
         result = self._fn("intercom_search_conversations")(limit=0)
         assert "error" in result
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_search_conversations_timeout(self, mock_post):
         mock_post.side_effect = httpx.TimeoutException("timed out")
         result = self._fn("intercom_search_conversations")()
         assert "error" in result
         assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_get_conversation_network_error(self, mock_get):
         mock_get.side_effect = httpx.RequestError("connection failed")
         result = self._fn("intercom_get_conversation")(conversation_id="1")
@@ -599,7 +599,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_get_contact_by_id(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"type": "contact", "id": "1"})
@@ -607,7 +607,7 @@ def test_get_contact_by_id(self, mock_get):
         result = self._fn("intercom_get_contact")(contact_id="1")
         assert result["id"] == "1"
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_get_contact_by_email(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -625,7 +625,7 @@ def test_get_contact_missing_params(self):
         result = self._fn("intercom_get_contact")()
         assert "error" in result
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_search_contacts(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -651,8 +651,8 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_add_note(self, mock_post, mock_get):
         # Mock /me for admin_id
         mock_get.return_value = MagicMock(
@@ -664,8 +664,8 @@ def test_add_note(self, mock_post, mock_get):
         result = self._fn("intercom_add_note")(conversation_id="1", body="Triage note")
         assert result["type"] == "conversation"
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_add_tag_to_conversation(self, mock_post, mock_get):
         # Mock /me for admin_id
         mock_get.return_value = MagicMock(
@@ -691,8 +691,8 @@ def test_add_tag_both_targets(self):
         assert "error" in result
         assert "not both" in result["error"]
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_assign_conversation(self, mock_post, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"id": "admin-1"})
@@ -705,8 +705,8 @@ def test_assign_conversation(self, mock_post, mock_get):
         )
         assert result["type"] == "conversation"
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.post")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.post")
     def test_assign_conversation_team_type(self, mock_post, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"id": "admin-1"})
@@ -728,7 +728,7 @@ def test_assign_conversation_invalid_type(self):
         )
         assert "error" in result
 
-    @patch("aden_tools.tools.intercom_tool.intercom_tool.httpx.get")
+    @patch("aden_tools.tools.intercom_tool.intercom_tool._http.get")
     def test_list_teams(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
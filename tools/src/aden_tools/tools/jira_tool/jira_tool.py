@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("jira")
+
 
 def _get_credentials(
     credentials: CredentialStoreAdapter | None,
@@ -53,7 +57,7 @@ def _request(method: str, url: str, email: str, token: str, **kwargs: Any) -> di
     headers.setdefault("Content-Type", "application/json")
     headers.setdefault("Accept", "application/json")
     try:
-        resp = getattr(httpx, method)(
+        resp = getattr(_http, method)(
             url,
             headers=headers,
             timeout=30.0,
@@ -10,9 +10,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("kafka")
+
 
 def _get_config() -> tuple[str, str, dict] | dict:
     """Return (base_url, cluster_id, headers) or error dict."""
@@ -42,7 +45,7 @@ def _get_config() -> tuple[str, str, dict] | dict:
 
 def _get(url: str, headers: dict, params: dict | None = None) -> dict:
     """Send a GET request."""
-    resp = httpx.get(url, headers=headers, params=params, timeout=30)
+    resp = _http.get(url, headers=headers, params=params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -50,7 +53,7 @@ def _get(url: str, headers: dict, params: dict | None = None) -> dict:
 
 def _post(url: str, headers: dict, payload: dict) -> dict:
     """Send a POST request."""
-    resp = httpx.post(url, headers=headers, json=payload, timeout=30)
+    resp = _http.post(url, headers=headers, json=payload, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -58,7 +61,7 @@ def _post(url: str, headers: dict, payload: dict) -> dict:
 
 def _delete(url: str, headers: dict) -> dict:
     """Send a DELETE request."""
-    resp = httpx.delete(url, headers=headers, timeout=30)
+    resp = _http.delete(url, headers=headers, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     if resp.status_code == 204:
@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("langfuse")
+
 DEFAULT_HOST = "https://cloud.langfuse.com"
 
 
@@ -118,7 +122,7 @@ def langfuse_list_traces(
                     if tag:
                         params.setdefault("tags", []).append(tag)
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{host}/api/public/traces",
                 auth=_auth(public_key, secret_key),
                 params=params,
@@ -177,7 +181,7 @@ def langfuse_get_trace(trace_id: str) -> dict:
             return {"error": "trace_id is required"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{host}/api/public/traces/{trace_id}",
                 auth=_auth(public_key, secret_key),
                 timeout=30.0,
@@ -271,7 +275,7 @@ def langfuse_list_scores(
             if data_type:
                 params["dataType"] = data_type
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{host}/api/public/v2/scores",
                 auth=_auth(public_key, secret_key),
                 params=params,
@@ -353,7 +357,7 @@ def langfuse_create_score(
             if observation_id:
                 body["observationId"] = observation_id
 
-            resp = httpx.post(
+            resp = _http.post(
                 f"{host}/api/public/scores",
                 auth=_auth(public_key, secret_key),
                 json=body,
@@ -401,7 +405,7 @@ def langfuse_list_prompts(
             if tag:
                 params["tag"] = tag
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{host}/api/public/v2/prompts",
                 auth=_auth(public_key, secret_key),
                 params=params,
@@ -468,7 +472,7 @@ def langfuse_get_prompt(
             if label:
                 params["label"] = label
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{host}/api/public/v2/prompts/{prompt_name}",
                 auth=_auth(public_key, secret_key),
                 params=params,
@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("linear")
+
 LINEAR_API_BASE = "https://api.linear.app/graphql"
 
 
@@ -42,7 +46,7 @@ def _execute_query(self, query: str, variables: dict[str, Any] | None = None) ->
         if variables:
             payload["variables"] = variables
 
-        response = httpx.post(
+        response = _http.post(
             LINEAR_API_BASE,
             headers=self._headers,
             json=payload,
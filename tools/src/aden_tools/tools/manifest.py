@@ -0,0 +1,304 @@
+"""
+Prebuilt tool manifest for lazy tool registration.
+
+Eagerly registering every integration imports ~100 modules (and their SDKs)
+before an MCP server can answer ``tools/list``.  The manifest records, per
+integration module, the schema of every tool it registers plus a content
+hash of the module's source.  ``register_all_tools(..., lazy=True)`` then:
+
+- adds a ``LazyTool`` per manifest entry, built from the stored schema,
+  without importing the integration;
+- imports the integration (in a worker thread) the first time any of its
+  tools is called, registers it into a private FastMCP instance with the
+  real credentials, and delegates the call to the real tool;
+- registers modules that are missing from the manifest, or whose source
+  hash changed, eagerly and writes the refreshed manifest back.
+
+Build the manifest ahead of time (e.g. in the Docker image) with::
+
+    python -m aden_tools.tools.manifest [--output PATH]
+
+The manifest lives next to this module unless ``ADEN_TOOL_MANIFEST`` points
+elsewhere.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import Tool, ToolResult
+from mcp.types import ToolAnnotations
+from pydantic import PrivateAttr
+
+from . import UNVERIFIED_TOOL_MODULES, VERIFIED_TOOL_MODULES, _register_module
+
+if TYPE_CHECKING:
+    from aden_tools.credentials import CredentialStoreAdapter
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_ENV = "ADEN_TOOL_MANIFEST"
+DEFAULT_MANIFEST_PATH = Path(__file__).with_name("tool_manifest.json")
+
+_TOOLS_DIR = Path(__file__).parent
+
+
+def _fastmcp_version() -> str:
+    try:
+        return version("fastmcp")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def manifest_path_from_env() -> Path:
+    """Manifest location: ``ADEN_TOOL_MANIFEST`` or the packaged default."""
+    override = os.environ.get(MANIFEST_ENV)
+    return Path(override) if override else DEFAULT_MANIFEST_PATH
+
+
+def module_fingerprint(module: str) -> str:
+    """Content hash of every ``.py`` file in an integration package."""
+    root = _TOOLS_DIR.joinpath(*module.split("."))
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _tool_spec(tool: Tool) -> dict[str, Any]:
+    return {
+        "name": tool.name,
+        "title": tool.title,
+        "description": tool.description,
+        "parameters": tool.parameters,
+        "output_schema": tool.output_schema,
+        "annotations": (
+            tool.annotations.model_dump(exclude_none=True) if tool.annotations else None
+        ),
+        "tags": sorted(tool.tags),
+        "meta": tool.meta,
+    }
+
+
+def _collect_module_tools(
+    module: str,
+    takes_credentials: bool,
+    credentials: CredentialStoreAdapter | None = None,
+) -> dict[str, Tool]:
+    scratch = FastMCP(f"manifest-{module}")
+    _register_module(scratch, module, takes_credentials, credentials=credentials)
+    return dict(scratch._tool_manager._tools)
+
+
+def _module_entry(module: str, tools: Iterable[Tool]) -> dict[str, Any]:
+    return {
+        "fingerprint": module_fingerprint(module),
+        "tools": [_tool_spec(tool) for tool in tools],
+    }
+
+
+def build_tool_manifest(modules: Iterable[tuple[str, bool]] | None = None) -> dict[str, Any]:
+    """
+    Import every integration and record its tool schemas.
+
+    Args:
+        modules: ``(module, takes_credentials)`` pairs; defaults to all
+                 verified and unverified modules
+
+    Returns:
+        Manifest dict suitable for ``write_tool_manifest``; modules that fail
+        to import are left out
+    """
+    if modules is None:
+        modules = VERIFIED_TOOL_MODULES + UNVERIFIED_TOOL_MODULES
+    entries: dict[str, Any] = {}
+    for module, takes_credentials in modules:
+        try:
+            tools = _collect_module_tools(module, takes_credentials)
+        except ImportError as e:
+            # Left out of the manifest: registered eagerly (and fails the same way) at startup
+            logger.warning("Skipping tool module %s: %s", module, e)
+            continue
+        entries[module] = _module_entry(module, tools.values())
+    return {"version": MANIFEST_VERSION, "fastmcp": _fastmcp_version(), "modules": entries}
+
+
+def load_tool_manifest(path: Path) -> dict[str, Any] | None:
+    """Read a manifest; None if it is missing, unreadable or from another format/FastMCP."""
+    try:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable tool manifest %s: %s", path, e)
+        return None
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("fastmcp") != _fastmcp_version()
+        or not isinstance(manifest.get("modules"), dict)
+    ):
+        return None
+    return manifest
+
+
+def write_tool_manifest(manifest: dict[str, Any], path: Path) -> None:
+    """Atomically write a manifest (temp file + rename)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tool_manifest.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class _ModuleLoader:
+    """Imports and registers one integration module on first use."""
+
+    def __init__(
+        self,
+        module: str,
+        takes_credentials: bool,
+        credentials: CredentialStoreAdapter | None,
+    ):
+        self.module = module
+        self._takes_credentials = takes_credentials
+        self._credentials = credentials
+        self._lock = threading.Lock()
+        self._tools: dict[str, Tool] | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._tools is not None
+
+    def load(self) -> dict[str, Tool]:
+        with self._lock:
+            if self._tools is None:
+                logger.debug("Lazily importing tool module %s", self.module)
+                self._tools = _collect_module_tools(
+                    self.module, self._takes_credentials, credentials=self._credentials
+                )
+            return self._tools
+
+    async def get_tool(self, name: str) -> Tool:
+        tools = self._tools if self._tools is not None else await asyncio.to_thread(self.load)
+        tool = tools.get(name)
+        if tool is None:
+            raise ToolError(f"Tool {name!r} is no longer provided by {self.module}")
+        return tool
+
+
+class LazyTool(Tool):
+    """A tool advertised from the manifest whose module is imported on first call."""
+
+    _loader: _ModuleLoader = PrivateAttr()
+
+    @classmethod
+    def from_spec(cls, spec: dict[str, Any], loader: _ModuleLoader) -> LazyTool:
+        annotations = spec.get("annotations")
+        tool = cls(
+            name=spec["name"],
+            title=spec.get("title"),
+            description=spec.get("description"),
+            parameters=spec["parameters"],
+            output_schema=spec.get("output_schema"),
+            annotations=ToolAnnotations(**annotations) if annotations else None,
+            tags=set(spec.get("tags") or ()),
+            meta=spec.get("meta"),
+        )
+        tool._loader = loader
+        return tool
+
+    @property
+    def module(self) -> str:
+        return self._loader.module
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        tool = await self._loader.get_tool(self.name)
+        return await tool.run(arguments)
+
+
+def register_lazy(
+    mcp: FastMCP,
+    modules: Iterable[tuple[str, bool]],
+    credentials: CredentialStoreAdapter | None = None,
+    manifest_path: Path | None = None,
+) -> None:
+    """
+    Register tools from the manifest without importing their modules.
+
+    Modules absent from the manifest or whose source changed are registered
+    eagerly, and the manifest is rewritten to include them.
+    """
+    path = Path(manifest_path) if manifest_path else manifest_path_from_env()
+    manifest = load_tool_manifest(path) or {
+        "version": MANIFEST_VERSION,
+        "fastmcp": _fastmcp_version(),
+        "modules": {},
+    }
+    entries: dict[str, Any] = manifest["modules"]
+    stale: list[str] = []
+
+    for module, takes_credentials in modules:
+        entry = entries.get(module)
+        if entry is None or entry.get("fingerprint") != module_fingerprint(module):
+            tools = _collect_module_tools(module, takes_credentials, credentials=credentials)
+            for tool in tools.values():
+                mcp.add_tool(tool)
+            entries[module] = _module_entry(module, tools.values())
+            stale.append(module)
+            continue
+
+        loader = _ModuleLoader(module, takes_credentials, credentials)
+        for spec in entry["tools"]:
+            mcp.add_tool(LazyTool.from_spec(spec, loader))
+
+    if stale:
+        logger.info(
+            "Tool manifest missing or stale for %d modules; refreshing %s", len(stale), path
+        )
+        try:
+            write_tool_manifest(manifest, path)
+        except OSError as e:
+            logger.warning("Could not write tool manifest %s: %s", path, e)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the lazy tool-registration manifest")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=f"Manifest path (default: ${MANIFEST_ENV} or {DEFAULT_MANIFEST_PATH.name})",
+    )
+    args = parser.parse_args(argv)
+    path = args.output or manifest_path_from_env()
+    manifest = build_tool_manifest()
+    write_tool_manifest(manifest, path)
+    n_tools = sum(len(entry["tools"]) for entry in manifest["modules"].values())
+    print(f"Wrote {n_tools} tools from {len(manifest['modules'])} modules to {path}")
+
+
+if __name__ == "__main__":
+    main()
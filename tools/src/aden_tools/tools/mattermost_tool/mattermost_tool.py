@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("mattermost")
+
 MAX_MESSAGE_LENGTH = 16383  # Mattermost API limit
 MAX_RETRIES = 2  # 3 total attempts on 429
 MAX_RETRY_WAIT = 60  # cap wait at 60s
@@ -52,7 +56,7 @@ def _request_with_retry(
         """Make HTTP request with retry on 429 rate limit."""
         request_kwargs = {"headers": self._headers, "timeout": 30.0, **kwargs}
         for attempt in range(MAX_RETRIES + 1):
-            response = httpx.request(method, url, **request_kwargs)
+            response = _http.request(method, url, **request_kwargs)
             if response.status_code == 429 and attempt < MAX_RETRIES:
                 try:
                     wait = min(float(response.headers.get("Retry-After", 1)), MAX_RETRY_WAIT)
@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("microsoft_graph")
+
 GRAPH_API_BASE = "https://graph.microsoft.com/v1.0"
 
 
@@ -39,7 +43,7 @@ def _get(endpoint: str, token: str, params: dict[str, Any] | None = None) -> dic
     """Make a GET request to Microsoft Graph API."""
     url = f"{GRAPH_API_BASE}/{endpoint}"
     try:
-        resp = httpx.get(url, headers=_headers(token), params=params, timeout=30.0)
+        resp = _http.get(url, headers=_headers(token), params=params, timeout=30.0)
         if resp.status_code == 401:
             return {"error": "Unauthorized. Access token may be expired or invalid."}
         if resp.status_code == 403:
@@ -59,7 +63,7 @@ def _post(endpoint: str, token: str, json_body: dict[str, Any]) -> dict[str, Any
     """Make a POST request to Microsoft Graph API."""
     url = f"{GRAPH_API_BASE}/{endpoint}"
     try:
-        resp = httpx.post(url, headers=_headers(token), json=json_body, timeout=30.0)
+        resp = _http.post(url, headers=_headers(token), json=json_body, timeout=30.0)
         if resp.status_code == 401:
             return {"error": "Unauthorized. Access token may be expired or invalid."}
         if resp.status_code == 403:
@@ -518,7 +522,7 @@ def onedrive_download_file(
                 download_url = f"{GRAPH_API_BASE}/me/drive/root:/{file_path}:/content"
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 download_url,
                 headers={"Authorization": f"Bearer {token}"},
                 timeout=60.0,
@@ -572,7 +576,7 @@ def onedrive_upload_file(
 
         url = f"{GRAPH_API_BASE}/me/drive/root:/{file_path}:/content"
         try:
-            resp = httpx.put(
+            resp = _http.put(
                 url,
                 headers={
                     "Authorization": f"Bearer {token}",
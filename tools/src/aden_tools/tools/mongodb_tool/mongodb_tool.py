@@ -13,9 +13,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("mongodb")
+
 
 def _get_config() -> tuple[str, str, str] | dict:
     """Return (base_url, api_key, data_source) or error dict."""
@@ -33,7 +36,7 @@ def _get_config() -> tuple[str, str, str] | dict:
 def _request(url: str, api_key: str, action: str, body: dict) -> dict:
     """Send a POST request to the Data API."""
     endpoint = f"{url}/action/{action}"
-    resp = httpx.post(
+    resp = _http.post(
         endpoint,
         headers={
             "Content-Type": "application/json",
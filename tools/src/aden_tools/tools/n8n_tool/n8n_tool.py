@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("n8n")
+
 
 def _get_creds(
     credentials: CredentialStoreAdapter | None,
@@ -113,7 +117,7 @@ def n8n_list_workflows(
             if cursor:
                 params["cursor"] = cursor
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{base_url}/api/v1/workflows",
                 headers=_headers(api_key),
                 params=params,
@@ -171,7 +175,7 @@ def n8n_get_workflow(workflow_id: str) -> dict:
             return {"error": "workflow_id is required"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{base_url}/api/v1/workflows/{workflow_id}",
                 headers=_headers(api_key),
                 timeout=30.0,
@@ -226,7 +230,7 @@ def n8n_activate_workflow(workflow_id: str) -> dict:
             return {"error": "workflow_id is required"}
 
         try:
-            resp = httpx.post(
+            resp = _http.post(
                 f"{base_url}/api/v1/workflows/{workflow_id}/activate",
                 headers=_headers(api_key),
                 timeout=30.0,
@@ -265,7 +269,7 @@ def n8n_deactivate_workflow(workflow_id: str) -> dict:
             return {"error": "workflow_id is required"}
 
         try:
-            resp = httpx.post(
+            resp = _http.post(
                 f"{base_url}/api/v1/workflows/{workflow_id}/deactivate",
                 headers=_headers(api_key),
                 timeout=30.0,
@@ -318,7 +322,7 @@ def n8n_list_executions(
             if cursor:
                 params["cursor"] = cursor
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{base_url}/api/v1/executions",
                 headers=_headers(api_key),
                 params=params,
@@ -383,7 +387,7 @@ def n8n_get_execution(
             if include_data:
                 params["includeData"] = "true"
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{base_url}/api/v1/executions/{execution_id}",
                 headers=_headers(api_key),
                 params=params,
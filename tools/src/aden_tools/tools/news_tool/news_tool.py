@@ -18,9 +18,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("news")
+
 NEWSDATA_URL = "https://newsdata.io/api/1/news"
 NEWSDATA_ARCHIVE_URL = "https://newsdata.io/api/1/archive"
 FINLIGHT_URL = "https://api.finlight.me/v2/articles"
@@ -196,7 +200,7 @@ def _search_newsdata(
 
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.get(url, params=params, timeout=30.0)
+            response = _http.get(url, params=params, timeout=30.0)
 
             if response.status_code == 429 and attempt < max_retries:
                 time.sleep(2**attempt)
@@ -248,7 +252,7 @@ def _search_finlight(
 
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.post(FINLIGHT_URL, json=json_body, headers=headers, timeout=30.0)
+            response = _http.post(FINLIGHT_URL, json=json_body, headers=headers, timeout=30.0)
 
             if response.status_code == 429 and attempt < max_retries:
                 time.sleep(2**attempt)
@@ -564,7 +568,7 @@ def news_latest(
             )
 
             def _fetch_latest():
-                r = httpx.get(NEWSDATA_URL, params=params, timeout=30.0)
+                r = _http.get(NEWSDATA_URL, params=params, timeout=30.0)
                 if r.status_code != 200:
                     return _newsdata_error(r)
                 articles = _parse_newsdata_results(r.json())
@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("notion")
+
 API_BASE = "https://api.notion.com/v1"
 NOTION_VERSION = "2022-06-28"
 
@@ -54,7 +58,7 @@ def _headers(token: str) -> dict[str, str]:
 def _request(method: str, path: str, token: str, **kwargs: Any) -> dict[str, Any]:
     """Make a request to the Notion API."""
     try:
-        resp = getattr(httpx, method)(
+        resp = getattr(_http, method)(
             f"{API_BASE}{path}",
             headers=_headers(token),
             timeout=30.0,
@@ -10,6 +10,10 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("openmeteo")
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register Open-Meteo weather tools with the MCP server."""
@@ -41,7 +45,7 @@ def weather_get_current(latitude: float, longitude: float) -> dict:
                 "longitude": longitude,
                 "current_weather": True,
             }
-            response = httpx.get(url, params=params, timeout=10)
+            response = _http.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             return data.get("current_weather", {"error": "No current weather data returned"})
@@ -82,7 +86,7 @@ def weather_get_forecast(latitude: float, longitude: float, days: int = 7) -> di
                 "forecast_days": days,
                 "timezone": "auto",
             }
-            response = httpx.get(url, params=params, timeout=10)
+            response = _http.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             daily = data.get("daily", {})
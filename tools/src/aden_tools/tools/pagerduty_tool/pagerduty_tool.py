@@ -9,9 +9,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("pagerduty")
+
 BASE_URL = "https://api.pagerduty.com"
 
 
@@ -34,7 +37,7 @@ def _get_headers(write: bool = False) -> dict | None:
 
 def _get(path: str, headers: dict, params: dict | None = None) -> dict:
     """Send a GET request."""
-    resp = httpx.get(f"{BASE_URL}{path}", headers=headers, params=params, timeout=30)
+    resp = _http.get(f"{BASE_URL}{path}", headers=headers, params=params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -42,7 +45,7 @@ def _get(path: str, headers: dict, params: dict | None = None) -> dict:
 
 def _post(path: str, headers: dict, body: dict) -> dict:
     """Send a POST request."""
-    resp = httpx.post(f"{BASE_URL}{path}", headers=headers, json=body, timeout=30)
+    resp = _http.post(f"{BASE_URL}{path}", headers=headers, json=body, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -50,7 +53,7 @@ def _post(path: str, headers: dict, body: dict) -> dict:
 
 def _put(path: str, headers: dict, body: dict) -> dict:
     """Send a PUT request."""
-    resp = httpx.put(f"{BASE_URL}{path}", headers=headers, json=body, timeout=30)
+    resp = _http.put(f"{BASE_URL}{path}", headers=headers, json=body, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
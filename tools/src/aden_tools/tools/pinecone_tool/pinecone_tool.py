@@ -18,9 +18,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("pinecone")
+
 CONTROL_PLANE = "https://api.pinecone.io"
 API_VERSION = "2025-04"
 
@@ -42,7 +46,7 @@ def _headers(token: str) -> dict[str, str]:
 def _control(method: str, path: str, token: str, **kwargs: Any) -> dict[str, Any]:
     """Make a control-plane request to api.pinecone.io."""
     try:
-        resp = getattr(httpx, method)(
+        resp = getattr(_http, method)(
             f"{CONTROL_PLANE}{path}",
             headers=_headers(token),
             timeout=30.0,
@@ -67,7 +71,7 @@ def _data(method: str, host: str, path: str, token: str, **kwargs: Any) -> dict[
     """Make a data-plane request to {index_host}."""
     url = host if host.startswith("https://") else f"https://{host}"
     try:
-        resp = getattr(httpx, method)(
+        resp = getattr(_http, method)(
             f"{url}{path}",
             headers=_headers(token),
             timeout=30.0,
@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("pipedrive")
+
 
 def _get_token(credentials: CredentialStoreAdapter | None) -> str | None:
     if credentials is not None:
@@ -42,7 +46,7 @@ def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any
         p = {"api_token": token}
         if params:
             p.update(params)
-        resp = httpx.get(f"{_base_url()}/{endpoint}", params=p, timeout=30.0)
+        resp = _http.get(f"{_base_url()}/{endpoint}", params=p, timeout=30.0)
         if resp.status_code == 401:
             return {"error": "Unauthorized. Check your PIPEDRIVE_API_TOKEN."}
         if resp.status_code == 404:
@@ -58,7 +62,7 @@ def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any
 
 def _post(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.post(
+        resp = _http.post(
             f"{_base_url()}/{endpoint}",
             params={"api_token": token},
             json=body or {},
@@ -77,7 +81,7 @@ def _post(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]
 
 def _put(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.put(
+        resp = _http.put(
             f"{_base_url()}/{endpoint}",
             params={"api_token": token},
             json=body or {},
@@ -96,7 +100,7 @@ def _put(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]:
 
 def _delete(endpoint: str, token: str) -> dict[str, Any]:
     try:
-        resp = httpx.delete(
+        resp = _http.delete(
             f"{_base_url()}/{endpoint}",
             params={"api_token": token},
             timeout=30.0,
@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("plaid")
+
 DEFAULT_ENV = "sandbox"
 BASE_URLS = {
     "sandbox": "https://sandbox.plaid.com",
@@ -49,7 +53,7 @@ def _post(
     base = BASE_URLS.get(env, BASE_URLS["sandbox"])
     payload = {**(body or {}), "client_id": client_id, "secret": secret}
     try:
-        resp = httpx.post(
+        resp = _http.post(
             f"{base}{path}",
             headers={"Content-Type": "application/json"},
             json=payload,
@@ -9,9 +9,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("powerbi")
+
 BASE_URL = "https://api.powerbi.com/v1.0/myorg"
 
 
@@ -25,7 +28,7 @@ def _get_headers() -> dict | None:
 
 def _get(url: str, headers: dict, params: dict | None = None) -> dict:
     """Send a GET request."""
-    resp = httpx.get(url, headers=headers, params=params, timeout=30)
+    resp = _http.get(url, headers=headers, params=params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -33,7 +36,7 @@ def _get(url: str, headers: dict, params: dict | None = None) -> dict:
 
 def _post(url: str, headers: dict, payload: dict | None = None) -> dict:
     """Send a POST request."""
-    resp = httpx.post(url, headers=headers, json=payload, timeout=30)
+    resp = _http.post(url, headers=headers, json=payload, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     if resp.status_code == 202:
@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("pushover")
+
 PUSHOVER_API = "https://api.pushover.net/1"
 
 
@@ -109,7 +113,7 @@ def pushover_send(
             data["ttl"] = ttl
 
         try:
-            resp = httpx.post(f"{PUSHOVER_API}/messages.json", data=data, timeout=30.0)
+            resp = _http.post(f"{PUSHOVER_API}/messages.json", data=data, timeout=30.0)
             result = resp.json()
             if result.get("status") != 1:
                 errors = result.get("errors", [])
@@ -151,7 +155,7 @@ def pushover_validate_user(
             data["device"] = device
 
         try:
-            resp = httpx.post(f"{PUSHOVER_API}/users/validate.json", data=data, timeout=30.0)
+            resp = _http.post(f"{PUSHOVER_API}/users/validate.json", data=data, timeout=30.0)
             result = resp.json()
             return {
                 "is_valid": result.get("status") == 1,
@@ -174,7 +178,7 @@ def pushover_list_sounds() -> dict[str, Any]:
             return _auth_error()
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{PUSHOVER_API}/sounds.json",
                 params={"token": token},
                 timeout=30.0,
@@ -207,7 +211,7 @@ def pushover_check_receipt(
             return {"error": "receipt is required"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{PUSHOVER_API}/receipts/{receipt}.json",
                 params={"token": token},
                 timeout=30.0,
@@ -249,7 +253,7 @@ def pushover_cancel_receipt(
             return {"error": "receipt is required"}
 
         try:
-            resp = httpx.post(
+            resp = _http.post(
                 f"{PUSHOVER_API}/receipts/{receipt}/cancel.json",
                 data={"token": token},
                 timeout=30.0,
@@ -317,7 +321,7 @@ def pushover_send_glance(
             data["device"] = device
 
         try:
-            resp = httpx.post(
+            resp = _http.post(
                 f"{PUSHOVER_API}/glances.json",
                 data=data,
                 timeout=30.0,
@@ -350,7 +354,7 @@ def pushover_get_limits() -> dict[str, Any]:
             return _auth_error()
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{PUSHOVER_API}/apps/limits.json",
                 params={"token": token},
                 timeout=30.0,
@@ -22,7 +22,7 @@ def decorator(func):
         "os.environ",
         {"PUSHOVER_API_TOKEN": "test_token", "PUSHOVER_USER_KEY": "test_user"},
     )
-    @patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.post")
+    @patch("aden_tools.tools.pushover_tool.pushover_tool._http.post")
     def test_pushover_send_notification(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -50,7 +50,7 @@ def test_pushover_send_notification_no_credentials(self):
         "os.environ",
         {"PUSHOVER_API_TOKEN": "test_token", "PUSHOVER_USER_KEY": "test_user"},
     )
-    @patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.post")
+    @patch("aden_tools.tools.pushover_tool.pushover_tool._http.post")
     def test_pushover_send_notification_with_url(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -65,7 +65,7 @@ def test_pushover_send_notification_with_url(self, mock_post):
         "os.environ",
         {"PUSHOVER_API_TOKEN": "test_token", "PUSHOVER_USER_KEY": "test_user"},
     )
-    @patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.get")
+    @patch("aden_tools.tools.pushover_tool.pushover_tool._http.get")
     def test_pushover_get_sounds(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -79,7 +79,7 @@ def test_pushover_get_sounds(self, mock_get):
         "os.environ",
         {"PUSHOVER_API_TOKEN": "test_token", "PUSHOVER_USER_KEY": "test_user"},
     )
-    @patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.post")
+    @patch("aden_tools.tools.pushover_tool.pushover_tool._http.post")
     def test_pushover_validate_user(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -10,9 +10,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("quickbooks")
+
 PROD_URL = "https://quickbooks.api.intuit.com/v3/company"
 SANDBOX_URL = "https://sandbox-quickbooks.api.intuit.com/v3/company"
 
@@ -42,14 +45,14 @@ def _headers(token: str, content_type: str = "application/json") -> dict:
 
 
 def _get(url: str, token: str, params: dict | None = None) -> dict:
-    resp = httpx.get(url, headers=_headers(token), params=params, timeout=30)
+    resp = _http.get(url, headers=_headers(token), params=params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
 
 
 def _post(url: str, token: str, body: dict) -> dict:
-    resp = httpx.post(url, headers=_headers(token), json=body, timeout=30)
+    resp = _http.post(url, headers=_headers(token), json=body, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
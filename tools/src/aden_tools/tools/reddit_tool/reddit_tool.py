@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("reddit")
+
 TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
 API_BASE = "https://oauth.reddit.com"
 USER_AGENT = "HiveAgent/1.0"
@@ -36,7 +40,7 @@ def _get_credentials(credentials: CredentialStoreAdapter | None) -> tuple[str |
 def _get_token(client_id: str, client_secret: str) -> str | None:
     """Acquire an OAuth2 app-only access token."""
     try:
-        resp = httpx.post(
+        resp = _http.post(
             TOKEN_URL,
             auth=(client_id, client_secret),
             data={"grant_type": "client_credentials"},
@@ -53,7 +57,7 @@ def _get_token(client_id: str, client_secret: str) -> str | None:
 def _get(path: str, token: str, params: dict[str, Any] | None = None) -> dict[str, Any] | list:
     """Make an authenticated GET to the Reddit OAuth API."""
     try:
-        resp = httpx.get(
+        resp = _http.get(
             f"{API_BASE}{path}",
             headers={"Authorization": f"bearer {token}", "User-Agent": USER_AGENT},
             params=params or {},
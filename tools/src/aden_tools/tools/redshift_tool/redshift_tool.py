@@ -13,9 +13,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("redshift")
+
 SERVICE = "redshift-data"
 
 
@@ -88,7 +91,7 @@ def _api_call(
         "Authorization": auth_header,
     }
 
-    resp = httpx.post(f"https://{host}/", headers=final_headers, content=body, timeout=30)
+    resp = _http.post(f"https://{host}/", headers=final_headers, content=body, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
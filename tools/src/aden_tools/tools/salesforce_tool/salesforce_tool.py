@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("salesforce")
+
 API_VERSION = "v62.0"
 
 
@@ -110,10 +114,10 @@ def salesforce_soql_query(
         try:
             if next_records_url:
                 url = f"{instance_url}{next_records_url}"
-                resp = httpx.get(url, headers=_headers(token), timeout=30.0)
+                resp = _http.get(url, headers=_headers(token), timeout=30.0)
             else:
                 url = f"{instance_url}/services/data/{API_VERSION}/query/"
-                resp = httpx.get(
+                resp = _http.get(
                     url,
                     headers=_headers(token),
                     params={"q": query},
@@ -166,7 +170,7 @@ def salesforce_get_record(
             params = {}
             if fields:
                 params["fields"] = fields
-            resp = httpx.get(url, headers=_headers(token), params=params, timeout=30.0)
+            resp = _http.get(url, headers=_headers(token), params=params, timeout=30.0)
             return _handle_response(resp)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
@@ -200,7 +204,7 @@ def salesforce_create_record(
 
         try:
             url = f"{instance_url}/services/data/{API_VERSION}/sobjects/{object_type}"
-            resp = httpx.post(url, headers=_headers(token), json=fields, timeout=30.0)
+            resp = _http.post(url, headers=_headers(token), json=fields, timeout=30.0)
             return _handle_response(resp)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
@@ -236,7 +240,7 @@ def salesforce_update_record(
 
         try:
             url = f"{instance_url}/services/data/{API_VERSION}/sobjects/{object_type}/{record_id}"
-            resp = httpx.patch(url, headers=_headers(token), json=fields, timeout=30.0)
+            resp = _http.patch(url, headers=_headers(token), json=fields, timeout=30.0)
             return _handle_response(resp)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
@@ -266,7 +270,7 @@ def salesforce_describe_object(
 
         try:
             url = f"{instance_url}/services/data/{API_VERSION}/sobjects/{object_type}/describe"
-            resp = httpx.get(url, headers=_headers(token), timeout=30.0)
+            resp = _http.get(url, headers=_headers(token), timeout=30.0)
             result = _handle_response(resp)
             if "error" in result:
                 return result
@@ -315,7 +319,7 @@ def salesforce_list_objects() -> dict:
 
         try:
             url = f"{instance_url}/services/data/{API_VERSION}/sobjects/"
-            resp = httpx.get(url, headers=_headers(token), timeout=30.0)
+            resp = _http.get(url, headers=_headers(token), timeout=30.0)
             result = _handle_response(resp)
             if "error" in result:
                 return result
@@ -364,7 +368,7 @@ def salesforce_delete_record(
 
         try:
             url = f"{instance_url}/services/data/{API_VERSION}/sobjects/{object_type}/{record_id}"
-            resp = httpx.delete(url, headers=_headers(token), timeout=30.0)
+            resp = _http.delete(url, headers=_headers(token), timeout=30.0)
             return _handle_response(resp)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
@@ -397,7 +401,7 @@ def salesforce_search_records(
 
         try:
             url = f"{instance_url}/services/data/{API_VERSION}/search/"
-            resp = httpx.get(
+            resp = _http.get(
                 url,
                 headers=_headers(token),
                 params={"q": search_query},
@@ -442,7 +446,7 @@ def salesforce_get_record_count(
 
         try:
             url = f"{instance_url}/services/data/{API_VERSION}/query/"
-            resp = httpx.get(
+            resp = _http.get(
                 url,
                 headers=_headers(token),
                 params={"q": f"SELECT COUNT() FROM {object_type}"},
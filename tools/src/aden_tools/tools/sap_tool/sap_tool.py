@@ -10,9 +10,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("sap")
+
 
 def _get_config() -> tuple[str, dict] | dict:
     """Return (base_url, headers) or error dict."""
@@ -31,7 +34,7 @@ def _get_config() -> tuple[str, dict] | dict:
 
 def _get(url: str, headers: dict, params: dict | None = None) -> dict:
     """Send a GET request."""
-    resp = httpx.get(url, headers=headers, params=params, timeout=30)
+    resp = _http.get(url, headers=headers, params=params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -23,9 +23,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("serpapi")
+
 SERPAPI_BASE = "https://serpapi.com/search.json"
 SERPAPI_ACCOUNT = "https://serpapi.com/account.json"
 
@@ -39,7 +43,7 @@ def __init__(self, api_key: str):
     def _request(self, params: dict[str, Any]) -> dict[str, Any]:
         """Make a GET request to SerpAPI."""
         params["api_key"] = self._api_key
-        response = httpx.get(SERPAPI_BASE, params=params, timeout=30.0)
+        response = _http.get(SERPAPI_BASE, params=params, timeout=30.0)
 
         if response.status_code == 401:
             return {
@@ -16,9 +16,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("shopify")
+
 API_VERSION = "2025-01"
 
 
@@ -116,7 +120,7 @@ def shopify_list_orders(
             if fulfillment_status:
                 params["fulfillment_status"] = fulfillment_status
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{_base_url(store)}/orders.json",
                 headers=_headers(token),
                 params=params,
@@ -167,7 +171,7 @@ def shopify_get_order(order_id: str) -> dict:
             return {"error": "order_id is required"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{_base_url(store)}/orders/{order_id}.json",
                 headers=_headers(token),
                 timeout=30.0,
@@ -252,7 +256,7 @@ def shopify_list_products(
             if vendor:
                 params["vendor"] = vendor
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{_base_url(store)}/products.json",
                 headers=_headers(token),
                 params=params,
@@ -304,7 +308,7 @@ def shopify_get_product(product_id: str) -> dict:
             return {"error": "product_id is required"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{_base_url(store)}/products/{product_id}.json",
                 headers=_headers(token),
                 timeout=30.0,
@@ -373,7 +377,7 @@ def shopify_list_customers(
         token, store = creds
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{_base_url(store)}/customers.json",
                 headers=_headers(token),
                 params={"limit": min(limit, 250)},
@@ -429,7 +433,7 @@ def shopify_search_customers(
             return {"error": "query is required"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{_base_url(store)}/customers/search.json",
                 headers=_headers(token),
                 params={"query": query, "limit": min(limit, 250)},
@@ -511,7 +515,7 @@ def shopify_update_product(
             return {"error": "At least one field to update is required"}
 
         try:
-            resp = httpx.put(
+            resp = _http.put(
                 f"{_base_url(store)}/products/{product_id}.json",
                 headers=_headers(token),
                 json={"product": product},
@@ -557,7 +561,7 @@ def shopify_get_customer(customer_id: str) -> dict:
             return {"error": "customer_id is required"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{_base_url(store)}/customers/{customer_id}.json",
                 headers=_headers(token),
                 timeout=30.0,
@@ -651,7 +655,7 @@ def shopify_create_draft_order(
             draft_order["tags"] = tags
 
         try:
-            resp = httpx.post(
+            resp = _http.post(
                 f"{_base_url(store)}/draft_orders.json",
                 headers=_headers(token),
                 json={"draft_order": draft_order},
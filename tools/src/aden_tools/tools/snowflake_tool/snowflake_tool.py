@@ -10,9 +10,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("snowflake")
+
 
 def _get_config() -> tuple[str, dict] | dict:
     """Return (base_url, headers) or error dict."""
@@ -90,7 +93,7 @@ def snowflake_execute_sql(
         if wh:
             body["warehouse"] = wh
 
-        resp = httpx.post(base_url, headers=headers, json=body, timeout=max(timeout + 10, 30))
+        resp = _http.post(base_url, headers=headers, json=body, timeout=max(timeout + 10, 30))
         if resp.status_code == 200:
             return _format_results(resp.json())
         if resp.status_code == 202:
@@ -116,7 +119,7 @@ def snowflake_get_statement_status(statement_handle: str) -> dict:
         if not statement_handle:
             return {"error": "statement_handle is required"}
 
-        resp = httpx.get(f"{base_url}/{statement_handle}", headers=headers, timeout=30)
+        resp = _http.get(f"{base_url}/{statement_handle}", headers=headers, timeout=30)
         if resp.status_code == 200:
             return _format_results(resp.json())
         if resp.status_code == 202:
@@ -149,7 +152,7 @@ def snowflake_cancel_statement(statement_handle: str) -> dict:
         if not statement_handle:
             return {"error": "statement_handle is required"}
 
-        resp = httpx.post(f"{base_url}/{statement_handle}/cancel", headers=headers, timeout=30)
+        resp = _http.post(f"{base_url}/{statement_handle}/cancel", headers=headers, timeout=30)
         if resp.status_code == 200:
             return {"result": "cancelled", "statement_handle": statement_handle}
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
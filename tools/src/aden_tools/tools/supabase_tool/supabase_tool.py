@@ -18,9 +18,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("supabase")
+
 
 def _get_config(credentials: CredentialStoreAdapter | None) -> tuple[str | None, str | None]:
     """Return (anon_key, project_url)."""
@@ -97,7 +101,7 @@ def supabase_select(
             params["order"] = order
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{url}/rest/v1/{table}",
                 headers=_rest_headers(key),
                 params=params,
@@ -144,7 +148,7 @@ def supabase_insert(
             return {"error": f"Invalid JSON in rows: {e!s}"}
 
         try:
-            resp = httpx.post(
+            resp = _http.post(
                 f"{url}/rest/v1/{table}",
                 headers=_rest_headers(key),
                 json=body,
@@ -196,7 +200,7 @@ def supabase_update(
                 params[k] = v
 
         try:
-            resp = httpx.patch(
+            resp = _http.patch(
                 f"{url}/rest/v1/{table}",
                 headers=_rest_headers(key),
                 params=params,
@@ -242,7 +246,7 @@ def supabase_delete(
         try:
             headers = _rest_headers(key)
             headers["Prefer"] = "return=representation"
-            resp = httpx.delete(
+            resp = _http.delete(
                 f"{url}/rest/v1/{table}",
                 headers=headers,
                 params=params,
@@ -282,7 +286,7 @@ def supabase_auth_signup(
             return {"error": "password must be at least 6 characters"}
 
         try:
-            resp = httpx.post(
+            resp = _http.post(
                 f"{url}/auth/v1/signup",
                 headers={"apikey": key, "Content-Type": "application/json"},
                 json={"email": email, "password": password},
@@ -322,7 +326,7 @@ def supabase_auth_signin(
             return {"error": "email and password are required"}
 
         try:
-            resp = httpx.post(
+            resp = _http.post(
                 f"{url}/auth/v1/token?grant_type=password",
                 headers={"apikey": key, "Content-Type": "application/json"},
                 json={"email": email, "password": password},
@@ -382,9 +386,9 @@ def supabase_edge_invoke(
 
         try:
             if method.upper() == "GET":
-                resp = httpx.get(fn_url, headers=headers, timeout=30.0)
+                resp = _http.get(fn_url, headers=headers, timeout=30.0)
             else:
-                resp = httpx.post(fn_url, headers=headers, json=parsed_body, timeout=30.0)
+                resp = _http.post(fn_url, headers=headers, json=parsed_body, timeout=30.0)
 
             content_type = resp.headers.get("content-type", "")
             if "application/json" in content_type:
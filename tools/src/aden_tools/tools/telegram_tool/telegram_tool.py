@@ -19,9 +19,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("telegram")
+
 TELEGRAM_API_BASE = "https://api.telegram.org/bot"
 
 
@@ -75,7 +79,7 @@ def send_message(
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/sendMessage",
             json=payload,
             timeout=30.0,
@@ -99,7 +103,7 @@ def send_document(
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/sendDocument",
             json=payload,
             timeout=30.0,
@@ -122,7 +126,7 @@ def edit_message_text(
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/editMessageText",
             json=payload,
             timeout=30.0,
@@ -139,7 +143,7 @@ def delete_message(
             "chat_id": chat_id,
             "message_id": message_id,
         }
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/deleteMessage",
             json=payload,
             timeout=30.0,
@@ -160,7 +164,7 @@ def forward_message(
             "message_id": message_id,
             "disable_notification": disable_notification,
         }
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/forwardMessage",
             json=payload,
             timeout=30.0,
@@ -184,7 +188,7 @@ def send_photo(
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/sendPhoto",
             json=payload,
             timeout=30.0,
@@ -201,7 +205,7 @@ def send_chat_action(
             "chat_id": chat_id,
             "action": action,
         }
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/sendChatAction",
             json=payload,
             timeout=30.0,
@@ -220,7 +224,7 @@ def pin_chat_message(
             "message_id": message_id,
             "disable_notification": disable_notification,
         }
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/pinChatMessage",
             json=payload,
             timeout=30.0,
@@ -239,7 +243,7 @@ def unpin_chat_message(
         if message_id is not None:
             payload["message_id"] = message_id
 
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/unpinChatMessage",
             json=payload,
             timeout=30.0,
@@ -251,7 +255,7 @@ def get_chat(
         chat_id: str,
     ) -> dict[str, Any]:
         """Get information about a chat."""
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/getChat",
             json={"chat_id": chat_id},
             timeout=30.0,
@@ -260,7 +264,7 @@ def get_chat(
 
     def get_me(self) -> dict[str, Any]:
         """Get bot information (useful for health checks)."""
-        response = httpx.get(
+        response = _http.get(
             f"{self._base_url}/getMe",
             timeout=30.0,
         )
@@ -271,7 +275,7 @@ def get_chat_member_count(self, chat_id: str) -> dict[str, Any]:
 
         API ref: https://core.telegram.org/bots/api#getchatmembercount
         """
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/getChatMemberCount",
             json={"chat_id": chat_id},
             timeout=30.0,
@@ -301,7 +305,7 @@ def send_video(
         if duration is not None:
             payload["duration"] = duration
 
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/sendVideo",
             json=payload,
             timeout=60.0,  # longer timeout for video uploads
@@ -317,7 +321,7 @@ def set_chat_description(
 
         API ref: https://core.telegram.org/bots/api#setchatdescription
         """
-        response = httpx.post(
+        response = _http.post(
             f"{self._base_url}/setChatDescription",
             json={"chat_id": chat_id, "description": description},
             timeout=30.0,
@@ -6,6 +6,10 @@
 
 import httpx
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("trello")
+
 TRELLO_API_BASE = "https://api.trello.com/1"
 
 
@@ -51,7 +55,7 @@ def _request(
         query: dict[str, Any] = {"key": self._api_key, "token": self._api_token}
         if params:
             query.update({k: v for k, v in params.items() if v is not None})
-        response = httpx.request(
+        response = _http.request(
             method,
             f"{TRELLO_API_BASE}{path}",
             params=query,
@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("twilio")
+
 
 def _get_credentials(credentials: CredentialStoreAdapter | None) -> tuple[str | None, str | None]:
     """Return (account_sid, auth_token)."""
@@ -46,7 +50,7 @@ def _request(
     headers = kwargs.pop("headers", {})
     headers["Authorization"] = _auth_header(account_sid, auth_token)
     try:
-        resp = getattr(httpx, method)(
+        resp = getattr(_http, method)(
             url,
             headers=headers,
             timeout=30.0,
@@ -340,7 +344,7 @@ def twilio_delete_message(message_sid: str) -> dict[str, Any]:
         headers: dict[str, str] = {}
         headers["Authorization"] = _auth_header(sid, token)
         try:
-            resp = httpx.delete(url, headers=headers, timeout=30.0)
+            resp = _http.delete(url, headers=headers, timeout=30.0)
             if resp.status_code == 204:
                 return {"sid": message_sid, "status": "deleted"}
             if resp.status_code == 401:
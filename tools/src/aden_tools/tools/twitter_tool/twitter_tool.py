@@ -9,9 +9,12 @@
 import os
 from typing import Any
 
-import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("twitter")
+
 BASE_URL = "https://api.x.com/2"
 
 TWEET_FIELDS = "created_at,public_metrics,author_id,lang"
@@ -28,7 +31,7 @@ def _get_headers() -> dict | None:
 
 def _get(path: str, headers: dict, params: dict | None = None) -> dict:
     """Send a GET request."""
-    resp = httpx.get(f"{BASE_URL}{path}", headers=headers, params=params, timeout=30)
+    resp = _http.get(f"{BASE_URL}{path}", headers=headers, params=params, timeout=30)
     if resp.status_code >= 400:
         return {"error": f"HTTP {resp.status_code}: {resp.text[:500]}"}
     return resp.json()
@@ -19,9 +19,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("vercel")
+
 VERCEL_API = "https://api.vercel.com"
 
 
@@ -37,7 +41,7 @@ def _headers(token: str) -> dict[str, str]:
 
 def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.get(
+        resp = _http.get(
             f"{VERCEL_API}/{endpoint}", headers=_headers(token), params=params, timeout=30.0
         )
         if resp.status_code == 401:
@@ -55,7 +59,7 @@ def _get(endpoint: str, token: str, params: dict | None = None) -> dict[str, Any
 
 def _post(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]:
     try:
-        resp = httpx.post(
+        resp = _http.post(
             f"{VERCEL_API}/{endpoint}", headers=_headers(token), json=body or {}, timeout=30.0
         )
         if resp.status_code == 401:
@@ -71,7 +75,7 @@ def _post(endpoint: str, token: str, body: dict | None = None) -> dict[str, Any]
 
 def _delete(endpoint: str, token: str) -> dict[str, Any]:
     try:
-        resp = httpx.delete(f"{VERCEL_API}/{endpoint}", headers=_headers(token), timeout=30.0)
+        resp = _http.delete(f"{VERCEL_API}/{endpoint}", headers=_headers(token), timeout=30.0)
         if resp.status_code not in (200, 204):
             return {"error": f"Vercel API error {resp.status_code}: {resp.text[:500]}"}
         return {"status": "deleted"}
@@ -25,9 +25,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("vision")
+
 VISION_API_URL = "https://vision.googleapis.com/v1/images:annotate"
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
@@ -76,7 +80,7 @@ def _call_api(
     ) -> dict[str, Any]:
         """Make request to Vision API."""
         try:
-            response = httpx.post(
+            response = _http.post(
                 VISION_API_URL,
                 params={"key": self._api_key},
                 json={"requests": [{"image": image_data, "features": features}]},
@@ -5,16 +5,38 @@
 enabling JavaScript-rendered content and bot detection evasion.
 Uses BeautifulSoup for HTML parsing and content extraction.
 Validates URLs against internal network ranges to prevent SSRF attacks.
+
+Pages are rendered in a warm, per-event-loop browser pool instead of
+launching Chromium for every call:
+
+- at most ``WEB_SCRAPE_MAX_PAGES`` pages render concurrently (default 4)
+- browser contexts are reused and recycled after
+  ``WEB_SCRAPE_CONTEXT_MAX_PAGES`` pages (default 20)
+- a crashed or disconnected browser is relaunched on the next call, and a
+  call that hit the crash is retried once
+- the browser is closed after ``WEB_SCRAPE_BROWSER_IDLE_TIMEOUT`` seconds
+  without work (default 300)
+
+Before rendering, a plain HTTP fetch is tried; if it already returns
+usable server-rendered HTML the browser is skipped entirely.
 """
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
+import logging
+import os
 import socket
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 
+import httpx
 from bs4 import BeautifulSoup
 from fastmcp import FastMCP
 from playwright.async_api import (
@@ -24,6 +46,8 @@
 )
 from playwright_stealth import Stealth
 
+logger = logging.getLogger(__name__)
+
 # Browser-like User-Agent for actual page requests
 BROWSER_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -31,6 +55,44 @@
     "Chrome/131.0.0.0 Safari/537.36"
 )
 
+_BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+]
+
+_NOISE_TAGS = ["script", "style", "nav", "footer", "header", "aside", "noscript", "iframe"]
+
+# Plain-HTTP fast path: pages with less main-content text than this, or
+# whose visible text asks for JavaScript, are rendered in the browser
+_STATIC_MIN_TEXT_CHARS = 500
+_STATIC_MAX_BYTES = 5 * 1024 * 1024
+_STATIC_MAX_REDIRECTS = 5
+_JS_REQUIRED_MARKERS = (
+    "enable javascript",
+    "javascript is disabled",
+    "javascript is required",
+    "requires javascript",
+    "turn on javascript",
+)
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r, using %s", name, raw, default)
+        return default
+
+
+_MAX_CONCURRENT_PAGES = max(1, int(_env_number("WEB_SCRAPE_MAX_PAGES", 4)))
+_CONTEXT_MAX_PAGES = max(1, int(_env_number("WEB_SCRAPE_CONTEXT_MAX_PAGES", 20)))
+_BROWSER_IDLE_TIMEOUT = _env_number("WEB_SCRAPE_BROWSER_IDLE_TIMEOUT", 300.0)
+
 
 def _is_internal_address(raw_ip: str) -> bool:
     """Check whether an IP address targets non-public infrastructure."""
@@ -75,6 +137,419 @@ def _check_url_target(url: str) -> str | None:
     return None
 
 
+def _is_html(content_type: str) -> bool:
+    return any(t in content_type for t in ["text/html", "application/xhtml+xml"])
+
+
+# ---------------------------------------------------------------------------
+# Browser pool
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _PooledContext:
+    context: Any
+    pages_served: int = 0
+
+
+class _BrowserPool:
+    """
+    A warm headless browser shared by all ``web_scrape`` calls on one event loop.
+
+    Playwright objects are bound to the loop that created them, so there is
+    one pool per running loop (see ``_get_browser_pool``).
+    """
+
+    def __init__(self, max_pages: int, context_max_pages: int, idle_timeout: float):
+        self.context_max_pages = context_max_pages
+        self.idle_timeout = idle_timeout
+        self._semaphore = asyncio.Semaphore(max_pages)
+        self._launch_lock = asyncio.Lock()
+        self._playwright_cm: Any = None
+        self._browser: Any = None
+        self._idle: list[_PooledContext] = []
+        self._active = 0
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self._idle_close_task: asyncio.Task | None = None
+        # Counters, useful for tests and debugging
+        self.launches = 0
+        self.contexts_created = 0
+        self.contexts_recycled = 0
+
+    @property
+    def browser_connected(self) -> bool:
+        """Whether the pooled browser is running (False if never launched or crashed)."""
+        if self._browser is None:
+            return False
+        try:
+            return bool(self._browser.is_connected())
+        except Exception:
+            return False
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """Check out a fresh page in a pooled context; blocks while the pool is full."""
+        async with self._semaphore:
+            self._active += 1
+            self._cancel_idle_close()
+            try:
+                slot = await self._checkout()
+                page = None
+                healthy = False
+                try:
+                    page = await slot.context.new_page()
+                    yield page
+                    healthy = True
+                finally:
+                    if page is not None:
+                        try:
+                            await page.close()
+                        except Exception:
+                            healthy = False
+                    await self._checkin(slot, healthy)
+            finally:
+                self._active -= 1
+                if self._active == 0:
+                    self._schedule_idle_close()
+
+    async def close(self) -> None:
+        """Close every pooled context, the browser and the Playwright driver."""
+        self._cancel_idle_close()
+        async with self._launch_lock:
+            await self._shutdown()
+
+    async def _checkout(self) -> _PooledContext:
+        if not self.browser_connected:
+            await self._relaunch()
+        if self._idle:
+            return self._idle.pop()
+        context = await self._browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=BROWSER_USER_AGENT,
+            locale="en-US",
+        )
+        self.contexts_created += 1
+        return _PooledContext(context)
+
+    async def _checkin(self, slot: _PooledContext, healthy: bool) -> None:
+        slot.pages_served += 1
+        reuse = healthy and self.browser_connected and slot.pages_served < self.context_max_pages
+        if reuse:
+            try:
+                # Don't carry session state from one scrape into the next
+                await slot.context.clear_cookies()
+            except Exception:
+                reuse = False
+        if reuse:
+            self._idle.append(slot)
+            return
+        if slot.pages_served >= self.context_max_pages:
+            self.contexts_recycled += 1
+        await _close_quietly(slot.context)
+
+    async def _relaunch(self) -> None:
+        async with self._launch_lock:
+            if self.browser_connected:
+                return  # Another caller relaunched while we waited
+            if self._browser is not None:
+                logger.warning("Pooled browser disconnected, relaunching")
+            await self._shutdown()
+            cm = async_playwright()
+            playwright = await cm.__aenter__()
+            try:
+                browser = await playwright.chromium.launch(headless=True, args=_BROWSER_ARGS)
+            except BaseException:
+                await cm.__aexit__(None, None, None)
+                raise
+            self._playwright_cm = cm
+            self._browser = browser
+            self.launches += 1
+
+    async def _shutdown(self) -> None:
+        # Detach everything before the first await so callers never see half-closed state
+        idle, self._idle = self._idle, []
+        browser, self._browser = self._browser, None
+        cm, self._playwright_cm = self._playwright_cm, None
+        for slot in idle:
+            await _close_quietly(slot.context)
+        if browser is not None:
+            await _close_quietly(browser)
+        if cm is not None:
+            try:
+                await cm.__aexit__(None, None, None)
+            except Exception:
+                logger.debug("Failed to stop Playwright", exc_info=True)
+
+    def _schedule_idle_close(self) -> None:
+        if self.idle_timeout <= 0 or self._browser is None:
+            return
+        loop = asyncio.get_running_loop()
+        self._idle_handle = loop.call_later(self.idle_timeout, self._on_idle_timeout)
+
+    def _cancel_idle_close(self) -> None:
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def _on_idle_timeout(self) -> None:
+        self._idle_handle = None
+        if self._active == 0:
+            self._idle_close_task = asyncio.ensure_future(self._close_if_idle())
+
+    async def _close_if_idle(self) -> None:
+        async with self._launch_lock:
+            if self._active == 0:
+                await self._shutdown()
+
+
+async def _close_quietly(closeable: Any) -> None:
+    try:
+        await closeable.close()
+    except Exception:
+        logger.debug("Failed to close %r", closeable, exc_info=True)
+
+
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _BrowserPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_browser_pool() -> _BrowserPool:
+    """Return the browser pool for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _BrowserPool(_MAX_CONCURRENT_PAGES, _CONTEXT_MAX_PAGES, _BROWSER_IDLE_TIMEOUT)
+        _pools[loop] = pool
+    return pool
+
+
+async def close_browser_pool() -> None:
+    """Shut down the browser pool of the running event loop, if any."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+# ---------------------------------------------------------------------------
+# Plain-HTTP fast path
+# ---------------------------------------------------------------------------
+
+
+class _RedirectBlocked(Exception):
+    """A redirect during the plain HTTP fetch pointed at an internal address."""
+
+    def __init__(self, result: dict[str, Any]):
+        super().__init__(result["error"])
+        self.result = result
+
+
+@dataclass
+class _StaticPage:
+    status: int
+    content_type: str
+    final_url: str
+    html: str
+
+
+async def _fetch_static(url: str) -> _StaticPage | None:
+    """
+    Fetch ``url`` without a browser, validating every redirect hop.
+
+    Returns:
+        The response, or None if the body exceeds ``_STATIC_MAX_BYTES``
+
+    Raises:
+        _RedirectBlocked: If a redirect targets an internal address
+        httpx.HTTPError: On network errors or too many redirects
+    """
+    headers = {"User-Agent": BROWSER_USER_AGENT, "Accept-Language": "en-US,en;q=0.9"}
+    async with httpx.AsyncClient(headers=headers, timeout=15.0, follow_redirects=False) as client:
+        for _ in range(_STATIC_MAX_REDIRECTS + 1):
+            async with client.stream("GET", url) as response:
+                if response.is_redirect:
+                    url = str(response.url.join(response.headers["location"]))
+                    block = _check_url_target(url)
+                    if block is not None:
+                        raise _RedirectBlocked(
+                            {"error": block, "blocked_by_ssrf_protection": True, "url": url}
+                        )
+                    continue
+
+                content_type = response.headers.get("content-type", "").lower()
+                body = b""
+                if response.status_code == 200 and _is_html(content_type):
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                        if len(body) > _STATIC_MAX_BYTES:
+                            return None
+                html = body.decode(response.encoding or "utf-8", errors="replace")
+                return _StaticPage(response.status_code, content_type, str(response.url), html)
+    raise httpx.TooManyRedirects(f"Exceeded {_STATIC_MAX_REDIRECTS} redirects", request=None)
+
+
+# ---------------------------------------------------------------------------
+# Content extraction
+# ---------------------------------------------------------------------------
+
+
+def _parse_html(html: str) -> BeautifulSoup:
+    """Parse HTML and strip noise elements."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(_NOISE_TAGS):
+        tag.decompose()
+    return soup
+
+
+def _main_text(soup: BeautifulSoup, selector: str | None) -> str | None:
+    """Whitespace-normalised text of the target content; None if ``selector`` matched nothing."""
+    if selector:
+        content_elem = soup.select_one(selector)
+        if not content_elem:
+            return None
+        text = content_elem.get_text(separator=" ", strip=True)
+    else:
+        # Auto-detect main content
+        main_content = (
+            soup.find("article")
+            or soup.find("main")
+            or soup.find(attrs={"role": "main"})
+            or soup.find(class_=["content", "post", "entry", "article-body"])
+            or soup.find("body")
+        )
+        text = main_content.get_text(separator=" ", strip=True) if main_content else ""
+    return " ".join(text.split())
+
+
+def _is_usable_static(text: str | None) -> bool:
+    """Whether server-rendered text is good enough to skip JavaScript rendering."""
+    if text is None or len(text) < _STATIC_MIN_TEXT_CHARS:
+        return False
+    lowered = text.lower()
+    return not any(marker in lowered for marker in _JS_REQUIRED_MARKERS)
+
+
+def _build_result(
+    soup: BeautifulSoup,
+    text: str | None,
+    *,
+    url: str,
+    base_url: str,
+    selector: str | None,
+    include_links: bool,
+    max_length: int,
+) -> dict[str, Any]:
+    if text is None:
+        return {"error": f"No elements found matching selector: {selector}"}
+
+    # Get title and description
+    title = soup.title.get_text(strip=True) if soup.title else ""
+
+    description = ""
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    if meta_desc:
+        description = meta_desc.get("content", "")
+
+    # Truncate if needed
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+
+    result: dict[str, Any] = {
+        "url": url,
+        "title": title,
+        "description": description,
+        "content": text,
+        "length": len(text),
+    }
+
+    # Extract links if requested
+    if include_links:
+        links: list[dict[str, str]] = []
+        for a in soup.find_all("a", href=True)[:50]:
+            href = a["href"]
+            # Convert relative URLs to absolute URLs (base is the final URL after redirects)
+            absolute_href = urljoin(base_url, href)
+            link_text = a.get_text(strip=True)
+            if link_text and absolute_href:
+                links.append({"text": link_text, "href": absolute_href})
+        result["links"] = links
+
+    return result
+
+
+async def _render_page(url: str) -> dict[str, Any] | tuple[str, str]:
+    """
+    Render ``url`` in a pooled browser page.
+
+    Returns:
+        ``(html, final_url)`` on success, or an error dict
+    """
+    async with _get_browser_pool().page() as page:
+        await Stealth().apply_stealth_async(page)
+
+        # Intercept navigation requests to block SSRF via redirects.
+        # Only check "document" requests (navigations), not
+        # sub-resources (CSS/JS/images) to avoid false positives
+        # and unnecessary DNS lookups.
+        ssrf_blocked: dict[str, Any] | None = None
+
+        async def _ssrf_route_handler(route):
+            nonlocal ssrf_blocked
+            req_url = route.request.url
+
+            # Skip non-network schemes (data:, blob:, etc.)
+            if urlparse(req_url).scheme not in {"http", "https"}:
+                await route.continue_()
+                return
+
+            block = _check_url_target(req_url)
+            if block is not None:
+                ssrf_blocked = {
+                    "error": block,
+                    "blocked_by_ssrf_protection": True,
+                    "url": req_url,
+                }
+                await route.abort("blockedbyclient")
+            else:
+                await route.continue_()
+
+        await page.route("**/*", _ssrf_route_handler)
+
+        response = await page.goto(
+            url,
+            wait_until="domcontentloaded",
+            timeout=60000,
+        )
+
+        # Check if a redirect was blocked by SSRF protection
+        if ssrf_blocked is not None:
+            return ssrf_blocked
+
+        # Validate response before waiting for JS render
+        if response is None:
+            return {"error": "Navigation failed: no response received"}
+
+        if response.status != 200:
+            return {"error": f"HTTP {response.status}: Failed to fetch URL"}
+
+        content_type = response.headers.get("content-type", "").lower()
+        if not _is_html(content_type):
+            return {
+                "error": (f"Skipping non-HTML content (Content-Type: {content_type})"),
+                "url": url,
+                "skipped": True,
+            }
+
+        # Wait for JS to finish rendering dynamic content
+        try:
+            await page.wait_for_load_state("networkidle", timeout=3000)
+        except PlaywrightTimeout:
+            pass  # Proceed with whatever has loaded
+
+        # Get fully rendered HTML
+        return await page.content(), str(response.url)
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register web scrape tools with the MCP server."""
 
@@ -85,6 +560,7 @@ async def web_scrape(
         include_links: bool = False,
         max_length: int = 50000,
         respect_robots_txt: bool = True,
+        render_js: bool | None = None,
     ) -> dict:
         """
         Scrape and extract text content from a webpage.
@@ -99,6 +575,9 @@ async def web_scrape(
             include_links: Include extracted links in the response
             max_length: Maximum length of extracted text (1000-500000)
             respect_robots_txt: Whether to respect robots.txt rules (default True)
+            render_js: None (default) tries a fast plain HTTP fetch and only renders
+                in the browser if the page needs JavaScript; True always renders;
+                False never launches the browser
 
         Returns:
             Dict with scraped content (url, title, description, content, length) or error dict
@@ -117,7 +596,7 @@ async def web_scrape(
             if block_reason is not None:
                 return {"error": block_reason, "blocked_by_ssrf_protection": True, "url": url}
 
-            # Check robots.txt before launching browser
+            # Check robots.txt before fetching the page
             if respect_robots_txt:
                 try:
                     parsed = urlparse(url)
@@ -134,153 +613,59 @@ async def web_scrape(
                 except Exception:
                     pass  # If robots.txt can't be fetched, proceed anyway
 
-            # Launch headless browser with stealth
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-blink-features=AutomationControlled",
-                    ],
-                )
-                try:
-                    context = await browser.new_context(
-                        viewport={"width": 1920, "height": 1080},
-                        user_agent=BROWSER_USER_AGENT,
-                        locale="en-US",
-                    )
-                    page = await context.new_page()
-                    await Stealth().apply_stealth_async(page)
-
-                    # Intercept navigation requests to block SSRF via redirects.
-                    # Only check "document" requests (navigations), not
-                    # sub-resources (CSS/JS/images) to avoid false positives
-                    # and unnecessary DNS lookups.
-                    ssrf_blocked: dict[str, Any] | None = None
-
-                    async def _ssrf_route_handler(route):
-                        nonlocal ssrf_blocked
-                        req_url = route.request.url
-
-                        # Skip non-network schemes (data:, blob:, etc.)
-                        if urlparse(req_url).scheme not in {"http", "https"}:
-                            await route.continue_()
-                            return
-
-                        block = _check_url_target(req_url)
-                        if block is not None:
-                            ssrf_blocked = {
-                                "error": block,
-                                "blocked_by_ssrf_protection": True,
-                                "url": req_url,
-                            }
-                            await route.abort("blockedbyclient")
-                        else:
-                            await route.continue_()
-
-                    await page.route("**/*", _ssrf_route_handler)
-
-                    response = await page.goto(
-                        url,
-                        wait_until="domcontentloaded",
-                        timeout=60000,
-                    )
-
-                    # Check if a redirect was blocked by SSRF protection
-                    if ssrf_blocked is not None:
-                        return ssrf_blocked
-
-                    # Validate response before waiting for JS render
-                    if response is None:
-                        return {"error": "Navigation failed: no response received"}
-
-                    if response.status != 200:
-                        return {"error": f"HTTP {response.status}: Failed to fetch URL"}
-
-                    content_type = response.headers.get("content-type", "").lower()
-                    if not any(t in content_type for t in ["text/html", "application/xhtml+xml"]):
-                        return {
-                            "error": (f"Skipping non-HTML content (Content-Type: {content_type})"),
-                            "url": url,
-                            "skipped": True,
-                        }
-
-                    # Wait for JS to finish rendering dynamic content
-                    try:
-                        await page.wait_for_load_state("networkidle", timeout=3000)
-                    except PlaywrightTimeout:
-                        pass  # Proceed with whatever has loaded
-
-                    # Get fully rendered HTML
-                    html_content = await page.content()
-                finally:
-                    await browser.close()
-
-            # Parse rendered HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Remove noise elements
-            for tag in soup(
-                ["script", "style", "nav", "footer", "header", "aside", "noscript", "iframe"]
-            ):
-                tag.decompose()
-
-            # Get title and description
-            title = soup.title.get_text(strip=True) if soup.title else ""
-
-            description = ""
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            if meta_desc:
-                description = meta_desc.get("content", "")
-
-            # Target content
-            if selector:
-                content_elem = soup.select_one(selector)
-                if not content_elem:
-                    return {"error": f"No elements found matching selector: {selector}"}
-                text = content_elem.get_text(separator=" ", strip=True)
-            else:
-                # Auto-detect main content
-                main_content = (
-                    soup.find("article")
-                    or soup.find("main")
-                    or soup.find(attrs={"role": "main"})
-                    or soup.find(class_=["content", "post", "entry", "article-body"])
-                    or soup.find("body")
-                )
-                text = main_content.get_text(separator=" ", strip=True) if main_content else ""
-
-            # Clean up whitespace
-            text = " ".join(text.split())
-
-            # Truncate if needed
-            if len(text) > max_length:
-                text = text[:max_length] + "..."
-
-            result: dict[str, Any] = {
+            extract = {
                 "url": url,
-                "title": title,
-                "description": description,
-                "content": text,
-                "length": len(text),
+                "selector": selector,
+                "include_links": include_links,
+                "max_length": max_length,
             }
 
-            # Extract links if requested
-            if include_links:
-                links: list[dict[str, str]] = []
-                base_url = str(response.url)  # Use final URL after redirects
-                for a in soup.find_all("a", href=True)[:50]:
-                    href = a["href"]
-                    # Convert relative URLs to absolute URLs
-                    absolute_href = urljoin(base_url, href)
-                    link_text = a.get_text(strip=True)
-                    if link_text and absolute_href:
-                        links.append({"text": link_text, "href": absolute_href})
-                result["links"] = links
-
-            return result
+            # Fast path: server-rendered pages don't need a browser
+            if render_js is not True:
+                try:
+                    static = await _fetch_static(url)
+                except _RedirectBlocked as e:
+                    return e.result
+                except httpx.HTTPError as e:
+                    if render_js is False:
+                        return {"error": f"Request failed: {e!s}"}
+                    static = None
+
+                if static is None:
+                    if render_js is False:
+                        return {"error": "Response too large to fetch without the browser"}
+                elif static.status == 200 and not _is_html(static.content_type):
+                    return {
+                        "error": f"Skipping non-HTML content (Content-Type: {static.content_type})",
+                        "url": url,
+                        "skipped": True,
+                    }
+                elif static.status == 200:
+                    soup = _parse_html(static.html)
+                    text = _main_text(soup, selector)
+                    if render_js is False or _is_usable_static(text):
+                        return _build_result(soup, text, base_url=static.final_url, **extract)
+                elif render_js is False:
+                    return {"error": f"HTTP {static.status}: Failed to fetch URL"}
+
+            # Render in the pooled headless browser; retry once if it crashed
+            for attempt in range(2):
+                try:
+                    rendered = await _render_page(url)
+                    break
+                except PlaywrightTimeout:
+                    raise
+                except PlaywrightError:
+                    if attempt or _get_browser_pool().browser_connected:
+                        raise
+                    logger.warning("Browser crashed while scraping %s, retrying", url)
+
+            if isinstance(rendered, dict):
+                return rendered
+            html_content, final_url = rendered
+
+            soup = _parse_html(html_content)
+            return _build_result(soup, _main_text(soup, selector), base_url=final_url, **extract)
 
         except PlaywrightTimeout:
             return {"error": "Request timed out"}
@@ -17,9 +17,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("web_search")
+
 
 def register_tools(
     mcp: FastMCP,
@@ -38,7 +42,7 @@ def _search_google(
         """Execute search using Google Custom Search API."""
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.get(
+            response = _http.get(
                 "https://www.googleapis.com/customsearch/v1",
                 params={
                     "key": api_key,
@@ -93,7 +97,7 @@ def _search_brave(
         """Execute search using Brave Search API."""
         max_retries = 3
         for attempt in range(max_retries + 1):
-            response = httpx.get(
+            response = _http.get(
                 "https://api.search.brave.com/res/v1/web/search",
                 params={
                     "q": query,
@@ -152,7 +156,7 @@ def _get_credentials() -> dict:
             "brave_api_key": os.getenv("BRAVE_SEARCH_API_KEY"),
         }
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache_ttl": 900})
     def web_search(
         query: str,
         num_results: int = 10,
@@ -12,6 +12,10 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
+_http = pooled_client("wikipedia")
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register wikipedia tool with the MCP server."""
@@ -22,7 +26,7 @@ def _strip_html(text: str) -> str:
             return ""
         return re.sub(r"<[^>]+>", "", text)
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache_ttl": 86400})
     def search_wikipedia(query: str, lang: str = "en", num_results: int = 3) -> dict:
         """
         Search Wikipedia for a given query and return summaries of top matching articles.
@@ -43,7 +47,7 @@ def search_wikipedia(query: str, lang: str = "en", num_results: int = 3) -> dict
 
         try:
             # 1. Search for pages
-            response = httpx.get(
+            response = _http.get(
                 base_url,
                 params={"q": query, "limit": num_results},
                 timeout=10.0,
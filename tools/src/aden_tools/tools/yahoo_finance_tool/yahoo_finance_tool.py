@@ -28,7 +28,7 @@ def _get_ticker(symbol: str) -> Any:
 def register_tools(mcp: FastMCP) -> None:
     """Register Yahoo Finance tools with the MCP server (no credentials needed)."""
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache_ttl": 60})
     def yahoo_finance_quote(symbol: str) -> dict[str, Any]:
         """
         Get current stock quote and key statistics.
@@ -69,7 +69,7 @@ def yahoo_finance_quote(symbol: str) -> dict[str, Any]:
         except Exception as e:
             return {"error": f"Failed to fetch quote for {symbol}: {e!s}"}
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache_ttl": 3600})
     def yahoo_finance_history(
         symbol: str,
         period: str = "1mo",
@@ -111,7 +111,7 @@ def yahoo_finance_history(
         except Exception as e:
             return {"error": f"Failed to fetch history for {symbol}: {e!s}"}
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache_ttl": 86400})
     def yahoo_finance_financials(
         symbol: str,
         statement: str = "income",
@@ -161,7 +161,7 @@ def yahoo_finance_financials(
         except Exception as e:
             return {"error": f"Failed to fetch financials for {symbol}: {e!s}"}
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache_ttl": 86400})
     def yahoo_finance_info(symbol: str) -> dict[str, Any]:
         """
         Get detailed company information.
@@ -201,7 +201,7 @@ def yahoo_finance_info(symbol: str) -> dict[str, Any]:
         except Exception as e:
             return {"error": f"Failed to fetch info for {symbol}: {e!s}"}
 
-    @mcp.tool()
+    @mcp.tool(meta={"cache_ttl": 86400})
     def yahoo_finance_search(query: str) -> dict[str, Any]:
         """
         Search for stock tickers by company name or keyword.
@@ -15,9 +15,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("youtube")
+
 YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
 MAX_RESULTS_LIMIT = 50  # YouTube API max per page
 
@@ -37,7 +41,7 @@ def _request(
     params["key"] = api_key
     url = f"{YOUTUBE_API_BASE}/{endpoint}"
     try:
-        resp = httpx.get(url, params=params, timeout=30.0)
+        resp = _http.get(url, params=params, timeout=30.0)
         if resp.status_code == 403:
             data = resp.json()
             reason = ""
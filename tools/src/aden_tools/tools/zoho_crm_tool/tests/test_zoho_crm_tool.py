@@ -71,7 +71,7 @@ def test_handle_response_generic_error(self):
         assert "error" in result
         assert "500" in result["error"]
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get")
     def test_search_records(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -89,7 +89,7 @@ def test_search_records(self, mock_get):
         assert result["data"]
         assert result["info"]["page"] == 1
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get")
     def test_get_record(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -105,7 +105,7 @@ def test_get_record(self, mock_get):
         )
         assert result["data"][0]["id"] == "1192161000000585006"
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.post")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.post")
     def test_create_record(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -125,7 +125,7 @@ def test_create_record(self, mock_post):
         )
         assert result["data"][0]["details"]["id"] == "1192161000000586001"
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.put")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.put")
     def test_update_record(self, mock_put):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -144,7 +144,7 @@ def test_update_record(self, mock_put):
         )
         assert result["data"][0]["details"]["id"] == "1192161000000586001"
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.post")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.post")
     def test_add_note_parent_id_structure(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -198,7 +198,7 @@ def test_credentials_from_adapter(self):
 
         search_fn = next(fn for fn in registered_fns if fn.__name__ == "zoho_crm_search")
 
-        with patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get") as mock_get:
+        with patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get") as mock_get:
             mock_get.return_value = MagicMock(
                 status_code=200,
                 json=MagicMock(return_value={"data": [], "info": {"page": 1, "per_page": 2}}),
@@ -220,7 +220,7 @@ def test_credentials_from_env_ZOHO_ACCESS_TOKEN(self):
 
         with (
             patch.dict("os.environ", {"ZOHO_ACCESS_TOKEN": "env-token"}),
-            patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get") as mock_get,
         ):
             mock_get.return_value = MagicMock(
                 status_code=200,
@@ -248,7 +248,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get")
     def test_zoho_crm_search_success(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -267,7 +267,7 @@ def test_zoho_crm_search_success(self, mock_get):
         assert "data" in result
         assert "raw" in result
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get")
     def test_zoho_crm_search_next_page(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -291,7 +291,7 @@ def test_zoho_crm_search_no_word_or_criteria(self):
         assert "error" in result
         assert "word" in result["error"] or "criteria" in result["error"]
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get")
     def test_zoho_crm_get_record_success(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -301,7 +301,7 @@ def test_zoho_crm_get_record_success(self, mock_get):
         assert result["success"] is True
         assert result["data"]["id"] == "123"
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.post")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.post")
     def test_zoho_crm_create_record_success(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -316,7 +316,7 @@ def test_zoho_crm_create_record_success(self, mock_post):
         assert result["success"] is True
         assert result["id"] == "456"
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.put")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.put")
     def test_zoho_crm_update_record_success(self, mock_put):
         mock_put.return_value = MagicMock(
             status_code=200,
@@ -328,7 +328,7 @@ def test_zoho_crm_update_record_success(self, mock_put):
         assert result["success"] is True
         assert result["id"] == "123"
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.post")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.post")
     def test_zoho_crm_add_note_success(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -344,14 +344,14 @@ def test_zoho_crm_add_note_success(self, mock_post):
         assert result["id"] == "note-1"
         assert result["data"]["parent_id"] == "123"
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get")
     def test_zoho_crm_search_timeout(self, mock_get):
         mock_get.side_effect = httpx.TimeoutException("timed out")
         result = self._fn("zoho_crm_search")(module="Leads", word="test")
         assert "error" in result
         assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get")
+    @patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get")
     def test_zoho_crm_get_record_network_error(self, mock_get):
         mock_get.side_effect = httpx.RequestError("connection failed")
         result = self._fn("zoho_crm_get_record")(module="Leads", id="1")
@@ -499,7 +499,7 @@ def test_tool_uses_stored_api_domain(self):
         register_tools(mcp, credentials=cred)
 
         search_fn = next(fn for fn in fns if fn.__name__ == "zoho_crm_search")
-        with patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool.httpx.get") as mock_get:
+        with patch("aden_tools.tools.zoho_crm_tool.zoho_crm_tool._http.get") as mock_get:
             mock_get.return_value = MagicMock(
                 status_code=200,
                 json=MagicMock(return_value={"data": [], "info": {"page": 1, "per_page": 2}}),
@@ -15,9 +15,13 @@
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http_client import pooled_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+_http = pooled_client("zoom")
+
 ZOOM_API_BASE = "https://api.zoom.us/v2"
 
 
@@ -91,7 +95,7 @@ def zoom_get_user(user_id: str = "me") -> dict:
             return token
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{ZOOM_API_BASE}/users/{user_id}",
                 headers=_headers(token),
                 timeout=30.0,
@@ -149,7 +153,7 @@ def zoom_list_meetings(
             if next_page_token:
                 params["next_page_token"] = next_page_token
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{ZOOM_API_BASE}/users/{user_id}/meetings",
                 headers=_headers(token),
                 params=params,
@@ -208,7 +212,7 @@ def zoom_get_meeting(meeting_id: str) -> dict:
             return {"error": "meeting_id is required"}
 
         try:
-            resp = httpx.get(
+            resp = _http.get(
                 f"{ZOOM_API_BASE}/meetings/{meeting_id}",
                 headers=_headers(token),
                 timeout=30.0,
@@ -290,7 +294,7 @@ def zoom_create_meeting(
             if agenda:
                 body["agenda"] = agenda
 
-            resp = httpx.post(
+            resp = _http.post(
                 f"{ZOOM_API_BASE}/users/{user_id}/meetings",
                 headers=_headers(token),
                 json=body,
@@ -335,7 +339,7 @@ def zoom_delete_meeting(meeting_id: str) -> dict:
             return {"error": "meeting_id is required"}
 
         try:
-            resp = httpx.delete(
+            resp = _http.delete(
                 f"{ZOOM_API_BASE}/meetings/{meeting_id}",
                 headers=_headers(token),
                 timeout=30.0,
@@ -383,7 +387,7 @@ def zoom_list_recordings(
             if next_page_token:
                 params["next_page_token"] = next_page_token
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{ZOOM_API_BASE}/users/{user_id}/recordings",
                 headers=_headers(token),
                 params=params,
@@ -479,7 +483,7 @@ def zoom_update_meeting(
             return {"error": "At least one field to update is required"}
 
         try:
-            resp = httpx.patch(
+            resp = _http.patch(
                 f"{ZOOM_API_BASE}/meetings/{meeting_id}",
                 headers=_headers(token),
                 json=body,
@@ -522,7 +526,7 @@ def zoom_list_meeting_participants(
             if next_page_token:
                 params["next_page_token"] = next_page_token
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{ZOOM_API_BASE}/past_meetings/{meeting_id}/participants",
                 headers=_headers(token),
                 params=params,
@@ -593,7 +597,7 @@ def zoom_list_meeting_registrants(
             if next_page_token:
                 params["next_page_token"] = next_page_token
 
-            resp = httpx.get(
+            resp = _http.get(
                 f"{ZOOM_API_BASE}/meetings/{meeting_id}/registrants",
                 headers=_headers(token),
                 params=params,
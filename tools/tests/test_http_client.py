@@ -0,0 +1,93 @@
+"""Tests for the shared pooled HTTP client layer."""
+
+from __future__ import annotations
+
+import http.server
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from aden_tools import http_client
+from aden_tools.http_client import (
+    PooledClient,
+    close_http_clients,
+    get_http_client,
+    pooled_client,
+)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=abc")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pools():
+    close_http_clients()
+    http_client._stats.clear()
+    yield
+    close_http_clients()
+    http_client._stats.clear()
+
+
+class TestPooledClient:
+    def test_reuses_connections(self, server_url):
+        client = pooled_client("test_reuse")
+        for _ in range(5):
+            assert client.get(server_url, timeout=5.0).json() == {"ok": True}
+
+        stats = client.stats
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["reused_connections"] == 4
+
+    def test_one_client_per_integration(self):
+        assert get_http_client("a") is get_http_client("a")
+        assert get_http_client("a") is not get_http_client("b")
+
+    def test_cookies_are_not_persisted(self, server_url):
+        client = pooled_client("test_cookies")
+        client.get(server_url)
+        assert len(get_http_client("test_cookies").cookies) == 0
+
+    def test_client_only_options_fall_back_to_one_shot_request(self, server_url):
+        client = pooled_client("test_unpooled")
+        response = client.get(server_url, verify=False)
+        assert response.status_code == 200
+        assert client.stats["unpooled_requests"] == 1
+
+    def test_does_not_proxy_the_httpx_module(self):
+        client = pooled_client("test_attrs")
+        assert isinstance(client, PooledClient)
+        with pytest.raises(AttributeError):
+            client.TimeoutException  # noqa: B018
+
+    def test_methods_route_through_request(self):
+        client = pooled_client("test_patch")
+        with patch.object(client, "request") as mock_request:
+            client.post("https://example.com", json={"a": 1}, timeout=3)
+        mock_request.assert_called_once_with(
+            "POST", "https://example.com", json={"a": 1}, timeout=3
+        )
@@ -0,0 +1,164 @@
+"""Tests for lazy tool registration from the prebuilt tool manifest."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+from fastmcp import FastMCP
+from fastmcp.tools.tool import FunctionTool
+
+from aden_tools.tools import VERIFIED_TOOL_MODULES, _register_module
+from aden_tools.tools.manifest import (
+    LazyTool,
+    build_tool_manifest,
+    load_tool_manifest,
+    register_lazy,
+    write_tool_manifest,
+)
+
+SMALL_MODULES = (("example_tool", False), ("time_tool", False))
+
+
+@pytest.fixture
+def manifest_path(tmp_path: Path) -> Path:
+    path = tmp_path / "tool_manifest.json"
+    write_tool_manifest(build_tool_manifest(SMALL_MODULES), path)
+    return path
+
+
+def _importtime(code: str, env: dict[str, str] | None = None) -> tuple[dict[str, int], str]:
+    """Run ``code`` under ``python -X importtime``; return (cumulative us per module, stdout)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        timeout=300,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative, proc.stdout
+
+
+def _integration_modules(imported: dict[str, int]) -> set[str]:
+    prefixes = tuple(f"aden_tools.tools.{module}" for module, _ in VERIFIED_TOOL_MODULES)
+    return {name for name in imported if name.startswith(prefixes)}
+
+
+class TestLazyRegistration:
+    def test_lazy_tools_match_manifest_schemas(self, manifest_path):
+        eager = FastMCP("eager")
+        for module, takes_credentials in SMALL_MODULES:
+            _register_module(eager, module, takes_credentials)
+        lazy = FastMCP("lazy")
+        register_lazy(lazy, SMALL_MODULES, manifest_path=manifest_path)
+
+        for name, tool in lazy._tool_manager._tools.items():
+            assert isinstance(tool, LazyTool)
+            real = eager._tool_manager._tools[name]
+            assert tool.parameters == real.parameters
+            assert tool.description == real.description
+            assert tool.output_schema == real.output_schema
+
+    @pytest.mark.asyncio
+    async def test_first_call_loads_module_and_delegates(self, manifest_path):
+        lazy = FastMCP("lazy")
+        register_lazy(lazy, SMALL_MODULES, manifest_path=manifest_path)
+        tool = lazy._tool_manager._tools["example_tool"]
+        assert not tool._loader.loaded
+
+        result = await lazy._tool_manager.call_tool(
+            "example_tool", {"message": "hi", "uppercase": True, "repeat": 2}
+        )
+
+        assert tool._loader.loaded
+        assert result.content[0].text == "HI HI"
+
+    def test_stale_module_is_registered_eagerly_and_manifest_refreshed(self, manifest_path):
+        manifest = json.loads(manifest_path.read_text())
+        manifest["modules"]["time_tool"]["fingerprint"] = "outdated"
+        del manifest["modules"]["example_tool"]
+        write_tool_manifest(manifest, manifest_path)
+
+        mcp = FastMCP("lazy")
+        register_lazy(mcp, SMALL_MODULES, manifest_path=manifest_path)
+
+        assert isinstance(mcp._tool_manager._tools["get_current_time"], FunctionTool)
+        assert isinstance(mcp._tool_manager._tools["example_tool"], FunctionTool)
+        refreshed = load_tool_manifest(manifest_path)
+        assert refreshed["modules"]["time_tool"]["fingerprint"] != "outdated"
+        assert "example_tool" in refreshed["modules"]
+
+        # The next start is fully lazy again
+        mcp = FastMCP("lazy-again")
+        register_lazy(mcp, SMALL_MODULES, manifest_path=manifest_path)
+        assert all(isinstance(t, LazyTool) for t in mcp._tool_manager._tools.values())
+
+    def test_unreadable_manifest_is_ignored(self, tmp_path):
+        path = tmp_path / "tool_manifest.json"
+        path.write_text("{not json")
+        assert load_tool_manifest(path) is None
+        assert load_tool_manifest(tmp_path / "missing.json") is None
+
+
+class TestStartupImportTime:
+    def test_importing_tools_package_does_not_import_integrations(self):
+        imported, _ = _importtime("import aden_tools.tools")
+        assert "aden_tools.tools" in imported
+        assert _integration_modules(imported) == set()
+
+    def test_lazy_startup_benchmark(self, tmp_path):
+        """Report startup import time for eager vs lazy registration of verified tools."""
+        path = tmp_path / "tool_manifest.json"
+        write_tool_manifest(build_tool_manifest(VERIFIED_TOOL_MODULES), path)
+        script = textwrap.dedent(
+            """
+            import time
+            start = time.perf_counter()
+            from fastmcp import FastMCP
+            from aden_tools.tools import register_all_tools
+            names = register_all_tools(FastMCP("bench"), lazy={lazy})
+            print(len(names), time.perf_counter() - start)
+            """
+        )
+
+        results = {}
+        for lazy in (False, True):
+            start = time.perf_counter()
+            imported, stdout = _importtime(
+                script.format(lazy=lazy), env={"ADEN_TOOL_MANIFEST": str(path)}
+            )
+            wall = time.perf_counter() - start
+            n_tools, startup = stdout.split()
+            results[lazy] = (imported, int(n_tools), float(startup), wall)
+
+        eager_imports, eager_tools, eager_startup, eager_wall = results[False]
+        lazy_imports, lazy_tools, lazy_startup, lazy_wall = results[True]
+
+        report = [
+            f"eager: {eager_tools} tools, {len(eager_imports)} modules, "
+            f"startup {eager_startup * 1000:.0f} ms (process {eager_wall * 1000:.0f} ms)",
+            f"lazy:  {lazy_tools} tools, {len(lazy_imports)} modules, "
+            f"startup {lazy_startup * 1000:.0f} ms (process {lazy_wall * 1000:.0f} ms)",
+            "slowest eager-only imports (cumulative):",
+        ]
+        eager_only = {k: v for k, v in eager_imports.items() if k not in lazy_imports}
+        for name, us in sorted(eager_only.items(), key=lambda kv: -kv[1])[:10]:
+            report.append(f"  {us / 1000:8.1f} ms  {name}")
+        print("\n".join(report))
+
+        assert lazy_tools == eager_tools
+        assert _integration_modules(lazy_imports) == set()
+        assert lazy_startup < eager_startup
@@ -48,7 +48,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.airtable_tool.airtable_tool.httpx.get",
+                "aden_tools.tools.airtable_tool.airtable_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -62,7 +62,7 @@ def test_pagination(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.airtable_tool.airtable_tool.httpx.get",
+                "aden_tools.tools.airtable_tool.airtable_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -82,7 +82,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.airtable_tool.airtable_tool.httpx.get",
+                "aden_tools.tools.airtable_tool.airtable_tool._http.get",
                 return_value=_mock_resp(RECORD_DATA),
             ),
         ):
@@ -125,7 +125,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.airtable_tool.airtable_tool.httpx.post",
+                "aden_tools.tools.airtable_tool.airtable_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -147,7 +147,7 @@ def test_successful_update(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.airtable_tool.airtable_tool.httpx.patch",
+                "aden_tools.tools.airtable_tool.airtable_tool._http.patch",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -176,7 +176,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.airtable_tool.airtable_tool.httpx.get",
+                "aden_tools.tools.airtable_tool.airtable_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -208,7 +208,7 @@ def test_successful_schema(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.airtable_tool.airtable_tool.httpx.get",
+                "aden_tools.tools.airtable_tool.airtable_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -40,7 +40,7 @@ def test_successful_run(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.apify_tool.apify_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.apify_tool.apify_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 201
             mock_post.return_value.json.return_value = mock_resp
@@ -71,7 +71,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.apify_tool.apify_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.apify_tool.apify_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -94,7 +94,7 @@ def test_successful_get(self, tool_fns):
         ]
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.apify_tool.apify_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.apify_tool.apify_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_items
@@ -121,7 +121,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.apify_tool.apify_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.apify_tool.apify_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -149,7 +149,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.apify_tool.apify_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.apify_tool.apify_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -168,7 +168,7 @@ def test_missing_params(self, tool_fns):
     def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.apify_tool.apify_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.apify_tool.apify_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {"screenshot": "base64..."}
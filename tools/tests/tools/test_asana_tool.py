@@ -27,7 +27,7 @@ def test_successful_list(self, tool_fns):
         mock_resp = {"data": [{"gid": "ws-1", "name": "My Workspace"}]}
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.asana_tool.asana_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.asana_tool.asana_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -51,7 +51,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.asana_tool.asana_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.asana_tool.asana_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -81,7 +81,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.asana_tool.asana_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.asana_tool.asana_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -114,7 +114,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.asana_tool.asana_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.asana_tool.asana_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -135,7 +135,7 @@ def test_successful_create(self, tool_fns):
         mock_resp = {"data": {"gid": "task-new", "name": "New Task"}}
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.asana_tool.asana_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.asana_tool.asana_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 201
             mock_post.return_value.json.return_value = mock_resp
@@ -166,7 +166,7 @@ def test_successful_search(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.asana_tool.asana_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.asana_tool.asana_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -80,7 +80,7 @@ def test_handle_response_generic_error_no_json(self):
         assert "error" in result
         assert "Bad Gateway" in result["error"]
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_request_get(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -99,7 +99,7 @@ def test_request_get(self, mock_request):
         )
         assert result == {"data": []}
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_request_post_with_body(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -113,7 +113,7 @@ def test_request_post_with_body(self, mock_request):
         assert call_kwargs["json"] == body
         assert result == {"data": [{"id": "rec-1"}]}
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_request_with_params(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -130,7 +130,7 @@ def test_request_with_params(self, mock_request):
 
     # --- Record Operations ---
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_records(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -147,7 +147,7 @@ def test_list_records(self, mock_request):
         assert result["total"] == 2
         assert len(result["records"]) == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_records_with_filter(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -161,7 +161,7 @@ def test_list_records_with_filter(self, mock_request):
         body = call_kwargs["json"]
         assert body["filter"] == filter_data
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_records_error(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 401
@@ -170,7 +170,7 @@ def test_list_records_error(self, mock_request):
         result = self.client.list_records("people")
         assert "error" in result
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_get_record(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -186,7 +186,7 @@ def test_get_record(self, mock_request):
 
         assert result["id"]["record_id"] == "rec-123"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_create_record(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -205,7 +205,7 @@ def test_create_record(self, mock_request):
         call_kwargs = mock_request.call_args.kwargs
         assert call_kwargs["json"] == {"data": {"values": values}}
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_update_record(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -222,7 +222,7 @@ def test_update_record(self, mock_request):
 
         assert result["values"]["name"][0]["first_name"] == "Updated"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_assert_record(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -238,7 +238,7 @@ def test_assert_record(self, mock_request):
 
     # --- List Operations ---
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_lists(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -250,7 +250,7 @@ def test_list_lists(self, mock_request):
         assert result["total"] == 1
         assert result["lists"][0]["name"] == "Sales Pipeline"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_get_entries(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -262,7 +262,7 @@ def test_get_entries(self, mock_request):
         assert result["total"] == 2
         assert len(result["entries"]) == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_create_entry(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -277,7 +277,7 @@ def test_create_entry(self, mock_request):
         assert body["data"]["parent_record_id"] == "rec-123"
         assert body["data"]["parent_object"] == "people"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_create_entry_with_values(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -291,7 +291,7 @@ def test_create_entry_with_values(self, mock_request):
         body = call_kwargs["json"]
         assert body["data"]["entry_values"] == entry_values
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_delete_entry(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 204
@@ -303,7 +303,7 @@ def test_delete_entry(self, mock_request):
 
     # --- Task Operations ---
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_create_task(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -325,7 +325,7 @@ def test_create_task(self, mock_request):
         assert result["id"] == "task-new"
         assert result["content"] == "Follow up with Jane"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_tasks(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -337,7 +337,7 @@ def test_list_tasks(self, mock_request):
         assert result["total"] == 2
         assert len(result["tasks"]) == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_get_task(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -348,7 +348,7 @@ def test_get_task(self, mock_request):
 
         assert result["id"] == "task-1"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_delete_task(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 204
@@ -360,7 +360,7 @@ def test_delete_task(self, mock_request):
 
     # --- Workspace Members ---
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_members(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -377,7 +377,7 @@ def test_list_members(self, mock_request):
         assert result["total"] == 2
         assert result["members"][0]["first_name"] == "Alice"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_get_member(self, mock_request):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -441,7 +441,7 @@ def test_credential_from_env(self, monkeypatch):
 
         # Should not return error when env var is set
         tool_fn = mcp._tool_manager._tools["attio_members_list"].fn
-        with patch("aden_tools.tools.attio_tool.attio_tool.httpx.request") as mock_req:
+        with patch("aden_tools.tools.attio_tool.attio_tool._http.request") as mock_req:
             mock_resp = MagicMock()
             mock_resp.status_code = 200
             mock_resp.json.return_value = {"data": []}
@@ -473,7 +473,7 @@ def test_credential_from_store(self, monkeypatch):
         register_tools(mcp, credentials=mock_creds)
 
         tool_fn = mcp._tool_manager._tools["attio_members_list"].fn
-        with patch("aden_tools.tools.attio_tool.attio_tool.httpx.request") as mock_req:
+        with patch("aden_tools.tools.attio_tool.attio_tool._http.request") as mock_req:
             mock_resp = MagicMock()
             mock_resp.status_code = 200
             mock_resp.json.return_value = {"data": []}
@@ -493,7 +493,7 @@ def setup_method(self):
         self.mcp = FastMCP("test")
         register_tools(self.mcp, credentials=None)
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_timeout_error(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
 
@@ -508,7 +508,7 @@ def test_timeout_error(self, mock_request, monkeypatch):
         assert "error" in result
         assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_network_error(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
 
@@ -528,7 +528,7 @@ def test_network_error(self, mock_request, monkeypatch):
 
 
 class TestRecordTools:
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_list(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -545,7 +545,7 @@ def test_record_list(self, mock_request, monkeypatch):
         result = tool_fn(object_handle="people", limit=10)
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_list_with_filter_json(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -577,7 +577,7 @@ def test_record_list_invalid_filter_json(self, monkeypatch):
         assert "error" in result
         assert "Invalid filter_json" in result["error"]
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_get(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -594,7 +594,7 @@ def test_record_get(self, mock_request, monkeypatch):
         result = tool_fn(object_handle="people", record_id="r1")
         assert result["id"]["record_id"] == "r1"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_create(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -614,7 +614,7 @@ def test_record_create(self, mock_request, monkeypatch):
         )
         assert result["id"]["record_id"] == "r-new"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_update(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -635,7 +635,7 @@ def test_record_update(self, mock_request, monkeypatch):
         )
         assert "error" not in result
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_record_assert(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -661,7 +661,7 @@ def test_record_assert(self, mock_request, monkeypatch):
 
 
 class TestListTools:
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_lists(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -678,7 +678,7 @@ def test_list_lists(self, mock_request, monkeypatch):
         result = tool_fn()
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_entries_get(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -695,7 +695,7 @@ def test_list_entries_get(self, mock_request, monkeypatch):
         result = tool_fn(list_id="list-1")
         assert result["total"] == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_entry_create(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -712,7 +712,7 @@ def test_list_entry_create(self, mock_request, monkeypatch):
         result = tool_fn(list_id="list-1", parent_record_id="rec-123")
         assert result["id"] == "entry-new"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_list_entry_delete(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -733,7 +733,7 @@ def test_list_entry_delete(self, mock_request, monkeypatch):
 
 
 class TestTaskTools:
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_task_create(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -750,7 +750,7 @@ def test_task_create(self, mock_request, monkeypatch):
         result = tool_fn(content="Follow up")
         assert result["id"] == "task-new"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_task_list(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -767,7 +767,7 @@ def test_task_list(self, mock_request, monkeypatch):
         result = tool_fn()
         assert result["total"] == 2
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_task_get(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -784,7 +784,7 @@ def test_task_get(self, mock_request, monkeypatch):
         result = tool_fn(task_id="t1")
         assert result["id"] == "t1"
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_task_delete(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -805,7 +805,7 @@ def test_task_delete(self, mock_request, monkeypatch):
 
 
 class TestMemberTools:
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_members_list(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -822,7 +822,7 @@ def test_members_list(self, mock_request, monkeypatch):
         result = tool_fn()
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.attio_tool.attio_tool.httpx.request")
+    @patch("aden_tools.tools.attio_tool.attio_tool._http.request")
     def test_member_get(self, mock_request, monkeypatch):
         monkeypatch.setenv("ATTIO_API_KEY", "test-key")
         from fastmcp import FastMCP
@@ -62,7 +62,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.aws_s3_tool.aws_s3_tool.httpx.get",
+                "aden_tools.tools.aws_s3_tool.aws_s3_tool._http.get",
                 return_value=_mock_resp(LIST_BUCKETS_XML),
             ),
         ):
@@ -82,7 +82,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.aws_s3_tool.aws_s3_tool.httpx.get",
+                "aden_tools.tools.aws_s3_tool.aws_s3_tool._http.get",
                 return_value=_mock_resp(LIST_OBJECTS_XML),
             ),
         ):
@@ -112,7 +112,7 @@ def test_successful_get_text(self, tool_fns):
         )
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.aws_s3_tool.aws_s3_tool.httpx.get", return_value=resp),
+            patch("aden_tools.tools.aws_s3_tool.aws_s3_tool._http.get", return_value=resp),
         ):
             result = tool_fns["s3_get_object"](bucket="my-bucket", key="file.txt")
 
@@ -130,7 +130,7 @@ def test_successful_put(self, tool_fns):
         resp = _mock_resp("", headers={"etag": '"abc123"'})
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.aws_s3_tool.aws_s3_tool.httpx.put", return_value=resp),
+            patch("aden_tools.tools.aws_s3_tool.aws_s3_tool._http.put", return_value=resp),
         ):
             result = tool_fns["s3_put_object"](
                 bucket="my-bucket", key="new-file.txt", content="Hello!"
@@ -151,7 +151,7 @@ def test_successful_delete(self, tool_fns):
         resp = _mock_resp("", status_code=204)
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.aws_s3_tool.aws_s3_tool.httpx.delete", return_value=resp),
+            patch("aden_tools.tools.aws_s3_tool.aws_s3_tool._http.delete", return_value=resp),
         ):
             result = tool_fns["s3_delete_object"](bucket="my-bucket", key="old-file.txt")
 
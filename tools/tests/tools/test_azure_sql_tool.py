@@ -56,7 +56,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.azure_sql_tool.azure_sql_tool.httpx.get",
+                "aden_tools.tools.azure_sql_tool.azure_sql_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -90,7 +90,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.azure_sql_tool.azure_sql_tool.httpx.get",
+                "aden_tools.tools.azure_sql_tool.azure_sql_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -128,7 +128,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.azure_sql_tool.azure_sql_tool.httpx.get",
+                "aden_tools.tools.azure_sql_tool.azure_sql_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -167,7 +167,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.azure_sql_tool.azure_sql_tool.httpx.get",
+                "aden_tools.tools.azure_sql_tool.azure_sql_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -201,7 +201,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.azure_sql_tool.azure_sql_tool.httpx.get",
+                "aden_tools.tools.azure_sql_tool.azure_sql_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -7,6 +7,8 @@
 
 from aden_tools.tools.brevo_tool import register_tools
 
+PATCH_BASE = "aden_tools.tools.brevo_tool.brevo_tool"
+
 
 @pytest.fixture
 def mcp():
@@ -75,7 +77,7 @@ def test_send_email_success(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_send_email")
 
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 201
             mock_response.content = b'{"messageId": "<abc123@smtp-relay.brevo.com>"}'
@@ -99,7 +101,7 @@ def test_send_email_with_text_content(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_send_email")
 
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 201
             mock_response.content = b'{"messageId": "<abc123@smtp-relay.brevo.com>"}'
@@ -175,7 +177,7 @@ def test_send_email_invalid_auth(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "invalid-key")
         fn = get_tool_fn("brevo_send_email")
 
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 401
             mock_response.content = b'{"message": "Key not found"}'
@@ -201,7 +203,7 @@ def test_send_email_timeout(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_send_email")
 
-        with patch("httpx.post", side_effect=httpx.TimeoutException("timeout")):
+        with patch(f"{PATCH_BASE}._http.post", side_effect=httpx.TimeoutException("timeout")):
             result = fn(
                 to_email="user@example.com",
                 to_name="John",
@@ -228,7 +230,7 @@ def test_send_sms_success(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_send_sms")
 
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 201
             mock_response.content = b'{"reference": "ref123", "remainingCredits": 95.0}'
@@ -285,7 +287,7 @@ def test_send_sms_timeout(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_send_sms")
 
-        with patch("httpx.post", side_effect=httpx.TimeoutException("timeout")):
+        with patch(f"{PATCH_BASE}._http.post", side_effect=httpx.TimeoutException("timeout")):
             result = fn(to="+919876543210", content="Hello", sender="HiveAgent")
 
         assert "error" in result
@@ -305,7 +307,7 @@ def test_create_contact_success(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_create_contact")
 
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 201
             mock_response.content = b'{"id": 42}'
@@ -327,7 +329,7 @@ def test_create_contact_with_list_ids(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_create_contact")
 
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 201
             mock_response.content = b'{"id": 43}'
@@ -366,7 +368,7 @@ def test_create_contact_timeout(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_create_contact")
 
-        with patch("httpx.post", side_effect=httpx.TimeoutException("timeout")):
+        with patch(f"{PATCH_BASE}._http.post", side_effect=httpx.TimeoutException("timeout")):
             result = fn(email="user@example.com")
 
         assert "error" in result
@@ -386,7 +388,7 @@ def test_get_contact_success(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_get_contact")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = b"{}"
@@ -421,7 +423,7 @@ def test_get_contact_not_found(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_get_contact")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_response.content = b'{"message": "Contact not found"}'
@@ -450,7 +452,7 @@ def test_get_contact_timeout(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_get_contact")
 
-        with patch("httpx.get", side_effect=httpx.TimeoutException("timeout")):
+        with patch(f"{PATCH_BASE}._http.get", side_effect=httpx.TimeoutException("timeout")):
             result = fn(email="user@example.com")
 
         assert "error" in result
@@ -470,7 +472,7 @@ def test_update_contact_success(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_update_contact")
 
-        with patch("httpx.put") as mock_put:
+        with patch(f"{PATCH_BASE}._http.put") as mock_put:
             mock_response = MagicMock()
             mock_response.status_code = 204
             mock_response.content = b""
@@ -490,7 +492,7 @@ def test_update_contact_with_list_ids(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_update_contact")
 
-        with patch("httpx.put") as mock_put:
+        with patch(f"{PATCH_BASE}._http.put") as mock_put:
             mock_response = MagicMock()
             mock_response.status_code = 204
             mock_response.content = b""
@@ -528,7 +530,7 @@ def test_update_contact_timeout(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_update_contact")
 
-        with patch("httpx.put", side_effect=httpx.TimeoutException("timeout")):
+        with patch(f"{PATCH_BASE}._http.put", side_effect=httpx.TimeoutException("timeout")):
             result = fn(email="user@example.com", first_name="Jane")
 
         assert "error" in result
@@ -548,7 +550,7 @@ def test_get_email_stats_success(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_get_email_stats")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = b"{}"
@@ -584,7 +586,7 @@ def test_get_email_stats_not_found(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_get_email_stats")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_response.content = b'{"message": "Not found"}'
@@ -602,7 +604,7 @@ def test_get_email_stats_timeout(self, get_tool_fn, monkeypatch):
         monkeypatch.setenv("BREVO_API_KEY", "test-api-key")
         fn = get_tool_fn("brevo_get_email_stats")
 
-        with patch("httpx.get", side_effect=httpx.TimeoutException("timeout")):
+        with patch(f"{PATCH_BASE}._http.get", side_effect=httpx.TimeoutException("timeout")):
             result = fn(message_id="<abc123@smtp-relay.brevo.com>")
 
         assert "error" in result
@@ -252,7 +252,7 @@ def test_check_availability_missing_time_max(self, calendar_tools, monkeypatch):
 class TestMockedAPIResponses:
     """Tests with mocked API responses."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_list_events_success(self, mock_get, calendar_tools, monkeypatch):
         """list_events returns formatted events on success."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -283,7 +283,7 @@ def test_list_events_success(self, mock_get, calendar_tools, monkeypatch):
         assert result["events"][0]["summary"] == "Team Meeting"
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_list_events_empty(self, mock_get, calendar_tools, monkeypatch):
         """list_events handles empty calendar."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -296,7 +296,7 @@ def test_list_events_empty(self, mock_get, calendar_tools, monkeypatch):
         assert len(result["events"]) == 0
         assert result["total"] == 0
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_create_event_success(self, mock_post, calendar_tools, monkeypatch):
         """create_event returns created event details."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -321,7 +321,7 @@ def test_create_event_success(self, mock_post, calendar_tools, monkeypatch):
         assert "id" in result
         assert result["summary"] == "New Event"
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.delete")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.delete")
     def test_delete_event_success(self, mock_delete, calendar_tools, monkeypatch):
         """delete_event returns success message."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -333,7 +333,7 @@ def test_delete_event_success(self, mock_delete, calendar_tools, monkeypatch):
         assert result["success"] is True
         assert "event123" in result["message"]
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_list_calendars_success(self, mock_get, calendar_tools, monkeypatch):
         """list_calendars returns formatted calendar list."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -365,7 +365,7 @@ def test_list_calendars_success(self, mock_get, calendar_tools, monkeypatch):
         assert result["calendars"][0]["primary"] is True
         assert result["total"] == 2
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_check_availability_success(self, mock_get, calendar_tools, monkeypatch):
         """check_availability returns events, busy, free_slots, and conflicts."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -398,7 +398,7 @@ def test_check_availability_success(self, mock_get, calendar_tools, monkeypatch)
         assert len(cal["free_slots"]) == 2  # before and after the event
         assert len(cal["conflicts"]) == 0
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_check_availability_detects_conflicts(self, mock_get, calendar_tools, monkeypatch):
         """check_availability detects overlapping events."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -439,7 +439,7 @@ def test_check_availability_detects_conflicts(self, mock_get, calendar_tools, mo
         assert cal["busy"][0]["start"] == "2024-01-15T14:00:00+00:00"
         assert cal["busy"][0]["end"] == "2024-01-15T15:30:00+00:00"
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_check_availability_computes_free_slots(self, mock_get, calendar_tools, monkeypatch):
         """check_availability computes free gaps between events."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -474,7 +474,7 @@ def test_check_availability_computes_free_slots(self, mock_get, calendar_tools,
         cal = result["calendars"]["primary"]
         assert len(cal["free_slots"]) == 3  # 8-9, 10-14, 15-17
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_check_availability_skips_transparent_events(
         self, mock_get, calendar_tools, monkeypatch
     ):
@@ -507,7 +507,7 @@ def test_check_availability_skips_transparent_events(
         assert len(cal["busy"]) == 0  # but not counted as busy
         assert len(cal["free_slots"]) == 1  # entire window is free
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_unauthorized_returns_error(self, mock_get, calendar_tools, monkeypatch):
         """401 response returns appropriate error."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "invalid-token")
@@ -519,7 +519,7 @@ def test_unauthorized_returns_error(self, mock_get, calendar_tools, monkeypatch)
         assert "error" in result
         assert "Invalid or expired OAuth token" in result["error"]
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_rate_limit_returns_error(self, mock_get, calendar_tools, monkeypatch):
         """429 response returns rate limit error."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -531,7 +531,7 @@ def test_rate_limit_returns_error(self, mock_get, calendar_tools, monkeypatch):
         assert "error" in result
         assert "Rate limit" in result["error"]
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_not_found_returns_error(self, mock_get, calendar_tools, monkeypatch):
         """404 response returns not found error."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -547,7 +547,7 @@ def test_not_found_returns_error(self, mock_get, calendar_tools, monkeypatch):
 class TestCredentialManager:
     """Tests for CredentialManager integration."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_uses_credential_store_adapter_when_provided(self, mock_get, mcp, monkeypatch):
         """Tool uses CredentialStoreAdapter when provided."""
         from aden_tools.credentials import CredentialStoreAdapter
@@ -574,7 +574,7 @@ def test_uses_credential_store_adapter_when_provided(self, mock_get, mcp, monkey
 class TestTokenRefresh:
     """Tests for OAuth token refresh functionality."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_expired_token_returns_helpful_error(self, mock_get, calendar_tools, monkeypatch):
         """401 response with simple token suggests re-authorization."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "expired-token")
@@ -588,7 +588,7 @@ def test_expired_token_returns_helpful_error(self, mock_get, calendar_tools, mon
         assert "help" in result
 
     @patch("aden_tools.tools.calendar_tool.calendar_tool._create_lifecycle_manager")
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_auto_refresh_uses_lifecycle_manager(
         self, mock_get, mock_create_lifecycle, mcp, monkeypatch
     ):
@@ -636,7 +636,7 @@ def test_auto_refresh_uses_lifecycle_manager(
         assert mock_lifecycle.sync_get_valid_token.called
         assert "events" in result
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_no_lifecycle_manager_without_refresh_token(self, mock_get, mcp, monkeypatch):
         """Lifecycle manager not created without refresh_token."""
         pytest.importorskip("framework.credentials", reason="Requires framework.credentials module")
@@ -667,7 +667,7 @@ def test_no_lifecycle_manager_without_refresh_token(self, mock_get, mcp, monkeyp
         # Should work using simple token
         assert "events" in result
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_graceful_degradation_on_refresh_failure(self, mock_get, calendar_tools, monkeypatch):
         """If token refresh fails, returns helpful error message."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "invalid-token")
@@ -687,7 +687,7 @@ def test_graceful_degradation_on_refresh_failure(self, mock_get, calendar_tools,
 class TestUpdateEventPatch:
     """Tests for PATCH-based update_event."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
     def test_update_event_patch_success(self, mock_patch, calendar_tools, monkeypatch):
         """update_event uses PATCH and returns updated event."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -714,7 +714,7 @@ def test_update_event_patch_success(self, mock_patch, calendar_tools, monkeypatc
         call_kwargs = mock_patch.call_args
         assert call_kwargs[1]["json"] == {"summary": "Updated Title"}
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
     def test_update_event_partial_fields(self, mock_patch, calendar_tools, monkeypatch):
         """update_event sends only provided fields in PATCH body."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -741,7 +741,7 @@ def test_update_event_partial_fields(self, mock_patch, calendar_tools, monkeypat
         assert body == {"description": "New desc", "location": "New place"}
         assert "summary" not in body
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
     def test_update_event_with_timezone(self, mock_patch, calendar_tools, monkeypatch):
         """update_event includes timezone in start/end when provided."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -764,7 +764,7 @@ def test_update_event_with_timezone(self, mock_patch, calendar_tools, monkeypatc
 class TestAllDayEvents:
     """Tests for all-day event support."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_create_all_day_event(self, mock_post, calendar_tools, monkeypatch):
         """create_event with all_day=True uses date field."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -824,7 +824,7 @@ def test_create_all_day_event_invalid_end_format(self, calendar_tools, monkeypat
         assert "date-only format" in result["error"]
         assert "end_time" in result["error"]
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
     def test_update_to_all_day_event(self, mock_patch, calendar_tools, monkeypatch):
         """update_event can convert timed event to all-day."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -870,7 +870,7 @@ def test_invalid_timezone_create_event(self, calendar_tools, monkeypatch):
         assert "Not/A_Timezone" in result["error"]
         assert "IANA format" in result["error"]
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_valid_timezone_passes(self, mock_post, calendar_tools, monkeypatch):
         """create_event accepts valid timezone."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -901,7 +901,7 @@ def test_invalid_timezone_update_event(self, calendar_tools, monkeypatch):
         assert "error" in result
         assert "Invalid timezone" in result["error"]
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_all_day_event_ignores_timezone(self, mock_post, calendar_tools, monkeypatch):
         """create_event with all_day=True skips timezone validation."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -923,7 +923,7 @@ def test_all_day_event_ignores_timezone(self, mock_post, calendar_tools, monkeyp
 class TestCreateEventWithAttendees:
     """Tests for create_event with attendees."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_create_event_with_attendees(self, mock_post, calendar_tools, monkeypatch):
         """create_event includes attendees in request body."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -957,7 +957,7 @@ def test_create_event_with_attendees(self, mock_post, calendar_tools, monkeypatc
         params = mock_post.call_args[1]["params"]
         assert params["sendUpdates"] == "all"
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_create_event_with_attendees_includes_conference_data(
         self, mock_post, calendar_tools, monkeypatch
     ):
@@ -983,7 +983,7 @@ def test_create_event_with_attendees_includes_conference_data(
         assert request_id.startswith("meet-")
         assert len(request_id) > len("meet-")
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_create_event_with_attendees_sets_conference_data_version(
         self, mock_post, calendar_tools, monkeypatch
     ):
@@ -1002,7 +1002,7 @@ def test_create_event_with_attendees_sets_conference_data_version(
         params = mock_post.call_args[1]["params"]
         assert params["conferenceDataVersion"] == 1
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_create_event_without_attendees_no_conference_data(
         self, mock_post, calendar_tools, monkeypatch
     ):
@@ -1026,7 +1026,7 @@ def test_create_event_without_attendees_no_conference_data(
 class TestListEventsOutputFields:
     """Tests for list_events output field coverage."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_list_events_includes_description_and_hangout_link(
         self, mock_get, calendar_tools, monkeypatch
     ):
@@ -1056,7 +1056,7 @@ def test_list_events_includes_description_and_hangout_link(
         assert event["description"] == "Discuss Q1 goals"
         assert event["hangoutLink"] == "https://meet.google.com/abc-defg-hij"
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_list_events_includes_attendees(self, mock_get, calendar_tools, monkeypatch):
         """list_events output includes attendee emails when present."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1085,7 +1085,7 @@ def test_list_events_includes_attendees(self, mock_get, calendar_tools, monkeypa
         assert "attendees" in event
         assert event["attendees"] == ["alice@example.com", "bob@example.com"]
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_list_events_no_attendees_omits_field(self, mock_get, calendar_tools, monkeypatch):
         """list_events without attendees omits the attendees field."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1109,7 +1109,7 @@ def test_list_events_no_attendees_omits_field(self, mock_get, calendar_tools, mo
         event = result["events"][0]
         assert "attendees" not in event
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_list_events_max_results_2500_accepted(self, mock_get, calendar_tools, monkeypatch):
         """list_events accepts max_results=2500 (the API maximum)."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1125,7 +1125,7 @@ def test_list_events_max_results_2500_accepted(self, mock_get, calendar_tools, m
 class TestIsNotNoneBehavior:
     """Tests for 'is not None' checks allowing empty strings."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_create_event_empty_description_included(self, mock_post, calendar_tools, monkeypatch):
         """create_event with description='' includes it in body (not None check)."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1143,7 +1143,7 @@ def test_create_event_empty_description_included(self, mock_post, calendar_tools
         assert "description" in body
         assert body["description"] == ""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_create_event_empty_location_included(self, mock_post, calendar_tools, monkeypatch):
         """create_event with location='' includes it in body (not None check)."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1161,7 +1161,7 @@ def test_create_event_empty_location_included(self, mock_post, calendar_tools, m
         assert "location" in body
         assert body["location"] == ""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.post")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.post")
     def test_create_event_none_description_excluded(self, mock_post, calendar_tools, monkeypatch):
         """create_event with description=None does not include it in body."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1195,8 +1195,8 @@ def test_update_event_no_fields_returns_error(self, calendar_tools, monkeypatch)
 class TestRemoveAttendees:
     """Tests for remove_attendees on update_event."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_remove_single_attendee(self, mock_get, mock_patch, calendar_tools, monkeypatch):
         """remove_attendees removes specified email and keeps the rest."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1241,8 +1241,8 @@ def test_remove_single_attendee(self, mock_get, mock_patch, calendar_tools, monk
         assert "alice@example.com" in attendee_emails
         assert "charlie@example.com" in attendee_emails
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_remove_attendees_case_insensitive(
         self, mock_get, mock_patch, calendar_tools, monkeypatch
     ):
@@ -1271,8 +1271,8 @@ def test_remove_attendees_case_insensitive(
         assert "Alice@Example.com" not in attendee_emails
         assert "bob@example.com" in attendee_emails
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_remove_multiple_attendees(self, mock_get, mock_patch, calendar_tools, monkeypatch):
         """remove_attendees can remove multiple emails at once."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1299,8 +1299,8 @@ def test_remove_multiple_attendees(self, mock_get, mock_patch, calendar_tools, m
         attendee_emails = [a["email"] for a in body["attendees"]]
         assert attendee_emails == ["bob@example.com"]
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_remove_attendees_from_event_with_no_attendees(
         self, mock_get, mock_patch, calendar_tools, monkeypatch
     ):
@@ -1321,8 +1321,8 @@ def test_remove_attendees_from_event_with_no_attendees(
         body = mock_patch.call_args[1]["json"]
         assert body["attendees"] == []
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_remove_attendees_sets_conference_data_version(
         self, mock_get, mock_patch, calendar_tools, monkeypatch
     ):
@@ -1346,7 +1346,7 @@ def test_remove_attendees_sets_conference_data_version(
         params = mock_patch.call_args[1]["params"]
         assert params["conferenceDataVersion"] == 1
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.get")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.get")
     def test_remove_attendees_get_fails_returns_error(self, mock_get, calendar_tools, monkeypatch):
         """remove_attendees returns error if GET to fetch event fails."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1365,7 +1365,7 @@ def test_remove_attendees_get_fails_returns_error(self, mock_get, calendar_tools
 class TestUpdateMeetLink:
     """Tests for add_meet_link on update_event."""
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
     def test_update_event_add_meet_link(self, mock_patch, calendar_tools, monkeypatch):
         """update_event with add_meet_link=True includes conferenceData."""
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "test-token")
@@ -1393,7 +1393,7 @@ def test_update_event_add_meet_link(self, mock_patch, calendar_tools, monkeypatc
         params = mock_patch.call_args[1]["params"]
         assert params["conferenceDataVersion"] == 1
 
-    @patch("aden_tools.tools.calendar_tool.calendar_tool.httpx.patch")
+    @patch("aden_tools.tools.calendar_tool.calendar_tool._http.patch")
     def test_update_event_without_meet_link_no_conference_data(
         self, mock_patch, calendar_tools, monkeypatch
     ):
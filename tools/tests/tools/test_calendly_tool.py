@@ -49,7 +49,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.calendly_tool.calendly_tool.httpx.get",
+                "aden_tools.tools.calendly_tool.calendly_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -85,7 +85,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.calendly_tool.calendly_tool.httpx.get",
+                "aden_tools.tools.calendly_tool.calendly_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -121,7 +121,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.calendly_tool.calendly_tool.httpx.get",
+                "aden_tools.tools.calendly_tool.calendly_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -156,7 +156,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.calendly_tool.calendly_tool.httpx.get",
+                "aden_tools.tools.calendly_tool.calendly_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -190,7 +190,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.calendly_tool.calendly_tool.httpx.get",
+                "aden_tools.tools.calendly_tool.calendly_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -48,7 +48,7 @@ def test_successful_upload(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.cloudinary_tool.cloudinary_tool.httpx.post",
+                "aden_tools.tools.cloudinary_tool.cloudinary_tool._http.post",
                 return_value=mock_resp,
             ),
         ):
@@ -84,7 +84,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.cloudinary_tool.cloudinary_tool.httpx.get", return_value=mock_resp
+                "aden_tools.tools.cloudinary_tool.cloudinary_tool._http.get", return_value=mock_resp
             ),
         ):
             result = tool_fns["cloudinary_list_resources"]()
@@ -117,7 +117,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.cloudinary_tool.cloudinary_tool.httpx.get", return_value=mock_resp
+                "aden_tools.tools.cloudinary_tool.cloudinary_tool._http.get", return_value=mock_resp
             ),
         ):
             result = tool_fns["cloudinary_get_resource"](public_id="sample1")
@@ -139,7 +139,7 @@ def test_successful_delete(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.cloudinary_tool.cloudinary_tool.httpx.post",
+                "aden_tools.tools.cloudinary_tool.cloudinary_tool._http.post",
                 return_value=mock_resp,
             ),
         ):
@@ -174,7 +174,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.cloudinary_tool.cloudinary_tool.httpx.post",
+                "aden_tools.tools.cloudinary_tool.cloudinary_tool._http.post",
                 return_value=mock_resp,
             ),
         ):
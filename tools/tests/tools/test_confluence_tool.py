@@ -45,7 +45,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.confluence_tool.confluence_tool.httpx.get", return_value=mock_resp
+                "aden_tools.tools.confluence_tool.confluence_tool._http.get", return_value=mock_resp
             ),
         ):
             result = tool_fns["confluence_list_spaces"]()
@@ -74,7 +74,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.confluence_tool.confluence_tool.httpx.get", return_value=mock_resp
+                "aden_tools.tools.confluence_tool.confluence_tool._http.get", return_value=mock_resp
             ),
         ):
             result = tool_fns["confluence_list_pages"](space_id="123")
@@ -105,7 +105,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.confluence_tool.confluence_tool.httpx.get", return_value=mock_resp
+                "aden_tools.tools.confluence_tool.confluence_tool._http.get", return_value=mock_resp
             ),
         ):
             result = tool_fns["confluence_get_page"](page_id="page-1")
@@ -128,7 +128,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.confluence_tool.confluence_tool.httpx.post",
+                "aden_tools.tools.confluence_tool.confluence_tool._http.post",
                 return_value=mock_resp,
             ),
         ):
@@ -162,7 +162,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.confluence_tool.confluence_tool.httpx.get", return_value=mock_resp
+                "aden_tools.tools.confluence_tool.confluence_tool._http.get", return_value=mock_resp
             ),
         ):
             result = tool_fns["confluence_search"](query="deployment")
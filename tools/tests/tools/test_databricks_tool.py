@@ -37,7 +37,7 @@ def test_successful_query(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.databricks_tool.databricks_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.databricks_tool.databricks_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_resp
@@ -65,7 +65,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.databricks_tool.databricks_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.databricks_tool.databricks_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -84,7 +84,7 @@ def test_missing_job_id(self, tool_fns):
     def test_successful_run(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.databricks_tool.databricks_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.databricks_tool.databricks_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {"run_id": 42}
@@ -106,7 +106,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.databricks_tool.databricks_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.databricks_tool.databricks_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -132,7 +132,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.databricks_tool.databricks_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.databricks_tool.databricks_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -151,7 +151,7 @@ def test_missing_cluster_id(self, tool_fns):
     def test_successful_start(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.databricks_tool.databricks_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.databricks_tool.databricks_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {}
@@ -171,7 +171,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.databricks_tool.databricks_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.databricks_tool.databricks_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -43,7 +43,7 @@ def test_successful_search(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.docker_hub_tool.docker_hub_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.docker_hub_tool.docker_hub_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -79,7 +79,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.docker_hub_tool.docker_hub_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.docker_hub_tool.docker_hub_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -109,7 +109,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.docker_hub_tool.docker_hub_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.docker_hub_tool.docker_hub_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -141,7 +141,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", {**ENV, "DOCKER_HUB_USERNAME": "myuser"}),
-            patch("aden_tools.tools.docker_hub_tool.docker_hub_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.docker_hub_tool.docker_hub_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
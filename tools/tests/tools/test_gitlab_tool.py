@@ -48,7 +48,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.gitlab_tool.gitlab_tool.httpx.get",
+                "aden_tools.tools.gitlab_tool.gitlab_tool._http.get",
                 return_value=_mock_resp(projects),
             ),
         ):
@@ -83,7 +83,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.gitlab_tool.gitlab_tool.httpx.get",
+                "aden_tools.tools.gitlab_tool.gitlab_tool._http.get",
                 return_value=_mock_resp(project),
             ),
         ):
@@ -116,7 +116,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.gitlab_tool.gitlab_tool.httpx.get",
+                "aden_tools.tools.gitlab_tool.gitlab_tool._http.get",
                 return_value=_mock_resp(issues),
             ),
         ):
@@ -151,7 +151,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.gitlab_tool.gitlab_tool.httpx.get", return_value=_mock_resp(issue)
+                "aden_tools.tools.gitlab_tool.gitlab_tool._http.get", return_value=_mock_resp(issue)
             ),
         ):
             result = tool_fns["gitlab_get_issue"](project_id="1", issue_iid=1)
@@ -175,7 +175,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.gitlab_tool.gitlab_tool.httpx.post",
+                "aden_tools.tools.gitlab_tool.gitlab_tool._http.post",
                 return_value=_mock_resp(issue, 201),
             ),
         ):
@@ -208,7 +208,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.gitlab_tool.gitlab_tool.httpx.get", return_value=_mock_resp(mrs)
+                "aden_tools.tools.gitlab_tool.gitlab_tool._http.get", return_value=_mock_resp(mrs)
             ),
         ):
             result = tool_fns["gitlab_list_merge_requests"](project_id="1")
@@ -26,6 +26,8 @@
     register_tools,
 )
 
+PATCH_BASE = "aden_tools.tools.google_docs_tool.google_docs_tool"
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -178,7 +180,7 @@ def test_success_returns_json(self, client):
 
 class TestGoogleDocsClientCreateDocument:
     def test_posts_title(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"documentId": "doc-1", "title": "My Doc"})
             result = client.create_document("My Doc")
             body = mock_post.call_args.kwargs["json"]
@@ -188,7 +190,7 @@ def test_posts_title(self, client):
 
 class TestGoogleDocsClientGetDocument:
     def test_gets_correct_url(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"documentId": "doc-1"})
             client.get_document("doc-1")
             args, _ = mock_get.call_args
@@ -197,7 +199,7 @@ def test_gets_correct_url(self, client):
 
 class TestGoogleDocsClientBatchUpdate:
     def test_batch_update_sends_requests(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             requests = [{"insertText": {"text": "hello", "location": {"index": 1}}}]
             client.batch_update("doc-1", requests)
@@ -207,7 +209,7 @@ def test_batch_update_sends_requests(self, client):
 
 class TestGoogleDocsClientInsertText:
     def test_insert_at_index(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             client.insert_text("doc-1", "Hello", index=5)
             body = mock_post.call_args.kwargs["json"]
@@ -216,7 +218,10 @@ def test_insert_at_index(self, client):
             assert req["location"]["index"] == 5
 
     def test_insert_at_end_fetches_doc(self, client):
-        with patch("httpx.get") as mock_get, patch("httpx.post") as mock_post:
+        with (
+            patch(f"{PATCH_BASE}._http.get") as mock_get,
+            patch(f"{PATCH_BASE}._http.post") as mock_post,
+        ):
             mock_get.return_value = _mock_response(
                 200,
                 {"body": {"content": [{"startIndex": 1, "endIndex": 20}]}},
@@ -229,7 +234,7 @@ def test_insert_at_end_fetches_doc(self, client):
 
 class TestGoogleDocsClientReplaceAllText:
     def test_replace_sends_correct_request(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             client.replace_all_text("doc-1", "{{NAME}}", "Alice")
             body = mock_post.call_args.kwargs["json"]
@@ -244,7 +249,7 @@ def test_empty_find_text_returns_error(self, client):
 
 class TestGoogleDocsClientInsertImage:
     def test_valid_image_insertion(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             client.insert_image("doc-1", "https://example.com/img.png", index=1)
             body = mock_post.call_args.kwargs["json"]
@@ -256,7 +261,7 @@ def test_invalid_uri_returns_error(self, client):
         assert "error" in result
 
     def test_image_with_dimensions(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             client.insert_image(
                 "doc-1",
@@ -272,7 +277,7 @@ def test_image_with_dimensions(self, client):
 
 class TestGoogleDocsClientFormatText:
     def test_bold_formatting(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             client.format_text("doc-1", 1, 10, bold=True)
             body = mock_post.call_args.kwargs["json"]
@@ -288,7 +293,7 @@ def test_no_options_returns_error(self, client):
 
 class TestGoogleDocsClientExportDocument:
     def test_export_pdf(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, content=b"%PDF-1.4 content")
             result = client.export_document("doc-1", "application/pdf")
             assert result["mime_type"] == "application/pdf"
@@ -298,7 +303,7 @@ def test_export_pdf(self, client):
 
 class TestGoogleDocsClientComments:
     def test_add_comment(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(
                 200, {"id": "comment-1", "content": "Nice work"}
             )
@@ -306,14 +311,14 @@ def test_add_comment(self, client):
             assert result["id"] == "comment-1"
 
     def test_add_comment_with_quoted_text(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"id": "comment-1"})
             client.add_comment("doc-1", "Fix this", quoted_text="typo here")
             body = mock_post.call_args.kwargs["json"]
             assert body["quotedFileContent"]["value"] == "typo here"
 
     def test_list_comments(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(
                 200, {"comments": [{"id": "c1"}], "nextPageToken": "tok2"}
             )
@@ -337,7 +342,7 @@ def test_no_credentials_returns_error(self, mcp, monkeypatch):
     def test_env_var_credential(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "env-tok")
         fn = _tool_fn(mcp, "google_docs_get_document")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"documentId": "doc-1"})
             fn(document_id="doc-1")
             headers = mock_get.call_args.kwargs["headers"]
@@ -347,7 +352,7 @@ def test_credential_store_used(self, mcp):
         creds = MagicMock()
         creds.get.return_value = "store-tok"
         fn = _tool_fn(mcp, "google_docs_get_document", credentials=creds)
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"documentId": "doc-1"})
             fn(document_id="doc-1")
             creds.get.assert_called_once_with("google")
@@ -363,7 +368,7 @@ def test_credential_store_account_alias(self, mcp):
         creds = MagicMock()
         creds.get_by_alias.return_value = "alias-tok"
         fn = _tool_fn(mcp, "google_docs_get_document", credentials=creds)
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"documentId": "doc-1"})
             fn(document_id="doc-1", account="my-account")
             creds.get_by_alias.assert_called_once_with("google", "my-account")
@@ -378,7 +383,7 @@ class TestGoogleDocsCreateDocument:
     def test_success_returns_url(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_create_document")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(
                 200, {"documentId": "new-doc", "title": "My Doc"}
             )
@@ -390,7 +395,7 @@ def test_success_returns_url(self, mcp, monkeypatch):
     def test_timeout(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_create_document")
-        with patch("httpx.post", side_effect=httpx.TimeoutException("t")):
+        with patch(f"{PATCH_BASE}._http.post", side_effect=httpx.TimeoutException("t")):
             result = fn(title="Doc")
             assert result == {"error": "Request timed out"}
 
@@ -399,7 +404,7 @@ class TestGoogleDocsGetDocument:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_get_document")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"documentId": "doc-1", "title": "Test"})
             result = fn(document_id="doc-1")
             assert result["documentId"] == "doc-1"
@@ -409,7 +414,7 @@ class TestGoogleDocsInsertText:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_insert_text")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             result = fn(document_id="doc-1", text="Hello", index=1)
             assert "error" not in result
@@ -419,7 +424,7 @@ class TestGoogleDocsReplaceAllText:
     def test_success_with_count(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_replace_all_text")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(
                 200,
                 {"replies": [{"replaceAllText": {"occurrencesChanged": 3}}]},
@@ -436,7 +441,7 @@ class TestGoogleDocsInsertImage:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_insert_image")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             result = fn(
                 document_id="doc-1",
@@ -449,7 +454,7 @@ def test_invalid_uri(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_insert_image")
         # This gets caught by the client-level validation
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             result = fn(
                 document_id="doc-1",
@@ -463,7 +468,7 @@ class TestGoogleDocsFormatText:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_format_text")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             result = fn(
                 document_id="doc-1",
@@ -478,7 +483,7 @@ class TestGoogleDocsBatchUpdate:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_batch_update")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             requests = [{"insertText": {"text": "Hi", "location": {"index": 1}}}]
             result = fn(
@@ -506,7 +511,7 @@ class TestGoogleDocsCreateList:
     def test_bullet_list(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_create_list")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             result = fn(
                 document_id="doc-1",
@@ -519,7 +524,7 @@ def test_bullet_list(self, mcp, monkeypatch):
     def test_numbered_list(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_create_list")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"replies": []})
             result = fn(
                 document_id="doc-1",
@@ -534,7 +539,7 @@ class TestGoogleDocsAddComment:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_add_comment")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"id": "comment-1", "content": "Fix this"})
             result = fn(document_id="doc-1", content="Fix this")
             assert result["id"] == "comment-1"
@@ -544,7 +549,7 @@ class TestGoogleDocsListComments:
     def test_success_returns_structured(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_list_comments")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(
                 200,
                 {"comments": [{"id": "c1"}], "nextPageToken": "tok2"},
@@ -559,7 +564,7 @@ class TestGoogleDocsExportContent:
     def test_export_pdf(self, mcp, monkeypatch):
         monkeypatch.setenv("GOOGLE_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "google_docs_export_content")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, content=b"PDF data here")
             result = fn(document_id="doc-1", format="pdf")
             assert result["mime_type"] == "application/pdf"
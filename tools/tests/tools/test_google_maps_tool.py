@@ -7,6 +7,8 @@
 
 from aden_tools.tools.google_maps_tool import register_tools
 
+PATCH_BASE = "aden_tools.tools.google_maps_tool.google_maps_tool"
+
 # ── Fixtures ───────────────────────────────────────────────────────────
 
 
@@ -222,7 +224,7 @@ def test_geocode_success(self, maps_geocode_fn, monkeypatch):
         """Successful geocode returns formatted results."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -259,7 +261,7 @@ def test_geocode_zero_results(self, maps_geocode_fn, monkeypatch):
         """Geocode with no matches returns empty results."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -277,7 +279,7 @@ def test_geocode_request_denied(self, maps_geocode_fn, monkeypatch):
         """API denied request returns error."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "invalid-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -296,7 +298,7 @@ def test_geocode_with_components_filter(self, maps_geocode_fn, monkeypatch):
         """Geocode with component filter passes params correctly."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"status": "OK", "results": []}
@@ -325,7 +327,7 @@ def test_reverse_geocode_success(self, maps_reverse_geocode_fn, monkeypatch):
         """Successful reverse geocode returns address results."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -355,7 +357,7 @@ def test_reverse_geocode_passes_latlng_param(self, maps_reverse_geocode_fn, monk
         """Reverse geocode sends correct latlng parameter."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"status": "OK", "results": []}
@@ -379,7 +381,7 @@ def test_directions_success(self, maps_directions_fn, monkeypatch):
         """Successful directions returns route data."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -422,7 +424,7 @@ def test_directions_with_waypoints(self, maps_directions_fn, monkeypatch):
         """Directions with waypoints passes params correctly."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"status": "OK", "routes": []}
@@ -448,7 +450,7 @@ def test_directions_not_found(self, maps_directions_fn, monkeypatch):
         """Directions with invalid location returns error."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -474,7 +476,7 @@ def test_distance_matrix_success(self, maps_distance_matrix_fn, monkeypatch):
         """Successful distance matrix returns rows and elements."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -518,7 +520,7 @@ def test_distance_matrix_with_traffic(self, maps_distance_matrix_fn, monkeypatch
         """Distance matrix with departure_time includes traffic data."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -553,7 +555,7 @@ def test_distance_matrix_passes_mode(self, maps_distance_matrix_fn, monkeypatch)
         """Distance matrix sends the correct mode parameter."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -582,7 +584,7 @@ def test_place_details_success(self, maps_place_details_fn, monkeypatch):
         """Successful place details returns result."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -608,7 +610,7 @@ def test_place_details_not_found(self, maps_place_details_fn, monkeypatch):
         """Invalid place_id returns not found error."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -625,7 +627,7 @@ def test_place_details_custom_fields(self, maps_place_details_fn, monkeypatch):
         """Place details passes custom fields parameter."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -656,7 +658,7 @@ def test_place_search_success(self, maps_place_search_fn, monkeypatch):
         """Successful place search returns structured results."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -703,7 +705,7 @@ def test_place_search_with_location_and_type(self, maps_place_search_fn, monkeyp
         """Place search passes location, radius, and type params."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -736,7 +738,7 @@ def test_place_search_zero_results(self, maps_place_search_fn, monkeypatch):
         """Place search with no matches returns empty results."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -754,7 +756,7 @@ def test_place_search_radius_capped(self, maps_place_search_fn, monkeypatch):
         """Place search caps radius at 50000."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"status": "OK", "results": []}
@@ -770,7 +772,7 @@ def test_place_search_with_page_token(self, maps_place_search_fn, monkeypatch):
         """Place search with page_token sends pagetoken parameter."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -800,7 +802,7 @@ def test_place_search_page_token_without_query(self, maps_place_search_fn, monke
         """Place search with only page_token (no query) still works."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -828,7 +830,7 @@ def test_over_query_limit(self, maps_geocode_fn, monkeypatch):
         """Over query limit returns appropriate error."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -846,7 +848,7 @@ def test_http_error(self, maps_geocode_fn, monkeypatch):
         """Non-200 HTTP status returns error."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_response.text = "Internal Server Error"
@@ -861,7 +863,7 @@ def test_timeout_error(self, maps_geocode_fn, monkeypatch):
         """Timeout returns appropriate error."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             import httpx
 
             mock_get.side_effect = httpx.TimeoutException("Connection timed out")
@@ -875,7 +877,7 @@ def test_network_error(self, maps_geocode_fn, monkeypatch):
         """Network error returns appropriate error."""
         monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "test-key")
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             import httpx
 
             mock_get.side_effect = httpx.ConnectError("Connection refused")
@@ -900,7 +902,7 @@ def test_geocode_with_credential_adapter(self, mcp):
         register_tools(mcp, credentials=creds)
         fn = mcp._tool_manager._tools["maps_geocode"].fn
 
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
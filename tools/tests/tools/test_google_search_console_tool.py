@@ -45,7 +45,7 @@ def test_successful_query(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.google_search_console_tool.google_search_console_tool.httpx.post"
+                "aden_tools.tools.google_search_console_tool.google_search_console_tool._http.post"
             ) as mock_post,
         ):
             mock_post.return_value.status_code = 200
@@ -66,7 +66,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.google_search_console_tool.google_search_console_tool.httpx.get"
+                "aden_tools.tools.google_search_console_tool.google_search_console_tool._http.get"
             ) as mock_get,
         ):
             mock_get.return_value.status_code = 200
@@ -99,7 +99,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.google_search_console_tool.google_search_console_tool.httpx.get"
+                "aden_tools.tools.google_search_console_tool.google_search_console_tool._http.get"
             ) as mock_get,
         ):
             mock_get.return_value.status_code = 200
@@ -134,7 +134,7 @@ def test_successful_inspect(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.google_search_console_tool.google_search_console_tool.httpx.post"
+                "aden_tools.tools.google_search_console_tool.google_search_console_tool._http.post"
             ) as mock_post,
         ):
             mock_post.return_value.status_code = 200
@@ -158,7 +158,7 @@ def test_successful_submit(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.google_search_console_tool.google_search_console_tool.httpx.put"
+                "aden_tools.tools.google_search_console_tool.google_search_console_tool._http.put"
             ) as mock_put,
         ):
             mock_put.return_value.status_code = 204
@@ -35,7 +35,7 @@ def test_missing_id(self, tool_fns):
         """Empty spreadsheet_id still makes the API call; the tool doesn't validate it."""
         with patch.dict("os.environ", ENV):
             with patch(
-                "aden_tools.tools.google_sheets_tool.google_sheets_tool.httpx.get",
+                "aden_tools.tools.google_sheets_tool.google_sheets_tool._http.get",
                 return_value=_mock_resp({"error": {"message": "not found"}}, status_code=404),
             ):
                 result = tool_fns["google_sheets_get_spreadsheet"](spreadsheet_id="")
@@ -59,7 +59,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.google_sheets_tool.google_sheets_tool.httpx.get",
+                "aden_tools.tools.google_sheets_tool.google_sheets_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -81,7 +81,7 @@ def test_missing_credentials(self, tool_fns):
     def test_missing_params(self, tool_fns):
         with patch.dict("os.environ", ENV):
             with patch(
-                "aden_tools.tools.google_sheets_tool.google_sheets_tool.httpx.get",
+                "aden_tools.tools.google_sheets_tool.google_sheets_tool._http.get",
                 return_value=_mock_resp({"error": {"message": "not found"}}, status_code=404),
             ):
                 result = tool_fns["google_sheets_get_values"](spreadsheet_id="", range_name="")
@@ -100,7 +100,7 @@ def test_successful_read(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.google_sheets_tool.google_sheets_tool.httpx.get",
+                "aden_tools.tools.google_sheets_tool.google_sheets_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
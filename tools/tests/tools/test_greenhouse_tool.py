@@ -46,7 +46,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.greenhouse_tool.greenhouse_tool.httpx.get",
+                "aden_tools.tools.greenhouse_tool.greenhouse_tool._http.get",
                 return_value=_mock_resp(jobs),
             ),
         ):
@@ -79,7 +79,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.greenhouse_tool.greenhouse_tool.httpx.get",
+                "aden_tools.tools.greenhouse_tool.greenhouse_tool._http.get",
                 return_value=_mock_resp(job),
             ),
         ):
@@ -111,7 +111,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.greenhouse_tool.greenhouse_tool.httpx.get",
+                "aden_tools.tools.greenhouse_tool.greenhouse_tool._http.get",
                 return_value=_mock_resp(candidates),
             ),
         ):
@@ -144,7 +144,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.greenhouse_tool.greenhouse_tool.httpx.get",
+                "aden_tools.tools.greenhouse_tool.greenhouse_tool._http.get",
                 return_value=_mock_resp(candidate),
             ),
         ):
@@ -175,7 +175,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.greenhouse_tool.greenhouse_tool.httpx.get",
+                "aden_tools.tools.greenhouse_tool.greenhouse_tool._http.get",
                 return_value=_mock_resp(apps),
             ),
         ):
@@ -207,7 +207,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.greenhouse_tool.greenhouse_tool.httpx.get",
+                "aden_tools.tools.greenhouse_tool.greenhouse_tool._http.get",
                 return_value=_mock_resp(app),
             ),
         ):
@@ -22,6 +22,8 @@
     register_tools,
 )
 
+PATCH_BASE = "aden_tools.tools.hubspot_tool.hubspot_tool"
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -123,7 +125,7 @@ class TestHubSpotClientSearchObjects:
     """Tests for _HubSpotClient.search_objects."""
 
     def test_search_posts_correct_url(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"results": [], "total": 0})
             client.search_objects("contacts", query="test@example.com")
             mock_post.assert_called_once()
@@ -131,7 +133,7 @@ def test_search_posts_correct_url(self, client):
             assert args[0] == f"{HUBSPOT_API_BASE}/crm/v3/objects/contacts/search"
 
     def test_search_sends_query_and_properties(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"results": []})
             client.search_objects(
                 "contacts",
@@ -145,7 +147,7 @@ def test_search_sends_query_and_properties(self, client):
             assert body["limit"] == 5
 
     def test_search_clamps_limit_to_100(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"results": []})
             client.search_objects("contacts", limit=999)
             body = mock_post.call_args.kwargs["json"]
@@ -156,14 +158,14 @@ class TestHubSpotClientGetObject:
     """Tests for _HubSpotClient.get_object."""
 
     def test_get_object_url(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"id": "42"})
             client.get_object("contacts", "42")
             args, _ = mock_get.call_args
             assert args[0] == f"{HUBSPOT_API_BASE}/crm/v3/objects/contacts/42"
 
     def test_get_object_passes_properties(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"id": "42"})
             client.get_object("contacts", "42", properties=["email", "phone"])
             params = mock_get.call_args.kwargs["params"]
@@ -174,7 +176,7 @@ class TestHubSpotClientCreateObject:
     """Tests for _HubSpotClient.create_object."""
 
     def test_create_object_posts_properties(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(
                 200, {"id": "99", "properties": {"email": "a@b.com"}}
             )
@@ -188,7 +190,7 @@ class TestHubSpotClientUpdateObject:
     """Tests for _HubSpotClient.update_object."""
 
     def test_update_object_uses_patch(self, client):
-        with patch("httpx.patch") as mock_patch:
+        with patch(f"{PATCH_BASE}._http.patch") as mock_patch:
             mock_patch.return_value = _mock_response(200, {"id": "42"})
             client.update_object("contacts", "42", {"phone": "+1234567890"})
             mock_patch.assert_called_once()
@@ -201,14 +203,14 @@ class TestHubSpotClientDeleteObject:
     """Tests for _HubSpotClient.delete_object."""
 
     def test_delete_returns_status_on_204(self, client):
-        with patch("httpx.delete") as mock_delete:
+        with patch(f"{PATCH_BASE}._http.delete") as mock_delete:
             mock_delete.return_value = _mock_response(status_code=204)
             result = client.delete_object("contacts", "42")
             assert result["status"] == "deleted"
             assert result["object_id"] == "42"
 
     def test_delete_non_204_delegates_to_handle_response(self, client):
-        with patch("httpx.delete") as mock_delete:
+        with patch(f"{PATCH_BASE}._http.delete") as mock_delete:
             mock_delete.return_value = _mock_response(
                 status_code=404, json_data={"message": "Not found"}
             )
@@ -220,21 +222,21 @@ class TestHubSpotClientAssociations:
     """Tests for association-related client methods."""
 
     def test_list_associations_url(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"results": []})
             client.list_associations("contacts", "1", "companies")
             args, _ = mock_get.call_args
             assert "/crm/v4/objects/contacts/1/associations/companies" in args[0]
 
     def test_list_associations_clamps_limit(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"results": []})
             client.list_associations("contacts", "1", "companies", limit=999)
             params = mock_get.call_args.kwargs["params"]
             assert params["limit"] == 500
 
     def test_create_association_uses_put(self, client):
-        with patch("httpx.put") as mock_put:
+        with patch(f"{PATCH_BASE}._http.put") as mock_put:
             mock_put.return_value = _mock_response(200, {"status": "ok"})
             client.create_association("contacts", "1", "companies", "2")
             mock_put.assert_called_once()
@@ -261,7 +263,7 @@ def test_no_credentials_returns_error(self, mcp, monkeypatch):
     def test_env_var_credential(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "env-token")
         fn = _tool_fn(mcp, "hubspot_search_contacts")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"results": []})
             fn(query="test")
             headers = mock_post.call_args.kwargs["headers"]
@@ -271,7 +273,7 @@ def test_credential_store_used_when_provided(self, mcp):
         creds = MagicMock()
         creds.get.return_value = "store-token"
         fn = _tool_fn(mcp, "hubspot_search_contacts", credentials=creds)
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"results": []})
             fn(query="test")
             creds.get.assert_called_once_with("hubspot")
@@ -289,7 +291,7 @@ def test_credential_store_account_alias(self, mcp):
         creds = MagicMock()
         creds.get_by_alias.return_value = "alias-token"
         fn = _tool_fn(mcp, "hubspot_search_contacts", credentials=creds)
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"results": []})
             fn(query="test", account="my-account")
             creds.get_by_alias.assert_called_once_with("hubspot", "my-account")
@@ -306,7 +308,7 @@ class TestHubSpotSearchContacts:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_search_contacts")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"results": [{"id": "1"}], "total": 1})
             result = fn(query="jane")
             assert result["total"] == 1
@@ -314,14 +316,14 @@ def test_success(self, mcp, monkeypatch):
     def test_timeout(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_search_contacts")
-        with patch("httpx.post", side_effect=httpx.TimeoutException("timeout")):
+        with patch(f"{PATCH_BASE}._http.post", side_effect=httpx.TimeoutException("timeout")):
             result = fn(query="jane")
             assert result == {"error": "Request timed out"}
 
     def test_network_error(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_search_contacts")
-        with patch("httpx.post", side_effect=httpx.RequestError("dns fail")):
+        with patch(f"{PATCH_BASE}._http.post", side_effect=httpx.RequestError("dns fail")):
             result = fn(query="jane")
             assert "Network error" in result["error"]
 
@@ -332,7 +334,7 @@ class TestHubSpotGetContact:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_get_contact")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(
                 200, {"id": "42", "properties": {"email": "a@b.com"}}
             )
@@ -342,7 +344,7 @@ def test_success(self, mcp, monkeypatch):
     def test_404(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_get_contact")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(status_code=404)
             result = fn(contact_id="999")
             assert "error" in result
@@ -355,7 +357,7 @@ class TestHubSpotCreateContact:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_create_contact")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(
                 200, {"id": "99", "properties": {"email": "new@example.com"}}
             )
@@ -369,7 +371,7 @@ class TestHubSpotUpdateContact:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_update_contact")
-        with patch("httpx.patch") as mock_patch:
+        with patch(f"{PATCH_BASE}._http.patch") as mock_patch:
             mock_patch.return_value = _mock_response(200, {"id": "42"})
             result = fn(contact_id="42", properties={"phone": "+1234567890"})
             assert result["id"] == "42"
@@ -384,7 +386,7 @@ class TestHubSpotSearchCompanies:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_search_companies")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"results": [{"id": "c1"}], "total": 1})
             result = fn(query="Acme")
             assert result["total"] == 1
@@ -394,7 +396,7 @@ class TestHubSpotGetCompany:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_get_company")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(
                 200, {"id": "c1", "properties": {"name": "Acme"}}
             )
@@ -406,7 +408,7 @@ class TestHubSpotCreateCompany:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_create_company")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(
                 200, {"id": "c2", "properties": {"name": "NewCo"}}
             )
@@ -418,7 +420,7 @@ class TestHubSpotUpdateCompany:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_update_company")
-        with patch("httpx.patch") as mock_patch:
+        with patch(f"{PATCH_BASE}._http.patch") as mock_patch:
             mock_patch.return_value = _mock_response(200, {"id": "c1"})
             result = fn(company_id="c1", properties={"industry": "Finance"})
             assert result["id"] == "c1"
@@ -433,7 +435,7 @@ class TestHubSpotSearchDeals:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_search_deals")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"results": [{"id": "d1"}], "total": 1})
             result = fn(query="big deal")
             assert result["total"] == 1
@@ -443,7 +445,7 @@ class TestHubSpotGetDeal:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_get_deal")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(
                 200, {"id": "d1", "properties": {"dealname": "Big Deal"}}
             )
@@ -455,7 +457,7 @@ class TestHubSpotCreateDeal:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_create_deal")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(
                 200, {"id": "d2", "properties": {"dealname": "New Deal"}}
             )
@@ -467,7 +469,7 @@ class TestHubSpotUpdateDeal:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_update_deal")
-        with patch("httpx.patch") as mock_patch:
+        with patch(f"{PATCH_BASE}._http.patch") as mock_patch:
             mock_patch.return_value = _mock_response(200, {"id": "d1"})
             result = fn(deal_id="d1", properties={"amount": "15000"})
             assert result["id"] == "d1"
@@ -484,7 +486,7 @@ class TestHubSpotDeleteObject:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_delete_object")
-        with patch("httpx.delete") as mock_delete:
+        with patch(f"{PATCH_BASE}._http.delete") as mock_delete:
             mock_delete.return_value = _mock_response(status_code=204)
             result = fn(object_type="contacts", object_id="42")
             assert result["status"] == "deleted"
@@ -500,7 +502,7 @@ def test_invalid_object_type(self, mcp, monkeypatch):
     def test_all_valid_object_types(self, mcp, monkeypatch, valid_type):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_delete_object")
-        with patch("httpx.delete") as mock_delete:
+        with patch(f"{PATCH_BASE}._http.delete") as mock_delete:
             mock_delete.return_value = _mock_response(status_code=204)
             result = fn(object_type=valid_type, object_id="1")
             assert result["status"] == "deleted"
@@ -508,7 +510,7 @@ def test_all_valid_object_types(self, mcp, monkeypatch, valid_type):
     def test_timeout(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_delete_object")
-        with patch("httpx.delete", side_effect=httpx.TimeoutException("t")):
+        with patch(f"{PATCH_BASE}._http.delete", side_effect=httpx.TimeoutException("t")):
             result = fn(object_type="contacts", object_id="1")
             assert result == {"error": "Request timed out"}
 
@@ -522,7 +524,7 @@ class TestHubSpotListAssociations:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_list_associations")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"results": [{"toObjectId": "c1"}]})
             result = fn(
                 from_object_type="contacts",
@@ -534,7 +536,7 @@ def test_success(self, mcp, monkeypatch):
     def test_timeout(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_list_associations")
-        with patch("httpx.get", side_effect=httpx.TimeoutException("t")):
+        with patch(f"{PATCH_BASE}._http.get", side_effect=httpx.TimeoutException("t")):
             result = fn(
                 from_object_type="contacts",
                 from_object_id="1",
@@ -547,7 +549,7 @@ class TestHubSpotCreateAssociation:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("HUBSPOT_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "hubspot_create_association")
-        with patch("httpx.put") as mock_put:
+        with patch(f"{PATCH_BASE}._http.put") as mock_put:
             mock_put.return_value = _mock_response(200, {"status": "ok"})
             result = fn(
                 from_object_type="contacts",
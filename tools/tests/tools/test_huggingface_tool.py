@@ -40,7 +40,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.get",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.get",
                 return_value=mock_resp,
             ),
         ):
@@ -74,7 +74,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.get",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.get",
                 return_value=mock_resp,
             ),
         ):
@@ -101,7 +101,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.get",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.get",
                 return_value=mock_resp,
             ),
         ):
@@ -133,7 +133,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.get",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.get",
                 return_value=mock_resp,
             ),
         ):
@@ -159,7 +159,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.get",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.get",
                 return_value=mock_resp,
             ),
         ):
@@ -189,7 +189,7 @@ def test_successful_whoami(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.get",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.get",
                 return_value=mock_resp,
             ),
         ):
@@ -238,7 +238,7 @@ def test_successful_inference(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.post",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.post",
                 return_value=mock_resp,
             ),
         ):
@@ -259,7 +259,7 @@ def test_inference_with_parameters(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.post",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.post",
                 return_value=mock_resp,
             ) as mock_post,
         ):
@@ -281,7 +281,7 @@ def test_model_loading_503(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.post",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.post",
                 return_value=mock_resp,
             ),
         ):
@@ -321,7 +321,7 @@ def test_successful_embedding(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.post",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.post",
                 return_value=mock_resp,
             ),
         ):
@@ -356,7 +356,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.get",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.get",
                 return_value=mock_resp,
             ),
         ):
@@ -374,7 +374,7 @@ def test_empty_endpoints(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.huggingface_tool.huggingface_tool.httpx.get",
+                "aden_tools.tools.huggingface_tool.huggingface_tool._http.get",
                 return_value=mock_resp,
             ),
         ):
@@ -23,6 +23,8 @@
     register_tools,
 )
 
+PATCH_BASE = "aden_tools.tools.intercom_tool.intercom_tool"
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -123,7 +125,7 @@ class TestIntercomClientAdminId:
     """Tests for lazy admin ID fetching via /me."""
 
     def test_fetches_admin_id_on_first_call(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"id": "admin-123"})
             result = client._get_admin_id()
             assert result == "admin-123"
@@ -131,7 +133,7 @@ def test_fetches_admin_id_on_first_call(self, client):
             assert INTERCOM_API_BASE + "/me" in mock_get.call_args[0][0]
 
     def test_caches_admin_id(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"id": "admin-123"})
             client._get_admin_id()
             client._get_admin_id()
@@ -139,7 +141,7 @@ def test_caches_admin_id(self, client):
             assert mock_get.call_count == 1
 
     def test_returns_error_on_failure(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(401)
             result = client._get_admin_id()
             assert isinstance(result, dict)
@@ -148,14 +150,14 @@ def test_returns_error_on_failure(self, client):
 
 class TestIntercomClientSearchConversations:
     def test_posts_to_correct_url(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"conversations": []})
             client.search_conversations({"field": "state", "operator": "=", "value": "open"})
             args, _ = mock_post.call_args
             assert args[0] == f"{INTERCOM_API_BASE}/conversations/search"
 
     def test_clamps_limit(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"conversations": []})
             client.search_conversations({}, limit=999)
             body = mock_post.call_args.kwargs["json"]
@@ -164,7 +166,7 @@ def test_clamps_limit(self, client):
 
 class TestIntercomClientGetConversation:
     def test_url_and_plaintext_param(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"id": "conv-1"})
             client.get_conversation("conv-1")
             args, kwargs = mock_get.call_args
@@ -175,7 +177,7 @@ def test_url_and_plaintext_param(self, client):
 class TestIntercomClientReplyToConversation:
     def test_reply_sends_admin_id(self, client):
         client._admin_id = "admin-1"
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"type": "conversation_part"})
             client.reply_to_conversation("conv-1", body="Hello", message_type="comment")
             body = mock_post.call_args.kwargs["json"]
@@ -186,7 +188,7 @@ def test_reply_sends_admin_id(self, client):
 
 class TestIntercomClientCreateContact:
     def test_creates_with_role_and_email(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"id": "contact-1", "role": "user"})
             client.create_contact(role="user", email="test@example.com")
             body = mock_post.call_args.kwargs["json"]
@@ -194,7 +196,7 @@ def test_creates_with_role_and_email(self, client):
             assert body["email"] == "test@example.com"
 
     def test_omits_none_fields(self, client):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"id": "contact-1"})
             client.create_contact(role="lead")
             body = mock_post.call_args.kwargs["json"]
@@ -204,7 +206,7 @@ def test_omits_none_fields(self, client):
 
 class TestIntercomClientListConversations:
     def test_passes_pagination_params(self, client):
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"conversations": []})
             client.list_conversations(limit=10, starting_after="cursor-abc")
             params = mock_get.call_args.kwargs["params"]
@@ -230,7 +232,7 @@ def test_no_credentials_returns_error(self, mcp, monkeypatch):
     def test_env_var_credential(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "env-tok")
         fn = _tool_fn(mcp, "intercom_list_teams")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"teams": []})
             fn()
             headers = mock_get.call_args.kwargs["headers"]
@@ -240,7 +242,7 @@ def test_credential_store_used(self, mcp):
         creds = MagicMock()
         creds.get.return_value = "store-tok"
         fn = _tool_fn(mcp, "intercom_list_teams", credentials=creds)
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"teams": []})
             fn()
             creds.get.assert_called_once_with("intercom")
@@ -262,7 +264,7 @@ class TestIntercomSearchConversations:
     def test_no_filters_returns_recent(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_search_conversations")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"conversations": [{"id": "1"}]})
             result = fn()
             assert "conversations" in result
@@ -290,7 +292,7 @@ def test_invalid_limit_too_low(self, mcp, monkeypatch):
     def test_status_filter_applied(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_search_conversations")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"conversations": []})
             fn(status="open")
             body = mock_post.call_args.kwargs["json"]
@@ -308,7 +310,7 @@ def test_invalid_created_after(self, mcp, monkeypatch):
     def test_timeout(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_search_conversations")
-        with patch("httpx.post", side_effect=httpx.TimeoutException("t")):
+        with patch(f"{PATCH_BASE}._http.post", side_effect=httpx.TimeoutException("t")):
             result = fn()
             assert result == {"error": "Request timed out"}
 
@@ -317,7 +319,7 @@ class TestIntercomGetConversation:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_get_conversation")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"id": "conv-1", "state": "open"})
             result = fn(conversation_id="conv-1")
             assert result["id"] == "conv-1"
@@ -332,7 +334,7 @@ class TestIntercomGetContact:
     def test_by_id(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_get_contact")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"id": "c1", "email": "a@b.com"})
             result = fn(contact_id="c1")
             assert result["id"] == "c1"
@@ -340,7 +342,7 @@ def test_by_id(self, mcp, monkeypatch):
     def test_by_email_fallback(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_get_contact")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(
                 200, {"data": [{"id": "c1", "email": "a@b.com"}]}
             )
@@ -357,7 +359,7 @@ def test_no_id_or_email(self, mcp, monkeypatch):
     def test_email_not_found(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_get_contact")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"data": []})
             result = fn(email="missing@example.com")
             assert "error" in result
@@ -368,7 +370,7 @@ class TestIntercomSearchContacts:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_search_contacts")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"data": [{"id": "c1"}]})
             result = fn(query="jane")
             assert "data" in result
@@ -385,7 +387,7 @@ class TestIntercomCreateContact:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_create_contact")
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = _mock_response(200, {"id": "new-c", "role": "user"})
             result = fn(email="new@example.com")
             assert result["id"] == "new-c"
@@ -407,7 +409,10 @@ class TestIntercomAddNote:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_add_note")
-        with patch("httpx.get") as mock_get, patch("httpx.post") as mock_post:
+        with (
+            patch(f"{PATCH_BASE}._http.get") as mock_get,
+            patch(f"{PATCH_BASE}._http.post") as mock_post,
+        ):
             mock_get.return_value = _mock_response(200, {"id": "admin-1"})
             mock_post.return_value = _mock_response(200, {"type": "conversation_part"})
             result = fn(conversation_id="conv-1", body="Internal note")
@@ -432,7 +437,10 @@ def test_cannot_provide_both_targets(self, mcp, monkeypatch):
     def test_tag_conversation_success(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_add_tag")
-        with patch("httpx.get") as mock_get, patch("httpx.post") as mock_post:
+        with (
+            patch(f"{PATCH_BASE}._http.get") as mock_get,
+            patch(f"{PATCH_BASE}._http.post") as mock_post,
+        ):
             mock_get.return_value = _mock_response(200, {"id": "admin-1"})
             # First post: create_or_get_tag, second: tag_conversation
             mock_post.side_effect = [
@@ -447,7 +455,10 @@ class TestIntercomAssignConversation:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_assign_conversation")
-        with patch("httpx.get") as mock_get, patch("httpx.post") as mock_post:
+        with (
+            patch(f"{PATCH_BASE}._http.get") as mock_get,
+            patch(f"{PATCH_BASE}._http.post") as mock_post,
+        ):
             mock_get.return_value = _mock_response(200, {"id": "admin-1"})
             mock_post.return_value = _mock_response(
                 200, {"id": "conv-1", "assignee": {"id": "admin-2"}}
@@ -474,7 +485,10 @@ class TestIntercomCloseConversation:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_close_conversation")
-        with patch("httpx.get") as mock_get, patch("httpx.post") as mock_post:
+        with (
+            patch(f"{PATCH_BASE}._http.get") as mock_get,
+            patch(f"{PATCH_BASE}._http.post") as mock_post,
+        ):
             mock_get.return_value = _mock_response(200, {"id": "admin-1"})
             mock_post.return_value = _mock_response(200, {"state": "closed"})
             result = fn(conversation_id="conv-1")
@@ -492,7 +506,7 @@ class TestIntercomListTeams:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_list_teams")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(
                 200, {"teams": [{"id": "t1", "name": "Support"}]}
             )
@@ -504,7 +518,7 @@ class TestIntercomListConversations:
     def test_success(self, mcp, monkeypatch):
         monkeypatch.setenv("INTERCOM_ACCESS_TOKEN", "tok")
         fn = _tool_fn(mcp, "intercom_list_conversations")
-        with patch("httpx.get") as mock_get:
+        with patch(f"{PATCH_BASE}._http.get") as mock_get:
             mock_get.return_value = _mock_response(200, {"conversations": [{"id": "conv-1"}]})
             result = fn(limit=5)
             assert "conversations" in result
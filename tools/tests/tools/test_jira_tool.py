@@ -57,7 +57,7 @@ def test_successful_search(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.jira_tool.jira_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.jira_tool.jira_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["jira_search_issues"](jql="project = TEST")
 
@@ -97,7 +97,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.jira_tool.jira_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.jira_tool.jira_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["jira_get_issue"](issue_key="TEST-1")
 
@@ -120,7 +120,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.jira_tool.jira_tool.httpx.post",
+                "aden_tools.tools.jira_tool.jira_tool._http.post",
                 return_value=_mock_resp(data, 201),
             ),
         ):
@@ -144,7 +144,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.jira_tool.jira_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.jira_tool.jira_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["jira_list_projects"]()
 
@@ -173,7 +173,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.jira_tool.jira_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.jira_tool.jira_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["jira_get_project"](project_key="TEST")
 
@@ -196,7 +196,7 @@ def test_successful_add(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.jira_tool.jira_tool.httpx.post",
+                "aden_tools.tools.jira_tool.jira_tool._http.post",
                 return_value=_mock_resp(data, 201),
             ),
         ):
@@ -54,7 +54,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.kafka_tool.kafka_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.kafka_tool.kafka_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["kafka_list_topics"]()
@@ -81,7 +81,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.kafka_tool.kafka_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.kafka_tool.kafka_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["kafka_get_topic"](topic_name="orders")
@@ -105,7 +105,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.kafka_tool.kafka_tool.httpx.post", return_value=_mock_resp(data)
+                "aden_tools.tools.kafka_tool.kafka_tool._http.post", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["kafka_create_topic"](topic_name="new-topic", partitions_count=3)
@@ -130,7 +130,7 @@ def test_successful_produce(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.kafka_tool.kafka_tool.httpx.post", return_value=_mock_resp(data)
+                "aden_tools.tools.kafka_tool.kafka_tool._http.post", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["kafka_produce_message"](
@@ -156,7 +156,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.kafka_tool.kafka_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.kafka_tool.kafka_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["kafka_list_consumer_groups"]()
@@ -184,7 +184,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.kafka_tool.kafka_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.kafka_tool.kafka_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["kafka_get_consumer_group_lag"](consumer_group_id="my-group")
@@ -55,7 +55,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.langfuse_tool.langfuse_tool.httpx.get",
+                "aden_tools.tools.langfuse_tool.langfuse_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -110,7 +110,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.langfuse_tool.langfuse_tool.httpx.get",
+                "aden_tools.tools.langfuse_tool.langfuse_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -143,7 +143,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.langfuse_tool.langfuse_tool.httpx.get",
+                "aden_tools.tools.langfuse_tool.langfuse_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -165,7 +165,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.langfuse_tool.langfuse_tool.httpx.post",
+                "aden_tools.tools.langfuse_tool.langfuse_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -197,7 +197,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.langfuse_tool.langfuse_tool.httpx.get",
+                "aden_tools.tools.langfuse_tool.langfuse_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -230,7 +230,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.langfuse_tool.langfuse_tool.httpx.get",
+                "aden_tools.tools.langfuse_tool.langfuse_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
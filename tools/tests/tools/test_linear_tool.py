@@ -74,7 +74,7 @@ def test_handle_response_generic_error(self):
         assert "error" in result
         assert "500" in result["error"]
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_execute_query(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -93,7 +93,7 @@ def test_execute_query(self, mock_post):
         )
         assert result == {"viewer": {"id": "user-123", "name": "Test User"}}
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_execute_query_with_variables(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -113,7 +113,7 @@ def test_execute_query_with_variables(self, mock_post):
 
     # --- Issue Operations ---
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_create_issue(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -142,7 +142,7 @@ def test_create_issue(self, mock_post):
         assert result["success"] is True
         assert result["issue"]["identifier"] == "ENG-123"
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_get_issue(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -163,7 +163,7 @@ def test_get_issue(self, mock_post):
         assert result["identifier"] == "ENG-123"
         assert result["state"]["name"] == "In Progress"
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_update_issue(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -185,7 +185,7 @@ def test_update_issue(self, mock_post):
 
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_delete_issue(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -196,7 +196,7 @@ def test_delete_issue(self, mock_post):
 
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_search_issues(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -218,7 +218,7 @@ def test_search_issues(self, mock_post):
         assert result["total"] == 2
         assert len(result["issues"]) == 2
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_add_comment(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -238,7 +238,7 @@ def test_add_comment(self, mock_post):
 
     # --- Project Operations ---
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_create_project(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -266,7 +266,7 @@ def test_create_project(self, mock_post):
         assert result["success"] is True
         assert result["project"]["name"] == "Q1 Roadmap"
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_get_project(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -286,7 +286,7 @@ def test_get_project(self, mock_post):
         assert result["name"] == "Q1 Roadmap"
         assert result["progress"] == 0.5
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_list_projects(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -309,7 +309,7 @@ def test_list_projects(self, mock_post):
 
     # --- Team Operations ---
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_list_teams(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -330,7 +330,7 @@ def test_list_teams(self, mock_post):
         assert result["total"] == 2
         assert result["teams"][0]["key"] == "ENG"
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_get_workflow_states(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -353,7 +353,7 @@ def test_get_workflow_states(self, mock_post):
 
     # --- User Operations ---
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_list_users(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -373,7 +373,7 @@ def test_list_users(self, mock_post):
 
         assert result["total"] == 2
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_get_viewer(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -394,7 +394,7 @@ def test_get_viewer(self, mock_post):
 
     # --- Label Operations ---
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_create_label(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -412,7 +412,7 @@ def test_create_label(self, mock_post):
 
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_list_labels(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -470,7 +470,7 @@ def test_credentials_from_credential_manager(self):
 
         teams_fn = next(fn for fn in registered_fns if fn.__name__ == "linear_teams_list")
 
-        with patch("aden_tools.tools.linear_tool.linear_tool.httpx.post") as mock_post:
+        with patch("aden_tools.tools.linear_tool.linear_tool._http.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"data": {"teams": {"nodes": []}}}
@@ -492,7 +492,7 @@ def test_credentials_from_env_var(self):
 
         with (
             patch.dict("os.environ", {"LINEAR_API_KEY": "lin_api_env_key"}),
-            patch("aden_tools.tools.linear_tool.linear_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.linear_tool.linear_tool._http.post") as mock_post,
         ):
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -522,7 +522,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_issue_create(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -540,7 +540,7 @@ def test_linear_issue_create(self, mock_post):
         result = self._fn("linear_issue_create")(title="Test Issue", team_id="team-123")
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_issue_get(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -549,7 +549,7 @@ def test_linear_issue_get(self, mock_post):
         result = self._fn("linear_issue_get")(issue_id="ENG-1")
         assert result["identifier"] == "ENG-1"
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_issue_update(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -560,7 +560,7 @@ def test_linear_issue_update(self, mock_post):
         result = self._fn("linear_issue_update")(issue_id="1", title="New Title")
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_issue_delete(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -569,7 +569,7 @@ def test_linear_issue_delete(self, mock_post):
         result = self._fn("linear_issue_delete")(issue_id="1")
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_issue_search(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -587,7 +587,7 @@ def test_linear_issue_search(self, mock_post):
         result = self._fn("linear_issue_search")(query="test")
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_issue_add_comment(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -598,14 +598,14 @@ def test_linear_issue_add_comment(self, mock_post):
         result = self._fn("linear_issue_add_comment")(issue_id="1", body="Test comment")
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_issue_create_timeout(self, mock_post):
         mock_post.side_effect = httpx.TimeoutException("timed out")
         result = self._fn("linear_issue_create")(title="Test Issue", team_id="team-123")
         assert "error" in result
         assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_issue_get_network_error(self, mock_post):
         mock_post.side_effect = httpx.RequestError("connection failed")
         result = self._fn("linear_issue_get")(issue_id="1")
@@ -625,7 +625,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_project_create(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -643,7 +643,7 @@ def test_linear_project_create(self, mock_post):
         result = self._fn("linear_project_create")(name="Test Project", team_ids=["team-1"])
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_project_get(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -652,7 +652,7 @@ def test_linear_project_get(self, mock_post):
         result = self._fn("linear_project_get")(project_id="p1")
         assert result["name"] == "Test"
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_project_update(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -663,7 +663,7 @@ def test_linear_project_update(self, mock_post):
         result = self._fn("linear_project_update")(project_id="p1", name="New Name")
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_project_list(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -694,7 +694,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_teams_list(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -705,7 +705,7 @@ def test_linear_teams_list(self, mock_post):
         result = self._fn("linear_teams_list")()
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_team_get(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -716,7 +716,7 @@ def test_linear_team_get(self, mock_post):
         result = self._fn("linear_team_get")(team_id="t1")
         assert result["key"] == "ENG"
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_workflow_states_get(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -740,7 +740,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_users_list(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -751,7 +751,7 @@ def test_linear_users_list(self, mock_post):
         result = self._fn("linear_users_list")()
         assert result["total"] == 1
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_user_get(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -760,7 +760,7 @@ def test_linear_user_get(self, mock_post):
         result = self._fn("linear_user_get")(user_id="u1")
         assert result["name"] == "Alice"
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_viewer(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -782,7 +782,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_label_create(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -800,7 +800,7 @@ def test_linear_label_create(self, mock_post):
         result = self._fn("linear_label_create")(name="bug", team_id="t1")
         assert result["success"] is True
 
-    @patch("aden_tools.tools.linear_tool.linear_tool.httpx.post")
+    @patch("aden_tools.tools.linear_tool.linear_tool._http.post")
     def test_linear_labels_list(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -51,7 +51,7 @@ def test_successful_enrich_by_name(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.lusha_tool.lusha_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.lusha_tool.lusha_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["lusha_enrich_person"](
@@ -75,7 +75,7 @@ def test_successful_enrich_by_email(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.lusha_tool.lusha_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.lusha_tool.lusha_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["lusha_enrich_person"](email="jane@acme.com")
@@ -104,7 +104,7 @@ def test_successful_enrich(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.lusha_tool.lusha_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.lusha_tool.lusha_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["lusha_enrich_company"](domain="acme.com")
@@ -140,7 +140,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.lusha_tool.lusha_tool.httpx.post", return_value=_mock_resp(data)
+                "aden_tools.tools.lusha_tool.lusha_tool._http.post", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["lusha_search_contacts"](
@@ -175,7 +175,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.lusha_tool.lusha_tool.httpx.post", return_value=_mock_resp(data)
+                "aden_tools.tools.lusha_tool.lusha_tool._http.post", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["lusha_search_companies"](country="United States")
@@ -195,7 +195,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.lusha_tool.lusha_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.lusha_tool.lusha_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["lusha_get_usage"]()
@@ -86,7 +86,7 @@ def test_handle_response_errors(self, status_code):
         assert "error" in result
         assert str(status_code) in result["error"]
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_list_teams(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -104,7 +104,7 @@ def test_list_teams(self, mock_request):
         assert len(result) == 2
         assert result[0]["display_name"] == "Test Team"
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_list_channels(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -121,7 +121,7 @@ def test_list_channels(self, mock_request):
         assert len(result) == 2
         assert result[0]["name"] == "town-square"
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_send_message(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=201,
@@ -139,7 +139,7 @@ def test_send_message(self, mock_request):
         assert "posts" in mock_request.call_args[0][1]
         assert result["message"] == "Hello world"
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_send_message_with_thread(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=201,
@@ -157,7 +157,7 @@ def test_send_message_with_thread(self, mock_request):
         assert call_kwargs["json"]["root_id"] == "p123"
         assert result["root_id"] == "p123"
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_get_posts(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -177,7 +177,7 @@ def test_get_posts(self, mock_request):
         assert "order" in result
         assert len(result["order"]) == 2
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_get_channel(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -194,7 +194,7 @@ def test_get_channel(self, mock_request):
         assert result["name"] == "town-square"
         assert result["type"] == "O"
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_delete_post(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"status": "ok"})
@@ -203,7 +203,7 @@ def test_delete_post(self, mock_request):
         assert mock_request.call_args[0][0] == "DELETE"
         assert "posts/p123" in mock_request.call_args[0][1]
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_create_reaction(self, mock_request):
         # First call returns user info, second creates the reaction
         mock_request.side_effect = [
@@ -228,7 +228,7 @@ def test_create_reaction(self, mock_request):
         assert mock_request.call_args_list[1][1]["json"]["emoji_name"] == "thumbsup"
 
     @patch("aden_tools.tools.mattermost_tool.mattermost_tool.time.sleep")
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_retry_on_429_then_success(self, mock_request, mock_sleep):
         mock_request.side_effect = [
             MagicMock(
@@ -248,7 +248,7 @@ def test_retry_on_429_then_success(self, mock_request, mock_sleep):
         mock_sleep.assert_called_once_with(0.01)
 
     @patch("aden_tools.tools.mattermost_tool.mattermost_tool.time.sleep")
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_retry_exhausted_returns_error(self, mock_request, mock_sleep):
         mock_request.return_value = MagicMock(
             status_code=429,
@@ -279,7 +279,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_list_teams_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -316,7 +316,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_list_channels_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -331,7 +331,7 @@ def test_list_channels_success(self, mock_request):
         assert len(result["channels"]) == 1
         assert result["channels"][0]["name"] == "town-square"
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_list_channels_error(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=404,
@@ -358,7 +358,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_send_message_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=201,
@@ -385,7 +385,7 @@ def test_send_message_length_validation(self):
     def test_send_message_exactly_at_limit(self):
         content = "x" * MAX_MESSAGE_LENGTH
         with patch(
-            "aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request"
+            "aden_tools.tools.mattermost_tool.mattermost_tool._http.request"
         ) as mock_request:
             mock_request.return_value = MagicMock(
                 status_code=201,
@@ -394,7 +394,7 @@ def test_send_message_exactly_at_limit(self):
             result = self._fn("mattermost_send_message")("c1", content)
         assert result["success"] is True
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_send_message_rate_limit_429_exhausted(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=429,
@@ -406,7 +406,7 @@ def test_send_message_rate_limit_429_exhausted(self, mock_request):
         assert "rate limit" in result["error"].lower()
         assert mock_request.call_count == MAX_RETRIES + 1
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_send_message_rate_limit_then_success(self, mock_request):
         mock_request.side_effect = [
             MagicMock(
@@ -440,7 +440,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_get_posts_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -471,7 +471,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_get_channel_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200,
@@ -504,7 +504,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_delete_post_success(self, mock_request):
         mock_request.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"status": "ok"})
@@ -529,7 +529,7 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.mattermost_tool.mattermost_tool.httpx.request")
+    @patch("aden_tools.tools.mattermost_tool.mattermost_tool._http.request")
     def test_create_reaction_success(self, mock_request):
         mock_request.side_effect = [
             MagicMock(
@@ -40,7 +40,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", {"MICROSOFT_GRAPH_ACCESS_TOKEN": "test-token"}),
             patch(
-                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool.httpx.get"
+                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool._http.get"
             ) as mock_get,
         ):
             mock_get.return_value.status_code = 200
@@ -75,7 +75,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", {"MICROSOFT_GRAPH_ACCESS_TOKEN": "test-token"}),
             patch(
-                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool.httpx.get"
+                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool._http.get"
             ) as mock_get,
         ):
             mock_get.return_value.status_code = 200
@@ -97,7 +97,7 @@ def test_successful_send(self, tool_fns):
         with (
             patch.dict("os.environ", {"MICROSOFT_GRAPH_ACCESS_TOKEN": "test-token"}),
             patch(
-                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool.httpx.post"
+                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool._http.post"
             ) as mock_post,
         ):
             mock_post.return_value.status_code = 202
@@ -119,7 +119,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", {"MICROSOFT_GRAPH_ACCESS_TOKEN": "test-token"}),
             patch(
-                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool.httpx.get"
+                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool._http.get"
             ) as mock_get,
         ):
             mock_get.return_value.status_code = 200
@@ -150,7 +150,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", {"MICROSOFT_GRAPH_ACCESS_TOKEN": "test-token"}),
             patch(
-                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool.httpx.get"
+                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool._http.get"
             ) as mock_get,
         ):
             mock_get.return_value.status_code = 200
@@ -171,7 +171,7 @@ def test_successful_send(self, tool_fns):
         with (
             patch.dict("os.environ", {"MICROSOFT_GRAPH_ACCESS_TOKEN": "test-token"}),
             patch(
-                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool.httpx.post"
+                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool._http.post"
             ) as mock_post,
         ):
             mock_post.return_value.status_code = 201
@@ -208,7 +208,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", {"MICROSOFT_GRAPH_ACCESS_TOKEN": "test-token"}),
             patch(
-                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool.httpx.get"
+                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool._http.get"
             ) as mock_get,
         ):
             mock_get.return_value.status_code = 200
@@ -230,7 +230,7 @@ def test_successful_upload(self, tool_fns):
         with (
             patch.dict("os.environ", {"MICROSOFT_GRAPH_ACCESS_TOKEN": "test-token"}),
             patch(
-                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool.httpx.put"
+                "aden_tools.tools.microsoft_graph_tool.microsoft_graph_tool._http.put"
             ) as mock_put,
         ):
             mock_put.return_value.status_code = 201
@@ -50,7 +50,7 @@ def test_successful_find(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.mongodb_tool.mongodb_tool.httpx.post",
+                "aden_tools.tools.mongodb_tool.mongodb_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -66,7 +66,7 @@ def test_successful_find_one(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.mongodb_tool.mongodb_tool.httpx.post",
+                "aden_tools.tools.mongodb_tool.mongodb_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -82,7 +82,7 @@ def test_no_match(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.mongodb_tool.mongodb_tool.httpx.post",
+                "aden_tools.tools.mongodb_tool.mongodb_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -104,7 +104,7 @@ def test_successful_insert(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.mongodb_tool.mongodb_tool.httpx.post",
+                "aden_tools.tools.mongodb_tool.mongodb_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -129,7 +129,7 @@ def test_successful_update(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.mongodb_tool.mongodb_tool.httpx.post",
+                "aden_tools.tools.mongodb_tool.mongodb_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -155,7 +155,7 @@ def test_successful_delete(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.mongodb_tool.mongodb_tool.httpx.post",
+                "aden_tools.tools.mongodb_tool.mongodb_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -184,7 +184,7 @@ def test_successful_aggregate(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.mongodb_tool.mongodb_tool.httpx.post",
+                "aden_tools.tools.mongodb_tool.mongodb_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -51,7 +51,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.n8n_tool.n8n_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.n8n_tool.n8n_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["n8n_list_workflows"]()
 
@@ -78,7 +78,7 @@ def test_pagination(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.n8n_tool.n8n_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.n8n_tool.n8n_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["n8n_list_workflows"]()
 
@@ -106,7 +106,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.n8n_tool.n8n_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.n8n_tool.n8n_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["n8n_get_workflow"](workflow_id="wf1")
 
@@ -125,7 +125,7 @@ def test_successful_activate(self, tool_fns):
         data = {"id": "wf1", "name": "Email Workflow", "active": True}
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.n8n_tool.n8n_tool.httpx.post", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.n8n_tool.n8n_tool._http.post", return_value=_mock_resp(data)),
         ):
             result = tool_fns["n8n_activate_workflow"](workflow_id="wf1")
 
@@ -137,7 +137,7 @@ def test_successful_deactivate(self, tool_fns):
         data = {"id": "wf1", "name": "Email Workflow", "active": False}
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.n8n_tool.n8n_tool.httpx.post", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.n8n_tool.n8n_tool._http.post", return_value=_mock_resp(data)),
         ):
             result = tool_fns["n8n_deactivate_workflow"](workflow_id="wf1")
 
@@ -162,7 +162,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.n8n_tool.n8n_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.n8n_tool.n8n_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["n8n_list_executions"]()
 
@@ -191,7 +191,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.n8n_tool.n8n_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.n8n_tool.n8n_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["n8n_get_execution"](execution_id="1000")
 
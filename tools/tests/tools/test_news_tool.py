@@ -56,7 +56,7 @@ def mock_get(url: str, params=None, timeout=30.0, headers=None):
                 },
             )
 
-        monkeypatch.setattr(httpx, "get", mock_get)
+        monkeypatch.setattr(news_tool._http, "get", mock_get)
 
         result = news_tools["news_search"].fn(query="funding")
 
@@ -91,8 +91,8 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 },
             )
 
-        monkeypatch.setattr(httpx, "get", mock_get)
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(news_tool._http, "get", mock_get)
+        monkeypatch.setattr(news_tool._http, "post", mock_post)
 
         result = news_tools["news_search"].fn(query="markets")
 
@@ -121,7 +121,7 @@ def mock_get(url: str, params=None, timeout=30.0, headers=None):
             captured["params"] = params or {}
             return DummyResponse(200, {"results": []})
 
-        monkeypatch.setattr(httpx, "get", mock_get)
+        monkeypatch.setattr(news_tool._http, "get", mock_get)
 
         result = news_tools["news_by_company"].fn(company_name="Acme", days_back=7)
 
@@ -148,7 +148,7 @@ def mock_get(url: str, params=None, timeout=30.0, headers=None):
                 return DummyResponse(429, {})
             return DummyResponse(200, {"results": [{"title": "OK", "source_id": "s"}]})
 
-        monkeypatch.setattr(httpx, "get", mock_get)
+        monkeypatch.setattr(news_tool._http, "get", mock_get)
         monkeypatch.setattr(time, "sleep", lambda s: None)
 
         result = news_tools["news_search"].fn(query="test")
@@ -170,8 +170,8 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 {"articles": [{"title": "Fallback", "source": "fin"}]},
             )
 
-        monkeypatch.setattr(httpx, "get", mock_get)
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(news_tool._http, "get", mock_get)
+        monkeypatch.setattr(news_tool._http, "post", mock_post)
         monkeypatch.setattr(time, "sleep", lambda s: None)
 
         result = news_tools["news_search"].fn(query="test")
@@ -195,7 +195,7 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 {"articles": [{"title": "OK", "source": "fin", "sentiment": 0.5}]},
             )
 
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(news_tool._http, "post", mock_post)
         monkeypatch.setattr(time, "sleep", lambda s: None)
 
         result = news_tools["news_sentiment"].fn(query="test")
@@ -222,7 +222,7 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 },
             )
 
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(news_tool._http, "post", mock_post)
 
         result = news_tools["news_sentiment"].fn(query="test")
 
@@ -245,7 +245,7 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 },
             )
 
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(news_tool._http, "post", mock_post)
 
         result = news_tools["news_sentiment"].fn(query="test")
 
@@ -263,7 +263,7 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 {"articles": [{"title": "A", "source": "s", "sentiment": 5.0}]},
             )
 
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(news_tool._http, "post", mock_post)
 
         result = news_tools["news_sentiment"].fn(query="test")
 
@@ -288,8 +288,8 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
             finlight_called = True
             return DummyResponse(200, {"articles": []})
 
-        monkeypatch.setattr(httpx, "get", mock_get)
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(news_tool._http, "get", mock_get)
+        monkeypatch.setattr(news_tool._http, "post", mock_post)
 
         result = news_tools["news_search"].fn(query="test")
 
@@ -310,8 +310,8 @@ def mock_post(url: str, json=None, timeout=30.0, headers=None):
                 {"articles": [{"title": "Fallback", "source": "fin"}]},
             )
 
-        monkeypatch.setattr(httpx, "get", mock_get)
-        monkeypatch.setattr(httpx, "post", mock_post)
+        monkeypatch.setattr(news_tool._http, "get", mock_get)
+        monkeypatch.setattr(news_tool._http, "post", mock_post)
 
         result = news_tools["news_search"].fn(query="test")
 
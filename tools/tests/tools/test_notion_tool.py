@@ -49,7 +49,7 @@ def test_http_error_codes(self, tool_fns, status_code, expected_fragment):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 return_value=_mock_resp({}, status_code),
             ),
         ):
@@ -61,7 +61,7 @@ def test_timeout_exception(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 side_effect=httpx.TimeoutException("timed out"),
             ),
         ):
@@ -73,7 +73,7 @@ def test_generic_exception(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 side_effect=ConnectionError("connection refused"),
             ),
         ):
@@ -96,7 +96,7 @@ def test_credential_store_used_when_provided(self, mcp: FastMCP):
         fn = tools["notion_search"].fn
 
         data = {"results": [], "has_more": False}
-        with patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)) as mock_post:
+        with patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)) as mock_post:
             result = fn(query="test")
 
         mock_creds.get.assert_called_with("notion_token")
@@ -140,7 +140,7 @@ def test_successful_search(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_search"](query="My Page")
 
@@ -151,7 +151,7 @@ def test_filter_type_page(self, tool_fns):
         data = {"results": [], "has_more": False}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)) as mock_post,
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)) as mock_post,
         ):
             tool_fns["notion_search"](filter_type="page")
 
@@ -174,7 +174,7 @@ def test_filter_type_database(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_search"](filter_type="database")
 
@@ -185,7 +185,7 @@ def test_filter_type_invalid_ignored(self, tool_fns):
         data = {"results": [], "has_more": False}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)) as mock_post,
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)) as mock_post,
         ):
             tool_fns["notion_search"](filter_type="invalid")
 
@@ -196,14 +196,14 @@ def test_page_size_clamped(self, tool_fns):
         data = {"results": [], "has_more": False}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)) as mock_post,
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)) as mock_post,
         ):
             tool_fns["notion_search"](page_size=0)
         assert mock_post.call_args.kwargs["json"]["page_size"] == 1
 
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)) as mock_post,
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)) as mock_post,
         ):
             tool_fns["notion_search"](page_size=200)
         assert mock_post.call_args.kwargs["json"]["page_size"] == 100
@@ -240,7 +240,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.get", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_get_page"](page_id="page-1")
 
@@ -302,7 +302,7 @@ def test_all_property_types(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.get", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_get_page"](page_id="page-1")
 
@@ -350,7 +350,7 @@ def test_successful_create(self, tool_fns):
         data = {"id": "new-page", "url": "https://notion.so/new-page"}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data, 201)),
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data, 201)),
         ):
             result = tool_fns["notion_create_page"](
                 parent_database_id="db-1",
@@ -376,7 +376,7 @@ def test_with_properties_json(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 return_value=_mock_resp(data, 201),
             ) as mock_post,
         ):
@@ -396,7 +396,7 @@ def test_with_content(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 return_value=_mock_resp(data, 201),
             ) as mock_post,
         ):
@@ -417,7 +417,7 @@ def test_custom_title_property(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 return_value=_mock_resp(data, 201),
             ) as mock_post,
         ):
@@ -448,7 +448,7 @@ def test_create_under_parent_page(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 return_value=_mock_resp(data, 201),
             ) as mock_post,
         ):
@@ -470,7 +470,7 @@ def test_create_under_parent_page_ignores_properties_json(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 return_value=_mock_resp(data, 201),
             ) as mock_post,
         ):
@@ -507,7 +507,7 @@ def test_successful_update_properties(self, tool_fns):
         data = {"id": "page-1", "url": "https://notion.so/page-1"}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_update_page"](
                 page_id="page-1",
@@ -522,7 +522,7 @@ def test_archive_page(self, tool_fns):
         data = {"id": "page-1", "url": "https://notion.so/page-1"}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_update_page"](page_id="page-1", archived=True)
 
@@ -579,7 +579,7 @@ def test_successful_query(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_query_database"](database_id="db-1")
 
@@ -590,7 +590,7 @@ def test_with_filter_json(self, tool_fns):
         data = {"results": [], "has_more": False}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)) as mock_post,
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)) as mock_post,
         ):
             tool_fns["notion_query_database"](
                 database_id="db-1",
@@ -613,7 +613,7 @@ def test_page_size_clamped(self, tool_fns):
         data = {"results": [], "has_more": False}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)) as mock_post,
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)) as mock_post,
         ):
             tool_fns["notion_query_database"](database_id="db-1", page_size=0)
         assert mock_post.call_args.kwargs["json"]["page_size"] == 1
@@ -622,7 +622,7 @@ def test_with_sorts_json(self, tool_fns):
         data = {"results": [], "has_more": False}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)) as mock_post,
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)) as mock_post,
         ):
             tool_fns["notion_query_database"](
                 database_id="db-1",
@@ -646,7 +646,7 @@ def test_with_start_cursor(self, tool_fns):
         data = {"results": [], "has_more": False}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)) as mock_post,
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)) as mock_post,
         ):
             tool_fns["notion_query_database"](
                 database_id="db-1",
@@ -660,7 +660,7 @@ def test_next_cursor_returned(self, tool_fns):
         data = {"results": [], "has_more": True, "next_cursor": "cursor-next-456"}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.post", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.post", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_query_database"](database_id="db-1")
 
@@ -698,7 +698,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.get", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_get_database"](database_id="db-1")
 
@@ -727,7 +727,7 @@ def test_successful_create_default_properties(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 return_value=_mock_resp(data, 201),
             ) as mock_post,
         ):
@@ -745,7 +745,7 @@ def test_with_extra_properties(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                f"{PATCH_BASE}.httpx.post",
+                f"{PATCH_BASE}._http.post",
                 return_value=_mock_resp(data, 201),
             ) as mock_post,
         ):
@@ -797,7 +797,7 @@ def test_update_title(self, tool_fns):
         data = {"id": "db-1", "url": "https://notion.so/db-1"}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_update_database"](database_id="db-1", title="Renamed DB")
 
@@ -809,7 +809,7 @@ def test_update_properties(self, tool_fns):
         data = {"id": "db-1", "url": "https://notion.so/db-1"}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_update_database"](
                 database_id="db-1",
@@ -824,7 +824,7 @@ def test_archive_database(self, tool_fns):
         data = {"id": "db-1", "url": "https://notion.so/db-1"}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_update_database"](database_id="db-1", archived=True)
 
@@ -888,7 +888,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.get", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_get_block_children"](block_id="page-1")
 
@@ -929,7 +929,7 @@ def test_successful_get_paragraph(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.get", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_get_block"](block_id="block-1")
 
@@ -950,7 +950,7 @@ def test_block_without_text(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.get", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_get_block"](block_id="block-2")
 
@@ -992,7 +992,7 @@ def test_successful_content_update(self, tool_fns):
         data = {"id": "block-1", "type": "paragraph"}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_update_block"](
                 block_id="block-1", content="Updated text", block_type="paragraph"
@@ -1014,7 +1014,7 @@ def test_archive_block(self, tool_fns):
         data = {"id": "block-1", "type": "paragraph"}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_update_block"](block_id="block-1", archived=True)
 
@@ -1043,7 +1043,7 @@ def test_successful_delete(self, tool_fns):
         data = {"id": "block-1", "archived": True}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.delete", return_value=_mock_resp(data)),
+            patch(f"{PATCH_BASE}._http.delete", return_value=_mock_resp(data)),
         ):
             result = tool_fns["notion_delete_block"](block_id="block-1")
 
@@ -1071,7 +1071,7 @@ def test_successful_append(self, tool_fns):
         data = {"results": []}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_append_blocks"](
                 block_id="page-1",
@@ -1089,7 +1089,7 @@ def test_blank_lines_stripped(self, tool_fns):
         data = {"results": []}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_append_blocks"](
                 block_id="page-1",
@@ -1113,7 +1113,7 @@ def test_block_type_heading(self, tool_fns):
         data = {"results": []}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_append_blocks"](
                 block_id="page-1",
@@ -1129,7 +1129,7 @@ def test_block_type_to_do(self, tool_fns):
         data = {"results": []}
         with (
             patch.dict("os.environ", ENV),
-            patch(f"{PATCH_BASE}.httpx.patch", return_value=_mock_resp(data)) as mock_patch,
+            patch(f"{PATCH_BASE}._http.patch", return_value=_mock_resp(data)) as mock_patch,
         ):
             result = tool_fns["notion_append_blocks"](
                 block_id="page-1",
@@ -52,7 +52,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pagerduty_tool.pagerduty_tool.httpx.get",
+                "aden_tools.tools.pagerduty_tool.pagerduty_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -76,7 +76,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pagerduty_tool.pagerduty_tool.httpx.get",
+                "aden_tools.tools.pagerduty_tool.pagerduty_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -97,7 +97,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pagerduty_tool.pagerduty_tool.httpx.post",
+                "aden_tools.tools.pagerduty_tool.pagerduty_tool._http.post",
                 return_value=_mock_resp(data, 201),
             ),
         ):
@@ -122,7 +122,7 @@ def test_successful_acknowledge(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pagerduty_tool.pagerduty_tool.httpx.put",
+                "aden_tools.tools.pagerduty_tool.pagerduty_tool._http.put",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -156,7 +156,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pagerduty_tool.pagerduty_tool.httpx.get",
+                "aden_tools.tools.pagerduty_tool.pagerduty_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
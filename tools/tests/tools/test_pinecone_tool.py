@@ -41,7 +41,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pinecone_tool.pinecone_tool.httpx.get", return_value=mock_resp),
+            patch("aden_tools.tools.pinecone_tool.pinecone_tool._http.get", return_value=mock_resp),
         ):
             result = tool_fns["pinecone_list_indexes"]()
 
@@ -69,7 +69,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pinecone_tool.pinecone_tool.httpx.post", return_value=mock_resp
+                "aden_tools.tools.pinecone_tool.pinecone_tool._http.post", return_value=mock_resp
             ),
         ):
             result = tool_fns["pinecone_create_index"](name="new-idx", dimension=768)
@@ -100,7 +100,7 @@ def test_successful_describe(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pinecone_tool.pinecone_tool.httpx.get", return_value=mock_resp),
+            patch("aden_tools.tools.pinecone_tool.pinecone_tool._http.get", return_value=mock_resp),
         ):
             result = tool_fns["pinecone_describe_index"](index_name="my-index")
 
@@ -121,7 +121,7 @@ def test_successful_delete(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pinecone_tool.pinecone_tool.httpx.delete", return_value=mock_resp
+                "aden_tools.tools.pinecone_tool.pinecone_tool._http.delete", return_value=mock_resp
             ),
         ):
             result = tool_fns["pinecone_delete_index"](index_name="old-index")
@@ -143,7 +143,7 @@ def test_successful_upsert(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pinecone_tool.pinecone_tool.httpx.post", return_value=mock_resp
+                "aden_tools.tools.pinecone_tool.pinecone_tool._http.post", return_value=mock_resp
             ),
         ):
             result = tool_fns["pinecone_upsert_vectors"](
@@ -177,7 +177,7 @@ def test_successful_query(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pinecone_tool.pinecone_tool.httpx.post", return_value=mock_resp
+                "aden_tools.tools.pinecone_tool.pinecone_tool._http.post", return_value=mock_resp
             ),
         ):
             result = tool_fns["pinecone_query_vectors"](
@@ -208,7 +208,7 @@ def test_successful_fetch(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pinecone_tool.pinecone_tool.httpx.get", return_value=mock_resp),
+            patch("aden_tools.tools.pinecone_tool.pinecone_tool._http.get", return_value=mock_resp),
         ):
             result = tool_fns["pinecone_fetch_vectors"](
                 index_host="my-index-abc.svc.pinecone.io",
@@ -232,7 +232,7 @@ def test_successful_delete(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pinecone_tool.pinecone_tool.httpx.post", return_value=mock_resp
+                "aden_tools.tools.pinecone_tool.pinecone_tool._http.post", return_value=mock_resp
             ),
         ):
             result = tool_fns["pinecone_delete_vectors"](
@@ -266,7 +266,7 @@ def test_successful_stats(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.pinecone_tool.pinecone_tool.httpx.post", return_value=mock_resp
+                "aden_tools.tools.pinecone_tool.pinecone_tool._http.post", return_value=mock_resp
             ),
         ):
             result = tool_fns["pinecone_index_stats"](
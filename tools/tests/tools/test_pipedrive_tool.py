@@ -42,7 +42,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -79,7 +79,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -99,7 +99,7 @@ def test_successful_create(self, tool_fns):
         mock_resp = {"success": True, "data": {"id": 42, "title": "New Deal"}}
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 201
             mock_post.return_value.json.return_value = mock_resp
@@ -126,7 +126,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -162,7 +162,7 @@ def test_successful_search(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -188,7 +188,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -219,7 +219,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -246,7 +246,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -272,7 +272,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -297,7 +297,7 @@ def test_successful_add(self, tool_fns):
         mock_resp = {"success": True, "data": {"id": 200}}
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.pipedrive_tool.pipedrive_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 201
             mock_post.return_value.json.return_value = mock_resp
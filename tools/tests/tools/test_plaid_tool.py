@@ -51,7 +51,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.plaid_tool.plaid_tool.httpx.post", return_value=mock_resp),
+            patch("aden_tools.tools.plaid_tool.plaid_tool._http.post", return_value=mock_resp),
         ):
             result = tool_fns["plaid_get_accounts"](access_token="access-sandbox-123")
 
@@ -86,7 +86,7 @@ def test_successful_balance(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.plaid_tool.plaid_tool.httpx.post", return_value=mock_resp),
+            patch("aden_tools.tools.plaid_tool.plaid_tool._http.post", return_value=mock_resp),
         ):
             result = tool_fns["plaid_get_balance"](access_token="access-sandbox-123")
 
@@ -123,7 +123,7 @@ def test_successful_sync(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.plaid_tool.plaid_tool.httpx.post", return_value=mock_resp),
+            patch("aden_tools.tools.plaid_tool.plaid_tool._http.post", return_value=mock_resp),
         ):
             result = tool_fns["plaid_sync_transactions"](access_token="access-sandbox-123")
 
@@ -159,7 +159,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.plaid_tool.plaid_tool.httpx.post", return_value=mock_resp),
+            patch("aden_tools.tools.plaid_tool.plaid_tool._http.post", return_value=mock_resp),
         ):
             result = tool_fns["plaid_get_transactions"](
                 access_token="access-sandbox-123",
@@ -193,7 +193,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.plaid_tool.plaid_tool.httpx.post", return_value=mock_resp),
+            patch("aden_tools.tools.plaid_tool.plaid_tool._http.post", return_value=mock_resp),
         ):
             result = tool_fns["plaid_get_institution"](institution_id="ins_1")
 
@@ -224,7 +224,7 @@ def test_successful_search(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.plaid_tool.plaid_tool.httpx.post", return_value=mock_resp),
+            patch("aden_tools.tools.plaid_tool.plaid_tool._http.post", return_value=mock_resp),
         ):
             result = tool_fns["plaid_search_institutions"](query="Chase")
 
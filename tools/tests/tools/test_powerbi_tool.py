@@ -47,7 +47,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.powerbi_tool.powerbi_tool.httpx.get",
+                "aden_tools.tools.powerbi_tool.powerbi_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -81,7 +81,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.powerbi_tool.powerbi_tool.httpx.get",
+                "aden_tools.tools.powerbi_tool.powerbi_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -114,7 +114,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.powerbi_tool.powerbi_tool.httpx.get",
+                "aden_tools.tools.powerbi_tool.powerbi_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -135,7 +135,7 @@ def test_successful_refresh(self, tool_fns):
         resp = _mock_resp({}, status_code=202, headers={"x-ms-request-id": "req-123"})
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.powerbi_tool.powerbi_tool.httpx.post", return_value=resp),
+            patch("aden_tools.tools.powerbi_tool.powerbi_tool._http.post", return_value=resp),
         ):
             result = tool_fns["powerbi_refresh_dataset"](workspace_id="ws-123", dataset_id="ds-456")
 
@@ -163,7 +163,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.powerbi_tool.powerbi_tool.httpx.get",
+                "aden_tools.tools.powerbi_tool.powerbi_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -43,7 +43,7 @@ def test_invalid_priority(self, tool_fns):
     def test_successful_send(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.pushover_tool.pushover_tool._http.post") as mock_post,
         ):
             mock_post.return_value.json.return_value = {"status": 1, "request": "req-1"}
             result = tool_fns["pushover_send"](user_key="ukey", message="Hello!")
@@ -54,7 +54,7 @@ def test_successful_send(self, tool_fns):
     def test_emergency_returns_receipt(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.pushover_tool.pushover_tool._http.post") as mock_post,
         ):
             mock_post.return_value.json.return_value = {
                 "status": 1,
@@ -68,7 +68,7 @@ def test_emergency_returns_receipt(self, tool_fns):
     def test_api_error(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.pushover_tool.pushover_tool._http.post") as mock_post,
         ):
             mock_post.return_value.json.return_value = {
                 "status": 0,
@@ -90,7 +90,7 @@ def test_missing_user_key(self, tool_fns):
     def test_valid_user(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.pushover_tool.pushover_tool._http.post") as mock_post,
         ):
             mock_post.return_value.json.return_value = {
                 "status": 1,
@@ -108,7 +108,7 @@ class TestPushoverListSounds:
     def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pushover_tool.pushover_tool._http.get") as mock_get,
         ):
             mock_get.return_value.json.return_value = {
                 "status": 1,
@@ -128,7 +128,7 @@ def test_missing_receipt(self, tool_fns):
     def test_successful_check(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.pushover_tool.pushover_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.pushover_tool.pushover_tool._http.get") as mock_get,
         ):
             mock_get.return_value.json.return_value = {
                 "status": 1,
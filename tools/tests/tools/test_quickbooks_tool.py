@@ -52,7 +52,7 @@ def test_successful_query(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.quickbooks_tool.quickbooks_tool.httpx.get",
+                "aden_tools.tools.quickbooks_tool.quickbooks_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -80,7 +80,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.quickbooks_tool.quickbooks_tool.httpx.get",
+                "aden_tools.tools.quickbooks_tool.quickbooks_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -107,7 +107,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.quickbooks_tool.quickbooks_tool.httpx.post",
+                "aden_tools.tools.quickbooks_tool.quickbooks_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -143,7 +143,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.quickbooks_tool.quickbooks_tool.httpx.post",
+                "aden_tools.tools.quickbooks_tool.quickbooks_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -176,7 +176,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.quickbooks_tool.quickbooks_tool.httpx.get",
+                "aden_tools.tools.quickbooks_tool.quickbooks_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -67,7 +67,7 @@ def test_handle_response_generic_error(self):
         assert "error" in result
         assert "500" in result["error"]
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_payments(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -116,7 +116,7 @@ def test_list_payments(self, mock_get):
         assert result["payments"][0]["amount"] == 50000
         assert result["payments"][1]["status"] == "authorized"
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_payments_with_filters(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -133,7 +133,7 @@ def test_list_payments_with_filters(self, mock_get):
         assert call_params["from"] == 1640000000
         assert call_params["to"] == 1650000000
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_payments_limit_capped(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -145,7 +145,7 @@ def test_list_payments_limit_capped(self, mock_get):
         call_params = mock_get.call_args.kwargs["params"]
         assert call_params["count"] == 100  # Capped at 100
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_get_payment(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -183,7 +183,7 @@ def test_get_payment(self, mock_get):
         assert result["captured"] is True
         assert result["fee"] == 1000
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.post")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.post")
     def test_create_payment_link(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -231,7 +231,7 @@ def test_create_payment_link(self, mock_post):
         assert result["short_url"] == "https://rzp.io/rzp/abc123"
         assert result["status"] == "created"
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.post")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.post")
     def test_create_payment_link_minimal(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -256,7 +256,7 @@ def test_create_payment_link_minimal(self, mock_post):
         assert "customer" not in call_json  # No customer details provided
         assert result["id"] == "plink_456"
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_invoices(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -290,7 +290,7 @@ def test_list_invoices(self, mock_get):
         assert result["invoices"][0]["id"] == "inv_123"
         assert result["invoices"][0]["status"] == "issued"
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_get_invoice(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -334,7 +334,7 @@ def test_get_invoice(self, mock_get):
         assert len(result["line_items"]) == 2
         assert result["paid_at"] == 1641000000
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.post")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.post")
     def test_create_refund_full(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -361,7 +361,7 @@ def test_create_refund_full(self, mock_post):
         assert result["id"] == "rfnd_123"
         assert result["status"] == "processed"
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.post")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.post")
     def test_create_refund_partial(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -427,7 +427,7 @@ def test_credentials_from_credential_manager(self):
 
         list_fn = next(fn for fn in registered_fns if fn.__name__ == "razorpay_list_payments")
 
-        with patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get") as mock_get:
+        with patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"count": 0, "items": []}
@@ -454,7 +454,7 @@ def test_credentials_from_env_vars(self):
                 "os.environ",
                 {"RAZORPAY_API_KEY": "rzp_test_env", "RAZORPAY_API_SECRET": "secret_env"},
             ),
-            patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get") as mock_get,
         ):
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -489,7 +489,7 @@ def teardown_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_payments_success(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -504,7 +504,7 @@ def test_list_payments_success(self, mock_get):
         assert result["count"] == 1
         assert len(result["payments"]) == 1
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_payments_normalizes_count(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"count": 0, "items": []})
@@ -517,14 +517,14 @@ def test_list_payments_normalizes_count(self, mock_get):
         self._fn("razorpay_list_payments")(count=-5)
         assert mock_get.call_args.kwargs["params"]["count"] == 1
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_payments_timeout(self, mock_get):
         mock_get.side_effect = httpx.TimeoutException("timed out")
         result = self._fn("razorpay_list_payments")()
         assert "error" in result
         assert "timed out" in result["error"]
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_payments_network_error(self, mock_get):
         mock_get.side_effect = httpx.RequestError("connection failed")
         result = self._fn("razorpay_list_payments")()
@@ -549,7 +549,7 @@ def teardown_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_get_payment_success(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -589,7 +589,7 @@ def teardown_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.post")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.post")
     def test_create_payment_link_success(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -648,7 +648,7 @@ def teardown_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_invoices_success(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -666,7 +666,7 @@ def test_list_invoices_success(self, mock_get):
         assert result["count"] == 2
         assert len(result["invoices"]) == 2
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_list_invoices_with_filter(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200, json=MagicMock(return_value={"count": 0, "items": []})
@@ -693,7 +693,7 @@ def teardown_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.get")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.get")
     def test_get_invoice_success(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -733,7 +733,7 @@ def teardown_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.post")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.post")
     def test_create_refund_success(self, mock_post):
         mock_post.return_value = MagicMock(
             status_code=200,
@@ -761,7 +761,7 @@ def test_create_refund_validation(self):
         assert "error" in result
         assert "positive" in result["error"]
 
-    @patch("aden_tools.tools.razorpay_tool.razorpay_tool.httpx.post")
+    @patch("aden_tools.tools.razorpay_tool.razorpay_tool._http.post")
     def test_create_refund_timeout(self, mock_post):
         mock_post.side_effect = httpx.TimeoutException("timed out")
         result = self._fn("razorpay_create_refund")(payment_id="pay_123")
@@ -69,8 +69,8 @@ def test_successful_search(self, tool_fns):
 
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.reddit_tool.reddit_tool.httpx.post", return_value=token_resp),
-            patch("aden_tools.tools.reddit_tool.reddit_tool.httpx.get", return_value=listing_resp),
+            patch("aden_tools.tools.reddit_tool.reddit_tool._http.post", return_value=token_resp),
+            patch("aden_tools.tools.reddit_tool.reddit_tool._http.get", return_value=listing_resp),
         ):
             result = tool_fns["reddit_search"](query="python")
 
@@ -111,8 +111,8 @@ def test_successful_get_posts(self, tool_fns):
 
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.reddit_tool.reddit_tool.httpx.post", return_value=token_resp),
-            patch("aden_tools.tools.reddit_tool.reddit_tool.httpx.get", return_value=listing_resp),
+            patch("aden_tools.tools.reddit_tool.reddit_tool._http.post", return_value=token_resp),
+            patch("aden_tools.tools.reddit_tool.reddit_tool._http.get", return_value=listing_resp),
         ):
             result = tool_fns["reddit_get_posts"](subreddit="python")
 
@@ -171,8 +171,8 @@ def test_successful_get_comments(self, tool_fns):
 
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.reddit_tool.reddit_tool.httpx.post", return_value=token_resp),
-            patch("aden_tools.tools.reddit_tool.reddit_tool.httpx.get", return_value=comments_resp),
+            patch("aden_tools.tools.reddit_tool.reddit_tool._http.post", return_value=token_resp),
+            patch("aden_tools.tools.reddit_tool.reddit_tool._http.get", return_value=comments_resp),
         ):
             result = tool_fns["reddit_get_comments"](post_id="abc123")
 
@@ -209,8 +209,8 @@ def test_successful_get_user(self, tool_fns):
 
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.reddit_tool.reddit_tool.httpx.post", return_value=token_resp),
-            patch("aden_tools.tools.reddit_tool.reddit_tool.httpx.get", return_value=user_resp),
+            patch("aden_tools.tools.reddit_tool.reddit_tool._http.post", return_value=token_resp),
+            patch("aden_tools.tools.reddit_tool.reddit_tool._http.get", return_value=user_resp),
         ):
             result = tool_fns["reddit_get_user"](username="testuser")
 
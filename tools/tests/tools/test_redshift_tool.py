@@ -58,7 +58,7 @@ def test_successful_execute(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.redshift_tool.redshift_tool.httpx.post",
+                "aden_tools.tools.redshift_tool.redshift_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -89,7 +89,7 @@ def test_successful_describe(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.redshift_tool.redshift_tool.httpx.post",
+                "aden_tools.tools.redshift_tool.redshift_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -121,7 +121,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.redshift_tool.redshift_tool.httpx.post",
+                "aden_tools.tools.redshift_tool.redshift_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -143,7 +143,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.redshift_tool.redshift_tool.httpx.post",
+                "aden_tools.tools.redshift_tool.redshift_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -170,7 +170,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.redshift_tool.redshift_tool.httpx.post",
+                "aden_tools.tools.redshift_tool.redshift_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -51,7 +51,7 @@ def test_successful_query(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.salesforce_tool.salesforce_tool.httpx.get",
+                "aden_tools.tools.salesforce_tool.salesforce_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -71,7 +71,7 @@ def test_pagination(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.salesforce_tool.salesforce_tool.httpx.get",
+                "aden_tools.tools.salesforce_tool.salesforce_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -98,7 +98,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.salesforce_tool.salesforce_tool.httpx.get",
+                "aden_tools.tools.salesforce_tool.salesforce_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -121,7 +121,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.salesforce_tool.salesforce_tool.httpx.post",
+                "aden_tools.tools.salesforce_tool.salesforce_tool._http.post",
                 return_value=_mock_resp(data, 201),
             ),
         ):
@@ -141,7 +141,7 @@ def test_successful_update(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.salesforce_tool.salesforce_tool.httpx.patch", return_value=resp
+                "aden_tools.tools.salesforce_tool.salesforce_tool._http.patch", return_value=resp
             ),
         ):
             result = tool_fns["salesforce_update_record"](
@@ -186,7 +186,7 @@ def test_successful_describe(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.salesforce_tool.salesforce_tool.httpx.get",
+                "aden_tools.tools.salesforce_tool.salesforce_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -222,7 +222,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.salesforce_tool.salesforce_tool.httpx.get",
+                "aden_tools.tools.salesforce_tool.salesforce_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
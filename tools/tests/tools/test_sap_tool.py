@@ -54,7 +54,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.sap_tool.sap_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.sap_tool.sap_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["sap_list_purchase_orders"]()
 
@@ -85,7 +85,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.sap_tool.sap_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.sap_tool.sap_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["sap_get_purchase_order"](purchase_order="4500000001")
 
@@ -112,7 +112,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.sap_tool.sap_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.sap_tool.sap_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["sap_list_business_partners"]()
 
@@ -140,7 +140,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.sap_tool.sap_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.sap_tool.sap_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["sap_list_products"]()
 
@@ -169,7 +169,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.sap_tool.sap_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.sap_tool.sap_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["sap_list_sales_orders"]()
 
@@ -8,6 +8,8 @@
 
 from aden_tools.tools.serpapi_tool import register_tools
 
+PATCH_BASE = "aden_tools.tools.serpapi_tool.serpapi_tool"
+
 
 @pytest.fixture
 def scholar_search_fn(mcp: FastMCP):
@@ -161,7 +163,10 @@ class TestHTTPErrors:
     def test_401_returns_auth_error(self, scholar_search_fn, monkeypatch):
         """HTTP 401 returns invalid API key error."""
         monkeypatch.setenv("SERPAPI_API_KEY", "bad-key")
-        with patch("httpx.get", return_value=_mock_response(401, {"error": "Invalid API key"})):
+        with patch(
+            f"{PATCH_BASE}._http.get",
+            return_value=_mock_response(401, {"error": "Invalid API key"}),
+        ):
             result = scholar_search_fn(query="test")
         assert "error" in result
         assert "Invalid SerpAPI API key" in result["error"]
@@ -169,7 +174,7 @@ def test_401_returns_auth_error(self, scholar_search_fn, monkeypatch):
     def test_429_returns_rate_limit(self, scholar_search_fn, monkeypatch):
         """HTTP 429 returns rate limit error."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", return_value=_mock_response(429)):
+        with patch(f"{PATCH_BASE}._http.get", return_value=_mock_response(429)):
             result = scholar_search_fn(query="test")
         assert "error" in result
         assert "rate limit" in result["error"].lower()
@@ -177,7 +182,10 @@ def test_429_returns_rate_limit(self, scholar_search_fn, monkeypatch):
     def test_500_returns_server_error(self, patents_search_fn, monkeypatch):
         """HTTP 500 returns server error."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", return_value=_mock_response(500, text="Internal Server Error")):
+        with patch(
+            f"{PATCH_BASE}._http.get",
+            return_value=_mock_response(500, text="Internal Server Error"),
+        ):
             result = patents_search_fn(query="test")
         assert "error" in result
         assert "500" in result["error"]
@@ -185,7 +193,7 @@ def test_500_returns_server_error(self, patents_search_fn, monkeypatch):
     def test_timeout_returns_error(self, scholar_search_fn, monkeypatch):
         """Timeout returns error dict."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", side_effect=httpx.TimeoutException("timed out")):
+        with patch(f"{PATCH_BASE}._http.get", side_effect=httpx.TimeoutException("timed out")):
             result = scholar_search_fn(query="test")
         assert "error" in result
         assert "timed out" in result["error"].lower()
@@ -194,7 +202,7 @@ def test_network_error_returns_error(self, scholar_search_fn, monkeypatch):
         """Network error returns error dict."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
         with patch(
-            "httpx.get",
+            f"{PATCH_BASE}._http.get",
             side_effect=httpx.ConnectError("Connection refused"),
         ):
             result = scholar_search_fn(query="test")
@@ -296,7 +304,7 @@ class TestScholarSearch:
     def test_successful_search(self, scholar_search_fn, monkeypatch):
         """Successful scholar search returns structured results."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", return_value=_mock_response(200, SCHOLAR_RESPONSE)):
+        with patch(f"{PATCH_BASE}._http.get", return_value=_mock_response(200, SCHOLAR_RESPONSE)):
             result = scholar_search_fn(query="deep learning")
 
         assert "error" not in result
@@ -317,7 +325,9 @@ def test_successful_search(self, scholar_search_fn, monkeypatch):
     def test_search_with_year_filter(self, scholar_search_fn, monkeypatch):
         """Search with year filters works."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", return_value=_mock_response(200, SCHOLAR_RESPONSE)) as mock:
+        with patch(
+            f"{PATCH_BASE}._http.get", return_value=_mock_response(200, SCHOLAR_RESPONSE)
+        ) as mock:
             scholar_search_fn(query="AI", year_low=2020, year_high=2024)
             params = mock.call_args[1]["params"]
             assert params["as_ylo"] == 2020
@@ -330,7 +340,7 @@ class TestScholarCite:
     def test_successful_cite(self, scholar_cite_fn, monkeypatch):
         """Successful citation lookup returns formats."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", return_value=_mock_response(200, CITE_RESPONSE)):
+        with patch(f"{PATCH_BASE}._http.get", return_value=_mock_response(200, CITE_RESPONSE)):
             result = scholar_cite_fn(result_id="vhbKQo7YFEEJ")
 
         assert "error" not in result
@@ -346,7 +356,7 @@ class TestScholarAuthor:
     def test_successful_author(self, scholar_author_fn, monkeypatch):
         """Successful author lookup returns profile and metrics."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", return_value=_mock_response(200, AUTHOR_RESPONSE)):
+        with patch(f"{PATCH_BASE}._http.get", return_value=_mock_response(200, AUTHOR_RESPONSE)):
             result = scholar_author_fn(author_id="WLN3QrAAAAAJ")
 
         assert "error" not in result
@@ -364,7 +374,7 @@ class TestPatentsSearch:
     def test_successful_search(self, patents_search_fn, monkeypatch):
         """Successful patent search returns structured results."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", return_value=_mock_response(200, PATENT_RESPONSE)):
+        with patch(f"{PATCH_BASE}._http.get", return_value=_mock_response(200, PATENT_RESPONSE)):
             result = patents_search_fn(query="machine learning")
 
         assert "error" not in result
@@ -378,7 +388,9 @@ def test_successful_search(self, patents_search_fn, monkeypatch):
     def test_search_with_filters(self, patents_search_fn, monkeypatch):
         """Search with country and status filters works."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", return_value=_mock_response(200, PATENT_RESPONSE)) as mock:
+        with patch(
+            f"{PATCH_BASE}._http.get", return_value=_mock_response(200, PATENT_RESPONSE)
+        ) as mock:
             patents_search_fn(query="AI", country="US", status="GRANT")
             params = mock.call_args[1]["params"]
             assert params["country"] == "US"
@@ -391,7 +403,7 @@ class TestPatentsDetails:
     def test_successful_details(self, patents_details_fn, monkeypatch):
         """Successful patent detail lookup."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
-        with patch("httpx.get", return_value=_mock_response(200, PATENT_RESPONSE)):
+        with patch(f"{PATCH_BASE}._http.get", return_value=_mock_response(200, PATENT_RESPONSE)):
             result = patents_details_fn(patent_id="US20210012345A1")
 
         assert "error" not in result
@@ -403,7 +415,7 @@ def test_not_found(self, patents_details_fn, monkeypatch):
         """Patent not found returns error."""
         monkeypatch.setenv("SERPAPI_API_KEY", "test-key")
         empty_response = {"organic_results": []}
-        with patch("httpx.get", return_value=_mock_response(200, empty_response)):
+        with patch(f"{PATCH_BASE}._http.get", return_value=_mock_response(200, empty_response)):
             result = patents_details_fn(patent_id="INVALID123")
         assert "error" in result
         assert "No patent found" in result["error"]
@@ -53,7 +53,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.shopify_tool.shopify_tool.httpx.get",
+                "aden_tools.tools.shopify_tool.shopify_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -110,7 +110,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.shopify_tool.shopify_tool.httpx.get",
+                "aden_tools.tools.shopify_tool.shopify_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -141,7 +141,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.shopify_tool.shopify_tool.httpx.get",
+                "aden_tools.tools.shopify_tool.shopify_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -192,7 +192,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.shopify_tool.shopify_tool.httpx.get",
+                "aden_tools.tools.shopify_tool.shopify_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -225,7 +225,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.shopify_tool.shopify_tool.httpx.get",
+                "aden_tools.tools.shopify_tool.shopify_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -261,7 +261,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.shopify_tool.shopify_tool.httpx.get",
+                "aden_tools.tools.shopify_tool.shopify_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -51,7 +51,7 @@ def test_successful_sync_query(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.snowflake_tool.snowflake_tool.httpx.post",
+                "aden_tools.tools.snowflake_tool.snowflake_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -70,7 +70,7 @@ def test_async_query(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.snowflake_tool.snowflake_tool.httpx.post",
+                "aden_tools.tools.snowflake_tool.snowflake_tool._http.post",
                 return_value=_mock_resp(data, 202),
             ),
         ):
@@ -98,7 +98,7 @@ def test_complete_result(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.snowflake_tool.snowflake_tool.httpx.get",
+                "aden_tools.tools.snowflake_tool.snowflake_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -115,7 +115,7 @@ def test_still_running(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.snowflake_tool.snowflake_tool.httpx.get",
+                "aden_tools.tools.snowflake_tool.snowflake_tool._http.get",
                 return_value=_mock_resp(data, 202),
             ),
         ):
@@ -131,7 +131,7 @@ def test_query_error(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.snowflake_tool.snowflake_tool.httpx.get",
+                "aden_tools.tools.snowflake_tool.snowflake_tool._http.get",
                 return_value=_mock_resp(data, 422),
             ),
         ):
@@ -152,7 +152,7 @@ def test_successful_cancel(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.snowflake_tool.snowflake_tool.httpx.post",
+                "aden_tools.tools.snowflake_tool.snowflake_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
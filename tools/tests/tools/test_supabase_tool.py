@@ -33,7 +33,7 @@ def test_successful_select(self, tool_fns):
         rows = [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.supabase_tool.supabase_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.supabase_tool.supabase_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = rows
@@ -46,7 +46,7 @@ def test_successful_select(self, tool_fns):
     def test_with_filters(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.supabase_tool.supabase_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.supabase_tool.supabase_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = []
@@ -71,7 +71,7 @@ def test_invalid_json(self, tool_fns):
     def test_successful_insert(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.supabase_tool.supabase_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.supabase_tool.supabase_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 201
             mock_post.return_value.json.return_value = [{"id": 1, "name": "Alice"}]
@@ -90,7 +90,7 @@ def test_missing_filters(self, tool_fns):
     def test_successful_update(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.supabase_tool.supabase_tool.httpx.patch") as mock_patch,
+            patch("aden_tools.tools.supabase_tool.supabase_tool._http.patch") as mock_patch,
         ):
             mock_patch.return_value.status_code = 200
             mock_patch.return_value.json.return_value = [{"id": 1, "status": "done"}]
@@ -111,7 +111,7 @@ def test_missing_filters(self, tool_fns):
     def test_successful_delete(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.supabase_tool.supabase_tool.httpx.delete") as mock_del,
+            patch("aden_tools.tools.supabase_tool.supabase_tool._http.delete") as mock_del,
         ):
             mock_del.return_value.status_code = 200
             mock_del.return_value.json.return_value = [{"id": 1}]
@@ -136,7 +136,7 @@ def test_signup_short_password(self, tool_fns):
     def test_successful_signup(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.supabase_tool.supabase_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.supabase_tool.supabase_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {
@@ -155,7 +155,7 @@ def test_signin_missing_fields(self, tool_fns):
     def test_successful_signin(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.supabase_tool.supabase_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.supabase_tool.supabase_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {
@@ -183,7 +183,7 @@ def test_invalid_body_json(self, tool_fns):
     def test_successful_invoke(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.supabase_tool.supabase_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.supabase_tool.supabase_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 200
             mock_post.return_value.headers = {"content-type": "application/json"}
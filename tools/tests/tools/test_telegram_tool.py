@@ -80,7 +80,7 @@ def test_handle_response_429(self):
         assert "error" in result
         assert "Rate limit" in result["error"]
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_send_message(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -96,7 +96,7 @@ def test_send_message(self, mock_post):
         assert result["ok"] is True
         assert result["result"]["message_id"] == 456
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_send_message_with_parse_mode(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -108,7 +108,7 @@ def test_send_message_with_parse_mode(self, mock_post):
         call_kwargs = mock_post.call_args.kwargs
         assert call_kwargs["json"]["parse_mode"] == "HTML"
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_send_document(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -128,7 +128,7 @@ def test_send_document(self, mock_post):
         assert result["ok"] is True
         assert result["result"]["message_id"] == 789
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.get")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.get")
     def test_get_me(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -146,7 +146,7 @@ def test_get_me(self, mock_get):
 
     # --- New client method tests ---
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_edit_message_text(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -166,7 +166,7 @@ def test_edit_message_text(self, mock_post):
         assert "editMessageText" in mock_post.call_args.args[0]
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_edit_message_text_with_parse_mode(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -180,7 +180,7 @@ def test_edit_message_text_with_parse_mode(self, mock_post):
         call_kwargs = mock_post.call_args.kwargs
         assert call_kwargs["json"]["parse_mode"] == "HTML"
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_delete_message(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -196,7 +196,7 @@ def test_delete_message(self, mock_post):
         assert "deleteMessage" in mock_post.call_args.args[0]
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_forward_message(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -216,7 +216,7 @@ def test_forward_message(self, mock_post):
         assert "forwardMessage" in mock_post.call_args.args[0]
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_forward_message_silent(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -233,7 +233,7 @@ def test_forward_message_silent(self, mock_post):
         call_kwargs = mock_post.call_args.kwargs
         assert call_kwargs["json"]["disable_notification"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_send_photo(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -260,7 +260,7 @@ def test_send_photo(self, mock_post):
         assert "sendPhoto" in mock_post.call_args.args[0]
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_send_photo_no_caption(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -272,7 +272,7 @@ def test_send_photo_no_caption(self, mock_post):
         call_kwargs = mock_post.call_args.kwargs
         assert "caption" not in call_kwargs["json"]
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_send_chat_action(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -288,7 +288,7 @@ def test_send_chat_action(self, mock_post):
         assert "sendChatAction" in mock_post.call_args.args[0]
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_pin_chat_message(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -304,7 +304,7 @@ def test_pin_chat_message(self, mock_post):
         assert "pinChatMessage" in mock_post.call_args.args[0]
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_pin_chat_message_silent(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -316,7 +316,7 @@ def test_pin_chat_message_silent(self, mock_post):
         call_kwargs = mock_post.call_args.kwargs
         assert call_kwargs["json"]["disable_notification"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_unpin_chat_message(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -332,7 +332,7 @@ def test_unpin_chat_message(self, mock_post):
         assert "unpinChatMessage" in mock_post.call_args.args[0]
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_unpin_chat_message_most_recent(self, mock_post):
         """Omitting message_id should unpin the most recently pinned message."""
         mock_response = MagicMock()
@@ -345,7 +345,7 @@ def test_unpin_chat_message_most_recent(self, mock_post):
         call_kwargs = mock_post.call_args.kwargs
         assert "message_id" not in call_kwargs["json"]
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_get_chat(self, mock_post):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -406,7 +406,7 @@ def test_send_message_no_token_error(self):
         assert "error" in result
         assert "not configured" in result["error"]
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_send_message_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -430,7 +430,7 @@ def test_credentials_adapter_used(self):
         tools = {t.name: t for t in self.mcp._tool_manager._tools.values()}
 
         # The credentials should be used when tools are called
-        with patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post") as mock_post:
+        with patch("aden_tools.tools.telegram_tool.telegram_tool._http.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"ok": True, "result": {}}
@@ -455,7 +455,7 @@ def setup_method(self):
     def _get_tools(self):
         return {t.name: t for t in self.mcp._tool_manager._tools.values()}
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_edit_message_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -473,7 +473,7 @@ def test_edit_message_success(self, mock_getenv, mock_post):
         assert result["ok"] is True
         assert result["result"]["text"] == "Updated"
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_delete_message_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -487,7 +487,7 @@ def test_delete_message_success(self, mock_getenv, mock_post):
 
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_forward_message_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -506,7 +506,7 @@ def test_forward_message_success(self, mock_getenv, mock_post):
 
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_send_photo_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -523,7 +523,7 @@ def test_send_photo_success(self, mock_getenv, mock_post):
 
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_send_chat_action_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -549,7 +549,7 @@ def test_send_chat_action_invalid_action(self):
         assert "Invalid action" in result["error"]
         assert "help" in result
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_get_chat_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -571,7 +571,7 @@ def test_get_chat_success(self, mock_getenv, mock_post):
         assert result["ok"] is True
         assert result["result"]["type"] == "supergroup"
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_pin_message_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -585,7 +585,7 @@ def test_pin_message_success(self, mock_getenv, mock_post):
 
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_unpin_message_success(self, mock_getenv, mock_post):
         mock_response = MagicMock()
@@ -599,7 +599,7 @@ def test_unpin_message_success(self, mock_getenv, mock_post):
 
         assert result["ok"] is True
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_unpin_message_most_recent(self, mock_getenv, mock_post):
         """message_id=0 should unpin most recent (omit message_id from payload)."""
@@ -654,7 +654,7 @@ class TestErrorHandling:
     def setup_method(self):
         self.client = _TelegramClient("test_token")
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_network_error(self, mock_post):
         import httpx
 
@@ -663,7 +663,7 @@ def test_network_error(self, mock_post):
         with pytest.raises(httpx.ConnectError):
             self.client.send_message(chat_id="123", text="test")
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     def test_timeout_error(self, mock_post):
         import httpx
 
@@ -672,7 +672,7 @@ def test_timeout_error(self, mock_post):
         with pytest.raises(httpx.TimeoutException):
             self.client.send_message(chat_id="123", text="test")
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_tool_returns_error_on_timeout(self, mock_getenv, mock_post):
         """MCP tool should return error dict on timeout, not raise."""
@@ -689,7 +689,7 @@ def test_tool_returns_error_on_timeout(self, mock_getenv, mock_post):
         assert "error" in result
         assert "timed out" in result["error"].lower()
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_tool_returns_error_on_network_failure(self, mock_getenv, mock_post):
         """MCP tool should return error dict on network error, not raise."""
@@ -730,7 +730,7 @@ def setup_method(self):
     def _get_tools(self):
         return {t.name: t for t in self.mcp._tool_manager._tools.values()}
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_edit_message_timeout(self, mock_getenv, mock_post):
         import httpx
@@ -744,7 +744,7 @@ def test_edit_message_timeout(self, mock_getenv, mock_post):
         assert "error" in result
         assert "timed out" in result["error"].lower()
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_delete_message_network_error(self, mock_getenv, mock_post):
         import httpx
@@ -758,7 +758,7 @@ def test_delete_message_network_error(self, mock_getenv, mock_post):
         assert "error" in result
         assert "network" in result["error"].lower() or "connection" in result["error"].lower()
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_forward_message_timeout(self, mock_getenv, mock_post):
         import httpx
@@ -774,7 +774,7 @@ def test_forward_message_timeout(self, mock_getenv, mock_post):
         assert "error" in result
         assert "timed out" in result["error"].lower()
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_send_photo_network_error(self, mock_getenv, mock_post):
         import httpx
@@ -788,7 +788,7 @@ def test_send_photo_network_error(self, mock_getenv, mock_post):
         assert "error" in result
         assert "network" in result["error"].lower() or "connection" in result["error"].lower()
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_get_chat_timeout(self, mock_getenv, mock_post):
         import httpx
@@ -802,7 +802,7 @@ def test_get_chat_timeout(self, mock_getenv, mock_post):
         assert "error" in result
         assert "timed out" in result["error"].lower()
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_pin_message_timeout(self, mock_getenv, mock_post):
         import httpx
@@ -816,7 +816,7 @@ def test_pin_message_timeout(self, mock_getenv, mock_post):
         assert "error" in result
         assert "timed out" in result["error"].lower()
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_unpin_message_network_error(self, mock_getenv, mock_post):
         import httpx
@@ -830,7 +830,7 @@ def test_unpin_message_network_error(self, mock_getenv, mock_post):
         assert "error" in result
         assert "network" in result["error"].lower() or "connection" in result["error"].lower()
 
-    @patch("aden_tools.tools.telegram_tool.telegram_tool.httpx.post")
+    @patch("aden_tools.tools.telegram_tool.telegram_tool._http.post")
     @patch("os.getenv", return_value="test_token")
     def test_delete_message_api_error_returned(self, mock_getenv, mock_post):
         """When API returns an error (e.g. permission denied), tool should propagate it."""
@@ -64,7 +64,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.terraform_tool.terraform_tool.httpx.get",
+                "aden_tools.tools.terraform_tool.terraform_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -105,7 +105,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.terraform_tool.terraform_tool.httpx.get",
+                "aden_tools.tools.terraform_tool.terraform_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -151,7 +151,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.terraform_tool.terraform_tool.httpx.get",
+                "aden_tools.tools.terraform_tool.terraform_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -191,7 +191,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.terraform_tool.terraform_tool.httpx.get",
+                "aden_tools.tools.terraform_tool.terraform_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -228,7 +228,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.terraform_tool.terraform_tool.httpx.post",
+                "aden_tools.tools.terraform_tool.terraform_tool._http.post",
                 return_value=_mock_resp(data),
             ),
         ):
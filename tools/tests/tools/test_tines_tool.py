@@ -54,7 +54,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.tines_tool.tines_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.tines_tool.tines_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["tines_list_stories"]()
@@ -88,7 +88,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.tines_tool.tines_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.tines_tool.tines_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["tines_get_story"](story_id=123)
@@ -116,7 +116,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.tines_tool.tines_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.tines_tool.tines_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["tines_list_actions"](story_id=123)
@@ -149,7 +149,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.tines_tool.tines_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.tines_tool.tines_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["tines_get_action"](action_id=456)
@@ -179,7 +179,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.tines_tool.tines_tool.httpx.get", return_value=_mock_resp(data)
+                "aden_tools.tools.tines_tool.tines_tool._http.get", return_value=_mock_resp(data)
             ),
         ):
             result = tool_fns["tines_get_action_logs"](action_id=456)
@@ -7,6 +7,8 @@
 
 from aden_tools.tools.trello_tool import register_tools
 
+PATCH_BASE = "aden_tools.tools.trello_tool.trello_client"
+
 
 @pytest.fixture
 def trello_tools(mcp: FastMCP, monkeypatch):
@@ -35,7 +37,7 @@ def fake_request(method, url, params=None, timeout=None):
             assert url.endswith("/members/me/boards")
             return MagicMock(status_code=200, json=lambda: [{"id": "b1"}])
 
-        monkeypatch.setattr("httpx.request", fake_request)
+        monkeypatch.setattr(f"{PATCH_BASE}._http.request", fake_request)
 
         result = trello_tools["trello_list_boards"]()
         assert "boards" in result
@@ -69,7 +71,7 @@ def test_rate_limit_error(self, trello_tools, monkeypatch):
         def fake_request(method, url, params=None, timeout=None):
             return MagicMock(status_code=429, json=lambda: {"message": "rate"}, text="rate")
 
-        monkeypatch.setattr("httpx.request", fake_request)
+        monkeypatch.setattr(f"{PATCH_BASE}._http.request", fake_request)
 
         result = trello_tools["trello_list_boards"]()
         assert "error" in result
@@ -81,7 +83,7 @@ def fake_request(method, url, params=None, timeout=None):
             assert url.endswith("/members/me")
             return MagicMock(status_code=200, json=lambda: {"id": "m1"})
 
-        monkeypatch.setattr("httpx.request", fake_request)
+        monkeypatch.setattr(f"{PATCH_BASE}._http.request", fake_request)
 
         result = trello_tools["trello_get_member"]()
         assert result["id"] == "m1"
@@ -92,7 +94,7 @@ def test_not_found(self, trello_tools, monkeypatch):
         def fake_request(method, url, params=None, timeout=None):
             return MagicMock(status_code=404, json=lambda: {"message": "nope"}, text="nope")
 
-        monkeypatch.setattr("httpx.request", fake_request)
+        monkeypatch.setattr(f"{PATCH_BASE}._http.request", fake_request)
 
         result = trello_tools["trello_list_lists"](board_id="missing")
         assert "error" in result
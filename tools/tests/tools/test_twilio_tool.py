@@ -55,7 +55,7 @@ def test_successful_send(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.twilio_tool.twilio_tool.httpx.post", return_value=_mock_resp(msg)
+                "aden_tools.tools.twilio_tool.twilio_tool._http.post", return_value=_mock_resp(msg)
             ),
         ):
             result = tool_fns["twilio_send_sms"](
@@ -83,7 +83,7 @@ def test_successful_send(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.twilio_tool.twilio_tool.httpx.post", return_value=_mock_resp(msg)
+                "aden_tools.tools.twilio_tool.twilio_tool._http.post", return_value=_mock_resp(msg)
             ),
         ):
             result = tool_fns["twilio_send_whatsapp"](
@@ -119,7 +119,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.twilio_tool.twilio_tool.httpx.get",
+                "aden_tools.tools.twilio_tool.twilio_tool._http.get",
                 return_value=_mock_resp(data, 200),
             ),
         ):
@@ -151,7 +151,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.twilio_tool.twilio_tool.httpx.get",
+                "aden_tools.tools.twilio_tool.twilio_tool._http.get",
                 return_value=_mock_resp(msg, 200),
             ),
         ):
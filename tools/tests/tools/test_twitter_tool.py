@@ -59,7 +59,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.twitter_tool.twitter_tool.httpx.get",
+                "aden_tools.tools.twitter_tool.twitter_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -97,7 +97,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.twitter_tool.twitter_tool.httpx.get",
+                "aden_tools.tools.twitter_tool.twitter_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -134,7 +134,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.twitter_tool.twitter_tool.httpx.get",
+                "aden_tools.tools.twitter_tool.twitter_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -170,7 +170,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.twitter_tool.twitter_tool.httpx.get",
+                "aden_tools.tools.twitter_tool.twitter_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -38,7 +38,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.vercel_tool.vercel_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.vercel_tool.vercel_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -68,7 +68,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.vercel_tool.vercel_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.vercel_tool.vercel_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -93,7 +93,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.vercel_tool.vercel_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.vercel_tool.vercel_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -115,7 +115,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.vercel_tool.vercel_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.vercel_tool.vercel_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -133,7 +133,7 @@ def test_list_env_vars(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.vercel_tool.vercel_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.vercel_tool.vercel_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_resp
@@ -150,7 +150,7 @@ def test_create_env_var_missing_fields(self, tool_fns):
     def test_create_env_var_success(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.vercel_tool.vercel_tool.httpx.post") as mock_post,
+            patch("aden_tools.tools.vercel_tool.vercel_tool._http.post") as mock_post,
         ):
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {"id": "env_2", "key": "DB_URL"}
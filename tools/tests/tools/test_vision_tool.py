@@ -11,6 +11,8 @@
 
 from aden_tools.tools.vision_tool import register_tools
 
+PATCH_BASE = "aden_tools.tools.vision_tool.vision_tool"
+
 
 @pytest.fixture
 def mcp() -> FastMCP:
@@ -62,7 +64,7 @@ def test_credentials_from_env(mcp: FastMCP):
     mock_response = {"responses": [{"labelAnnotations": []}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -128,7 +130,7 @@ def test_detect_labels_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/dog.jpg", max_labels=5)
 
@@ -156,7 +158,7 @@ def test_detect_text_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/text.jpg")
 
@@ -189,7 +191,7 @@ def test_detect_faces_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/face.jpg")
 
@@ -224,7 +226,7 @@ def test_localize_objects_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/cat.jpg")
 
@@ -250,7 +252,7 @@ def test_detect_logos_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/logos.jpg")
 
@@ -279,7 +281,7 @@ def test_detect_landmarks_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/paris.jpg")
 
@@ -316,7 +318,7 @@ def test_image_properties_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/colorful.jpg")
 
@@ -346,7 +348,7 @@ def test_web_detection_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/sunset.jpg")
 
@@ -376,7 +378,7 @@ def test_safe_search_success(mcp: FastMCP):
     }
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/photo.jpg")
 
@@ -396,7 +398,7 @@ def test_local_file_success(mcp: FastMCP, sample_image: Path):
     mock_response = {"responses": [{"labelAnnotations": [{"description": "Image", "score": 0.9}]}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source=str(sample_image))
 
@@ -416,7 +418,7 @@ def test_api_error_401(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(401)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -430,7 +432,7 @@ def test_api_error_403(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(403)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -444,7 +446,7 @@ def test_api_error_429(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(429)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -458,7 +460,7 @@ def test_timeout_error(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.side_effect = httpx.TimeoutException("Timeout")
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -472,7 +474,7 @@ def test_network_error(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.side_effect = httpx.RequestError("Network error")
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -486,7 +488,7 @@ def test_empty_response(mcp: FastMCP):
     tool_fn = mcp._tool_manager._tools["vision_detect_labels"].fn
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json={"responses": []})
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -502,7 +504,7 @@ def test_api_error_in_response(mcp: FastMCP):
     mock_response = {"responses": [{"error": {"message": "Image too small"}}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
@@ -521,7 +523,7 @@ def test_max_labels_clamped(mcp: FastMCP):
     mock_response = {"responses": [{"labelAnnotations": []}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             # Test with value > 100
             tool_fn(image_source="https://example.com/image.jpg", max_labels=200)
@@ -540,7 +542,7 @@ def test_detect_text_no_text_found(mcp: FastMCP):
     mock_response = {"responses": [{"textAnnotations": []}]}
 
     with patch.dict(os.environ, {"GOOGLE_CLOUD_VISION_API_KEY": "test-api-key"}):
-        with patch("httpx.post") as mock_post:
+        with patch(f"{PATCH_BASE}._http.post") as mock_post:
             mock_post.return_value = httpx.Response(200, json=mock_response)
             result = tool_fn(image_source="https://example.com/image.jpg")
 
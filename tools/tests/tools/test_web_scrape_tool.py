@@ -1,15 +1,18 @@
 """Tests for web_scrape tool (FastMCP)."""
 
+import asyncio
 import socket
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp import FastMCP
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeout
 
-from aden_tools.tools.web_scrape_tool import register_tools
+from aden_tools.tools.web_scrape_tool import register_tools, web_scrape_tool
 from aden_tools.tools.web_scrape_tool.web_scrape_tool import (
     _check_url_target,
     _is_internal_address,
+    _StaticPage,
 )
 
 
@@ -20,6 +23,15 @@ def web_scrape_fn(mcp: FastMCP):
     return mcp._tool_manager._tools["web_scrape"].fn
 
 
+@pytest.fixture(autouse=True)
+def _isolated_scrape():
+    """Fresh browser pool per test, and no real network from the plain-HTTP fast path."""
+    web_scrape_tool._pools.clear()
+    with patch(_STATIC_PATH, AsyncMock(return_value=None)):
+        yield
+    web_scrape_tool._pools.clear()
+
+
 def _make_playwright_mocks(html, status=200, final_url="https://example.com/page"):
     """Build a full playwright mock chain and return (context_manager, response, page)."""
     mock_response = MagicMock(
@@ -38,6 +50,7 @@ def _make_playwright_mocks(html, status=200, final_url="https://example.com/page
 
     mock_browser = AsyncMock()
     mock_browser.new_context.return_value = mock_context
+    mock_browser.is_connected = MagicMock(return_value=True)
 
     mock_pw = MagicMock()
     mock_pw.chromium.launch = AsyncMock(return_value=mock_browser)
@@ -52,6 +65,7 @@ def _make_playwright_mocks(html, status=200, final_url="https://example.com/page
 
 _PW_PATH = "aden_tools.tools.web_scrape_tool.web_scrape_tool.async_playwright"
 _STEALTH_PATH = "aden_tools.tools.web_scrape_tool.web_scrape_tool.Stealth"
+_STATIC_PATH = "aden_tools.tools.web_scrape_tool.web_scrape_tool._fetch_static"
 
 
 class TestWebScrapeTool:
@@ -532,3 +546,206 @@ async def test_allows_public_url(self, _mock_check, mock_pw, mock_stealth, web_s
         result = await web_scrape_fn(url="https://example.com/")
         assert "error" not in result
         assert "Hello world" in result["content"]
+
+
+def _make_browser(page):
+    context = AsyncMock()
+    context.new_page.return_value = page
+    browser = AsyncMock()
+    browser.new_context.return_value = context
+    browser.is_connected = MagicMock(return_value=True)
+    return browser
+
+
+def _playwright_launching(*browsers):
+    mock_pw = MagicMock()
+    mock_pw.chromium.launch = AsyncMock(side_effect=list(browsers))
+    mock_cm = MagicMock()
+    mock_cm.__aenter__ = AsyncMock(return_value=mock_pw)
+    mock_cm.__aexit__ = AsyncMock(return_value=False)
+    return mock_cm, mock_pw.chromium.launch
+
+
+class TestWebScrapeBrowserPool:
+    """The browser is launched once and reused across calls."""
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_browser_and_context_reused(self, mock_pw, mock_stealth, web_scrape_fn):
+        mock_cm, _, mock_page = _make_playwright_mocks("<html><body>Hello</body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        for _ in range(3):
+            assert "error" not in await web_scrape_fn(url="https://example.com")
+
+        launch = mock_cm.__aenter__.return_value.chromium.launch
+        assert launch.await_count == 1
+        browser = launch.return_value
+        assert browser.new_context.await_count == 1
+        assert mock_page.close.await_count == 3
+        browser.new_context.return_value.clear_cookies.assert_awaited()
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_context_recycled_after_max_pages(self, mock_pw, mock_stealth, web_scrape_fn):
+        mock_cm, _, _ = _make_playwright_mocks("<html><body>Hello</body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        with patch.object(web_scrape_tool, "_CONTEXT_MAX_PAGES", 2):
+            for _ in range(5):
+                assert "error" not in await web_scrape_fn(url="https://example.com")
+
+        pool = web_scrape_tool._get_browser_pool()
+        browser = mock_cm.__aenter__.return_value.chromium.launch.return_value
+        assert browser.new_context.await_count == 3
+        assert pool.contexts_recycled == 2
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_crashed_browser_is_relaunched_and_call_retried(
+        self, mock_pw, mock_stealth, web_scrape_fn
+    ):
+        good_page = _make_playwright_mocks("<html><body>Recovered</body></html>")[2]
+        crashing_page = AsyncMock()
+        crashed = _make_browser(crashing_page)
+
+        async def crash(*args, **kwargs):
+            crashed.is_connected.return_value = False
+            raise PlaywrightError("Target page, context or browser has been closed")
+
+        crashing_page.goto.side_effect = crash
+        mock_cm, launch = _playwright_launching(crashed, _make_browser(good_page))
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url="https://example.com")
+
+        assert result["content"] == "Recovered"
+        assert launch.await_count == 2
+        assert web_scrape_tool._get_browser_pool().browser_connected
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_timeout_is_not_retried(self, mock_pw, mock_stealth, web_scrape_fn):
+        mock_cm, _, mock_page = _make_playwright_mocks("<html></html>")
+        mock_page.goto.side_effect = PlaywrightTimeout("timed out")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        result = await web_scrape_fn(url="https://example.com")
+        assert result == {"error": "Request timed out"}
+        assert mock_page.goto.await_count == 1
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_concurrent_pages_are_bounded(self, mock_pw, mock_stealth, web_scrape_fn):
+        mock_cm, mock_response, mock_page = _make_playwright_mocks("<html><body>x</body></html>")
+        in_flight = 0
+        peak = 0
+
+        async def slow_goto(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_response
+
+        mock_page.goto.side_effect = slow_goto
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        with patch.object(web_scrape_tool, "_MAX_CONCURRENT_PAGES", 2):
+            results = await asyncio.gather(
+                *(web_scrape_fn(url="https://example.com") for _ in range(6))
+            )
+
+        assert all("error" not in r for r in results)
+        assert peak == 2
+
+
+_ARTICLE_HTML = (
+    "<html><head><title>Docs</title></head><body><article>"
+    + "Server rendered paragraph. " * 40
+    + '<a href="/next">Next</a></article></body></html>'
+)
+_SPA_SHELL_HTML = (
+    '<html><body><div id="root"></div>'
+    "<p>You need to enable JavaScript to run this app.</p></body></html>"
+)
+
+
+class TestWebScrapeStaticFastPath:
+    """Plain HTTP fetch is used when it already returns usable HTML."""
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_server_rendered_page_skips_browser(self, mock_pw, web_scrape_fn):
+        static = _StaticPage(200, "text/html", "https://example.com/docs/", _ARTICLE_HTML)
+        with patch(_STATIC_PATH, AsyncMock(return_value=static)):
+            result = await web_scrape_fn(url="https://example.com/docs", include_links=True)
+
+        assert result["title"] == "Docs"
+        assert "Server rendered paragraph." in result["content"]
+        assert result["links"] == [{"text": "Next", "href": "https://example.com/next"}]
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_javascript_shell_falls_back_to_browser(
+        self, mock_pw, mock_stealth, web_scrape_fn
+    ):
+        mock_cm, _, _ = _make_playwright_mocks("<html><body>Rendered app</body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+        static = _StaticPage(200, "text/html", "https://example.com/", _SPA_SHELL_HTML)
+
+        with patch(_STATIC_PATH, AsyncMock(return_value=static)):
+            result = await web_scrape_fn(url="https://example.com")
+
+        assert result["content"] == "Rendered app"
+
+    @pytest.mark.asyncio
+    @patch(_STEALTH_PATH)
+    @patch(_PW_PATH)
+    async def test_render_js_true_skips_fast_path(self, mock_pw, mock_stealth, web_scrape_fn):
+        mock_cm, _, _ = _make_playwright_mocks("<html><body>Rendered</body></html>")
+        mock_pw.return_value = mock_cm
+        mock_stealth.return_value.apply_stealth_async = AsyncMock()
+
+        with patch(_STATIC_PATH, AsyncMock()) as mock_static:
+            result = await web_scrape_fn(url="https://example.com", render_js=True)
+
+        assert result["content"] == "Rendered"
+        mock_static.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_render_js_false_never_uses_browser(self, mock_pw, web_scrape_fn):
+        static = _StaticPage(200, "text/html", "https://example.com/", _SPA_SHELL_HTML)
+        with patch(_STATIC_PATH, AsyncMock(return_value=static)):
+            result = await web_scrape_fn(url="https://example.com", render_js=False)
+        assert "enable JavaScript" in result["content"]
+
+        static = _StaticPage(403, "text/html", "https://example.com/", "")
+        with patch(_STATIC_PATH, AsyncMock(return_value=static)):
+            result = await web_scrape_fn(url="https://example.com", render_js=False)
+        assert result == {"error": "HTTP 403: Failed to fetch URL"}
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_PW_PATH)
+    async def test_non_html_skipped_without_browser(self, mock_pw, web_scrape_fn):
+        static = _StaticPage(200, "application/pdf", "https://example.com/a.pdf", "")
+        with patch(_STATIC_PATH, AsyncMock(return_value=static)):
+            result = await web_scrape_fn(url="https://example.com/a.pdf")
+        assert result["skipped"] is True
+        mock_pw.assert_not_called()
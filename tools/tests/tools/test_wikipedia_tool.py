@@ -32,7 +32,7 @@ def tool_func(mcp):
     tools = {}
     mock_mcp = MagicMock()
 
-    def mock_tool():
+    def mock_tool(**kwargs):
         def decorator(f):
             tools[f.__name__] = f
             return f
@@ -65,7 +65,7 @@ def test_search_wikipedia_success(tool_func):
         ]
     }
 
-    patch_target = "aden_tools.tools.wikipedia_tool.wikipedia_tool.httpx.get"
+    patch_target = "aden_tools.tools.wikipedia_tool.wikipedia_tool._http.get"
     with patch(patch_target, return_value=mock_response) as mock_get:
         result = tool_func(query="AI")
 
@@ -92,7 +92,7 @@ def test_search_wikipedia_api_error(tool_func):
     mock_response = MagicMock()
     mock_response.status_code = 500
 
-    patch_target = "aden_tools.tools.wikipedia_tool.wikipedia_tool.httpx.get"
+    patch_target = "aden_tools.tools.wikipedia_tool.wikipedia_tool._http.get"
     with patch(patch_target, return_value=mock_response):
         result = tool_func(query="Error")
         assert "error" in result
@@ -102,7 +102,7 @@ def test_search_wikipedia_api_error(tool_func):
 def test_search_wikipedia_timeout(tool_func):
     import httpx
 
-    patch_target = "aden_tools.tools.wikipedia_tool.wikipedia_tool.httpx.get"
+    patch_target = "aden_tools.tools.wikipedia_tool.wikipedia_tool._http.get"
     with patch(patch_target, side_effect=httpx.TimeoutException("Timeout")):
         result = tool_func(query="Timeout")
         assert "error" in result
@@ -50,7 +50,7 @@ def test_successful_search(self, tool_fns):
         }
         with (
             patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}),
-            patch("aden_tools.tools.youtube_tool.youtube_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.youtube_tool.youtube_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
@@ -64,7 +64,7 @@ def test_successful_search(self, tool_fns):
     def test_max_results_clamped(self, tool_fns):
         with (
             patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}),
-            patch("aden_tools.tools.youtube_tool.youtube_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.youtube_tool.youtube_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {"pageInfo": {"totalResults": 0}, "items": []}
@@ -107,7 +107,7 @@ def test_successful_details(self, tool_fns):
         }
         with (
             patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}),
-            patch("aden_tools.tools.youtube_tool.youtube_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.youtube_tool.youtube_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
@@ -132,7 +132,7 @@ def test_no_identifier(self, tool_fns):
     def test_channel_not_found(self, tool_fns):
         with (
             patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}),
-            patch("aden_tools.tools.youtube_tool.youtube_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.youtube_tool.youtube_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {"items": []}
@@ -163,7 +163,7 @@ def test_successful_channel(self, tool_fns):
         }
         with (
             patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}),
-            patch("aden_tools.tools.youtube_tool.youtube_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.youtube_tool.youtube_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
@@ -185,7 +185,7 @@ def test_missing_playlist_id(self, tool_fns):
     def test_playlist_not_found(self, tool_fns):
         with (
             patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}),
-            patch("aden_tools.tools.youtube_tool.youtube_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.youtube_tool.youtube_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {"items": []}
@@ -221,7 +221,7 @@ def test_successful_comments(self, tool_fns):
         }
         with (
             patch.dict("os.environ", {"YOUTUBE_API_KEY": "test-key"}),
-            patch("aden_tools.tools.youtube_tool.youtube_tool.httpx.get") as mock_get,
+            patch("aden_tools.tools.youtube_tool.youtube_tool._http.get") as mock_get,
         ):
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = mock_response
@@ -55,7 +55,7 @@ def test_successful_list(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.zendesk_tool.zendesk_tool.httpx.get",
+                "aden_tools.tools.zendesk_tool.zendesk_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -76,7 +76,7 @@ def test_successful_get(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.zendesk_tool.zendesk_tool.httpx.get",
+                "aden_tools.tools.zendesk_tool.zendesk_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -97,7 +97,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.zendesk_tool.zendesk_tool.httpx.post",
+                "aden_tools.tools.zendesk_tool.zendesk_tool._http.post",
                 return_value=_mock_resp(data, 201),
             ),
         ):
@@ -120,7 +120,7 @@ def test_successful_update(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.zendesk_tool.zendesk_tool.httpx.put",
+                "aden_tools.tools.zendesk_tool.zendesk_tool._http.put",
                 return_value=_mock_resp(data),
             ),
         ):
@@ -145,7 +145,7 @@ def test_successful_search(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.zendesk_tool.zendesk_tool.httpx.get",
+                "aden_tools.tools.zendesk_tool.zendesk_tool._http.get",
                 return_value=_mock_resp(data),
             ),
         ):
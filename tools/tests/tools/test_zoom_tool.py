@@ -46,7 +46,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.zoom_tool.zoom_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.zoom_tool.zoom_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["zoom_get_user"]()
 
@@ -75,7 +75,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.zoom_tool.zoom_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.zoom_tool.zoom_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["zoom_list_meetings"]()
 
@@ -103,7 +103,7 @@ def test_pagination(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.zoom_tool.zoom_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.zoom_tool.zoom_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["zoom_list_meetings"]()
 
@@ -142,7 +142,7 @@ def test_successful_get(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.zoom_tool.zoom_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.zoom_tool.zoom_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["zoom_get_meeting"](meeting_id="78475495050")
 
@@ -171,7 +171,7 @@ def test_successful_create(self, tool_fns):
         with (
             patch.dict("os.environ", ENV),
             patch(
-                "aden_tools.tools.zoom_tool.zoom_tool.httpx.post",
+                "aden_tools.tools.zoom_tool.zoom_tool._http.post",
                 return_value=_mock_resp(data, 201),
             ),
         ):
@@ -195,7 +195,7 @@ def test_successful_delete(self, tool_fns):
         resp.status_code = 204
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.zoom_tool.zoom_tool.httpx.delete", return_value=resp),
+            patch("aden_tools.tools.zoom_tool.zoom_tool._http.delete", return_value=resp),
         ):
             result = tool_fns["zoom_delete_meeting"](meeting_id="78475495050")
 
@@ -235,7 +235,7 @@ def test_successful_list(self, tool_fns):
         }
         with (
             patch.dict("os.environ", ENV),
-            patch("aden_tools.tools.zoom_tool.zoom_tool.httpx.get", return_value=_mock_resp(data)),
+            patch("aden_tools.tools.zoom_tool.zoom_tool._http.get", return_value=_mock_resp(data)),
         ):
             result = tool_fns["zoom_list_recordings"](from_date="2025-01-01", to_date="2025-01-31")
 